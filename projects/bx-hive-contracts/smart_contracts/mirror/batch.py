@@ -0,0 +1,62 @@
+"""Readonly ABI calls packed 16 to a simulate request.
+
+Every readonly call through a generated client is its own simulate round trip.
+batch_read puts up to 16 calls, to any mix of apps, into one unsigned group,
+simulates it with empty signatures and unnamed resources allowed, and returns
+each call's decoded return value in order. Nothing is submitted.
+
+    signature = "get_user(address)(uint32,uint8,string,uint64)"
+    calls = [readonly_call(registry_app_id, signature, addr, sender=reader) for addr in addresses]
+    users = batch_read(algorand, calls)
+
+Generated clients build the same params, e.g. `client.params.get_match(args=(match_id,))`.
+"""
+
+import dataclasses
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+
+import algokit_utils
+from algosdk import abi
+
+# Transactions per group, and groups simulated at once
+_GROUP_SIZE = 16
+_PARALLEL_GROUPS = 4
+
+
+def readonly_call(
+    app_id: int, signature: str, *args: algokit_utils.ABIValue, sender: str
+) -> algokit_utils.AppCallMethodCallParams:
+    method_args: list[algokit_utils.ABIValue] = list(args)
+    return algokit_utils.AppCallMethodCallParams(
+        app_id=app_id,
+        method=abi.Method.from_signature(signature),
+        args=method_args,
+        sender=sender,
+    )
+
+
+def batch_read(
+    algorand: algokit_utils.AlgorandClient,
+    calls: Sequence[algokit_utils.AppCallMethodCallParams],
+    sender: str | None = None,
+) -> list[algokit_utils.ABIValue | None]:
+    """Return values of calls, simulated _GROUP_SIZE per group.
+
+    sender, if given, replaces each call's sender. Simulate still checks that
+    the sender can pay the group's fees, so use a funded account. A call that
+    fails (e.g. "Match not found") fails the simulate of its whole group.
+    """
+    if sender is not None:
+        calls = [dataclasses.replace(call, sender=sender) for call in calls]
+
+    def simulate(group: Sequence[algokit_utils.AppCallMethodCallParams]) -> list[algokit_utils.ABIValue | None]:
+        composer = algorand.new_group()
+        for call in group:
+            composer.add_app_call_method_call(call)
+        result = composer.simulate(skip_signatures=True, allow_unnamed_resources=True)
+        return [method_return.value for method_return in result.returns]
+
+    groups = [calls[i : i + _GROUP_SIZE] for i in range(0, len(calls), _GROUP_SIZE)]
+    with ThreadPoolExecutor(max_workers=_PARALLEL_GROUPS) as pool:
+        return [value for values in pool.map(simulate, groups) for value in values]
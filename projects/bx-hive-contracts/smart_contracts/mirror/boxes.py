@@ -0,0 +1,109 @@
+"""Box layouts of the three contracts, for off-chain readers (mirror, reader)."""
+
+import typing
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from algosdk import abi, encoding
+
+# Decoded column values: uintN decode to int, address and string to str
+ColumnValue: typing.TypeAlias = int | str
+Row: typing.TypeAlias = dict[str, ColumnValue]
+
+
+@dataclass(frozen=True)
+class BoxTable:
+    prefix: bytes
+    key_len: int
+    table: str
+    key_columns: tuple[str, ...]
+    decode_key: Callable[[bytes], tuple[ColumnValue, ...]]
+    value_type: abi.ABIType
+    value_columns: tuple[str, ...]
+
+
+def _address_key(key: bytes) -> tuple[ColumnValue, ...]:
+    return (typing.cast(str, encoding.encode_address(key)),)
+
+
+def _no_key(key: bytes) -> tuple[ColumnValue, ...]:
+    return ()
+
+
+def _variation_key(key: bytes) -> tuple[ColumnValue, ...]:
+    return (int.from_bytes(key, "big") >> 32,)
+
+
+# Box layouts mirror smart_contracts/shared/types.py
+USERS = BoxTable(
+    prefix=b"u_",
+    key_len=32,
+    table="users",
+    key_columns=("address",),
+    decode_key=_address_key,
+    value_type=abi.ABIType.from_string("(uint32,uint8,string,uint64)"),
+    value_columns=("user_id", "role", "name", "created_at"),
+)
+EXPERIMENTS = BoxTable(
+    prefix=b"e_",
+    key_len=4,
+    table="experiments",
+    key_columns=(),
+    decode_key=_no_key,
+    value_type=abi.ABIType.from_string("(uint32,address,string,uint64,uint64)"),
+    value_columns=("exp_id", "owner", "name", "created_at", "variation_count"),
+)
+VARIATIONS = BoxTable(
+    prefix=b"v_",
+    key_len=8,
+    table="variations",
+    key_columns=("exp_id",),
+    decode_key=_variation_key,
+    value_type=abi.ABIType.from_string("(uint32,uint64,string,uint64)"),
+    value_columns=("var_id", "variation_app_id", "label", "created_at"),
+)
+PARTICIPANTS = BoxTable(
+    prefix=b"p_",
+    key_len=32,
+    table="participants",
+    key_columns=("address",),
+    decode_key=_address_key,
+    value_type=abi.ABIType.from_string("(uint8,uint8,uint32)"),
+    value_columns=("enrolled", "assigned", "match_id"),
+)
+MATCHES = BoxTable(
+    prefix=b"m_",
+    key_len=4,
+    table="matches",
+    key_columns=(),
+    decode_key=_no_key,
+    value_type=abi.ABIType.from_string(
+        "(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)"
+    ),
+    value_columns=(
+        "match_id",
+        "investor",
+        "trustee",
+        "phase",
+        "created_at",
+        "investment",
+        "return_amount",
+        "investor_payout",
+        "trustee_payout",
+        "completed_at",
+        "paid_out",
+    ),
+)
+
+
+def spec_for(name: bytes, specs: tuple[BoxTable, ...]) -> BoxTable | None:
+    """The layout a full box name (prefix + key) belongs to, if any."""
+    return next((s for s in specs if name.startswith(s.prefix) and len(name) == len(s.prefix) + s.key_len), None)
+
+
+def decode_row(spec: BoxTable, name: bytes, value: bytes) -> Row:
+    """Key and value columns of one box, by column name."""
+    columns = (*spec.key_columns, *spec.value_columns)
+    decoded = typing.cast(list[ColumnValue], spec.value_type.decode(value))
+    values = (*spec.decode_key(name[len(spec.prefix) :]), *decoded)
+    return dict(zip(columns, values, strict=True))
@@ -0,0 +1,99 @@
+"""Vectorized decoding of fixed-size Match and ParticipantInfo box values.
+
+Match (118 bytes) and ParticipantInfo (6 bytes) are static ARC-4 structs, so a
+concatenation of raw box values is exactly a NumPy structured array: decoding is
+one np.frombuffer view, with no per-record Python objects. Integers stay
+big-endian in the view; to_columns makes native-endian column copies.
+
+NumPy is optional and only needed by this module.
+"""
+
+import typing
+from collections.abc import Iterable
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
+
+if typing.TYPE_CHECKING:
+    import numpy.typing as npt
+
+    # Every field of both structs is an unsigned integer (addresses are uint8 arrays)
+    _Unsigned: typing.TypeAlias = np.uint8 | np.uint32 | np.uint64
+
+MATCH_SIZE = 118
+PARTICIPANT_INFO_SIZE = 6
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("numpy is required for columnar decoding (pip install numpy)")
+
+
+# Field order and widths mirror smart_contracts/shared/types.py
+_Field: typing.TypeAlias = tuple[str, str] | tuple[str, str, tuple[int]]
+_MATCH_FIELDS: list[_Field] = [
+    ("match_id", ">u4"),
+    ("investor", "u1", (32,)),
+    ("trustee", "u1", (32,)),
+    ("phase", "u1"),
+    ("created_at", ">u8"),
+    ("investment", ">u8"),
+    ("return_amount", ">u8"),
+    ("investor_payout", ">u8"),
+    ("trustee_payout", ">u8"),
+    ("completed_at", ">u8"),
+    ("paid_out", "u1"),
+]
+_PARTICIPANT_INFO_FIELDS: list[_Field] = [
+    ("enrolled", "u1"),
+    ("assigned", "u1"),
+    ("match_id", ">u4"),
+]
+
+if np is not None:
+    MATCH_DTYPE = np.dtype(_MATCH_FIELDS)
+    PARTICIPANT_INFO_DTYPE = np.dtype(_PARTICIPANT_INFO_FIELDS)
+    assert MATCH_DTYPE.itemsize == MATCH_SIZE
+    assert PARTICIPANT_INFO_DTYPE.itemsize == PARTICIPANT_INFO_SIZE
+
+
+def _decode(buffer: bytes | bytearray | memoryview, dtype: "np.dtype[np.void]") -> "npt.NDArray[np.void]":
+    if len(buffer) % dtype.itemsize:
+        raise ValueError(f"Buffer of {len(buffer)} bytes is not a whole number of {dtype.itemsize}-byte records")
+    return np.frombuffer(buffer, dtype=dtype)
+
+
+def decode_matches(buffer: bytes | bytearray | memoryview) -> "npt.NDArray[np.void]":
+    """Read-only structured view over concatenated m_ box values."""
+    _require_numpy()
+    return _decode(buffer, MATCH_DTYPE)
+
+
+def decode_participants(buffer: bytes | bytearray | memoryview) -> "npt.NDArray[np.void]":
+    """Read-only structured view over concatenated p_ box values (keys are not
+    part of the value; keep the address list alongside in the same order)."""
+    _require_numpy()
+    return _decode(buffer, PARTICIPANT_INFO_DTYPE)
+
+
+def join_values(values: Iterable[bytes]) -> bytes:
+    """Concatenate raw box values for decode_matches / decode_participants."""
+    return b"".join(values)
+
+
+def to_columns(records: "npt.NDArray[np.void]") -> dict[str, "npt.NDArray[_Unsigned]"]:
+    """One native-endian, contiguous array per field (address fields are (n, 32) uint8)."""
+    _require_numpy()
+    names = records.dtype.names
+    if names is None:
+        raise ValueError("to_columns needs a structured array, e.g. from decode_matches")
+    return {name: _native_column(records, name) for name in names}
+
+
+def _native_column(records: "npt.NDArray[np.void]", name: str) -> "npt.NDArray[_Unsigned]":
+    # NumPy types a field looked up by name as ndarray[..., dtype[Any]]; a
+    # (32,) subarray field comes back as an (n, 32) array of its base dtype
+    column = typing.cast("npt.NDArray[_Unsigned]", records[name])
+    return column.astype(column.dtype.newbyteorder("="))
@@ -0,0 +1,207 @@
+"""Concurrent box reads over a pool of keep-alive algod connections.
+
+The generated clients' box getters and readonly calls are synchronous, one new
+HTTP request at a time. AsyncBoxReader keeps `concurrency` persistent algod
+connections and runs that many box requests at once from asyncio, decoding
+with the layouts in mirror/boxes.py. get_match and get_variation only return
+an m_ / v_ box, so they are served as box reads here, without simulate.
+
+    async with AsyncBoxReader.from_algorand(algorand) as reader:
+        export = await reader.export_experiment(experiments_app_id, exp_id)
+"""
+
+import asyncio
+import base64
+import http.client
+import json
+import typing
+import urllib.parse
+from types import TracebackType
+
+import algokit_utils
+
+from smart_contracts.mirror.boxes import (
+    EXPERIMENTS,
+    MATCHES,
+    PARTICIPANTS,
+    VARIATIONS,
+    BoxTable,
+    ColumnValue,
+    Row,
+    decode_row,
+    spec_for,
+)
+from smart_contracts.mirror.columnar import decode_matches, join_values
+
+if typing.TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+# The algod responses read here; anything else comes back as a plain JSON object
+_Json: typing.TypeAlias = dict[str, object]
+
+
+class _Box(typing.TypedDict):
+    name: str
+    value: str
+
+
+class _BoxDescriptor(typing.TypedDict):
+    name: str
+
+
+class _BoxesPage(typing.TypedDict):
+    boxes: list[_BoxDescriptor]
+
+
+class ExperimentExport(typing.TypedDict):
+    experiment: Row | None
+    # Variation rows with their "participants" and "matches" rows added
+    variations: list[dict[str, ColumnValue | list[Row]]]
+
+
+class AsyncBoxReader:
+    def __init__(
+        self,
+        algod_address: str,
+        algod_token: str = "",
+        headers: dict[str, str] | None = None,
+        concurrency: int = 16,
+    ) -> None:
+        url = urllib.parse.urlsplit(algod_address)
+        self._https = url.scheme == "https"
+        self._host = url.hostname or "localhost"
+        self._port = url.port
+        self._base_path = url.path.rstrip("/")
+        self._headers = {"X-Algo-API-Token": algod_token, **(headers or {})} if algod_token else dict(headers or {})
+        self._pool: asyncio.Queue[http.client.HTTPConnection] = asyncio.Queue()
+        for _ in range(concurrency):
+            self._pool.put_nowait(self._connect())
+
+    @classmethod
+    def from_algorand(cls, algorand: algokit_utils.AlgorandClient, concurrency: int = 16) -> "AsyncBoxReader":
+        algod = algorand.client.algod
+        return cls(algod.algod_address, algod.algod_token, algod.headers, concurrency)
+
+    async def __aenter__(self) -> "AsyncBoxReader":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        while not self._pool.empty():
+            self._pool.get_nowait().close()
+
+    # -------------------------------------------------------------------------
+    # HTTP
+    # -------------------------------------------------------------------------
+
+    def _connect(self) -> http.client.HTTPConnection:
+        if self._https:
+            return http.client.HTTPSConnection(self._host, self._port, timeout=30)
+        return http.client.HTTPConnection(self._host, self._port, timeout=30)
+
+    async def _get(self, path: str) -> _Json | None:
+        """GET an algod path on a pooled connection; None on 404."""
+        conn = await self._pool.get()
+        try:
+            return await asyncio.to_thread(self._request, conn, self._base_path + path, self._headers)
+        finally:
+            self._pool.put_nowait(conn)
+
+    @staticmethod
+    def _request(conn: http.client.HTTPConnection, path: str, headers: dict[str, str] | None = None) -> _Json | None:
+        try:
+            conn.request("GET", path, headers=headers or {})
+            response = conn.getresponse()
+        except (http.client.HTTPException, OSError):
+            # The server dropped the idle keep-alive connection; reopen once
+            conn.close()
+            conn.request("GET", path, headers=headers or {})
+            response = conn.getresponse()
+        body = response.read()
+        if response.status == 404:
+            return None
+        if response.status != 200:
+            raise RuntimeError(f"algod GET {path} failed: {response.status} {body[:200]!r}")
+        return typing.cast(_Json, json.loads(body))
+
+    # -------------------------------------------------------------------------
+    # Boxes
+    # -------------------------------------------------------------------------
+
+    async def box(self, app_id: int, name: bytes) -> bytes | None:
+        encoded = urllib.parse.quote(base64.b64encode(name).decode(), safe="")
+        result = typing.cast(_Box | None, await self._get(f"/v2/applications/{app_id}/box?name=b64:{encoded}"))
+        return None if result is None else base64.b64decode(result["value"])
+
+    async def box_names(self, app_id: int, prefix: bytes = b"") -> list[bytes]:
+        result = typing.cast(_BoxesPage | None, await self._get(f"/v2/applications/{app_id}/boxes"))
+        names = [base64.b64decode(box["name"]) for box in (result["boxes"] if result else [])]
+        return sorted(name for name in names if name.startswith(prefix))
+
+    async def rows(self, app_id: int, spec: BoxTable, names: list[bytes]) -> list[Row]:
+        """Decoded rows of the named boxes, fetched concurrently; missing boxes are dropped."""
+        names = [name for name in names if spec_for(name, (spec,)) is not None]
+        values = await asyncio.gather(*(self.box(app_id, name) for name in names))
+        return [decode_row(spec, name, value) for name, value in zip(names, values, strict=True) if value is not None]
+
+    # -------------------------------------------------------------------------
+    # Contract reads
+    # -------------------------------------------------------------------------
+
+    async def get_match(self, variation_app_id: int, match_id: int) -> Row | None:
+        rows = await self.rows(variation_app_id, MATCHES, [MATCHES.prefix + match_id.to_bytes(4, "big")])
+        return rows[0] if rows else None
+
+    async def get_variation(self, experiments_app_id: int, exp_id: int, var_id: int) -> Row | None:
+        key = VARIATIONS.prefix + ((exp_id << 32) + var_id).to_bytes(8, "big")
+        rows = await self.rows(experiments_app_id, VARIATIONS, [key])
+        return rows[0] if rows else None
+
+    async def matches(self, variation_app_id: int, match_ids: list[int] | None = None) -> list[Row]:
+        if match_ids is None:
+            names = await self.box_names(variation_app_id, MATCHES.prefix)
+        else:
+            names = [MATCHES.prefix + match_id.to_bytes(4, "big") for match_id in match_ids]
+        return await self.rows(variation_app_id, MATCHES, names)
+
+    async def match_records(self, variation_app_id: int) -> "npt.NDArray[np.void]":
+        """All matches as one structured NumPy array (see mirror/columnar.py), in match_id order."""
+        names = await self.box_names(variation_app_id, MATCHES.prefix)
+        names = [name for name in names if spec_for(name, (MATCHES,)) is not None]
+        values = await asyncio.gather(*(self.box(variation_app_id, name) for name in names))
+        return decode_matches(join_values(value for value in values if value is not None))
+
+    async def participants(self, variation_app_id: int) -> list[Row]:
+        names = await self.box_names(variation_app_id, PARTICIPANTS.prefix)
+        return await self.rows(variation_app_id, PARTICIPANTS, names)
+
+    async def variations(self, experiments_app_id: int, exp_id: int) -> list[Row]:
+        names = await self.box_names(experiments_app_id, VARIATIONS.prefix + exp_id.to_bytes(4, "big"))
+        return await self.rows(experiments_app_id, VARIATIONS, names)
+
+    async def export_experiment(self, experiments_app_id: int, exp_id: int) -> ExperimentExport:
+        """The experiment, its variations, and every variation's participants and
+        matches, with all variations read concurrently."""
+        experiment_rows, variations = await asyncio.gather(
+            self.rows(experiments_app_id, EXPERIMENTS, [EXPERIMENTS.prefix + exp_id.to_bytes(4, "big")]),
+            self.variations(experiments_app_id, exp_id),
+        )
+        app_ids = [typing.cast(int, v["variation_app_id"]) for v in variations]
+        details = await asyncio.gather(
+            *(asyncio.gather(self.participants(app_id), self.matches(app_id)) for app_id in app_ids)
+        )
+        return {
+            "experiment": experiment_rows[0] if experiment_rows else None,
+            "variations": [
+                {**variation, "participants": participants, "matches": matches}
+                for variation, (participants, matches) in zip(variations, details, strict=True)
+            ],
+        }
@@ -0,0 +1,237 @@
+"""Local SQLite mirror of registry users, experiments, variations, participants and matches.
+
+The first sync of an app lists and reads all of its boxes. Later syncs ask the
+indexer for app calls since the app's last synced round and re-read only the
+boxes those calls (and their inner calls) referenced, deleting rows whose box is
+gone. Boxes reached only through another transaction's references in the same
+group are picked up when that transaction calls a mirrored app too.
+
+    mirror = StateMirror(algorand, "bx-hive.sqlite", registry_app_id, experiments_app_id)
+    mirror.sync()
+    rows = mirror.matches(variation_app_id)
+"""
+
+import base64
+import logging
+import sqlite3
+import typing
+from collections.abc import Iterator
+from pathlib import Path
+
+import algokit_utils
+from algosdk.error import AlgodHTTPError
+
+from smart_contracts.mirror.boxes import (
+    EXPERIMENTS,
+    MATCHES,
+    PARTICIPANTS,
+    USERS,
+    VARIATIONS,
+    BoxTable,
+    ColumnValue,
+    decode_row,
+    spec_for,
+)
+
+logger = logging.getLogger(__name__)
+
+
+_REGISTRY_TABLES = (USERS,)
+_EXPERIMENTS_TABLES = (EXPERIMENTS, VARIATIONS)
+_VARIATION_TABLES = (PARTICIPANTS, MATCHES)
+
+
+# The parts of the indexer's search_transactions payload that sync reads
+class _BoxReference(typing.TypedDict, total=False):
+    app: int
+    name: str
+
+
+_ApplicationTransaction = typing.TypedDict(
+    "_ApplicationTransaction",
+    {"application-id": int, "foreign-apps": list[int], "box-references": list[_BoxReference]},
+    total=False,
+)
+_Transaction = typing.TypedDict(
+    "_Transaction",
+    {
+        "application-transaction": _ApplicationTransaction,
+        "created-application-index": int,
+        "inner-txns": list["_Transaction"],
+    },
+    total=False,
+)
+_TransactionsPage = typing.TypedDict(
+    "_TransactionsPage",
+    {"current-round": int, "next-token": str, "transactions": list[_Transaction]},
+    total=False,
+)
+
+
+def _create_table_sql(spec: BoxTable) -> str:
+    columns = ", ".join((*spec.key_columns, *spec.value_columns))
+    return (
+        f"CREATE TABLE IF NOT EXISTS {spec.table} "
+        f"(app_id INTEGER NOT NULL, box_key BLOB NOT NULL, {columns}, PRIMARY KEY (app_id, box_key))"
+    )
+
+
+class StateMirror:
+    def __init__(
+        self,
+        algorand: algokit_utils.AlgorandClient,
+        db_path: str | Path,
+        registry_app_id: int,
+        experiments_app_id: int,
+    ) -> None:
+        self.algorand = algorand
+        self.registry_app_id = registry_app_id
+        self.experiments_app_id = experiments_app_id
+        self.db = sqlite3.connect(db_path)
+        self.db.row_factory = sqlite3.Row
+        with self.db:
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS sync_state (app_id INTEGER PRIMARY KEY, last_round INTEGER NOT NULL)"
+            )
+            for spec in (*_REGISTRY_TABLES, *_EXPERIMENTS_TABLES, *_VARIATION_TABLES):
+                self.db.execute(_create_table_sql(spec))
+
+    # -------------------------------------------------------------------------
+    # Sync
+    # -------------------------------------------------------------------------
+
+    def sync(self) -> int:
+        """Bring every mirrored app up to the indexer's current round; returns that round.
+
+        The bound comes from the indexer rather than algod: a round algod has
+        reached but the indexer has not would be marked synced while its app
+        calls were still missing from the search.
+        """
+        sync_round = self._indexer_round()
+        self._sync_app(self.registry_app_id, _REGISTRY_TABLES, sync_round)
+        self._sync_app(self.experiments_app_id, _EXPERIMENTS_TABLES, sync_round)
+        variation_app_ids = [
+            typing.cast(int, row["variation_app_id"])
+            for row in self._fetchall(
+                "SELECT variation_app_id FROM variations WHERE app_id = ?", (self.experiments_app_id,)
+            )
+        ]
+        for app_id in variation_app_ids:
+            self._sync_app(app_id, _VARIATION_TABLES, sync_round)
+        return sync_round
+
+    def _sync_app(self, app_id: int, specs: tuple[BoxTable, ...], sync_round: int) -> None:
+        rows = self._fetchall("SELECT last_round FROM sync_state WHERE app_id = ?", (app_id,))
+        if not rows:
+            names = {box.name_raw for box in self.algorand.app.get_box_names(app_id)}
+        else:
+            last_round = typing.cast(int, rows[0]["last_round"])
+            if last_round >= sync_round:
+                return
+            names = self._touched_boxes(app_id, last_round + 1, sync_round)
+
+        updated = 0
+        with self.db:
+            for name in names:
+                spec = spec_for(name, specs)
+                if spec is None:
+                    continue
+                try:
+                    value = self.algorand.app.get_box_value(app_id, name)
+                except AlgodHTTPError as e:  # type: ignore[misc]  # algosdk's errors are untyped
+                    if typing.cast(int | None, e.code) != 404:
+                        raise
+                    self.db.execute(f"DELETE FROM {spec.table} WHERE app_id = ? AND box_key = ?", (app_id, name))
+                    continue
+                self._upsert(spec, app_id, name, value)
+                updated += 1
+            self.db.execute(
+                "INSERT INTO sync_state (app_id, last_round) VALUES (?, ?) "
+                "ON CONFLICT (app_id) DO UPDATE SET last_round = excluded.last_round",
+                (app_id, sync_round),
+            )
+        logger.debug(f"Mirrored app {app_id} to round {sync_round}: {updated} boxes read")
+
+    def _upsert(self, spec: BoxTable, app_id: int, name: bytes, value: bytes) -> None:
+        row: dict[str, ColumnValue | bytes] = {"app_id": app_id, "box_key": name, **decode_row(spec, name, value)}
+        placeholders = ", ".join("?" * len(row))
+        self.db.execute(
+            f"INSERT OR REPLACE INTO {spec.table} ({', '.join(row)}) VALUES ({placeholders})", tuple(row.values())
+        )
+
+    def _indexer_round(self) -> int:
+        response = typing.cast(
+            _TransactionsPage,
+            self.algorand.client.indexer.search_transactions(application_id=self.registry_app_id, limit=1),
+        )
+        return response["current-round"]
+
+    def _touched_boxes(self, app_id: int, min_round: int, max_round: int) -> set[bytes]:
+        names: set[bytes] = set()
+        next_page: str | None = None
+        while True:
+            response = typing.cast(
+                _TransactionsPage,
+                self.algorand.client.indexer.search_transactions(
+                    application_id=app_id, min_round=min_round, max_round=max_round, next_page=next_page
+                ),
+            )
+            transactions = response.get("transactions", [])
+            for txn in transactions:
+                names.update(_box_references(txn, app_id))
+            next_page = response.get("next-token")
+            if not next_page or not transactions:
+                return names
+
+    def _fetchall(self, sql: str, params: tuple[ColumnValue, ...]) -> list[sqlite3.Row]:
+        return typing.cast(list[sqlite3.Row], self.db.execute(sql, params).fetchall())
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def users(self, role: int | None = None) -> list[sqlite3.Row]:
+        sql = "SELECT * FROM users WHERE app_id = ?"
+        params: tuple[ColumnValue, ...] = (self.registry_app_id,)
+        if role is not None:
+            sql += " AND role = ?"
+            params += (role,)
+        return self._fetchall(sql + " ORDER BY user_id", params)
+
+    def experiments(self, owner: str | None = None) -> list[sqlite3.Row]:
+        sql = "SELECT * FROM experiments WHERE app_id = ?"
+        params: tuple[ColumnValue, ...] = (self.experiments_app_id,)
+        if owner is not None:
+            sql += " AND owner = ?"
+            params += (owner,)
+        return self._fetchall(sql + " ORDER BY exp_id", params)
+
+    def variations(self, exp_id: int) -> list[sqlite3.Row]:
+        return self._fetchall(
+            "SELECT * FROM variations WHERE app_id = ? AND exp_id = ? ORDER BY var_id",
+            (self.experiments_app_id, exp_id),
+        )
+
+    def participants(self, variation_app_id: int) -> list[sqlite3.Row]:
+        return self._fetchall("SELECT * FROM participants WHERE app_id = ?", (variation_app_id,))
+
+    def matches(self, variation_app_id: int) -> list[sqlite3.Row]:
+        return self._fetchall("SELECT * FROM matches WHERE app_id = ? ORDER BY match_id", (variation_app_id,))
+
+    def close(self) -> None:
+        self.db.close()
+
+
+def _box_references(txn: _Transaction, app_id: int) -> Iterator[bytes]:
+    """Names of app_id's boxes referenced by an indexer transaction and its inner transactions."""
+    app_call = txn.get("application-transaction")
+    if app_call is not None:
+        called = app_call.get("application-id") or txn.get("created-application-index", 0)
+        foreign_apps = app_call.get("foreign-apps", [])
+        for ref in app_call.get("box-references", []):
+            index = ref.get("app", 0)
+            target = called if index == 0 else foreign_apps[index - 1]
+            if target == app_id:
+                yield base64.b64decode(ref.get("name", ""))
+    for inner in txn.get("inner-txns", []):
+        yield from _box_references(inner, app_id)
@@ -1,9 +1,56 @@
-from algopy import Account, ARC4Contract, BoxMap, Global, GlobalState, Txn, UInt64, arc4
+from algopy import (
+    Account,
+    ARC4Contract,
+    Box,
+    BoxMap,
+    Bytes,
+    Global,
+    GlobalState,
+    OpUpFeeSource,
+    StateTotals,
+    Txn,
+    UInt64,
+    arc4,
+    ensure_budget,
+    gtxn,
+    op,
+    subroutine,
+    urange,
+)
 
-from smart_contracts.shared.types import ExperimentTemplateInfo, User
+from smart_contracts.shared.events import UserRegistered, UsersRegistered
+from smart_contracts.shared.membership import (
+    MEMBER_PROOF_BYTES,
+    MEMBER_ROOT_SLOTS,
+    MEMBER_ROOTS_PER_SLOT,
+    MEMBER_TREE_DEPTH,
+    MEMBER_TREE_SIZE,
+    member_roots_key,
+)
+from smart_contracts.shared.types import ADMIN_OPERATOR, ExperimentTemplateInfo, User
 
+# Box MBR (2,500 + 400 * (key_len + value_len)) per user, charged by register_users:
+#   u_ box: "u_"(2) + Address(32) + User(17 + name_len) = 22,900 + 400 * name_len
+#   ui_ box: "ui_"(3) + UInt32(4) + Address(32) = 18,100
+#   ri_ box: "ri_"(3) + UInt64(8) + UInt32(4) = 8,500
+# (the one-off rc_ counter box per role, 5,700, comes from the app account)
+USER_MBR = 49_500
+USER_NAME_BYTE_MBR = 400
 
-class BxHiveRegistry(ARC4Contract):
+# get_users / get_users_by_role page budget: the ABI return log is capped at
+# 1,024 bytes, 4 of which are the return prefix
+_RETURN_PAGE_BYTES = 1_020
+
+# Member tree opcode budgets: sha256 costs 35, plus the loop around it.
+# Op-ups come from the group's fee credit, so the caller covers them (up to 4
+# inner fees per call) rather than the app account, which register_user is open to.
+_MEMBER_LEVEL_BUDGET = 60
+_MEMBER_ROOT_BUDGET = 2_000
+
+
+# The member root slots ("mr0" .. "mr7") are written by key, so the schema
+# reserves them on top of super_admin: 1 + MEMBER_ROOT_SLOTS bytes globals.
+class BxHiveRegistry(ARC4Contract, state_totals=StateTotals(global_bytes=9, global_uints=1)):
     def __init__(self) -> None:
         self.super_admin = GlobalState(Account)
         self.user_count = GlobalState(UInt64(0))
@@ -11,6 +58,12 @@ class BxHiveRegistry(ARC4Contract):
         self.users = BoxMap(Account, User, key_prefix=b"u_")
         self.user_ids = BoxMap(arc4.UInt32, arc4.Address, key_prefix=b"ui_")
         self.experiment_templates = BoxMap(arc4.UInt8, ExperimentTemplateInfo, key_prefix=b"t_")
+        # Per-role directory: role → number of users, and packed (role << 32 | position) → user_id
+        self.role_counts = BoxMap(arc4.UInt8, arc4.UInt32, key_prefix=b"rc_")
+        self.role_index = BoxMap(arc4.UInt64, arc4.UInt32, key_prefix=b"ri_")
+        # Member tree (shared/membership.py): the left sibling hash per level of the
+        # rightmost path; the recent roots live in the "mr0" .. "mr7" globals
+        self.member_branch = Box(Bytes, key=b"mk")
 
     @arc4.abimethod(create="require")
     def create(self) -> None:
@@ -30,7 +83,48 @@ class BxHiveRegistry(ARC4Contract):
 
     @arc4.abimethod
     def register_user(self, role: arc4.UInt8, name: arc4.String) -> arc4.UInt32:
-        assert Txn.sender not in self.users, "Already registered"
+        user_id = self._register(Txn.sender, role, name)
+        self._update_member_root()
+        arc4.emit(UserRegistered(user_id=user_id, addr=arc4.Address(Txn.sender), role=role))
+        return user_id
+
+    @arc4.abimethod
+    def register_users(
+        self,
+        addresses: arc4.DynamicArray[arc4.Address],
+        roles: arc4.DynamicArray[arc4.UInt8],
+        names: arc4.DynamicArray[arc4.String],
+        mbr_payment: gtxn.PaymentTransaction,
+    ) -> arc4.UInt32:
+        """Operator bulk registration of a cohort, funded by one MBR payment of
+        USER_MBR + USER_NAME_BYTE_MBR * len(name) per user. User IDs are assigned
+        sequentially; returns the first one. Each user touches three boxes (plus
+        the shared rc_ and mk boxes), so a call fits about 2 users unless the
+        group shares box references. The member root is updated once per call,
+        and one UsersRegistered event covers the whole cohort.
+        """
+        assert self._is_operator(Txn.sender), "Not operator"
+        assert addresses.length == roles.length, "Length mismatch"
+        assert addresses.length == names.length, "Length mismatch"
+        assert mbr_payment.receiver == Global.current_application_address, "Wrong MBR receiver"
+
+        mbr = UInt64(0)
+        for i in urange(names.length):
+            mbr += UInt64(USER_MBR) + UInt64(USER_NAME_BYTE_MBR) * names[i].native.bytes.length
+        assert mbr_payment.amount >= mbr, "Insufficient MBR"
+
+        first_user_id = arc4.UInt32(self.user_count.value)
+        for i in urange(addresses.length):
+            self._register(Account(addresses[i].bytes), roles[i], names[i])
+        self._update_member_root()
+        arc4.emit(UsersRegistered(first_user_id=first_user_id, count=arc4.UInt32(addresses.length)))
+        return first_user_id
+
+    @subroutine
+    def _register(self, addr: Account, role: arc4.UInt8, name: arc4.String) -> arc4.UInt32:
+        assert addr not in self.users, "Already registered"
+        assert self.user_count.value < UInt64(MEMBER_TREE_SIZE), "Registry full"
+        self._insert_member(addr, self.user_count.value)
         user_id = arc4.UInt32(self.user_count.value)
         self.user_count.value += UInt64(1)
         user = User(
@@ -39,10 +133,67 @@ class BxHiveRegistry(ARC4Contract):
             name=name,
             created_at=arc4.UInt64(Global.latest_timestamp),
         )
-        self.users[Txn.sender] = user
-        self.user_ids[user_id] = arc4.Address(Txn.sender)
+        self.users[addr] = user
+        self.user_ids[user_id] = arc4.Address(addr)
+
+        position = UInt64(0)
+        if role in self.role_counts:
+            position = self.role_counts[role].as_uint64()
+        self.role_index[arc4.UInt64((role.as_uint64() << UInt64(32)) + position)] = user_id
+        self.role_counts[role] = arc4.UInt32(position + UInt64(1))
         return user_id
 
+    @subroutine
+    def _insert_member(self, addr: Account, index: UInt64) -> None:
+        """Append sha256(addr) as leaf index; only the branch entry of the first
+        level whose subtree is still open changes."""
+        if not self.member_branch:
+            self.member_branch.create(size=UInt64(MEMBER_PROOF_BYTES))
+        node = op.sha256(addr.bytes)
+        size = index + UInt64(1)
+        for level in urange(MEMBER_TREE_DEPTH):
+            if size & UInt64(1):
+                self.member_branch.replace(level * UInt64(32), node)
+                return
+            ensure_budget(UInt64(_MEMBER_LEVEL_BUDGET), OpUpFeeSource.GroupCredit)
+            node = op.sha256(self.member_branch.extract(level * UInt64(32), UInt64(32)) + node)
+            size = size >> UInt64(1)
+
+    @subroutine
+    def _update_member_root(self) -> None:
+        ensure_budget(UInt64(_MEMBER_ROOT_BUDGET), OpUpFeeSource.GroupCredit)
+        node = op.bzero(32)
+        zero = op.bzero(32)
+        size = self.user_count.value
+        for level in urange(MEMBER_TREE_DEPTH):
+            if size & UInt64(1):
+                node = op.sha256(self.member_branch.extract(level * UInt64(32), UInt64(32)) + node)
+            else:
+                node = op.sha256(node + zero)
+            zero = op.sha256(zero + zero)
+            size = size >> UInt64(1)
+
+        # Shift the new root into slot 0; a full slot hands its oldest root to
+        # the next one, and the last slot drops it
+        carry = node
+        for slot in urange(MEMBER_ROOT_SLOTS):
+            key = member_roots_key(slot)
+            roots = carry
+            slot_roots, exists = op.AppGlobal.get_ex_bytes(Global.current_application_id, key)
+            if exists:
+                roots += slot_roots
+            if roots.length <= UInt64(32 * MEMBER_ROOTS_PER_SLOT):
+                op.AppGlobal.put(key, roots)
+                return
+            op.AppGlobal.put(key, op.extract(roots, 0, 32 * MEMBER_ROOTS_PER_SLOT))
+            carry = op.extract(roots, 32 * MEMBER_ROOTS_PER_SLOT, 32)
+
+    @subroutine
+    def _is_operator(self, addr: Account) -> bool:
+        if addr == self.super_admin.value:
+            return True
+        return addr in self.admins and self.admins[addr].as_uint64() >= UInt64(ADMIN_OPERATOR)
+
     @arc4.abimethod
     def register_template(
         self,
@@ -68,4 +219,70 @@ class BxHiveRegistry(ARC4Contract):
     @arc4.abimethod(readonly=True)
     def get_template(self, template_id: arc4.UInt8) -> ExperimentTemplateInfo:
         assert template_id in self.experiment_templates, "Template not found"
-        return self.experiment_templates[template_id]
\ No newline at end of file
+        return self.experiment_templates[template_id]
+
+    @arc4.abimethod(readonly=True)
+    def get_users(
+        self, start: arc4.UInt32, count: arc4.UInt32
+    ) -> arc4.DynamicArray[arc4.Tuple[arc4.Address, User]]:
+        """(address, User) for user_ids start .. start + count - 1. Names are
+        variable length, so the page also stops early once the encoded result
+        would overflow the return log; continue from start + len(page) while
+        that is below user_count.
+        """
+        end = start.as_uint64() + count.as_uint64()
+        if end > self.user_count.value:
+            end = self.user_count.value
+
+        page = arc4.DynamicArray[arc4.Tuple[arc4.Address, User]]()
+        size = UInt64(2)  # array length prefix
+        for user_id in urange(start.as_uint64(), end):
+            entry = self._user_entry(self.user_ids[arc4.UInt32(user_id)])
+            size += entry.bytes.length + UInt64(2)  # element + its head offset
+            if size > UInt64(_RETURN_PAGE_BYTES):
+                break
+            page.append(entry.copy())
+        return page
+
+    @arc4.abimethod(readonly=True)
+    def get_users_by_role(
+        self, role: arc4.UInt8, start: arc4.UInt32, count: arc4.UInt32
+    ) -> arc4.DynamicArray[arc4.Tuple[arc4.Address, User]]:
+        """Like get_users, but over the users of one role in registration order."""
+        page = arc4.DynamicArray[arc4.Tuple[arc4.Address, User]]()
+        if role not in self.role_counts:
+            return page
+        end = start.as_uint64() + count.as_uint64()
+        if end > self.role_counts[role].as_uint64():
+            end = self.role_counts[role].as_uint64()
+
+        size = UInt64(2)  # array length prefix
+        for position in urange(start.as_uint64(), end):
+            user_id = self.role_index[arc4.UInt64((role.as_uint64() << UInt64(32)) + position)]
+            entry = self._user_entry(self.user_ids[user_id])
+            size += entry.bytes.length + UInt64(2)  # element + its head offset
+            if size > UInt64(_RETURN_PAGE_BYTES):
+                break
+            page.append(entry.copy())
+        return page
+
+    @arc4.abimethod(readonly=True)
+    def get_member_roots(self) -> Bytes:
+        """Recent member tree roots, newest first, 32 bytes each."""
+        roots = Bytes()
+        for slot in urange(MEMBER_ROOT_SLOTS):
+            slot_roots, exists = op.AppGlobal.get_ex_bytes(Global.current_application_id, member_roots_key(slot))
+            if not exists:
+                break
+            roots += slot_roots
+        return roots
+
+    @arc4.abimethod(readonly=True)
+    def get_role_count(self, role: arc4.UInt8) -> arc4.UInt32:
+        if role in self.role_counts:
+            return self.role_counts[role]
+        return arc4.UInt32(0)
+
+    @subroutine
+    def _user_entry(self, addr: arc4.Address) -> arc4.Tuple[arc4.Address, User]:
+        return arc4.Tuple((addr.copy(), self.users[Account(addr.bytes)]))
@@ -0,0 +1,61 @@
+"""Off-chain side of the registry member tree (see smart_contracts/shared/membership.py).
+
+The tree is rebuilt from all registered addresses in user_id order, e.g. paged
+out of BxHiveRegistry.get_users. A proof stays valid while its root is among the
+registry's kept roots (the "mr0" .. "mr7" globals), i.e. until MEMBER_ROOTS_KEPT
+more registration calls land; rebuild and retry if self_enroll_with_proof fails
+with "Invalid membership proof". Registries that predate the tree have no roots,
+so their users enroll with self_enroll instead.
+"""
+
+import hashlib
+from collections.abc import Sequence
+
+from smart_contracts.shared.membership import MEMBER_TREE_DEPTH, MEMBER_TREE_SIZE
+
+
+def _sha256(data: bytes) -> bytes:
+    return hashlib.sha256(data).digest()
+
+
+def _zero_hashes() -> list[bytes]:
+    zeros = [bytes(32)]
+    for _ in range(MEMBER_TREE_DEPTH):
+        zeros.append(_sha256(zeros[-1] + zeros[-1]))
+    return zeros
+
+
+def _levels(addresses: Sequence[bytes]) -> list[list[bytes]]:
+    """Non-empty nodes of every level, leaves first; missing right children are zero hashes."""
+    if len(addresses) > MEMBER_TREE_SIZE:
+        raise ValueError("Too many addresses for the member tree")
+    zeros = _zero_hashes()
+    level = [_sha256(addr) for addr in addresses]
+    levels = [level]
+    for depth in range(MEMBER_TREE_DEPTH):
+        if len(level) % 2:
+            level = [*level, zeros[depth]]
+        level = [_sha256(level[i] + level[i + 1]) for i in range(0, len(level), 2)]
+        levels.append(level)
+    return levels
+
+
+def member_root(addresses: Sequence[bytes]) -> bytes:
+    """Root of the tree holding addresses (32-byte public keys) in user_id order."""
+    if not addresses:
+        return _zero_hashes()[MEMBER_TREE_DEPTH]
+    return _levels(addresses)[MEMBER_TREE_DEPTH][0]
+
+
+def member_proof(addresses: Sequence[bytes], user_id: int) -> bytes:
+    """The MEMBER_PROOF_BYTES proof argument for self_enroll_with_proof."""
+    if not 0 <= user_id < len(addresses):
+        raise ValueError(f"user_id {user_id} not in the member tree")
+    zeros = _zero_hashes()
+    proof = b""
+    index = user_id
+    for depth, level in enumerate(_levels(addresses)[:MEMBER_TREE_DEPTH]):
+        sibling = index ^ 1
+        proof += level[sibling] if sibling < len(level) else zeros[depth]
+        index //= 2
+    return proof
@@ -0,0 +1,112 @@
+from algopy import arc4
+
+# ARC-28 events emitted with arc4.emit(); the struct name is the event name.
+# Every event carries at least two fields: algopy_testing cannot build the
+# one-element tuple behind a single-field struct.
+#
+# An app call may write at most 32 logs totalling 1,024 bytes, so batch methods
+# emit one aggregate event (UsersRegistered, ParticipantsEnrolled,
+# MatchesCreated) rather than one event per item; the items themselves are in
+# the call's arguments or the boxes it wrote.
+
+
+# BxHiveRegistry
+class UserRegistered(arc4.Struct, frozen=True):
+    user_id: arc4.UInt32
+    addr: arc4.Address
+    role: arc4.UInt8
+
+
+class UsersRegistered(arc4.Struct, frozen=True):
+    first_user_id: arc4.UInt32  # user ids first_user_id .. first_user_id + count - 1
+    count: arc4.UInt32
+
+
+# TrustExperiments
+class ExperimentCreated(arc4.Struct, frozen=True):
+    exp_id: arc4.UInt32
+    owner: arc4.Address
+
+
+class VariationCreated(arc4.Struct, frozen=True):
+    exp_id: arc4.UInt32
+    var_id: arc4.UInt32
+    app_id: arc4.UInt64
+
+
+class TreasuryDeposited(arc4.Struct, frozen=True):
+    exp_id: arc4.UInt32
+    amount: arc4.UInt64
+    balance: arc4.UInt64  # treasury balance after the deposit
+
+
+class TreasuryWithdrawn(arc4.Struct, frozen=True):
+    exp_id: arc4.UInt32
+    amount: arc4.UInt64
+    balance: arc4.UInt64  # treasury balance after the withdrawal
+
+
+# TrustVariation
+class ParticipantEnrolled(arc4.Struct, frozen=True):
+    addr: arc4.Address
+    position: arc4.UInt32  # enrollment order, 0-based
+
+
+class ParticipantsEnrolled(arc4.Struct, frozen=True):
+    first_position: arc4.UInt32  # positions first_position .. first_position + count - 1
+    count: arc4.UInt32
+
+
+class MatchCreated(arc4.Struct, frozen=True):
+    match_id: arc4.UInt32
+    investor: arc4.Address
+    trustee: arc4.Address
+
+
+class MatchesCreated(arc4.Struct, frozen=True):
+    first_match_id: arc4.UInt32  # match ids first_match_id .. first_match_id + count - 1
+    count: arc4.UInt32
+
+
+class InvestorDecided(arc4.Struct, frozen=True):
+    match_id: arc4.UInt32
+    investment: arc4.UInt64
+
+
+class TrusteeDecided(arc4.Struct, frozen=True):
+    match_id: arc4.UInt32
+    return_amount: arc4.UInt64
+    investor_payout: arc4.UInt64
+    trustee_payout: arc4.UInt64
+
+
+class MatchPaidOut(arc4.Struct, frozen=True):
+    match_id: arc4.UInt32
+    investor_payout: arc4.UInt64
+    trustee_payout: arc4.UInt64
+
+
+class PayoutClaimed(arc4.Struct, frozen=True):
+    addr: arc4.Address
+    amount: arc4.UInt64
+
+
+class EscrowDeposited(arc4.Struct, frozen=True):
+    amount: arc4.UInt64
+    deposited: arc4.UInt64  # escrow_deposited after the deposit
+
+
+class EscrowWithdrawn(arc4.Struct, frozen=True):
+    receiver: arc4.Address
+    amount: arc4.UInt64
+
+
+class VariationEnded(arc4.Struct, frozen=True):
+    refunded: arc4.UInt64
+    retained: arc4.UInt64  # escrow_pending, still held for unsettled matches
+
+
+class BoxesSwept(arc4.Struct, frozen=True):
+    kind: arc4.UInt8
+    count: arc4.UInt64
+    refunded: arc4.UInt64
@@ -0,0 +1,55 @@
+from algopy import Application, Bytes, UInt64, op, subroutine, urange
+
+# BxHiveRegistry keeps an append-only sha256 Merkle tree of registered addresses:
+# leaf i = sha256(address of user_id i), empty leaves are 32 zero bytes and a
+# parent is sha256(left + right). Consumers check a proof against one of the
+# registry's recent roots instead of calling into the registry.
+MEMBER_TREE_DEPTH = 20
+MEMBER_TREE_SIZE = 1_048_576  # 2**MEMBER_TREE_DEPTH users
+MEMBER_PROOF_BYTES = 640  # one 32-byte sibling hash per level, leaf level first
+# Recent roots, newest first, spread over the globals "mr0" .. "mr7": a global's key
+# and value share 128 bytes, so each slot holds three roots. A proof stays valid
+# for MEMBER_ROOTS_KEPT registration calls after the one that produced its root.
+MEMBER_ROOTS_PER_SLOT = 3
+MEMBER_ROOT_SLOTS = 8
+MEMBER_ROOTS_KEPT = 24  # MEMBER_ROOTS_PER_SLOT * MEMBER_ROOT_SLOTS
+
+
+@subroutine
+def member_root_from_proof(leaf: Bytes, index: UInt64, proof: Bytes) -> Bytes:
+    assert proof.length == UInt64(MEMBER_PROOF_BYTES), "Bad proof length"
+    assert index < UInt64(MEMBER_TREE_SIZE), "Bad proof index"
+    node = leaf
+    for level in urange(MEMBER_TREE_DEPTH):
+        sibling = op.extract(proof, level * UInt64(32), 32)
+        if (index >> level) & UInt64(1):
+            node = op.sha256(sibling + node)
+        else:
+            node = op.sha256(node + sibling)
+    return node
+
+
+@subroutine
+def member_root_known(roots: Bytes, root: Bytes) -> bool:
+    for offset in urange(UInt64(0), roots.length, UInt64(32)):
+        if op.extract(roots, offset, 32) == root:
+            return True
+    return False
+
+
+@subroutine
+def member_roots_key(slot: UInt64) -> Bytes:
+    return Bytes(b"mr") + op.extract(Bytes(b"01234567"), slot, 1)
+
+
+@subroutine
+def member_root_registered(registry: Application, root: Bytes) -> bool:
+    """Whether root is one of the registry's kept roots. Slots fill in order,
+    so the first missing slot ends the search."""
+    for slot in urange(MEMBER_ROOT_SLOTS):
+        roots, exists = op.AppGlobal.get_ex_bytes(registry, member_roots_key(slot))
+        if not exists:
+            return False
+        if member_root_known(roots, root):
+            return True
+    return False
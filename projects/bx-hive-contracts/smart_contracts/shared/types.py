@@ -14,6 +14,11 @@ STATUS_ACTIVE: int = 0
 STATUS_CLOSED: int = 1
 STATUS_COMPLETED: int = 2
 
+# Settlement mode constants
+SETTLEMENT_IMMEDIATE: int = 0
+SETTLEMENT_DEFERRED: int = 1
+SETTLEMENT_CLAIM: int = 2
+
 # Match phase constants
 PHASE_INVESTOR_DECISION: int = 0
 PHASE_TRUSTEE_DECISION: int = 1
@@ -49,9 +54,28 @@ class VariationInfo(arc4.Struct, frozen=True):
     created_at: arc4.UInt64
 
 
+class VariationParams(arc4.Struct, frozen=True):
+    """One variation's configuration for TrustExperiments.create_variations."""
+
+    label: arc4.String
+    e1: arc4.UInt64
+    e2: arc4.UInt64
+    multiplier: arc4.UInt64
+    unit: arc4.UInt64
+    asset_id: arc4.UInt64
+    max_participants: arc4.UInt64
+    escrow: arc4.UInt64
+
+
+class Treasury(arc4.Struct, frozen=True):
+    asset_id: arc4.UInt64
+    balance: arc4.UInt64
+
+
 class ParticipantInfo(arc4.Struct, frozen=True):
     enrolled: arc4.UInt8
     assigned: arc4.UInt8
+    match_id: arc4.UInt32  # only meaningful when assigned == 1
 
 
 class Match(arc4.Struct):
@@ -75,4 +99,25 @@ class VariationConfig(arc4.Struct, frozen=True):
     unit: arc4.UInt64
     asset_id: arc4.UInt64
     status: arc4.UInt8
-    max_participants: arc4.UInt64
\ No newline at end of file
+    max_participants: arc4.UInt64
+
+
+class VariationStats(arc4.Struct):
+    # Running aggregates; squares are 128-bit so they cannot overflow
+    invested_count: arc4.UInt64
+    completed_count: arc4.UInt64
+    sum_investment: arc4.UInt64
+    sumsq_investment: arc4.UInt128
+    sum_return: arc4.UInt64
+    sumsq_return: arc4.UInt128
+    sum_investor_payout: arc4.UInt64
+    sumsq_investor_payout: arc4.UInt128
+    sum_trustee_payout: arc4.UInt64
+    sumsq_trustee_payout: arc4.UInt128
+
+
+class PlayerState(arc4.Struct):
+    participant: ParticipantInfo
+    has_match: arc4.UInt8
+    match: Match
+    config: VariationConfig
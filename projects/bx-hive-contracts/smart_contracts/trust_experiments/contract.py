@@ -1,4 +1,6 @@
 from algopy import (
+    Account,
+    Application,
     ARC4Contract,
     Asset,
     Box,
@@ -6,25 +8,51 @@ from algopy import (
     Bytes,
     Global,
     GlobalState,
+    OpUpFeeSource,
     TransactionType,
     Txn,
     UInt64,
     arc4,
+    ensure_budget,
     gtxn,
     itxn,
+    op,
+    subroutine,
+    urange,
 )
 
+from smart_contracts.shared.events import ExperimentCreated, TreasuryDeposited, TreasuryWithdrawn, VariationCreated
+
 # Variation app MBR (paid as ALGO regardless of payout asset):
 #   - base account MBR: 100_000 (0.1 ALGO)
 #   - +100_000 (0.1 ALGO) per asset opt-in (only when asset_id > 0)
 _VAR_APP_MBR_ALGO = 100_000
 _VAR_APP_MBR_ASA = 200_000
 
-from smart_contracts.shared.types import ExperimentGroup, VariationInfo
+from smart_contracts.shared.types import ExperimentGroup, Treasury, VariationInfo, VariationParams
+
+# get_variations / get_experiments_by_owner page budget: the ABI return log is capped at 1,024 bytes,
+# 4 of which are the return prefix
+_RETURN_PAGE_BYTES = 1_020
+
+# create_variations logs one VariationCreated per variation plus the ABI return,
+# and an app call may write at most 32 logs
+MAX_VARIATIONS_PER_CALL = 31
+
+# Chunked TrustVariation program upload (write_trust_variation_chunk kind)
+PROGRAM_APPROVAL = 0
+PROGRAM_CLEAR = 1
+# The program hash is sha512_256 over itob(approval_len) + itob(clear_len) + the
+# sha512_256 digest of each PROGRAM_HASH_CHUNK-byte slice of approval, then clear
+# (a box larger than 4,096 bytes cannot be hashed in one stack value)
+PROGRAM_HASH_CHUNK = 4096
+# Approval + clear may span at most 4 program pages (3 extra pages)
+_MAX_PROGRAM_BYTES = 8192
+_PROGRAM_PAGE_BYTES = 2048
 
 # TrustVariation GlobalState schema
-_TRUST_VAR_GLOBAL_UINT = 16
-_TRUST_VAR_GLOBAL_BYTES = 1
+_TRUST_VAR_GLOBAL_UINT = 23
+_TRUST_VAR_GLOBAL_BYTES = 2
 
 
 class TrustExperiments(ARC4Contract):
@@ -35,9 +63,20 @@ class TrustExperiments(ARC4Contract):
         self.experiments = BoxMap(arc4.UInt32, ExperimentGroup, key_prefix=b"e_")
         # BoxMap: packed UInt64 key (high 32 bits = exp_id, low 32 bits = var_id) → VariationInfo
         self.variations = BoxMap(arc4.UInt64, VariationInfo, key_prefix=b"v_")
-        # On-chain TrustVariation bytecode (set once after deploy via set_trust_variation_program)
+        # BoxMap: owner → exp_ids they created, in creation order
+        self.owner_experiments = BoxMap(Account, arc4.DynamicArray[arc4.UInt32], key_prefix=b"oe_")
+        # BoxMap: variation app_id → packed (exp_id, var_id) key into variations
+        self.variation_apps = BoxMap(arc4.UInt64, arc4.UInt64, key_prefix=b"va_")
+        # BoxMap: exp_id → pooled escrow that treasury-funded variations draw from
+        self.treasuries = BoxMap(arc4.UInt32, Treasury, key_prefix=b"tr_")
+        # On-chain TrustVariation bytecode (set after deploy via set_trust_variation_program,
+        # or uploaded in chunks: begin_ → write_ → finalize_trust_variation_program)
         self.tv_approval = Box(Bytes, key=b"tv_approval")
         self.tv_clear = Box(Bytes, key=b"tv_clear")
+        # Finalized program hash and version; tv_ready is 0 while an upload is in progress
+        self.tv_hash = GlobalState(Bytes)
+        self.tv_version = GlobalState(UInt64(0))
+        self.tv_ready = GlobalState(UInt64(0))
 
     @arc4.abimethod(create="require")
     def create(self, registry_app: arc4.UInt64) -> None:
@@ -54,6 +93,100 @@ class TrustExperiments(ARC4Contract):
         assert mbr_payment.receiver == Global.current_application_address, "Wrong MBR receiver"
         self.tv_approval.value = approval
         self.tv_clear.value = clear
+        self._record_program(self._program_hash())
+
+    @arc4.abimethod
+    def begin_trust_variation_upload(
+        self,
+        approval_size: arc4.UInt64,
+        clear_size: arc4.UInt64,
+        mbr_payment: gtxn.PaymentTransaction,
+    ) -> None:
+        """Create or resize the program boxes for a chunked upload. Resizing keeps
+        existing bytes, so an interrupted upload of the same program resumes where
+        it stopped. The payment must cover any box growth; spawning is disabled
+        until finalize_trust_variation_program succeeds.
+        """
+        assert Txn.sender == Global.creator_address, "Not creator"
+        assert mbr_payment.receiver == Global.current_application_address, "Wrong MBR receiver"
+        approval_len = approval_size.as_uint64()
+        clear_len = clear_size.as_uint64()
+        assert approval_len > UInt64(0), "Empty program"
+        assert clear_len > UInt64(0), "Empty program"
+        assert approval_len + clear_len <= UInt64(_MAX_PROGRAM_BYTES), "Program too large"
+
+        # Box MBR: 2,500 + 400 * (key_len + size); keys are 11 and 8 bytes
+        cost = UInt64(0)
+        if self.tv_approval:
+            if approval_len > self.tv_approval.length:
+                cost += UInt64(400) * (approval_len - self.tv_approval.length)
+            self.tv_approval.resize(approval_len)
+        else:
+            cost += UInt64(2_500 + 400 * 11) + UInt64(400) * approval_len
+            self.tv_approval.create(size=approval_len)
+        if self.tv_clear:
+            if clear_len > self.tv_clear.length:
+                cost += UInt64(400) * (clear_len - self.tv_clear.length)
+            self.tv_clear.resize(clear_len)
+        else:
+            cost += UInt64(2_500 + 400 * 8) + UInt64(400) * clear_len
+            self.tv_clear.create(size=clear_len)
+        assert mbr_payment.amount >= cost, "Insufficient MBR"
+        self.tv_ready.value = UInt64(0)
+
+    @arc4.abimethod
+    def write_trust_variation_chunk(self, kind: arc4.UInt8, offset: arc4.UInt64, chunk: Bytes) -> None:
+        """Write chunk at offset into the approval or clear box. Chunks are
+        independent, so they can be sent in any order and in parallel groups.
+        """
+        assert Txn.sender == Global.creator_address, "Not creator"
+        self.tv_ready.value = UInt64(0)
+        if kind.as_uint64() == UInt64(PROGRAM_APPROVAL):
+            self.tv_approval.replace(offset.as_uint64(), chunk)
+        else:
+            assert kind.as_uint64() == UInt64(PROGRAM_CLEAR), "Unknown program kind"
+            self.tv_clear.replace(offset.as_uint64(), chunk)
+
+    @arc4.abimethod
+    def finalize_trust_variation_program(self, expected_hash: Bytes) -> arc4.UInt64:
+        """Check the uploaded boxes against the deployer's program hash, record
+        it and bump tv_version. Returns the new version. Hashing 8 KB needs about
+        1,000 extra opcodes, drawn from op-up calls paid by the group's fees.
+        """
+        assert Txn.sender == Global.creator_address, "Not creator"
+        assert self.tv_approval, "Upload not started"
+        assert self.tv_clear, "Upload not started"
+        ensure_budget(
+            UInt64(700) + (self.tv_approval.length + self.tv_clear.length) // UInt64(8),
+            OpUpFeeSource.GroupCredit,
+        )
+        program_hash = self._program_hash()
+        assert program_hash == expected_hash, "Program hash mismatch"
+        return arc4.UInt64(self._record_program(program_hash))
+
+    @subroutine
+    def _program_hash(self) -> Bytes:
+        digests = op.itob(self.tv_approval.length) + op.itob(self.tv_clear.length)
+        approval_len = self.tv_approval.length
+        for start in urange(UInt64(0), approval_len, UInt64(PROGRAM_HASH_CHUNK)):
+            length = approval_len - start
+            if length > UInt64(PROGRAM_HASH_CHUNK):
+                length = UInt64(PROGRAM_HASH_CHUNK)
+            digests += op.sha512_256(self.tv_approval.extract(start, length))
+        clear_len = self.tv_clear.length
+        for start in urange(UInt64(0), clear_len, UInt64(PROGRAM_HASH_CHUNK)):
+            length = clear_len - start
+            if length > UInt64(PROGRAM_HASH_CHUNK):
+                length = UInt64(PROGRAM_HASH_CHUNK)
+            digests += op.sha512_256(self.tv_clear.extract(start, length))
+        return op.sha512_256(digests)
+
+    @subroutine
+    def _record_program(self, program_hash: Bytes) -> UInt64:
+        self.tv_hash.value = program_hash
+        self.tv_version.value += UInt64(1)
+        self.tv_ready.value = UInt64(1)
+        return self.tv_version.value
 
     @arc4.abimethod
     def opt_in_to_asset(
@@ -90,8 +223,19 @@ class TrustExperiments(ARC4Contract):
             created_at=arc4.UInt64(Global.latest_timestamp),
             variation_count=arc4.UInt64(0),
         )
+        self._index_owner_experiment(exp_id)
+        arc4.emit(ExperimentCreated(exp_id=exp_id, owner=arc4.Address(Txn.sender)))
         return exp_id
 
+    @subroutine
+    def _index_owner_experiment(self, exp_id: arc4.UInt32) -> None:
+        if Txn.sender in self.owner_experiments:
+            exp_ids = self.owner_experiments[Txn.sender].copy()
+            exp_ids.append(exp_id)
+            self.owner_experiments[Txn.sender] = exp_ids.copy()
+        else:
+            self.owner_experiments[Txn.sender] = arc4.DynamicArray(exp_id)
+
     @arc4.abimethod
     def create_variation(
         self,
@@ -109,106 +253,151 @@ class TrustExperiments(ARC4Contract):
         assert exp_id in self.experiments, "Experiment not found"
         experiment = self.experiments[exp_id].copy()
         assert experiment.owner == arc4.Address(Txn.sender), "Not experiment owner"
-        assert self.tv_approval, "TrustVariation program not set"
-        assert self.tv_clear, "TrustVariation program not set"
-
-        asset_id_value = asset_id.as_uint64()
+        assert self.tv_ready.value == UInt64(1), "TrustVariation program not set"
 
         # MBR leg funds the new variation app's account: 0.1 ALGO base + 0.1 ALGO
         # per asset opt-in. Always paid in ALGO regardless of payout asset.
         assert mbr_payment.receiver == Global.current_application_address, "Wrong MBR receiver"
-        if asset_id_value == UInt64(0):
+        if asset_id.as_uint64() == UInt64(0):
             assert mbr_payment.amount >= UInt64(_VAR_APP_MBR_ALGO), "MBR must be >= 0.1 ALGO"
         else:
             assert mbr_payment.amount >= UInt64(_VAR_APP_MBR_ASA), "MBR must be >= 0.2 ALGO"
 
-        # Escrow leg holds the actual payout pool. Payment for ALGO experiments,
-        # AssetTransfer of the chosen ASA otherwise.
-        escrow_amount = UInt64(0)
-        if asset_id_value == UInt64(0):
-            assert escrow_funding.type == TransactionType.Payment, "Escrow must be Payment for ALGO"
-            assert escrow_funding.receiver == Global.current_application_address, "Wrong escrow receiver"
-            assert escrow_funding.amount > UInt64(0), "Escrow must be > 0"
-            escrow_amount = escrow_funding.amount
-        else:
-            assert escrow_funding.type == TransactionType.AssetTransfer, "Escrow must be AssetTransfer for ASA"
-            assert escrow_funding.asset_receiver == Global.current_application_address, "Wrong escrow receiver"
-            assert escrow_funding.xfer_asset.id == asset_id_value, "Wrong asset"
-            assert escrow_funding.asset_amount > UInt64(0), "Escrow must be > 0"
-            escrow_amount = escrow_funding.asset_amount
-
+        escrow_amount = self._check_escrow(escrow_funding, asset_id.as_uint64())
         var_id = arc4.UInt32(experiment.variation_count.as_uint64())
+        params = VariationParams(
+            label=label,
+            e1=e1,
+            e2=e2,
+            multiplier=multiplier,
+            unit=unit,
+            asset_id=asset_id,
+            max_participants=max_participants,
+            escrow=arc4.UInt64(escrow_amount),
+        )
+        new_app_id = self._spawn_variation(exp_id, var_id, params, mbr_payment.amount, treasury_funded=False)
 
-        # Deploy TrustVariation and call create() in one transaction
-        # Selector: create(uint64,uint32,uint32,address,uint64,uint64,uint64,uint64,uint64,uint64,uint64)void
-        deployed = itxn.ApplicationCall(
-            approval_program=self.tv_approval.value,
-            clear_state_program=self.tv_clear.value,
-            global_num_uint=_TRUST_VAR_GLOBAL_UINT,
-            global_num_bytes=_TRUST_VAR_GLOBAL_BYTES,
-            app_args=(
-                Bytes(b"\xb8\xdb\x86\x05"),
-                arc4.UInt64(Global.current_application_id.id).bytes,
-                exp_id.bytes,
-                var_id.bytes,
-                arc4.Address(Txn.sender).bytes,
-                e1.bytes,
-                e2.bytes,
-                multiplier.bytes,
-                unit.bytes,
-                asset_id.bytes,
-                arc4.UInt64(self.registry_app.value).bytes,
-                max_participants.bytes,
-            ),
-            fee=0,
-        ).submit()
-        new_app = deployed.created_app
-
-        # Fund the new variation app's account with MBR (covers base + opt-in).
-        itxn.Payment(
-            receiver=new_app.address,
-            amount=mbr_payment.amount,
-            fee=0,
-        ).submit()
+        # Increment experiment variation count
+        self.experiments[exp_id] = ExperimentGroup(
+            exp_id=experiment.exp_id,
+            owner=experiment.owner.copy(),
+            name=experiment.name,
+            created_at=experiment.created_at,
+            variation_count=arc4.UInt64(experiment.variation_count.as_uint64() + UInt64(1)),
+        )
 
-        # Forward escrow to the new TrustVariation app account.
-        if asset_id_value == UInt64(0):
-            itxn.Payment(
-                receiver=new_app.address,
-                amount=escrow_amount,
-                fee=0,
-            ).submit()
-        else:
-            itxn.AssetTransfer(
-                xfer_asset=Asset(asset_id_value),
-                asset_receiver=new_app.address,
-                asset_amount=escrow_amount,
-                fee=0,
-            ).submit()
+        return new_app_id
 
-        # Record the deposit in TrustVariation
-        # Selector: record_escrow(uint64)void
-        itxn.ApplicationCall(
-            app_id=new_app,
-            app_args=(
-                Bytes(b"\x5c\x9a\x83\x6b"),
-                arc4.UInt64(escrow_amount).bytes,
-            ),
-            fee=0,
-        ).submit()
+    @arc4.abimethod
+    def create_variations(
+        self,
+        exp_id: arc4.UInt32,
+        configs: arc4.DynamicArray[VariationParams],
+        mbr_payment: gtxn.PaymentTransaction,
+        escrow_funding: gtxn.Transaction,
+    ) -> arc4.DynamicArray[arc4.UInt64]:
+        """Spawn several variations (e.g. every cell of a factorial design) in one
+        call. A single MBR leg covers every variation's app MBR and a single
+        escrow leg carries the sum of the configs' escrow amounts, so all configs
+        must share one payout asset. Any MBR surplus goes to the last variation.
+
+        At most MAX_VARIATIONS_PER_CALL configs per call. Each variation takes 4
+        inner transactions; the group needs one extra app call per 4 variations
+        beyond the first 4 to pool enough inner-transaction budget.
+        Returns the new app IDs in config order.
+        """
+        assert exp_id in self.experiments, "Experiment not found"
+        experiment = self.experiments[exp_id].copy()
+        assert experiment.owner == arc4.Address(Txn.sender), "Not experiment owner"
+        assert self.tv_ready.value == UInt64(1), "TrustVariation program not set"
+        assert configs.length > UInt64(0), "No configs"
+        assert configs.length <= UInt64(MAX_VARIATIONS_PER_CALL), "Too many configs"
+
+        asset_id_value = configs[0].asset_id.as_uint64()
+        total_escrow = UInt64(0)
+        for i in urange(configs.length):
+            assert configs[i].asset_id.as_uint64() == asset_id_value, "Mixed payout assets"
+            assert configs[i].escrow.as_uint64() > UInt64(0), "Escrow must be > 0"
+            total_escrow += configs[i].escrow.as_uint64()
+
+        var_mbr = self._variation_mbr(asset_id_value)
+        assert mbr_payment.receiver == Global.current_application_address, "Wrong MBR receiver"
+        assert mbr_payment.amount >= var_mbr * configs.length, "Insufficient MBR"
+        assert self._check_escrow(escrow_funding, asset_id_value) == total_escrow, "Escrow must equal config total"
+
+        first_var_id = experiment.variation_count.as_uint64()
+        last = configs.length - UInt64(1)
+        app_ids = arc4.DynamicArray[arc4.UInt64]()
+        for i in urange(configs.length):
+            mbr_amount = var_mbr
+            if i == last:
+                mbr_amount = mbr_payment.amount - var_mbr * last
+            var_id = arc4.UInt32(first_var_id + i)
+            app_ids.append(self._spawn_variation(exp_id, var_id, configs[i], mbr_amount, treasury_funded=False))
 
-        # Packed composite key: high 32 bits = exp_id, low 32 bits = var_id
-        variation_key = arc4.UInt64(
-            experiment.exp_id.as_uint64() * UInt64(4294967296) + var_id.as_uint64()
-        )
-        self.variations[variation_key] = VariationInfo(
-            var_id=var_id,
-            app_id=arc4.UInt64(new_app.id),
-            label=label,
-            created_at=arc4.UInt64(Global.latest_timestamp),
+        self.experiments[exp_id] = ExperimentGroup(
+            exp_id=experiment.exp_id,
+            owner=experiment.owner.copy(),
+            name=experiment.name,
+            created_at=experiment.created_at,
+            variation_count=arc4.UInt64(first_var_id + configs.length),
         )
+        return app_ids
+
+    @arc4.abimethod
+    def deposit_treasury(self, exp_id: arc4.UInt32, asset_id: arc4.UInt64, funding: gtxn.Transaction) -> None:
+        """Add funds to the experiment treasury. The first deposit fixes the
+        treasury's payout asset; the treasury box MBR comes from the app account.
+        """
+        assert exp_id in self.experiments, "Experiment not found"
+        assert self.experiments[exp_id].owner == arc4.Address(Txn.sender), "Not experiment owner"
+        amount = self._check_escrow(funding, asset_id.as_uint64())
+        balance = UInt64(0)
+        if exp_id in self.treasuries:
+            treasury = self.treasuries[exp_id]
+            assert treasury.asset_id == asset_id, "Wrong asset"
+            balance = treasury.balance.as_uint64()
+        self.treasuries[exp_id] = Treasury(asset_id=asset_id, balance=arc4.UInt64(balance + amount))
+        arc4.emit(TreasuryDeposited(exp_id=exp_id, amount=arc4.UInt64(amount), balance=arc4.UInt64(balance + amount)))
+
+    @arc4.abimethod
+    def withdraw_treasury(self, exp_id: arc4.UInt32, amount: arc4.UInt64) -> None:
+        assert exp_id in self.experiments, "Experiment not found"
+        assert self.experiments[exp_id].owner == arc4.Address(Txn.sender), "Not experiment owner"
+        assert exp_id in self.treasuries, "No treasury"
+        treasury = self.treasuries[exp_id]
+        assert treasury.balance.as_uint64() >= amount.as_uint64(), "Insufficient treasury"
+        balance = treasury.balance.as_uint64() - amount.as_uint64()
+        self.treasuries[exp_id] = Treasury(asset_id=treasury.asset_id, balance=arc4.UInt64(balance))
+        self._send_funds(Txn.sender, treasury.asset_id.as_uint64(), amount.as_uint64())
+        arc4.emit(TreasuryWithdrawn(exp_id=exp_id, amount=amount, balance=arc4.UInt64(balance)))
+
+    @arc4.abimethod
+    def create_treasury_variation(
+        self,
+        exp_id: arc4.UInt32,
+        params: VariationParams,
+        mbr_payment: gtxn.PaymentTransaction,
+    ) -> arc4.UInt64:
+        """Spawn a variation with no escrow of its own: it draws payouts from the
+        experiment treasury as trustee decisions need them (see draw_escrow).
+        Three inner transactions instead of four, and no capital locked per cell.
+        params.escrow must be 0.
+        """
+        assert exp_id in self.experiments, "Experiment not found"
+        experiment = self.experiments[exp_id].copy()
+        assert experiment.owner == arc4.Address(Txn.sender), "Not experiment owner"
+        assert self.tv_ready.value == UInt64(1), "TrustVariation program not set"
+        assert exp_id in self.treasuries, "No treasury"
+        assert self.treasuries[exp_id].asset_id == params.asset_id, "Wrong asset"
+        assert params.escrow.as_uint64() == UInt64(0), "Treasury variations hold no escrow"
+
+        assert mbr_payment.receiver == Global.current_application_address, "Wrong MBR receiver"
+        assert mbr_payment.amount >= self._variation_mbr(params.asset_id.as_uint64()), "Insufficient MBR"
+
+        var_id = arc4.UInt32(experiment.variation_count.as_uint64())
+        new_app_id = self._spawn_variation(exp_id, var_id, params, mbr_payment.amount, treasury_funded=True)
 
-        # Increment experiment variation count
         self.experiments[exp_id] = ExperimentGroup(
             exp_id=experiment.exp_id,
             owner=experiment.owner.copy(),
@@ -216,8 +405,26 @@ class TrustExperiments(ARC4Contract):
             created_at=experiment.created_at,
             variation_count=arc4.UInt64(experiment.variation_count.as_uint64() + UInt64(1)),
         )
+        return new_app_id
 
-        return arc4.UInt64(new_app.id)
+    @arc4.abimethod
+    def draw_escrow(self, exp_id: arc4.UInt32, var_id: arc4.UInt32, amount: arc4.UInt64) -> None:
+        """Inner call from a treasury-funded TrustVariation: send it amount from
+        the experiment treasury. Only the variation app recorded under
+        (exp_id, var_id) may draw.
+        """
+        key = arc4.UInt64(exp_id.as_uint64() * UInt64(4294967296) + var_id.as_uint64())
+        assert key in self.variations, "Variation not found"
+        variation_app = self.variations[key].app_id.as_uint64()
+        assert Global.caller_application_id == variation_app, "Not the variation app"
+        assert exp_id in self.treasuries, "No treasury"
+        treasury = self.treasuries[exp_id]
+        assert treasury.balance.as_uint64() >= amount.as_uint64(), "Insufficient treasury"
+        self.treasuries[exp_id] = Treasury(
+            asset_id=treasury.asset_id,
+            balance=arc4.UInt64(treasury.balance.as_uint64() - amount.as_uint64()),
+        )
+        self._send_funds(Application(variation_app).address, treasury.asset_id.as_uint64(), amount.as_uint64())
 
     @arc4.abimethod
     def create_experiment_with_variation(
@@ -233,51 +440,101 @@ class TrustExperiments(ARC4Contract):
         mbr_payment: gtxn.PaymentTransaction,
         escrow_funding: gtxn.Transaction,
     ) -> tuple[arc4.UInt32, arc4.UInt64]:
-        assert self.tv_approval, "TrustVariation program not set"
-        assert self.tv_clear, "TrustVariation program not set"
-
-        asset_id_value = asset_id.as_uint64()
+        assert self.tv_ready.value == UInt64(1), "TrustVariation program not set"
 
         # MBR leg funds the new variation app's account; always ALGO.
         assert mbr_payment.receiver == Global.current_application_address, "Wrong MBR receiver"
-        if asset_id_value == UInt64(0):
+        if asset_id.as_uint64() == UInt64(0):
             assert mbr_payment.amount >= UInt64(_VAR_APP_MBR_ALGO), "MBR must be >= 0.1 ALGO"
         else:
             assert mbr_payment.amount >= UInt64(_VAR_APP_MBR_ASA), "MBR must be >= 0.2 ALGO"
 
-        # Escrow leg: Payment for ALGO, AssetTransfer for ASA.
-        escrow_amount = UInt64(0)
-        if asset_id_value == UInt64(0):
-            assert escrow_funding.type == TransactionType.Payment, "Escrow must be Payment for ALGO"
-            assert escrow_funding.receiver == Global.current_application_address, "Wrong escrow receiver"
-            assert escrow_funding.amount > UInt64(0), "Escrow must be > 0"
-            escrow_amount = escrow_funding.amount
-        else:
-            assert escrow_funding.type == TransactionType.AssetTransfer, "Escrow must be AssetTransfer for ASA"
-            assert escrow_funding.asset_receiver == Global.current_application_address, "Wrong escrow receiver"
-            assert escrow_funding.xfer_asset.id == asset_id_value, "Wrong asset"
-            assert escrow_funding.asset_amount > UInt64(0), "Escrow must be > 0"
-            escrow_amount = escrow_funding.asset_amount
+        escrow_amount = self._check_escrow(escrow_funding, asset_id.as_uint64())
 
         # Create the experiment group
         exp_id = arc4.UInt32(self.experiment_count.value)
         self.experiment_count.value += UInt64(1)
+        created_at = arc4.UInt64(Global.latest_timestamp)
+        self._index_owner_experiment(exp_id)
+
+        arc4.emit(ExperimentCreated(exp_id=exp_id, owner=arc4.Address(Txn.sender)))
+
+        # Create the first variation (var_id = 0)
+        params = VariationParams(
+            label=label,
+            e1=e1,
+            e2=e2,
+            multiplier=multiplier,
+            unit=unit,
+            asset_id=asset_id,
+            max_participants=max_participants,
+            escrow=arc4.UInt64(escrow_amount),
+        )
+        new_app_id = self._spawn_variation(exp_id, arc4.UInt32(0), params, mbr_payment.amount, treasury_funded=False)
+
         self.experiments[exp_id] = ExperimentGroup(
             exp_id=exp_id,
             owner=arc4.Address(Txn.sender),
             name=name,
-            created_at=arc4.UInt64(Global.latest_timestamp),
-            variation_count=arc4.UInt64(0),
+            created_at=created_at,
+            variation_count=arc4.UInt64(1),
         )
 
-        # Create the first variation (var_id = 0)
-        var_id = arc4.UInt32(0)
+        return exp_id, new_app_id
+
+    @subroutine
+    def _variation_mbr(self, asset_id: UInt64) -> UInt64:
+        if asset_id == UInt64(0):
+            return UInt64(_VAR_APP_MBR_ALGO)
+        return UInt64(_VAR_APP_MBR_ASA)
+
+    @subroutine
+    def _check_escrow(self, escrow_funding: gtxn.Transaction, asset_id: UInt64) -> UInt64:
+        """Validate the escrow leg (Payment for ALGO, AssetTransfer of the payout
+        ASA otherwise) and return its amount.
+        """
+        if asset_id == UInt64(0):
+            assert escrow_funding.type == TransactionType.Payment, "Escrow must be Payment for ALGO"
+            assert escrow_funding.receiver == Global.current_application_address, "Wrong escrow receiver"
+            assert escrow_funding.amount > UInt64(0), "Escrow must be > 0"
+            return escrow_funding.amount
+        assert escrow_funding.type == TransactionType.AssetTransfer, "Escrow must be AssetTransfer for ASA"
+        assert escrow_funding.asset_receiver == Global.current_application_address, "Wrong escrow receiver"
+        assert escrow_funding.xfer_asset.id == asset_id, "Wrong asset"
+        assert escrow_funding.asset_amount > UInt64(0), "Escrow must be > 0"
+        return escrow_funding.asset_amount
+
+    @subroutine
+    def _spawn_variation(
+        self,
+        exp_id: arc4.UInt32,
+        var_id: arc4.UInt32,
+        params: VariationParams,
+        mbr_amount: UInt64,
+        *,
+        treasury_funded: bool,
+    ) -> arc4.UInt64:
+        """Deploy a TrustVariation, fund its MBR, forward its escrow and record
+        it under (exp_id, var_id). Four inner transactions; three when the
+        variation is treasury-funded instead of holding escrow.
+        """
+
+        # Programs over 4,096 bytes don't fit one stack value, so the approval
+        # program is passed as two pages (the second may be empty)
+        approval_len = self.tv_approval.length
+        first_page = approval_len
+        if first_page > UInt64(4096):
+            first_page = UInt64(4096)
 
         # Deploy TrustVariation and call create() in one transaction
         # Selector: create(uint64,uint32,uint32,address,uint64,uint64,uint64,uint64,uint64,uint64,uint64)void
         deployed = itxn.ApplicationCall(
-            approval_program=self.tv_approval.value,
+            approval_program=(
+                self.tv_approval.extract(0, first_page),
+                self.tv_approval.extract(first_page, approval_len - first_page),
+            ),
             clear_state_program=self.tv_clear.value,
+            extra_program_pages=(approval_len + self.tv_clear.length - UInt64(1)) // UInt64(_PROGRAM_PAGE_BYTES),
             global_num_uint=_TRUST_VAR_GLOBAL_UINT,
             global_num_bytes=_TRUST_VAR_GLOBAL_BYTES,
             app_args=(
@@ -286,80 +543,146 @@ class TrustExperiments(ARC4Contract):
                 exp_id.bytes,
                 var_id.bytes,
                 arc4.Address(Txn.sender).bytes,
-                e1.bytes,
-                e2.bytes,
-                multiplier.bytes,
-                unit.bytes,
-                asset_id.bytes,
+                params.e1.bytes,
+                params.e2.bytes,
+                params.multiplier.bytes,
+                params.unit.bytes,
+                params.asset_id.bytes,
                 arc4.UInt64(self.registry_app.value).bytes,
-                max_participants.bytes,
+                params.max_participants.bytes,
             ),
             fee=0,
         ).submit()
         new_app = deployed.created_app
 
-        # Fund the new variation app's account with MBR.
+        # Fund the new variation app's account with MBR (covers base + opt-in).
         itxn.Payment(
             receiver=new_app.address,
-            amount=mbr_payment.amount,
+            amount=mbr_amount,
             fee=0,
         ).submit()
 
-        # Forward escrow to the new TrustVariation app account.
-        if asset_id_value == UInt64(0):
-            itxn.Payment(
-                receiver=new_app.address,
-                amount=escrow_amount,
+        if treasury_funded:
+            # Selector: enable_treasury_funding()void
+            itxn.ApplicationCall(
+                app_id=new_app,
+                app_args=(Bytes(b"\x09\xc1\xc3\xe7"),),
                 fee=0,
             ).submit()
         else:
-            itxn.AssetTransfer(
-                xfer_asset=Asset(asset_id_value),
-                asset_receiver=new_app.address,
-                asset_amount=escrow_amount,
+            # Forward escrow to the new TrustVariation app account.
+            self._send_funds(new_app.address, params.asset_id.as_uint64(), params.escrow.as_uint64())
+
+            # Record the deposit in TrustVariation
+            # Selector: record_escrow(uint64)void
+            itxn.ApplicationCall(
+                app_id=new_app,
+                app_args=(
+                    Bytes(b"\x5c\x9a\x83\x6b"),
+                    params.escrow.bytes,
+                ),
                 fee=0,
             ).submit()
 
-        # Record the deposit in TrustVariation
-        # Selector: record_escrow(uint64)void
-        itxn.ApplicationCall(
-            app_id=new_app,
-            app_args=(
-                Bytes(b"\x5c\x9a\x83\x6b"),
-                arc4.UInt64(escrow_amount).bytes,
-            ),
-            fee=0,
-        ).submit()
-
-        # Store variation info
-        variation_key = arc4.UInt64(
-            exp_id.as_uint64() * UInt64(4294967296) + var_id.as_uint64()
-        )
+        # Packed composite key: high 32 bits = exp_id, low 32 bits = var_id
+        variation_key = arc4.UInt64(exp_id.as_uint64() * UInt64(4294967296) + var_id.as_uint64())
         self.variations[variation_key] = VariationInfo(
             var_id=var_id,
             app_id=arc4.UInt64(new_app.id),
-            label=label,
+            label=params.label,
             created_at=arc4.UInt64(Global.latest_timestamp),
         )
+        self.variation_apps[arc4.UInt64(new_app.id)] = variation_key
+        arc4.emit(VariationCreated(exp_id=exp_id, var_id=var_id, app_id=arc4.UInt64(new_app.id)))
 
-        # Set variation_count to 1
-        self.experiments[exp_id] = ExperimentGroup(
-            exp_id=exp_id,
-            owner=arc4.Address(Txn.sender),
-            name=name,
-            created_at=self.experiments[exp_id].created_at,
-            variation_count=arc4.UInt64(1),
-        )
+        return arc4.UInt64(new_app.id)
 
-        return exp_id, arc4.UInt64(new_app.id)
+    @subroutine
+    def _send_funds(self, receiver: Account, asset_id: UInt64, amount: UInt64) -> None:
+        if asset_id == UInt64(0):
+            itxn.Payment(
+                receiver=receiver,
+                amount=amount,
+                fee=0,
+            ).submit()
+        else:
+            itxn.AssetTransfer(
+                xfer_asset=Asset(asset_id),
+                asset_receiver=receiver,
+                asset_amount=amount,
+                fee=0,
+            ).submit()
 
     @arc4.abimethod(readonly=True)
     def get_experiment(self, exp_id: arc4.UInt32) -> ExperimentGroup:
         assert exp_id in self.experiments, "Experiment not found"
         return self.experiments[exp_id]
 
+    @arc4.abimethod(readonly=True)
+    def get_experiments_by_owner(
+        self, owner: Account, start: arc4.UInt32, count: arc4.UInt32
+    ) -> arc4.DynamicArray[ExperimentGroup]:
+        """The owner's experiments start .. start + count - 1, in creation order.
+        Like get_variations, the page stops early at the end of the index or once
+        the encoded result would overflow the return log.
+        """
+        page = arc4.DynamicArray[ExperimentGroup]()
+        if owner not in self.owner_experiments:
+            return page
+
+        exp_ids = self.owner_experiments[owner].copy()
+        end = start.as_uint64() + count.as_uint64()
+        if end > exp_ids.length:
+            end = exp_ids.length
+
+        size = UInt64(2)  # array length prefix
+        for i in urange(start.as_uint64(), end):
+            experiment = self.experiments[exp_ids[i]]
+            size += experiment.bytes.length + UInt64(2)  # element + its head offset
+            if size > UInt64(_RETURN_PAGE_BYTES):
+                break
+            page.append(experiment)
+        return page
+
+    @arc4.abimethod(readonly=True)
+    def get_treasury(self, exp_id: arc4.UInt32) -> Treasury:
+        assert exp_id in self.treasuries, "No treasury"
+        return self.treasuries[exp_id]
+
     @arc4.abimethod(readonly=True)
     def get_variation(self, exp_id: arc4.UInt32, var_id: arc4.UInt32) -> VariationInfo:
         key = arc4.UInt64(exp_id.as_uint64() * UInt64(4294967296) + var_id.as_uint64())
         assert key in self.variations, "Variation not found"
         return self.variations[key]
+
+    @arc4.abimethod(readonly=True)
+    def get_variation_by_app(self, app_id: arc4.UInt64) -> tuple[arc4.UInt32, VariationInfo]:
+        """Resolve a TrustVariation app ID to its exp_id and variation record."""
+        assert app_id in self.variation_apps, "Variation not found"
+        key = self.variation_apps[app_id]
+        return arc4.UInt32(key.as_uint64() >> UInt64(32)), self.variations[key]
+
+    @arc4.abimethod(readonly=True)
+    def get_variations(
+        self, exp_id: arc4.UInt32, start: arc4.UInt32, count: arc4.UInt32
+    ) -> arc4.DynamicArray[VariationInfo]:
+        """Variations start .. start + count - 1 of an experiment, in var_id order.
+        The page stops early at variation_count, or once the encoded result would
+        overflow the return log (labels are variable length); continue from
+        start + len(page) while that is below variation_count.
+        """
+        assert exp_id in self.experiments, "Experiment not found"
+        end = start.as_uint64() + count.as_uint64()
+        variation_count = self.experiments[exp_id].variation_count.as_uint64()
+        if end > variation_count:
+            end = variation_count
+
+        page = arc4.DynamicArray[VariationInfo]()
+        size = UInt64(2)  # array length prefix
+        for var_id in urange(start.as_uint64(), end):
+            info = self.variations[arc4.UInt64(exp_id.as_uint64() * UInt64(4294967296) + var_id)]
+            size += info.bytes.length + UInt64(2)  # element + its head offset
+            if size > UInt64(_RETURN_PAGE_BYTES):
+                break
+            page.append(info)
+        return page
@@ -1,11 +1,26 @@
 import base64
 import logging
+import typing
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import algokit_utils
+from algosdk import encoding
+
+from smart_contracts.trust_experiments.contract import PROGRAM_APPROVAL, PROGRAM_CLEAR, PROGRAM_HASH_CHUNK
+
+if typing.TYPE_CHECKING:
+    from smart_contracts.artifacts.trust_experiments.trust_experiments_client import TrustExperimentsClient
 
 logger = logging.getLogger(__name__)
 
+# App args are capped at 2 KB per call (selector + kind + offset + length prefix included)
+_UPLOAD_CHUNK_BYTES = 2_000
+_UPLOAD_GROUP_SIZE = 16
+_UPLOAD_PARALLEL_GROUPS = 4
+# Box I/O budget granted per box reference
+_BOX_QUOTA_BYTES = 1_024
+
 
 def deploy() -> None:
     from smart_contracts.artifacts.trust_experiments.trust_experiments_client import (
@@ -52,26 +67,140 @@ def deploy() -> None:
 
     # Upload TrustVariation bytecode to on-chain box storage.
     # This is idempotent — safe to re-run after contract upgrades.
-    artifact_path = Path(__file__).parent.parent / "artifacts" / "trust_variation"
+    artifact_path = trust_variation_artifacts()
     approval_teal = (artifact_path / "TrustVariation.approval.teal").read_text()
     clear_teal = (artifact_path / "TrustVariation.clear.teal").read_text()
 
-    approval_bytes = base64.b64decode(algorand.client.algod.compile(approval_teal)["result"])
-    clear_bytes = base64.b64decode(algorand.client.algod.compile(clear_teal)["result"])
+    approval_bytes = _compile(algorand, approval_teal)
+    clear_bytes = _compile(algorand, clear_teal)
+
+    upload_trust_variation_program(algorand, app_client, deployer.address, approval_bytes, clear_bytes)
+
+
+def trust_variation_artifacts() -> Path:
+    """Directory of the committed TrustVariation artifacts that deploy uploads.
+
+    Deploy does not build. A contract.py edited after the last build makes the
+    TEAL stale, so that is logged. It is a warning rather than an error because
+    a fresh checkout sets both mtimes to checkout time in no particular order.
+    """
+    smart_contracts_dir = Path(__file__).parent.parent
+    artifact_path = smart_contracts_dir / "artifacts" / "trust_variation"
+    contract_path = smart_contracts_dir / "trust_variation" / "contract.py"
+    approval_path = artifact_path / "TrustVariation.approval.teal"
+    if contract_path.stat().st_mtime > approval_path.stat().st_mtime:
+        logger.warning(
+            f"{approval_path.name} is older than {contract_path}; "
+            "run `algokit project run build` first if the contract has changed"
+        )
+    return artifact_path
+
+
+def _compile(algorand: algokit_utils.AlgorandClient, teal: str) -> bytes:
+    result = typing.cast(dict[str, str], algorand.client.algod.compile(teal))
+    return base64.b64decode(result["result"])
+
 
-    # MBR for tv_approval box (~8 KB) + tv_clear box (~141 bytes) ≈ 3.35 ALGO
-    # Only needed on first upload; subsequent calls replace existing box values (no extra MBR).
-    mbr_amount = 3_350_000  # microAlgos — conservative upper bound
+def trust_variation_program_hash(approval: bytes, clear: bytes) -> bytes:
+    """Off-chain mirror of TrustExperiments._program_hash."""
+    digests = len(approval).to_bytes(8, "big") + len(clear).to_bytes(8, "big")
+    for program in (approval, clear):
+        for start in range(0, len(program), PROGRAM_HASH_CHUNK):
+            digests += typing.cast(bytes, encoding.checksum(program[start : start + PROGRAM_HASH_CHUNK]))
+    return typing.cast(bytes, encoding.checksum(digests))
 
+
+def upload_trust_variation_program(
+    algorand: algokit_utils.AlgorandClient,
+    app_client: "TrustExperimentsClient",
+    sender: str,
+    approval: bytes,
+    clear: bytes,
+) -> None:
+    """Chunked, resumable upload of the TrustVariation program.
+
+    Skips everything if the finalized program already matches. Otherwise chunks
+    whose bytes are already in the boxes (from an interrupted upload or an
+    unchanged region of a previous version) are not re-sent, and the remaining
+    chunks go out in parallel groups before finalize checks the hash.
+    """
+    expected_hash = trust_variation_program_hash(approval, clear)
+    state = algorand.app.get_global_state(app_client.app_id)
+    if (
+        "tv_ready" in state
+        and state["tv_ready"].value == 1
+        and state["tv_hash"].value_raw == expected_hash
+    ):
+        logger.info(f"TrustVariation program v{state['tv_version'].value} already uploaded")
+        return
+
+    existing: dict[int, bytes] = {}
+    box_names = {box.name_raw for box in algorand.app.get_box_names(app_client.app_id)}
+    for kind, name in ((PROGRAM_APPROVAL, b"tv_approval"), (PROGRAM_CLEAR, b"tv_clear")):
+        if name in box_names:
+            existing[kind] = algorand.app.get_box_value(app_client.app_id, name)
+
+    # Box growth MBR, mirroring begin_trust_variation_upload
+    mbr_amount = 0
+    for kind, name, program in ((PROGRAM_APPROVAL, b"tv_approval", approval), (PROGRAM_CLEAR, b"tv_clear", clear)):
+        if kind in existing:
+            mbr_amount += 400 * max(0, len(program) - len(existing[kind]))
+        else:
+            mbr_amount += 2_500 + 400 * (len(name) + len(program))
     mbr_payment = algorand.create_transaction.payment(
         algokit_utils.PaymentParams(
-            sender=deployer.address,
+            sender=sender,
             receiver=app_client.app_address,
             amount=algokit_utils.AlgoAmount.from_micro_algo(mbr_amount),
         )
     )
+    app_client.send.begin_trust_variation_upload(args=(len(approval), len(clear), mbr_payment))
+
+    # Resizing keeps the old bytes, so any chunk that already matches is done
+    writes: list[tuple[int, int, bytes]] = []
+    for kind, program in ((PROGRAM_APPROVAL, approval), (PROGRAM_CLEAR, clear)):
+        old = existing.get(kind, b"")
+        for offset in range(0, len(program), _UPLOAD_CHUNK_BYTES):
+            chunk = program[offset : offset + _UPLOAD_CHUNK_BYTES]
+            if old[offset : offset + len(chunk)] != chunk:
+                writes.append((kind, offset, chunk))
+    logger.info(f"Uploading {len(writes)} TrustVariation program chunks")
+
+    box_refs = {
+        PROGRAM_APPROVAL: [b"tv_approval"] * min(8, -(-len(approval) // _BOX_QUOTA_BYTES)),
+        PROGRAM_CLEAR: [b"tv_clear"] * min(8, -(-len(clear) // _BOX_QUOTA_BYTES)),
+    }
 
-    app_client.send.set_trust_variation_program(
-        args=(approval_bytes, clear_bytes, mbr_payment),
+    def send_group(batch: list[tuple[int, int, bytes]]) -> None:
+        group = app_client.new_group()
+        for kind, offset, chunk in batch:
+            group.write_trust_variation_chunk(
+                args=(kind, offset, chunk),
+                params=algokit_utils.CommonAppCallParams(box_references=[*box_refs[kind]]),
+            )
+        group.send()
+
+    batches = [writes[i : i + _UPLOAD_GROUP_SIZE] for i in range(0, len(writes), _UPLOAD_GROUP_SIZE)]
+    with ThreadPoolExecutor(max_workers=_UPLOAD_PARALLEL_GROUPS) as pool:
+        list(pool.map(send_group, batches))
+
+    # finalize reads both boxes, which can need more box refs than one
+    # transaction carries: rewrite the first clear chunk in the same group to
+    # add the clear box's quota, then finalize (hashing is paid for with op-ups).
+    opups = (len(approval) + len(clear)) // 8 // 700 + 2
+    (
+        app_client.new_group()
+        .write_trust_variation_chunk(
+            args=(PROGRAM_CLEAR, 0, clear[:_UPLOAD_CHUNK_BYTES]),
+            params=algokit_utils.CommonAppCallParams(box_references=[*box_refs[PROGRAM_CLEAR]]),
+        )
+        .finalize_trust_variation_program(
+            args=(expected_hash,),
+            params=algokit_utils.CommonAppCallParams(
+                box_references=[*box_refs[PROGRAM_APPROVAL]],
+                extra_fee=algokit_utils.AlgoAmount.from_micro_algo(1_000 * opups),
+            ),
+        )
+        .send()
     )
-    logger.info("Uploaded TrustVariation bytecode to TrustExperiments box storage")
\ No newline at end of file
+    logger.info("Uploaded TrustVariation bytecode to TrustExperiments box storage")
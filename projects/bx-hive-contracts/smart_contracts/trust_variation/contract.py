@@ -3,36 +3,98 @@ from algopy import (
     Application,
     ARC4Contract,
     Asset,
+    BigUInt,
+    Box,
     BoxMap,
     Bytes,
     Global,
     GlobalState,
+    OnCompleteAction,
+    OpUpFeeSource,
     Txn,
     UInt64,
     arc4,
+    ensure_budget,
     gtxn,
     itxn,
+    op,
+    subroutine,
     urange,
 )
 
+from smart_contracts.shared.events import (
+    BoxesSwept,
+    EscrowDeposited,
+    EscrowWithdrawn,
+    InvestorDecided,
+    MatchCreated,
+    MatchesCreated,
+    MatchPaidOut,
+    ParticipantEnrolled,
+    ParticipantsEnrolled,
+    PayoutClaimed,
+    TrusteeDecided,
+    VariationEnded,
+)
+from smart_contracts.shared.membership import member_root_from_proof, member_root_registered, member_roots_key
 from smart_contracts.shared.types import (
     PHASE_COMPLETED,
     PHASE_INVESTOR_DECISION,
     PHASE_TRUSTEE_DECISION,
+    SETTLEMENT_CLAIM,
+    SETTLEMENT_IMMEDIATE,
     STATUS_ACTIVE,
     STATUS_CLOSED,
     STATUS_COMPLETED,
     Match,
     ParticipantInfo,
+    PlayerState,
+    User,
     VariationConfig,
+    VariationStats,
 )
 
 # Box MBR constants (2,500 + 400 * (key_len + value_len))
-# Participant box: prefix "p_"(2) + Address(32) + ParticipantInfo(2) = 16,900
-PARTICIPANT_MBR = 16_900
+# Participant box: prefix "p_"(2) + Address(32) + ParticipantInfo(6) = 18,500
+PARTICIPANT_MBR = 18_500
+# Enrollment order box: prefix "o_"(2) + UInt32(4) + Address(32) = 17,700
+# (charged per participant on top of PARTICIPANT_MBR once auto-matching is enabled)
+ORDER_BOX_MBR = 17_700
 # Match box: prefix "m_"(2) + UInt32(4) + Match(118) = 52,100
-# Player match box x2: prefix "pm_"(3) + Address(32) + UInt32(4) = 18,100 each
-MATCH_MBR = 88_300  # 52,100 + 2 * 18,100
+# (a player's match_id lives in their participant box, so no extra lookup boxes)
+MATCH_MBR = 52_100
+# Claim box: prefix "c_"(2) + Address(32) + UInt64(8) = 19,300
+# (charged per player on top of MATCH_MBR in SETTLEMENT_CLAIM mode, and refunded
+# to the owner once claimed, or at end_variation for matches that never completed)
+CLAIM_MBR = 19_300
+# Roster bitmap box: key "roster"(6) + 1 byte per 4 registry user_ids (2 flag bits each)
+ROSTER_BOX_MBR = 4_900  # 2,500 + 400 * 6, charged once when the box is created
+ROSTER_BYTE_MBR = 400  # per bitmap byte, i.e. 100 per user_id slot
+# get_roster_flags bits
+ROSTER_ENROLLED = 1
+ROSTER_ASSIGNED = 2
+
+# sweep_boxes kinds
+SWEEP_PARTICIPANTS = 0  # p_ boxes, keyed by address
+SWEEP_MATCHES = 1  # m_ boxes, keyed by match_id
+SWEEP_ENROLLMENT_ORDER = 2  # o_ boxes, keyed by enrollment position
+
+# get_matches page size: the ABI return log is capped at 1,024 bytes
+# (4-byte return prefix + 2-byte array length + 8 * Match(118) = 950)
+MATCHES_PAGE_SIZE = 8
+# An app call may write at most 32 logs totalling 1,024 bytes. add_participants,
+# create_matches and auto_match emit one aggregate event (12 bytes) however
+# many items they write, but settle emits a 24-byte MatchPaidOut per match:
+# 32 of them fill the log count (768 bytes)
+MAX_SETTLE_PER_CALL = 32
+
+# Opcode budget for checking a registry member proof (20 sha256 at 35 each, plus the loop)
+_MEMBER_PROOF_BUDGET = 1_200
+
+
+@subroutine
+def _add_square(acc: arc4.UInt128, x: UInt64) -> arc4.UInt128:
+    return arc4.UInt128(acc.as_biguint() + BigUInt(x) * BigUInt(x))
 
 
 class TrustVariation(ARC4Contract):
@@ -54,9 +116,30 @@ class TrustVariation(ARC4Contract):
         self.registry_app = GlobalState(UInt64(0))
         self.participant_count = GlobalState(UInt64(0))
         self.max_participants = GlobalState(UInt64(0))
+        self.match_cursor = GlobalState(UInt64(0))
+        self.settlement_mode = GlobalState(UInt64(0))
+        # Payouts recorded by trustee decisions but not yet sent (deferred settlement)
+        self.escrow_pending = GlobalState(UInt64(0))
+        # Running sums for O(1) analytics (one 112-byte global bytes slot)
+        self.stats = GlobalState(VariationStats)
+        # Users enrolled through the roster bitmap (not counted in participant_count)
+        self.roster_count = GlobalState(UInt64(0))
+        # 1 when payouts are drawn on demand from the experiment treasury
+        self.treasury_funded = GlobalState(UInt64(0))
+        # 1 when enrollments record their position for auto_match
+        self.auto_match_enabled = GlobalState(UInt64(0))
+        # Prepaid claim box MBR no longer needed (box claimed, or match never
+        # completed), owed back to the owner by end_variation / sweep_boxes
+        self.claim_mbr_refund = GlobalState(UInt64(0))
         self.participants = BoxMap(arc4.Address, ParticipantInfo, key_prefix=b"p_")
         self.matches = BoxMap(arc4.UInt32, Match, key_prefix=b"m_")
-        self.player_match = BoxMap(arc4.Address, arc4.UInt32, key_prefix=b"pm_")
+        # Enrollment position → participant address, walked by auto_match (only
+        # written while auto_match_enabled)
+        self.enrollment_order = BoxMap(arc4.UInt32, arc4.Address, key_prefix=b"o_")
+        # Claim ledger: payouts owed to each player in SETTLEMENT_CLAIM mode
+        self.claimable = BoxMap(Account, arc4.UInt64, key_prefix=b"c_")
+        # Enrolled/assigned flags for roster participants, indexed by registry user_id
+        self.roster = Box(Bytes, key=b"roster")
 
     # -------------------------------------------------------------------------
     # Setup
@@ -95,6 +178,24 @@ class TrustVariation(ARC4Contract):
         self.registry_app.value = registry_app.as_uint64()
         self.participant_count.value = UInt64(0)
         self.max_participants.value = max_participants.as_uint64()
+        self.match_cursor.value = UInt64(0)
+        self.settlement_mode.value = UInt64(SETTLEMENT_IMMEDIATE)
+        self.escrow_pending.value = UInt64(0)
+        self.roster_count.value = UInt64(0)
+        self.treasury_funded.value = UInt64(0)
+        self.auto_match_enabled.value = UInt64(0)
+        self.stats.value = VariationStats(
+            invested_count=arc4.UInt64(0),
+            completed_count=arc4.UInt64(0),
+            sum_investment=arc4.UInt64(0),
+            sumsq_investment=arc4.UInt128(0),
+            sum_return=arc4.UInt64(0),
+            sumsq_return=arc4.UInt128(0),
+            sum_investor_payout=arc4.UInt64(0),
+            sumsq_investor_payout=arc4.UInt128(0),
+            sum_trustee_payout=arc4.UInt64(0),
+            sumsq_trustee_payout=arc4.UInt128(0),
+        )
 
         if asset_id.as_uint64() > UInt64(0):
             itxn.AssetTransfer(
@@ -110,81 +211,466 @@ class TrustVariation(ARC4Contract):
         assert payment.receiver == Global.current_application_address, "Wrong receiver"
         assert payment.amount > UInt64(0), "Amount must be > 0"
         self.escrow_deposited.value += payment.amount
+        arc4.emit(
+            EscrowDeposited(
+                amount=arc4.UInt64(payment.amount), deposited=arc4.UInt64(self.escrow_deposited.value)
+            )
+        )
 
     @arc4.abimethod
     def record_escrow(self, amount: arc4.UInt64) -> None:
         assert Txn.sender == Application(self.experiments_app.value).address, "Not experiments app"
         assert amount.as_uint64() > UInt64(0), "Amount must be > 0"
         self.escrow_deposited.value += amount.as_uint64()
+        arc4.emit(EscrowDeposited(amount=amount, deposited=arc4.UInt64(self.escrow_deposited.value)))
+
+    @arc4.abimethod
+    def enable_treasury_funding(self) -> None:
+        """Called by TrustExperiments right after create for treasury-funded
+        variations: instead of holding a prefunded escrow, the variation draws
+        each payout shortfall from the experiment treasury when it is needed.
+        """
+        assert Txn.sender == Application(self.experiments_app.value).address, "Not experiments app"
+        self.treasury_funded.value = UInt64(1)
+
+    @subroutine
+    def _reserve_escrow(self, amount: UInt64) -> None:
+        """Make sure amount is available, drawing the shortfall from the
+        experiment treasury for treasury-funded variations.
+        """
+        if self.treasury_funded.value == UInt64(0):
+            return
+        available = self._available_escrow()
+        if available >= amount:
+            return
+        shortfall = amount - available
+        # Selector: draw_escrow(uint32,uint32,uint64)void
+        itxn.ApplicationCall(
+            app_id=Application(self.experiments_app.value),
+            app_args=(
+                Bytes(b"\x94\x42\x2e\xf3"),
+                arc4.UInt32(self.exp_id.value).bytes,
+                arc4.UInt32(self.var_id.value).bytes,
+                arc4.UInt64(shortfall).bytes,
+            ),
+            fee=0,
+        ).submit()
+        self.escrow_deposited.value += shortfall
+        arc4.emit(
+            EscrowDeposited(amount=arc4.UInt64(shortfall), deposited=arc4.UInt64(self.escrow_deposited.value))
+        )
 
     @arc4.abimethod
     def end_variation(self) -> None:
         assert Txn.sender == self.owner.value, "Not owner"
         assert self.status.value != UInt64(STATUS_COMPLETED), "Already ended"
 
-        remaining = self.escrow_deposited.value - self.escrow_paid_out.value
+        # Escrow owed to unsettled matches stays behind for settle()
+        remaining = self._available_escrow()
         if remaining > UInt64(0):
-            if self.asset_id.value == UInt64(0):
-                itxn.Payment(
-                    receiver=self.owner.value,
-                    amount=remaining,
-                    fee=0,
-                ).submit()
-            else:
-                itxn.AssetTransfer(
-                    xfer_asset=Asset(self.asset_id.value),
-                    asset_receiver=self.owner.value,
-                    asset_amount=remaining,
-                    fee=0,
-                ).submit()
+            self._send_payout(self.owner.value, remaining)
             self.escrow_deposited.value -= remaining
 
+        # No more trustee decisions, so incomplete matches never use their claim boxes
+        if self.settlement_mode.value == UInt64(SETTLEMENT_CLAIM):
+            incomplete = self.match_count.value - self.stats.value.completed_count.as_uint64()
+            self.claim_mbr_refund.value += incomplete * UInt64(2 * CLAIM_MBR)
+        self._refund_mbr(self._take_claim_mbr_refund())
+
         self.status.value = UInt64(STATUS_COMPLETED)
+        arc4.emit(VariationEnded(refunded=arc4.UInt64(remaining), retained=arc4.UInt64(self.escrow_pending.value)))
+
+    @arc4.abimethod
+    def sweep_boxes(self, kind: arc4.UInt8, keys: arc4.DynamicArray[arc4.DynamicBytes]) -> arc4.UInt64:
+        """Delete boxes of one SWEEP_* kind from an ended variation and refund
+        their MBR to the owner in one payment; returns the amount. keys are the
+        box keys without prefix (32-byte address or 4-byte uint32). Missing keys
+        and matches with an unsettled deferred payout are skipped, so sweeps can
+        be retried. Swept data is gone from get_match/get_matches; the events
+        remain the record. The payment also returns the MBR of claim boxes
+        claimed since the last refund, so a call with no keys collects just that.
+        """
+        assert Txn.sender == self.owner.value, "Not owner"
+        assert self.status.value == UInt64(STATUS_COMPLETED), "Not completed"
+        assert kind.as_uint64() <= UInt64(SWEEP_ENROLLMENT_ORDER), "Unknown box kind"
+
+        box_mbr = UInt64(PARTICIPANT_MBR)
+        if kind.as_uint64() == UInt64(SWEEP_MATCHES):
+            box_mbr = UInt64(MATCH_MBR)
+        elif kind.as_uint64() == UInt64(SWEEP_ENROLLMENT_ORDER):
+            box_mbr = UInt64(ORDER_BOX_MBR)
+
+        swept = UInt64(0)
+        for i in urange(keys.length):
+            key = keys[i].native
+            if kind.as_uint64() == UInt64(SWEEP_PARTICIPANTS):
+                assert key.length == UInt64(32), "Bad key"
+                addr = arc4.Address(key)
+                if addr in self.participants:
+                    del self.participants[addr]
+                    swept += UInt64(1)
+            elif kind.as_uint64() == UInt64(SWEEP_MATCHES):
+                assert key.length == UInt64(4), "Bad key"
+                match_id = arc4.UInt32.from_bytes(key)
+                if match_id in self.matches:
+                    match = self.matches[match_id].copy()
+                    if match.phase != arc4.UInt8(PHASE_COMPLETED) or match.paid_out == arc4.UInt8(1):
+                        del self.matches[match_id]
+                        swept += UInt64(1)
+            else:
+                assert key.length == UInt64(4), "Bad key"
+                position = arc4.UInt32.from_bytes(key)
+                if position in self.enrollment_order:
+                    del self.enrollment_order[position]
+                    swept += UInt64(1)
+
+        refunded = swept * box_mbr + self._take_claim_mbr_refund()
+        self._refund_mbr(refunded)
+        arc4.emit(BoxesSwept(kind=kind, count=arc4.UInt64(swept), refunded=arc4.UInt64(refunded)))
+        return arc4.UInt64(refunded)
+
+    @subroutine
+    def _take_claim_mbr_refund(self) -> UInt64:
+        amount = self.claim_mbr_refund.value
+        self.claim_mbr_refund.value = UInt64(0)
+        return amount
+
+    @subroutine
+    def _refund_mbr(self, amount: UInt64) -> None:
+        """Return freed box MBR (always ALGO) to the owner."""
+        if amount > UInt64(0):
+            itxn.Payment(
+                receiver=self.owner.value,
+                amount=amount,
+                fee=0,
+            ).submit()
+
+    @arc4.abimethod
+    def set_settlement_mode(self, mode: arc4.UInt8) -> None:
+        """SETTLEMENT_IMMEDIATE pays both players inside submit_trustee_decision.
+        SETTLEMENT_DEFERRED only records the payouts; the owner pushes them later
+        in bulk with settle(). SETTLEMENT_CLAIM credits them to the claim ledger
+        and each player pulls their balance with claim().
+
+        The mode is fixed once the first match exists, because match MBR
+        depends on it (claim boxes are prepaid at match creation).
+        """
+        assert Txn.sender == self.owner.value, "Not owner"
+        assert self.status.value != UInt64(STATUS_COMPLETED), "Already ended"
+        assert self.match_count.value == UInt64(0), "Matches already created"
+        assert mode.as_uint64() <= UInt64(SETTLEMENT_CLAIM), "Unknown settlement mode"
+        self.settlement_mode.value = mode.as_uint64()
+
+    @arc4.abimethod
+    def enable_auto_match(self) -> None:
+        """Record every later enrollment's position in an o_ box so auto_match can
+        pair in enrollment order. Must precede the first enrollment, since earlier
+        participants would have no position; each enrollment then costs
+        PARTICIPANT_MBR + ORDER_BOX_MBR.
+        """
+        assert Txn.sender == self.owner.value, "Not owner"
+        assert self.status.value == UInt64(STATUS_ACTIVE), "Not active"
+        assert self.participant_count.value == UInt64(0), "Participants already enrolled"
+        self.auto_match_enabled.value = UInt64(1)
+
+    @subroutine
+    def _participant_mbr(self) -> UInt64:
+        if self.auto_match_enabled.value == UInt64(1):
+            return UInt64(PARTICIPANT_MBR + ORDER_BOX_MBR)
+        return UInt64(PARTICIPANT_MBR)
 
     @arc4.abimethod
     def add_participants(self, addresses: arc4.DynamicArray[arc4.Address], mbr_payment: gtxn.PaymentTransaction) -> None:
         assert Txn.sender == self.owner.value, "Not owner"
         assert self.status.value == UInt64(STATUS_ACTIVE), "Not active"
         assert mbr_payment.receiver == Global.current_application_address, "Wrong MBR receiver"
-        assert mbr_payment.amount >= UInt64(PARTICIPANT_MBR) * addresses.length, "Insufficient MBR"
+        assert mbr_payment.amount >= self._participant_mbr() * addresses.length, "Insufficient MBR"
+        first_position = arc4.UInt32(self.participant_count.value)
         for i in urange(addresses.length):
             addr = addresses[i].copy()
             assert addr not in self.participants, "Already enrolled"
-            self.participants[addr] = ParticipantInfo(
-                enrolled=arc4.UInt8(1),
-                assigned=arc4.UInt8(0),
-            )
-            self.participant_count.value += UInt64(1)
+            self._store_participant(addr)
+        arc4.emit(ParticipantsEnrolled(first_position=first_position, count=arc4.UInt32(addresses.length)))
 
     @arc4.abimethod
     def self_enroll(self, mbr_payment: gtxn.PaymentTransaction) -> None:
-        assert self.status.value == UInt64(STATUS_ACTIVE), "Not active"
         addr = arc4.Address(Txn.sender)
+        self._check_self_enroll(addr, mbr_payment)
+        # Verify sender is registered in BxHiveRegistry
+        user_id = self._registry_user_id(addr)
+        assert self._roster_flags(user_id.as_uint64()) == UInt64(0), "Already on roster"
+        self._enroll(addr)
+
+    @arc4.abimethod
+    def self_enroll_grouped(
+        self,
+        registry_call: gtxn.ApplicationCallTransaction,
+        mbr_payment: gtxn.PaymentTransaction,
+    ) -> None:
+        """self_enroll without the inner call: the sender puts their own
+        BxHiveRegistry.get_user(sender) call in the group instead. get_user fails
+        for unregistered accounts and groups are atomic, so its presence proves
+        registration at the minimum fee; its return log carries the user_id that
+        is checked against the roster.
+        """
+        addr = arc4.Address(Txn.sender)
+        self._check_self_enroll(addr, mbr_payment)
+        assert registry_call.app_id == Application(self.registry_app.value), "Not a registry call"
+        assert registry_call.sender == Txn.sender, "Registry call from another sender"
+        assert registry_call.on_completion == OnCompleteAction.NoOp, "Registry call not NoOp"
+        assert registry_call.app_args(0) == Bytes(b"\x6f\xad\x4a\x65"), "Not a get_user call"  # get_user(address)
+        assert registry_call.app_args(1) == addr.bytes, "Registry call for another address"
+        user_id = User.from_log(registry_call.last_log).user_id
+        assert self._roster_flags(user_id.as_uint64()) == UInt64(0), "Already on roster"
+        self._enroll(addr)
+
+    @arc4.abimethod
+    def self_enroll_with_proof(
+        self,
+        user_id: arc4.UInt32,
+        proof: Bytes,
+        mbr_payment: gtxn.PaymentTransaction,
+    ) -> None:
+        """self_enroll without any registry call: proof is the sender's path in
+        the registry member tree (registry/membership.py member_proof), checked
+        against the registry's member root globals read directly. The hashes need
+        about 1,200 opcodes; pool them with another app call in the group or pay
+        one extra minimum fee for the op-up.
+        """
+        addr = arc4.Address(Txn.sender)
+        self._check_self_enroll(addr, mbr_payment)
+        registry = Application(self.registry_app.value)
+        _roots, exists = op.AppGlobal.get_ex_bytes(registry, member_roots_key(UInt64(0)))
+        assert exists, "Registry has no member roots"
+        ensure_budget(UInt64(_MEMBER_PROOF_BUDGET), OpUpFeeSource.GroupCredit)
+        root = member_root_from_proof(op.sha256(addr.bytes), user_id.as_uint64(), proof)
+        assert member_root_registered(registry, root), "Invalid membership proof"
+        assert self._roster_flags(user_id.as_uint64()) == UInt64(0), "Already on roster"
+        self._enroll(addr)
+
+    @subroutine
+    def _check_self_enroll(self, addr: arc4.Address, mbr_payment: gtxn.PaymentTransaction) -> None:
+        assert self.status.value == UInt64(STATUS_ACTIVE), "Not active"
         assert addr not in self.participants, "Already enrolled"
-        if self.max_participants.value > UInt64(0):
-            assert self.participant_count.value < self.max_participants.value, "Full"
+        self._check_capacity(UInt64(1))
         assert mbr_payment.receiver == Global.current_application_address, "Wrong receiver"
-        assert mbr_payment.amount >= UInt64(16_900), "Insufficient MBR"
-        # Verify sender is registered in BxHiveRegistry
-        itxn.ApplicationCall(
+        assert mbr_payment.amount >= self._participant_mbr(), "Insufficient MBR"
+
+    @subroutine
+    def _check_capacity(self, added: UInt64) -> None:
+        """max_participants covers p_ and roster enrollments together."""
+        if self.max_participants.value > UInt64(0):
+            enrolled = self.participant_count.value + self.roster_count.value
+            assert enrolled + added <= self.max_participants.value, "Full"
+
+    @subroutine
+    def _registry_user_id(self, addr: arc4.Address) -> arc4.UInt32:
+        """Look addr up in BxHiveRegistry; the inner call fails if it is not registered."""
+        result = itxn.ApplicationCall(
             app_id=Application(self.registry_app.value),
             app_args=(
                 Bytes(b"\x6f\xad\x4a\x65"),  # get_user(address) selector
-                arc4.Address(Txn.sender).bytes,
+                addr.bytes,
             ),
             fee=0,
         ).submit()
+        return User.from_log(result.last_log).user_id
+
+    @subroutine
+    def _enroll(self, addr: arc4.Address) -> None:
+        position = self._store_participant(addr)
+        arc4.emit(ParticipantEnrolled(addr=addr.copy(), position=position))
+
+    @subroutine
+    def _store_participant(self, addr: arc4.Address) -> arc4.UInt32:
+        """Write addr's p_ box (and o_ box when auto-matching); returns its position."""
         self.participants[addr] = ParticipantInfo(
             enrolled=arc4.UInt8(1),
             assigned=arc4.UInt8(0),
+            match_id=arc4.UInt32(0),
         )
+        position = arc4.UInt32(self.participant_count.value)
+        if self.auto_match_enabled.value == UInt64(1):
+            self.enrollment_order[position] = addr.copy()
         self.participant_count.value += UInt64(1)
+        return position
+
+    @arc4.abimethod
+    def enroll_user_ids(
+        self,
+        user_ids: arc4.DynamicArray[arc4.UInt32],
+        mbr_payment: gtxn.PaymentTransaction,
+    ) -> None:
+        """Enroll registry users into the roster bitmap instead of p_ boxes. The
+        bitmap grows to cover the highest user_id; the MBR payment must cover the
+        added bytes (plus ROSTER_BOX_MBR the first time). No per-user event is
+        emitted, so large batches stay within the log limits. Roster users count
+        towards max_participants; ones that also hold a p_ box are rejected by
+        create_match_by_ids, and self-enrollment rejects roster user_ids.
+        """
+        assert Txn.sender == self.owner.value, "Not owner"
+        assert self.status.value == UInt64(STATUS_ACTIVE), "Not active"
+        assert user_ids.length > UInt64(0), "No user ids"
+        self._check_capacity(user_ids.length)
+        assert mbr_payment.receiver == Global.current_application_address, "Wrong MBR receiver"
+
+        size = UInt64(0)
+        for i in urange(user_ids.length):
+            needed = user_ids[i].as_uint64() // UInt64(4) + UInt64(1)
+            if needed > size:
+                size = needed
+
+        cost = UInt64(0)
+        if not self.roster:
+            cost = UInt64(ROSTER_BOX_MBR) + UInt64(ROSTER_BYTE_MBR) * size
+            self.roster.create(size=size)
+        elif size > self.roster.length:
+            cost = UInt64(ROSTER_BYTE_MBR) * (size - self.roster.length)
+            self.roster.resize(size)
+        assert mbr_payment.amount >= cost, "Insufficient MBR"
+
+        for i in urange(user_ids.length):
+            user_id = user_ids[i].as_uint64()
+            assert self._roster_flags(user_id) == UInt64(0), "Already enrolled"
+            self._set_roster_flag(user_id, UInt64(0))
+        self.roster_count.value += user_ids.length
+
+    @subroutine
+    def _roster_flags(self, user_id: UInt64) -> UInt64:
+        if not self.roster or user_id // UInt64(4) >= self.roster.length:
+            return UInt64(0)
+        byte = self.roster.extract(user_id // UInt64(4), UInt64(1))
+        bit = (user_id % UInt64(4)) * UInt64(2)
+        return op.getbit(byte, bit) | (op.getbit(byte, bit + UInt64(1)) << UInt64(1))
+
+    @subroutine
+    def _set_roster_flag(self, user_id: UInt64, flag_bit: UInt64) -> None:
+        index = user_id // UInt64(4)
+        bit = (user_id % UInt64(4)) * UInt64(2) + flag_bit
+        byte = op.setbit_bytes(self.roster.extract(index, UInt64(1)), bit, True)  # noqa: FBT003
+        self.roster.replace(index, byte)
 
     @arc4.abimethod
     def create_match(self, investor: arc4.Address, trustee: arc4.Address, mbr_payment: gtxn.PaymentTransaction) -> arc4.UInt32:
         assert Txn.sender == self.owner.value, "Not owner"
         assert mbr_payment.receiver == Global.current_application_address, "Wrong MBR receiver"
-        assert mbr_payment.amount >= UInt64(MATCH_MBR), "Insufficient MBR"
+        assert mbr_payment.amount >= self._match_mbr(), "Insufficient MBR"
+        match_id = self._create_match(investor, trustee)
+        arc4.emit(MatchCreated(match_id=match_id, investor=investor.copy(), trustee=trustee.copy()))
+        return match_id
+
+    @arc4.abimethod
+    def create_matches(
+        self,
+        pairs: arc4.DynamicArray[arc4.Tuple[arc4.Address, arc4.Address]],
+        mbr_payment: gtxn.PaymentTransaction,
+    ) -> arc4.UInt32:
+        """Pair several (investor, trustee) tuples in one call, funded by a single
+        aggregate MBR payment. Match IDs are assigned sequentially; returns the
+        first one. Emits a single MatchesCreated for the whole batch.
+        """
+        assert Txn.sender == self.owner.value, "Not owner"
+        assert pairs.length > UInt64(0), "No pairs"
+        assert mbr_payment.receiver == Global.current_application_address, "Wrong MBR receiver"
+        assert mbr_payment.amount >= self._match_mbr() * pairs.length, "Insufficient MBR"
+
+        first_match_id = arc4.UInt32(self.match_count.value)
+        for i in urange(pairs.length):
+            pair = pairs[i].copy()
+            self._create_match(pair[0], pair[1])
+        arc4.emit(MatchesCreated(first_match_id=first_match_id, count=arc4.UInt32(pairs.length)))
+        return first_match_id
+
+    @arc4.abimethod
+    def auto_match(self, n: arc4.UInt64, mbr_payment: gtxn.PaymentTransaction) -> arc4.UInt64:
+        """Pair up to n unassigned participants in enrollment order, starting at
+        match_cursor. Within a pair the earlier enrollee is the investor and the
+        later one the trustee; participants already paired via create_match are
+        skipped. An odd leftover stays unpaired and the cursor parks on it so the
+        next call picks it up. MBR is charged for n / 2 matches up front.
+        Requires enable_auto_match. Emits one MatchesCreated and returns the
+        number of matches created.
+        """
+        assert Txn.sender == self.owner.value, "Not owner"
+        assert self.auto_match_enabled.value == UInt64(1), "Auto-match not enabled"
+        count = n.as_uint64()
+        assert count > UInt64(0), "n must be > 0"
+        assert count % UInt64(2) == UInt64(0), "n must be even"
+        assert mbr_payment.receiver == Global.current_application_address, "Wrong MBR receiver"
+        assert mbr_payment.amount >= self._match_mbr() * (count // UInt64(2)), "Insufficient MBR"
+
+        first_match_id = arc4.UInt32(self.match_count.value)
+        created = UInt64(0)
+        cursor = self.match_cursor.value
+        pending = arc4.Address()
+        pending_pos = UInt64(0)
+        has_pending = False
+        while count > UInt64(0) and cursor < self.participant_count.value:
+            addr = self.enrollment_order[arc4.UInt32(cursor)].copy()
+            if self.participants[addr].assigned == arc4.UInt8(0):
+                if has_pending:
+                    self._create_match(pending, addr)
+                    created += UInt64(1)
+                    has_pending = False
+                else:
+                    pending = addr.copy()
+                    pending_pos = cursor
+                    has_pending = True
+                count -= UInt64(1)
+            cursor += UInt64(1)
+
+        if has_pending:
+            cursor = pending_pos
+        self.match_cursor.value = cursor
+        arc4.emit(MatchesCreated(first_match_id=first_match_id, count=arc4.UInt32(created)))
+        return arc4.UInt64(created)
+
+    @arc4.abimethod
+    def create_match_by_ids(
+        self,
+        investor_id: arc4.UInt32,
+        investor: arc4.Address,
+        trustee_id: arc4.UInt32,
+        trustee: arc4.Address,
+        mbr_payment: gtxn.PaymentTransaction,
+    ) -> arc4.UInt32:
+        """Pair two roster participants. Each address is checked against its
+        user_id in BxHiveRegistry, since the roster only stores flags. Roster
+        players have no p_ box: they find their match through the MatchCreated
+        event or get_matches rather than get_player_match.
+        """
+        assert Txn.sender == self.owner.value, "Not owner"
+        assert mbr_payment.receiver == Global.current_application_address, "Wrong MBR receiver"
+        assert mbr_payment.amount >= self._match_mbr(), "Insufficient MBR"
+        assert investor_id != trustee_id, "Same player"
+
+        investor_flags = self._roster_flags(investor_id.as_uint64())
+        assert investor_flags & UInt64(ROSTER_ENROLLED), "Investor not enrolled"
+        assert not investor_flags & UInt64(ROSTER_ASSIGNED), "Investor already assigned"
+
+        trustee_flags = self._roster_flags(trustee_id.as_uint64())
+        assert trustee_flags & UInt64(ROSTER_ENROLLED), "Trustee not enrolled"
+        assert not trustee_flags & UInt64(ROSTER_ASSIGNED), "Trustee already assigned"
+
+        assert investor not in self.participants, "Investor enrolled outside the roster"
+        assert trustee not in self.participants, "Trustee enrolled outside the roster"
+        assert self._registry_user_id(investor) == investor_id, "Investor id mismatch"
+        assert self._registry_user_id(trustee) == trustee_id, "Trustee id mismatch"
+
+        self._set_roster_flag(investor_id.as_uint64(), UInt64(1))
+        self._set_roster_flag(trustee_id.as_uint64(), UInt64(1))
+        match_id = self._new_match(investor, trustee)
+        arc4.emit(MatchCreated(match_id=match_id, investor=investor.copy(), trustee=trustee.copy()))
+        return match_id
+
+    @subroutine
+    def _match_mbr(self) -> UInt64:
+        if self.settlement_mode.value == UInt64(SETTLEMENT_CLAIM):
+            return UInt64(MATCH_MBR + 2 * CLAIM_MBR)
+        return UInt64(MATCH_MBR)
+
+    @subroutine
+    def _create_match(self, investor: arc4.Address, trustee: arc4.Address) -> arc4.UInt32:
         assert investor in self.participants, "Investor not enrolled"
         assert trustee in self.participants, "Trustee not enrolled"
 
@@ -196,6 +682,17 @@ class TrustVariation(ARC4Contract):
         assert trustee_info.enrolled == arc4.UInt8(1), "Trustee not active"
         assert trustee_info.assigned == arc4.UInt8(0), "Trustee already assigned"
 
+        match_id = self._new_match(investor, trustee)
+        self.participants[investor] = ParticipantInfo(
+            enrolled=arc4.UInt8(1), assigned=arc4.UInt8(1), match_id=match_id
+        )
+        self.participants[trustee] = ParticipantInfo(
+            enrolled=arc4.UInt8(1), assigned=arc4.UInt8(1), match_id=match_id
+        )
+        return match_id
+
+    @subroutine
+    def _new_match(self, investor: arc4.Address, trustee: arc4.Address) -> arc4.UInt32:
         match_id = arc4.UInt32(self.match_count.value)
         self.match_count.value += UInt64(1)
 
@@ -212,12 +709,6 @@ class TrustVariation(ARC4Contract):
             completed_at=arc4.UInt64(0),
             paid_out=arc4.UInt8(0),
         )
-        self.player_match[investor] = match_id
-        self.player_match[trustee] = match_id
-
-        self.participants[investor] = ParticipantInfo(enrolled=arc4.UInt8(1), assigned=arc4.UInt8(1))
-        self.participants[trustee] = ParticipantInfo(enrolled=arc4.UInt8(1), assigned=arc4.UInt8(1))
-
         return match_id
 
     @arc4.abimethod
@@ -246,6 +737,13 @@ class TrustVariation(ARC4Contract):
         match.phase = arc4.UInt8(PHASE_TRUSTEE_DECISION)
         match.investment = investment
         self.matches[match_id] = match.copy()
+        arc4.emit(InvestorDecided(match_id=match_id, investment=investment))
+
+        stats = self.stats.value.copy()
+        stats.invested_count = arc4.UInt64(stats.invested_count.as_uint64() + UInt64(1))
+        stats.sum_investment = arc4.UInt64(stats.sum_investment.as_uint64() + inv_amount)
+        stats.sumsq_investment = _add_square(stats.sumsq_investment, inv_amount)
+        self.stats.value = stats.copy()
 
     @arc4.abimethod
     def submit_trustee_decision(self, match_id: arc4.UInt32, return_amount: arc4.UInt64) -> None:
@@ -267,68 +765,146 @@ class TrustVariation(ARC4Contract):
 
         investor_payout = self.e1.value - s + r
         trustee_payout = self.e2.value + max_return - r
+        self._reserve_escrow(investor_payout + trustee_payout)
 
-        if self.asset_id.value == UInt64(0):
-            itxn.Payment(
-                receiver=Account(match.investor.bytes),
-                amount=investor_payout,
-                fee=0,
-            ).submit()
-
-            itxn.Payment(
-                receiver=Account(match.trustee.bytes),
-                amount=trustee_payout,
-                fee=0,
-            ).submit()
+        if self.settlement_mode.value == UInt64(SETTLEMENT_IMMEDIATE):
+            self._pay_match(match_id, match.investor.copy(), match.trustee.copy(), investor_payout, trustee_payout)
+            match.paid_out = arc4.UInt8(1)
         else:
-            itxn.AssetTransfer(
-                xfer_asset=Asset(self.asset_id.value),
-                asset_receiver=Account(match.investor.bytes),
-                asset_amount=investor_payout,
-                fee=0,
-            ).submit()
-
-            itxn.AssetTransfer(
-                xfer_asset=Asset(self.asset_id.value),
-                asset_receiver=Account(match.trustee.bytes),
-                asset_amount=trustee_payout,
-                fee=0,
-            ).submit()
-
-        self.escrow_paid_out.value += investor_payout + trustee_payout
-        self.paid_out_count.value += UInt64(1)
+            assert self._available_escrow() >= investor_payout + trustee_payout, "Insufficient escrow"
+            self.escrow_pending.value += investor_payout + trustee_payout
+            if self.settlement_mode.value == UInt64(SETTLEMENT_CLAIM):
+                # Released to the claim ledger; funds leave on claim()
+                self._credit(match.investor.copy(), investor_payout)
+                self._credit(match.trustee.copy(), trustee_payout)
+                self.paid_out_count.value += UInt64(1)
+                match.paid_out = arc4.UInt8(1)
+            else:
+                # Record only; settle() sends the payouts later
+                match.paid_out = arc4.UInt8(0)
 
         match.phase = arc4.UInt8(PHASE_COMPLETED)
         match.return_amount = return_amount
         match.investor_payout = arc4.UInt64(investor_payout)
         match.trustee_payout = arc4.UInt64(trustee_payout)
         match.completed_at = arc4.UInt64(Global.latest_timestamp)
-        match.paid_out = arc4.UInt8(1)
         self.matches[match_id] = match.copy()
+        arc4.emit(
+            TrusteeDecided(
+                match_id=match_id,
+                return_amount=return_amount,
+                investor_payout=arc4.UInt64(investor_payout),
+                trustee_payout=arc4.UInt64(trustee_payout),
+            )
+        )
+
+        stats = self.stats.value.copy()
+        stats.completed_count = arc4.UInt64(stats.completed_count.as_uint64() + UInt64(1))
+        stats.sum_return = arc4.UInt64(stats.sum_return.as_uint64() + r)
+        stats.sumsq_return = _add_square(stats.sumsq_return, r)
+        stats.sum_investor_payout = arc4.UInt64(stats.sum_investor_payout.as_uint64() + investor_payout)
+        stats.sumsq_investor_payout = _add_square(stats.sumsq_investor_payout, investor_payout)
+        stats.sum_trustee_payout = arc4.UInt64(stats.sum_trustee_payout.as_uint64() + trustee_payout)
+        stats.sumsq_trustee_payout = _add_square(stats.sumsq_trustee_payout, trustee_payout)
+        self.stats.value = stats.copy()
 
     @arc4.abimethod
-    def withdraw_escrow(self) -> None:
+    def settle(self, match_ids: arc4.DynamicArray[arc4.UInt32]) -> None:
+        """Push the recorded payouts of completed, unpaid matches, at most
+        MAX_SETTLE_PER_CALL per call. Each match costs two inner transactions, so
+        one group (four settle calls pooling their budget) can settle up to 128.
+        """
         assert Txn.sender == self.owner.value, "Not owner"
-        assert self.paid_out_count.value == self.match_count.value, "Matches not all paid out"
+        assert match_ids.length <= UInt64(MAX_SETTLE_PER_CALL), "Too many matches"
+        for i in urange(match_ids.length):
+            match_id = match_ids[i]
+            assert match_id in self.matches, "Match not found"
+            match = self.matches[match_id].copy()
+            assert match.phase == arc4.UInt8(PHASE_COMPLETED), "Match not completed"
+            assert match.paid_out == arc4.UInt8(0), "Already paid out"
+
+            investor_payout = match.investor_payout.as_uint64()
+            trustee_payout = match.trustee_payout.as_uint64()
+            self._pay_match(match_id, match.investor.copy(), match.trustee.copy(), investor_payout, trustee_payout)
+            self.escrow_pending.value -= investor_payout + trustee_payout
+
+            match.paid_out = arc4.UInt8(1)
+            self.matches[match_id] = match.copy()
 
-        remaining = self.escrow_deposited.value - self.escrow_paid_out.value
-        assert remaining > UInt64(0), "No remaining escrow"
+    @arc4.abimethod
+    def claim(self) -> arc4.UInt64:
+        """Pay out everything the claim ledger owes the sender in one transfer."""
+        assert Txn.sender in self.claimable, "Nothing to claim"
+        amount = self.claimable[Txn.sender].as_uint64()
+        del self.claimable[Txn.sender]
+        self.claim_mbr_refund.value += UInt64(CLAIM_MBR)
+
+        self._send_payout(Txn.sender, amount)
+        self.escrow_paid_out.value += amount
+        self.escrow_pending.value -= amount
+        arc4.emit(PayoutClaimed(addr=arc4.Address(Txn.sender), amount=arc4.UInt64(amount)))
+        return arc4.UInt64(amount)
+
+    @subroutine
+    def _credit(self, addr: arc4.Address, amount: UInt64) -> None:
+        account = Account(addr.bytes)
+        if account in self.claimable:
+            self.claimable[account] = arc4.UInt64(self.claimable[account].as_uint64() + amount)
+        else:
+            self.claimable[account] = arc4.UInt64(amount)
+
+    @subroutine
+    def _pay_match(
+        self,
+        match_id: arc4.UInt32,
+        investor: arc4.Address,
+        trustee: arc4.Address,
+        investor_payout: UInt64,
+        trustee_payout: UInt64,
+    ) -> None:
+        self._send_payout(Account(investor.bytes), investor_payout)
+        self._send_payout(Account(trustee.bytes), trustee_payout)
+        self.escrow_paid_out.value += investor_payout + trustee_payout
+        self.paid_out_count.value += UInt64(1)
+        arc4.emit(
+            MatchPaidOut(
+                match_id=match_id,
+                investor_payout=arc4.UInt64(investor_payout),
+                trustee_payout=arc4.UInt64(trustee_payout),
+            )
+        )
 
+    @subroutine
+    def _send_payout(self, receiver: Account, amount: UInt64) -> None:
         if self.asset_id.value == UInt64(0):
             itxn.Payment(
-                receiver=self.owner.value,
-                amount=remaining,
+                receiver=receiver,
+                amount=amount,
                 fee=0,
             ).submit()
         else:
             itxn.AssetTransfer(
                 xfer_asset=Asset(self.asset_id.value),
-                asset_receiver=self.owner.value,
-                asset_amount=remaining,
+                asset_receiver=receiver,
+                asset_amount=amount,
                 fee=0,
             ).submit()
 
+    @subroutine
+    def _available_escrow(self) -> UInt64:
+        return self.escrow_deposited.value - self.escrow_paid_out.value - self.escrow_pending.value
+
+    @arc4.abimethod
+    def withdraw_escrow(self) -> None:
+        assert Txn.sender == self.owner.value, "Not owner"
+        assert self.paid_out_count.value == self.match_count.value, "Matches not all paid out"
+
+        remaining = self._available_escrow()
+        assert remaining > UInt64(0), "No remaining escrow"
+
+        self._send_payout(self.owner.value, remaining)
         self.escrow_deposited.value -= remaining
+        arc4.emit(EscrowWithdrawn(receiver=arc4.Address(self.owner.value), amount=arc4.UInt64(remaining)))
 
     # -------------------------------------------------------------------------
     # Queries
@@ -336,6 +912,44 @@ class TrustVariation(ARC4Contract):
 
     @arc4.abimethod(readonly=True)
     def get_config(self) -> VariationConfig:
+        return self._config()
+
+    @arc4.abimethod(readonly=True)
+    def get_player_state(self, addr: arc4.Address) -> PlayerState:
+        """Participant record, their match and the variation config in one call.
+        Unknown addresses get enrolled == 0; match is zeroed when has_match == 0,
+        which includes an assigned player whose m_ box sweep_boxes has deleted.
+        """
+        info = ParticipantInfo(enrolled=arc4.UInt8(0), assigned=arc4.UInt8(0), match_id=arc4.UInt32(0))
+        has_match = arc4.UInt8(0)
+        match = Match(
+            match_id=arc4.UInt32(0),
+            investor=arc4.Address(),
+            trustee=arc4.Address(),
+            phase=arc4.UInt8(0),
+            created_at=arc4.UInt64(0),
+            investment=arc4.UInt64(0),
+            return_amount=arc4.UInt64(0),
+            investor_payout=arc4.UInt64(0),
+            trustee_payout=arc4.UInt64(0),
+            completed_at=arc4.UInt64(0),
+            paid_out=arc4.UInt8(0),
+        )
+        if addr in self.participants:
+            info = self.participants[addr]
+            if info.assigned == arc4.UInt8(1) and info.match_id in self.matches:
+                has_match = arc4.UInt8(1)
+                match = self.matches[info.match_id].copy()
+
+        return PlayerState(
+            participant=info,
+            has_match=has_match,
+            match=match.copy(),
+            config=self._config(),
+        )
+
+    @subroutine
+    def _config(self) -> VariationConfig:
         return VariationConfig(
             e1=arc4.UInt64(self.e1.value),
             e2=arc4.UInt64(self.e2.value),
@@ -351,10 +965,50 @@ class TrustVariation(ARC4Contract):
         assert match_id in self.matches, "Match not found"
         return self.matches[match_id].copy()
 
+    @arc4.abimethod(readonly=True)
+    def get_matches(self, start: arc4.UInt32, count: arc4.UInt32) -> arc4.DynamicArray[Match]:
+        """Matches start .. start + count - 1, capped at MATCHES_PAGE_SIZE ids and
+        at match_count. Match ids whose m_ box was swept are skipped, so a short
+        page does not mean the end: continue from start + min(count,
+        MATCHES_PAGE_SIZE) while that is below match_count.
+        """
+        end = start.as_uint64() + count.as_uint64()
+        if count.as_uint64() > UInt64(MATCHES_PAGE_SIZE):
+            end = start.as_uint64() + UInt64(MATCHES_PAGE_SIZE)
+        if end > self.match_count.value:
+            end = self.match_count.value
+
+        page = arc4.DynamicArray[Match]()
+        for match_id in urange(start.as_uint64(), end):
+            if arc4.UInt32(match_id) in self.matches:
+                page.append(self.matches[arc4.UInt32(match_id)].copy())
+        return page
+
     @arc4.abimethod(readonly=True)
     def get_player_match(self, addr: arc4.Address) -> arc4.UInt32:
-        assert addr in self.player_match, "No active match"
-        return self.player_match[addr]
+        assert addr in self.participants, "No active match"
+        info = self.participants[addr].copy()
+        assert info.assigned == arc4.UInt8(1), "No active match"
+        return info.match_id
+
+    @arc4.abimethod(readonly=True)
+    def get_roster_flags(self, user_id: arc4.UInt32) -> arc4.UInt8:
+        """ROSTER_ENROLLED | ROSTER_ASSIGNED bits for a roster user_id."""
+        return arc4.UInt8(self._roster_flags(user_id.as_uint64()))
+
+    @arc4.abimethod(readonly=True)
+    def get_roster_count(self) -> arc4.UInt64:
+        return arc4.UInt64(self.roster_count.value)
+
+    @arc4.abimethod(readonly=True)
+    def get_stats(self) -> VariationStats:
+        return self.stats.value.copy()
+
+    @arc4.abimethod(readonly=True)
+    def get_claimable(self, addr: Account) -> arc4.UInt64:
+        if addr in self.claimable:
+            return self.claimable[addr]
+        return arc4.UInt64(0)
 
     @arc4.abimethod(readonly=True)
     def get_participant_count(self) -> arc4.UInt64:
@@ -362,4 +1016,4 @@ class TrustVariation(ARC4Contract):
 
     @arc4.abimethod(readonly=True)
     def get_escrow_balance(self) -> arc4.UInt64:
-        return arc4.UInt64(self.escrow_deposited.value - self.escrow_paid_out.value)
\ No newline at end of file
+        return arc4.UInt64(self._available_escrow())
\ No newline at end of file
@@ -0,0 +1,99 @@
+import logging
+import typing
+
+import algokit_utils
+
+from smart_contracts.shared.types import STATUS_COMPLETED
+from smart_contracts.trust_variation.contract import SWEEP_ENROLLMENT_ORDER, SWEEP_MATCHES, SWEEP_PARTICIPANTS
+
+logger = logging.getLogger(__name__)
+
+# Box references per app call, which is also the number of boxes one call deletes
+_SWEEP_KEYS_PER_CALL = 8
+_SWEEP_GROUP_SIZE = 16
+# Variations requested per get_variations call (pages also stop at the 1 KB return limit)
+_VARIATIONS_PAGE = 32
+
+_SWEEP_PREFIXES = (
+    (SWEEP_PARTICIPANTS, b"p_", 32),
+    (SWEEP_MATCHES, b"m_", 4),
+    (SWEEP_ENROLLMENT_ORDER, b"o_", 4),
+)
+
+
+def experiment_variation_app_ids(
+    algorand: algokit_utils.AlgorandClient, experiments_app_id: int, exp_id: int, sender: str
+) -> list[int]:
+    """App IDs of an experiment's variations in var_id order, paged out of
+    TrustExperiments.get_variations (readonly, so simulated by sender). The
+    generated client returns that page undecoded, as (var_id, app_id, label,
+    created_at) sequences rather than VariationInfo dataclasses.
+    """
+    from smart_contracts.artifacts.trust_experiments.trust_experiments_client import TrustExperimentsClient
+
+    client = TrustExperimentsClient(algorand=algorand, app_id=experiments_app_id, default_sender=sender)
+    experiment = client.send.get_experiment(args=(exp_id,)).abi_return
+    if experiment is None:
+        raise RuntimeError(f"get_experiment returned no experiment {exp_id}")
+    variation_count: int = experiment.variation_count
+    app_ids: list[int] = []
+    while len(app_ids) < variation_count:
+        page = client.send.get_variations(args=(exp_id, len(app_ids), _VARIATIONS_PAGE)).abi_return
+        if not page:
+            raise RuntimeError(f"get_variations returned no variation at var_id {len(app_ids)}")
+        app_ids.extend(variation[1] for variation in page)
+    return app_ids
+
+
+def sweep_experiment(
+    algorand: algokit_utils.AlgorandClient,
+    experiments_app_id: int,
+    exp_id: int,
+    owner: str,
+) -> int:
+    """Sweep the p_, m_ and o_ boxes of every ended variation of an experiment.
+
+    Calls carry 8 keys each (one box reference per key) and are packed 16 to a
+    group across variations, so a group frees up to 128 boxes. Variations that
+    have not ended are skipped. Matches with unsettled deferred payouts are left
+    in place by the contract; settle them and run this again. Returns the total
+    MBR refunded to owner.
+    """
+    from smart_contracts.artifacts.trust_variation.trust_variation_client import TrustVariationClient
+
+    calls = []
+    for app_id in experiment_variation_app_ids(algorand, experiments_app_id, exp_id, owner):
+        client = TrustVariationClient(algorand=algorand, app_id=app_id, default_sender=owner)
+        if client.state.global_state.status != STATUS_COMPLETED:
+            logger.info(f"Variation app {app_id} has not ended, skipping")
+            continue
+
+        box_names = [box.name_raw for box in algorand.app.get_box_names(app_id)]
+        for kind, prefix, key_len in _SWEEP_PREFIXES:
+            keys = [
+                name[len(prefix) :]
+                for name in box_names
+                if name.startswith(prefix) and len(name) == len(prefix) + key_len
+            ]
+            for start in range(0, len(keys), _SWEEP_KEYS_PER_CALL):
+                batch = keys[start : start + _SWEEP_KEYS_PER_CALL]
+                calls.append(
+                    client.params.sweep_boxes(
+                        args=(kind, [*batch]),
+                        params=algokit_utils.CommonAppCallParams(
+                            box_references=[prefix + key for key in batch],
+                            # covers the refund payment's inner fee
+                            extra_fee=algokit_utils.AlgoAmount.from_micro_algo(1_000),
+                        ),
+                    )
+                )
+
+    refunded = 0
+    for start in range(0, len(calls), _SWEEP_GROUP_SIZE):
+        group = algorand.new_group()
+        for call in calls[start : start + _SWEEP_GROUP_SIZE]:
+            group.add_app_call_method_call(call)
+        result = group.send()
+        refunded += sum(typing.cast(int, ret.value) for ret in result.returns)
+    logger.info(f"Swept experiment {exp_id} with {len(calls)} calls, refunded {refunded} microAlgo")
+    return refunded
@@ -0,0 +1,101 @@
+import threading
+from types import SimpleNamespace
+
+import algokit_utils
+import pytest
+
+from smart_contracts.mirror import batch
+from smart_contracts.mirror.batch import batch_read, readonly_call
+
+REGISTRY_APP_ID = 10
+VARIATION_APP_ID = 30
+GET_MATCH = "get_match(uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)"
+
+
+class _FakeComposer:
+    """Records added calls; simulate returns each call's first arg as its value."""
+
+    def __init__(self, algorand: "_FakeAlgorand") -> None:
+        self.algorand = algorand
+        self.calls: list[algokit_utils.AppCallMethodCallParams] = []
+
+    def add_app_call_method_call(self, call: algokit_utils.AppCallMethodCallParams) -> "_FakeComposer":
+        self.calls.append(call)
+        return self
+
+    def simulate(self, **kwargs: object) -> SimpleNamespace:
+        with self.algorand.lock:
+            self.algorand.simulated.append((self.calls, kwargs))
+        return SimpleNamespace(returns=[SimpleNamespace(value=call.args[0]) for call in self.calls])
+
+
+class _FakeAlgorand:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.simulated: list[tuple[list[algokit_utils.AppCallMethodCallParams], dict]] = []
+
+    def new_group(self) -> _FakeComposer:
+        return _FakeComposer(self)
+
+
+def _calls(count: int, sender: str = "CALLER") -> list[algokit_utils.AppCallMethodCallParams]:
+    return [readonly_call(VARIATION_APP_ID, GET_MATCH, match_id, sender=sender) for match_id in range(count)]
+
+
+def test_readonly_call_builds_method_from_signature() -> None:
+    call = readonly_call(REGISTRY_APP_ID, "get_user(address)(uint32,uint8,string,uint64)", "ADDR", sender="CALLER")
+
+    assert call.app_id == REGISTRY_APP_ID
+    assert call.method.name == "get_user"
+    assert [str(arg.type) for arg in call.method.args] == ["address"]
+    assert str(call.method.returns.type) == "(uint32,uint8,string,uint64)"
+    assert (call.args, call.sender) == (["ADDR"], "CALLER")
+
+
+def test_batch_read_splits_into_groups_of_16_in_order() -> None:
+    algorand = _FakeAlgorand()
+
+    values = batch_read(algorand, _calls(40))  # type: ignore[arg-type]
+
+    assert values == list(range(40))
+    sizes = sorted((len(calls) for calls, _ in algorand.simulated), reverse=True)
+    assert sizes == [16, 16, 8]
+    assert all(kwargs == {"skip_signatures": True, "allow_unnamed_resources": True} for _, kwargs in algorand.simulated)
+
+
+def test_batch_read_keeps_order_when_groups_finish_out_of_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Only 2 groups at once, and the first group waits for the second to finish
+    monkeypatch.setattr(batch, "_PARALLEL_GROUPS", 2)
+    second_done = threading.Event()
+    algorand = _FakeAlgorand()
+    simulate = _FakeComposer.simulate
+
+    def ordered_simulate(self: _FakeComposer, **kwargs: object) -> SimpleNamespace:
+        if self.calls[0].args[0] == 0:
+            assert second_done.wait(timeout=5)
+        result = simulate(self, **kwargs)
+        if self.calls[0].args[0] == 16:
+            second_done.set()
+        return result
+
+    monkeypatch.setattr(_FakeComposer, "simulate", ordered_simulate)
+
+    assert batch_read(algorand, _calls(20)) == list(range(20))  # type: ignore[arg-type]
+    assert [calls[0].args[0] for calls, _ in algorand.simulated] == [16, 0]
+
+
+def test_batch_read_replaces_sender() -> None:
+    algorand = _FakeAlgorand()
+    calls = _calls(3, sender="ORIGINAL")
+
+    batch_read(algorand, calls, sender="FUNDED")  # type: ignore[arg-type]
+
+    assert [call.sender for call in algorand.simulated[0][0]] == ["FUNDED"] * 3
+    assert [call.sender for call in calls] == ["ORIGINAL"] * 3
+
+
+def test_batch_read_no_calls() -> None:
+    algorand = _FakeAlgorand()
+
+    assert batch_read(algorand, []) == []  # type: ignore[arg-type]
+    assert algorand.simulated == []
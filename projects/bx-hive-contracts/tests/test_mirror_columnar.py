@@ -0,0 +1,119 @@
+import sys
+
+import pytest
+from algopy import arc4
+
+from smart_contracts.mirror.columnar import (
+    MATCH_SIZE,
+    PARTICIPANT_INFO_SIZE,
+    decode_matches,
+    decode_participants,
+    join_values,
+    to_columns,
+)
+from smart_contracts.shared.types import Match, ParticipantInfo
+
+# NumPy is an optional dependency of mirror/columnar.py and is not in the lock file
+np = pytest.importorskip("numpy")
+
+ALICE = bytes(range(32))
+BOB = bytes(range(32, 64))
+
+
+def _match(match_id: int, investment: int) -> Match:
+    return Match(
+        match_id=arc4.UInt32(match_id),
+        investor=arc4.Address(ALICE),
+        trustee=arc4.Address(BOB),
+        phase=arc4.UInt8(2),
+        created_at=arc4.UInt64(1_700_000_000 + match_id),
+        investment=arc4.UInt64(investment),
+        return_amount=arc4.UInt64(investment * 2),
+        investor_payout=arc4.UInt64(2**64 - 1),
+        trustee_payout=arc4.UInt64(investment + 1),
+        completed_at=arc4.UInt64(1_700_000_100 + match_id),
+        paid_out=arc4.UInt8(1),
+    )
+
+
+def _participant(assigned: int, match_id: int) -> ParticipantInfo:
+    return ParticipantInfo(enrolled=arc4.UInt8(1), assigned=arc4.UInt8(assigned), match_id=arc4.UInt32(match_id))
+
+
+def test_sizes_match_the_arc4_structs() -> None:
+    assert len(_match(0, 0).bytes.value) == MATCH_SIZE
+    assert len(_participant(0, 0).bytes.value) == PARTICIPANT_INFO_SIZE
+
+
+def test_decode_matches_fields() -> None:
+    matches = [_match(0, 40), _match(70_000, 2**40)]
+
+    records = decode_matches(join_values(match.bytes.value for match in matches))
+
+    assert len(records) == 2
+    for record, match in zip(records, matches, strict=True):
+        assert record["match_id"] == match.match_id.as_uint64()
+        assert bytes(record["investor"]) == ALICE
+        assert bytes(record["trustee"]) == BOB
+        assert record["phase"] == 2
+        assert record["created_at"] == match.created_at.as_uint64()
+        assert record["investment"] == match.investment.as_uint64()
+        assert record["return_amount"] == match.return_amount.as_uint64()
+        assert record["investor_payout"] == 2**64 - 1
+        assert record["trustee_payout"] == match.trustee_payout.as_uint64()
+        assert record["completed_at"] == match.completed_at.as_uint64()
+        assert record["paid_out"] == 1
+
+
+def test_decode_participants_fields() -> None:
+    infos = [_participant(0, 0), _participant(1, 258)]
+
+    records = decode_participants(join_values(info.bytes.value for info in infos))
+
+    assert records["enrolled"].tolist() == [1, 1]
+    assert records["assigned"].tolist() == [0, 1]
+    assert records["match_id"].tolist() == [0, 258]
+
+
+def test_decode_empty_buffer() -> None:
+    assert len(decode_matches(b"")) == 0
+    assert len(decode_participants(join_values([]))) == 0
+
+
+@pytest.mark.parametrize(
+    ("decode", "size"), [(decode_matches, MATCH_SIZE), (decode_participants, PARTICIPANT_INFO_SIZE)]
+)
+def test_decode_rejects_partial_records(decode: object, size: int) -> None:
+    with pytest.raises(ValueError, match=f"not a whole number of {size}-byte records"):
+        decode(bytes(size + 1))  # type: ignore[operator]
+
+
+def test_to_columns_matches_struct_values() -> None:
+    matches = [_match(match_id, 1_000 * match_id) for match_id in range(5)]
+    records = decode_matches(join_values(match.bytes.value for match in matches))
+
+    columns = to_columns(records)
+
+    assert set(columns) == set(records.dtype.names)
+    native = "<" if sys.byteorder == "little" else ">"
+    for column in columns.values():
+        assert column.flags.c_contiguous
+        assert column.dtype.byteorder in ("=", "|", native)
+    assert columns["match_id"].tolist() == [match.match_id.as_uint64() for match in matches]
+    assert columns["investment"].tolist() == [match.investment.as_uint64() for match in matches]
+    assert columns["investor_payout"].dtype == np.uint64
+    assert columns["investor_payout"].tolist() == [2**64 - 1] * 5
+    assert columns["investor"].shape == (5, 32)
+    assert all(bytes(row) == ALICE for row in columns["investor"])
+    # Arithmetic on the copies works without byte-swapping
+    assert int(columns["trustee_payout"].sum()) == sum(1_000 * i + 1 for i in range(5))
+
+
+def test_to_columns_participants() -> None:
+    records = decode_participants(join_values(_participant(i % 2, i).bytes.value for i in range(4)))
+
+    columns = to_columns(records)
+
+    assert columns["match_id"].dtype == np.dtype("=u4")
+    assert columns["match_id"].tolist() == [0, 1, 2, 3]
+    assert columns["assigned"].tolist() == [0, 1, 0, 1]
@@ -0,0 +1,189 @@
+import asyncio
+import base64
+import http.client
+import json
+import urllib.parse
+
+import pytest
+from algopy import arc4
+
+from smart_contracts.mirror.boxes import MATCHES, PARTICIPANTS
+from smart_contracts.mirror.reader import AsyncBoxReader
+from smart_contracts.shared.types import Match, ParticipantInfo
+
+VARIATION_APP_ID = 30
+
+
+def _match(match_id: int) -> bytes:
+    return Match(
+        match_id=arc4.UInt32(match_id),
+        investor=arc4.Address(bytes(32)),
+        trustee=arc4.Address(bytes(range(32))),
+        phase=arc4.UInt8(2),
+        created_at=arc4.UInt64(1_000),
+        investment=arc4.UInt64(40),
+        return_amount=arc4.UInt64(60),
+        investor_payout=arc4.UInt64(120),
+        trustee_payout=arc4.UInt64(110),
+        completed_at=arc4.UInt64(1_100),
+        paid_out=arc4.UInt8(1),
+    ).bytes.value
+
+
+class _FakeAlgod:
+    """Stands in for AsyncBoxReader._request: answers box and box-list paths from a dict."""
+
+    def __init__(self, boxes: dict[bytes, bytes]) -> None:
+        self.boxes = boxes
+        self.requests: list[tuple[str, dict[str, str]]] = []
+
+    def __call__(self, conn: object, path: str, headers: dict[str, str] | None = None) -> dict | None:
+        self.requests.append((path, headers or {}))
+        if path.endswith("/boxes"):
+            return {"boxes": [{"name": base64.b64encode(name).decode()} for name in self.boxes]}
+        name = base64.b64decode(urllib.parse.unquote(path.split("name=b64:")[1]))
+        if name not in self.boxes:
+            return None
+        return {"name": base64.b64encode(name).decode(), "value": base64.b64encode(self.boxes[name]).decode()}
+
+
+def _reader(monkeypatch: pytest.MonkeyPatch, boxes: dict[bytes, bytes]) -> tuple[AsyncBoxReader, _FakeAlgod]:
+    algod = _FakeAlgod(boxes)
+    monkeypatch.setattr(AsyncBoxReader, "_request", staticmethod(algod))
+    return AsyncBoxReader("http://localhost:4001/algod", "secret", concurrency=2), algod
+
+
+# -------------------------------------------------------------------------
+# Paths and box names
+# -------------------------------------------------------------------------
+
+
+def test_box_url_is_base64_and_percent_encoded(monkeypatch: pytest.MonkeyPatch) -> None:
+    # b"m_\xfb\xff" encodes to "bV/7/w==", whose "/" and "=" must be escaped in the query string
+    name = b"m_" + bytes([0xFB, 0xFF])
+    reader, algod = _reader(monkeypatch, {name: b"\x01"})
+
+    assert asyncio.run(reader.box(VARIATION_APP_ID, name)) == b"\x01"
+
+    path, headers = algod.requests[0]
+    assert path == f"/algod/v2/applications/{VARIATION_APP_ID}/box?name=b64:bV%2F7%2Fw%3D%3D"
+    assert headers == {"X-Algo-API-Token": "secret"}
+    reader.close()
+
+
+def test_box_missing_is_none(monkeypatch: pytest.MonkeyPatch) -> None:
+    reader, _ = _reader(monkeypatch, {})
+
+    assert asyncio.run(reader.box(VARIATION_APP_ID, b"m_" + bytes(4))) is None
+    reader.close()
+
+
+def test_box_names_filter_by_prefix_and_sort(monkeypatch: pytest.MonkeyPatch) -> None:
+    boxes = {b"p_" + bytes(32): b"", b"m_" + (1).to_bytes(4, "big"): b"", b"m_" + bytes(4): b""}
+    reader, algod = _reader(monkeypatch, boxes)
+
+    names = asyncio.run(reader.box_names(VARIATION_APP_ID, MATCHES.prefix))
+
+    assert names == [b"m_" + bytes(4), b"m_" + (1).to_bytes(4, "big")]
+    assert algod.requests[0][0] == f"/algod/v2/applications/{VARIATION_APP_ID}/boxes"
+    reader.close()
+
+
+def test_get_match_and_rows_drop_missing_boxes(monkeypatch: pytest.MonkeyPatch) -> None:
+    boxes = {b"m_" + bytes(4): _match(0), b"m_" + (2).to_bytes(4, "big"): _match(2)}
+    reader, _ = _reader(monkeypatch, boxes)
+
+    async def read() -> tuple[list[dict], dict | None]:
+        return await reader.matches(VARIATION_APP_ID, [0, 1, 2]), await reader.get_match(VARIATION_APP_ID, 1)
+
+    rows, missing = asyncio.run(read())
+
+    assert [row["match_id"] for row in rows] == [0, 2]
+    assert missing is None
+    reader.close()
+
+
+def test_rows_skip_names_of_other_layouts(monkeypatch: pytest.MonkeyPatch) -> None:
+    info = ParticipantInfo(enrolled=arc4.UInt8(1), assigned=arc4.UInt8(0), match_id=arc4.UInt32(0)).bytes.value
+    boxes = {b"p_" + bytes(32): info, b"p_short": b"\x00"}
+    reader, algod = _reader(monkeypatch, boxes)
+
+    rows = asyncio.run(reader.rows(VARIATION_APP_ID, PARTICIPANTS, list(boxes)))
+
+    assert len(rows) == 1
+    assert rows[0]["enrolled"] == 1
+    assert len(algod.requests) == 1  # the malformed name is never fetched
+    reader.close()
+
+
+def test_match_records_decode_in_match_id_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("numpy")
+    boxes = {b"m_" + (1).to_bytes(4, "big"): _match(1), b"m_" + bytes(4): _match(0)}
+    reader, _ = _reader(monkeypatch, boxes)
+
+    records = asyncio.run(reader.match_records(VARIATION_APP_ID))
+
+    assert records["match_id"].tolist() == [0, 1]
+    assert records["investor_payout"].tolist() == [120, 120]
+    reader.close()
+
+
+# -------------------------------------------------------------------------
+# HTTP retry
+# -------------------------------------------------------------------------
+
+
+class _Response:
+    def __init__(self, status: int, body: bytes) -> None:
+        self.status = status
+        self._body = body
+
+    def read(self) -> bytes:
+        return self._body
+
+
+class _Connection:
+    """HTTPConnection double; the first `failures` requests raise like a dropped keep-alive."""
+
+    def __init__(self, status: int = 200, body: bytes = b"{}", failures: int = 0) -> None:
+        self.status = status
+        self.body = body
+        self.failures = failures
+        self.requests: list[str] = []
+        self.closed = 0
+
+    def request(self, method: str, path: str, headers: dict[str, str]) -> None:
+        self.requests.append(path)
+        if self.failures:
+            self.failures -= 1
+            raise http.client.RemoteDisconnected("Remote end closed connection without response")
+
+    def getresponse(self) -> _Response:
+        return _Response(self.status, self.body)
+
+    def close(self) -> None:
+        self.closed += 1
+
+
+def test_request_reopens_a_dropped_connection_once() -> None:
+    conn = _Connection(body=json.dumps({"value": "AQ=="}).encode(), failures=1)
+
+    result = AsyncBoxReader._request(conn, "/v2/applications/30/box?name=b64:AA%3D%3D")  # type: ignore[arg-type]
+
+    assert result == {"value": "AQ=="}
+    assert conn.closed == 1
+    assert conn.requests == ["/v2/applications/30/box?name=b64:AA%3D%3D"] * 2
+
+
+def test_request_second_failure_propagates() -> None:
+    conn = _Connection(failures=2)
+
+    with pytest.raises(http.client.RemoteDisconnected):
+        AsyncBoxReader._request(conn, "/v2/status")  # type: ignore[arg-type]
+
+
+def test_request_404_is_none_and_errors_raise() -> None:
+    assert AsyncBoxReader._request(_Connection(status=404), "/v2/x") is None  # type: ignore[arg-type]
+
+    with pytest.raises(RuntimeError, match="algod GET /v2/x failed: 500"):
+        AsyncBoxReader._request(_Connection(status=500, body=b"boom"), "/v2/x")  # type: ignore[arg-type]
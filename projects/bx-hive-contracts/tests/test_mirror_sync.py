@@ -0,0 +1,263 @@
+import base64
+from types import SimpleNamespace
+
+import pytest
+from algopy import arc4
+from algosdk import encoding
+from algosdk.error import AlgodHTTPError
+
+from smart_contracts.mirror.boxes import EXPERIMENTS, MATCHES, PARTICIPANTS, USERS, VARIATIONS, decode_row, spec_for
+from smart_contracts.mirror.sync import StateMirror, _box_references
+from smart_contracts.shared.types import ExperimentGroup, Match, ParticipantInfo, User, VariationInfo
+
+REGISTRY_APP_ID = 10
+EXPERIMENTS_APP_ID = 20
+VARIATION_APP_ID = 30
+
+ALICE = bytes(range(32))
+BOB = bytes(range(32, 64))
+
+
+def _user(user_id: int, name: str) -> bytes:
+    return User(
+        user_id=arc4.UInt32(user_id), role=arc4.UInt8(1), name=arc4.String(name), created_at=arc4.UInt64(1_700)
+    ).bytes.value
+
+
+def _experiment(variation_count: int) -> bytes:
+    return ExperimentGroup(
+        exp_id=arc4.UInt32(3),
+        owner=arc4.Address(ALICE),
+        name=arc4.String("Trust"),
+        created_at=arc4.UInt64(1_800),
+        variation_count=arc4.UInt64(variation_count),
+    ).bytes.value
+
+
+def _variation(app_id: int) -> bytes:
+    return VariationInfo(
+        var_id=arc4.UInt32(1), app_id=arc4.UInt64(app_id), label=arc4.String("m=3"), created_at=arc4.UInt64(1_900)
+    ).bytes.value
+
+
+def _participant(assigned: int, match_id: int) -> bytes:
+    return ParticipantInfo(
+        enrolled=arc4.UInt8(1), assigned=arc4.UInt8(assigned), match_id=arc4.UInt32(match_id)
+    ).bytes.value
+
+
+def _match(phase: int) -> bytes:
+    return Match(
+        match_id=arc4.UInt32(0),
+        investor=arc4.Address(ALICE),
+        trustee=arc4.Address(BOB),
+        phase=arc4.UInt8(phase),
+        created_at=arc4.UInt64(2_000),
+        investment=arc4.UInt64(40),
+        return_amount=arc4.UInt64(60),
+        investor_payout=arc4.UInt64(120),
+        trustee_payout=arc4.UInt64(110),
+        completed_at=arc4.UInt64(2_100),
+        paid_out=arc4.UInt8(1),
+    ).bytes.value
+
+
+# -------------------------------------------------------------------------
+# Row decoding (mirror/boxes.py)
+# -------------------------------------------------------------------------
+
+
+def test_decode_user_row() -> None:
+    row = decode_row(USERS, b"u_" + ALICE, _user(7, "Alice"))
+
+    assert row == {
+        "address": encoding.encode_address(ALICE),
+        "user_id": 7,
+        "role": 1,
+        "name": "Alice",
+        "created_at": 1_700,
+    }
+
+
+def test_decode_experiment_and_variation_rows() -> None:
+    experiment = decode_row(EXPERIMENTS, b"e_" + (3).to_bytes(4, "big"), _experiment(2))
+    variation = decode_row(VARIATIONS, b"v_" + ((3 << 32) + 1).to_bytes(8, "big"), _variation(VARIATION_APP_ID))
+
+    assert experiment == {
+        "exp_id": 3,
+        "owner": encoding.encode_address(ALICE),
+        "name": "Trust",
+        "created_at": 1_800,
+        "variation_count": 2,
+    }
+    # The v_ key packs (exp_id << 32 | var_id); only exp_id becomes a column
+    assert variation == {
+        "exp_id": 3,
+        "var_id": 1,
+        "variation_app_id": VARIATION_APP_ID,
+        "label": "m=3",
+        "created_at": 1_900,
+    }
+
+
+def test_decode_participant_and_match_rows() -> None:
+    participant = decode_row(PARTICIPANTS, b"p_" + BOB, _participant(1, 0))
+    match = decode_row(MATCHES, b"m_" + bytes(4), _match(2))
+
+    assert participant == {"address": encoding.encode_address(BOB), "enrolled": 1, "assigned": 1, "match_id": 0}
+    assert match["investor"] == encoding.encode_address(ALICE)
+    assert match["trustee"] == encoding.encode_address(BOB)
+    assert (match["phase"], match["investor_payout"], match["trustee_payout"], match["paid_out"]) == (2, 120, 110, 1)
+
+
+def test_spec_for_checks_prefix_and_key_length() -> None:
+    specs = (PARTICIPANTS, MATCHES)
+
+    assert spec_for(b"p_" + ALICE, specs) is PARTICIPANTS
+    assert spec_for(b"m_" + bytes(4), specs) is MATCHES
+    assert spec_for(b"m_" + bytes(8), specs) is None
+    assert spec_for(b"o_" + bytes(4), specs) is None
+
+
+# -------------------------------------------------------------------------
+# _box_references
+# -------------------------------------------------------------------------
+
+
+def _ref(app: int, name: bytes) -> dict:
+    return {"app": app, "name": base64.b64encode(name).decode()}
+
+
+def test_box_references_own_app() -> None:
+    txn = {"application-transaction": {"application-id": VARIATION_APP_ID, "box-references": [_ref(0, b"m_0000")]}}
+
+    assert list(_box_references(txn, VARIATION_APP_ID)) == [b"m_0000"]
+    assert list(_box_references(txn, EXPERIMENTS_APP_ID)) == []
+
+
+def test_box_references_map_foreign_app_index() -> None:
+    # Index 0 is the called app; index i is foreign-apps[i - 1]
+    txn = {
+        "application-transaction": {
+            "application-id": EXPERIMENTS_APP_ID,
+            "foreign-apps": [REGISTRY_APP_ID, VARIATION_APP_ID],
+            "box-references": [_ref(0, b"e_0003"), _ref(1, b"u_alice"), _ref(2, b"p_bob")],
+        }
+    }
+
+    assert list(_box_references(txn, EXPERIMENTS_APP_ID)) == [b"e_0003"]
+    assert list(_box_references(txn, REGISTRY_APP_ID)) == [b"u_alice"]
+    assert list(_box_references(txn, VARIATION_APP_ID)) == [b"p_bob"]
+
+
+def test_box_references_app_create_and_inner_txns() -> None:
+    # A create call has application-id 0 and reports the new app separately
+    create = {
+        "created-application-index": VARIATION_APP_ID,
+        "application-transaction": {"application-id": 0, "box-references": [_ref(0, b"roster")]},
+    }
+    outer = {
+        "application-transaction": {"application-id": EXPERIMENTS_APP_ID, "box-references": []},
+        "inner-txns": [{"tx-type": "pay"}, create],
+    }
+
+    assert list(_box_references(outer, VARIATION_APP_ID)) == [b"roster"]
+
+
+def test_box_references_skips_non_app_calls() -> None:
+    assert list(_box_references({"tx-type": "pay"}, VARIATION_APP_ID)) == []
+
+
+# -------------------------------------------------------------------------
+# StateMirror.sync
+# -------------------------------------------------------------------------
+
+
+class _FakeChain:
+    """algorand.app box reads plus the indexer search StateMirror uses."""
+
+    def __init__(self) -> None:
+        self.boxes: dict[int, dict[bytes, bytes]] = {}
+        self.txns: dict[int, list[dict]] = {}
+        self.indexer_round = 0
+        self.searches: list[dict] = []
+        self.app = self
+        self.client = SimpleNamespace(indexer=self, algod=None)
+
+    def get_box_names(self, app_id: int) -> list[SimpleNamespace]:
+        return [SimpleNamespace(name_raw=name) for name in self.boxes.get(app_id, {})]
+
+    def get_box_value(self, app_id: int, name: bytes) -> bytes:
+        if name not in self.boxes.get(app_id, {}):
+            raise AlgodHTTPError("box not found", code=404)
+        return self.boxes[app_id][name]
+
+    def search_transactions(self, application_id: int, **kwargs: object) -> dict:
+        self.searches.append({"application_id": application_id, **kwargs})
+        transactions = [] if kwargs.get("limit") == 1 else self.txns.get(application_id, [])
+        return {"current-round": self.indexer_round, "transactions": transactions}
+
+
+@pytest.fixture()
+def chain() -> _FakeChain:
+    chain = _FakeChain()
+    chain.boxes = {
+        REGISTRY_APP_ID: {b"u_" + ALICE: _user(0, "Alice")},
+        EXPERIMENTS_APP_ID: {
+            b"e_" + (3).to_bytes(4, "big"): _experiment(1),
+            b"v_" + ((3 << 32) + 1).to_bytes(8, "big"): _variation(VARIATION_APP_ID),
+        },
+        VARIATION_APP_ID: {b"p_" + ALICE: _participant(0, 0), b"p_" + BOB: _participant(0, 0)},
+    }
+    chain.indexer_round = 10
+    return chain
+
+
+def test_sync_is_bounded_by_the_indexer_round(chain: _FakeChain) -> None:
+    # algod is never asked: its last round may be ahead of what the indexer has seen
+    mirror = StateMirror(chain, ":memory:", REGISTRY_APP_ID, EXPERIMENTS_APP_ID)  # type: ignore[arg-type]
+
+    assert mirror.sync() == 10
+    assert [row["name"] for row in mirror.users()] == ["Alice"]
+    assert [row["variation_app_id"] for row in mirror.variations(3)] == [VARIATION_APP_ID]
+    assert len(mirror.participants(VARIATION_APP_ID)) == 2
+    states = mirror.db.execute("SELECT last_round FROM sync_state").fetchall()
+    assert [row["last_round"] for row in states] == [10, 10, 10]
+
+
+def test_sync_rereads_only_touched_boxes(chain: _FakeChain) -> None:
+    mirror = StateMirror(chain, ":memory:", REGISTRY_APP_ID, EXPERIMENTS_APP_ID)  # type: ignore[arg-type]
+    mirror.sync()
+
+    # Rounds 11..12: a match is created and Bob's box is swept
+    chain.boxes[VARIATION_APP_ID][b"m_" + bytes(4)] = _match(0)
+    chain.boxes[VARIATION_APP_ID][b"p_" + ALICE] = _participant(1, 0)
+    del chain.boxes[VARIATION_APP_ID][b"p_" + BOB]
+    chain.txns[VARIATION_APP_ID] = [
+        {
+            "application-transaction": {
+                "application-id": VARIATION_APP_ID,
+                "box-references": [_ref(0, b"m_" + bytes(4)), _ref(0, b"p_" + ALICE), _ref(0, b"p_" + BOB)],
+            }
+        }
+    ]
+    chain.indexer_round = 12
+    chain.searches.clear()
+
+    assert mirror.sync() == 12
+    participants = mirror.participants(VARIATION_APP_ID)
+    assert [(row["address"], row["assigned"]) for row in participants] == [(encoding.encode_address(ALICE), 1)]
+    assert [row["phase"] for row in mirror.matches(VARIATION_APP_ID)] == [0]
+    variation_search = next(s for s in chain.searches if s["application_id"] == VARIATION_APP_ID)
+    assert (variation_search["min_round"], variation_search["max_round"]) == (11, 12)
+
+
+def test_sync_skips_apps_already_at_the_indexer_round(chain: _FakeChain) -> None:
+    mirror = StateMirror(chain, ":memory:", REGISTRY_APP_ID, EXPERIMENTS_APP_ID)  # type: ignore[arg-type]
+    mirror.sync()
+    chain.searches.clear()
+
+    mirror.sync()
+
+    # Only the round lookup; no app is searched
+    assert chain.searches == [{"application_id": REGISTRY_APP_ID, "limit": 1}]
@@ -1,10 +1,14 @@
+import hashlib
 from collections.abc import Iterator
 
 import pytest
-from algopy import arc4
+from algopy import Account, Application, Bytes, arc4
 from algopy_testing import AlgopyTestContext, algopy_testing_context
 
-from smart_contracts.registry.contract import BxHiveRegistry
+from smart_contracts.registry.contract import USER_MBR, USER_NAME_BYTE_MBR, BxHiveRegistry
+from smart_contracts.registry.membership import member_root
+from smart_contracts.shared.events import UserRegistered, UsersRegistered
+from smart_contracts.shared.membership import MEMBER_ROOTS_KEPT
 from smart_contracts.shared.types import ADMIN_OPERATOR, ROLE_EXPERIMENTER, ROLE_PARTICIPANT
 
 
@@ -94,4 +98,207 @@ def test_get_user_not_found_fails(context: AlgopyTestContext, registry: BxHiveRe
 
 def test_get_template_not_found_fails(context: AlgopyTestContext, registry: BxHiveRegistry) -> None:
     with pytest.raises(Exception, match="Template not found"):
-        registry.get_template(arc4.UInt8(99))
\ No newline at end of file
+        registry.get_template(arc4.UInt8(99))
+
+# -------------------------------------------------------------------------
+# register_users (operator bulk registration)
+# -------------------------------------------------------------------------
+
+
+def _register_users(
+    ctx: AlgopyTestContext,
+    registry: BxHiveRegistry,
+    accounts: list[Account],
+    names: list[str],
+    mbr: int | None = None,
+) -> arc4.UInt32:
+    app_addr = ctx.ledger.get_app(registry.__app_id__).address
+    if mbr is None:
+        mbr = sum(USER_MBR + USER_NAME_BYTE_MBR * len(name) for name in names)
+    mbr_pay = ctx.any.txn.payment(receiver=app_addr, amount=mbr)
+    return registry.register_users(
+        arc4.DynamicArray(*(arc4.Address(a) for a in accounts)),
+        arc4.DynamicArray(*(arc4.UInt8(ROLE_PARTICIPANT) for _ in accounts)),
+        arc4.DynamicArray(*(arc4.String(n) for n in names)),
+        mbr_pay,
+    )
+
+
+def test_register_users(context: AlgopyTestContext, registry: BxHiveRegistry) -> None:
+    registry.register_user(arc4.UInt8(ROLE_EXPERIMENTER), arc4.String("Alice"))
+    a, b = context.any.account(), context.any.account()
+
+    first_id = _register_users(context, registry, [a, b], ["P1", "P2"])
+
+    assert first_id == arc4.UInt32(1)
+    assert registry.user_count.value == 3
+    assert registry.get_user(b).name == arc4.String("P2")
+    assert registry.user_ids[arc4.UInt32(2)] == arc4.Address(b)
+
+
+def test_register_users_by_operator(context: AlgopyTestContext, registry: BxHiveRegistry) -> None:
+    operator = context.any.account()
+    registry.add_admin(operator, arc4.UInt8(ADMIN_OPERATOR))
+    app_call = context.any.txn.application_call(sender=operator, app_id=Application(registry.__app_id__))
+    with context.txn.create_group(gtxns=[app_call], active_txn_index=0):
+        _register_users(context, registry, [context.any.account()], ["P1"])
+
+    assert registry.user_count.value == 1
+
+
+def test_register_users_not_operator_fails(context: AlgopyTestContext, registry: BxHiveRegistry) -> None:
+    other = context.any.account()
+    app_call = context.any.txn.application_call(sender=other, app_id=Application(registry.__app_id__))
+    with context.txn.create_group(gtxns=[app_call], active_txn_index=0):
+        with pytest.raises(Exception, match="Not operator"):
+            _register_users(context, registry, [context.any.account()], ["P1"])
+
+
+def test_register_users_insufficient_mbr_fails(context: AlgopyTestContext, registry: BxHiveRegistry) -> None:
+    with pytest.raises(Exception, match="Insufficient MBR"):
+        _register_users(context, registry, [context.any.account()], ["Long name"], mbr=USER_MBR)
+
+
+def test_register_users_duplicate_fails(context: AlgopyTestContext, registry: BxHiveRegistry) -> None:
+    a = context.any.account()
+    with pytest.raises(Exception, match="Already registered"):
+        _register_users(context, registry, [a, a], ["P1", "P1"])
+
+
+def test_register_users_length_mismatch_fails(context: AlgopyTestContext, registry: BxHiveRegistry) -> None:
+    with pytest.raises(Exception, match="Length mismatch"):
+        _register_users(context, registry, [context.any.account()], ["P1", "P2"])
+
+
+# -------------------------------------------------------------------------
+# get_users / get_users_by_role
+# -------------------------------------------------------------------------
+
+
+def _register_as(ctx: AlgopyTestContext, registry: BxHiveRegistry, role: int, name: str) -> Account:
+    account = ctx.any.account()
+    app_call = ctx.any.txn.application_call(sender=account, app_id=Application(registry.__app_id__))
+    with ctx.txn.create_group(gtxns=[app_call], active_txn_index=0):
+        registry.register_user(arc4.UInt8(role), arc4.String(name))
+    return account
+
+
+def test_get_users_pages(context: AlgopyTestContext, registry: BxHiveRegistry) -> None:
+    accounts = [_register_as(context, registry, ROLE_PARTICIPANT, f"P{i}") for i in range(3)]
+
+    page = registry.get_users(arc4.UInt32(1), arc4.UInt32(10))
+
+    assert page.length == 2
+    assert page[0][0] == arc4.Address(accounts[1])
+    assert page[1][1].name == arc4.String("P2")
+
+
+def test_get_users_stops_at_return_limit(context: AlgopyTestContext, registry: BxHiveRegistry) -> None:
+    for i in range(12):
+        _register_as(context, registry, ROLE_PARTICIPANT, f"{i:02d}" + "x" * 48)
+
+    page = registry.get_users(arc4.UInt32(0), arc4.UInt32(12))
+
+    assert 0 < page.length < 12
+    assert len(page.bytes) <= 1_020
+
+
+def test_get_users_by_role(context: AlgopyTestContext, registry: BxHiveRegistry) -> None:
+    _register_as(context, registry, ROLE_EXPERIMENTER, "Alice")
+    bob = _register_as(context, registry, ROLE_PARTICIPANT, "Bob")
+    _register_as(context, registry, ROLE_EXPERIMENTER, "Carol")
+    dan = _register_as(context, registry, ROLE_PARTICIPANT, "Dan")
+
+    page = registry.get_users_by_role(arc4.UInt8(ROLE_PARTICIPANT), arc4.UInt32(0), arc4.UInt32(10))
+
+    assert registry.get_role_count(arc4.UInt8(ROLE_PARTICIPANT)) == arc4.UInt32(2)
+    assert [entry[0] for entry in page] == [arc4.Address(bob), arc4.Address(dan)]
+    assert page[1][1].user_id == arc4.UInt32(3)
+
+
+def test_get_users_by_role_unknown_role_is_empty(context: AlgopyTestContext, registry: BxHiveRegistry) -> None:
+    _register_as(context, registry, ROLE_EXPERIMENTER, "Alice")
+
+    page = registry.get_users_by_role(arc4.UInt8(ROLE_PARTICIPANT), arc4.UInt32(0), arc4.UInt32(10))
+
+    assert page.length == 0
+    assert registry.get_role_count(arc4.UInt8(ROLE_PARTICIPANT)) == arc4.UInt32(0)
+
+
+# -------------------------------------------------------------------------
+# Member tree
+# -------------------------------------------------------------------------
+
+
+def test_member_root_tracks_registrations(context: AlgopyTestContext, registry: BxHiveRegistry) -> None:
+    accounts = [_register_as(context, registry, ROLE_PARTICIPANT, f"P{i}") for i in range(5)]
+
+    roots = registry.get_member_roots().value
+
+    assert roots[:32] == member_root([a.bytes.value for a in accounts])
+    assert roots[32:64] == member_root([a.bytes.value for a in accounts[:4]])
+    assert len(roots) == 5 * 32
+
+
+def test_member_roots_keep_a_window_across_slots(context: AlgopyTestContext, registry: BxHiveRegistry) -> None:
+    accounts = [_register_as(context, registry, ROLE_PARTICIPANT, f"P{i}") for i in range(MEMBER_ROOTS_KEPT + 2)]
+    members = [a.bytes.value for a in accounts]
+
+    roots = registry.get_member_roots().value
+
+    # Newest first; the two oldest roots have been dropped from the last slot
+    assert len(roots) == MEMBER_ROOTS_KEPT * 32
+    expected = [member_root(members[: len(members) - i]) for i in range(MEMBER_ROOTS_KEPT)]
+    assert [roots[i : i + 32] for i in range(0, len(roots), 32)] == expected
+    assert context.ledger.get_global_state(registry, b"mr0") == b"".join(expected[:3])
+
+
+def test_member_root_updated_once_per_bulk_call(context: AlgopyTestContext, registry: BxHiveRegistry) -> None:
+    accounts = [context.any.account(), context.any.account()]
+    _register_users(context, registry, accounts, ["P1", "P2"])
+
+    roots = registry.get_member_roots().value
+
+    assert roots == member_root([a.bytes.value for a in accounts])
+
+
+# -------------------------------------------------------------------------
+# ARC-28 events
+# -------------------------------------------------------------------------
+
+
+def _event_log(signature: str, event: arc4.Struct) -> Bytes:
+    """The log arc4.emit writes: sha512_256(signature)[:4] + the encoded struct."""
+    return Bytes(hashlib.new("sha512_256", signature.encode()).digest()[:4]) + event.bytes
+
+
+def _last_logs(ctx: AlgopyTestContext) -> list[Bytes]:
+    txn = ctx.txn.last_active
+    return [txn.logs(i) for i in range(txn.num_logs)]
+
+
+def test_register_user_emits_user_registered(context: AlgopyTestContext, registry: BxHiveRegistry) -> None:
+    registry.register_user(arc4.UInt8(ROLE_PARTICIPANT), arc4.String("Bob"))
+
+    logs = _last_logs(context)
+    # The event, then the ABI return log
+    assert len(logs) == 2
+    assert logs[0] == _event_log(
+        "UserRegistered(uint32,address,uint8)",
+        UserRegistered(
+            user_id=arc4.UInt32(0), addr=arc4.Address(context.default_sender), role=arc4.UInt8(ROLE_PARTICIPANT)
+        ),
+    )
+
+
+def test_register_users_emits_one_event_per_call(context: AlgopyTestContext, registry: BxHiveRegistry) -> None:
+    # 40 UserRegistered events would be 1,640 bytes, past the 1,024-byte log limit
+    registry.register_user(arc4.UInt8(ROLE_EXPERIMENTER), arc4.String("Alice"))
+    accounts = [context.any.account() for _ in range(40)]
+    _register_users(context, registry, accounts, [f"P{i}" for i in range(40)])
+
+    logs = _last_logs(context)
+    assert logs[0] == _event_log(
+        "UsersRegistered(uint32,uint32)", UsersRegistered(first_user_id=arc4.UInt32(1), count=arc4.UInt32(40))
+    )
+    assert len(logs) == 2
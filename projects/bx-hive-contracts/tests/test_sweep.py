@@ -0,0 +1,74 @@
+from types import SimpleNamespace
+
+import pytest
+
+from smart_contracts.artifacts.trust_experiments import trust_experiments_client
+from smart_contracts.trust_variation import sweep
+
+
+class _FakeExperimentsClient:
+    """get_experiment / get_variations over a fixed list of variation app IDs.
+
+    Pages stop after page_limit entries to mimic the 1 KB return cap. Like the
+    generated client, get_variations returns each VariationInfo as the list
+    algosdk decodes it to, (var_id, app_id, label, created_at).
+    """
+
+    def __init__(self, app_ids: list[int], page_limit: int) -> None:
+        self.app_ids = app_ids
+        self.page_limit = page_limit
+        self.calls: list[tuple[int, int, int]] = []
+        self.missing = False
+        self.send = self
+
+    def get_experiment(self, args: tuple[int]) -> SimpleNamespace:
+        if self.missing:
+            return SimpleNamespace(abi_return=None)
+        return SimpleNamespace(abi_return=SimpleNamespace(variation_count=len(self.app_ids)))
+
+    def get_variations(self, args: tuple[int, int, int]) -> SimpleNamespace:
+        self.calls.append(args)
+        _, start, count = args
+        end = min(start + count, start + self.page_limit, len(self.app_ids))
+        page = [[var_id, self.app_ids[var_id], f"v{var_id}", 1_700] for var_id in range(start, end)]
+        return SimpleNamespace(abi_return=page)
+
+
+def _patch_client(monkeypatch: pytest.MonkeyPatch, fake: _FakeExperimentsClient) -> None:
+    monkeypatch.setattr(trust_experiments_client, "TrustExperimentsClient", lambda **_: fake)
+
+
+def test_variation_app_ids_follow_short_pages(monkeypatch: pytest.MonkeyPatch) -> None:
+    fake = _FakeExperimentsClient(list(range(1000, 1012)), page_limit=5)
+    _patch_client(monkeypatch, fake)
+
+    app_ids = sweep.experiment_variation_app_ids(None, 42, 7, "SENDER")  # type: ignore[arg-type]
+
+    assert app_ids == list(range(1000, 1012))
+    assert [start for _, start, _ in fake.calls] == [0, 5, 10]
+    assert all(exp_id == 7 for exp_id, _, _ in fake.calls)
+
+
+def test_variation_app_ids_empty_experiment(monkeypatch: pytest.MonkeyPatch) -> None:
+    fake = _FakeExperimentsClient([], page_limit=5)
+    _patch_client(monkeypatch, fake)
+
+    assert sweep.experiment_variation_app_ids(None, 42, 7, "SENDER") == []  # type: ignore[arg-type]
+    assert fake.calls == []
+
+
+def test_variation_app_ids_empty_page_fails(monkeypatch: pytest.MonkeyPatch) -> None:
+    fake = _FakeExperimentsClient([1000, 1001], page_limit=0)
+    _patch_client(monkeypatch, fake)
+
+    with pytest.raises(RuntimeError, match="no variation at var_id 0"):
+        sweep.experiment_variation_app_ids(None, 42, 7, "SENDER")  # type: ignore[arg-type]
+
+
+def test_variation_app_ids_missing_experiment_fails(monkeypatch: pytest.MonkeyPatch) -> None:
+    fake = _FakeExperimentsClient([1000], page_limit=5)
+    fake.missing = True
+    _patch_client(monkeypatch, fake)
+
+    with pytest.raises(RuntimeError, match="no experiment 7"):
+        sweep.experiment_variation_app_ids(None, 42, 7, "SENDER")  # type: ignore[arg-type]
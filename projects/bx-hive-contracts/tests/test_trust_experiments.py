@@ -1,10 +1,27 @@
-from collections.abc import Iterator
+import contextvars
+import hashlib
+import threading
+from collections.abc import Callable, Iterator
+from types import SimpleNamespace
 
+import algokit_utils
 import pytest
-from algopy import Application, arc4
+from algopy import Application, Bytes, UInt64, arc4
 from algopy_testing import AlgopyTestContext, algopy_testing_context
 
-from smart_contracts.trust_experiments.contract import TrustExperiments
+from smart_contracts.shared.events import TreasuryDeposited, TreasuryWithdrawn
+from smart_contracts.shared.types import ExperimentGroup, VariationInfo, VariationParams
+from smart_contracts.trust_experiments.contract import (
+    MAX_VARIATIONS_PER_CALL,
+    PROGRAM_APPROVAL,
+    PROGRAM_CLEAR,
+    TrustExperiments,
+)
+from smart_contracts.trust_experiments.deploy_config import (
+    trust_variation_artifacts,
+    trust_variation_program_hash,
+    upload_trust_variation_program,
+)
 
 REGISTRY_APP_ID = 0
 
@@ -161,6 +178,437 @@ def test_create_variation_not_owner_fails(context: AlgopyTestContext) -> None:
             )
 
 
+# -------------------------------------------------------------------------
+# chunked program upload
+# -------------------------------------------------------------------------
+
+# Larger than one 4,096-byte hash chunk so finalize hashes several slices
+APPROVAL = bytes(range(256)) * 20
+CLEAR = b"\x0a\x81\x01\x43"
+
+
+def _begin_upload(ctx: AlgopyTestContext, contract: TrustExperiments, mbr: int = 10_000_000) -> None:
+    app_addr = ctx.ledger.get_app(contract.__app_id__).address
+    mbr_pay = ctx.any.txn.payment(receiver=app_addr, amount=mbr)
+    contract.begin_trust_variation_upload(arc4.UInt64(len(APPROVAL)), arc4.UInt64(len(CLEAR)), mbr_pay)
+
+
+def _write_program(contract: TrustExperiments, chunk_size: int = 2_000) -> None:
+    for kind, program in ((PROGRAM_APPROVAL, APPROVAL), (PROGRAM_CLEAR, CLEAR)):
+        # Out of order on purpose: chunks are independent
+        for offset in reversed(range(0, len(program), chunk_size)):
+            contract.write_trust_variation_chunk(
+                arc4.UInt8(kind), arc4.UInt64(offset), Bytes(program[offset : offset + chunk_size])
+            )
+
+
+def test_chunked_upload_finalize_records_version(context: AlgopyTestContext) -> None:
+    contract = _make_experiments(context)
+    _begin_upload(context, contract)
+    _write_program(contract)
+
+    version = contract.finalize_trust_variation_program(Bytes(trust_variation_program_hash(APPROVAL, CLEAR)))
+
+    assert version == arc4.UInt64(1)
+    assert contract.tv_ready.value == 1
+    # Box values above 4 KB cannot be read back as one Bytes, so compare raw box contents
+    assert context.ledger.get_box(contract, b"tv_approval") == APPROVAL
+    assert context.ledger.get_box(contract, b"tv_clear") == CLEAR
+    assert contract.tv_hash.value == Bytes(trust_variation_program_hash(APPROVAL, CLEAR))
+
+
+def test_chunked_upload_resume_bumps_version(context: AlgopyTestContext) -> None:
+    contract = _make_experiments(context)
+    _begin_upload(context, contract)
+    _write_program(contract)
+    contract.finalize_trust_variation_program(Bytes(trust_variation_program_hash(APPROVAL, CLEAR)))
+
+    # Same sizes: begin keeps the bytes, so finalize succeeds without rewriting
+    _begin_upload(context, contract, mbr=0)
+    assert contract.tv_ready.value == 0
+    version = contract.finalize_trust_variation_program(Bytes(trust_variation_program_hash(APPROVAL, CLEAR)))
+
+    assert version == arc4.UInt64(2)
+
+
+def test_chunked_upload_hash_mismatch_fails(context: AlgopyTestContext) -> None:
+    contract = _make_experiments(context)
+    _begin_upload(context, contract)
+    _write_program(contract)
+    contract.write_trust_variation_chunk(arc4.UInt8(PROGRAM_APPROVAL), arc4.UInt64(0), Bytes(b"\xff"))
+
+    with pytest.raises(Exception, match="Program hash mismatch"):
+        contract.finalize_trust_variation_program(Bytes(trust_variation_program_hash(APPROVAL, CLEAR)))
+
+
+class _UploadGroup:
+    """Stands in for a TrustExperimentsComposer, calling the contract on send()."""
+
+    def __init__(self, client: "_UploadClient") -> None:
+        self._client = client
+        self._calls: list[Callable[[], object]] = []
+
+    def write_trust_variation_chunk(self, args: tuple[int, int, bytes], **_: object) -> "_UploadGroup":
+        kind, offset, chunk = args
+        self._calls.append(
+            lambda: self._client.contract.write_trust_variation_chunk(
+                arc4.UInt8(kind), arc4.UInt64(offset), Bytes(chunk)
+            )
+        )
+        return self
+
+    def finalize_trust_variation_program(self, args: tuple[bytes], **_: object) -> "_UploadGroup":
+        self._calls.append(lambda: self._client.contract.finalize_trust_variation_program(Bytes(args[0])))
+        return self
+
+    def send(self) -> None:
+        self._client.run(self._calls)
+
+
+class _UploadClient:
+    """Minimal TrustExperimentsClient + AlgorandClient pair for upload_trust_variation_program.
+
+    The uploader sends write groups from worker threads, so calls re-enter the
+    test context (held in a ContextVar) and run one at a time.
+    """
+
+    def __init__(self, ctx: AlgopyTestContext, contract: TrustExperiments) -> None:
+        self.ctx = ctx
+        self.contract = contract
+        self.app_id = contract.__app_id__
+        self.app_address = ctx.ledger.get_app(contract.__app_id__).address
+        self.chunks_written = 0
+        self._context = contextvars.copy_context()
+        self._lock = threading.Lock()
+        self.app = self
+        self.send = self
+        self.create_transaction = self
+
+    def run(self, calls: list[Callable[[], object]]) -> None:
+        with self._lock:
+            for call in calls:
+                self._context.copy().run(call)
+            self.chunks_written += len(calls)
+
+    # algorand.app
+    def get_global_state(self, _app_id: int) -> dict[str, SimpleNamespace]:
+        # Like algod, unset keys are left out
+        state = {
+            "tv_ready": SimpleNamespace(value=int(self.contract.tv_ready.value)),
+            "tv_version": SimpleNamespace(value=int(self.contract.tv_version.value)),
+        }
+        tv_hash, exists = self.contract.tv_hash.maybe()
+        if exists:
+            state["tv_hash"] = SimpleNamespace(value_raw=tv_hash.value)
+        return state
+
+    def get_box_names(self, _app_id: int) -> list[SimpleNamespace]:
+        names = (b"tv_approval", b"tv_clear")
+        return [SimpleNamespace(name_raw=n) for n in names if self.ctx.ledger.box_exists(self.contract, n)]
+
+    def get_box_value(self, _app_id: int, name: bytes) -> bytes:
+        return self.ctx.ledger.get_box(self.contract, name)
+
+    # algorand.create_transaction
+    def payment(self, params: algokit_utils.PaymentParams) -> object:
+        return self.ctx.any.txn.payment(receiver=self.app_address, amount=params.amount.micro_algo)
+
+    # app_client.send / app_client.new_group
+    def begin_trust_variation_upload(self, args: tuple[int, int, object]) -> None:
+        approval_len, clear_len, mbr_payment = args
+        self.contract.begin_trust_variation_upload(arc4.UInt64(approval_len), arc4.UInt64(clear_len), mbr_payment)
+
+    def new_group(self) -> _UploadGroup:
+        return _UploadGroup(self)
+
+
+def test_deploy_upload_round_trips_through_finalize(context: AlgopyTestContext) -> None:
+    contract = _make_experiments(context)
+    client = _UploadClient(context, contract)
+    sender = context.default_sender.public_key
+
+    upload_trust_variation_program(client, client, sender, APPROVAL, CLEAR)  # type: ignore[arg-type]
+
+    assert contract.tv_ready.value == 1
+    assert contract.tv_version.value == 1
+    assert contract.tv_hash.value == Bytes(trust_variation_program_hash(APPROVAL, CLEAR))
+    assert context.ledger.get_box(contract, b"tv_approval") == APPROVAL
+
+
+def test_deploy_upload_resends_only_changed_chunks(context: AlgopyTestContext) -> None:
+    contract = _make_experiments(context)
+    client = _UploadClient(context, contract)
+    sender = context.default_sender.public_key
+    upload_trust_variation_program(client, client, sender, APPROVAL, CLEAR)  # type: ignore[arg-type]
+
+    # Unchanged program: nothing is sent and the version stays put
+    client.chunks_written = 0
+    upload_trust_variation_program(client, client, sender, APPROVAL, CLEAR)  # type: ignore[arg-type]
+    assert client.chunks_written == 0
+    assert contract.tv_version.value == 1
+
+    # One byte changed in the last approval chunk: that chunk plus the finalize group
+    updated = APPROVAL[:-1] + b"\x00"
+    upload_trust_variation_program(client, client, sender, updated, CLEAR)  # type: ignore[arg-type]
+    assert client.chunks_written == 1 + 2
+    assert contract.tv_version.value == 2
+    assert contract.tv_hash.value == Bytes(trust_variation_program_hash(updated, CLEAR))
+    assert context.ledger.get_box(contract, b"tv_approval") == updated
+
+
+def test_deploy_uploads_the_committed_trust_variation_artifacts() -> None:
+    artifact_path = trust_variation_artifacts()
+
+    assert artifact_path.parts[-2:] == ("artifacts", "trust_variation")
+    assert (artifact_path / "TrustVariation.approval.teal").is_file()
+    assert (artifact_path / "TrustVariation.clear.teal").is_file()
+
+
+def test_begin_upload_insufficient_mbr_fails(context: AlgopyTestContext) -> None:
+    contract = _make_experiments(context)
+    with pytest.raises(Exception, match="Insufficient MBR"):
+        _begin_upload(context, contract, mbr=1_000)
+
+
+def test_write_chunk_unknown_kind_fails(context: AlgopyTestContext) -> None:
+    contract = _make_experiments(context)
+    _begin_upload(context, contract)
+    with pytest.raises(Exception, match="Unknown program kind"):
+        contract.write_trust_variation_chunk(arc4.UInt8(2), arc4.UInt64(0), Bytes(b"\x00"))
+
+
+def test_create_variation_before_finalize_fails(context: AlgopyTestContext) -> None:
+    contract = _make_experiments(context)
+    exp_id = contract.create_experiment(arc4.String("Alpha"))
+    _begin_upload(context, contract)
+    _write_program(contract)
+    app_addr = context.ledger.get_app(contract.__app_id__).address
+    mbr_pay = context.any.txn.payment(receiver=app_addr, amount=100_000)
+    escrow_pay = context.any.txn.payment(receiver=app_addr, amount=1_000)
+
+    with pytest.raises(Exception, match="TrustVariation program not set"):
+        contract.create_variations(exp_id, arc4.DynamicArray(_params(1_000)), mbr_pay, escrow_pay)
+
+
+# -------------------------------------------------------------------------
+# create_variations error paths
+# -------------------------------------------------------------------------
+
+
+def _params(escrow: int, asset_id: int = 0) -> VariationParams:
+    return VariationParams(
+        label=arc4.String("cell"),
+        e1=arc4.UInt64(100),
+        e2=arc4.UInt64(50),
+        multiplier=arc4.UInt64(3),
+        unit=arc4.UInt64(10),
+        asset_id=arc4.UInt64(asset_id),
+        max_participants=arc4.UInt64(0),
+        escrow=arc4.UInt64(escrow),
+    )
+
+
+def _create_variations(
+    ctx: AlgopyTestContext,
+    contract: TrustExperiments,
+    configs: list[VariationParams],
+    mbr: int,
+    escrow: int,
+) -> arc4.DynamicArray[arc4.UInt64]:
+    """Call create_variations on a fresh experiment with a stub program set."""
+    exp_id = contract.create_experiment(arc4.String("Factorial"))
+    contract.tv_approval.value = Bytes(b"\x0a")
+    contract.tv_clear.value = Bytes(b"\x0a")
+    contract.tv_ready.value = UInt64(1)
+    app_addr = ctx.ledger.get_app(contract.__app_id__).address
+    mbr_pay = ctx.any.txn.payment(receiver=app_addr, amount=mbr)
+    escrow_pay = ctx.any.txn.payment(receiver=app_addr, amount=escrow)
+    return contract.create_variations(exp_id, arc4.DynamicArray(*configs), mbr_pay, escrow_pay)
+
+
+def test_create_variations_program_not_set_fails(context: AlgopyTestContext) -> None:
+    contract = _make_experiments(context)
+    exp_id = contract.create_experiment(arc4.String("Factorial"))
+    app_addr = context.ledger.get_app(contract.__app_id__).address
+    mbr_pay = context.any.txn.payment(receiver=app_addr, amount=100_000)
+    escrow_pay = context.any.txn.payment(receiver=app_addr, amount=1_000)
+    with pytest.raises(Exception, match="TrustVariation program not set"):
+        contract.create_variations(exp_id, arc4.DynamicArray(_params(1_000)), mbr_pay, escrow_pay)
+
+
+def test_create_variations_mixed_assets_fails(context: AlgopyTestContext) -> None:
+    contract = _make_experiments(context)
+    with pytest.raises(Exception, match="Mixed payout assets"):
+        _create_variations(context, contract, [_params(1_000), _params(1_000, asset_id=7)], 300_000, 2_000)
+
+
+def test_create_variations_insufficient_mbr_fails(context: AlgopyTestContext) -> None:
+    contract = _make_experiments(context)
+    with pytest.raises(Exception, match="Insufficient MBR"):
+        _create_variations(context, contract, [_params(1_000), _params(1_000)], 100_000, 2_000)
+
+
+def test_create_variations_escrow_mismatch_fails(context: AlgopyTestContext) -> None:
+    contract = _make_experiments(context)
+    with pytest.raises(Exception, match="Escrow must equal config total"):
+        _create_variations(context, contract, [_params(1_000), _params(2_000)], 200_000, 2_000)
+
+
+def test_create_variations_over_log_limit_fails(context: AlgopyTestContext) -> None:
+    """One VariationCreated log per variation plus the return log must fit in 32 logs."""
+    contract = _make_experiments(context)
+    count = MAX_VARIATIONS_PER_CALL + 1
+    with pytest.raises(Exception, match="Too many configs"):
+        _create_variations(context, contract, [_params(1_000)] * count, 100_000 * count, 1_000 * count)
+
+
+# -------------------------------------------------------------------------
+# experiment treasury
+# -------------------------------------------------------------------------
+
+
+def _deposit_treasury(
+    ctx: AlgopyTestContext, contract: TrustExperiments, exp_id: arc4.UInt32, amount: int
+) -> None:
+    app_addr = ctx.ledger.get_app(contract.__app_id__).address
+    funding = ctx.any.txn.payment(receiver=app_addr, amount=amount)
+    contract.deposit_treasury(exp_id, arc4.UInt64(0), funding)
+
+
+def test_deposit_treasury_accumulates(context: AlgopyTestContext) -> None:
+    contract = _make_experiments(context)
+    exp_id = contract.create_experiment(arc4.String("Alpha"))
+    _deposit_treasury(context, contract, exp_id, 5_000)
+    _deposit_treasury(context, contract, exp_id, 2_000)
+
+    treasury = contract.get_treasury(exp_id)
+    assert treasury.asset_id == arc4.UInt64(0)
+    assert treasury.balance == arc4.UInt64(7_000)
+
+
+def test_deposit_treasury_wrong_asset_fails(context: AlgopyTestContext) -> None:
+    contract = _make_experiments(context)
+    exp_id = contract.create_experiment(arc4.String("Alpha"))
+    _deposit_treasury(context, contract, exp_id, 5_000)
+
+    asa = context.any.asset()
+    app_addr = context.ledger.get_app(contract.__app_id__).address
+    funding = context.any.txn.asset_transfer(asset_receiver=app_addr, xfer_asset=asa, asset_amount=10)
+    with pytest.raises(Exception, match="Wrong asset"):
+        contract.deposit_treasury(exp_id, arc4.UInt64(int(asa.id)), funding)
+
+
+def test_withdraw_treasury(context: AlgopyTestContext) -> None:
+    contract = _make_experiments(context)
+    exp_id = contract.create_experiment(arc4.String("Alpha"))
+    _deposit_treasury(context, contract, exp_id, 5_000)
+
+    contract.withdraw_treasury(exp_id, arc4.UInt64(3_000))
+
+    # Read the inner payment before get_treasury starts a new group
+    payment = context.txn.last_group.last_itxn.payment
+    assert payment.receiver == context.default_sender
+    assert payment.amount == 3_000
+    assert contract.get_treasury(exp_id).balance == arc4.UInt64(2_000)
+
+
+def test_withdraw_treasury_insufficient_fails(context: AlgopyTestContext) -> None:
+    contract = _make_experiments(context)
+    exp_id = contract.create_experiment(arc4.String("Alpha"))
+    _deposit_treasury(context, contract, exp_id, 1_000)
+
+    with pytest.raises(Exception, match="Insufficient treasury"):
+        contract.withdraw_treasury(exp_id, arc4.UInt64(1_001))
+
+
+def _event_log(signature: str, event: arc4.Struct) -> Bytes:
+    """The log arc4.emit writes: sha512_256(signature)[:4] + the encoded struct."""
+    return Bytes(hashlib.new("sha512_256", signature.encode()).digest()[:4]) + event.bytes
+
+
+def _last_logs(ctx: AlgopyTestContext) -> list[Bytes]:
+    txn = ctx.txn.last_active
+    return [txn.logs(i) for i in range(txn.num_logs)]
+
+
+def test_deposit_treasury_emits_treasury_deposited(context: AlgopyTestContext) -> None:
+    contract = _make_experiments(context)
+    exp_id = contract.create_experiment(arc4.String("Alpha"))
+    _deposit_treasury(context, contract, exp_id, 5_000)
+    _deposit_treasury(context, contract, exp_id, 2_000)
+
+    assert _last_logs(context) == [
+        _event_log(
+            "TreasuryDeposited(uint32,uint64,uint64)",
+            TreasuryDeposited(exp_id=exp_id, amount=arc4.UInt64(2_000), balance=arc4.UInt64(7_000)),
+        )
+    ]
+
+
+def test_withdraw_treasury_emits_treasury_withdrawn(context: AlgopyTestContext) -> None:
+    contract = _make_experiments(context)
+    exp_id = contract.create_experiment(arc4.String("Alpha"))
+    _deposit_treasury(context, contract, exp_id, 5_000)
+
+    contract.withdraw_treasury(exp_id, arc4.UInt64(3_000))
+
+    assert _last_logs(context) == [
+        _event_log(
+            "TreasuryWithdrawn(uint32,uint64,uint64)",
+            TreasuryWithdrawn(exp_id=exp_id, amount=arc4.UInt64(3_000), balance=arc4.UInt64(2_000)),
+        )
+    ]
+
+
+def test_draw_escrow_pays_the_variation_app(context: AlgopyTestContext) -> None:
+    contract = _make_experiments(context)
+    exp_id = contract.create_experiment(arc4.String("Alpha"))
+    _deposit_treasury(context, contract, exp_id, 1_000)
+    _seed_variations(contract, exp_id, ["a"])
+    variation_app = context.any.application(id=1000)
+    context.ledger.patch_global_fields(caller_application_id=variation_app.id)
+
+    contract.draw_escrow(exp_id, arc4.UInt32(0), arc4.UInt64(400))
+
+    payment = context.txn.last_group.last_itxn.payment
+    assert payment.receiver == variation_app.address
+    assert payment.amount == 400
+    assert contract.get_treasury(exp_id).balance == arc4.UInt64(600)
+
+
+def test_draw_escrow_insufficient_treasury_fails(context: AlgopyTestContext) -> None:
+    contract = _make_experiments(context)
+    exp_id = contract.create_experiment(arc4.String("Alpha"))
+    _deposit_treasury(context, contract, exp_id, 300)
+    _seed_variations(contract, exp_id, ["a"])
+    context.ledger.patch_global_fields(caller_application_id=context.any.application(id=1000).id)
+
+    with pytest.raises(Exception, match="Insufficient treasury"):
+        contract.draw_escrow(exp_id, arc4.UInt32(0), arc4.UInt64(400))
+
+
+def test_draw_escrow_from_non_variation_fails(context: AlgopyTestContext) -> None:
+    contract = _make_experiments(context)
+    exp_id = contract.create_experiment(arc4.String("Alpha"))
+    _deposit_treasury(context, contract, exp_id, 1_000)
+    _seed_variations(contract, exp_id, ["a"])
+
+    with pytest.raises(Exception, match="Not the variation app"):
+        contract.draw_escrow(exp_id, arc4.UInt32(0), arc4.UInt64(100))
+
+
+def test_create_treasury_variation_with_escrow_fails(context: AlgopyTestContext) -> None:
+    contract = _make_experiments(context)
+    exp_id = contract.create_experiment(arc4.String("Alpha"))
+    _deposit_treasury(context, contract, exp_id, 1_000)
+    contract.tv_ready.value = UInt64(1)
+    app_addr = context.ledger.get_app(contract.__app_id__).address
+    mbr_pay = context.any.txn.payment(receiver=app_addr, amount=100_000)
+
+    with pytest.raises(Exception, match="Treasury variations hold no escrow"):
+        contract.create_treasury_variation(exp_id, _params(500), mbr_pay)
+
+
 # -------------------------------------------------------------------------
 # opt_in_to_asset
 # -------------------------------------------------------------------------
@@ -210,4 +658,131 @@ def test_opt_in_to_asset_insufficient_mbr_fails(context: AlgopyTestContext) -> N
 def test_get_variation_not_found_fails(context: AlgopyTestContext) -> None:
     contract = _make_experiments(context)
     with pytest.raises(Exception, match="Variation not found"):
-        contract.get_variation(arc4.UInt32(0), arc4.UInt32(0))
\ No newline at end of file
+        contract.get_variation(arc4.UInt32(0), arc4.UInt32(0))
+
+# -------------------------------------------------------------------------
+# get_experiments_by_owner
+# -------------------------------------------------------------------------
+
+
+def test_get_experiments_by_owner(context: AlgopyTestContext) -> None:
+    contract = _make_experiments(context)
+    contract.create_experiment(arc4.String("Mine A"))
+
+    other = context.any.account()
+    app_call = context.any.txn.application_call(sender=other, app_id=Application(contract.__app_id__))
+    with context.txn.create_group(gtxns=[app_call], active_txn_index=0):
+        contract.create_experiment(arc4.String("Theirs"))
+
+    contract.create_experiment(arc4.String("Mine B"))
+
+    mine = contract.get_experiments_by_owner(context.default_sender, arc4.UInt32(0), arc4.UInt32(10))
+    assert [e.name.native for e in mine] == ["Mine A", "Mine B"]
+    assert [e.exp_id for e in mine] == [arc4.UInt32(0), arc4.UInt32(2)]
+
+    theirs = contract.get_experiments_by_owner(other, arc4.UInt32(0), arc4.UInt32(10))
+    assert [e.name.native for e in theirs] == ["Theirs"]
+
+
+def test_get_experiments_by_owner_pages(context: AlgopyTestContext) -> None:
+    contract = _make_experiments(context)
+    for name in ["a", "b", "c"]:
+        contract.create_experiment(arc4.String(name))
+
+    page = contract.get_experiments_by_owner(context.default_sender, arc4.UInt32(1), arc4.UInt32(5))
+
+    assert [e.name.native for e in page] == ["b", "c"]
+
+
+def test_get_experiments_by_owner_unknown_is_empty(context: AlgopyTestContext) -> None:
+    contract = _make_experiments(context)
+    page = contract.get_experiments_by_owner(context.any.account(), arc4.UInt32(0), arc4.UInt32(5))
+    assert page.length == 0
+
+
+# -------------------------------------------------------------------------
+# get_variations
+# -------------------------------------------------------------------------
+
+
+def _seed_variations(contract: TrustExperiments, exp_id: arc4.UInt32, labels: list[str]) -> None:
+    """Write variation boxes directly (spawning needs a real TrustVariation program)."""
+    for var_id, label in enumerate(labels):
+        key = arc4.UInt64(exp_id.native * 2**32 + var_id)
+        contract.variations[key] = VariationInfo(
+            var_id=arc4.UInt32(var_id),
+            app_id=arc4.UInt64(1000 + var_id),
+            label=arc4.String(label),
+            created_at=arc4.UInt64(0),
+        )
+        contract.variation_apps[arc4.UInt64(1000 + var_id)] = key
+    experiment = contract.experiments[exp_id]
+    contract.experiments[exp_id] = ExperimentGroup(
+        exp_id=experiment.exp_id,
+        owner=experiment.owner,
+        name=experiment.name,
+        created_at=experiment.created_at,
+        variation_count=arc4.UInt64(len(labels)),
+    )
+
+
+def test_get_variations_page(context: AlgopyTestContext) -> None:
+    contract = _make_experiments(context)
+    exp_id = contract.create_experiment(arc4.String("Alpha"))
+    _seed_variations(contract, exp_id, ["a", "b", "c", "d"])
+
+    page = contract.get_variations(exp_id, arc4.UInt32(1), arc4.UInt32(2))
+
+    assert [v.label.native for v in page] == ["b", "c"]
+    assert page[0].app_id == arc4.UInt64(1001)
+
+
+def test_get_variations_stops_at_variation_count(context: AlgopyTestContext) -> None:
+    contract = _make_experiments(context)
+    exp_id = contract.create_experiment(arc4.String("Alpha"))
+    _seed_variations(contract, exp_id, ["a", "b", "c"])
+
+    page = contract.get_variations(exp_id, arc4.UInt32(2), arc4.UInt32(10))
+
+    assert page.length == 1
+
+
+def test_get_variations_caps_encoded_size(context: AlgopyTestContext) -> None:
+    contract = _make_experiments(context)
+    exp_id = contract.create_experiment(arc4.String("Alpha"))
+    # 24 fixed bytes + 300-byte label + 2-byte offset = 326 bytes each; 3 fit in 1,020
+    _seed_variations(contract, exp_id, ["x" * 300] * 5)
+
+    page = contract.get_variations(exp_id, arc4.UInt32(0), arc4.UInt32(5))
+
+    assert page.length == 3
+
+
+def test_get_variations_experiment_not_found_fails(context: AlgopyTestContext) -> None:
+    contract = _make_experiments(context)
+    with pytest.raises(Exception, match="Experiment not found"):
+        contract.get_variations(arc4.UInt32(0), arc4.UInt32(0), arc4.UInt32(1))
+
+
+# -------------------------------------------------------------------------
+# get_variation_by_app
+# -------------------------------------------------------------------------
+
+
+def test_get_variation_by_app(context: AlgopyTestContext) -> None:
+    contract = _make_experiments(context)
+    contract.create_experiment(arc4.String("Alpha"))
+    exp_id = contract.create_experiment(arc4.String("Beta"))
+    _seed_variations(contract, exp_id, ["control", "treatment"])
+
+    found_exp_id, info = contract.get_variation_by_app(arc4.UInt64(1001))
+
+    assert found_exp_id == arc4.UInt32(1)
+    assert info.var_id == arc4.UInt32(1)
+    assert info.label.native == "treatment"
+
+
+def test_get_variation_by_app_unknown_fails(context: AlgopyTestContext) -> None:
+    contract = _make_experiments(context)
+    with pytest.raises(Exception, match="Variation not found"):
+        contract.get_variation_by_app(arc4.UInt64(42))
@@ -1,18 +1,47 @@
+import hashlib
 from collections.abc import Iterator
 
 import pytest
-from algopy import Account, Application, UInt64, arc4
+from algopy import Account, Application, Bytes, UInt64, arc4
 from algopy_testing import AlgopyTestContext, algopy_testing_context
 
+from smart_contracts.registry.membership import member_proof, member_root
+from smart_contracts.shared.events import (
+    MatchCreated,
+    MatchesCreated,
+    MatchPaidOut,
+    ParticipantEnrolled,
+    ParticipantsEnrolled,
+    TrusteeDecided,
+)
 from smart_contracts.shared.types import (
     PHASE_COMPLETED,
     PHASE_INVESTOR_DECISION,
     PHASE_TRUSTEE_DECISION,
+    ROLE_PARTICIPANT,
+    SETTLEMENT_CLAIM,
+    SETTLEMENT_DEFERRED,
     STATUS_ACTIVE,
     STATUS_CLOSED,
     STATUS_COMPLETED,
+    ParticipantInfo,
+    User,
+)
+from smart_contracts.trust_variation.contract import (
+    CLAIM_MBR,
+    MATCH_MBR,
+    MATCHES_PAGE_SIZE,
+    MAX_SETTLE_PER_CALL,
+    ORDER_BOX_MBR,
+    PARTICIPANT_MBR,
+    ROSTER_BOX_MBR,
+    ROSTER_BYTE_MBR,
+    ROSTER_ENROLLED,
+    SWEEP_ENROLLMENT_ORDER,
+    SWEEP_MATCHES,
+    SWEEP_PARTICIPANTS,
+    TrustVariation,
 )
-from smart_contracts.trust_variation.contract import MATCH_MBR, PARTICIPANT_MBR, TrustVariation
 
 # Game parameters used across tests (simple round numbers)
 E1 = 100
@@ -20,6 +49,8 @@ E2 = 50
 MULTIPLIER = 3
 UNIT = 10
 ASSET_ID = 0  # ALGO
+GET_USER_SELECTOR = bytes.fromhex("6fad4a65")  # BxHiveRegistry get_user(address)
+ARC4_RETURN_PREFIX = bytes.fromhex("151f7c75")  # prefix of an ABI method's return log
 
 
 @pytest.fixture()
@@ -255,14 +286,32 @@ def test_create_match(context: AlgopyTestContext) -> None:
     assert match_id == arc4.UInt32(0)
     assert contract.match_count.value == 1
     assert match_id in contract.matches
-    assert contract.player_match[investor] == arc4.UInt32(0)
-    assert contract.player_match[trustee] == arc4.UInt32(0)
+    assert contract.participants[investor].match_id == arc4.UInt32(0)
+    assert contract.participants[trustee].match_id == arc4.UInt32(0)
+    assert contract.get_player_match(investor) == arc4.UInt32(0)
+    assert contract.get_player_match(trustee) == arc4.UInt32(0)
 
     match = contract.matches[match_id].copy()
     assert match.phase == arc4.UInt8(PHASE_INVESTOR_DECISION)
     assert match.paid_out == arc4.UInt8(0)
 
 
+def test_get_player_match_unassigned_fails(context: AlgopyTestContext) -> None:
+    contract = _make_variation(context)
+    investor, _, _ = _add_participants(context, contract)
+
+    with pytest.raises(Exception, match="No active match"):
+        contract.get_player_match(investor)
+
+
+def test_get_player_match_not_enrolled_fails(context: AlgopyTestContext) -> None:
+    contract = _make_variation(context)
+    stranger = arc4.Address(context.any.account())
+
+    with pytest.raises(Exception, match="No active match"):
+        contract.get_player_match(stranger)
+
+
 def test_create_match_unenrolled_investor_fails(context: AlgopyTestContext) -> None:
     contract = _make_variation(context)
     _, trustee, _ = _add_participants(context, contract)
@@ -287,6 +336,296 @@ def test_create_match_already_assigned_fails(context: AlgopyTestContext) -> None
         _create_match(context, contract, investor.copy(), third.copy())
 
 
+# -------------------------------------------------------------------------
+# create_matches
+# -------------------------------------------------------------------------
+
+
+def _enroll(ctx: AlgopyTestContext, contract: TrustVariation, count: int) -> list[arc4.Address]:
+    """Enroll `count` fresh accounts via add_participants and return their addresses."""
+    addrs = [arc4.Address(ctx.any.account()) for _ in range(count)]
+    participants: arc4.DynamicArray[arc4.Address] = arc4.DynamicArray(*(a.copy() for a in addrs))
+    app_addr = ctx.ledger.get_app(contract.__app_id__).address
+    mbr = PARTICIPANT_MBR + (ORDER_BOX_MBR if contract.auto_match_enabled.value else 0)
+    mbr_pay = ctx.any.txn.payment(receiver=app_addr, amount=mbr * count)
+    contract.add_participants(participants, mbr_pay)
+    return addrs
+
+
+def _pairs(
+    *pairs: tuple[arc4.Address, arc4.Address],
+) -> arc4.DynamicArray[arc4.Tuple[arc4.Address, arc4.Address]]:
+    return arc4.DynamicArray(*(arc4.Tuple((inv.copy(), tru.copy())) for inv, tru in pairs))
+
+
+def test_create_matches(context: AlgopyTestContext) -> None:
+    contract = _make_variation(context)
+    a, b, c, d = _enroll(context, contract, 4)
+    app_addr = context.ledger.get_app(contract.__app_id__).address
+    mbr_pay = context.any.txn.payment(receiver=app_addr, amount=MATCH_MBR * 2)
+
+    first_id = contract.create_matches(_pairs((a, b), (c, d)), mbr_pay)
+
+    assert first_id == arc4.UInt32(0)
+    assert contract.match_count.value == 2
+    assert contract.matches[arc4.UInt32(0)].investor == a
+    assert contract.matches[arc4.UInt32(0)].trustee == b
+    assert contract.matches[arc4.UInt32(1)].investor == c
+    assert contract.matches[arc4.UInt32(1)].trustee == d
+    assert contract.participants[d].assigned == arc4.UInt8(1)
+
+
+def test_create_matches_insufficient_mbr_fails(context: AlgopyTestContext) -> None:
+    contract = _make_variation(context)
+    a, b, c, d = _enroll(context, contract, 4)
+    app_addr = context.ledger.get_app(contract.__app_id__).address
+    mbr_pay = context.any.txn.payment(receiver=app_addr, amount=MATCH_MBR)
+
+    with pytest.raises(Exception, match="Insufficient MBR"):
+        contract.create_matches(_pairs((a, b), (c, d)), mbr_pay)
+
+
+def test_create_matches_duplicate_participant_fails(context: AlgopyTestContext) -> None:
+    contract = _make_variation(context)
+    a, b, c = _enroll(context, contract, 3)
+    app_addr = context.ledger.get_app(contract.__app_id__).address
+    mbr_pay = context.any.txn.payment(receiver=app_addr, amount=MATCH_MBR * 2)
+
+    with pytest.raises(Exception, match="Investor already assigned"):
+        contract.create_matches(_pairs((a, b), (a, c)), mbr_pay)
+
+
+# -------------------------------------------------------------------------
+# auto_match
+# -------------------------------------------------------------------------
+
+
+def _auto_match(ctx: AlgopyTestContext, contract: TrustVariation, n: int) -> arc4.UInt64:
+    app_addr = ctx.ledger.get_app(contract.__app_id__).address
+    mbr_pay = ctx.any.txn.payment(receiver=app_addr, amount=MATCH_MBR * (n // 2))
+    return contract.auto_match(arc4.UInt64(n), mbr_pay)
+
+
+def _make_auto_match_variation(ctx: AlgopyTestContext) -> TrustVariation:
+    contract = _make_variation(ctx)
+    contract.enable_auto_match()
+    return contract
+
+
+def test_add_participants_records_enrollment_order(context: AlgopyTestContext) -> None:
+    contract = _make_auto_match_variation(context)
+    a, b = _enroll(context, contract, 2)
+
+    assert contract.enrollment_order[arc4.UInt32(0)] == a
+    assert contract.enrollment_order[arc4.UInt32(1)] == b
+
+
+def test_enrollment_order_not_recorded_without_auto_match(context: AlgopyTestContext) -> None:
+    contract = _make_variation(context)
+    _enroll(context, contract, 2)
+
+    assert arc4.UInt32(0) not in contract.enrollment_order
+    assert contract.participant_count.value == 2
+
+
+def test_auto_match_charges_order_box_mbr(context: AlgopyTestContext) -> None:
+    contract = _make_auto_match_variation(context)
+    app_addr = context.ledger.get_app(contract.__app_id__).address
+    mbr_pay = context.any.txn.payment(receiver=app_addr, amount=PARTICIPANT_MBR)
+
+    with pytest.raises(Exception, match="Insufficient MBR"):
+        contract.add_participants(arc4.DynamicArray(arc4.Address(context.any.account())), mbr_pay)
+
+
+def test_enable_auto_match_after_enrollment_fails(context: AlgopyTestContext) -> None:
+    contract = _make_variation(context)
+    _enroll(context, contract, 1)
+
+    with pytest.raises(Exception, match="Participants already enrolled"):
+        contract.enable_auto_match()
+
+
+def test_auto_match_not_enabled_fails(context: AlgopyTestContext) -> None:
+    contract = _make_variation(context)
+    _enroll(context, contract, 2)
+
+    with pytest.raises(Exception, match="Auto-match not enabled"):
+        _auto_match(context, contract, 2)
+
+
+def test_auto_match_pairs_in_enrollment_order(context: AlgopyTestContext) -> None:
+    contract = _make_auto_match_variation(context)
+    a, b, c, d = _enroll(context, contract, 4)
+
+    created = _auto_match(context, contract, 4)
+
+    assert created == arc4.UInt64(2)
+    assert contract.matches[arc4.UInt32(0)].investor == a
+    assert contract.matches[arc4.UInt32(0)].trustee == b
+    assert contract.matches[arc4.UInt32(1)].investor == c
+    assert contract.matches[arc4.UInt32(1)].trustee == d
+    assert contract.match_cursor.value == 4
+
+
+def test_auto_match_skips_manually_assigned(context: AlgopyTestContext) -> None:
+    contract = _make_auto_match_variation(context)
+    a, b, c, d = _enroll(context, contract, 4)
+    _create_match(context, contract, a.copy(), c.copy())
+
+    created = _auto_match(context, contract, 2)
+
+    assert created == arc4.UInt64(1)
+    assert contract.matches[arc4.UInt32(1)].investor == b
+    assert contract.matches[arc4.UInt32(1)].trustee == d
+
+
+def test_auto_match_odd_leftover_resumes(context: AlgopyTestContext) -> None:
+    contract = _make_auto_match_variation(context)
+    a, b, c = _enroll(context, contract, 3)
+
+    created = _auto_match(context, contract, 4)
+    assert created == arc4.UInt64(1)
+    assert contract.match_cursor.value == 2  # parked on c
+    assert contract.participants[c].assigned == arc4.UInt8(0)
+
+    (d,) = _enroll(context, contract, 1)
+    created = _auto_match(context, contract, 2)
+    assert created == arc4.UInt64(1)
+    assert contract.matches[arc4.UInt32(1)].investor == c
+    assert contract.matches[arc4.UInt32(1)].trustee == d
+    assert contract.match_cursor.value == 4
+
+
+def test_auto_match_odd_n_fails(context: AlgopyTestContext) -> None:
+    contract = _make_auto_match_variation(context)
+    _enroll(context, contract, 3)
+    app_addr = context.ledger.get_app(contract.__app_id__).address
+    mbr_pay = context.any.txn.payment(receiver=app_addr, amount=MATCH_MBR * 2)
+
+    with pytest.raises(Exception, match="n must be even"):
+        contract.auto_match(arc4.UInt64(3), mbr_pay)
+
+
+def test_auto_match_insufficient_mbr_fails(context: AlgopyTestContext) -> None:
+    contract = _make_auto_match_variation(context)
+    _enroll(context, contract, 4)
+    app_addr = context.ledger.get_app(contract.__app_id__).address
+    mbr_pay = context.any.txn.payment(receiver=app_addr, amount=MATCH_MBR)
+
+    with pytest.raises(Exception, match="Insufficient MBR"):
+        contract.auto_match(arc4.UInt64(4), mbr_pay)
+
+
+# -------------------------------------------------------------------------
+# roster bitmap (enroll_user_ids / create_match_by_ids)
+# -------------------------------------------------------------------------
+
+
+def _enroll_user_ids(
+    ctx: AlgopyTestContext, contract: TrustVariation, user_ids: list[int], amount: int
+) -> None:
+    app_addr = ctx.ledger.get_app(contract.__app_id__).address
+    ids: arc4.DynamicArray[arc4.UInt32] = arc4.DynamicArray(*(arc4.UInt32(i) for i in user_ids))
+    mbr_pay = ctx.any.txn.payment(receiver=app_addr, amount=amount)
+    contract.enroll_user_ids(ids, mbr_pay)
+
+
+def test_enroll_user_ids_sets_flags(context: AlgopyTestContext) -> None:
+    contract = _make_variation(context)
+    # ids 0..9 fit in 3 bitmap bytes
+    _enroll_user_ids(context, contract, [0, 5, 9], ROSTER_BOX_MBR + ROSTER_BYTE_MBR * 3)
+
+    assert contract.roster.length == 3
+    assert contract.roster_count.value == 3
+    assert contract.get_roster_flags(arc4.UInt32(5)) == arc4.UInt8(ROSTER_ENROLLED)
+    assert contract.get_roster_flags(arc4.UInt32(4)) == arc4.UInt8(0)
+    assert contract.get_roster_flags(arc4.UInt32(1000)) == arc4.UInt8(0)
+    # Roster users do not touch the p_ participant count
+    assert contract.participant_count.value == 0
+
+
+def test_enroll_user_ids_grows_bitmap(context: AlgopyTestContext) -> None:
+    contract = _make_variation(context)
+    _enroll_user_ids(context, contract, [1], ROSTER_BOX_MBR + ROSTER_BYTE_MBR)
+    # Growing from 1 to 26 bytes only charges the 25 added bytes
+    _enroll_user_ids(context, contract, [2, 100], ROSTER_BYTE_MBR * 25)
+
+    assert contract.roster.length == 26
+    assert contract.get_roster_flags(arc4.UInt32(1)) == arc4.UInt8(ROSTER_ENROLLED)
+    assert contract.get_roster_flags(arc4.UInt32(100)) == arc4.UInt8(ROSTER_ENROLLED)
+
+
+def test_enroll_user_ids_insufficient_mbr_fails(context: AlgopyTestContext) -> None:
+    contract = _make_variation(context)
+    with pytest.raises(Exception, match="Insufficient MBR"):
+        _enroll_user_ids(context, contract, [0, 40], ROSTER_BOX_MBR + ROSTER_BYTE_MBR * 10)
+
+
+def test_enroll_user_ids_duplicate_fails(context: AlgopyTestContext) -> None:
+    contract = _make_variation(context)
+    with pytest.raises(Exception, match="Already enrolled"):
+        _enroll_user_ids(context, contract, [3, 3], ROSTER_BOX_MBR + ROSTER_BYTE_MBR)
+
+
+def test_enroll_user_ids_not_owner_fails(context: AlgopyTestContext) -> None:
+    contract = _make_variation(context, owner=context.any.account())
+    with pytest.raises(Exception, match="Not owner"):
+        _enroll_user_ids(context, contract, [0], ROSTER_BOX_MBR + ROSTER_BYTE_MBR)
+
+
+def test_create_match_by_ids_unenrolled_fails(context: AlgopyTestContext) -> None:
+    """Roster flags are checked before the registry lookups, so this path needs no registry app."""
+    contract = _make_variation(context)
+    _enroll_user_ids(context, contract, [0], ROSTER_BOX_MBR + ROSTER_BYTE_MBR)
+    app_addr = context.ledger.get_app(contract.__app_id__).address
+    mbr_pay = context.any.txn.payment(receiver=app_addr, amount=MATCH_MBR)
+
+    with pytest.raises(Exception, match="Trustee not enrolled"):
+        contract.create_match_by_ids(
+            arc4.UInt32(0),
+            arc4.Address(context.any.account()),
+            arc4.UInt32(1),
+            arc4.Address(context.any.account()),
+            mbr_pay,
+        )
+
+
+def test_create_match_by_ids_same_player_fails(context: AlgopyTestContext) -> None:
+    contract = _make_variation(context)
+    _enroll_user_ids(context, contract, [0], ROSTER_BOX_MBR + ROSTER_BYTE_MBR)
+    app_addr = context.ledger.get_app(contract.__app_id__).address
+    mbr_pay = context.any.txn.payment(receiver=app_addr, amount=MATCH_MBR)
+    addr = arc4.Address(context.any.account())
+
+    with pytest.raises(Exception, match="Same player"):
+        contract.create_match_by_ids(arc4.UInt32(0), addr, arc4.UInt32(0), addr.copy(), mbr_pay)
+
+
+def test_create_match_by_ids_participant_box_fails(context: AlgopyTestContext) -> None:
+    """A roster user who also holds a p_ box cannot be paired a second time."""
+    contract = _make_variation(context)
+    _enroll_user_ids(context, contract, [0, 1], ROSTER_BOX_MBR + ROSTER_BYTE_MBR)
+    investor = arc4.Address(context.any.account())
+    contract.participants[investor] = ParticipantInfo(
+        enrolled=arc4.UInt8(1), assigned=arc4.UInt8(0), match_id=arc4.UInt32(0)
+    )
+    app_addr = context.ledger.get_app(contract.__app_id__).address
+    mbr_pay = context.any.txn.payment(receiver=app_addr, amount=MATCH_MBR)
+
+    with pytest.raises(Exception, match="Investor enrolled outside the roster"):
+        contract.create_match_by_ids(
+            arc4.UInt32(0), investor, arc4.UInt32(1), arc4.Address(context.any.account()), mbr_pay
+        )
+
+
+def test_enroll_user_ids_counts_against_max_participants(context: AlgopyTestContext) -> None:
+    contract = _make_variation(context, max_participants=2)
+    _enroll_user_ids(context, contract, [0, 1], ROSTER_BOX_MBR + ROSTER_BYTE_MBR)
+
+    with pytest.raises(Exception, match="Full"):
+        _enroll_user_ids(context, contract, [2], 0)
+
+
 # -------------------------------------------------------------------------
 # submit_investor_decision
 # investor = ctx.default_sender → no create_group needed
@@ -404,6 +743,268 @@ def test_submit_trustee_decision_wrong_caller_fails(context: AlgopyTestContext)
         contract.submit_trustee_decision(match_id, arc4.UInt64(60))
 
 
+# -------------------------------------------------------------------------
+# deferred settlement (set_settlement_mode / settle)
+# -------------------------------------------------------------------------
+
+
+def _submit_trustee_decision(
+    ctx: AlgopyTestContext,
+    contract: TrustVariation,
+    trustee_acct: Account,
+    match_id: arc4.UInt32,
+    return_amount: int,
+) -> None:
+    app_call = ctx.any.txn.application_call(
+        sender=trustee_acct, app_id=Application(contract.__app_id__)
+    )
+    with ctx.txn.create_group(gtxns=[app_call], active_txn_index=0):
+        contract.submit_trustee_decision(match_id, arc4.UInt64(return_amount))
+
+
+def test_deferred_decision_records_without_paying(context: AlgopyTestContext) -> None:
+    contract = _make_variation(context)
+    contract.set_settlement_mode(arc4.UInt8(SETTLEMENT_DEFERRED))
+    contract.escrow_deposited.value = UInt64(1000)
+    investor, trustee, trustee_acct = _add_participants(context, contract)
+    match_id = _create_match(context, contract, investor.copy(), trustee.copy())
+    contract.submit_investor_decision(match_id, arc4.UInt64(40))
+
+    _submit_trustee_decision(context, contract, trustee_acct, match_id, 60)
+
+    match = contract.matches[match_id].copy()
+    assert match.phase == arc4.UInt8(PHASE_COMPLETED)
+    assert match.investor_payout == arc4.UInt64(120)
+    assert match.trustee_payout == arc4.UInt64(110)
+    assert match.paid_out == arc4.UInt8(0)
+    assert contract.escrow_pending.value == 230
+    assert contract.escrow_paid_out.value == 0
+    assert contract.paid_out_count.value == 0
+    assert contract.get_escrow_balance() == arc4.UInt64(770)
+
+
+def test_deferred_decision_insufficient_escrow_fails(context: AlgopyTestContext) -> None:
+    contract = _make_variation(context)
+    contract.set_settlement_mode(arc4.UInt8(SETTLEMENT_DEFERRED))
+    contract.escrow_deposited.value = UInt64(100)
+    investor, trustee, trustee_acct = _add_participants(context, contract)
+    match_id = _create_match(context, contract, investor.copy(), trustee.copy())
+    contract.submit_investor_decision(match_id, arc4.UInt64(40))
+
+    with pytest.raises(Exception, match="Insufficient escrow"):
+        _submit_trustee_decision(context, contract, trustee_acct, match_id, 60)
+
+
+@pytest.mark.parametrize("asset_id_param", [0, 1001])
+def test_settle_pays_pending_matches(context: AlgopyTestContext, asset_id_param: int) -> None:
+    contract = _make_variation(context, asset_id=asset_id_param)
+    contract.set_settlement_mode(arc4.UInt8(SETTLEMENT_DEFERRED))
+    contract.escrow_deposited.value = UInt64(1000)
+    investor, trustee, trustee_acct = _add_participants(context, contract)
+    match_id = _create_match(context, contract, investor.copy(), trustee.copy())
+    contract.submit_investor_decision(match_id, arc4.UInt64(40))
+    _submit_trustee_decision(context, contract, trustee_acct, match_id, 60)
+
+    contract.settle(arc4.DynamicArray(match_id))
+
+    assert contract.matches[match_id].paid_out == arc4.UInt8(1)
+    assert contract.escrow_pending.value == 0
+    assert contract.escrow_paid_out.value == 230
+    assert contract.paid_out_count.value == 1
+
+
+def test_settle_twice_fails(context: AlgopyTestContext) -> None:
+    contract = _make_variation(context)
+    contract.set_settlement_mode(arc4.UInt8(SETTLEMENT_DEFERRED))
+    contract.escrow_deposited.value = UInt64(1000)
+    investor, trustee, trustee_acct = _add_participants(context, contract)
+    match_id = _create_match(context, contract, investor.copy(), trustee.copy())
+    contract.submit_investor_decision(match_id, arc4.UInt64(40))
+    _submit_trustee_decision(context, contract, trustee_acct, match_id, 60)
+    contract.settle(arc4.DynamicArray(match_id))
+
+    with pytest.raises(Exception, match="Already paid out"):
+        contract.settle(arc4.DynamicArray(match_id))
+
+
+def test_settle_incomplete_match_fails(context: AlgopyTestContext) -> None:
+    contract = _make_variation(context)
+    investor, trustee, _ = _add_participants(context, contract)
+    match_id = _create_match(context, contract, investor.copy(), trustee.copy())
+
+    with pytest.raises(Exception, match="Match not completed"):
+        contract.settle(arc4.DynamicArray(match_id))
+
+
+def test_set_settlement_mode_not_owner_fails(context: AlgopyTestContext) -> None:
+    other = context.any.account()
+    contract = _make_variation(context, owner=other)
+    with pytest.raises(Exception, match="Not owner"):
+        contract.set_settlement_mode(arc4.UInt8(SETTLEMENT_DEFERRED))
+
+
+def test_set_settlement_mode_unknown_fails(context: AlgopyTestContext) -> None:
+    contract = _make_variation(context)
+    with pytest.raises(Exception, match="Unknown settlement mode"):
+        contract.set_settlement_mode(arc4.UInt8(9))
+
+
+def test_end_variation_keeps_pending_payouts(context: AlgopyTestContext) -> None:
+    contract = _make_variation(context)
+    contract.escrow_deposited.value = UInt64(1000)
+    contract.escrow_pending.value = UInt64(230)
+    contract.end_variation()
+    # Only the unreserved 770 is refunded
+    assert contract.escrow_deposited.value == 230
+
+
+def test_set_settlement_mode_after_matches_fails(context: AlgopyTestContext) -> None:
+    contract = _make_variation(context)
+    investor, trustee, _ = _add_participants(context, contract)
+    _create_match(context, contract, investor.copy(), trustee.copy())
+
+    with pytest.raises(Exception, match="Matches already created"):
+        contract.set_settlement_mode(arc4.UInt8(SETTLEMENT_DEFERRED))
+
+
+# -------------------------------------------------------------------------
+# claim ledger (SETTLEMENT_CLAIM / claim)
+# -------------------------------------------------------------------------
+
+
+def _claim_mode_completed_match(
+    ctx: AlgopyTestContext, contract: TrustVariation
+) -> tuple[arc4.Address, Account, arc4.UInt32]:
+    """Play one match to completion in claim mode. Returns (investor, trustee_acct, match_id)."""
+    contract.set_settlement_mode(arc4.UInt8(SETTLEMENT_CLAIM))
+    contract.escrow_deposited.value = UInt64(1000)
+    investor, trustee, trustee_acct = _add_participants(ctx, contract)
+    app_addr = ctx.ledger.get_app(contract.__app_id__).address
+    mbr_pay = ctx.any.txn.payment(receiver=app_addr, amount=MATCH_MBR + 2 * CLAIM_MBR)
+    match_id = contract.create_match(investor.copy(), trustee.copy(), mbr_pay)
+    contract.submit_investor_decision(match_id, arc4.UInt64(40))
+    _submit_trustee_decision(ctx, contract, trustee_acct, match_id, 60)
+    return investor, trustee_acct, match_id
+
+
+def test_claim_mode_requires_claim_box_mbr(context: AlgopyTestContext) -> None:
+    contract = _make_variation(context)
+    contract.set_settlement_mode(arc4.UInt8(SETTLEMENT_CLAIM))
+    investor, trustee, _ = _add_participants(context, contract)
+
+    with pytest.raises(Exception, match="Insufficient MBR"):
+        _create_match(context, contract, investor.copy(), trustee.copy())
+
+
+def test_claim_mode_decision_credits_ledger(context: AlgopyTestContext) -> None:
+    contract = _make_variation(context)
+    investor, trustee_acct, match_id = _claim_mode_completed_match(context, contract)
+
+    assert contract.get_claimable(context.default_sender) == arc4.UInt64(120)
+    assert contract.get_claimable(trustee_acct) == arc4.UInt64(110)
+    assert contract.matches[match_id].paid_out == arc4.UInt8(1)
+    assert contract.paid_out_count.value == 1
+    assert contract.escrow_pending.value == 230
+    assert contract.escrow_paid_out.value == 0
+
+
+@pytest.mark.parametrize("asset_id_param", [0, 1001])
+def test_claim_pays_and_clears_balance(context: AlgopyTestContext, asset_id_param: int) -> None:
+    contract = _make_variation(context, asset_id=asset_id_param)
+    _claim_mode_completed_match(context, contract)
+
+    claimed = contract.claim()
+
+    assert claimed == arc4.UInt64(120)
+    assert context.default_sender not in contract.claimable
+    assert contract.get_claimable(context.default_sender) == arc4.UInt64(0)
+    assert contract.escrow_pending.value == 110
+    assert contract.escrow_paid_out.value == 120
+
+
+def test_claim_nothing_owed_fails(context: AlgopyTestContext) -> None:
+    contract = _make_variation(context)
+    with pytest.raises(Exception, match="Nothing to claim"):
+        contract.claim()
+
+
+def test_claim_releases_claim_box_mbr(context: AlgopyTestContext) -> None:
+    contract = _make_variation(context)
+    _claim_mode_completed_match(context, contract)
+
+    contract.claim()
+
+    assert contract.claim_mbr_refund.value == CLAIM_MBR
+
+
+def test_end_variation_refunds_unused_claim_mbr(context: AlgopyTestContext) -> None:
+    contract = _make_variation(context)
+    _claim_mode_completed_match(context, contract)
+    contract.claim()
+    # A second match that never completes: neither of its claim boxes is ever created
+    a, b = _enroll(context, contract, 2)
+    app_addr = context.ledger.get_app(contract.__app_id__).address
+    mbr_pay = context.any.txn.payment(receiver=app_addr, amount=MATCH_MBR + 2 * CLAIM_MBR)
+    contract.create_match(a, b, mbr_pay)
+
+    contract.end_variation()
+
+    refund = context.txn.last_group.last_itxn.payment
+    assert refund.receiver == context.default_sender
+    assert refund.amount == 3 * CLAIM_MBR
+    assert contract.claim_mbr_refund.value == 0
+
+
+def test_sweep_boxes_refunds_claims_made_after_end(context: AlgopyTestContext) -> None:
+    contract = _make_variation(context)
+    _, trustee_acct, _ = _claim_mode_completed_match(context, contract)
+    contract.end_variation()
+    app_call = context.any.txn.application_call(sender=trustee_acct, app_id=Application(contract.__app_id__))
+    with context.txn.create_group(gtxns=[app_call], active_txn_index=0):
+        contract.claim()
+
+    no_keys = arc4.DynamicArray[arc4.DynamicBytes]()
+    assert contract.sweep_boxes(arc4.UInt8(SWEEP_MATCHES), no_keys) == arc4.UInt64(CLAIM_MBR)
+    assert contract.sweep_boxes(arc4.UInt8(SWEEP_MATCHES), no_keys) == arc4.UInt64(0)
+
+
+# -------------------------------------------------------------------------
+# get_stats (running aggregates)
+# -------------------------------------------------------------------------
+
+
+def test_get_stats_initially_zero(context: AlgopyTestContext) -> None:
+    contract = _make_variation(context)
+    stats = contract.get_stats()
+    assert stats.invested_count == arc4.UInt64(0)
+    assert stats.completed_count == arc4.UInt64(0)
+    assert stats.sumsq_trustee_payout == arc4.UInt128(0)
+
+
+def test_get_stats_tracks_decisions(context: AlgopyTestContext) -> None:
+    """s=40, r=60 → investor_payout=120, trustee_payout=110."""
+    contract = _make_variation(context)
+    investor, trustee, trustee_acct = _add_participants(context, contract)
+    match_id = _create_match(context, contract, investor.copy(), trustee.copy())
+
+    contract.submit_investor_decision(match_id, arc4.UInt64(40))
+    stats = contract.get_stats()
+    assert stats.invested_count == arc4.UInt64(1)
+    assert stats.sum_investment == arc4.UInt64(40)
+    assert stats.sumsq_investment == arc4.UInt128(1_600)
+    assert stats.completed_count == arc4.UInt64(0)
+
+    _submit_trustee_decision(context, contract, trustee_acct, match_id, 60)
+    stats = contract.get_stats()
+    assert stats.completed_count == arc4.UInt64(1)
+    assert stats.sum_return == arc4.UInt64(60)
+    assert stats.sumsq_return == arc4.UInt128(3_600)
+    assert stats.sum_investor_payout == arc4.UInt64(120)
+    assert stats.sumsq_investor_payout == arc4.UInt128(14_400)
+    assert stats.sum_trustee_payout == arc4.UInt64(110)
+    assert stats.sumsq_trustee_payout == arc4.UInt128(12_100)
+
+
 # -------------------------------------------------------------------------
 # withdraw_escrow
 # -------------------------------------------------------------------------
@@ -445,6 +1046,64 @@ def test_get_config(context: AlgopyTestContext, asset_id_param: int) -> None:
     assert config.max_participants == arc4.UInt64(0)
 
 
+def _make_matches(ctx: AlgopyTestContext, contract: TrustVariation, pairs: int) -> None:
+    addrs = _enroll(ctx, contract, pairs * 2)
+    for i in range(pairs):
+        _create_match(ctx, contract, addrs[2 * i].copy(), addrs[2 * i + 1].copy())
+
+
+def test_get_matches_page(context: AlgopyTestContext) -> None:
+    contract = _make_variation(context)
+    _make_matches(context, contract, 3)
+
+    page = contract.get_matches(arc4.UInt32(1), arc4.UInt32(5))
+
+    assert page.length == 2  # clamped to match_count
+    assert page[0].match_id == arc4.UInt32(1)
+    assert page[1].match_id == arc4.UInt32(2)
+
+
+def test_get_matches_caps_page_size(context: AlgopyTestContext) -> None:
+    contract = _make_variation(context)
+    _make_matches(context, contract, MATCHES_PAGE_SIZE + 1)
+
+    page = contract.get_matches(arc4.UInt32(0), arc4.UInt32(100))
+
+    assert page.length == MATCHES_PAGE_SIZE
+
+
+def test_get_matches_past_end_is_empty(context: AlgopyTestContext) -> None:
+    contract = _make_variation(context)
+    _make_matches(context, contract, 1)
+
+    assert contract.get_matches(arc4.UInt32(5), arc4.UInt32(2)).length == 0
+
+
+def test_get_player_state_with_match(context: AlgopyTestContext) -> None:
+    contract = _make_variation(context)
+    investor, trustee, _ = _add_participants(context, contract)
+    match_id = _create_match(context, contract, investor.copy(), trustee.copy())
+
+    state = contract.get_player_state(trustee)
+
+    assert state.participant.enrolled == arc4.UInt8(1)
+    assert state.participant.match_id == match_id
+    assert state.has_match == arc4.UInt8(1)
+    assert state.match.trustee == trustee
+    assert state.config.e1 == arc4.UInt64(E1)
+
+
+def test_get_player_state_unknown_address(context: AlgopyTestContext) -> None:
+    contract = _make_variation(context)
+    stranger = arc4.Address(context.any.account())
+
+    state = contract.get_player_state(stranger)
+
+    assert state.participant.enrolled == arc4.UInt8(0)
+    assert state.has_match == arc4.UInt8(0)
+    assert state.config.unit == arc4.UInt64(UNIT)
+
+
 def test_get_config_returns_max_participants(context: AlgopyTestContext) -> None:
     """Capacity flows through `create()` → state → `get_config()`."""
     contract = _make_variation(context, max_participants=5)
@@ -503,11 +1162,152 @@ def test_self_enroll_full_rejects(context: AlgopyTestContext) -> None:
     assert contract.participant_count.value == 1
 
     # default_sender attempts self_enroll → 'Full' assertion fires before inner txn.
-    self_mbr = context.any.txn.payment(receiver=app_addr, amount=16_900)
+    self_mbr = context.any.txn.payment(receiver=app_addr, amount=PARTICIPANT_MBR)
     with pytest.raises(Exception, match="Full"):
         contract.self_enroll(self_mbr)
 
 
+def _make_variation_with_registry(
+    ctx: AlgopyTestContext, max_participants: int = 0
+) -> tuple[TrustVariation, Application]:
+    registry = ctx.any.application()
+    contract = TrustVariation()
+    contract.create(
+        arc4.UInt64(0),
+        arc4.UInt32(1),
+        arc4.UInt32(1),
+        ctx.default_sender,
+        arc4.UInt64(E1),
+        arc4.UInt64(E2),
+        arc4.UInt64(MULTIPLIER),
+        arc4.UInt64(UNIT),
+        arc4.UInt64(ASSET_ID),
+        arc4.UInt64(registry.id),
+        arc4.UInt64(max_participants),
+    )
+    return contract, registry
+
+
+def _self_enroll_grouped(
+    ctx: AlgopyTestContext, contract: TrustVariation, registry: Application, addr: Account, user_id: int = 0
+) -> None:
+    """self_enroll_grouped after a get_user(addr) call that returned user_id."""
+    user = User(
+        user_id=arc4.UInt32(user_id),
+        role=arc4.UInt8(ROLE_PARTICIPANT),
+        name=arc4.String("P"),
+        created_at=arc4.UInt64(0),
+    )
+    registry_call = ctx.any.txn.application_call(
+        sender=ctx.default_sender,
+        app_id=registry,
+        app_args=[Bytes(GET_USER_SELECTOR), addr.bytes],
+        logs=[Bytes(ARC4_RETURN_PREFIX) + user.bytes],
+    )
+    app_addr = ctx.ledger.get_app(contract.__app_id__).address
+    mbr_pay = ctx.any.txn.payment(receiver=app_addr, amount=PARTICIPANT_MBR)
+    contract.self_enroll_grouped(registry_call, mbr_pay)
+
+
+def test_self_enroll_grouped(context: AlgopyTestContext) -> None:
+    contract, registry = _make_variation_with_registry(context)
+    _self_enroll_grouped(context, contract, registry, context.default_sender)
+
+    assert contract.participant_count.value == 1
+    assert contract.participants[arc4.Address(context.default_sender)].enrolled == arc4.UInt8(1)
+
+
+def test_self_enroll_grouped_roster_user_fails(context: AlgopyTestContext) -> None:
+    contract, registry = _make_variation_with_registry(context)
+    _enroll_user_ids(context, contract, [3], ROSTER_BOX_MBR + ROSTER_BYTE_MBR)
+
+    with pytest.raises(Exception, match="Already on roster"):
+        _self_enroll_grouped(context, contract, registry, context.default_sender, user_id=3)
+
+    assert contract.participant_count.value == 0
+
+
+def test_self_enroll_grouped_wrong_app_fails(context: AlgopyTestContext) -> None:
+    contract, _ = _make_variation_with_registry(context)
+    with pytest.raises(Exception, match="Not a registry call"):
+        _self_enroll_grouped(context, contract, context.any.application(), context.default_sender)
+
+
+def test_self_enroll_grouped_other_address_fails(context: AlgopyTestContext) -> None:
+    contract, registry = _make_variation_with_registry(context)
+    with pytest.raises(Exception, match="Registry call for another address"):
+        _self_enroll_grouped(context, contract, registry, context.any.account())
+
+
+def _self_enroll_with_proof(ctx: AlgopyTestContext, contract: TrustVariation, user_id: int, proof: bytes) -> None:
+    app_addr = ctx.ledger.get_app(contract.__app_id__).address
+    mbr_pay = ctx.any.txn.payment(receiver=app_addr, amount=PARTICIPANT_MBR)
+    contract.self_enroll_with_proof(arc4.UInt32(user_id), Bytes(proof), mbr_pay)
+
+
+def test_self_enroll_with_proof(context: AlgopyTestContext) -> None:
+    contract, registry = _make_variation_with_registry(context)
+    members = [context.any.account().bytes.value, context.default_sender.bytes.value, context.any.account().bytes.value]
+    context.ledger.set_global_state(registry, b"mr0", member_root(members))
+
+    _self_enroll_with_proof(context, contract, 1, member_proof(members, 1))
+
+    assert contract.participant_count.value == 1
+    assert arc4.Address(context.default_sender) in contract.participants
+
+
+def test_self_enroll_with_proof_accepts_older_root(context: AlgopyTestContext) -> None:
+    contract, registry = _make_variation_with_registry(context)
+    members = [context.default_sender.bytes.value]
+    newer = [*members, context.any.account().bytes.value]
+    # The proof's root has been pushed out of slot 0 into slot 1
+    newer_roots = [member_root([*newer, context.any.account().bytes.value] * n) for n in (1, 2, 3)]
+    context.ledger.set_global_state(registry, b"mr0", b"".join(newer_roots))
+    context.ledger.set_global_state(registry, b"mr1", member_root(newer) + member_root(members))
+
+    _self_enroll_with_proof(context, contract, 0, member_proof(members, 0))
+
+    assert contract.participant_count.value == 1
+
+
+def test_self_enroll_with_proof_other_sender_fails(context: AlgopyTestContext) -> None:
+    contract, registry = _make_variation_with_registry(context)
+    members = [context.any.account().bytes.value, context.any.account().bytes.value]
+    context.ledger.set_global_state(registry, b"mr0", member_root(members))
+
+    with pytest.raises(Exception, match="Invalid membership proof"):
+        _self_enroll_with_proof(context, contract, 1, member_proof(members, 1))
+
+
+def test_self_enroll_with_proof_bad_length_fails(context: AlgopyTestContext) -> None:
+    contract, registry = _make_variation_with_registry(context)
+    members = [context.default_sender.bytes.value]
+    context.ledger.set_global_state(registry, b"mr0", member_root(members))
+
+    with pytest.raises(Exception, match="Bad proof length"):
+        _self_enroll_with_proof(context, contract, 0, member_proof(members, 0)[:-32])
+
+
+def test_self_enroll_with_proof_roster_user_fails(context: AlgopyTestContext) -> None:
+    contract, registry = _make_variation_with_registry(context)
+    members = [context.default_sender.bytes.value]
+    context.ledger.set_global_state(registry, b"mr0", member_root(members))
+    _enroll_user_ids(context, contract, [0], ROSTER_BOX_MBR + ROSTER_BYTE_MBR)
+
+    with pytest.raises(Exception, match="Already on roster"):
+        _self_enroll_with_proof(context, contract, 0, member_proof(members, 0))
+
+
+def test_self_enroll_full_counts_roster(context: AlgopyTestContext) -> None:
+    contract, registry = _make_variation_with_registry(context, max_participants=1)
+    members = [context.any.account().bytes.value, context.default_sender.bytes.value]
+    context.ledger.set_global_state(registry, b"mr0", member_root(members))
+    _enroll_user_ids(context, contract, [0], ROSTER_BOX_MBR + ROSTER_BYTE_MBR)
+
+    with pytest.raises(Exception, match="Full"):
+        _self_enroll_with_proof(context, contract, 1, member_proof(members, 1))
+
+
 def test_add_participants_bypasses_max_participants(context: AlgopyTestContext) -> None:
     """Owner-driven add_participants intentionally has no capacity check.
 
@@ -600,6 +1400,62 @@ def test_record_escrow_zero_amount_fails(context: AlgopyTestContext) -> None:
             contract.record_escrow(arc4.UInt64(0))
 
 
+def test_enable_treasury_funding_from_experiments_app(context: AlgopyTestContext) -> None:
+    contract, experiments_app = _make_variation_with_experiments_app(context)
+    exp_addr = context.ledger.get_app(experiments_app.id).address
+    app_call = context.any.txn.application_call(
+        sender=exp_addr, app_id=Application(contract.__app_id__)
+    )
+    with context.txn.create_group(gtxns=[app_call], active_txn_index=0):
+        contract.enable_treasury_funding()
+
+    assert contract.treasury_funded.value == 1
+
+
+def _treasury_funded_match(
+    ctx: AlgopyTestContext, escrow: int
+) -> tuple[TrustVariation, Application, arc4.UInt32, Account]:
+    """Treasury-funded deferred variation with one match awaiting the trustee."""
+    contract, experiments_app = _make_variation_with_experiments_app(ctx)
+    contract.treasury_funded.value = UInt64(1)
+    contract.escrow_deposited.value = UInt64(escrow)
+    contract.set_settlement_mode(arc4.UInt8(SETTLEMENT_DEFERRED))
+    investor, trustee, trustee_acct = _add_participants(ctx, contract)
+    match_id = _create_match(ctx, contract, investor.copy(), trustee.copy())
+    contract.submit_investor_decision(match_id, arc4.UInt64(40))
+    return contract, experiments_app, match_id, trustee_acct
+
+
+def test_reserve_escrow_draws_shortfall_from_treasury(context: AlgopyTestContext) -> None:
+    contract, experiments_app, match_id, trustee_acct = _treasury_funded_match(context, escrow=100)
+
+    # Payouts total 230 against 100 deposited: draw the 130 shortfall
+    _submit_trustee_decision(context, contract, trustee_acct, match_id, 60)
+
+    draw = context.txn.last_group.last_itxn.application_call
+    assert draw.app_id == experiments_app
+    assert draw.app_args(0) == Bytes(bytes.fromhex("94422ef3"))  # draw_escrow(uint32,uint32,uint64)void
+    assert draw.app_args(3) == arc4.UInt64(130).bytes
+    assert contract.escrow_deposited.value == 230
+    assert contract.escrow_pending.value == 230
+
+
+def test_reserve_escrow_skips_draw_when_escrow_covers_payouts(context: AlgopyTestContext) -> None:
+    contract, _, match_id, trustee_acct = _treasury_funded_match(context, escrow=1_000)
+
+    _submit_trustee_decision(context, contract, trustee_acct, match_id, 60)
+
+    with pytest.raises(ValueError, match="No inner transactions"):
+        _ = context.txn.last_group.last_itxn
+    assert contract.escrow_deposited.value == 1_000
+
+
+def test_enable_treasury_funding_wrong_caller_fails(context: AlgopyTestContext) -> None:
+    contract, _ = _make_variation_with_experiments_app(context)
+    with pytest.raises(Exception, match="Not experiments app"):
+        contract.enable_treasury_funding()
+
+
 # -------------------------------------------------------------------------
 # end_variation
 # -------------------------------------------------------------------------
@@ -664,4 +1520,233 @@ def test_submit_trustee_decision_after_end_variation_fails(context: AlgopyTestCo
     )
     with context.txn.create_group(gtxns=[app_call], active_txn_index=0):
         with pytest.raises(Exception, match="Variation ended"):
-            contract.submit_trustee_decision(match_id, arc4.UInt64(60))
\ No newline at end of file
+            contract.submit_trustee_decision(match_id, arc4.UInt64(60))
+
+
+# -------------------------------------------------------------------------
+# sweep_boxes
+# -------------------------------------------------------------------------
+
+
+def _keys(*keys: bytes) -> arc4.DynamicArray[arc4.DynamicBytes]:
+    return arc4.DynamicArray(*(arc4.DynamicBytes(key) for key in keys))
+
+
+def test_sweep_participant_and_order_boxes(context: AlgopyTestContext) -> None:
+    contract = _make_auto_match_variation(context)
+    investor, trustee = _enroll(context, contract, 2)
+    contract.end_variation()
+
+    refunded = contract.sweep_boxes(arc4.UInt8(SWEEP_PARTICIPANTS), _keys(investor.bytes.value, trustee.bytes.value))
+    order_refunded = contract.sweep_boxes(arc4.UInt8(SWEEP_ENROLLMENT_ORDER), _keys(bytes(4), (1).to_bytes(4, "big")))
+
+    assert refunded == arc4.UInt64(2 * PARTICIPANT_MBR)
+    assert order_refunded == arc4.UInt64(2 * ORDER_BOX_MBR)
+    assert investor not in contract.participants
+    assert arc4.UInt32(1) not in contract.enrollment_order
+
+
+def test_sweep_skips_missing_keys(context: AlgopyTestContext) -> None:
+    contract = _make_variation(context)
+    investor, _, _ = _add_participants(context, contract)
+    contract.end_variation()
+    contract.sweep_boxes(arc4.UInt8(SWEEP_PARTICIPANTS), _keys(investor.bytes.value))
+
+    refunded = contract.sweep_boxes(arc4.UInt8(SWEEP_PARTICIPANTS), _keys(investor.bytes.value))
+
+    assert refunded == arc4.UInt64(0)
+
+
+def test_sweep_keeps_unsettled_matches(context: AlgopyTestContext) -> None:
+    contract = _make_variation(context)
+    contract.set_settlement_mode(arc4.UInt8(SETTLEMENT_DEFERRED))
+    contract.escrow_deposited.value = UInt64(1000)
+    investor, trustee, trustee_acct = _add_participants(context, contract)
+    match_id = _create_match(context, contract, investor.copy(), trustee.copy())
+    contract.submit_investor_decision(match_id, arc4.UInt64(40))
+    _submit_trustee_decision(context, contract, trustee_acct, match_id, 60)
+    contract.end_variation()
+
+    assert contract.sweep_boxes(arc4.UInt8(SWEEP_MATCHES), _keys(match_id.bytes.value)) == arc4.UInt64(0)
+    assert match_id in contract.matches
+
+    contract.settle(arc4.DynamicArray(match_id))
+    assert contract.sweep_boxes(arc4.UInt8(SWEEP_MATCHES), _keys(match_id.bytes.value)) == arc4.UInt64(MATCH_MBR)
+    assert match_id not in contract.matches
+
+
+def test_sweep_before_end_fails(context: AlgopyTestContext) -> None:
+    contract = _make_variation(context)
+    investor, _, _ = _add_participants(context, contract)
+
+    with pytest.raises(Exception, match="Not completed"):
+        contract.sweep_boxes(arc4.UInt8(SWEEP_PARTICIPANTS), _keys(investor.bytes.value))
+
+
+def test_sweep_wrong_caller_fails(context: AlgopyTestContext) -> None:
+    contract = _make_variation(context, owner=context.any.account())
+
+    with pytest.raises(Exception, match="Not owner"):
+        contract.sweep_boxes(arc4.UInt8(SWEEP_MATCHES), _keys(bytes(4)))
+
+
+def test_sweep_bad_key_fails(context: AlgopyTestContext) -> None:
+    contract = _make_variation(context)
+    contract.end_variation()
+
+    with pytest.raises(Exception, match="Bad key"):
+        contract.sweep_boxes(arc4.UInt8(SWEEP_MATCHES), _keys(bytes(32)))
+
+
+def test_get_matches_skips_swept_matches(context: AlgopyTestContext) -> None:
+    contract = _make_variation(context)
+    _make_matches(context, contract, 3)
+    contract.end_variation()
+    contract.sweep_boxes(arc4.UInt8(SWEEP_MATCHES), _keys((1).to_bytes(4, "big")))
+
+    page = contract.get_matches(arc4.UInt32(0), arc4.UInt32(3))
+
+    assert [match.match_id for match in page] == [arc4.UInt32(0), arc4.UInt32(2)]
+
+
+def test_get_player_state_after_match_swept(context: AlgopyTestContext) -> None:
+    contract = _make_variation(context)
+    investor, trustee, _ = _add_participants(context, contract)
+    match_id = _create_match(context, contract, investor.copy(), trustee.copy())
+    contract.end_variation()
+    contract.sweep_boxes(arc4.UInt8(SWEEP_MATCHES), _keys(match_id.bytes.value))
+
+    state = contract.get_player_state(trustee)
+
+    assert state.participant.assigned == arc4.UInt8(1)
+    assert state.has_match == arc4.UInt8(0)
+    assert state.match.trustee == arc4.Address()
+
+
+# -------------------------------------------------------------------------
+# ARC-28 events
+# -------------------------------------------------------------------------
+
+
+def _event_log(signature: str, event: arc4.Struct) -> Bytes:
+    """The log arc4.emit writes: sha512_256(signature)[:4] + the encoded struct."""
+    return Bytes(hashlib.new("sha512_256", signature.encode()).digest()[:4]) + event.bytes
+
+
+def _last_logs(ctx: AlgopyTestContext) -> list[Bytes]:
+    txn = ctx.txn.last_active
+    return [txn.logs(i) for i in range(txn.num_logs)]
+
+
+def _assert_within_log_limits(logs: list[Bytes]) -> None:
+    """An app call may write at most 32 logs totalling 1,024 bytes (algopy_testing does not check)."""
+    assert len(logs) <= 32
+    assert sum(len(log) for log in logs) <= 1_024
+
+
+def test_add_participants_emits_one_event_per_call(context: AlgopyTestContext) -> None:
+    # 40 ParticipantEnrolled events would be 1,600 bytes
+    contract = _make_variation(context)
+    _enroll(context, contract, 2)
+    _enroll(context, contract, 40)
+
+    logs = _last_logs(context)
+    assert logs == [
+        _event_log(
+            "ParticipantsEnrolled(uint32,uint32)",
+            ParticipantsEnrolled(first_position=arc4.UInt32(2), count=arc4.UInt32(40)),
+        ),
+    ]
+
+
+def test_self_enroll_emits_participant_enrolled(context: AlgopyTestContext) -> None:
+    contract, registry = _make_variation_with_registry(context)
+    members = [context.default_sender.bytes.value]
+    context.ledger.set_global_state(registry, b"mr0", member_root(members))
+
+    _self_enroll_with_proof(context, contract, 0, member_proof(members, 0))
+
+    assert _last_logs(context) == [
+        _event_log(
+            "ParticipantEnrolled(address,uint32)",
+            ParticipantEnrolled(addr=arc4.Address(context.default_sender), position=arc4.UInt32(0)),
+        ),
+    ]
+
+
+def test_create_matches_emits_one_event_per_call(context: AlgopyTestContext) -> None:
+    contract = _make_variation(context)
+    addrs = _enroll(context, contract, 40)
+    app_addr = context.ledger.get_app(contract.__app_id__).address
+    mbr_pay = context.any.txn.payment(receiver=app_addr, amount=MATCH_MBR * 20)
+
+    contract.create_matches(_pairs(*zip(addrs[::2], addrs[1::2], strict=True)), mbr_pay)
+
+    logs = _last_logs(context)
+    _assert_within_log_limits(logs)
+    assert logs[0] == _event_log(
+        "MatchesCreated(uint32,uint32)",
+        MatchesCreated(first_match_id=arc4.UInt32(0), count=arc4.UInt32(20)),
+    )
+
+
+def test_auto_match_emits_one_event_per_call(context: AlgopyTestContext) -> None:
+    contract = _make_auto_match_variation(context)
+    _enroll(context, contract, 40)
+
+    _auto_match(context, contract, 40)
+
+    logs = _last_logs(context)
+    _assert_within_log_limits(logs)
+    assert logs[0] == _event_log(
+        "MatchesCreated(uint32,uint32)",
+        MatchesCreated(first_match_id=arc4.UInt32(0), count=arc4.UInt32(20)),
+    )
+
+
+def test_settle_too_many_matches_fails(context: AlgopyTestContext) -> None:
+    contract = _make_variation(context)
+    match_ids = arc4.DynamicArray(*(arc4.UInt32(i) for i in range(MAX_SETTLE_PER_CALL + 1)))
+
+    with pytest.raises(Exception, match="Too many matches"):
+        contract.settle(match_ids)
+
+
+def test_create_match_emits_match_created(context: AlgopyTestContext) -> None:
+    contract = _make_variation(context)
+    investor, trustee, _ = _add_participants(context, contract)
+    _create_match(context, contract, investor.copy(), trustee.copy())
+
+    logs = _last_logs(context)
+    # The event, then the ABI return log
+    assert len(logs) == 2
+    assert logs[0] == _event_log(
+        "MatchCreated(uint32,address,address)",
+        MatchCreated(match_id=arc4.UInt32(0), investor=investor.copy(), trustee=trustee.copy()),
+    )
+
+
+def test_trustee_decision_emits_match_paid_out(context: AlgopyTestContext) -> None:
+    contract = _make_variation(context)
+    investor, trustee, trustee_acct = _add_participants(context, contract)
+    match_id = _create_match(context, contract, investor.copy(), trustee.copy())
+    contract.submit_investor_decision(match_id, arc4.UInt64(40))
+
+    _submit_trustee_decision(context, contract, trustee_acct, match_id, 60)
+
+    # Paid out immediately, so MatchPaidOut precedes the decision event
+    assert _last_logs(context) == [
+        _event_log(
+            "MatchPaidOut(uint32,uint64,uint64)",
+            MatchPaidOut(match_id=match_id, investor_payout=arc4.UInt64(120), trustee_payout=arc4.UInt64(110)),
+        ),
+        _event_log(
+            "TrusteeDecided(uint32,uint64,uint64,uint64)",
+            TrusteeDecided(
+                match_id=match_id,
+                return_amount=arc4.UInt64(60),
+                investor_payout=arc4.UInt64(120),
+                trustee_payout=arc4.UInt64(110),
+            ),
+        ),
+    ]
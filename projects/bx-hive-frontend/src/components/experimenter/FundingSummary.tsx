@@ -84,8 +84,8 @@ export default function FundingSummary({
         </table>
       </div>
       <p className="text-xs text-muted-foreground mt-2">
-        Escrow funds payouts to players in {payoutAsset.unitName}. Match MBR (0.0883 ALGO/match) covers on-chain storage and is paid in ALGO
-        regardless of payout asset. Participants pay 0.0169 ALGO each on self-enrollment.
+        Escrow funds payouts to players in {payoutAsset.unitName}. Match MBR (0.0521 ALGO/match) covers on-chain storage and is paid in ALGO
+        regardless of payout asset. Participants pay 0.0185 ALGO each on self-enrollment.
       </p>
       <div
         role="alert"
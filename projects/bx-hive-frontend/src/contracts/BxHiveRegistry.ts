@@ -14,7 +14,7 @@ import { SendParams,SendTransactionComposerResults  } from '@algorandfoundation/
 import { AppFactoryCreateMethodCallParams, AppFactoryAppClientParams, AppFactoryDeployParams, AppFactoryParams, AppFactory as _AppFactory, AppFactoryResolveAppClientByCreatorAndNameParams, CreateSchema  } from '@algorandfoundation/algokit-utils/app-factory'
 import { TransactionComposer, TransactionComposerConfig, SkipSignaturesSimulateOptions, RawSimulateOptions, SimulateOptions, AppMethodCallTransactionArgument } from '@algorandfoundation/algokit-utils/composer'
 
-export const APP_SPEC: Arc56Contract = {"name":"BxHiveRegistry","structs":{"ExperimentTemplateInfo":[{"name":"appId","type":"uint64"},{"name":"name","type":"string"},{"name":"playerCount","type":"uint8"},{"name":"enabled","type":"uint8"}],"User":[{"name":"userId","type":"uint32"},{"name":"role","type":"uint8"},{"name":"name","type":"string"},{"name":"createdAt","type":"uint64"}]},"methods":[{"name":"create","args":[],"returns":{"type":"void"},"actions":{"create":["NoOp"],"call":[]},"readonly":false,"events":[],"recommendations":{}},{"name":"add_admin","args":[{"type":"address","name":"addr"},{"type":"uint8","name":"role"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[],"recommendations":{}},{"name":"remove_admin","args":[{"type":"address","name":"addr"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[],"recommendations":{}},{"name":"register_user","args":[{"type":"uint8","name":"role"},{"type":"string","name":"name"}],"returns":{"type":"uint32"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[],"recommendations":{}},{"name":"register_template","args":[{"type":"uint8","name":"template_id"},{"type":"uint64","name":"app_id"},{"type":"string","name":"name"},{"type":"uint8","name":"player_count"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[],"recommendations":{}},{"name":"get_user","args":[{"type":"address","name":"addr"}],"returns":{"type":"(uint32,uint8,string,uint64)","struct":"User"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_template","args":[{"type":"uint8","name":"template_id"}],"returns":{"type":"(uint64,string,uint8,uint8)","struct":"ExperimentTemplateInfo"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}}],"arcs":[22,28],"networks":{},"state":{"schema":{"global":{"ints":1,"bytes":1},"local":{"ints":0,"bytes":0}},"keys":{"global":{"super_admin":{"keyType":"AVMString","valueType":"address","key":"c3VwZXJfYWRtaW4="},"user_count":{"keyType":"AVMString","valueType":"AVMUint64","key":"dXNlcl9jb3VudA=="}},"local":{},"box":{}},"maps":{"global":{},"local":{},"box":{"admins":{"keyType":"address","valueType":"uint8","prefix":"YWRtXw=="},"users":{"keyType":"address","valueType":"User","prefix":"dV8="},"user_ids":{"keyType":"uint32","valueType":"address","prefix":"dWlf"},"experiment_templates":{"keyType":"uint8","valueType":"ExperimentTemplateInfo","prefix":"dF8="}}}},"bareActions":{"create":[],"call":[]},"sourceInfo":{"approval":{"sourceInfo":[{"pc":[195],"errorMessage":"Admin not found"},{"pc":[229],"errorMessage":"Already registered"},{"pc":[161,186,340],"errorMessage":"Not super admin"},{"pc":[59],"errorMessage":"OnCompletion must be NoOp"},{"pc":[408],"errorMessage":"Template not found"},{"pc":[383],"errorMessage":"User not found"},{"pc":[159,184,338],"errorMessage":"check self.super_admin exists"},{"pc":[233],"errorMessage":"check self.user_count exists"},{"pc":[213,317],"errorMessage":"invalid array length header"},{"pc":[220,324],"errorMessage":"invalid number of bytes for arc4.dynamic_array<arc4.uint8>"},{"pc":[145,178,375],"errorMessage":"invalid number of bytes for arc4.static_array<arc4.uint8, 32>"},{"pc":[311],"errorMessage":"invalid number of bytes for arc4.uint64"},{"pc":[153,207,302,332,399],"errorMessage":"invalid number of bytes for arc4.uint8"},{"pc":[240],"errorMessage":"overflow"}],"pcOffsetMethod":"none"},"clear":{"sourceInfo":[],"pcOffsetMethod":"none"}},"source":{"approval":"I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAxIDAgMzIgMgogICAgYnl0ZWNibG9jayAidXNlcl9jb3VudCIgInN1cGVyX2FkbWluIiAweDc1NWYgMHgxNTFmN2M3NSAweDYxNjQ2ZDVmIDB4NzQ1ZgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjkKICAgIC8vIHNlbGYudXNlcl9jb3VudCA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgwKSkKICAgIGJ5dGVjXzAgLy8gInVzZXJfY291bnQiCiAgICBpbnRjXzEgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKCm1haW5fYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYKICAgIC8vIGNsYXNzIEJ4SGl2ZVJlZ2lzdHJ5KEFSQzRDb250cmFjdCk6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIG11c3QgYmUgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJ6IG1haW5fY3JlYXRlX05vT3BAMTIKICAgIHB1c2hieXRlc3MgMHg3ZWJhMjNlMyAweDQ4MjhjZDJkIDB4ZTgxMWYyYTcgMHgzZGE5YzY4MiAweDZmYWQ0YTY1IDB4MDg5NzAzNDIgLy8gbWV0aG9kICJhZGRfYWRtaW4oYWRkcmVzcyx1aW50OCl2b2lkIiwgbWV0aG9kICJyZW1vdmVfYWRtaW4oYWRkcmVzcyl2b2lkIiwgbWV0aG9kICJyZWdpc3Rlcl91c2VyKHVpbnQ4LHN0cmluZyl1aW50MzIiLCBtZXRob2QgInJlZ2lzdGVyX3RlbXBsYXRlKHVpbnQ4LHVpbnQ2NCxzdHJpbmcsdWludDgpdm9pZCIsIG1ldGhvZCAiZ2V0X3VzZXIoYWRkcmVzcykodWludDMyLHVpbnQ4LHN0cmluZyx1aW50NjQpIiwgbWV0aG9kICJnZXRfdGVtcGxhdGUodWludDgpKHVpbnQ2NCxzdHJpbmcsdWludDgsdWludDgpIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggYWRkX2FkbWluIHJlbW92ZV9hZG1pbiByZWdpc3Rlcl91c2VyIHJlZ2lzdGVyX3RlbXBsYXRlIGdldF91c2VyIGdldF90ZW1wbGF0ZQogICAgZXJyCgptYWluX2NyZWF0ZV9Ob09wQDEyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYKICAgIC8vIGNsYXNzIEJ4SGl2ZVJlZ2lzdHJ5KEFSQzRDb250cmFjdCk6CiAgICBwdXNoYnl0ZXMgMHg0YzVjNjFiYSAvLyBtZXRob2QgImNyZWF0ZSgpdm9pZCIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIGNyZWF0ZQogICAgZXJyCgoKLy8gc21hcnRfY29udHJhY3RzLnJlZ2lzdHJ5LmNvbnRyYWN0LkJ4SGl2ZVJlZ2lzdHJ5LmNyZWF0ZVtyb3V0aW5nXSgpIC0+IHZvaWQ6CmNyZWF0ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToxNwogICAgLy8gc2VsZi5zdXBlcl9hZG1pbi52YWx1ZSA9IFR4bi5zZW5kZXIKICAgIGJ5dGVjXzEgLy8gInN1cGVyX2FkbWluIgogICAgdHhuIFNlbmRlcgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToxOAogICAgLy8gc2VsZi51c2VyX2NvdW50LnZhbHVlID0gVUludDY0KDApCiAgICBieXRlY18wIC8vICJ1c2VyX2NvdW50IgogICAgaW50Y18xIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6MTUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChjcmVhdGU9InJlcXVpcmUiKQogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5yZWdpc3RyeS5jb250cmFjdC5CeEhpdmVSZWdpc3RyeS5hZGRfYWRtaW5bcm91dGluZ10oKSAtPiB2b2lkOgphZGRfYWRtaW46CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6MjAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18wIC8vIDEKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToyMgogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5zdXBlcl9hZG1pbi52YWx1ZSwgIk5vdCBzdXBlciBhZG1pbiIKICAgIHR4biBTZW5kZXIKICAgIGludGNfMSAvLyAwCiAgICBieXRlY18xIC8vICJzdXBlcl9hZG1pbiIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdXBlcl9hZG1pbiBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gTm90IHN1cGVyIGFkbWluCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6MjMKICAgIC8vIHNlbGYuYWRtaW5zW2FkZHJdID0gcm9sZQogICAgYnl0ZWMgNCAvLyAweDYxNjQ2ZDVmCiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMucmVnaXN0cnkuY29udHJhY3QuQnhIaXZlUmVnaXN0cnkucmVtb3ZlX2FkbWluW3JvdXRpbmddKCkgLT4gdm9pZDoKcmVtb3ZlX2FkbWluOgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI1CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI3CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLnN1cGVyX2FkbWluLnZhbHVlLCAiTm90IHN1cGVyIGFkbWluIgogICAgdHhuIFNlbmRlcgogICAgaW50Y18xIC8vIDAKICAgIGJ5dGVjXzEgLy8gInN1cGVyX2FkbWluIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnN1cGVyX2FkbWluIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBOb3Qgc3VwZXIgYWRtaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToyOAogICAgLy8gYXNzZXJ0IGFkZHIgaW4gc2VsZi5hZG1pbnMsICJBZG1pbiBub3QgZm91bmQiCiAgICBieXRlYyA0IC8vIDB4NjE2NDZkNWYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBBZG1pbiBub3QgZm91bmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToyOQogICAgLy8gZGVsIHNlbGYuYWRtaW5zW2FkZHJdCiAgICBib3hfZGVsCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToyNQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnJlZ2lzdHJ5LmNvbnRyYWN0LkJ4SGl2ZVJlZ2lzdHJ5LnJlZ2lzdGVyX3VzZXJbcm91dGluZ10oKSAtPiB2b2lkOgpyZWdpc3Rlcl91c2VyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMxCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzAgLy8gMQogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50OAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBpbnRjXzEgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgaW50Y18zIC8vIDIKICAgICsKICAgIGRpZyAxCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMzCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciBub3QgaW4gc2VsZi51c2VycywgIkFscmVhZHkgcmVnaXN0ZXJlZCIKICAgIGJ5dGVjXzIgLy8gMHg3NTVmCiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgIQogICAgYXNzZXJ0IC8vIEFscmVhZHkgcmVnaXN0ZXJlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM0CiAgICAvLyB1c2VyX2lkID0gYXJjNC5VSW50MzIoc2VsZi51c2VyX2NvdW50LnZhbHVlKQogICAgaW50Y18xIC8vIDAKICAgIGJ5dGVjXzAgLy8gInVzZXJfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudXNlcl9jb3VudCBleGlzdHMKICAgIGR1cAogICAgaXRvYgogICAgZHVwCiAgICBiaXRsZW4KICAgIGludGNfMiAvLyAzMgogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZXh0cmFjdCA0IDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weTozNQogICAgLy8gc2VsZi51c2VyX2NvdW50LnZhbHVlICs9IFVJbnQ2NCgxKQogICAgc3dhcAogICAgaW50Y18wIC8vIDEKICAgICsKICAgIGJ5dGVjXzAgLy8gInVzZXJfY291bnQiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQwCiAgICAvLyBjcmVhdGVkX2F0PWFyYzQuVUludDY0KEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wKSwKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weTozNi00MQogICAgLy8gdXNlciA9IFVzZXIoCiAgICAvLyAgICAgdXNlcl9pZD11c2VyX2lkLAogICAgLy8gICAgIHJvbGU9cm9sZSwKICAgIC8vICAgICBuYW1lPW5hbWUsCiAgICAvLyAgICAgY3JlYXRlZF9hdD1hcmM0LlVJbnQ2NChHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCksCiAgICAvLyApCiAgICBkaWcgMQogICAgdW5jb3ZlciA0CiAgICBjb25jYXQKICAgIHB1c2hieXRlcyAweDAwMGYKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQyCiAgICAvLyBzZWxmLnVzZXJzW1R4bi5zZW5kZXJdID0gdXNlcgogICAgYnl0ZWNfMiAvLyAweDc1NWYKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZGVsCiAgICBwb3AKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weTo0MwogICAgLy8gc2VsZi51c2VyX2lkc1t1c2VyX2lkXSA9IGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKQogICAgdHhuIFNlbmRlcgogICAgcHVzaGJ5dGVzIDB4NzU2OTVmCiAgICBkaWcgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6MzEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgYnl0ZWNfMyAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5yZWdpc3RyeS5jb250cmFjdC5CeEhpdmVSZWdpc3RyeS5yZWdpc3Rlcl90ZW1wbGF0ZVtyb3V0aW5nXSgpIC0+IHZvaWQ6CnJlZ2lzdGVyX3RlbXBsYXRlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ2CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzAgLy8gMQogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50OAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgOCAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZHVwCiAgICBpbnRjXzEgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgaW50Y18zIC8vIDIKICAgICsKICAgIGRpZyAxCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNAogICAgZHVwCiAgICBsZW4KICAgIGludGNfMCAvLyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ4CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6NTQKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYuc3VwZXJfYWRtaW4udmFsdWUsICJOb3Qgc3VwZXIgYWRtaW4iCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzEgLy8gMAogICAgYnl0ZWNfMSAvLyAic3VwZXJfYWRtaW4iCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3VwZXJfYWRtaW4gZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIE5vdCBzdXBlciBhZG1pbgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU1LTYwCiAgICAvLyB0ZW1wbGF0ZSA9IEV4cGVyaW1lbnRUZW1wbGF0ZUluZm8oCiAgICAvLyAgICAgYXBwX2lkPWFwcF9pZCwKICAgIC8vICAgICBuYW1lPW5hbWUsCiAgICAvLyAgICAgcGxheWVyX2NvdW50PXBsYXllcl9jb3VudCwKICAgIC8vICAgICBlbmFibGVkPWFyYzQuVUludDgoMSksCiAgICAvLyApCiAgICB1bmNvdmVyIDIKICAgIHB1c2hieXRlcyAweDAwMGMKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6NTkKICAgIC8vIGVuYWJsZWQ9YXJjNC5VSW50OCgxKSwKICAgIHB1c2hieXRlcyAweDAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6NTUtNjAKICAgIC8vIHRlbXBsYXRlID0gRXhwZXJpbWVudFRlbXBsYXRlSW5mbygKICAgIC8vICAgICBhcHBfaWQ9YXBwX2lkLAogICAgLy8gICAgIG5hbWU9bmFtZSwKICAgIC8vICAgICBwbGF5ZXJfY291bnQ9cGxheWVyX2NvdW50LAogICAgLy8gICAgIGVuYWJsZWQ9YXJjNC5VSW50OCgxKSwKICAgIC8vICkKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6NjEKICAgIC8vIHNlbGYuZXhwZXJpbWVudF90ZW1wbGF0ZXNbdGVtcGxhdGVfaWRdID0gdGVtcGxhdGUKICAgIGJ5dGVjIDUgLy8gMHg3NDVmCiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZGVsCiAgICBwb3AKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weTo0NgogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnJlZ2lzdHJ5LmNvbnRyYWN0LkJ4SGl2ZVJlZ2lzdHJ5LmdldF91c2VyW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X3VzZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6NjMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6NjUKICAgIC8vIGFzc2VydCBhZGRyIGluIHNlbGYudXNlcnMsICJVc2VyIG5vdCBmb3VuZCIKICAgIGJ5dGVjXzIgLy8gMHg3NTVmCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gVXNlciBub3QgZm91bmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weTo2NgogICAgLy8gcmV0dXJuIHNlbGYudXNlcnNbYWRkcl0KICAgIGJveF9nZXQKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYzCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzMgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMucmVnaXN0cnkuY29udHJhY3QuQnhIaXZlUmVnaXN0cnkuZ2V0X3RlbXBsYXRlW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X3RlbXBsYXRlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY4CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzAgLy8gMQogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50OAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcwCiAgICAvLyBhc3NlcnQgdGVtcGxhdGVfaWQgaW4gc2VsZi5leHBlcmltZW50X3RlbXBsYXRlcywgIlRlbXBsYXRlIG5vdCBmb3VuZCIKICAgIGJ5dGVjIDUgLy8gMHg3NDVmCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gVGVtcGxhdGUgbm90IGZvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6NzEKICAgIC8vIHJldHVybiBzZWxmLmV4cGVyaW1lbnRfdGVtcGxhdGVzW3RlbXBsYXRlX2lkXQogICAgYm94X2dldAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6NjgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWNfMyAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgo=","clear":"I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"},"byteCode":{"approval":"CyAEAQAgAiYGCnVzZXJfY291bnQLc3VwZXJfYWRtaW4CdV8EFR98dQRhZG1fAnRfMRhAAAMoI2cxGRREMRhBADKCBgR+uiPjBEgozS0E6BHypwQ9qcaCBG+tSmUECJcDQjYaAI4GABgAOQBWALUA/gEWAIAETFxhujYaAI4BAAEAKTEAZygjZyJDNhoBSRUkEkQ2GgJJFSISRDEAIyllRBJEJwRPAlBMvyJDNhoBSRUkEkQxACMpZUQSRCcETFBJvUUBRLxIIkM2GgFJFSISRDYaAkkjWSUISwEVEkQqMQBQvUUBFEQjKGVESRZJkyQORFcEBEwiCChMZzIHFksBTwRQgAIAD1BMUE8CUCoxAFBJvEhMvzEAgAN1aV9LAlBMvytMULAiQzYaAUkVIhJENhoCSRWBCBJENhoDSSNZJQhLARUSRDYaBEkVIhJEMQAjKWVEEkRPAoACAAxQTFCAAQFQTFAnBU8CUEm8SEy/IkM2GgFJFSQSRCpMUEm9RQFEvkgrTFCwIkM2GgFJFSISRCcFTFBJvUUBRL5IK0xQsCJD","clear":"C4EBQw=="},"events":[],"templateVariables":{}} as unknown as Arc56Contract
+export const APP_SPEC: Arc56Contract = {"name":"BxHiveRegistry","structs":{"ExperimentTemplateInfo":[{"name":"appId","type":"uint64"},{"name":"name","type":"string"},{"name":"playerCount","type":"uint8"},{"name":"enabled","type":"uint8"}],"User":[{"name":"userId","type":"uint32"},{"name":"role","type":"uint8"},{"name":"name","type":"string"},{"name":"createdAt","type":"uint64"}]},"methods":[{"name":"create","args":[],"returns":{"type":"void"},"actions":{"create":["NoOp"],"call":[]},"readonly":false,"events":[],"recommendations":{}},{"name":"add_admin","args":[{"type":"address","name":"addr"},{"type":"uint8","name":"role"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[],"recommendations":{}},{"name":"remove_admin","args":[{"type":"address","name":"addr"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[],"recommendations":{}},{"name":"register_user","args":[{"type":"uint8","name":"role"},{"type":"string","name":"name"}],"returns":{"type":"uint32"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[{"name":"UserRegistered","args":[{"type":"uint32","name":"user_id"},{"type":"address","name":"addr"},{"type":"uint8","name":"role"}]}],"recommendations":{}},{"name":"register_users","args":[{"type":"address[]","name":"addresses"},{"type":"uint8[]","name":"roles"},{"type":"string[]","name":"names"},{"type":"pay","name":"mbr_payment"}],"returns":{"type":"uint32"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Operator bulk registration of a cohort, funded by one MBR payment of\nUSER_MBR + USER_NAME_BYTE_MBR * len(name) per user. User IDs are assigned sequentially; returns the first one. Each user touches three boxes (plus the shared rc_ and mk boxes), so a call fits about 2 users unless the group shares box references. The member root is updated once per call, and one UsersRegistered event covers the whole cohort.","events":[{"name":"UsersRegistered","args":[{"type":"uint32","name":"first_user_id"},{"type":"uint32","name":"count"}]}],"recommendations":{}},{"name":"register_template","args":[{"type":"uint8","name":"template_id"},{"type":"uint64","name":"app_id"},{"type":"string","name":"name"},{"type":"uint8","name":"player_count"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[],"recommendations":{}},{"name":"get_user","args":[{"type":"address","name":"addr"}],"returns":{"type":"(uint32,uint8,string,uint64)","struct":"User"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_template","args":[{"type":"uint8","name":"template_id"}],"returns":{"type":"(uint64,string,uint8,uint8)","struct":"ExperimentTemplateInfo"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_users","args":[{"type":"uint32","name":"start"},{"type":"uint32","name":"count"}],"returns":{"type":"(address,(uint32,uint8,string,uint64))[]"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"desc":"(address, User) for user_ids start .. start + count - 1. Names are\nvariable length, so the page also stops early once the encoded result would overflow the return log; continue from start + len(page) while that is below user_count.","events":[],"recommendations":{}},{"name":"get_users_by_role","args":[{"type":"uint8","name":"role"},{"type":"uint32","name":"start"},{"type":"uint32","name":"count"}],"returns":{"type":"(address,(uint32,uint8,string,uint64))[]"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"desc":"Like get_users, but over the users of one role in registration order.","events":[],"recommendations":{}},{"name":"get_member_roots","args":[],"returns":{"type":"byte[]"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"desc":"Recent member tree roots, newest first, 32 bytes each.","events":[],"recommendations":{}},{"name":"get_role_count","args":[{"type":"uint8","name":"role"}],"returns":{"type":"uint32"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}}],"arcs":[22,28],"networks":{},"state":{"schema":{"global":{"ints":1,"bytes":9},"local":{"ints":0,"bytes":0}},"keys":{"global":{"super_admin":{"keyType":"AVMString","valueType":"address","key":"c3VwZXJfYWRtaW4="},"user_count":{"keyType":"AVMString","valueType":"AVMUint64","key":"dXNlcl9jb3VudA=="}},"local":{},"box":{"member_branch":{"keyType":"AVMBytes","valueType":"AVMBytes","key":"bWs="}}},"maps":{"global":{},"local":{},"box":{"admins":{"keyType":"address","valueType":"uint8","prefix":"YWRtXw=="},"users":{"keyType":"address","valueType":"User","prefix":"dV8="},"user_ids":{"keyType":"uint32","valueType":"address","prefix":"dWlf"},"experiment_templates":{"keyType":"uint8","valueType":"ExperimentTemplateInfo","prefix":"dF8="},"role_counts":{"keyType":"uint8","valueType":"uint32","prefix":"cmNf"},"role_index":{"keyType":"uint64","valueType":"uint32","prefix":"cmlf"}}}},"bareActions":{"create":[],"call":[]},"sourceInfo":{"approval":{"sourceInfo":[{"pc":[784,1865],"errorMessage":"Address length is 32 bytes"},{"pc":[455],"errorMessage":"Admin not found"},{"pc":[1454],"errorMessage":"Already registered"},{"pc":[739],"errorMessage":"Insufficient MBR"},{"pc":[658,662],"errorMessage":"Length mismatch"},{"pc":[651],"errorMessage":"Not operator"},{"pc":[421,446,936],"errorMessage":"Not super admin"},{"pc":[97],"errorMessage":"OnCompletion must be NoOp"},{"pc":[1468],"errorMessage":"Registry full"},{"pc":[1005],"errorMessage":"Template not found"},{"pc":[980],"errorMessage":"User not found"},{"pc":[670],"errorMessage":"Wrong MBR receiver"},{"pc":[878],"errorMessage":"check self.admins entry exists"},{"pc":[1230,1238,1419,1598],"errorMessage":"check self.role_counts entry exists"},{"pc":[1271],"errorMessage":"check self.role_index entry exists"},{"pc":[419,444,645,934],"errorMessage":"check self.super_admin exists"},{"pc":[743,1047,1058,1462,1526,1700],"errorMessage":"check self.user_count exists"},{"pc":[1094,1277],"errorMessage":"check self.user_ids entry exists"},{"pc":[1872],"errorMessage":"check self.users entry exists"},{"pc":[690,779,793,799],"errorMessage":"index access is out of bounds"},{"pc":[590],"errorMessage":"invalid array encoding"},{"pc":[473,527,545,560,604,913],"errorMessage":"invalid array length header"},{"pc":[624],"errorMessage":"invalid number of bytes for arc4.dynamic_array<arc4.dynamic_array<arc4.uint8>>"},{"pc":[538],"errorMessage":"invalid number of bytes for arc4.dynamic_array<arc4.static_array<arc4.uint8, 32>>"},{"pc":[480,554,920],"errorMessage":"invalid number of bytes for arc4.dynamic_array<arc4.uint8>"},{"pc":[405,438,971],"errorMessage":"invalid number of bytes for arc4.static_array<arc4.uint8, 32>"},{"pc":[1026,1035,1180,1191],"errorMessage":"invalid number of bytes for arc4.uint32"},{"pc":[907],"errorMessage":"invalid number of bytes for arc4.uint64"},{"pc":[413,467,898,928,996,1169,1405],"errorMessage":"invalid number of bytes for arc4.uint8"},{"pc":[598],"errorMessage":"invalid tail pointer for (len+(len+utf8[])[])"},{"pc":[749,836,1085,1533,1631],"errorMessage":"overflow"},{"pc":[636],"errorMessage":"transaction type is pay"}],"pcOffsetMethod":"none"},"clear":{"sourceInfo":[],"pcOffsetMethod":"none"}},"source":{"approval":"I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAxIDAgMzIgMgogICAgYnl0ZWNibG9jayAidXNlcl9jb3VudCIgMHgxNTFmN2M3NSAweCAic3VwZXJfYWRtaW4iIDB4NmQ2YiAweDYxNjQ2ZDVmIDB4NzU1ZiAweDc1Njk1ZiAweDcyNjM1ZiAweDA2ODEwMSAweDc0NWYgMHgwMDAwIDB4MDAwMiAweDcyNjk1ZiAweDMwMzEzMjMzMzQzNTM2MzcgMHg2ZDcyCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYm56IG1haW5fYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6NTYKICAgIC8vIHNlbGYudXNlcl9jb3VudCA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgwKSkKICAgIGJ5dGVjXzAgLy8gInVzZXJfY291bnQiCiAgICBpbnRjXzEgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKCm1haW5fYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUxLTUzCiAgICAvLyAjIFRoZSBtZW1iZXIgcm9vdCBzbG90cyAoIm1yMCIgLi4gIm1yNyIpIGFyZSB3cml0dGVuIGJ5IGtleSwgc28gdGhlIHNjaGVtYQogICAgLy8gIyByZXNlcnZlcyB0aGVtIG9uIHRvcCBvZiBzdXBlcl9hZG1pbjogMSArIE1FTUJFUl9ST09UX1NMT1RTIGJ5dGVzIGdsb2JhbHMuCiAgICAvLyBjbGFzcyBCeEhpdmVSZWdpc3RyeShBUkM0Q29udHJhY3QsIHN0YXRlX3RvdGFscz1TdGF0ZVRvdGFscyhnbG9iYWxfYnl0ZXM9OSwgZ2xvYmFsX3VpbnRzPTEpKToKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gbXVzdCBiZSBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYnogbWFpbl9jcmVhdGVfTm9PcEAxNwogICAgcHVzaGJ5dGVzcyAweDdlYmEyM2UzIDB4NDgyOGNkMmQgMHhlODExZjJhNyAweGVmYTVkOWJjIDB4M2RhOWM2ODIgMHg2ZmFkNGE2NSAweDA4OTcwMzQyIDB4NzdlOGU1OGYgMHg3ZDEwZDQ5NSAweDcxNTNkMzMzIDB4NmYwMzU2YTQgLy8gbWV0aG9kICJhZGRfYWRtaW4oYWRkcmVzcyx1aW50OCl2b2lkIiwgbWV0aG9kICJyZW1vdmVfYWRtaW4oYWRkcmVzcyl2b2lkIiwgbWV0aG9kICJyZWdpc3Rlcl91c2VyKHVpbnQ4LHN0cmluZyl1aW50MzIiLCBtZXRob2QgInJlZ2lzdGVyX3VzZXJzKGFkZHJlc3NbXSx1aW50OFtdLHN0cmluZ1tdLHBheSl1aW50MzIiLCBtZXRob2QgInJlZ2lzdGVyX3RlbXBsYXRlKHVpbnQ4LHVpbnQ2NCxzdHJpbmcsdWludDgpdm9pZCIsIG1ldGhvZCAiZ2V0X3VzZXIoYWRkcmVzcykodWludDMyLHVpbnQ4LHN0cmluZyx1aW50NjQpIiwgbWV0aG9kICJnZXRfdGVtcGxhdGUodWludDgpKHVpbnQ2NCxzdHJpbmcsdWludDgsdWludDgpIiwgbWV0aG9kICJnZXRfdXNlcnModWludDMyLHVpbnQzMikoYWRkcmVzcywodWludDMyLHVpbnQ4LHN0cmluZyx1aW50NjQpKVtdIiwgbWV0aG9kICJnZXRfdXNlcnNfYnlfcm9sZSh1aW50OCx1aW50MzIsdWludDMyKShhZGRyZXNzLCh1aW50MzIsdWludDgsc3RyaW5nLHVpbnQ2NCkpW10iLCBtZXRob2QgImdldF9tZW1iZXJfcm9vdHMoKWJ5dGVbXSIsIG1ldGhvZCAiZ2V0X3JvbGVfY291bnQodWludDgpdWludDMyIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggYWRkX2FkbWluIHJlbW92ZV9hZG1pbiByZWdpc3Rlcl91c2VyIHJlZ2lzdGVyX3VzZXJzIHJlZ2lzdGVyX3RlbXBsYXRlIGdldF91c2VyIGdldF90ZW1wbGF0ZSBnZXRfdXNlcnMgZ2V0X3VzZXJzX2J5X3JvbGUgZ2V0X21lbWJlcl9yb290cyBnZXRfcm9sZV9jb3VudAogICAgZXJyCgptYWluX2NyZWF0ZV9Ob09wQDE3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUxLTUzCiAgICAvLyAjIFRoZSBtZW1iZXIgcm9vdCBzbG90cyAoIm1yMCIgLi4gIm1yNyIpIGFyZSB3cml0dGVuIGJ5IGtleSwgc28gdGhlIHNjaGVtYQogICAgLy8gIyByZXNlcnZlcyB0aGVtIG9uIHRvcCBvZiBzdXBlcl9hZG1pbjogMSArIE1FTUJFUl9ST09UX1NMT1RTIGJ5dGVzIGdsb2JhbHMuCiAgICAvLyBjbGFzcyBCeEhpdmVSZWdpc3RyeShBUkM0Q29udHJhY3QsIHN0YXRlX3RvdGFscz1TdGF0ZVRvdGFscyhnbG9iYWxfYnl0ZXM9OSwgZ2xvYmFsX3VpbnRzPTEpKToKICAgIHB1c2hieXRlcyAweDRjNWM2MWJhIC8vIG1ldGhvZCAiY3JlYXRlKCl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggY3JlYXRlCiAgICBlcnIKCgovLyBfcHV5YV9saWIudXRpbC5lbnN1cmVfYnVkZ2V0KHJlcXVpcmVkX2J1ZGdldDogdWludDY0LCBmZWVfc291cmNlOiB1aW50NjQpIC0+IHZvaWQ6CmVuc3VyZV9idWRnZXQ6CiAgICBwcm90byAyIDAKICAgIGZyYW1lX2RpZyAtMgogICAgcHVzaGludCAxMCAvLyAxMAogICAgKwoKZW5zdXJlX2J1ZGdldF93aGlsZV90b3BAMToKICAgIGZyYW1lX2RpZyAwCiAgICBnbG9iYWwgT3Bjb2RlQnVkZ2V0CiAgICA+CiAgICBieiBlbnN1cmVfYnVkZ2V0X2FmdGVyX3doaWxlQDYKICAgIGl0eG5fYmVnaW4KICAgIHB1c2hpbnQgNiAvLyBhcHBsCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBwdXNoaW50IDUgLy8gRGVsZXRlQXBwbGljYXRpb24KICAgIGl0eG5fZmllbGQgT25Db21wbGV0aW9uCiAgICBieXRlYyA5IC8vIDB4MDY4MTAxCiAgICBpdHhuX2ZpZWxkIEFwcHJvdmFsUHJvZ3JhbQogICAgYnl0ZWMgOSAvLyAweDA2ODEwMQogICAgaXR4bl9maWVsZCBDbGVhclN0YXRlUHJvZ3JhbQogICAgZnJhbWVfZGlnIC0xCiAgICBzd2l0Y2ggZW5zdXJlX2J1ZGdldF9zd2l0Y2hfY2FzZV8wQDMgZW5zdXJlX2J1ZGdldF9zd2l0Y2hfY2FzZV8xQDQKCmVuc3VyZV9idWRnZXRfc3dpdGNoX2Nhc2VfbmV4dEA1OgogICAgaXR4bl9zdWJtaXQKICAgIGIgZW5zdXJlX2J1ZGdldF93aGlsZV90b3BAMQoKZW5zdXJlX2J1ZGdldF9zd2l0Y2hfY2FzZV8xQDQ6CiAgICBnbG9iYWwgTWluVHhuRmVlCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgYiBlbnN1cmVfYnVkZ2V0X3N3aXRjaF9jYXNlX25leHRANQoKZW5zdXJlX2J1ZGdldF9zd2l0Y2hfY2FzZV8wQDM6CiAgICBpbnRjXzEgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGIgZW5zdXJlX2J1ZGdldF9zd2l0Y2hfY2FzZV9uZXh0QDUKCmVuc3VyZV9idWRnZXRfYWZ0ZXJfd2hpbGVANjoKICAgIHJldHN1YgoKCi8vIF9wdXlhX2xpYi5hcmM0LmR5bmFtaWNfYXJyYXlfY29uY2F0X2R5bmFtaWNfZWxlbWVudChhcnJheV9pdGVtc19jb3VudDogdWludDY0LCBhcnJheV9oZWFkX2FuZF90YWlsOiBieXRlcywgbmV3X2l0ZW1zX2NvdW50OiB1aW50NjQsIG5ld19oZWFkX2FuZF90YWlsOiBieXRlcykgLT4gYnl0ZXM6CmR5bmFtaWNfYXJyYXlfY29uY2F0X2R5bmFtaWNfZWxlbWVudDoKICAgIHByb3RvIDQgMQogICAgYnl0ZWNfMiAvLyAiIgogICAgZHVwCiAgICBmcmFtZV9kaWcgLTIKICAgIGludGNfMyAvLyAyCiAgICAqCiAgICBmcmFtZV9kaWcgLTQKICAgIGludGNfMyAvLyAyCiAgICAqCiAgICBpbnRjXzEgLy8gMAoKZHluYW1pY19hcnJheV9jb25jYXRfZHluYW1pY19lbGVtZW50X2Zvcl9oZWFkZXJAMToKICAgIGZyYW1lX2RpZyA0CiAgICBmcmFtZV9kaWcgMwogICAgPAogICAgYnogZHluYW1pY19hcnJheV9jb25jYXRfZHluYW1pY19lbGVtZW50X2FmdGVyX2ZvckA0CiAgICBmcmFtZV9kaWcgLTMKICAgIGZyYW1lX2RpZyA0CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGV4dHJhY3RfdWludDE2CiAgICBmcmFtZV9kaWcgMgogICAgKwogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIGZyYW1lX2RpZyAxCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2J1cnkgMQogICAgaW50Y18zIC8vIDIKICAgICsKICAgIGZyYW1lX2J1cnkgNAogICAgYiBkeW5hbWljX2FycmF5X2NvbmNhdF9keW5hbWljX2VsZW1lbnRfZm9yX2hlYWRlckAxCgpkeW5hbWljX2FycmF5X2NvbmNhdF9keW5hbWljX2VsZW1lbnRfYWZ0ZXJfZm9yQDQ6CiAgICBmcmFtZV9kaWcgLTMKICAgIGxlbgogICAgZnJhbWVfYnVyeSAwCiAgICBpbnRjXzEgLy8gMAogICAgZnJhbWVfYnVyeSA0CgpkeW5hbWljX2FycmF5X2NvbmNhdF9keW5hbWljX2VsZW1lbnRfZm9yX2hlYWRlckA1OgogICAgZnJhbWVfZGlnIDQKICAgIGZyYW1lX2RpZyAyCiAgICA8CiAgICBieiBkeW5hbWljX2FycmF5X2NvbmNhdF9keW5hbWljX2VsZW1lbnRfYWZ0ZXJfZm9yQDgKICAgIGZyYW1lX2RpZyAtMQogICAgZnJhbWVfZGlnIDQKICAgIGR1cAogICAgY292ZXIgMgogICAgZXh0cmFjdF91aW50MTYKICAgIGZyYW1lX2RpZyAwCiAgICArCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgZnJhbWVfZGlnIDEKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfYnVyeSAxCiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgZnJhbWVfYnVyeSA0CiAgICBiIGR5bmFtaWNfYXJyYXlfY29uY2F0X2R5bmFtaWNfZWxlbWVudF9mb3JfaGVhZGVyQDUKCmR5bmFtaWNfYXJyYXlfY29uY2F0X2R5bmFtaWNfZWxlbWVudF9hZnRlcl9mb3JAODoKICAgIGZyYW1lX2RpZyAtNAogICAgZnJhbWVfZGlnIC0yCiAgICArCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgZnJhbWVfZGlnIDEKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC0zCiAgICBmcmFtZV9kaWcgMwogICAgZnJhbWVfZGlnIDAKICAgIHN1YnN0cmluZzMKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC0xCiAgICBsZW4KICAgIGZyYW1lX2RpZyAtMQogICAgZnJhbWVfZGlnIDIKICAgIHVuY292ZXIgMgogICAgc3Vic3RyaW5nMwogICAgY29uY2F0CiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5yZWdpc3RyeS5jb250cmFjdC5CeEhpdmVSZWdpc3RyeS5jcmVhdGVbcm91dGluZ10oKSAtPiB2b2lkOgpjcmVhdGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6NzAKICAgIC8vIHNlbGYuc3VwZXJfYWRtaW4udmFsdWUgPSBUeG4uc2VuZGVyCiAgICBieXRlY18zIC8vICJzdXBlcl9hZG1pbiIKICAgIHR4biBTZW5kZXIKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6NzEKICAgIC8vIHNlbGYudXNlcl9jb3VudC52YWx1ZSA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMCAvLyAidXNlcl9jb3VudCIKICAgIGludGNfMSAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY4CiAgICAvLyBAYXJjNC5hYmltZXRob2QoY3JlYXRlPSJyZXF1aXJlIikKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMucmVnaXN0cnkuY29udHJhY3QuQnhIaXZlUmVnaXN0cnkuYWRkX2FkbWluW3JvdXRpbmddKCkgLT4gdm9pZDoKYWRkX2FkbWluOgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjczCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIGludGNfMCAvLyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ4CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6NzUKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYuc3VwZXJfYWRtaW4udmFsdWUsICJOb3Qgc3VwZXIgYWRtaW4iCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzEgLy8gMAogICAgYnl0ZWNfMyAvLyAic3VwZXJfYWRtaW4iCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3VwZXJfYWRtaW4gZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIE5vdCBzdXBlciBhZG1pbgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc2CiAgICAvLyBzZWxmLmFkbWluc1thZGRyXSA9IHJvbGUKICAgIGJ5dGVjIDUgLy8gMHg2MTY0NmQ1ZgogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weTo3MwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnJlZ2lzdHJ5LmNvbnRyYWN0LkJ4SGl2ZVJlZ2lzdHJ5LnJlbW92ZV9hZG1pbltyb3V0aW5nXSgpIC0+IHZvaWQ6CnJlbW92ZV9hZG1pbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weTo3OAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weTo4MAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5zdXBlcl9hZG1pbi52YWx1ZSwgIk5vdCBzdXBlciBhZG1pbiIKICAgIHR4biBTZW5kZXIKICAgIGludGNfMSAvLyAwCiAgICBieXRlY18zIC8vICJzdXBlcl9hZG1pbiIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdXBlcl9hZG1pbiBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gTm90IHN1cGVyIGFkbWluCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6ODEKICAgIC8vIGFzc2VydCBhZGRyIGluIHNlbGYuYWRtaW5zLCAiQWRtaW4gbm90IGZvdW5kIgogICAgYnl0ZWMgNSAvLyAweDYxNjQ2ZDVmCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gQWRtaW4gbm90IGZvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6ODIKICAgIC8vIGRlbCBzZWxmLmFkbWluc1thZGRyXQogICAgYm94X2RlbAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6NzgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5yZWdpc3RyeS5jb250cmFjdC5CeEhpdmVSZWdpc3RyeS5yZWdpc3Rlcl91c2VyW3JvdXRpbmddKCkgLT4gdm9pZDoKcmVnaXN0ZXJfdXNlcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weTo4NAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18wIC8vIDEKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDgKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgaW50Y18xIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGludGNfMyAvLyAyCiAgICArCiAgICBkaWcgMQogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50OD4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weTo4NgogICAgLy8gdXNlcl9pZCA9IHNlbGYuX3JlZ2lzdGVyKFR4bi5zZW5kZXIsIHJvbGUsIG5hbWUpCiAgICB0eG4gU2VuZGVyCiAgICBkaWcgMgogICAgdW5jb3ZlciAyCiAgICBjYWxsc3ViIF9yZWdpc3RlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg3CiAgICAvLyBzZWxmLl91cGRhdGVfbWVtYmVyX3Jvb3QoKQogICAgY2FsbHN1YiBfdXBkYXRlX21lbWJlcl9yb290CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6ODgKICAgIC8vIGFyYzQuZW1pdChVc2VyUmVnaXN0ZXJlZCh1c2VyX2lkPXVzZXJfaWQsIGFkZHI9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLCByb2xlPXJvbGUpKQogICAgZHVwCiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBwdXNoYnl0ZXMgMHhmMjQ2NjNkZiAvLyBtZXRob2QgIlVzZXJSZWdpc3RlcmVkKHVpbnQzMixhZGRyZXNzLHVpbnQ4KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6ODQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5yZWdpc3RyeS5jb250cmFjdC5CeEhpdmVSZWdpc3RyeS5yZWdpc3Rlcl91c2Vyc1tyb3V0aW5nXSgpIC0+IHZvaWQ6CnJlZ2lzdGVyX3VzZXJzOgogICAgaW50Y18xIC8vIDAKICAgIGR1cG4gMgogICAgYnl0ZWNfMiAvLyAiIgogICAgZHVwbiAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6OTEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwbiAyCiAgICBpbnRjXzEgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpbnRjXzIgLy8gMzIKICAgICoKICAgIGludGNfMyAvLyAyCiAgICArCiAgICBzd2FwCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXBuIDIKICAgIGludGNfMSAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGludGNfMyAvLyAyCiAgICArCiAgICBzd2FwCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZHVwCiAgICBpbnRjXzEgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpbnRjXzMgLy8gMgogICAgKgogICAgc3dhcAogICAgZHVwCiAgICBsZW4KICAgIHN3YXAKICAgIGV4dHJhY3QgMiAwCiAgICBpbnRjXzEgLy8gMAoKcmVnaXN0ZXJfdXNlcnNfZm9yX2hlYWRlckAxOgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjkxCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGR1cAogICAgZGlnIDUKICAgIDwKICAgIGJ6IHJlZ2lzdGVyX3VzZXJzX2FmdGVyX2ZvckA0CiAgICBkdXBuIDIKICAgIGludGNfMyAvLyAyCiAgICAqCiAgICBkaWcgMwogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGVuY29kaW5nCiAgICBkdXAKICAgIGRpZyA3CiAgICBkdXAKICAgIGNvdmVyIDQKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCB0YWlsIHBvaW50ZXIgZm9yIChsZW4rKGxlbit1dGY4W10pW10pCiAgICBkaWcgMQogICAgbGVuCiAgICBzdWJzdHJpbmczCiAgICBpbnRjXzEgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgaW50Y18zIC8vIDIKICAgICsKICAgICsKICAgIGJ1cnkgNQogICAgaW50Y18wIC8vIDEKICAgICsKICAgIGJ1cnkgMQogICAgYiByZWdpc3Rlcl91c2Vyc19mb3JfaGVhZGVyQDEKCnJlZ2lzdGVyX3VzZXJzX2FmdGVyX2ZvckA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjkxCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGRpZyAzCiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgZGlnIDMKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50OD4+CiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18wIC8vIDEKICAgIC0KICAgIGR1cAogICAgYnVyeSAxMQogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMCAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToxMDYKICAgIC8vIGFzc2VydCBzZWxmLl9pc19vcGVyYXRvcihUeG4uc2VuZGVyKSwgIk5vdCBvcGVyYXRvciIKICAgIHR4biBTZW5kZXIKICAgIGR1cAogICAgYnVyeSAxNwogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE5MwogICAgLy8gaWYgYWRkciA9PSBzZWxmLnN1cGVyX2FkbWluLnZhbHVlOgogICAgaW50Y18xIC8vIDAKICAgIGJ5dGVjXzMgLy8gInN1cGVyX2FkbWluIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnN1cGVyX2FkbWluIGV4aXN0cwogICAgPT0KICAgIGJ6IHJlZ2lzdGVyX3VzZXJzX2FmdGVyX2lmX2Vsc2VAMTYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToxOTQKICAgIC8vIHJldHVybiBUcnVlCiAgICBpbnRjXzAgLy8gMQoKcmVnaXN0ZXJfdXNlcnNfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMucmVnaXN0cnkuY29udHJhY3QuQnhIaXZlUmVnaXN0cnkuX2lzX29wZXJhdG9yQDIxOgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwNgogICAgLy8gYXNzZXJ0IHNlbGYuX2lzX29wZXJhdG9yKFR4bi5zZW5kZXIpLCAiTm90IG9wZXJhdG9yIgogICAgYXNzZXJ0IC8vIE5vdCBvcGVyYXRvcgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwNwogICAgLy8gYXNzZXJ0IGFkZHJlc3Nlcy5sZW5ndGggPT0gcm9sZXMubGVuZ3RoLCAiTGVuZ3RoIG1pc21hdGNoIgogICAgZGlnIDcKICAgIGR1cAogICAgZGlnIDcKICAgID09CiAgICBhc3NlcnQgLy8gTGVuZ3RoIG1pc21hdGNoCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6MTA4CiAgICAvLyBhc3NlcnQgYWRkcmVzc2VzLmxlbmd0aCA9PSBuYW1lcy5sZW5ndGgsICJMZW5ndGggbWlzbWF0Y2giCiAgICBkaWcgNQogICAgPT0KICAgIGFzc2VydCAvLyBMZW5ndGggbWlzbWF0Y2gKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToxMDkKICAgIC8vIGFzc2VydCBtYnJfcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLCAiV3JvbmcgTUJSIHJlY2VpdmVyIgogICAgZGlnIDkKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBXcm9uZyBNQlIgcmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToxMTEKICAgIC8vIG1iciA9IFVJbnQ2NCgwKQogICAgaW50Y18xIC8vIDAKICAgIGJ1cnkgMTEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToxMTIKICAgIC8vIGZvciBpIGluIHVyYW5nZShuYW1lcy5sZW5ndGgpOgogICAgaW50Y18xIC8vIDAKICAgIGJ1cnkgMTIKCnJlZ2lzdGVyX3VzZXJzX2Zvcl9oZWFkZXJANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToxMTIKICAgIC8vIGZvciBpIGluIHVyYW5nZShuYW1lcy5sZW5ndGgpOgogICAgZGlnIDExCiAgICBkaWcgNQogICAgPAogICAgZHVwCiAgICBidXJ5IDE0CiAgICBieiByZWdpc3Rlcl91c2Vyc19hZnRlcl9mb3JAOQogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExMwogICAgLy8gbWJyICs9IFVJbnQ2NChVU0VSX01CUikgKyBVSW50NjQoVVNFUl9OQU1FX0JZVEVfTUJSKSAqIG5hbWVzW2ldLm5hdGl2ZS5ieXRlcy5sZW5ndGgKICAgIGRpZyAxMgogICAgYXNzZXJ0IC8vIGluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBkaWcgMTEKICAgIGR1cAogICAgaW50Y18zIC8vIDIKICAgICoKICAgIGRpZyAzCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgZXh0cmFjdF91aW50MTYKICAgIGR1cDIKICAgIGV4dHJhY3RfdWludDE2CiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgZXh0cmFjdDMKICAgIGV4dHJhY3QgMiAwCiAgICBsZW4KICAgIHB1c2hpbnQgNDAwIC8vIDQwMAogICAgKgogICAgcHVzaGludCA0OTUwMCAvLyA0OTUwMAogICAgKwogICAgZGlnIDEyCiAgICArCiAgICBidXJ5IDEyCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6MTEyCiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UobmFtZXMubGVuZ3RoKToKICAgIGludGNfMCAvLyAxCiAgICArCiAgICBidXJ5IDEyCiAgICBiIHJlZ2lzdGVyX3VzZXJzX2Zvcl9oZWFkZXJANgoKcmVnaXN0ZXJfdXNlcnNfYWZ0ZXJfZm9yQDk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6MTE0CiAgICAvLyBhc3NlcnQgbWJyX3BheW1lbnQuYW1vdW50ID49IG1iciwgIkluc3VmZmljaWVudCBNQlIiCiAgICBkaWcgOQogICAgZ3R4bnMgQW1vdW50CiAgICBkaWcgMTEKICAgID49CiAgICBhc3NlcnQgLy8gSW5zdWZmaWNpZW50IE1CUgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExNgogICAgLy8gZmlyc3RfdXNlcl9pZCA9IGFyYzQuVUludDMyKHNlbGYudXNlcl9jb3VudC52YWx1ZSkKICAgIGludGNfMSAvLyAwCiAgICBieXRlY18wIC8vICJ1c2VyX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnVzZXJfY291bnQgZXhpc3RzCiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDQgNAogICAgYnVyeSAxNAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExNwogICAgLy8gZm9yIGkgaW4gdXJhbmdlKGFkZHJlc3Nlcy5sZW5ndGgpOgogICAgaW50Y18xIC8vIDAKICAgIGJ1cnkgMTIKCnJlZ2lzdGVyX3VzZXJzX2Zvcl9oZWFkZXJAMTA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6MTE3CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoYWRkcmVzc2VzLmxlbmd0aCk6CiAgICBkaWcgMTEKICAgIGRpZyA4CiAgICA8CiAgICBieiByZWdpc3Rlcl91c2Vyc19hZnRlcl9mb3JAMTMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToxMTgKICAgIC8vIHNlbGYuX3JlZ2lzdGVyKEFjY291bnQoYWRkcmVzc2VzW2ldLmJ5dGVzKSwgcm9sZXNbaV0sIG5hbWVzW2ldKQogICAgZGlnIDgKICAgIGV4dHJhY3QgMiAwCiAgICBkaWcgMTIKICAgIGR1cAogICAgY292ZXIgMgogICAgaW50Y18yIC8vIDMyCiAgICAqCiAgICBpbnRjXzIgLy8gMzIKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBpbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBBZGRyZXNzIGxlbmd0aCBpcyAzMiBieXRlcwogICAgZGlnIDgKICAgIGV4dHJhY3QgMiAwCiAgICBkaWcgMgogICAgaW50Y18wIC8vIDEKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBpbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZGlnIDIKICAgIGRpZyA4CiAgICA8CiAgICBhc3NlcnQgLy8gaW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGRpZyAyCiAgICBpbnRjXzMgLy8gMgogICAgKgogICAgZGlnIDUKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBleHRyYWN0X3VpbnQxNgogICAgZHVwMgogICAgZXh0cmFjdF91aW50MTYKICAgIGludGNfMyAvLyAyCiAgICArCiAgICBleHRyYWN0MwogICAgY2FsbHN1YiBfcmVnaXN0ZXIKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExNwogICAgLy8gZm9yIGkgaW4gdXJhbmdlKGFkZHJlc3Nlcy5sZW5ndGgpOgogICAgaW50Y18wIC8vIDEKICAgICsKICAgIGJ1cnkgMTIKICAgIGIgcmVnaXN0ZXJfdXNlcnNfZm9yX2hlYWRlckAxMAoKcmVnaXN0ZXJfdXNlcnNfYWZ0ZXJfZm9yQDEzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExOQogICAgLy8gc2VsZi5fdXBkYXRlX21lbWJlcl9yb290KCkKICAgIGNhbGxzdWIgX3VwZGF0ZV9tZW1iZXJfcm9vdAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyMAogICAgLy8gYXJjNC5lbWl0KFVzZXJzUmVnaXN0ZXJlZChmaXJzdF91c2VyX2lkPWZpcnN0X3VzZXJfaWQsIGNvdW50PWFyYzQuVUludDMyKGFkZHJlc3Nlcy5sZW5ndGgpKSkKICAgIGRpZyA3CiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDQgNAogICAgZGlnIDE0CiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBwdXNoYnl0ZXMgMHhlZDZlMDYzZiAvLyBtZXRob2QgIlVzZXJzUmVnaXN0ZXJlZCh1aW50MzIsdWludDMyKSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6OTEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKcmVnaXN0ZXJfdXNlcnNfYWZ0ZXJfaWZfZWxzZUAxNjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToxOTUKICAgIC8vIHJldHVybiBhZGRyIGluIHNlbGYuYWRtaW5zIGFuZCBzZWxmLmFkbWluc1thZGRyXS5hc191aW50NjQoKSA+PSBVSW50NjQoQURNSU5fT1BFUkFUT1IpCiAgICBieXRlYyA1IC8vIDB4NjE2NDZkNWYKICAgIGRpZyAxNgogICAgY29uY2F0CiAgICBkdXAKICAgIGJ1cnkgMTYKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYnogcmVnaXN0ZXJfdXNlcnNfYm9vbF9mYWxzZUAxOQogICAgZGlnIDE0CiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hZG1pbnMgZW50cnkgZXhpc3RzCiAgICBidG9pCiAgICBieiByZWdpc3Rlcl91c2Vyc19ib29sX2ZhbHNlQDE5CiAgICBpbnRjXzAgLy8gMQogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwNgogICAgLy8gYXNzZXJ0IHNlbGYuX2lzX29wZXJhdG9yKFR4bi5zZW5kZXIpLCAiTm90IG9wZXJhdG9yIgogICAgYiByZWdpc3Rlcl91c2Vyc19hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5yZWdpc3RyeS5jb250cmFjdC5CeEhpdmVSZWdpc3RyeS5faXNfb3BlcmF0b3JAMjEKCnJlZ2lzdGVyX3VzZXJzX2Jvb2xfZmFsc2VAMTk6CiAgICBpbnRjXzEgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwNgogICAgLy8gYXNzZXJ0IHNlbGYuX2lzX29wZXJhdG9yKFR4bi5zZW5kZXIpLCAiTm90IG9wZXJhdG9yIgogICAgYiByZWdpc3Rlcl91c2Vyc19hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5yZWdpc3RyeS5jb250cmFjdC5CeEhpdmVSZWdpc3RyeS5faXNfb3BlcmF0b3JAMjEKCgovLyBzbWFydF9jb250cmFjdHMucmVnaXN0cnkuY29udHJhY3QuQnhIaXZlUmVnaXN0cnkucmVnaXN0ZXJfdGVtcGxhdGVbcm91dGluZ10oKSAtPiB2b2lkOgpyZWdpc3Rlcl90ZW1wbGF0ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToxOTcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMCAvLyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ4CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCA4IC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBkdXAKICAgIGludGNfMSAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgZGlnIDEKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA0CiAgICBkdXAKICAgIGxlbgogICAgaW50Y18wIC8vIDEKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToyMDUKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYuc3VwZXJfYWRtaW4udmFsdWUsICJOb3Qgc3VwZXIgYWRtaW4iCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzEgLy8gMAogICAgYnl0ZWNfMyAvLyAic3VwZXJfYWRtaW4iCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3VwZXJfYWRtaW4gZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIE5vdCBzdXBlciBhZG1pbgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwNi0yMTEKICAgIC8vIHRlbXBsYXRlID0gRXhwZXJpbWVudFRlbXBsYXRlSW5mbygKICAgIC8vICAgICBhcHBfaWQ9YXBwX2lkLAogICAgLy8gICAgIG5hbWU9bmFtZSwKICAgIC8vICAgICBwbGF5ZXJfY291bnQ9cGxheWVyX2NvdW50LAogICAgLy8gICAgIGVuYWJsZWQ9YXJjNC5VSW50OCgxKSwKICAgIC8vICkKICAgIHVuY292ZXIgMgogICAgcHVzaGJ5dGVzIDB4MDAwYwogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToyMTAKICAgIC8vIGVuYWJsZWQ9YXJjNC5VSW50OCgxKSwKICAgIHB1c2hieXRlcyAweDAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6MjA2LTIxMQogICAgLy8gdGVtcGxhdGUgPSBFeHBlcmltZW50VGVtcGxhdGVJbmZvKAogICAgLy8gICAgIGFwcF9pZD1hcHBfaWQsCiAgICAvLyAgICAgbmFtZT1uYW1lLAogICAgLy8gICAgIHBsYXllcl9jb3VudD1wbGF5ZXJfY291bnQsCiAgICAvLyAgICAgZW5hYmxlZD1hcmM0LlVJbnQ4KDEpLAogICAgLy8gKQogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToyMTIKICAgIC8vIHNlbGYuZXhwZXJpbWVudF90ZW1wbGF0ZXNbdGVtcGxhdGVfaWRdID0gdGVtcGxhdGUKICAgIGJ5dGVjIDEwIC8vIDB4NzQ1ZgogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2RlbAogICAgcG9wCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6MTk3CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMucmVnaXN0cnkuY29udHJhY3QuQnhIaXZlUmVnaXN0cnkuZ2V0X3VzZXJbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfdXNlcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToyMTQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6MjE2CiAgICAvLyBhc3NlcnQgYWRkciBpbiBzZWxmLnVzZXJzLCAiVXNlciBub3QgZm91bmQiCiAgICBieXRlYyA2IC8vIDB4NzU1ZgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIFVzZXIgbm90IGZvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6MjE3CiAgICAvLyByZXR1cm4gc2VsZi51c2Vyc1thZGRyXQogICAgYm94X2dldAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6MjE0CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzEgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMucmVnaXN0cnkuY29udHJhY3QuQnhIaXZlUmVnaXN0cnkuZ2V0X3RlbXBsYXRlW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X3RlbXBsYXRlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIxOQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18wIC8vIDEKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToyMjEKICAgIC8vIGFzc2VydCB0ZW1wbGF0ZV9pZCBpbiBzZWxmLmV4cGVyaW1lbnRfdGVtcGxhdGVzLCAiVGVtcGxhdGUgbm90IGZvdW5kIgogICAgYnl0ZWMgMTAgLy8gMHg3NDVmCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gVGVtcGxhdGUgbm90IGZvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6MjIyCiAgICAvLyByZXR1cm4gc2VsZi5leHBlcmltZW50X3RlbXBsYXRlc1t0ZW1wbGF0ZV9pZF0KICAgIGJveF9nZXQKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIxOQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlY18xIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnJlZ2lzdHJ5LmNvbnRyYWN0LkJ4SGl2ZVJlZ2lzdHJ5LmdldF91c2Vyc1tyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF91c2VyczoKICAgIGludGNfMSAvLyAwCiAgICBkdXAKICAgIGJ5dGVjXzIgLy8gIiIKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIyNAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCA0IC8vIDQKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDMyCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCA0IC8vIDQKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDMyCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6MjMzCiAgICAvLyBlbmQgPSBzdGFydC5hc191aW50NjQoKSArIGNvdW50LmFzX3VpbnQ2NCgpCiAgICBzd2FwCiAgICBidG9pCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgYnRvaQogICAgKwogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6MjM0CiAgICAvLyBpZiBlbmQgPiBzZWxmLnVzZXJfY291bnQudmFsdWU6CiAgICBpbnRjXzEgLy8gMAogICAgYnl0ZWNfMCAvLyAidXNlcl9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi51c2VyX2NvdW50IGV4aXN0cwogICAgPgogICAgYnogZ2V0X3VzZXJzX2FmdGVyX2lmX2Vsc2VAMwogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIzNQogICAgLy8gZW5kID0gc2VsZi51c2VyX2NvdW50LnZhbHVlCiAgICBpbnRjXzEgLy8gMAogICAgYnl0ZWNfMCAvLyAidXNlcl9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBzd2FwCiAgICBidXJ5IDIKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnVzZXJfY291bnQgZXhpc3RzCgpnZXRfdXNlcnNfYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIzNwogICAgLy8gcGFnZSA9IGFyYzQuRHluYW1pY0FycmF5W2FyYzQuVHVwbGVbYXJjNC5BZGRyZXNzLCBVc2VyXV0oKQogICAgYnl0ZWMgMTEgLy8gMHgwMDAwCiAgICBidXJ5IDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToyMzgKICAgIC8vIHNpemUgPSBVSW50NjQoMikgICMgYXJyYXkgbGVuZ3RoIHByZWZpeAogICAgaW50Y18zIC8vIDIKICAgIGJ1cnkgNAogICAgZGlnIDEKICAgIGJ1cnkgMwoKZ2V0X3VzZXJzX2Zvcl9oZWFkZXJANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToyMzkKICAgIC8vIGZvciB1c2VyX2lkIGluIHVyYW5nZShzdGFydC5hc191aW50NjQoKSwgZW5kKToKICAgIGRpZyAyCiAgICBkaWcgMQogICAgPAogICAgYnogZ2V0X3VzZXJzX2FmdGVyX2ZvckA5CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6MjQwCiAgICAvLyBlbnRyeSA9IHNlbGYuX3VzZXJfZW50cnkoc2VsZi51c2VyX2lkc1thcmM0LlVJbnQzMih1c2VyX2lkKV0pCiAgICBkaWcgMgogICAgaXRvYgogICAgZHVwCiAgICBiaXRsZW4KICAgIGludGNfMiAvLyAzMgogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZXh0cmFjdCA0IDQKICAgIGJ5dGVjIDcgLy8gMHg3NTY5NWYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudXNlcl9pZHMgZW50cnkgZXhpc3RzCiAgICBjYWxsc3ViIF91c2VyX2VudHJ5CiAgICBkdXAKICAgIGJ1cnkgNwogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI0MQogICAgLy8gc2l6ZSArPSBlbnRyeS5ieXRlcy5sZW5ndGggKyBVSW50NjQoMikgICMgZWxlbWVudCArIGl0cyBoZWFkIG9mZnNldAogICAgbGVuCiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgZGlnIDQKICAgICsKICAgIGR1cAogICAgYnVyeSA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6MjQyCiAgICAvLyBpZiBzaXplID4gVUludDY0KF9SRVRVUk5fUEFHRV9CWVRFUyk6CiAgICBwdXNoaW50IDEwMjAgLy8gMTAyMAogICAgPgogICAgYm56IGdldF91c2Vyc19hZnRlcl9mb3JAOQogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI0NAogICAgLy8gcGFnZS5hcHBlbmQoZW50cnkuY29weSgpKQogICAgZGlnIDQKICAgIGR1cAogICAgaW50Y18xIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBzd2FwCiAgICBleHRyYWN0IDIgMAogICAgYnl0ZWMgMTIgLy8gMHgwMDAyCiAgICBkaWcgOAogICAgY29uY2F0CiAgICBjb3ZlciAyCiAgICBpbnRjXzAgLy8gMQogICAgdW5jb3ZlciAzCiAgICBjYWxsc3ViIGR5bmFtaWNfYXJyYXlfY29uY2F0X2R5bmFtaWNfZWxlbWVudAogICAgYnVyeSA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6MjM5CiAgICAvLyBmb3IgdXNlcl9pZCBpbiB1cmFuZ2Uoc3RhcnQuYXNfdWludDY0KCksIGVuZCk6CiAgICBkaWcgMgogICAgaW50Y18wIC8vIDEKICAgICsKICAgIGJ1cnkgMwogICAgYiBnZXRfdXNlcnNfZm9yX2hlYWRlckA0CgpnZXRfdXNlcnNfYWZ0ZXJfZm9yQDk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6MjI0CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzEgLy8gMHgxNTFmN2M3NQogICAgZGlnIDUKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnJlZ2lzdHJ5LmNvbnRyYWN0LkJ4SGl2ZVJlZ2lzdHJ5LmdldF91c2Vyc19ieV9yb2xlW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X3VzZXJzX2J5X3JvbGU6CiAgICBpbnRjXzEgLy8gMAogICAgYnl0ZWNfMiAvLyAiIgogICAgZHVwbiAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6MjQ3CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cG4gMgogICAgbGVuCiAgICBpbnRjXzAgLy8gMQogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50OAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBsZW4KICAgIHB1c2hpbnQgNCAvLyA0CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQzMgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZHVwCiAgICBjb3ZlciAyCiAgICBsZW4KICAgIHB1c2hpbnQgNCAvLyA0CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQzMgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI1MgogICAgLy8gcGFnZSA9IGFyYzQuRHluYW1pY0FycmF5W2FyYzQuVHVwbGVbYXJjNC5BZGRyZXNzLCBVc2VyXV0oKQogICAgYnl0ZWMgMTEgLy8gMHgwMDAwCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6MjUzCiAgICAvLyBpZiByb2xlIG5vdCBpbiBzZWxmLnJvbGVfY291bnRzOgogICAgYnl0ZWMgOCAvLyAweDcyNjM1ZgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYm56IGdldF91c2Vyc19ieV9yb2xlX2FmdGVyX2lmX2Vsc2VAMwogICAgZGlnIDEKCmdldF91c2Vyc19ieV9yb2xlX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLnJlZ2lzdHJ5LmNvbnRyYWN0LkJ4SGl2ZVJlZ2lzdHJ5LmdldF91c2Vyc19ieV9yb2xlQDEyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI0NwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlY18xIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgpnZXRfdXNlcnNfYnlfcm9sZV9hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6MjU1CiAgICAvLyBlbmQgPSBzdGFydC5hc191aW50NjQoKSArIGNvdW50LmFzX3VpbnQ2NCgpCiAgICBkaWcgMwogICAgYnRvaQogICAgZHVwCiAgICBidXJ5IDcKICAgIGRpZyAzCiAgICBidG9pCiAgICArCiAgICBkdXAKICAgIGJ1cnkgMTAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToyNTYKICAgIC8vIGlmIGVuZCA+IHNlbGYucm9sZV9jb3VudHNbcm9sZV0uYXNfdWludDY0KCk6CiAgICBkaWcgMQogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucm9sZV9jb3VudHMgZW50cnkgZXhpc3RzCiAgICBidG9pCiAgICA+CiAgICBieiBnZXRfdXNlcnNfYnlfcm9sZV9hZnRlcl9pZl9lbHNlQDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToyNTcKICAgIC8vIGVuZCA9IHNlbGYucm9sZV9jb3VudHNbcm9sZV0uYXNfdWludDY0KCkKICAgIGR1cAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucm9sZV9jb3VudHMgZW50cnkgZXhpc3RzCiAgICBidG9pCiAgICBidXJ5IDkKCmdldF91c2Vyc19ieV9yb2xlX2FmdGVyX2lmX2Vsc2VANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToyNTkKICAgIC8vIHNpemUgPSBVSW50NjQoMikgICMgYXJyYXkgbGVuZ3RoIHByZWZpeAogICAgaW50Y18zIC8vIDIKICAgIGJ1cnkgNwogICAgZGlnIDUKICAgIGJ1cnkgOAoKZ2V0X3VzZXJzX2J5X3JvbGVfZm9yX2hlYWRlckA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI2MAogICAgLy8gZm9yIHBvc2l0aW9uIGluIHVyYW5nZShzdGFydC5hc191aW50NjQoKSwgZW5kKToKICAgIGRpZyA3CiAgICBkaWcgOQogICAgPAogICAgYnogZ2V0X3VzZXJzX2J5X3JvbGVfYWZ0ZXJfZm9yQDExCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6MjYxCiAgICAvLyB1c2VyX2lkID0gc2VsZi5yb2xlX2luZGV4W2FyYzQuVUludDY0KChyb2xlLmFzX3VpbnQ2NCgpIDw8IFVJbnQ2NCgzMikpICsgcG9zaXRpb24pXQogICAgZGlnIDQKICAgIGJ0b2kKICAgIGludGNfMiAvLyAzMgogICAgc2hsCiAgICBkaWcgOAogICAgKwogICAgaXRvYgogICAgYnl0ZWMgMTMgLy8gMHg3MjY5NWYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucm9sZV9pbmRleCBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToyNjIKICAgIC8vIGVudHJ5ID0gc2VsZi5fdXNlcl9lbnRyeShzZWxmLnVzZXJfaWRzW3VzZXJfaWRdKQogICAgYnl0ZWMgNyAvLyAweDc1Njk1ZgogICAgc3dhcAogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi51c2VyX2lkcyBlbnRyeSBleGlzdHMKICAgIGNhbGxzdWIgX3VzZXJfZW50cnkKICAgIGR1cAogICAgYnVyeSAxMQogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI2MwogICAgLy8gc2l6ZSArPSBlbnRyeS5ieXRlcy5sZW5ndGggKyBVSW50NjQoMikgICMgZWxlbWVudCArIGl0cyBoZWFkIG9mZnNldAogICAgbGVuCiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgZGlnIDcKICAgICsKICAgIGR1cAogICAgYnVyeSA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6MjY0CiAgICAvLyBpZiBzaXplID4gVUludDY0KF9SRVRVUk5fUEFHRV9CWVRFUyk6CiAgICBwdXNoaW50IDEwMjAgLy8gMTAyMAogICAgPgogICAgYm56IGdldF91c2Vyc19ieV9yb2xlX2FmdGVyX2ZvckAxMQogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI2NgogICAgLy8gcGFnZS5hcHBlbmQoZW50cnkuY29weSgpKQogICAgZGlnIDEKICAgIGR1cAogICAgaW50Y18xIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBzd2FwCiAgICBleHRyYWN0IDIgMAogICAgYnl0ZWMgMTIgLy8gMHgwMDAyCiAgICBkaWcgMTIKICAgIGNvbmNhdAogICAgY292ZXIgMgogICAgaW50Y18wIC8vIDEKICAgIHVuY292ZXIgMwogICAgY2FsbHN1YiBkeW5hbWljX2FycmF5X2NvbmNhdF9keW5hbWljX2VsZW1lbnQKICAgIGJ1cnkgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI2MAogICAgLy8gZm9yIHBvc2l0aW9uIGluIHVyYW5nZShzdGFydC5hc191aW50NjQoKSwgZW5kKToKICAgIGRpZyA3CiAgICBpbnRjXzAgLy8gMQogICAgKwogICAgYnVyeSA4CiAgICBiIGdldF91c2Vyc19ieV9yb2xlX2Zvcl9oZWFkZXJANgoKZ2V0X3VzZXJzX2J5X3JvbGVfYWZ0ZXJfZm9yQDExOgogICAgZGlnIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToyNDcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYiBnZXRfdXNlcnNfYnlfcm9sZV9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5yZWdpc3RyeS5jb250cmFjdC5CeEhpdmVSZWdpc3RyeS5nZXRfdXNlcnNfYnlfcm9sZUAxMgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5yZWdpc3RyeS5jb250cmFjdC5CeEhpdmVSZWdpc3RyeS5nZXRfbWVtYmVyX3Jvb3RzW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X21lbWJlcl9yb290czoKICAgIGludGNfMSAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6MjcyCiAgICAvLyByb290cyA9IEJ5dGVzKCkKICAgIGJ5dGVjXzIgLy8gMHgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToyNzMKICAgIC8vIGZvciBzbG90IGluIHVyYW5nZShNRU1CRVJfUk9PVF9TTE9UUyk6CiAgICBpbnRjXzEgLy8gMAoKZ2V0X21lbWJlcl9yb290c19mb3JfaGVhZGVyQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6MjczCiAgICAvLyBmb3Igc2xvdCBpbiB1cmFuZ2UoTUVNQkVSX1JPT1RfU0xPVFMpOgogICAgZHVwCiAgICBwdXNoaW50IDggLy8gOAogICAgPAogICAgYnogZ2V0X21lbWJlcl9yb290c19hZnRlcl9mb3JANwogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI3NAogICAgLy8gc2xvdF9yb290cywgZXhpc3RzID0gb3AuQXBwR2xvYmFsLmdldF9leF9ieXRlcyhHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9pZCwgbWVtYmVyX3Jvb3RzX2tleShzbG90KSkKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25JRAogICAgLy8gc21hcnRfY29udHJhY3RzL3NoYXJlZC9tZW1iZXJzaGlwLnB5OjQyCiAgICAvLyByZXR1cm4gQnl0ZXMoYiJtciIpICsgb3AuZXh0cmFjdChCeXRlcyhiIjAxMjM0NTY3IiksIHNsb3QsIDEpCiAgICBieXRlYyAxNCAvLyAweDMwMzEzMjMzMzQzNTM2MzcKICAgIGRpZyAyCiAgICBpbnRjXzAgLy8gMQogICAgZXh0cmFjdDMKICAgIGJ5dGVjIDE1IC8vIDB4NmQ3MgogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6Mjc0CiAgICAvLyBzbG90X3Jvb3RzLCBleGlzdHMgPSBvcC5BcHBHbG9iYWwuZ2V0X2V4X2J5dGVzKEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2lkLCBtZW1iZXJfcm9vdHNfa2V5KHNsb3QpKQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIHN3YXAKICAgIGJ1cnkgNAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI3NQogICAgLy8gaWYgbm90IGV4aXN0czoKICAgIGJ6IGdldF9tZW1iZXJfcm9vdHNfYWZ0ZXJfZm9yQDcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToyNzcKICAgIC8vIHJvb3RzICs9IHNsb3Rfcm9vdHMKICAgIGRpZyAxCiAgICBkaWcgMwogICAgY29uY2F0CiAgICBidXJ5IDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToyNzMKICAgIC8vIGZvciBzbG90IGluIHVyYW5nZShNRU1CRVJfUk9PVF9TTE9UUyk6CiAgICBkdXAKICAgIGludGNfMCAvLyAxCiAgICArCiAgICBidXJ5IDEKICAgIGIgZ2V0X21lbWJlcl9yb290c19mb3JfaGVhZGVyQDIKCmdldF9tZW1iZXJfcm9vdHNfYWZ0ZXJfZm9yQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6MjY5CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGRpZyAxCiAgICBkdXAKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5yZWdpc3RyeS5jb250cmFjdC5CeEhpdmVSZWdpc3RyeS5nZXRfcm9sZV9jb3VudFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9yb2xlX2NvdW50OgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI4MAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18wIC8vIDEKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToyODIKICAgIC8vIGlmIHJvbGUgaW4gc2VsZi5yb2xlX2NvdW50czoKICAgIGJ5dGVjIDggLy8gMHg3MjYzNWYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGJ6IGdldF9yb2xlX2NvdW50X2FmdGVyX2lmX2Vsc2VAMwogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI4MwogICAgLy8gcmV0dXJuIHNlbGYucm9sZV9jb3VudHNbcm9sZV0KICAgIGR1cAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucm9sZV9jb3VudHMgZW50cnkgZXhpc3RzCgpnZXRfcm9sZV9jb3VudF9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5yZWdpc3RyeS5jb250cmFjdC5CeEhpdmVSZWdpc3RyeS5nZXRfcm9sZV9jb3VudEA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI4MAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlY18xIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgpnZXRfcm9sZV9jb3VudF9hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6Mjg0CiAgICAvLyByZXR1cm4gYXJjNC5VSW50MzIoMCkKICAgIHB1c2hieXRlcyAweDAwMDAwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6MjgwCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGIgZ2V0X3JvbGVfY291bnRfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMucmVnaXN0cnkuY29udHJhY3QuQnhIaXZlUmVnaXN0cnkuZ2V0X3JvbGVfY291bnRANAoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5yZWdpc3RyeS5jb250cmFjdC5CeEhpdmVSZWdpc3RyeS5fcmVnaXN0ZXIoYWRkcjogYnl0ZXMsIHJvbGU6IGJ5dGVzLCBuYW1lOiBieXRlcykgLT4gYnl0ZXM6Cl9yZWdpc3RlcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToxMjMtMTI0CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9yZWdpc3RlcihzZWxmLCBhZGRyOiBBY2NvdW50LCByb2xlOiBhcmM0LlVJbnQ4LCBuYW1lOiBhcmM0LlN0cmluZykgLT4gYXJjNC5VSW50MzI6CiAgICBwcm90byAzIDEKICAgIGludGNfMSAvLyAwCiAgICBkdXBuIDIKICAgIGJ5dGVjXzIgLy8gIiIKICAgIGR1cG4gMgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyNQogICAgLy8gYXNzZXJ0IGFkZHIgbm90IGluIHNlbGYudXNlcnMsICJBbHJlYWR5IHJlZ2lzdGVyZWQiCiAgICBieXRlYyA2IC8vIDB4NzU1ZgogICAgZnJhbWVfZGlnIC0zCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICAhCiAgICBhc3NlcnQgLy8gQWxyZWFkeSByZWdpc3RlcmVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6MTI2CiAgICAvLyBhc3NlcnQgc2VsZi51c2VyX2NvdW50LnZhbHVlIDwgVUludDY0KE1FTUJFUl9UUkVFX1NJWkUpLCAiUmVnaXN0cnkgZnVsbCIKICAgIGludGNfMSAvLyAwCiAgICBieXRlY18wIC8vICJ1c2VyX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIHN3YXAKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi51c2VyX2NvdW50IGV4aXN0cwogICAgcHVzaGludCAxMDQ4NTc2IC8vIDEwNDg1NzYKICAgIDwKICAgIGFzc2VydCAvLyBSZWdpc3RyeSBmdWxsCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6MTUwCiAgICAvLyBpZiBub3Qgc2VsZi5tZW1iZXJfYnJhbmNoOgogICAgYnl0ZWMgNCAvLyAweDZkNmIKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYm56IF9yZWdpc3Rlcl9hZnRlcl9pZl9lbHNlQDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToxNTEKICAgIC8vIHNlbGYubWVtYmVyX2JyYW5jaC5jcmVhdGUoc2l6ZT1VSW50NjQoTUVNQkVSX1BST09GX0JZVEVTKSkKICAgIGJ5dGVjIDQgLy8gMHg2ZDZiCiAgICBwdXNoaW50IDY0MCAvLyA2NDAKICAgIGJveF9jcmVhdGUKICAgIHBvcAoKX3JlZ2lzdGVyX2FmdGVyX2lmX2Vsc2VANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToxNTIKICAgIC8vIG5vZGUgPSBvcC5zaGEyNTYoYWRkci5ieXRlcykKICAgIGZyYW1lX2RpZyAtMwogICAgc2hhMjU2CiAgICBmcmFtZV9idXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToxNTMKICAgIC8vIHNpemUgPSBpbmRleCArIFVJbnQ2NCgxKQogICAgZnJhbWVfZGlnIDcKICAgIGludGNfMCAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToxNTQKICAgIC8vIGZvciBsZXZlbCBpbiB1cmFuZ2UoTUVNQkVSX1RSRUVfREVQVEgpOgogICAgaW50Y18xIC8vIDAKICAgIGZyYW1lX2J1cnkgMwoKX3JlZ2lzdGVyX2Zvcl9oZWFkZXJANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToxNTQKICAgIC8vIGZvciBsZXZlbCBpbiB1cmFuZ2UoTUVNQkVSX1RSRUVfREVQVEgpOgogICAgZnJhbWVfZGlnIDMKICAgIHB1c2hpbnQgMjAgLy8gMjAKICAgIDwKICAgIGJ6IF9yZWdpc3Rlcl9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5yZWdpc3RyeS5jb250cmFjdC5CeEhpdmVSZWdpc3RyeS5faW5zZXJ0X21lbWJlckAxMgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1NQogICAgLy8gaWYgc2l6ZSAmIFVJbnQ2NCgxKToKICAgIGZyYW1lX2RpZyA1CiAgICBpbnRjXzAgLy8gMQogICAgJgogICAgYnogX3JlZ2lzdGVyX2FmdGVyX2lmX2Vsc2VAOQogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1NgogICAgLy8gc2VsZi5tZW1iZXJfYnJhbmNoLnJlcGxhY2UobGV2ZWwgKiBVSW50NjQoMzIpLCBub2RlKQogICAgZnJhbWVfZGlnIDMKICAgIGludGNfMiAvLyAzMgogICAgKgogICAgYnl0ZWMgNCAvLyAweDZkNmIKICAgIHN3YXAKICAgIGZyYW1lX2RpZyAxCiAgICBib3hfcmVwbGFjZQoKX3JlZ2lzdGVyX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLnJlZ2lzdHJ5LmNvbnRyYWN0LkJ4SGl2ZVJlZ2lzdHJ5Ll9pbnNlcnRfbWVtYmVyQDEyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyOAogICAgLy8gdXNlcl9pZCA9IGFyYzQuVUludDMyKHNlbGYudXNlcl9jb3VudC52YWx1ZSkKICAgIGludGNfMSAvLyAwCiAgICBieXRlY18wIC8vICJ1c2VyX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnVzZXJfY291bnQgZXhpc3RzCiAgICBkdXAKICAgIGl0b2IKICAgIGR1cAogICAgYml0bGVuCiAgICBpbnRjXzIgLy8gMzIKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGV4dHJhY3QgNCA0CiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyOQogICAgLy8gc2VsZi51c2VyX2NvdW50LnZhbHVlICs9IFVJbnQ2NCgxKQogICAgc3dhcAogICAgaW50Y18wIC8vIDEKICAgICsKICAgIGJ5dGVjXzAgLy8gInVzZXJfY291bnQiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzNAogICAgLy8gY3JlYXRlZF9hdD1hcmM0LlVJbnQ2NChHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCksCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6MTMwLTEzNQogICAgLy8gdXNlciA9IFVzZXIoCiAgICAvLyAgICAgdXNlcl9pZD11c2VyX2lkLAogICAgLy8gICAgIHJvbGU9cm9sZSwKICAgIC8vICAgICBuYW1lPW5hbWUsCiAgICAvLyAgICAgY3JlYXRlZF9hdD1hcmM0LlVJbnQ2NChHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCksCiAgICAvLyApCiAgICBkaWcgMQogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIHB1c2hieXRlcyAweDAwMGYKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzNgogICAgLy8gc2VsZi51c2Vyc1thZGRyXSA9IHVzZXIKICAgIGZyYW1lX2RpZyA2CiAgICBkdXAKICAgIGJveF9kZWwKICAgIHBvcAogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzNwogICAgLy8gc2VsZi51c2VyX2lkc1t1c2VyX2lkXSA9IGFyYzQuQWRkcmVzcyhhZGRyKQogICAgYnl0ZWMgNyAvLyAweDc1Njk1ZgogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTMKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToxMzkKICAgIC8vIHBvc2l0aW9uID0gVUludDY0KDApCiAgICBpbnRjXzEgLy8gMAogICAgZnJhbWVfYnVyeSA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6MTQwCiAgICAvLyBpZiByb2xlIGluIHNlbGYucm9sZV9jb3VudHM6CiAgICBieXRlYyA4IC8vIDB4NzI2MzVmCiAgICBmcmFtZV9kaWcgLTIKICAgIGNvbmNhdAogICAgZHVwCiAgICBmcmFtZV9idXJ5IDAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYnogX3JlZ2lzdGVyX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0MQogICAgLy8gcG9zaXRpb24gPSBzZWxmLnJvbGVfY291bnRzW3JvbGVdLmFzX3VpbnQ2NCgpCiAgICBmcmFtZV9kaWcgMAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucm9sZV9jb3VudHMgZW50cnkgZXhpc3RzCiAgICBidG9pCiAgICBmcmFtZV9idXJ5IDQKCl9yZWdpc3Rlcl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6MTQyCiAgICAvLyBzZWxmLnJvbGVfaW5kZXhbYXJjNC5VSW50NjQoKHJvbGUuYXNfdWludDY0KCkgPDwgVUludDY0KDMyKSkgKyBwb3NpdGlvbildID0gdXNlcl9pZAogICAgZnJhbWVfZGlnIC0yCiAgICBidG9pCiAgICBpbnRjXzIgLy8gMzIKICAgIHNobAogICAgZnJhbWVfZGlnIDQKICAgIGR1cAogICAgY292ZXIgMgogICAgKwogICAgaXRvYgogICAgYnl0ZWMgMTMgLy8gMHg3MjY5NWYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIDIKICAgIGR1cAogICAgY292ZXIgMwogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0MwogICAgLy8gc2VsZi5yb2xlX2NvdW50c1tyb2xlXSA9IGFyYzQuVUludDMyKHBvc2l0aW9uICsgVUludDY0KDEpKQogICAgaW50Y18wIC8vIDEKICAgICsKICAgIGl0b2IKICAgIGR1cAogICAgYml0bGVuCiAgICBpbnRjXzIgLy8gMzIKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGV4dHJhY3QgNCA0CiAgICBmcmFtZV9kaWcgMAogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0NAogICAgLy8gcmV0dXJuIHVzZXJfaWQKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgpfcmVnaXN0ZXJfYWZ0ZXJfaWZfZWxzZUA5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1OAogICAgLy8gZW5zdXJlX2J1ZGdldChVSW50NjQoX01FTUJFUl9MRVZFTF9CVURHRVQpLCBPcFVwRmVlU291cmNlLkdyb3VwQ3JlZGl0KQogICAgcHVzaGludCA2MCAvLyA2MAogICAgaW50Y18xIC8vIDAKICAgIGNhbGxzdWIgZW5zdXJlX2J1ZGdldAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1OQogICAgLy8gbm9kZSA9IG9wLnNoYTI1NihzZWxmLm1lbWJlcl9icmFuY2guZXh0cmFjdChsZXZlbCAqIFVJbnQ2NCgzMiksIFVJbnQ2NCgzMikpICsgbm9kZSkKICAgIGZyYW1lX2RpZyAzCiAgICBkdXAKICAgIGludGNfMiAvLyAzMgogICAgKgogICAgYnl0ZWMgNCAvLyAweDZkNmIKICAgIHN3YXAKICAgIGludGNfMiAvLyAzMgogICAgYm94X2V4dHJhY3QKICAgIGZyYW1lX2RpZyAxCiAgICBjb25jYXQKICAgIHNoYTI1NgogICAgZnJhbWVfYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6MTYwCiAgICAvLyBzaXplID0gc2l6ZSA+PiBVSW50NjQoMSkKICAgIGZyYW1lX2RpZyA1CiAgICBpbnRjXzAgLy8gMQogICAgc2hyCiAgICBmcmFtZV9idXJ5IDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToxNTQKICAgIC8vIGZvciBsZXZlbCBpbiB1cmFuZ2UoTUVNQkVSX1RSRUVfREVQVEgpOgogICAgaW50Y18wIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMwogICAgYiBfcmVnaXN0ZXJfZm9yX2hlYWRlckA2CgoKLy8gc21hcnRfY29udHJhY3RzLnJlZ2lzdHJ5LmNvbnRyYWN0LkJ4SGl2ZVJlZ2lzdHJ5Ll91cGRhdGVfbWVtYmVyX3Jvb3QoKSAtPiB2b2lkOgpfdXBkYXRlX21lbWJlcl9yb290OgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2Mi0xNjMKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX3VwZGF0ZV9tZW1iZXJfcm9vdChzZWxmKSAtPiBOb25lOgogICAgcHJvdG8gMCAwCiAgICBpbnRjXzEgLy8gMAogICAgZHVwbiAzCiAgICBieXRlY18yIC8vICIiCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6MTY0CiAgICAvLyBlbnN1cmVfYnVkZ2V0KFVJbnQ2NChfTUVNQkVSX1JPT1RfQlVER0VUKSwgT3BVcEZlZVNvdXJjZS5Hcm91cENyZWRpdCkKICAgIHB1c2hpbnQgMjAwMCAvLyAyMDAwCiAgICBpbnRjXzEgLy8gMAogICAgY2FsbHN1YiBlbnN1cmVfYnVkZ2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6MTY1CiAgICAvLyBub2RlID0gb3AuYnplcm8oMzIpCiAgICBpbnRjXzIgLy8gMzIKICAgIGJ6ZXJvCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToxNjcKICAgIC8vIHNpemUgPSBzZWxmLnVzZXJfY291bnQudmFsdWUKICAgIGludGNfMSAvLyAwCiAgICBieXRlY18wIC8vICJ1c2VyX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIHN3YXAKICAgIGNvdmVyIDIKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnVzZXJfY291bnQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6MTY4CiAgICAvLyBmb3IgbGV2ZWwgaW4gdXJhbmdlKE1FTUJFUl9UUkVFX0RFUFRIKToKICAgIGludGNfMSAvLyAwCgpfdXBkYXRlX21lbWJlcl9yb290X2Zvcl9oZWFkZXJAMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToxNjgKICAgIC8vIGZvciBsZXZlbCBpbiB1cmFuZ2UoTUVNQkVSX1RSRUVfREVQVEgpOgogICAgZnJhbWVfZGlnIDgKICAgIHB1c2hpbnQgMjAgLy8gMjAKICAgIDwKICAgIGJ6IF91cGRhdGVfbWVtYmVyX3Jvb3RfYWZ0ZXJfZm9yQDcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToxNjkKICAgIC8vIGlmIHNpemUgJiBVSW50NjQoMSk6CiAgICBmcmFtZV9kaWcgNgogICAgaW50Y18wIC8vIDEKICAgICYKICAgIGJ6IF91cGRhdGVfbWVtYmVyX3Jvb3RfZWxzZV9ib2R5QDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToxNzAKICAgIC8vIG5vZGUgPSBvcC5zaGEyNTYoc2VsZi5tZW1iZXJfYnJhbmNoLmV4dHJhY3QobGV2ZWwgKiBVSW50NjQoMzIpLCBVSW50NjQoMzIpKSArIG5vZGUpCiAgICBmcmFtZV9kaWcgOAogICAgaW50Y18yIC8vIDMyCiAgICAqCiAgICBieXRlYyA0IC8vIDB4NmQ2YgogICAgc3dhcAogICAgaW50Y18yIC8vIDMyCiAgICBib3hfZXh0cmFjdAogICAgZnJhbWVfZGlnIDUKICAgIGNvbmNhdAogICAgc2hhMjU2CiAgICBmcmFtZV9idXJ5IDUKCl91cGRhdGVfbWVtYmVyX3Jvb3RfYWZ0ZXJfaWZfZWxzZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3MwogICAgLy8gemVybyA9IG9wLnNoYTI1Nih6ZXJvICsgemVybykKICAgIGZyYW1lX2RpZyA3CiAgICBkdXAKICAgIGNvbmNhdAogICAgc2hhMjU2CiAgICBmcmFtZV9idXJ5IDcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToxNzQKICAgIC8vIHNpemUgPSBzaXplID4+IFVJbnQ2NCgxKQogICAgZnJhbWVfZGlnIDYKICAgIGludGNfMCAvLyAxCiAgICBzaHIKICAgIGZyYW1lX2J1cnkgNgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2OAogICAgLy8gZm9yIGxldmVsIGluIHVyYW5nZShNRU1CRVJfVFJFRV9ERVBUSCk6CiAgICBmcmFtZV9kaWcgOAogICAgaW50Y18wIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgOAogICAgYiBfdXBkYXRlX21lbWJlcl9yb290X2Zvcl9oZWFkZXJAMQoKX3VwZGF0ZV9tZW1iZXJfcm9vdF9lbHNlX2JvZHlANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToxNzIKICAgIC8vIG5vZGUgPSBvcC5zaGEyNTYobm9kZSArIHplcm8pCiAgICBmcmFtZV9kaWcgNQogICAgZnJhbWVfZGlnIDcKICAgIGNvbmNhdAogICAgc2hhMjU2CiAgICBmcmFtZV9idXJ5IDUKICAgIGIgX3VwZGF0ZV9tZW1iZXJfcm9vdF9hZnRlcl9pZl9lbHNlQDUKCl91cGRhdGVfbWVtYmVyX3Jvb3RfYWZ0ZXJfZm9yQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6MTc5CiAgICAvLyBmb3Igc2xvdCBpbiB1cmFuZ2UoTUVNQkVSX1JPT1RfU0xPVFMpOgogICAgaW50Y18xIC8vIDAKICAgIGZyYW1lX2RpZyA1CiAgICBmcmFtZV9idXJ5IDAKICAgIGZyYW1lX2J1cnkgNAoKX3VwZGF0ZV9tZW1iZXJfcm9vdF9mb3JfaGVhZGVyQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6MTc5CiAgICAvLyBmb3Igc2xvdCBpbiB1cmFuZ2UoTUVNQkVSX1JPT1RfU0xPVFMpOgogICAgZnJhbWVfZGlnIDQKICAgIHB1c2hpbnQgOCAvLyA4CiAgICA8CiAgICBieiBfdXBkYXRlX21lbWJlcl9yb290X2FmdGVyX2ZvckAxNQogICAgLy8gc21hcnRfY29udHJhY3RzL3NoYXJlZC9tZW1iZXJzaGlwLnB5OjQyCiAgICAvLyByZXR1cm4gQnl0ZXMoYiJtciIpICsgb3AuZXh0cmFjdChCeXRlcyhiIjAxMjM0NTY3IiksIHNsb3QsIDEpCiAgICBieXRlYyAxNCAvLyAweDMwMzEzMjMzMzQzNTM2MzcKICAgIGZyYW1lX2RpZyA0CiAgICBpbnRjXzAgLy8gMQogICAgZXh0cmFjdDMKICAgIGJ5dGVjIDE1IC8vIDB4NmQ3MgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE4MgogICAgLy8gc2xvdF9yb290cywgZXhpc3RzID0gb3AuQXBwR2xvYmFsLmdldF9leF9ieXRlcyhHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9pZCwga2V5KQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbklECiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgc3dhcAogICAgZnJhbWVfYnVyeSAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6MTgzCiAgICAvLyBpZiBleGlzdHM6CiAgICBibnogX3VwZGF0ZV9tZW1iZXJfcm9vdF9pZl9ib2R5QDEwCiAgICBmcmFtZV9kaWcgMAogICAgZnJhbWVfYnVyeSAyCgpfdXBkYXRlX21lbWJlcl9yb290X2FmdGVyX2lmX2Vsc2VAMTE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6MTg1CiAgICAvLyBpZiByb290cy5sZW5ndGggPD0gVUludDY0KDMyICogTUVNQkVSX1JPT1RTX1BFUl9TTE9UKToKICAgIGZyYW1lX2RpZyAyCiAgICBsZW4KICAgIHB1c2hpbnQgOTYgLy8gOTYKICAgIDw9CiAgICBieiBfdXBkYXRlX21lbWJlcl9yb290X2FmdGVyX2lmX2Vsc2VAMTMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToxODYKICAgIC8vIG9wLkFwcEdsb2JhbC5wdXQoa2V5LCByb290cykKICAgIGZyYW1lX2RpZyAxCiAgICBmcmFtZV9kaWcgMgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToxODcKICAgIC8vIHJldHVybgogICAgcmV0c3ViCgpfdXBkYXRlX21lbWJlcl9yb290X2FmdGVyX2lmX2Vsc2VAMTM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6MTg4CiAgICAvLyBvcC5BcHBHbG9iYWwucHV0KGtleSwgb3AuZXh0cmFjdChyb290cywgMCwgMzIgKiBNRU1CRVJfUk9PVFNfUEVSX1NMT1QpKQogICAgZnJhbWVfZGlnIDIKICAgIGR1cAogICAgZXh0cmFjdCAwIDk2CiAgICBmcmFtZV9kaWcgMQogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToxODkKICAgIC8vIGNhcnJ5ID0gb3AuZXh0cmFjdChyb290cywgMzIgKiBNRU1CRVJfUk9PVFNfUEVSX1NMT1QsIDMyKQogICAgZXh0cmFjdCA5NiAzMgogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVnaXN0cnkvY29udHJhY3QucHk6MTc5CiAgICAvLyBmb3Igc2xvdCBpbiB1cmFuZ2UoTUVNQkVSX1JPT1RfU0xPVFMpOgogICAgZnJhbWVfZGlnIDQKICAgIGludGNfMCAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDQKICAgIGIgX3VwZGF0ZV9tZW1iZXJfcm9vdF9mb3JfaGVhZGVyQDgKCl91cGRhdGVfbWVtYmVyX3Jvb3RfaWZfYm9keUAxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToxODQKICAgIC8vIHJvb3RzICs9IHNsb3Rfcm9vdHMKICAgIGZyYW1lX2RpZyAwCiAgICBmcmFtZV9kaWcgMwogICAgY29uY2F0CiAgICBmcmFtZV9idXJ5IDIKICAgIGIgX3VwZGF0ZV9tZW1iZXJfcm9vdF9hZnRlcl9pZl9lbHNlQDExCgpfdXBkYXRlX21lbWJlcl9yb290X2FmdGVyX2ZvckAxNToKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5yZWdpc3RyeS5jb250cmFjdC5CeEhpdmVSZWdpc3RyeS5fdXNlcl9lbnRyeShhZGRyOiBieXRlcykgLT4gYnl0ZXM6Cl91c2VyX2VudHJ5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI4Ni0yODcKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX3VzZXJfZW50cnkoc2VsZiwgYWRkcjogYXJjNC5BZGRyZXNzKSAtPiBhcmM0LlR1cGxlW2FyYzQuQWRkcmVzcywgVXNlcl06CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZWdpc3RyeS9jb250cmFjdC5weToyODgKICAgIC8vIHJldHVybiBhcmM0LlR1cGxlKChhZGRyLmNvcHkoKSwgc2VsZi51c2Vyc1tBY2NvdW50KGFkZHIuYnl0ZXMpXSkpCiAgICBmcmFtZV9kaWcgLTEKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIEFkZHJlc3MgbGVuZ3RoIGlzIDMyIGJ5dGVzCiAgICBieXRlYyA2IC8vIDB4NzU1ZgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnVzZXJzIGVudHJ5IGV4aXN0cwogICAgZnJhbWVfZGlnIC0xCiAgICBwdXNoYnl0ZXMgMHgwMDIyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgcmV0c3ViCg==","clear":"I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"},"byteCode":{"approval":"CyAEAQAgAiYQCnVzZXJfY291bnQEFR98dQALc3VwZXJfYWRtaW4CbWsEYWRtXwJ1XwN1aV8DcmNfAwaBAQJ0XwIAAAIAAgNyaV8IMDEyMzQ1NjcCbXIxGEAAAygjZzEZFEQxGEEAVYILBH66I+MESCjNLQToEfKnBO+l2bwEPanGggRvrUplBAiXA0IEd+jljwR9ENSVBHFT0zMEbwNWpDYaAI4LANMA9AERAUgCwAMJAyIDOwPKBH8EuwCABExcYbo2GgCOAQC8AIoCAIv+gQoIiwAyDA1BACqxgQayEIEFshknCbIeJwmyH4v/jQIACwAEs0L/2zIAsgFC//UjsgFC/++JigQBKkmL/iULi/wlCyOLBIsDDEEAHIv9iwRJTgJZiwIIFlcGAosBTFCMASUIjARC/9yL/RWMACOMBIsEiwIMQQAci/+LBElOAlmLAAgWVwYCiwFMUIwBJQiMBEL/3Iv8i/4IFlcGAosBUIv9iwOLAFJQi/8Vi/+LAk8CUlCMAIkrMQBnKCNnIkM2GgFJFSQSRDYaAkkVIhJEMQAjK2VEEkQnBU8CUEy/IkM2GgFJFSQSRDEAIytlRBJEJwVMUEm9RQFEvEgiQzYaAUkVIhJENhoCSSNZJQhLARUSRDEASwJPAogDsYgEoEkxAFBPAlCABPJGY99MULApTFCwIkMjRwIqRwM2GgFHAiNZSU4CJAslCEwVEkQ2GgJHAiNZSU4CJQhMFRJENhoDSSNZSU4CJQtMSRVMVwIAI0lLBQxBACRHAiULSwNJTwJZSUsHSU4EEkRLARVSI1klCAhFBSIIRQFC/9VLAyUISwMSRDEWIglJRQs4ECISRDEASUURIytlRBJBANMiREsHSUsHEkRLBRJESwk4BzIKEkQjRQsjRQxLC0sFDElFDkEALEsMREsLSSULSwNJTwJZSlklCFhXAgAVgZADC4HcggMISwwIRQwiCEUMQv/JSwk4CEsLD0QjKGVEFkmTJA5EVwQERQ4jRQxLC0sIDEEAPEsIVwIASwxJTgIkCyRYSRUkEkRLCFcCAEsCIlhLAksIDERLAiULSwVJTwJZSlklCFiIAmlIIghFDEL/vIgDUEsHFkmTJA5EVwQESw5JTwJQgATtbgY/TFCwKUxQsCJDJwVLEFBJRRC9RQFBAAxLDr5EF0EABCJC/xQjQv8QNhoBSRUiEkQ2GgJJFYEIEkQ2GgNJI1klCEsBFRJENhoESRUiEkQxACMrZUQSRE8CgAIADFBMUIABAVBMUCcKTwJQSbxITL8iQzYaAUkVJBJEJwZMUEm9RQFEvkgpTFCwIkM2GgFJFSISRCcKTFBJvUUBRL5IKUxQsCJDI0kqSTYaAUkVgQQSRDYaAkkVgQQSREwXSU8CFwhJIyhlRA1BAAcjKGVMRQJEJwtFBSVFBEsBRQNLAksBDEEASEsCFkmTJA5EVwQEJwdMUL5EiAL3SUUHFSUISwQISUUFgfwHDUAAIUsESSNZTFcCACcMSwhQTgIiTwOI/JJFBUsCIghFA0L/sClLBVCwIkMjKkcDNhoBRwIVIhJENhoCSU4CFYEEEkQ2GgNJTgIVgQQSRCcLTCcITFBJvUUBQAAISwEpTFCwIkNLAxdJRQdLAxcISUUKSwG+RBcNQQAGSb5EF0UJJUUHSwVFCEsHSwkMQQBMSwQXJJBLCAgWJw1MUL5EJwdMUL5EiAJASUULFSUISwcISUUIgfwHDUAAIUsBSSNZTFcCACcMSwxQTgIiTwOI+9tFAksHIghFCEL/rEsBQv9+IyojSYEIDEEAIjIIJw5LAiJYJw9MUGVMRQRBAA9LAUsDUEUCSSIIRQFC/9dLAUkVFlcGAkxQKUxQsCJDNhoBSRUiEkQnCExQSb1FAUEACUm+RClMULAiQ4AEAAAAAEL/8YoDASNHAipHAicGi/1QSb1FARREIyhlTElPAkSBgIBADEQnBL1FAUAABycEgYAFuUiL/QGMAYsHIgiMBSOMA4sDgRQMQQARiwUiGkEAgYsDJAsnBEyLAbsjKGVESRZJkyQORFcEBEmMAkwiCChMZzIHFksBi/5QgAIAD1BMUIv/UIsGSbxITL8nB0xQi/2/I4wEJwiL/lBJjAC9RQFBAAeLAL5EF4wEi/4XJJCLBElOAggWJw1MUIsCSU4DvyIIFkmTJA5EVwQEiwBMv4wAiYE8I4j6WosDSSQLJwRMJLqLAVABjAGLBSKRjAUiCIwDQv9NigAAI0cDKoHQDyOI+i8kr0kjKGVMTgJEI4sIgRQMQQA3iwYiGkEAJYsIJAsnBEwkuosFUAGMBYsHSVABjAeLBiKRjAaLCCIIjAhC/8yLBYsHUAGMBUL/3yOLBYwAjASLBIEIDEEATCcOiwQiWCcPTFBJjAEyCExlTIwDQAAriwCMAosCFYFgDkEABosBiwJniYsCSVcAYIsBTGdXYCCMAIsEIgiMBEL/tosAiwNQjAJC/8+JigEBi/8VJBJEJwaL/1C+RIv/gAIAIlBMUIk=","clear":"C4EBQw=="},"events":[{"name":"UserRegistered","args":[{"type":"uint32","name":"user_id"},{"type":"address","name":"addr"},{"type":"uint8","name":"role"}]},{"name":"UsersRegistered","args":[{"type":"uint32","name":"first_user_id"},{"type":"uint32","name":"count"}]}],"templateVariables":{}} as unknown as Arc56Contract
 
 /**
  * A state record containing binary data
@@ -107,6 +107,12 @@ export type BxHiveRegistryArgs = {
       role: bigint | number
       name: string
     }
+    'register_users(address[],uint8[],string[],pay)uint32': {
+      addresses: string[]
+      roles: bigint | number[]
+      names: string[]
+      mbrPayment: AppMethodCallTransactionArgument
+    }
     'register_template(uint8,uint64,string,uint8)void': {
       templateId: bigint | number
       appId: bigint | number
@@ -119,6 +125,19 @@ export type BxHiveRegistryArgs = {
     'get_template(uint8)(uint64,string,uint8,uint8)': {
       templateId: bigint | number
     }
+    'get_users(uint32,uint32)(address,(uint32,uint8,string,uint64))[]': {
+      start: bigint | number
+      count: bigint | number
+    }
+    'get_users_by_role(uint8,uint32,uint32)(address,(uint32,uint8,string,uint64))[]': {
+      role: bigint | number
+      start: bigint | number
+      count: bigint | number
+    }
+    'get_member_roots()byte[]': Record<string, never>
+    'get_role_count(uint8)uint32': {
+      role: bigint | number
+    }
   }
   /**
    * The tuple representation of the arguments for each method
@@ -128,9 +147,14 @@ export type BxHiveRegistryArgs = {
     'add_admin(address,uint8)void': [addr: string, role: bigint | number]
     'remove_admin(address)void': [addr: string]
     'register_user(uint8,string)uint32': [role: bigint | number, name: string]
+    'register_users(address[],uint8[],string[],pay)uint32': [addresses: string[], roles: bigint | number[], names: string[], mbrPayment: AppMethodCallTransactionArgument]
     'register_template(uint8,uint64,string,uint8)void': [templateId: bigint | number, appId: bigint | number, name: string, playerCount: bigint | number]
     'get_user(address)(uint32,uint8,string,uint64)': [addr: string]
     'get_template(uint8)(uint64,string,uint8,uint8)': [templateId: bigint | number]
+    'get_users(uint32,uint32)(address,(uint32,uint8,string,uint64))[]': [start: bigint | number, count: bigint | number]
+    'get_users_by_role(uint8,uint32,uint32)(address,(uint32,uint8,string,uint64))[]': [role: bigint | number, start: bigint | number, count: bigint | number]
+    'get_member_roots()byte[]': []
+    'get_role_count(uint8)uint32': [role: bigint | number]
   }
 }
 
@@ -142,9 +166,14 @@ export type BxHiveRegistryReturns = {
   'add_admin(address,uint8)void': void
   'remove_admin(address)void': void
   'register_user(uint8,string)uint32': number
+  'register_users(address[],uint8[],string[],pay)uint32': number
   'register_template(uint8,uint64,string,uint8)void': void
   'get_user(address)(uint32,uint8,string,uint64)': User
   'get_template(uint8)(uint64,string,uint8,uint8)': ExperimentTemplateInfo
+  'get_users(uint32,uint32)(address,(uint32,uint8,string,uint64))[]': [string, [number, number, string, bigint]][]
+  'get_users_by_role(uint8,uint32,uint32)(address,(uint32,uint8,string,uint64))[]': [string, [number, number, string, bigint]][]
+  'get_member_roots()byte[]': Uint8Array
+  'get_role_count(uint8)uint32': number
 }
 
 /**
@@ -175,6 +204,11 @@ export type BxHiveRegistryTypes = {
       argsTuple: BxHiveRegistryArgs['tuple']['register_user(uint8,string)uint32']
       returns: BxHiveRegistryReturns['register_user(uint8,string)uint32']
     }>
+    & Record<'register_users(address[],uint8[],string[],pay)uint32' | 'register_users', {
+      argsObj: BxHiveRegistryArgs['obj']['register_users(address[],uint8[],string[],pay)uint32']
+      argsTuple: BxHiveRegistryArgs['tuple']['register_users(address[],uint8[],string[],pay)uint32']
+      returns: BxHiveRegistryReturns['register_users(address[],uint8[],string[],pay)uint32']
+    }>
     & Record<'register_template(uint8,uint64,string,uint8)void' | 'register_template', {
       argsObj: BxHiveRegistryArgs['obj']['register_template(uint8,uint64,string,uint8)void']
       argsTuple: BxHiveRegistryArgs['tuple']['register_template(uint8,uint64,string,uint8)void']
@@ -190,6 +224,26 @@ export type BxHiveRegistryTypes = {
       argsTuple: BxHiveRegistryArgs['tuple']['get_template(uint8)(uint64,string,uint8,uint8)']
       returns: BxHiveRegistryReturns['get_template(uint8)(uint64,string,uint8,uint8)']
     }>
+    & Record<'get_users(uint32,uint32)(address,(uint32,uint8,string,uint64))[]' | 'get_users', {
+      argsObj: BxHiveRegistryArgs['obj']['get_users(uint32,uint32)(address,(uint32,uint8,string,uint64))[]']
+      argsTuple: BxHiveRegistryArgs['tuple']['get_users(uint32,uint32)(address,(uint32,uint8,string,uint64))[]']
+      returns: BxHiveRegistryReturns['get_users(uint32,uint32)(address,(uint32,uint8,string,uint64))[]']
+    }>
+    & Record<'get_users_by_role(uint8,uint32,uint32)(address,(uint32,uint8,string,uint64))[]' | 'get_users_by_role', {
+      argsObj: BxHiveRegistryArgs['obj']['get_users_by_role(uint8,uint32,uint32)(address,(uint32,uint8,string,uint64))[]']
+      argsTuple: BxHiveRegistryArgs['tuple']['get_users_by_role(uint8,uint32,uint32)(address,(uint32,uint8,string,uint64))[]']
+      returns: BxHiveRegistryReturns['get_users_by_role(uint8,uint32,uint32)(address,(uint32,uint8,string,uint64))[]']
+    }>
+    & Record<'get_member_roots()byte[]' | 'get_member_roots', {
+      argsObj: BxHiveRegistryArgs['obj']['get_member_roots()byte[]']
+      argsTuple: BxHiveRegistryArgs['tuple']['get_member_roots()byte[]']
+      returns: BxHiveRegistryReturns['get_member_roots()byte[]']
+    }>
+    & Record<'get_role_count(uint8)uint32' | 'get_role_count', {
+      argsObj: BxHiveRegistryArgs['obj']['get_role_count(uint8)uint32']
+      argsTuple: BxHiveRegistryArgs['tuple']['get_role_count(uint8)uint32']
+      returns: BxHiveRegistryReturns['get_role_count(uint8)uint32']
+    }>
   /**
    * Defines the shape of the state of the application.
    */
@@ -202,12 +256,16 @@ export type BxHiveRegistryTypes = {
       maps: {}
     }
     box: {
-      keys: {}
+      keys: {
+        memberBranch: BinaryState
+      }
       maps: {
         admins: Map<string, number>
         users: Map<string, User>
         userIds: Map<bigint | number, string>
         experimentTemplates: Map<bigint | number, ExperimentTemplateInfo>
+        roleCounts: Map<bigint | number, number>
+        roleIndex: Map<bigint | number, number>
       }
     }
   }
@@ -341,6 +399,23 @@ export abstract class BxHiveRegistryParamsFactory {
       args: Array.isArray(params.args) ? params.args : [params.args.role, params.args.name],
     }
   }
+  /**
+   * Constructs a no op call for the register_users(address[],uint8[],string[],pay)uint32 ABI method
+   *
+  * Operator bulk registration of a cohort, funded by one MBR payment of
+  USER_MBR + USER_NAME_BYTE_MBR * len(name) per user. User IDs are assigned sequentially; returns the first one. Each user touches three boxes (plus the shared rc_ and mk boxes), so a call fits about 2 users unless the group shares box references. The member root is updated once per call, and one UsersRegistered event covers the whole cohort.
+
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static registerUsers(params: CallParams<BxHiveRegistryArgs['obj']['register_users(address[],uint8[],string[],pay)uint32'] | BxHiveRegistryArgs['tuple']['register_users(address[],uint8[],string[],pay)uint32']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'register_users(address[],uint8[],string[],pay)uint32' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.addresses, params.args.roles, params.args.names, params.args.mbrPayment],
+    }
+  }
   /**
    * Constructs a no op call for the register_template(uint8,uint64,string,uint8)void ABI method
    *
@@ -380,6 +455,68 @@ export abstract class BxHiveRegistryParamsFactory {
       args: Array.isArray(params.args) ? params.args : [params.args.templateId],
     }
   }
+  /**
+   * Constructs a no op call for the get_users(uint32,uint32)(address,(uint32,uint8,string,uint64))[] ABI method
+   *
+  * (address, User) for user_ids start .. start + count - 1. Names are
+  variable length, so the page also stops early once the encoded result would overflow the return log; continue from start + len(page) while that is below user_count.
+
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static getUsers(params: CallParams<BxHiveRegistryArgs['obj']['get_users(uint32,uint32)(address,(uint32,uint8,string,uint64))[]'] | BxHiveRegistryArgs['tuple']['get_users(uint32,uint32)(address,(uint32,uint8,string,uint64))[]']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'get_users(uint32,uint32)(address,(uint32,uint8,string,uint64))[]' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.start, params.args.count],
+    }
+  }
+  /**
+   * Constructs a no op call for the get_users_by_role(uint8,uint32,uint32)(address,(uint32,uint8,string,uint64))[] ABI method
+   *
+  * Like get_users, but over the users of one role in registration order.
+
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static getUsersByRole(params: CallParams<BxHiveRegistryArgs['obj']['get_users_by_role(uint8,uint32,uint32)(address,(uint32,uint8,string,uint64))[]'] | BxHiveRegistryArgs['tuple']['get_users_by_role(uint8,uint32,uint32)(address,(uint32,uint8,string,uint64))[]']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'get_users_by_role(uint8,uint32,uint32)(address,(uint32,uint8,string,uint64))[]' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.role, params.args.start, params.args.count],
+    }
+  }
+  /**
+   * Constructs a no op call for the get_member_roots()byte[] ABI method
+   *
+  * Recent member tree roots, newest first, 32 bytes each.
+
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static getMemberRoots(params: CallParams<BxHiveRegistryArgs['obj']['get_member_roots()byte[]'] | BxHiveRegistryArgs['tuple']['get_member_roots()byte[]']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'get_member_roots()byte[]' as const,
+      args: Array.isArray(params.args) ? params.args : [],
+    }
+  }
+  /**
+   * Constructs a no op call for the get_role_count(uint8)uint32 ABI method
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static getRoleCount(params: CallParams<BxHiveRegistryArgs['obj']['get_role_count(uint8)uint32'] | BxHiveRegistryArgs['tuple']['get_role_count(uint8)uint32']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'get_role_count(uint8)uint32' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.role],
+    }
+  }
 }
 
 /**
@@ -643,6 +780,20 @@ export class BxHiveRegistryClient {
       return this.appClient.params.call(BxHiveRegistryParamsFactory.registerUser(params))
     },
 
+    /**
+     * Makes a call to the BxHiveRegistry smart contract using the `register_users(address[],uint8[],string[],pay)uint32` ABI method.
+     *
+    * Operator bulk registration of a cohort, funded by one MBR payment of
+    USER_MBR + USER_NAME_BYTE_MBR * len(name) per user. User IDs are assigned sequentially; returns the first one. Each user touches three boxes (plus the shared rc_ and mk boxes), so a call fits about 2 users unless the group shares box references. The member root is updated once per call, and one UsersRegistered event covers the whole cohort.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    registerUsers: (params: CallParams<BxHiveRegistryArgs['obj']['register_users(address[],uint8[],string[],pay)uint32'] | BxHiveRegistryArgs['tuple']['register_users(address[],uint8[],string[],pay)uint32']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.params.call(BxHiveRegistryParamsFactory.registerUsers(params))
+    },
+
     /**
      * Makes a call to the BxHiveRegistry smart contract using the `register_template(uint8,uint64,string,uint8)void` ABI method.
      *
@@ -677,6 +828,64 @@ export class BxHiveRegistryClient {
       return this.appClient.params.call(BxHiveRegistryParamsFactory.getTemplate(params))
     },
 
+    /**
+     * Makes a call to the BxHiveRegistry smart contract using the `get_users(uint32,uint32)(address,(uint32,uint8,string,uint64))[]` ABI method.
+     *
+    * (address, User) for user_ids start .. start + count - 1. Names are
+    variable length, so the page also stops early once the encoded result would overflow the return log; continue from start + len(page) while that is below user_count.
+
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    getUsers: (params: CallParams<BxHiveRegistryArgs['obj']['get_users(uint32,uint32)(address,(uint32,uint8,string,uint64))[]'] | BxHiveRegistryArgs['tuple']['get_users(uint32,uint32)(address,(uint32,uint8,string,uint64))[]']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.params.call(BxHiveRegistryParamsFactory.getUsers(params))
+    },
+
+    /**
+     * Makes a call to the BxHiveRegistry smart contract using the `get_users_by_role(uint8,uint32,uint32)(address,(uint32,uint8,string,uint64))[]` ABI method.
+     *
+    * Like get_users, but over the users of one role in registration order.
+
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    getUsersByRole: (params: CallParams<BxHiveRegistryArgs['obj']['get_users_by_role(uint8,uint32,uint32)(address,(uint32,uint8,string,uint64))[]'] | BxHiveRegistryArgs['tuple']['get_users_by_role(uint8,uint32,uint32)(address,(uint32,uint8,string,uint64))[]']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.params.call(BxHiveRegistryParamsFactory.getUsersByRole(params))
+    },
+
+    /**
+     * Makes a call to the BxHiveRegistry smart contract using the `get_member_roots()byte[]` ABI method.
+     *
+    * Recent member tree roots, newest first, 32 bytes each.
+
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    getMemberRoots: (params: CallParams<BxHiveRegistryArgs['obj']['get_member_roots()byte[]'] | BxHiveRegistryArgs['tuple']['get_member_roots()byte[]']> & { onComplete?: OnApplicationComplete.NoOp } = {args: []}) => {
+      return this.appClient.params.call(BxHiveRegistryParamsFactory.getMemberRoots(params))
+    },
+
+    /**
+     * Makes a call to the BxHiveRegistry smart contract using the `get_role_count(uint8)uint32` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    getRoleCount: (params: CallParams<BxHiveRegistryArgs['obj']['get_role_count(uint8)uint32'] | BxHiveRegistryArgs['tuple']['get_role_count(uint8)uint32']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.params.call(BxHiveRegistryParamsFactory.getRoleCount(params))
+    },
+
   }
 
   /**
@@ -723,6 +932,20 @@ export class BxHiveRegistryClient {
       return this.appClient.createTransaction.call(BxHiveRegistryParamsFactory.registerUser(params))
     },
 
+    /**
+     * Makes a call to the BxHiveRegistry smart contract using the `register_users(address[],uint8[],string[],pay)uint32` ABI method.
+     *
+    * Operator bulk registration of a cohort, funded by one MBR payment of
+    USER_MBR + USER_NAME_BYTE_MBR * len(name) per user. User IDs are assigned sequentially; returns the first one. Each user touches three boxes (plus the shared rc_ and mk boxes), so a call fits about 2 users unless the group shares box references. The member root is updated once per call, and one UsersRegistered event covers the whole cohort.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    registerUsers: (params: CallParams<BxHiveRegistryArgs['obj']['register_users(address[],uint8[],string[],pay)uint32'] | BxHiveRegistryArgs['tuple']['register_users(address[],uint8[],string[],pay)uint32']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.createTransaction.call(BxHiveRegistryParamsFactory.registerUsers(params))
+    },
+
     /**
      * Makes a call to the BxHiveRegistry smart contract using the `register_template(uint8,uint64,string,uint8)void` ABI method.
      *
@@ -757,6 +980,64 @@ export class BxHiveRegistryClient {
       return this.appClient.createTransaction.call(BxHiveRegistryParamsFactory.getTemplate(params))
     },
 
+    /**
+     * Makes a call to the BxHiveRegistry smart contract using the `get_users(uint32,uint32)(address,(uint32,uint8,string,uint64))[]` ABI method.
+     *
+    * (address, User) for user_ids start .. start + count - 1. Names are
+    variable length, so the page also stops early once the encoded result would overflow the return log; continue from start + len(page) while that is below user_count.
+
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    getUsers: (params: CallParams<BxHiveRegistryArgs['obj']['get_users(uint32,uint32)(address,(uint32,uint8,string,uint64))[]'] | BxHiveRegistryArgs['tuple']['get_users(uint32,uint32)(address,(uint32,uint8,string,uint64))[]']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.createTransaction.call(BxHiveRegistryParamsFactory.getUsers(params))
+    },
+
+    /**
+     * Makes a call to the BxHiveRegistry smart contract using the `get_users_by_role(uint8,uint32,uint32)(address,(uint32,uint8,string,uint64))[]` ABI method.
+     *
+    * Like get_users, but over the users of one role in registration order.
+
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    getUsersByRole: (params: CallParams<BxHiveRegistryArgs['obj']['get_users_by_role(uint8,uint32,uint32)(address,(uint32,uint8,string,uint64))[]'] | BxHiveRegistryArgs['tuple']['get_users_by_role(uint8,uint32,uint32)(address,(uint32,uint8,string,uint64))[]']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.createTransaction.call(BxHiveRegistryParamsFactory.getUsersByRole(params))
+    },
+
+    /**
+     * Makes a call to the BxHiveRegistry smart contract using the `get_member_roots()byte[]` ABI method.
+     *
+    * Recent member tree roots, newest first, 32 bytes each.
+
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    getMemberRoots: (params: CallParams<BxHiveRegistryArgs['obj']['get_member_roots()byte[]'] | BxHiveRegistryArgs['tuple']['get_member_roots()byte[]']> & { onComplete?: OnApplicationComplete.NoOp } = {args: []}) => {
+      return this.appClient.createTransaction.call(BxHiveRegistryParamsFactory.getMemberRoots(params))
+    },
+
+    /**
+     * Makes a call to the BxHiveRegistry smart contract using the `get_role_count(uint8)uint32` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    getRoleCount: (params: CallParams<BxHiveRegistryArgs['obj']['get_role_count(uint8)uint32'] | BxHiveRegistryArgs['tuple']['get_role_count(uint8)uint32']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.createTransaction.call(BxHiveRegistryParamsFactory.getRoleCount(params))
+    },
+
   }
 
   /**
@@ -806,6 +1087,21 @@ export class BxHiveRegistryClient {
       return {...result, return: result.return as unknown as (undefined | BxHiveRegistryReturns['register_user(uint8,string)uint32'])}
     },
 
+    /**
+     * Makes a call to the BxHiveRegistry smart contract using the `register_users(address[],uint8[],string[],pay)uint32` ABI method.
+     *
+    * Operator bulk registration of a cohort, funded by one MBR payment of
+    USER_MBR + USER_NAME_BYTE_MBR * len(name) per user. User IDs are assigned sequentially; returns the first one. Each user touches three boxes (plus the shared rc_ and mk boxes), so a call fits about 2 users unless the group shares box references. The member root is updated once per call, and one UsersRegistered event covers the whole cohort.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    registerUsers: async (params: CallParams<BxHiveRegistryArgs['obj']['register_users(address[],uint8[],string[],pay)uint32'] | BxHiveRegistryArgs['tuple']['register_users(address[],uint8[],string[],pay)uint32']> & SendParams & { onComplete?: OnApplicationComplete.NoOp }) => {
+      const result = await this.appClient.send.call(BxHiveRegistryParamsFactory.registerUsers(params))
+      return {...result, return: result.return as unknown as (undefined | BxHiveRegistryReturns['register_users(address[],uint8[],string[],pay)uint32'])}
+    },
+
     /**
      * Makes a call to the BxHiveRegistry smart contract using the `register_template(uint8,uint64,string,uint8)void` ABI method.
      *
@@ -843,6 +1139,68 @@ export class BxHiveRegistryClient {
       return {...result, return: result.return as unknown as (undefined | BxHiveRegistryReturns['get_template(uint8)(uint64,string,uint8,uint8)'])}
     },
 
+    /**
+     * Makes a call to the BxHiveRegistry smart contract using the `get_users(uint32,uint32)(address,(uint32,uint8,string,uint64))[]` ABI method.
+     *
+    * (address, User) for user_ids start .. start + count - 1. Names are
+    variable length, so the page also stops early once the encoded result would overflow the return log; continue from start + len(page) while that is below user_count.
+
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    getUsers: async (params: CallParams<BxHiveRegistryArgs['obj']['get_users(uint32,uint32)(address,(uint32,uint8,string,uint64))[]'] | BxHiveRegistryArgs['tuple']['get_users(uint32,uint32)(address,(uint32,uint8,string,uint64))[]']> & SendParams & { onComplete?: OnApplicationComplete.NoOp }) => {
+      const result = await this.appClient.send.call(BxHiveRegistryParamsFactory.getUsers(params))
+      return {...result, return: result.return as unknown as (undefined | BxHiveRegistryReturns['get_users(uint32,uint32)(address,(uint32,uint8,string,uint64))[]'])}
+    },
+
+    /**
+     * Makes a call to the BxHiveRegistry smart contract using the `get_users_by_role(uint8,uint32,uint32)(address,(uint32,uint8,string,uint64))[]` ABI method.
+     *
+    * Like get_users, but over the users of one role in registration order.
+
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    getUsersByRole: async (params: CallParams<BxHiveRegistryArgs['obj']['get_users_by_role(uint8,uint32,uint32)(address,(uint32,uint8,string,uint64))[]'] | BxHiveRegistryArgs['tuple']['get_users_by_role(uint8,uint32,uint32)(address,(uint32,uint8,string,uint64))[]']> & SendParams & { onComplete?: OnApplicationComplete.NoOp }) => {
+      const result = await this.appClient.send.call(BxHiveRegistryParamsFactory.getUsersByRole(params))
+      return {...result, return: result.return as unknown as (undefined | BxHiveRegistryReturns['get_users_by_role(uint8,uint32,uint32)(address,(uint32,uint8,string,uint64))[]'])}
+    },
+
+    /**
+     * Makes a call to the BxHiveRegistry smart contract using the `get_member_roots()byte[]` ABI method.
+     *
+    * Recent member tree roots, newest first, 32 bytes each.
+
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    getMemberRoots: async (params: CallParams<BxHiveRegistryArgs['obj']['get_member_roots()byte[]'] | BxHiveRegistryArgs['tuple']['get_member_roots()byte[]']> & SendParams & { onComplete?: OnApplicationComplete.NoOp } = {args: []}) => {
+      const result = await this.appClient.send.call(BxHiveRegistryParamsFactory.getMemberRoots(params))
+      return {...result, return: result.return as unknown as (undefined | BxHiveRegistryReturns['get_member_roots()byte[]'])}
+    },
+
+    /**
+     * Makes a call to the BxHiveRegistry smart contract using the `get_role_count(uint8)uint32` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    getRoleCount: async (params: CallParams<BxHiveRegistryArgs['obj']['get_role_count(uint8)uint32'] | BxHiveRegistryArgs['tuple']['get_role_count(uint8)uint32']> & SendParams & { onComplete?: OnApplicationComplete.NoOp }) => {
+      const result = await this.appClient.send.call(BxHiveRegistryParamsFactory.getRoleCount(params))
+      return {...result, return: result.return as unknown as (undefined | BxHiveRegistryReturns['get_role_count(uint8)uint32'])}
+    },
+
   }
 
   /**
@@ -881,6 +1239,68 @@ export class BxHiveRegistryClient {
     return result.return as unknown as BxHiveRegistryReturns['get_template(uint8)(uint64,string,uint8,uint8)']
   }
 
+  /**
+   * Makes a readonly (simulated) call to the BxHiveRegistry smart contract using the `get_users(uint32,uint32)(address,(uint32,uint8,string,uint64))[]` ABI method.
+   *
+  * (address, User) for user_ids start .. start + count - 1. Names are
+  variable length, so the page also stops early once the encoded result would overflow the return log; continue from start + len(page) while that is below user_count.
+
+   * 
+   * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+   *
+   * @param params The params for the smart contract call
+   * @returns The call result
+   */
+  async getUsers(params: CallParams<BxHiveRegistryArgs['obj']['get_users(uint32,uint32)(address,(uint32,uint8,string,uint64))[]'] | BxHiveRegistryArgs['tuple']['get_users(uint32,uint32)(address,(uint32,uint8,string,uint64))[]']>) {
+    const result = await this.appClient.send.call(BxHiveRegistryParamsFactory.getUsers(params))
+    return result.return as unknown as BxHiveRegistryReturns['get_users(uint32,uint32)(address,(uint32,uint8,string,uint64))[]']
+  }
+
+  /**
+   * Makes a readonly (simulated) call to the BxHiveRegistry smart contract using the `get_users_by_role(uint8,uint32,uint32)(address,(uint32,uint8,string,uint64))[]` ABI method.
+   *
+  * Like get_users, but over the users of one role in registration order.
+
+   * 
+   * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+   *
+   * @param params The params for the smart contract call
+   * @returns The call result
+   */
+  async getUsersByRole(params: CallParams<BxHiveRegistryArgs['obj']['get_users_by_role(uint8,uint32,uint32)(address,(uint32,uint8,string,uint64))[]'] | BxHiveRegistryArgs['tuple']['get_users_by_role(uint8,uint32,uint32)(address,(uint32,uint8,string,uint64))[]']>) {
+    const result = await this.appClient.send.call(BxHiveRegistryParamsFactory.getUsersByRole(params))
+    return result.return as unknown as BxHiveRegistryReturns['get_users_by_role(uint8,uint32,uint32)(address,(uint32,uint8,string,uint64))[]']
+  }
+
+  /**
+   * Makes a readonly (simulated) call to the BxHiveRegistry smart contract using the `get_member_roots()byte[]` ABI method.
+   *
+  * Recent member tree roots, newest first, 32 bytes each.
+
+   * 
+   * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+   *
+   * @param params The params for the smart contract call
+   * @returns The call result
+   */
+  async getMemberRoots(params: CallParams<BxHiveRegistryArgs['obj']['get_member_roots()byte[]'] | BxHiveRegistryArgs['tuple']['get_member_roots()byte[]']> = {args: []}) {
+    const result = await this.appClient.send.call(BxHiveRegistryParamsFactory.getMemberRoots(params))
+    return result.return as unknown as BxHiveRegistryReturns['get_member_roots()byte[]']
+  }
+
+  /**
+   * Makes a readonly (simulated) call to the BxHiveRegistry smart contract using the `get_role_count(uint8)uint32` ABI method.
+   * 
+   * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+   *
+   * @param params The params for the smart contract call
+   * @returns The call result
+   */
+  async getRoleCount(params: CallParams<BxHiveRegistryArgs['obj']['get_role_count(uint8)uint32'] | BxHiveRegistryArgs['tuple']['get_role_count(uint8)uint32']>) {
+    const result = await this.appClient.send.call(BxHiveRegistryParamsFactory.getRoleCount(params))
+    return result.return as unknown as BxHiveRegistryReturns['get_role_count(uint8)uint32']
+  }
+
   /**
    * Methods to access state for the current BxHiveRegistry app
    */
@@ -918,8 +1338,13 @@ export class BxHiveRegistryClient {
       getAll: async (): Promise<Partial<Expand<BoxKeysState>>> => {
         const result = await this.appClient.state.box.getAll()
         return {
+          memberBranch: new BinaryStateValue(result.member_branch),
         }
       },
+      /**
+       * Get the current value of the member_branch key in box state
+       */
+      memberBranch: async (): Promise<BinaryState> => { return new BinaryStateValue((await this.appClient.state.box.getValue("member_branch")) as Uint8Array | undefined) },
       /**
        * Get values from the admins map in box state
        */
@@ -972,6 +1397,32 @@ export class BxHiveRegistryClient {
          */
         value: async (key: bigint | number): Promise<ExperimentTemplateInfo | undefined> => { return await this.appClient.state.box.getMapValue("experiment_templates", key) as ExperimentTemplateInfo | undefined },
       },
+      /**
+       * Get values from the role_counts map in box state
+       */
+      roleCounts: {
+        /**
+         * Get all current values of the role_counts map in box state
+         */
+        getMap: async (): Promise<Map<number, number>> => { return (await this.appClient.state.box.getMap("role_counts")) as Map<number, number> },
+        /**
+         * Get a current value of the role_counts map by key from box state
+         */
+        value: async (key: bigint | number): Promise<number | undefined> => { return await this.appClient.state.box.getMapValue("role_counts", key) as number | undefined },
+      },
+      /**
+       * Get values from the role_index map in box state
+       */
+      roleIndex: {
+        /**
+         * Get all current values of the role_index map in box state
+         */
+        getMap: async (): Promise<Map<bigint, number>> => { return (await this.appClient.state.box.getMap("role_index")) as Map<bigint, number> },
+        /**
+         * Get a current value of the role_index map by key from box state
+         */
+        value: async (key: bigint | number): Promise<number | undefined> => { return await this.appClient.state.box.getMapValue("role_index", key) as number | undefined },
+      },
     },
   }
 
@@ -1001,6 +1452,13 @@ export class BxHiveRegistryClient {
         promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.registerUser(params)))
         return this
       },
+      /**
+       * Add a register_users(address[],uint8[],string[],pay)uint32 method call against the BxHiveRegistry contract
+       */
+      registerUsers(params: CallParams<BxHiveRegistryArgs['obj']['register_users(address[],uint8[],string[],pay)uint32'] | BxHiveRegistryArgs['tuple']['register_users(address[],uint8[],string[],pay)uint32']> & { onComplete?: OnApplicationComplete.NoOp }) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.registerUsers(params)))
+        return this
+      },
       /**
        * Add a register_template(uint8,uint64,string,uint8)void method call against the BxHiveRegistry contract
        */
@@ -1022,6 +1480,34 @@ export class BxHiveRegistryClient {
         promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getTemplate(params)))
         return this
       },
+      /**
+       * Add a get_users(uint32,uint32)(address,(uint32,uint8,string,uint64))[] method call against the BxHiveRegistry contract
+       */
+      getUsers(params: CallParams<BxHiveRegistryArgs['obj']['get_users(uint32,uint32)(address,(uint32,uint8,string,uint64))[]'] | BxHiveRegistryArgs['tuple']['get_users(uint32,uint32)(address,(uint32,uint8,string,uint64))[]']> & { onComplete?: OnApplicationComplete.NoOp }) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getUsers(params)))
+        return this
+      },
+      /**
+       * Add a get_users_by_role(uint8,uint32,uint32)(address,(uint32,uint8,string,uint64))[] method call against the BxHiveRegistry contract
+       */
+      getUsersByRole(params: CallParams<BxHiveRegistryArgs['obj']['get_users_by_role(uint8,uint32,uint32)(address,(uint32,uint8,string,uint64))[]'] | BxHiveRegistryArgs['tuple']['get_users_by_role(uint8,uint32,uint32)(address,(uint32,uint8,string,uint64))[]']> & { onComplete?: OnApplicationComplete.NoOp }) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getUsersByRole(params)))
+        return this
+      },
+      /**
+       * Add a get_member_roots()byte[] method call against the BxHiveRegistry contract
+       */
+      getMemberRoots(params: CallParams<BxHiveRegistryArgs['obj']['get_member_roots()byte[]'] | BxHiveRegistryArgs['tuple']['get_member_roots()byte[]']> & { onComplete?: OnApplicationComplete.NoOp }) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getMemberRoots(params)))
+        return this
+      },
+      /**
+       * Add a get_role_count(uint8)uint32 method call against the BxHiveRegistry contract
+       */
+      getRoleCount(params: CallParams<BxHiveRegistryArgs['obj']['get_role_count(uint8)uint32'] | BxHiveRegistryArgs['tuple']['get_role_count(uint8)uint32']> & { onComplete?: OnApplicationComplete.NoOp }) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getRoleCount(params)))
+        return this
+      },
       /**
        * Add a clear state call to the BxHiveRegistry contract
        */
@@ -1081,6 +1567,18 @@ export type BxHiveRegistryComposer<TReturns extends [...any[]] = []> = {
    */
   registerUser(params?: CallParams<BxHiveRegistryArgs['obj']['register_user(uint8,string)uint32'] | BxHiveRegistryArgs['tuple']['register_user(uint8,string)uint32']>): BxHiveRegistryComposer<[...TReturns, BxHiveRegistryReturns['register_user(uint8,string)uint32'] | undefined]>
 
+  /**
+   * Calls the register_users(address[],uint8[],string[],pay)uint32 ABI method.
+   *
+  * Operator bulk registration of a cohort, funded by one MBR payment of
+  USER_MBR + USER_NAME_BYTE_MBR * len(name) per user. User IDs are assigned sequentially; returns the first one. Each user touches three boxes (plus the shared rc_ and mk boxes), so a call fits about 2 users unless the group shares box references. The member root is updated once per call, and one UsersRegistered event covers the whole cohort.
+
+   *
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  registerUsers(params?: CallParams<BxHiveRegistryArgs['obj']['register_users(address[],uint8[],string[],pay)uint32'] | BxHiveRegistryArgs['tuple']['register_users(address[],uint8[],string[],pay)uint32']>): BxHiveRegistryComposer<[...TReturns, BxHiveRegistryReturns['register_users(address[],uint8[],string[],pay)uint32'] | undefined]>
+
   /**
    * Calls the register_template(uint8,uint64,string,uint8)void ABI method.
    *
@@ -1105,6 +1603,48 @@ export type BxHiveRegistryComposer<TReturns extends [...any[]] = []> = {
    */
   getTemplate(params?: CallParams<BxHiveRegistryArgs['obj']['get_template(uint8)(uint64,string,uint8,uint8)'] | BxHiveRegistryArgs['tuple']['get_template(uint8)(uint64,string,uint8,uint8)']>): BxHiveRegistryComposer<[...TReturns, BxHiveRegistryReturns['get_template(uint8)(uint64,string,uint8,uint8)'] | undefined]>
 
+  /**
+   * Calls the get_users(uint32,uint32)(address,(uint32,uint8,string,uint64))[] ABI method.
+   *
+  * (address, User) for user_ids start .. start + count - 1. Names are
+  variable length, so the page also stops early once the encoded result would overflow the return log; continue from start + len(page) while that is below user_count.
+
+   *
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  getUsers(params?: CallParams<BxHiveRegistryArgs['obj']['get_users(uint32,uint32)(address,(uint32,uint8,string,uint64))[]'] | BxHiveRegistryArgs['tuple']['get_users(uint32,uint32)(address,(uint32,uint8,string,uint64))[]']>): BxHiveRegistryComposer<[...TReturns, BxHiveRegistryReturns['get_users(uint32,uint32)(address,(uint32,uint8,string,uint64))[]'] | undefined]>
+
+  /**
+   * Calls the get_users_by_role(uint8,uint32,uint32)(address,(uint32,uint8,string,uint64))[] ABI method.
+   *
+  * Like get_users, but over the users of one role in registration order.
+
+   *
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  getUsersByRole(params?: CallParams<BxHiveRegistryArgs['obj']['get_users_by_role(uint8,uint32,uint32)(address,(uint32,uint8,string,uint64))[]'] | BxHiveRegistryArgs['tuple']['get_users_by_role(uint8,uint32,uint32)(address,(uint32,uint8,string,uint64))[]']>): BxHiveRegistryComposer<[...TReturns, BxHiveRegistryReturns['get_users_by_role(uint8,uint32,uint32)(address,(uint32,uint8,string,uint64))[]'] | undefined]>
+
+  /**
+   * Calls the get_member_roots()byte[] ABI method.
+   *
+  * Recent member tree roots, newest first, 32 bytes each.
+
+   *
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  getMemberRoots(params?: CallParams<BxHiveRegistryArgs['obj']['get_member_roots()byte[]'] | BxHiveRegistryArgs['tuple']['get_member_roots()byte[]']>): BxHiveRegistryComposer<[...TReturns, BxHiveRegistryReturns['get_member_roots()byte[]'] | undefined]>
+
+  /**
+   * Calls the get_role_count(uint8)uint32 ABI method.
+   *
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  getRoleCount(params?: CallParams<BxHiveRegistryArgs['obj']['get_role_count(uint8)uint32'] | BxHiveRegistryArgs['tuple']['get_role_count(uint8)uint32']>): BxHiveRegistryComposer<[...TReturns, BxHiveRegistryReturns['get_role_count(uint8)uint32'] | undefined]>
+
   /**
    * Makes a clear_state call to an existing instance of the BxHiveRegistry smart contract.
    *
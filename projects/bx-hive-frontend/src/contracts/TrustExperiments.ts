@@ -14,7 +14,7 @@ import { SendParams,SendTransactionComposerResults  } from '@algorandfoundation/
 import { AppFactoryCreateMethodCallParams, AppFactoryAppClientParams, AppFactoryDeployParams, AppFactoryParams, AppFactory as _AppFactory, AppFactoryResolveAppClientByCreatorAndNameParams, CreateSchema  } from '@algorandfoundation/algokit-utils/app-factory'
 import { TransactionComposer, TransactionComposerConfig, SkipSignaturesSimulateOptions, RawSimulateOptions, SimulateOptions, AppMethodCallTransactionArgument } from '@algorandfoundation/algokit-utils/composer'
 
-export const APP_SPEC: Arc56Contract = {"name":"TrustExperiments","structs":{"ExperimentGroup":[{"name":"expId","type":"uint32"},{"name":"owner","type":"address"},{"name":"name","type":"string"},{"name":"createdAt","type":"uint64"},{"name":"variationCount","type":"uint64"}],"VariationInfo":[{"name":"varId","type":"uint32"},{"name":"appId","type":"uint64"},{"name":"label","type":"string"},{"name":"createdAt","type":"uint64"}]},"methods":[{"name":"create","args":[{"type":"uint64","name":"registry_app"}],"returns":{"type":"void"},"actions":{"create":["NoOp"],"call":[]},"readonly":false,"events":[],"recommendations":{}},{"name":"set_trust_variation_program","args":[{"type":"byte[]","name":"approval"},{"type":"byte[]","name":"clear"},{"type":"pay","name":"mbr_payment"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[],"recommendations":{}},{"name":"opt_in_to_asset","args":[{"type":"uint64","name":"asset_id"},{"type":"pay","name":"mbr_payment"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"One-time per-asset setup: opt the TrustExperiments app account into\nan ASA so it can receive escrow asset-transfer legs from experimenters. Idempotent — no-op if already opted in. Caller pays the 0.1 ALGO MBR that the opt-in adds to this contract's account.","events":[],"recommendations":{}},{"name":"create_experiment","args":[{"type":"string","name":"name"}],"returns":{"type":"uint32"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[],"recommendations":{}},{"name":"create_variation","args":[{"type":"uint32","name":"exp_id"},{"type":"string","name":"label"},{"type":"uint64","name":"e1"},{"type":"uint64","name":"e2"},{"type":"uint64","name":"multiplier"},{"type":"uint64","name":"unit"},{"type":"uint64","name":"asset_id"},{"type":"uint64","name":"max_participants"},{"type":"pay","name":"mbr_payment"},{"type":"txn","name":"escrow_funding"}],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[],"recommendations":{}},{"name":"create_experiment_with_variation","args":[{"type":"string","name":"name"},{"type":"string","name":"label"},{"type":"uint64","name":"e1"},{"type":"uint64","name":"e2"},{"type":"uint64","name":"multiplier"},{"type":"uint64","name":"unit"},{"type":"uint64","name":"asset_id"},{"type":"uint64","name":"max_participants"},{"type":"pay","name":"mbr_payment"},{"type":"txn","name":"escrow_funding"}],"returns":{"type":"(uint32,uint64)"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[],"recommendations":{}},{"name":"get_experiment","args":[{"type":"uint32","name":"exp_id"}],"returns":{"type":"(uint32,address,string,uint64,uint64)","struct":"ExperimentGroup"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_variation","args":[{"type":"uint32","name":"exp_id"},{"type":"uint32","name":"var_id"}],"returns":{"type":"(uint32,uint64,string,uint64)","struct":"VariationInfo"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}}],"arcs":[22,28],"networks":{},"state":{"schema":{"global":{"ints":2,"bytes":0},"local":{"ints":0,"bytes":0}},"keys":{"global":{"registry_app":{"keyType":"AVMString","valueType":"AVMUint64","key":"cmVnaXN0cnlfYXBw"},"experiment_count":{"keyType":"AVMString","valueType":"AVMUint64","key":"ZXhwZXJpbWVudF9jb3VudA=="}},"local":{},"box":{"tv_approval":{"keyType":"AVMBytes","valueType":"AVMBytes","key":"dHZfYXBwcm92YWw="},"tv_clear":{"keyType":"AVMBytes","valueType":"AVMBytes","key":"dHZfY2xlYXI="}}},"maps":{"global":{},"local":{},"box":{"experiments":{"keyType":"uint32","valueType":"ExperimentGroup","prefix":"ZV8="},"variations":{"keyType":"uint64","valueType":"VariationInfo","prefix":"dl8="}}}},"bareActions":{"create":[],"call":[]},"sourceInfo":{"approval":{"sourceInfo":[{"pc":[314],"errorMessage":"Asset ID must be > 0"},{"pc":[629,958,1134,1488],"errorMessage":"Escrow must be > 0"},{"pc":[938,1468],"errorMessage":"Escrow must be AssetTransfer for ASA"},{"pc":[616,1121],"errorMessage":"Escrow must be Payment for ALGO"},{"pc":[556,1519],"errorMessage":"Experiment not found"},{"pc":[329,604,1109],"errorMessage":"MBR must be >= 0.1 ALGO"},{"pc":[969,1499],"errorMessage":"MBR must be >= 0.2 ALGO"},{"pc":[268],"errorMessage":"Not creator"},{"pc":[572],"errorMessage":"Not experiment owner"},{"pc":[127],"errorMessage":"OnCompletion must be NoOp"},{"pc":[577,582,1082,1087],"errorMessage":"TrustVariation program not set"},{"pc":[1561],"errorMessage":"Variation not found"},{"pc":[274,322,593,1098],"errorMessage":"Wrong MBR receiver"},{"pc":[952,1482],"errorMessage":"Wrong asset"},{"pc":[623,945,1128,1475],"errorMessage":"Wrong escrow receiver"},{"pc":[746,771,911,1287,1312,1441],"errorMessage":"application exists"},{"pc":[377,1138],"errorMessage":"check self.experiment_count exists"},{"pc":[672,1213],"errorMessage":"check self.registry_app exists"},{"pc":[659,1200],"errorMessage":"check self.tv_approval exists"},{"pc":[662,1203],"errorMessage":"check self.tv_clear exists"},{"pc":[224,241,365,455,985,999],"errorMessage":"invalid array length header"},{"pc":[232,249,373,462,992,1006],"errorMessage":"invalid number of bytes for arc4.dynamic_array<arc4.uint8>"},{"pc":[446,1510,1535,1543],"errorMessage":"invalid number of bytes for arc4.uint32"},{"pc":[211,297,472,482,492,502,513,523,1014,1022,1030,1038,1047,1057],"errorMessage":"invalid number of bytes for arc4.uint64"},{"pc":[385,649,1149],"errorMessage":"overflow"},{"pc":[262,307,537,1071],"errorMessage":"transaction type is pay"}],"pcOffsetMethod":"none"},"clear":{"sourceInfo":[],"pcOffsetMethod":"none"}},"source":{"approval":"I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgOCA0IDEwMDAwMCA0Mjk0OTY3Mjk2IDIwMDAwMAogICAgYnl0ZWNibG9jayAweDc0NzY1ZjYxNzA3MDcyNmY3NjYxNmMgMHg3NDc2NWY2MzZjNjU2MTcyICJleHBlcmltZW50X2NvdW50IiAweDE1MWY3Yzc1ICJyZWdpc3RyeV9hcHAiIDB4MDAzNiAweDY1NWYgMHg3NjVmIDB4MDAwMDAwMDAwMDAwMDAwMCAweGI4ZGI4NjA1IDB4NWM5YTgzNmIgMHgwMDE2IDB4MDAwMDAwMDAKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTozMgogICAgLy8gc2VsZi5yZWdpc3RyeV9hcHAgPSBHbG9iYWxTdGF0ZShVSW50NjQoMCkpCiAgICBieXRlYyA0IC8vICJyZWdpc3RyeV9hcHAiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTozMwogICAgLy8gc2VsZi5leHBlcmltZW50X2NvdW50ID0gR2xvYmFsU3RhdGUoVUludDY0KDApKQogICAgYnl0ZWNfMiAvLyAiZXhwZXJpbWVudF9jb3VudCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAoKbWFpbl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MzAKICAgIC8vIGNsYXNzIFRydXN0RXhwZXJpbWVudHMoQVJDNENvbnRyYWN0KToKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gbXVzdCBiZSBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYnogbWFpbl9jcmVhdGVfTm9PcEAxMwogICAgcHVzaGJ5dGVzcyAweDI5OWMzNTIxIDB4ZjgzNGM3NWMgMHgzMDI3N2NiNSAweDc2NjMyZTI5IDB4ZmJmYmQxZWQgMHhiZTYxN2JjYSAweDFhZjM3NmFkIC8vIG1ldGhvZCAic2V0X3RydXN0X3ZhcmlhdGlvbl9wcm9ncmFtKGJ5dGVbXSxieXRlW10scGF5KXZvaWQiLCBtZXRob2QgIm9wdF9pbl90b19hc3NldCh1aW50NjQscGF5KXZvaWQiLCBtZXRob2QgImNyZWF0ZV9leHBlcmltZW50KHN0cmluZyl1aW50MzIiLCBtZXRob2QgImNyZWF0ZV92YXJpYXRpb24odWludDMyLHN0cmluZyx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCxwYXksdHhuKXVpbnQ2NCIsIG1ldGhvZCAiY3JlYXRlX2V4cGVyaW1lbnRfd2l0aF92YXJpYXRpb24oc3RyaW5nLHN0cmluZyx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCxwYXksdHhuKSh1aW50MzIsdWludDY0KSIsIG1ldGhvZCAiZ2V0X2V4cGVyaW1lbnQodWludDMyKSh1aW50MzIsYWRkcmVzcyxzdHJpbmcsdWludDY0LHVpbnQ2NCkiLCBtZXRob2QgImdldF92YXJpYXRpb24odWludDMyLHVpbnQzMikodWludDMyLHVpbnQ2NCxzdHJpbmcsdWludDY0KSIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIHNldF90cnVzdF92YXJpYXRpb25fcHJvZ3JhbSBvcHRfaW5fdG9fYXNzZXQgY3JlYXRlX2V4cGVyaW1lbnQgY3JlYXRlX3ZhcmlhdGlvbiBjcmVhdGVfZXhwZXJpbWVudF93aXRoX3ZhcmlhdGlvbiBnZXRfZXhwZXJpbWVudCBnZXRfdmFyaWF0aW9uCiAgICBlcnIKCm1haW5fY3JlYXRlX05vT3BAMTM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MzAKICAgIC8vIGNsYXNzIFRydXN0RXhwZXJpbWVudHMoQVJDNENvbnRyYWN0KToKICAgIHB1c2hieXRlcyAweDI0MGQyZjY3IC8vIG1ldGhvZCAiY3JlYXRlKHVpbnQ2NCl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggY3JlYXRlCiAgICBlcnIKCgovLyBzbWFydF9jb250cmFjdHMudHJ1c3RfZXhwZXJpbWVudHMuY29udHJhY3QuVHJ1c3RFeHBlcmltZW50cy5jcmVhdGVbcm91dGluZ10oKSAtPiB2b2lkOgpjcmVhdGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NDIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChjcmVhdGU9InJlcXVpcmUiKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjQ0CiAgICAvLyBzZWxmLnJlZ2lzdHJ5X2FwcC52YWx1ZSA9IHJlZ2lzdHJ5X2FwcC5hc191aW50NjQoKQogICAgYnRvaQogICAgYnl0ZWMgNCAvLyAicmVnaXN0cnlfYXBwIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo0MgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGNyZWF0ZT0icmVxdWlyZSIpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnRydXN0X2V4cGVyaW1lbnRzLmNvbnRyYWN0LlRydXN0RXhwZXJpbWVudHMuc2V0X3RydXN0X3ZhcmlhdGlvbl9wcm9ncmFtW3JvdXRpbmddKCkgLT4gdm9pZDoKc2V0X3RydXN0X3ZhcmlhdGlvbl9wcm9ncmFtOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjQ2CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIHB1c2hpbnQgMiAvLyAyCiAgICArCiAgICBkaWcgMQogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50OD4KICAgIGV4dHJhY3QgMiAwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBwdXNoaW50IDIgLy8gMgogICAgKwogICAgZGlnIDEKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICBleHRyYWN0IDIgMAogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NTMKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsICJOb3QgY3JlYXRvciIKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBOb3QgY3JlYXRvcgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjU0CiAgICAvLyBhc3NlcnQgbWJyX3BheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywgIldyb25nIE1CUiByZWNlaXZlciIKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBXcm9uZyBNQlIgcmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo1NQogICAgLy8gc2VsZi50dl9hcHByb3ZhbC52YWx1ZSA9IGFwcHJvdmFsCiAgICBieXRlY18wIC8vIDB4NzQ3NjVmNjE3MDcwNzI2Zjc2NjE2YwogICAgYm94X2RlbAogICAgcG9wCiAgICBieXRlY18wIC8vIDB4NzQ3NjVmNjE3MDcwNzI2Zjc2NjE2YwogICAgdW5jb3ZlciAyCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NTYKICAgIC8vIHNlbGYudHZfY2xlYXIudmFsdWUgPSBjbGVhcgogICAgYnl0ZWNfMSAvLyAweDc0NzY1ZjYzNmM2NTYxNzIKICAgIGJveF9kZWwKICAgIHBvcAogICAgYnl0ZWNfMSAvLyAweDc0NzY1ZjYzNmM2NTYxNzIKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo0NgogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnRydXN0X2V4cGVyaW1lbnRzLmNvbnRyYWN0LlRydXN0RXhwZXJpbWVudHMub3B0X2luX3RvX2Fzc2V0W3JvdXRpbmddKCkgLT4gdm9pZDoKb3B0X2luX3RvX2Fzc2V0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjU4CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjY5CiAgICAvLyBhc3NlcnQgYXNzZXRfaWQuYXNfdWludDY0KCkgPiBVSW50NjQoMCksICJBc3NldCBJRCBtdXN0IGJlID4gMCIKICAgIHN3YXAKICAgIGJ0b2kKICAgIGR1cAogICAgY292ZXIgMgogICAgZHVwCiAgICBhc3NlcnQgLy8gQXNzZXQgSUQgbXVzdCBiZSA+IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo3MAogICAgLy8gYXNzZXJ0IG1icl9wYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsICJXcm9uZyBNQlIgcmVjZWl2ZXIiCiAgICBkaWcgMQogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIFdyb25nIE1CUiByZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjcxCiAgICAvLyBhc3NlcnQgbWJyX3BheW1lbnQuYW1vdW50ID49IFVJbnQ2NCgxMDBfMDAwKSwgIk1CUiBtdXN0IGJlID49IDAuMSBBTEdPIgogICAgc3dhcAogICAgZ3R4bnMgQW1vdW50CiAgICBpbnRjIDQgLy8gMTAwMDAwCiAgICA+PQogICAgYXNzZXJ0IC8vIE1CUiBtdXN0IGJlID49IDAuMSBBTEdPCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NzQKICAgIC8vIGlmIG5vdCBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLmlzX29wdGVkX2luKGFzc2V0KToKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBzd2FwCiAgICBhc3NldF9ob2xkaW5nX2dldCBBc3NldEJhbGFuY2UKICAgIGJ1cnkgMQogICAgYm56IG9wdF9pbl90b19hc3NldF9hZnRlcl9pZl9lbHNlQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo3NS04MAogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgLy8gICAgIHhmZXJfYXNzZXQ9YXNzZXQsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBhc3NldF9hbW91bnQ9VUludDY0KDApLAogICAgLy8gICAgIGZlZT0wLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5Ojc3CiAgICAvLyBhc3NldF9yZWNlaXZlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo3OAogICAgLy8gYXNzZXRfYW1vdW50PVVJbnQ2NCgwKSwKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEFzc2V0QW1vdW50CiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIGR1cAogICAgaXR4bl9maWVsZCBYZmVyQXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo3NQogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgaW50Y18zIC8vIGF4ZmVyCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NzkKICAgIC8vIGZlZT0wLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NzUtODAKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PWFzc2V0LAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PVVJbnQ2NCgwKSwKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CgpvcHRfaW5fdG9fYXNzZXRfYWZ0ZXJfaWZfZWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjU4CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMudHJ1c3RfZXhwZXJpbWVudHMuY29udHJhY3QuVHJ1c3RFeHBlcmltZW50cy5jcmVhdGVfZXhwZXJpbWVudFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmNyZWF0ZV9leHBlcmltZW50OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjgyCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIHB1c2hpbnQgMiAvLyAyCiAgICArCiAgICBkaWcgMQogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50OD4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo4NAogICAgLy8gZXhwX2lkID0gYXJjNC5VSW50MzIoc2VsZi5leHBlcmltZW50X2NvdW50LnZhbHVlKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gImV4cGVyaW1lbnRfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZXhwZXJpbWVudF9jb3VudCBleGlzdHMKICAgIGR1cAogICAgaXRvYgogICAgZHVwCiAgICBiaXRsZW4KICAgIHB1c2hpbnQgMzIgLy8gMzIKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGV4dHJhY3QgNCA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6ODUKICAgIC8vIHNlbGYuZXhwZXJpbWVudF9jb3VudC52YWx1ZSArPSBVSW50NjQoMSkKICAgIHN3YXAKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBieXRlY18yIC8vICJleHBlcmltZW50X2NvdW50IgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo4OAogICAgLy8gb3duZXI9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjkwCiAgICAvLyBjcmVhdGVkX2F0PWFyYzQuVUludDY0KEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wKSwKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo4Ni05MgogICAgLy8gc2VsZi5leHBlcmltZW50c1tleHBfaWRdID0gRXhwZXJpbWVudEdyb3VwKAogICAgLy8gICAgIGV4cF9pZD1leHBfaWQsCiAgICAvLyAgICAgb3duZXI9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgIG5hbWU9bmFtZSwKICAgIC8vICAgICBjcmVhdGVkX2F0PWFyYzQuVUludDY0KEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wKSwKICAgIC8vICAgICB2YXJpYXRpb25fY291bnQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyApCiAgICBkaWcgMgogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIGJ5dGVjIDUgLy8gMHgwMDM2CiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjkxCiAgICAvLyB2YXJpYXRpb25fY291bnQ9YXJjNC5VSW50NjQoMCksCiAgICBieXRlYyA4IC8vIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5Ojg2LTkyCiAgICAvLyBzZWxmLmV4cGVyaW1lbnRzW2V4cF9pZF0gPSBFeHBlcmltZW50R3JvdXAoCiAgICAvLyAgICAgZXhwX2lkPWV4cF9pZCwKICAgIC8vICAgICBvd25lcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgbmFtZT1uYW1lLAogICAgLy8gICAgIGNyZWF0ZWRfYXQ9YXJjNC5VSW50NjQoR2xvYmFsLmxhdGVzdF90aW1lc3RhbXApLAogICAgLy8gICAgIHZhcmlhdGlvbl9jb3VudD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICkKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo4NgogICAgLy8gc2VsZi5leHBlcmltZW50c1tleHBfaWRdID0gRXhwZXJpbWVudEdyb3VwKAogICAgYnl0ZWMgNiAvLyAweDY1NWYKICAgIGRpZyAyCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo4Ni05MgogICAgLy8gc2VsZi5leHBlcmltZW50c1tleHBfaWRdID0gRXhwZXJpbWVudEdyb3VwKAogICAgLy8gICAgIGV4cF9pZD1leHBfaWQsCiAgICAvLyAgICAgb3duZXI9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgIG5hbWU9bmFtZSwKICAgIC8vICAgICBjcmVhdGVkX2F0PWFyYzQuVUludDY0KEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wKSwKICAgIC8vICAgICB2YXJpYXRpb25fY291bnQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyApCiAgICBkdXAKICAgIGJveF9kZWwKICAgIHBvcAogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjgyCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGJ5dGVjXzMgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMudHJ1c3RfZXhwZXJpbWVudHMuY29udHJhY3QuVHJ1c3RFeHBlcmltZW50cy5jcmVhdGVfdmFyaWF0aW9uW3JvdXRpbmddKCkgLT4gdm9pZDoKY3JlYXRlX3ZhcmlhdGlvbjoKICAgIGludGNfMCAvLyAwCiAgICBkdXAKICAgIHB1c2hieXRlcyAiIgogICAgZHVwbiAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6OTUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwbiAyCiAgICBsZW4KICAgIGludGNfMyAvLyA0CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQzMgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBwdXNoaW50IDIgLy8gMgogICAgKwogICAgc3dhcAogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50OD4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGR1cAogICAgY292ZXIgMgogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDQKICAgIGR1cAogICAgY292ZXIgMgogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDUKICAgIGR1cAogICAgY292ZXIgMgogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDYKICAgIGR1cAogICAgY292ZXIgMgogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDcKICAgIGR1cAogICAgY292ZXIgMgogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgOAogICAgZHVwCiAgICBjb3ZlciAzCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgdHhuIEdyb3VwSW5kZXgKICAgIHB1c2hpbnQgMiAvLyAyCiAgICAtCiAgICBkdXAKICAgIGNvdmVyIDMKICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMSAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgY292ZXIgMwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjEwOQogICAgLy8gYXNzZXJ0IGV4cF9pZCBpbiBzZWxmLmV4cGVyaW1lbnRzLCAiRXhwZXJpbWVudCBub3QgZm91bmQiCiAgICBieXRlYyA2IC8vIDB4NjU1ZgogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIGR1cAogICAgY292ZXIgMwogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBFeHBlcmltZW50IG5vdCBmb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjExMAogICAgLy8gZXhwZXJpbWVudCA9IHNlbGYuZXhwZXJpbWVudHNbZXhwX2lkXS5jb3B5KCkKICAgIGR1cAogICAgYm94X2dldAogICAgcG9wCiAgICBjb3ZlciAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MTEwLTExMQogICAgLy8gZXhwZXJpbWVudCA9IHNlbGYuZXhwZXJpbWVudHNbZXhwX2lkXS5jb3B5KCkKICAgIC8vIGFzc2VydCBleHBlcmltZW50Lm93bmVyID09IGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwgIk5vdCBleHBlcmltZW50IG93bmVyIgogICAgaW50Y18zIC8vIDQKICAgIHB1c2hpbnQgMzIgLy8gMzIKICAgIGJveF9leHRyYWN0CiAgICBkdXAKICAgIGNvdmVyIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToxMTEKICAgIC8vIGFzc2VydCBleHBlcmltZW50Lm93bmVyID09IGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwgIk5vdCBleHBlcmltZW50IG93bmVyIgogICAgdHhuIFNlbmRlcgogICAgPT0KICAgIGFzc2VydCAvLyBOb3QgZXhwZXJpbWVudCBvd25lcgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjExMgogICAgLy8gYXNzZXJ0IHNlbGYudHZfYXBwcm92YWwsICJUcnVzdFZhcmlhdGlvbiBwcm9ncmFtIG5vdCBzZXQiCiAgICBieXRlY18wIC8vIDB4NzQ3NjVmNjE3MDcwNzI2Zjc2NjE2YwogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gVHJ1c3RWYXJpYXRpb24gcHJvZ3JhbSBub3Qgc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MTEzCiAgICAvLyBhc3NlcnQgc2VsZi50dl9jbGVhciwgIlRydXN0VmFyaWF0aW9uIHByb2dyYW0gbm90IHNldCIKICAgIGJ5dGVjXzEgLy8gMHg3NDc2NWY2MzZjNjU2MTcyCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBUcnVzdFZhcmlhdGlvbiBwcm9ncmFtIG5vdCBzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToxMTUKICAgIC8vIGFzc2V0X2lkX3ZhbHVlID0gYXNzZXRfaWQuYXNfdWludDY0KCkKICAgIHN3YXAKICAgIGJ0b2kKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MTE3LTExOQogICAgLy8gIyBNQlIgbGVnIGZ1bmRzIHRoZSBuZXcgdmFyaWF0aW9uIGFwcCdzIGFjY291bnQ6IDAuMSBBTEdPIGJhc2UgKyAwLjEgQUxHTwogICAgLy8gIyBwZXIgYXNzZXQgb3B0LWluLiBBbHdheXMgcGFpZCBpbiBBTEdPIHJlZ2FyZGxlc3Mgb2YgcGF5b3V0IGFzc2V0LgogICAgLy8gYXNzZXJ0IG1icl9wYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsICJXcm9uZyBNQlIgcmVjZWl2ZXIiCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gV3JvbmcgTUJSIHJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MTIwCiAgICAvLyBpZiBhc3NldF9pZF92YWx1ZSA9PSBVSW50NjQoMCk6CiAgICBibnogY3JlYXRlX3ZhcmlhdGlvbl9lbHNlX2JvZHlAMwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjEyMQogICAgLy8gYXNzZXJ0IG1icl9wYXltZW50LmFtb3VudCA+PSBVSW50NjQoX1ZBUl9BUFBfTUJSX0FMR08pLCAiTUJSIG11c3QgYmUgPj0gMC4xIEFMR08iCiAgICBkaWcgNQogICAgZ3R4bnMgQW1vdW50CiAgICBpbnRjIDQgLy8gMTAwMDAwCiAgICA+PQogICAgYXNzZXJ0IC8vIE1CUiBtdXN0IGJlID49IDAuMSBBTEdPCgpjcmVhdGVfdmFyaWF0aW9uX2FmdGVyX2lmX2Vsc2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToxMjgKICAgIC8vIGlmIGFzc2V0X2lkX3ZhbHVlID09IFVJbnQ2NCgwKToKICAgIGR1cAogICAgYm56IGNyZWF0ZV92YXJpYXRpb25fZWxzZV9ib2R5QDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToxMjkKICAgIC8vIGFzc2VydCBlc2Nyb3dfZnVuZGluZy50eXBlID09IFRyYW5zYWN0aW9uVHlwZS5QYXltZW50LCAiRXNjcm93IG11c3QgYmUgUGF5bWVudCBmb3IgQUxHTyIKICAgIGRpZyA0CiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIEVzY3JvdyBtdXN0IGJlIFBheW1lbnQgZm9yIEFMR08KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToxMzAKICAgIC8vIGFzc2VydCBlc2Nyb3dfZnVuZGluZy5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLCAiV3JvbmcgZXNjcm93IHJlY2VpdmVyIgogICAgZHVwCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gV3JvbmcgZXNjcm93IHJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MTMxCiAgICAvLyBhc3NlcnQgZXNjcm93X2Z1bmRpbmcuYW1vdW50ID4gVUludDY0KDApLCAiRXNjcm93IG11c3QgYmUgPiAwIgogICAgZ3R4bnMgQW1vdW50CiAgICBkdXAKICAgIGJ1cnkgMTcKICAgIGFzc2VydCAvLyBFc2Nyb3cgbXVzdCBiZSA+IDAKCmNyZWF0ZV92YXJpYXRpb25fYWZ0ZXJfaWZfZWxzZUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjE0MAogICAgLy8gdmFyX2lkID0gYXJjNC5VSW50MzIoZXhwZXJpbWVudC52YXJpYXRpb25fY291bnQuYXNfdWludDY0KCkpCiAgICBkaWcgMwogICAgcHVzaGludCA0NiAvLyA0NgogICAgaW50Y18yIC8vIDgKICAgIGJveF9leHRyYWN0CiAgICBidG9pCiAgICBkdXAKICAgIGJ1cnkgMTYKICAgIGl0b2IKICAgIGR1cAogICAgYnVyeSAyMAogICAgZHVwCiAgICBiaXRsZW4KICAgIHB1c2hpbnQgMzIgLy8gMzIKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGV4dHJhY3QgNCA0CiAgICBkdXAKICAgIGJ1cnkgMTkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToxNDItMTY0CiAgICAvLyAjIERlcGxveSBUcnVzdFZhcmlhdGlvbiBhbmQgY2FsbCBjcmVhdGUoKSBpbiBvbmUgdHJhbnNhY3Rpb24KICAgIC8vICMgU2VsZWN0b3I6IGNyZWF0ZSh1aW50NjQsdWludDMyLHVpbnQzMixhZGRyZXNzLHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCl2b2lkCiAgICAvLyBkZXBsb3llZCA9IGl0eG4uQXBwbGljYXRpb25DYWxsKAogICAgLy8gICAgIGFwcHJvdmFsX3Byb2dyYW09c2VsZi50dl9hcHByb3ZhbC52YWx1ZSwKICAgIC8vICAgICBjbGVhcl9zdGF0ZV9wcm9ncmFtPXNlbGYudHZfY2xlYXIudmFsdWUsCiAgICAvLyAgICAgZ2xvYmFsX251bV91aW50PV9UUlVTVF9WQVJfR0xPQkFMX1VJTlQsCiAgICAvLyAgICAgZ2xvYmFsX251bV9ieXRlcz1fVFJVU1RfVkFSX0dMT0JBTF9CWVRFUywKICAgIC8vICAgICBhcHBfYXJncz0oCiAgICAvLyAgICAgICAgIEJ5dGVzKGIiXHhiOFx4ZGJceDg2XHgwNSIpLAogICAgLy8gICAgICAgICBhcmM0LlVJbnQ2NChHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9pZC5pZCkuYnl0ZXMsCiAgICAvLyAgICAgICAgIGV4cF9pZC5ieXRlcywKICAgIC8vICAgICAgICAgdmFyX2lkLmJ5dGVzLAogICAgLy8gICAgICAgICBhcmM0LkFkZHJlc3MoVHhuLnNlbmRlcikuYnl0ZXMsCiAgICAvLyAgICAgICAgIGUxLmJ5dGVzLAogICAgLy8gICAgICAgICBlMi5ieXRlcywKICAgIC8vICAgICAgICAgbXVsdGlwbGllci5ieXRlcywKICAgIC8vICAgICAgICAgdW5pdC5ieXRlcywKICAgIC8vICAgICAgICAgYXNzZXRfaWQuYnl0ZXMsCiAgICAvLyAgICAgICAgIGFyYzQuVUludDY0KHNlbGYucmVnaXN0cnlfYXBwLnZhbHVlKS5ieXRlcywKICAgIC8vICAgICAgICAgbWF4X3BhcnRpY2lwYW50cy5ieXRlcywKICAgIC8vICAgICApLAogICAgLy8gICAgIGZlZT0wLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjE0NQogICAgLy8gYXBwcm92YWxfcHJvZ3JhbT1zZWxmLnR2X2FwcHJvdmFsLnZhbHVlLAogICAgYnl0ZWNfMCAvLyAweDc0NzY1ZjYxNzA3MDcyNmY3NjYxNmMKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnR2X2FwcHJvdmFsIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjE0NgogICAgLy8gY2xlYXJfc3RhdGVfcHJvZ3JhbT1zZWxmLnR2X2NsZWFyLnZhbHVlLAogICAgYnl0ZWNfMSAvLyAweDc0NzY1ZjYzNmM2NTYxNzIKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnR2X2NsZWFyIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjE1MQogICAgLy8gYXJjNC5VSW50NjQoR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQuaWQpLmJ5dGVzLAogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbklECiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MTU0CiAgICAvLyBhcmM0LkFkZHJlc3MoVHhuLnNlbmRlcikuYnl0ZXMsCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MTYwCiAgICAvLyBhcmM0LlVJbnQ2NChzZWxmLnJlZ2lzdHJ5X2FwcC52YWx1ZSkuYnl0ZXMsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAicmVnaXN0cnlfYXBwIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJlZ2lzdHJ5X2FwcCBleGlzdHMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToxNTAKICAgIC8vIEJ5dGVzKGIiXHhiOFx4ZGJceDg2XHgwNSIpLAogICAgYnl0ZWMgOSAvLyAweGI4ZGI4NjA1CiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgdW5jb3ZlciAyCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgZGlnIDE4CiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgdW5jb3ZlciA0CiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgc3dhcAogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGRpZyAxNAogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGRpZyAxMwogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGRpZyAxMgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGRpZyAxMQogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGRpZyAxMAogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBkaWcgOAogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToxNDgKICAgIC8vIGdsb2JhbF9udW1fYnl0ZXM9X1RSVVNUX1ZBUl9HTE9CQUxfQllURVMsCiAgICBpbnRjXzEgLy8gMQogICAgaXR4bl9maWVsZCBHbG9iYWxOdW1CeXRlU2xpY2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToxNDcKICAgIC8vIGdsb2JhbF9udW1fdWludD1fVFJVU1RfVkFSX0dMT0JBTF9VSU5ULAogICAgcHVzaGludCAxNiAvLyAxNgogICAgaXR4bl9maWVsZCBHbG9iYWxOdW1VaW50CiAgICBpdHhuX2ZpZWxkIENsZWFyU3RhdGVQcm9ncmFtUGFnZXMKICAgIGl0eG5fZmllbGQgQXBwcm92YWxQcm9ncmFtUGFnZXMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToxNDItMTQ0CiAgICAvLyAjIERlcGxveSBUcnVzdFZhcmlhdGlvbiBhbmQgY2FsbCBjcmVhdGUoKSBpbiBvbmUgdHJhbnNhY3Rpb24KICAgIC8vICMgU2VsZWN0b3I6IGNyZWF0ZSh1aW50NjQsdWludDMyLHVpbnQzMixhZGRyZXNzLHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCl2b2lkCiAgICAvLyBkZXBsb3llZCA9IGl0eG4uQXBwbGljYXRpb25DYWxsKAogICAgcHVzaGludCA2IC8vIGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToxNjMKICAgIC8vIGZlZT0wLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MTQyLTE2NAogICAgLy8gIyBEZXBsb3kgVHJ1c3RWYXJpYXRpb24gYW5kIGNhbGwgY3JlYXRlKCkgaW4gb25lIHRyYW5zYWN0aW9uCiAgICAvLyAjIFNlbGVjdG9yOiBjcmVhdGUodWludDY0LHVpbnQzMix1aW50MzIsYWRkcmVzcyx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQpdm9pZAogICAgLy8gZGVwbG95ZWQgPSBpdHhuLkFwcGxpY2F0aW9uQ2FsbCgKICAgIC8vICAgICBhcHByb3ZhbF9wcm9ncmFtPXNlbGYudHZfYXBwcm92YWwudmFsdWUsCiAgICAvLyAgICAgY2xlYXJfc3RhdGVfcHJvZ3JhbT1zZWxmLnR2X2NsZWFyLnZhbHVlLAogICAgLy8gICAgIGdsb2JhbF9udW1fdWludD1fVFJVU1RfVkFSX0dMT0JBTF9VSU5ULAogICAgLy8gICAgIGdsb2JhbF9udW1fYnl0ZXM9X1RSVVNUX1ZBUl9HTE9CQUxfQllURVMsCiAgICAvLyAgICAgYXBwX2FyZ3M9KAogICAgLy8gICAgICAgICBCeXRlcyhiIlx4YjhceGRiXHg4Nlx4MDUiKSwKICAgIC8vICAgICAgICAgYXJjNC5VSW50NjQoR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQuaWQpLmJ5dGVzLAogICAgLy8gICAgICAgICBleHBfaWQuYnl0ZXMsCiAgICAvLyAgICAgICAgIHZhcl9pZC5ieXRlcywKICAgIC8vICAgICAgICAgYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLmJ5dGVzLAogICAgLy8gICAgICAgICBlMS5ieXRlcywKICAgIC8vICAgICAgICAgZTIuYnl0ZXMsCiAgICAvLyAgICAgICAgIG11bHRpcGxpZXIuYnl0ZXMsCiAgICAvLyAgICAgICAgIHVuaXQuYnl0ZXMsCiAgICAvLyAgICAgICAgIGFzc2V0X2lkLmJ5dGVzLAogICAgLy8gICAgICAgICBhcmM0LlVJbnQ2NChzZWxmLnJlZ2lzdHJ5X2FwcC52YWx1ZSkuYnl0ZXMsCiAgICAvLyAgICAgICAgIG1heF9wYXJ0aWNpcGFudHMuYnl0ZXMsCiAgICAvLyAgICAgKSwKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICBpdHhuIENyZWF0ZWRBcHBsaWNhdGlvbklECiAgICBkdXAKICAgIGJ1cnkgMTgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToxNjctMTcyCiAgICAvLyAjIEZ1bmQgdGhlIG5ldyB2YXJpYXRpb24gYXBwJ3MgYWNjb3VudCB3aXRoIE1CUiAoY292ZXJzIGJhc2UgKyBvcHQtaW4pLgogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPW5ld19hcHAuYWRkcmVzcywKICAgIC8vICAgICBhbW91bnQ9bWJyX3BheW1lbnQuYW1vdW50LAogICAgLy8gICAgIGZlZT0wLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjE2OQogICAgLy8gcmVjZWl2ZXI9bmV3X2FwcC5hZGRyZXNzLAogICAgYXBwX3BhcmFtc19nZXQgQXBwQWRkcmVzcwogICAgYXNzZXJ0IC8vIGFwcGxpY2F0aW9uIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjE3MAogICAgLy8gYW1vdW50PW1icl9wYXltZW50LmFtb3VudCwKICAgIGRpZyA2CiAgICBndHhucyBBbW91bnQKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MTY3LTE2OAogICAgLy8gIyBGdW5kIHRoZSBuZXcgdmFyaWF0aW9uIGFwcCdzIGFjY291bnQgd2l0aCBNQlIgKGNvdmVycyBiYXNlICsgb3B0LWluKS4KICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIGludGNfMSAvLyBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToxNzEKICAgIC8vIGZlZT0wLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MTY3LTE3MgogICAgLy8gIyBGdW5kIHRoZSBuZXcgdmFyaWF0aW9uIGFwcCdzIGFjY291bnQgd2l0aCBNQlIgKGNvdmVycyBiYXNlICsgb3B0LWluKS4KICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1uZXdfYXBwLmFkZHJlc3MsCiAgICAvLyAgICAgYW1vdW50PW1icl9wYXltZW50LmFtb3VudCwKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MTc0LTE3NQogICAgLy8gIyBGb3J3YXJkIGVzY3JvdyB0byB0aGUgbmV3IFRydXN0VmFyaWF0aW9uIGFwcCBhY2NvdW50LgogICAgLy8gaWYgYXNzZXRfaWRfdmFsdWUgPT0gVUludDY0KDApOgogICAgZHVwCiAgICBibnogY3JlYXRlX3ZhcmlhdGlvbl9lbHNlX2JvZHlAMTIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToxNzYtMTgwCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9bmV3X2FwcC5hZGRyZXNzLAogICAgLy8gICAgIGFtb3VudD1lc2Nyb3dfYW1vdW50LAogICAgLy8gICAgIGZlZT0wLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjE3NwogICAgLy8gcmVjZWl2ZXI9bmV3X2FwcC5hZGRyZXNzLAogICAgZGlnIDE2CiAgICBhcHBfcGFyYW1zX2dldCBBcHBBZGRyZXNzCiAgICBhc3NlcnQgLy8gYXBwbGljYXRpb24gZXhpc3RzCiAgICBkaWcgMTYKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MTc2CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MTc5CiAgICAvLyBmZWU9MCwKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjE3Ni0xODAKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1uZXdfYXBwLmFkZHJlc3MsCiAgICAvLyAgICAgYW1vdW50PWVzY3Jvd19hbW91bnQsCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAoKY3JlYXRlX3ZhcmlhdGlvbl9hZnRlcl9pZl9lbHNlQDE0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjE4OS0xOTgKICAgIC8vICMgUmVjb3JkIHRoZSBkZXBvc2l0IGluIFRydXN0VmFyaWF0aW9uCiAgICAvLyAjIFNlbGVjdG9yOiByZWNvcmRfZXNjcm93KHVpbnQ2NCl2b2lkCiAgICAvLyBpdHhuLkFwcGxpY2F0aW9uQ2FsbCgKICAgIC8vICAgICBhcHBfaWQ9bmV3X2FwcCwKICAgIC8vICAgICBhcHBfYXJncz0oCiAgICAvLyAgICAgICAgIEJ5dGVzKGIiXHg1Y1x4OWFceDgzXHg2YiIpLAogICAgLy8gICAgICAgICBhcmM0LlVJbnQ2NChlc2Nyb3dfYW1vdW50KS5ieXRlcywKICAgIC8vICAgICApLAogICAgLy8gICAgIGZlZT0wLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjE5NQogICAgLy8gYXJjNC5VSW50NjQoZXNjcm93X2Ftb3VudCkuYnl0ZXMsCiAgICBkaWcgMTUKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToxOTQKICAgIC8vIEJ5dGVzKGIiXHg1Y1x4OWFceDgzXHg2YiIpLAogICAgYnl0ZWMgMTAgLy8gMHg1YzlhODM2YgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBkaWcgMTYKICAgIGR1cAogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbklECiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MTg5LTE5MQogICAgLy8gIyBSZWNvcmQgdGhlIGRlcG9zaXQgaW4gVHJ1c3RWYXJpYXRpb24KICAgIC8vICMgU2VsZWN0b3I6IHJlY29yZF9lc2Nyb3codWludDY0KXZvaWQKICAgIC8vIGl0eG4uQXBwbGljYXRpb25DYWxsKAogICAgcHVzaGludCA2IC8vIGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToxOTcKICAgIC8vIGZlZT0wLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MTg5LTE5OAogICAgLy8gIyBSZWNvcmQgdGhlIGRlcG9zaXQgaW4gVHJ1c3RWYXJpYXRpb24KICAgIC8vICMgU2VsZWN0b3I6IHJlY29yZF9lc2Nyb3codWludDY0KXZvaWQKICAgIC8vIGl0eG4uQXBwbGljYXRpb25DYWxsKAogICAgLy8gICAgIGFwcF9pZD1uZXdfYXBwLAogICAgLy8gICAgIGFwcF9hcmdzPSgKICAgIC8vICAgICAgICAgQnl0ZXMoYiJceDVjXHg5YVx4ODNceDZiIiksCiAgICAvLyAgICAgICAgIGFyYzQuVUludDY0KGVzY3Jvd19hbW91bnQpLmJ5dGVzLAogICAgLy8gICAgICksCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjIwMgogICAgLy8gZXhwZXJpbWVudC5leHBfaWQuYXNfdWludDY0KCkgKiBVSW50NjQoNDI5NDk2NzI5NikgKyB2YXJfaWQuYXNfdWludDY0KCkKICAgIGRpZyA0CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGludGNfMCAvLyAwCiAgICBpbnRjXzMgLy8gNAogICAgYm94X2V4dHJhY3QKICAgIGR1cAogICAgYnRvaQogICAgaW50YyA1IC8vIDQyOTQ5NjcyOTYKICAgICoKICAgIGRpZyAyMgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjE0MAogICAgLy8gdmFyX2lkID0gYXJjNC5VSW50MzIoZXhwZXJpbWVudC52YXJpYXRpb25fY291bnQuYXNfdWludDY0KCkpCiAgICBpbnRjXzMgLy8gNAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjIwMgogICAgLy8gZXhwZXJpbWVudC5leHBfaWQuYXNfdWludDY0KCkgKiBVSW50NjQoNDI5NDk2NzI5NikgKyB2YXJfaWQuYXNfdWludDY0KCkKICAgIGV4dHJhY3RfdWludDMyCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MjAwLTIwMwogICAgLy8gIyBQYWNrZWQgY29tcG9zaXRlIGtleTogaGlnaCAzMiBiaXRzID0gZXhwX2lkLCBsb3cgMzIgYml0cyA9IHZhcl9pZAogICAgLy8gdmFyaWF0aW9uX2tleSA9IGFyYzQuVUludDY0KAogICAgLy8gICAgIGV4cGVyaW1lbnQuZXhwX2lkLmFzX3VpbnQ2NCgpICogVUludDY0KDQyOTQ5NjcyOTYpICsgdmFyX2lkLmFzX3VpbnQ2NCgpCiAgICAvLyApCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MjA2CiAgICAvLyBhcHBfaWQ9YXJjNC5VSW50NjQobmV3X2FwcC5pZCksCiAgICB1bmNvdmVyIDIKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToyMDgKICAgIC8vIGNyZWF0ZWRfYXQ9YXJjNC5VSW50NjQoR2xvYmFsLmxhdGVzdF90aW1lc3RhbXApLAogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjIwNC0yMDkKICAgIC8vIHNlbGYudmFyaWF0aW9uc1t2YXJpYXRpb25fa2V5XSA9IFZhcmlhdGlvbkluZm8oCiAgICAvLyAgICAgdmFyX2lkPXZhcl9pZCwKICAgIC8vICAgICBhcHBfaWQ9YXJjNC5VSW50NjQobmV3X2FwcC5pZCksCiAgICAvLyAgICAgbGFiZWw9bGFiZWwsCiAgICAvLyAgICAgY3JlYXRlZF9hdD1hcmM0LlVJbnQ2NChHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCksCiAgICAvLyApCiAgICBkaWcgMjIKICAgIGRpZyAyCiAgICBjb25jYXQKICAgIGJ5dGVjIDExIC8vIDB4MDAxNgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGRpZyAxNwogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MjA0CiAgICAvLyBzZWxmLnZhcmlhdGlvbnNbdmFyaWF0aW9uX2tleV0gPSBWYXJpYXRpb25JbmZvKAogICAgYnl0ZWMgNyAvLyAweDc2NWYKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MjA0LTIwOQogICAgLy8gc2VsZi52YXJpYXRpb25zW3ZhcmlhdGlvbl9rZXldID0gVmFyaWF0aW9uSW5mbygKICAgIC8vICAgICB2YXJfaWQ9dmFyX2lkLAogICAgLy8gICAgIGFwcF9pZD1hcmM0LlVJbnQ2NChuZXdfYXBwLmlkKSwKICAgIC8vICAgICBsYWJlbD1sYWJlbCwKICAgIC8vICAgICBjcmVhdGVkX2F0PWFyYzQuVUludDY0KEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wKSwKICAgIC8vICkKICAgIGR1cAogICAgYm94X2RlbAogICAgcG9wCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MjE1CiAgICAvLyBuYW1lPWV4cGVyaW1lbnQubmFtZSwKICAgIGRpZyA1CiAgICBkdXAKICAgIHB1c2hpbnQgMzYgLy8gMzYKICAgIGV4dHJhY3RfdWludDE2CiAgICBkaWcgMQogICAgbGVuCiAgICBzdWJzdHJpbmczCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MjE2CiAgICAvLyBjcmVhdGVkX2F0PWV4cGVyaW1lbnQuY3JlYXRlZF9hdCwKICAgIGRpZyAzCiAgICBwdXNoaW50IDM4IC8vIDM4CiAgICBpbnRjXzIgLy8gOAogICAgYm94X2V4dHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToyMTcKICAgIC8vIHZhcmlhdGlvbl9jb3VudD1hcmM0LlVJbnQ2NChleHBlcmltZW50LnZhcmlhdGlvbl9jb3VudC5hc191aW50NjQoKSArIFVJbnQ2NCgxKSksCiAgICBkaWcgMTkKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MjExLTIxOAogICAgLy8gIyBJbmNyZW1lbnQgZXhwZXJpbWVudCB2YXJpYXRpb24gY291bnQKICAgIC8vIHNlbGYuZXhwZXJpbWVudHNbZXhwX2lkXSA9IEV4cGVyaW1lbnRHcm91cCgKICAgIC8vICAgICBleHBfaWQ9ZXhwZXJpbWVudC5leHBfaWQsCiAgICAvLyAgICAgb3duZXI9ZXhwZXJpbWVudC5vd25lci5jb3B5KCksCiAgICAvLyAgICAgbmFtZT1leHBlcmltZW50Lm5hbWUsCiAgICAvLyAgICAgY3JlYXRlZF9hdD1leHBlcmltZW50LmNyZWF0ZWRfYXQsCiAgICAvLyAgICAgdmFyaWF0aW9uX2NvdW50PWFyYzQuVUludDY0KGV4cGVyaW1lbnQudmFyaWF0aW9uX2NvdW50LmFzX3VpbnQ2NCgpICsgVUludDY0KDEpKSwKICAgIC8vICkKICAgIHVuY292ZXIgNAogICAgZGlnIDcKICAgIGNvbmNhdAogICAgYnl0ZWMgNSAvLyAweDAwMzYKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBkaWcgMgogICAgYm94X2RlbAogICAgcG9wCiAgICB1bmNvdmVyIDIKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo5NQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBieXRlY18zIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgpjcmVhdGVfdmFyaWF0aW9uX2Vsc2VfYm9keUAxMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToxODItMTg3CiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1Bc3NldChhc3NldF9pZF92YWx1ZSksCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9bmV3X2FwcC5hZGRyZXNzLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1lc2Nyb3dfYW1vdW50LAogICAgLy8gICAgIGZlZT0wLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjE4NAogICAgLy8gYXNzZXRfcmVjZWl2ZXI9bmV3X2FwcC5hZGRyZXNzLAogICAgZGlnIDE2CiAgICBhcHBfcGFyYW1zX2dldCBBcHBBZGRyZXNzCiAgICBhc3NlcnQgLy8gYXBwbGljYXRpb24gZXhpc3RzCiAgICBkaWcgMTYKICAgIGl0eG5fZmllbGQgQXNzZXRBbW91bnQKICAgIGl0eG5fZmllbGQgQXNzZXRSZWNlaXZlcgogICAgZHVwCiAgICBpdHhuX2ZpZWxkIFhmZXJBc3NldAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjE4MgogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgaW50Y18zIC8vIGF4ZmVyCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MTg2CiAgICAvLyBmZWU9MCwKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjE4Mi0xODcKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PUFzc2V0KGFzc2V0X2lkX3ZhbHVlKSwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1uZXdfYXBwLmFkZHJlc3MsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PWVzY3Jvd19hbW91bnQsCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgYiBjcmVhdGVfdmFyaWF0aW9uX2FmdGVyX2lmX2Vsc2VAMTQKCmNyZWF0ZV92YXJpYXRpb25fZWxzZV9ib2R5QDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MTM0CiAgICAvLyBhc3NlcnQgZXNjcm93X2Z1bmRpbmcudHlwZSA9PSBUcmFuc2FjdGlvblR5cGUuQXNzZXRUcmFuc2ZlciwgIkVzY3JvdyBtdXN0IGJlIEFzc2V0VHJhbnNmZXIgZm9yIEFTQSIKICAgIGRpZyA0CiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzMgLy8gYXhmZXIKICAgID09CiAgICBhc3NlcnQgLy8gRXNjcm93IG11c3QgYmUgQXNzZXRUcmFuc2ZlciBmb3IgQVNBCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MTM1CiAgICAvLyBhc3NlcnQgZXNjcm93X2Z1bmRpbmcuYXNzZXRfcmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywgIldyb25nIGVzY3JvdyByZWNlaXZlciIKICAgIGR1cAogICAgZ3R4bnMgQXNzZXRSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gV3JvbmcgZXNjcm93IHJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MTM2CiAgICAvLyBhc3NlcnQgZXNjcm93X2Z1bmRpbmcueGZlcl9hc3NldC5pZCA9PSBhc3NldF9pZF92YWx1ZSwgIldyb25nIGFzc2V0IgogICAgZHVwCiAgICBndHhucyBYZmVyQXNzZXQKICAgIGRpZyAyCiAgICA9PQogICAgYXNzZXJ0IC8vIFdyb25nIGFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MTM3CiAgICAvLyBhc3NlcnQgZXNjcm93X2Z1bmRpbmcuYXNzZXRfYW1vdW50ID4gVUludDY0KDApLCAiRXNjcm93IG11c3QgYmUgPiAwIgogICAgZ3R4bnMgQXNzZXRBbW91bnQKICAgIGR1cAogICAgYnVyeSAxNwogICAgYXNzZXJ0IC8vIEVzY3JvdyBtdXN0IGJlID4gMAogICAgYiBjcmVhdGVfdmFyaWF0aW9uX2FmdGVyX2lmX2Vsc2VANwoKY3JlYXRlX3ZhcmlhdGlvbl9lbHNlX2JvZHlAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToxMjMKICAgIC8vIGFzc2VydCBtYnJfcGF5bWVudC5hbW91bnQgPj0gVUludDY0KF9WQVJfQVBQX01CUl9BU0EpLCAiTUJSIG11c3QgYmUgPj0gMC4yIEFMR08iCiAgICBkaWcgNQogICAgZ3R4bnMgQW1vdW50CiAgICBpbnRjIDYgLy8gMjAwMDAwCiAgICA+PQogICAgYXNzZXJ0IC8vIE1CUiBtdXN0IGJlID49IDAuMiBBTEdPCiAgICBiIGNyZWF0ZV92YXJpYXRpb25fYWZ0ZXJfaWZfZWxzZUA0CgoKLy8gc21hcnRfY29udHJhY3RzLnRydXN0X2V4cGVyaW1lbnRzLmNvbnRyYWN0LlRydXN0RXhwZXJpbWVudHMuY3JlYXRlX2V4cGVyaW1lbnRfd2l0aF92YXJpYXRpb25bcm91dGluZ10oKSAtPiB2b2lkOgpjcmVhdGVfZXhwZXJpbWVudF93aXRoX3ZhcmlhdGlvbjoKICAgIGludGNfMCAvLyAwCiAgICBkdXBuIDIKICAgIHB1c2hieXRlcyAiIgogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MjIyCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cG4gMgogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIHB1c2hpbnQgMiAvLyAyCiAgICArCiAgICBzd2FwCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwbiAyCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgcHVzaGludCAyIC8vIDIKICAgICsKICAgIHN3YXAKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA0CiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA1CiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA2CiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA3CiAgICBkdXBuIDIKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA4CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICB0eG4gR3JvdXBJbmRleAogICAgcHVzaGludCAyIC8vIDIKICAgIC0KICAgIGR1cAogICAgY292ZXIgMgogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBjb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MjM2CiAgICAvLyBhc3NlcnQgc2VsZi50dl9hcHByb3ZhbCwgIlRydXN0VmFyaWF0aW9uIHByb2dyYW0gbm90IHNldCIKICAgIGJ5dGVjXzAgLy8gMHg3NDc2NWY2MTcwNzA3MjZmNzY2MTZjCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBUcnVzdFZhcmlhdGlvbiBwcm9ncmFtIG5vdCBzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToyMzcKICAgIC8vIGFzc2VydCBzZWxmLnR2X2NsZWFyLCAiVHJ1c3RWYXJpYXRpb24gcHJvZ3JhbSBub3Qgc2V0IgogICAgYnl0ZWNfMSAvLyAweDc0NzY1ZjYzNmM2NTYxNzIKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIFRydXN0VmFyaWF0aW9uIHByb2dyYW0gbm90IHNldAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjIzOQogICAgLy8gYXNzZXRfaWRfdmFsdWUgPSBhc3NldF9pZC5hc191aW50NjQoKQogICAgc3dhcAogICAgYnRvaQogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToyNDEtMjQyCiAgICAvLyAjIE1CUiBsZWcgZnVuZHMgdGhlIG5ldyB2YXJpYXRpb24gYXBwJ3MgYWNjb3VudDsgYWx3YXlzIEFMR08uCiAgICAvLyBhc3NlcnQgbWJyX3BheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywgIldyb25nIE1CUiByZWNlaXZlciIKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBXcm9uZyBNQlIgcmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToyNDMKICAgIC8vIGlmIGFzc2V0X2lkX3ZhbHVlID09IFVJbnQ2NCgwKToKICAgIGJueiBjcmVhdGVfZXhwZXJpbWVudF93aXRoX3ZhcmlhdGlvbl9lbHNlX2JvZHlAMwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjI0NAogICAgLy8gYXNzZXJ0IG1icl9wYXltZW50LmFtb3VudCA+PSBVSW50NjQoX1ZBUl9BUFBfTUJSX0FMR08pLCAiTUJSIG11c3QgYmUgPj0gMC4xIEFMR08iCiAgICBkaWcgMgogICAgZ3R4bnMgQW1vdW50CiAgICBpbnRjIDQgLy8gMTAwMDAwCiAgICA+PQogICAgYXNzZXJ0IC8vIE1CUiBtdXN0IGJlID49IDAuMSBBTEdPCgpjcmVhdGVfZXhwZXJpbWVudF93aXRoX3ZhcmlhdGlvbl9hZnRlcl9pZl9lbHNlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MjUwCiAgICAvLyBpZiBhc3NldF9pZF92YWx1ZSA9PSBVSW50NjQoMCk6CiAgICBkdXAKICAgIGJueiBjcmVhdGVfZXhwZXJpbWVudF93aXRoX3ZhcmlhdGlvbl9lbHNlX2JvZHlANgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjI1MQogICAgLy8gYXNzZXJ0IGVzY3Jvd19mdW5kaW5nLnR5cGUgPT0gVHJhbnNhY3Rpb25UeXBlLlBheW1lbnQsICJFc2Nyb3cgbXVzdCBiZSBQYXltZW50IGZvciBBTEdPIgogICAgZGlnIDEKICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMSAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gRXNjcm93IG11c3QgYmUgUGF5bWVudCBmb3IgQUxHTwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjI1MgogICAgLy8gYXNzZXJ0IGVzY3Jvd19mdW5kaW5nLnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsICJXcm9uZyBlc2Nyb3cgcmVjZWl2ZXIiCiAgICBkdXAKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBXcm9uZyBlc2Nyb3cgcmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToyNTMKICAgIC8vIGFzc2VydCBlc2Nyb3dfZnVuZGluZy5hbW91bnQgPiBVSW50NjQoMCksICJFc2Nyb3cgbXVzdCBiZSA+IDAiCiAgICBndHhucyBBbW91bnQKICAgIGR1cAogICAgYnVyeSAxMwogICAgYXNzZXJ0IC8vIEVzY3JvdyBtdXN0IGJlID4gMAoKY3JlYXRlX2V4cGVyaW1lbnRfd2l0aF92YXJpYXRpb25fYWZ0ZXJfaWZfZWxzZUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjI2Mi0yNjMKICAgIC8vICMgQ3JlYXRlIHRoZSBleHBlcmltZW50IGdyb3VwCiAgICAvLyBleHBfaWQgPSBhcmM0LlVJbnQzMihzZWxmLmV4cGVyaW1lbnRfY291bnQudmFsdWUpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAiZXhwZXJpbWVudF9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5leHBlcmltZW50X2NvdW50IGV4aXN0cwogICAgZHVwCiAgICBpdG9iCiAgICBkdXAKICAgIGJ1cnkgMTgKICAgIGR1cAogICAgYml0bGVuCiAgICBwdXNoaW50IDMyIC8vIDMyCiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDQgNAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBidXJ5IDE2CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MjY0CiAgICAvLyBzZWxmLmV4cGVyaW1lbnRfY291bnQudmFsdWUgKz0gVUludDY0KDEpCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnl0ZWNfMiAvLyAiZXhwZXJpbWVudF9jb3VudCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MjY3CiAgICAvLyBvd25lcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MjY5CiAgICAvLyBjcmVhdGVkX2F0PWFyYzQuVUludDY0KEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wKSwKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToyNjUtMjcxCiAgICAvLyBzZWxmLmV4cGVyaW1lbnRzW2V4cF9pZF0gPSBFeHBlcmltZW50R3JvdXAoCiAgICAvLyAgICAgZXhwX2lkPWV4cF9pZCwKICAgIC8vICAgICBvd25lcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgbmFtZT1uYW1lLAogICAgLy8gICAgIGNyZWF0ZWRfYXQ9YXJjNC5VSW50NjQoR2xvYmFsLmxhdGVzdF90aW1lc3RhbXApLAogICAgLy8gICAgIHZhcmlhdGlvbl9jb3VudD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICkKICAgIGRpZyAyCiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgYnl0ZWMgNSAvLyAweDAwMzYKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MjcwCiAgICAvLyB2YXJpYXRpb25fY291bnQ9YXJjNC5VSW50NjQoMCksCiAgICBieXRlYyA4IC8vIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjI2NS0yNzEKICAgIC8vIHNlbGYuZXhwZXJpbWVudHNbZXhwX2lkXSA9IEV4cGVyaW1lbnRHcm91cCgKICAgIC8vICAgICBleHBfaWQ9ZXhwX2lkLAogICAgLy8gICAgIG93bmVyPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICBuYW1lPW5hbWUsCiAgICAvLyAgICAgY3JlYXRlZF9hdD1hcmM0LlVJbnQ2NChHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCksCiAgICAvLyAgICAgdmFyaWF0aW9uX2NvdW50PWFyYzQuVUludDY0KDApLAogICAgLy8gKQogICAgY29uY2F0CiAgICBkaWcgMTIKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjI2NQogICAgLy8gc2VsZi5leHBlcmltZW50c1tleHBfaWRdID0gRXhwZXJpbWVudEdyb3VwKAogICAgYnl0ZWMgNiAvLyAweDY1NWYKICAgIGRpZyAyCiAgICBjb25jYXQKICAgIGR1cAogICAgYnVyeSAxOAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjI2NS0yNzEKICAgIC8vIHNlbGYuZXhwZXJpbWVudHNbZXhwX2lkXSA9IEV4cGVyaW1lbnRHcm91cCgKICAgIC8vICAgICBleHBfaWQ9ZXhwX2lkLAogICAgLy8gICAgIG93bmVyPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICBuYW1lPW5hbWUsCiAgICAvLyAgICAgY3JlYXRlZF9hdD1hcmM0LlVJbnQ2NChHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCksCiAgICAvLyAgICAgdmFyaWF0aW9uX2NvdW50PWFyYzQuVUludDY0KDApLAogICAgLy8gKQogICAgZHVwCiAgICBib3hfZGVsCiAgICBwb3AKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToyNzYtMjk4CiAgICAvLyAjIERlcGxveSBUcnVzdFZhcmlhdGlvbiBhbmQgY2FsbCBjcmVhdGUoKSBpbiBvbmUgdHJhbnNhY3Rpb24KICAgIC8vICMgU2VsZWN0b3I6IGNyZWF0ZSh1aW50NjQsdWludDMyLHVpbnQzMixhZGRyZXNzLHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCl2b2lkCiAgICAvLyBkZXBsb3llZCA9IGl0eG4uQXBwbGljYXRpb25DYWxsKAogICAgLy8gICAgIGFwcHJvdmFsX3Byb2dyYW09c2VsZi50dl9hcHByb3ZhbC52YWx1ZSwKICAgIC8vICAgICBjbGVhcl9zdGF0ZV9wcm9ncmFtPXNlbGYudHZfY2xlYXIudmFsdWUsCiAgICAvLyAgICAgZ2xvYmFsX251bV91aW50PV9UUlVTVF9WQVJfR0xPQkFMX1VJTlQsCiAgICAvLyAgICAgZ2xvYmFsX251bV9ieXRlcz1fVFJVU1RfVkFSX0dMT0JBTF9CWVRFUywKICAgIC8vICAgICBhcHBfYXJncz0oCiAgICAvLyAgICAgICAgIEJ5dGVzKGIiXHhiOFx4ZGJceDg2XHgwNSIpLAogICAgLy8gICAgICAgICBhcmM0LlVJbnQ2NChHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9pZC5pZCkuYnl0ZXMsCiAgICAvLyAgICAgICAgIGV4cF9pZC5ieXRlcywKICAgIC8vICAgICAgICAgdmFyX2lkLmJ5dGVzLAogICAgLy8gICAgICAgICBhcmM0LkFkZHJlc3MoVHhuLnNlbmRlcikuYnl0ZXMsCiAgICAvLyAgICAgICAgIGUxLmJ5dGVzLAogICAgLy8gICAgICAgICBlMi5ieXRlcywKICAgIC8vICAgICAgICAgbXVsdGlwbGllci5ieXRlcywKICAgIC8vICAgICAgICAgdW5pdC5ieXRlcywKICAgIC8vICAgICAgICAgYXNzZXRfaWQuYnl0ZXMsCiAgICAvLyAgICAgICAgIGFyYzQuVUludDY0KHNlbGYucmVnaXN0cnlfYXBwLnZhbHVlKS5ieXRlcywKICAgIC8vICAgICAgICAgbWF4X3BhcnRpY2lwYW50cy5ieXRlcywKICAgIC8vICAgICApLAogICAgLy8gICAgIGZlZT0wLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjI3OQogICAgLy8gYXBwcm92YWxfcHJvZ3JhbT1zZWxmLnR2X2FwcHJvdmFsLnZhbHVlLAogICAgYnl0ZWNfMCAvLyAweDc0NzY1ZjYxNzA3MDcyNmY3NjYxNmMKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnR2X2FwcHJvdmFsIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjI4MAogICAgLy8gY2xlYXJfc3RhdGVfcHJvZ3JhbT1zZWxmLnR2X2NsZWFyLnZhbHVlLAogICAgYnl0ZWNfMSAvLyAweDc0NzY1ZjYzNmM2NTYxNzIKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnR2X2NsZWFyIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjI4NQogICAgLy8gYXJjNC5VSW50NjQoR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQuaWQpLmJ5dGVzLAogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbklECiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6Mjg4CiAgICAvLyBhcmM0LkFkZHJlc3MoVHhuLnNlbmRlcikuYnl0ZXMsCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6Mjk0CiAgICAvLyBhcmM0LlVJbnQ2NChzZWxmLnJlZ2lzdHJ5X2FwcC52YWx1ZSkuYnl0ZXMsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAicmVnaXN0cnlfYXBwIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJlZ2lzdHJ5X2FwcCBleGlzdHMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToyODQKICAgIC8vIEJ5dGVzKGIiXHhiOFx4ZGJceDg2XHgwNSIpLAogICAgYnl0ZWMgOSAvLyAweGI4ZGI4NjA1CiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgdW5jb3ZlciAyCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgdW5jb3ZlciA0CiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjI3My0yNzQKICAgIC8vICMgQ3JlYXRlIHRoZSBmaXJzdCB2YXJpYXRpb24gKHZhcl9pZCA9IDApCiAgICAvLyB2YXJfaWQgPSBhcmM0LlVJbnQzMigwKQogICAgYnl0ZWMgMTIgLy8gMHgwMDAwMDAwMAogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIHN3YXAKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBkaWcgMTEKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBkaWcgMTAKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBkaWcgOQogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGRpZyA4CiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgZGlnIDcKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgZGlnIDUKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MjgyCiAgICAvLyBnbG9iYWxfbnVtX2J5dGVzPV9UUlVTVF9WQVJfR0xPQkFMX0JZVEVTLAogICAgaW50Y18xIC8vIDEKICAgIGl0eG5fZmllbGQgR2xvYmFsTnVtQnl0ZVNsaWNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MjgxCiAgICAvLyBnbG9iYWxfbnVtX3VpbnQ9X1RSVVNUX1ZBUl9HTE9CQUxfVUlOVCwKICAgIHB1c2hpbnQgMTYgLy8gMTYKICAgIGl0eG5fZmllbGQgR2xvYmFsTnVtVWludAogICAgaXR4bl9maWVsZCBDbGVhclN0YXRlUHJvZ3JhbVBhZ2VzCiAgICBpdHhuX2ZpZWxkIEFwcHJvdmFsUHJvZ3JhbVBhZ2VzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6Mjc2LTI3OAogICAgLy8gIyBEZXBsb3kgVHJ1c3RWYXJpYXRpb24gYW5kIGNhbGwgY3JlYXRlKCkgaW4gb25lIHRyYW5zYWN0aW9uCiAgICAvLyAjIFNlbGVjdG9yOiBjcmVhdGUodWludDY0LHVpbnQzMix1aW50MzIsYWRkcmVzcyx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQpdm9pZAogICAgLy8gZGVwbG95ZWQgPSBpdHhuLkFwcGxpY2F0aW9uQ2FsbCgKICAgIHB1c2hpbnQgNiAvLyBhcHBsCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6Mjk3CiAgICAvLyBmZWU9MCwKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjI3Ni0yOTgKICAgIC8vICMgRGVwbG95IFRydXN0VmFyaWF0aW9uIGFuZCBjYWxsIGNyZWF0ZSgpIGluIG9uZSB0cmFuc2FjdGlvbgogICAgLy8gIyBTZWxlY3RvcjogY3JlYXRlKHVpbnQ2NCx1aW50MzIsdWludDMyLGFkZHJlc3MsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0KXZvaWQKICAgIC8vIGRlcGxveWVkID0gaXR4bi5BcHBsaWNhdGlvbkNhbGwoCiAgICAvLyAgICAgYXBwcm92YWxfcHJvZ3JhbT1zZWxmLnR2X2FwcHJvdmFsLnZhbHVlLAogICAgLy8gICAgIGNsZWFyX3N0YXRlX3Byb2dyYW09c2VsZi50dl9jbGVhci52YWx1ZSwKICAgIC8vICAgICBnbG9iYWxfbnVtX3VpbnQ9X1RSVVNUX1ZBUl9HTE9CQUxfVUlOVCwKICAgIC8vICAgICBnbG9iYWxfbnVtX2J5dGVzPV9UUlVTVF9WQVJfR0xPQkFMX0JZVEVTLAogICAgLy8gICAgIGFwcF9hcmdzPSgKICAgIC8vICAgICAgICAgQnl0ZXMoYiJceGI4XHhkYlx4ODZceDA1IiksCiAgICAvLyAgICAgICAgIGFyYzQuVUludDY0KEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2lkLmlkKS5ieXRlcywKICAgIC8vICAgICAgICAgZXhwX2lkLmJ5dGVzLAogICAgLy8gICAgICAgICB2YXJfaWQuYnl0ZXMsCiAgICAvLyAgICAgICAgIGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKS5ieXRlcywKICAgIC8vICAgICAgICAgZTEuYnl0ZXMsCiAgICAvLyAgICAgICAgIGUyLmJ5dGVzLAogICAgLy8gICAgICAgICBtdWx0aXBsaWVyLmJ5dGVzLAogICAgLy8gICAgICAgICB1bml0LmJ5dGVzLAogICAgLy8gICAgICAgICBhc3NldF9pZC5ieXRlcywKICAgIC8vICAgICAgICAgYXJjNC5VSW50NjQoc2VsZi5yZWdpc3RyeV9hcHAudmFsdWUpLmJ5dGVzLAogICAgLy8gICAgICAgICBtYXhfcGFydGljaXBhbnRzLmJ5dGVzLAogICAgLy8gICAgICksCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgaXR4biBDcmVhdGVkQXBwbGljYXRpb25JRAogICAgZHVwCiAgICBidXJ5IDE0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MzAxLTMwNgogICAgLy8gIyBGdW5kIHRoZSBuZXcgdmFyaWF0aW9uIGFwcCdzIGFjY291bnQgd2l0aCBNQlIuCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9bmV3X2FwcC5hZGRyZXNzLAogICAgLy8gICAgIGFtb3VudD1tYnJfcGF5bWVudC5hbW91bnQsCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MzAzCiAgICAvLyByZWNlaXZlcj1uZXdfYXBwLmFkZHJlc3MsCiAgICBhcHBfcGFyYW1zX2dldCBBcHBBZGRyZXNzCiAgICBhc3NlcnQgLy8gYXBwbGljYXRpb24gZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MzA0CiAgICAvLyBhbW91bnQ9bWJyX3BheW1lbnQuYW1vdW50LAogICAgZGlnIDMKICAgIGd0eG5zIEFtb3VudAogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTozMDEtMzAyCiAgICAvLyAjIEZ1bmQgdGhlIG5ldyB2YXJpYXRpb24gYXBwJ3MgYWNjb3VudCB3aXRoIE1CUi4KICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIGludGNfMSAvLyBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTozMDUKICAgIC8vIGZlZT0wLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MzAxLTMwNgogICAgLy8gIyBGdW5kIHRoZSBuZXcgdmFyaWF0aW9uIGFwcCdzIGFjY291bnQgd2l0aCBNQlIuCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9bmV3X2FwcC5hZGRyZXNzLAogICAgLy8gICAgIGFtb3VudD1tYnJfcGF5bWVudC5hbW91bnQsCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjMwOC0zMDkKICAgIC8vICMgRm9yd2FyZCBlc2Nyb3cgdG8gdGhlIG5ldyBUcnVzdFZhcmlhdGlvbiBhcHAgYWNjb3VudC4KICAgIC8vIGlmIGFzc2V0X2lkX3ZhbHVlID09IFVJbnQ2NCgwKToKICAgIGR1cAogICAgYm56IGNyZWF0ZV9leHBlcmltZW50X3dpdGhfdmFyaWF0aW9uX2Vsc2VfYm9keUAxMgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjMxMC0zMTQKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1uZXdfYXBwLmFkZHJlc3MsCiAgICAvLyAgICAgYW1vdW50PWVzY3Jvd19hbW91bnQsCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MzExCiAgICAvLyByZWNlaXZlcj1uZXdfYXBwLmFkZHJlc3MsCiAgICBkaWcgMTIKICAgIGFwcF9wYXJhbXNfZ2V0IEFwcEFkZHJlc3MKICAgIGFzc2VydCAvLyBhcHBsaWNhdGlvbiBleGlzdHMKICAgIGRpZyAxMgogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTozMTAKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIGludGNfMSAvLyBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTozMTMKICAgIC8vIGZlZT0wLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MzEwLTMxNAogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPW5ld19hcHAuYWRkcmVzcywKICAgIC8vICAgICBhbW91bnQ9ZXNjcm93X2Ftb3VudCwKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CgpjcmVhdGVfZXhwZXJpbWVudF93aXRoX3ZhcmlhdGlvbl9hZnRlcl9pZl9lbHNlQDE0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjMyMy0zMzIKICAgIC8vICMgUmVjb3JkIHRoZSBkZXBvc2l0IGluIFRydXN0VmFyaWF0aW9uCiAgICAvLyAjIFNlbGVjdG9yOiByZWNvcmRfZXNjcm93KHVpbnQ2NCl2b2lkCiAgICAvLyBpdHhuLkFwcGxpY2F0aW9uQ2FsbCgKICAgIC8vICAgICBhcHBfaWQ9bmV3X2FwcCwKICAgIC8vICAgICBhcHBfYXJncz0oCiAgICAvLyAgICAgICAgIEJ5dGVzKGIiXHg1Y1x4OWFceDgzXHg2YiIpLAogICAgLy8gICAgICAgICBhcmM0LlVJbnQ2NChlc2Nyb3dfYW1vdW50KS5ieXRlcywKICAgIC8vICAgICApLAogICAgLy8gICAgIGZlZT0wLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjMyOQogICAgLy8gYXJjNC5VSW50NjQoZXNjcm93X2Ftb3VudCkuYnl0ZXMsCiAgICBkaWcgMTEKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTozMjgKICAgIC8vIEJ5dGVzKGIiXHg1Y1x4OWFceDgzXHg2YiIpLAogICAgYnl0ZWMgMTAgLy8gMHg1YzlhODM2YgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBkaWcgMTIKICAgIGR1cAogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbklECiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MzIzLTMyNQogICAgLy8gIyBSZWNvcmQgdGhlIGRlcG9zaXQgaW4gVHJ1c3RWYXJpYXRpb24KICAgIC8vICMgU2VsZWN0b3I6IHJlY29yZF9lc2Nyb3codWludDY0KXZvaWQKICAgIC8vIGl0eG4uQXBwbGljYXRpb25DYWxsKAogICAgcHVzaGludCA2IC8vIGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTozMzEKICAgIC8vIGZlZT0wLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MzIzLTMzMgogICAgLy8gIyBSZWNvcmQgdGhlIGRlcG9zaXQgaW4gVHJ1c3RWYXJpYXRpb24KICAgIC8vICMgU2VsZWN0b3I6IHJlY29yZF9lc2Nyb3codWludDY0KXZvaWQKICAgIC8vIGl0eG4uQXBwbGljYXRpb25DYWxsKAogICAgLy8gICAgIGFwcF9pZD1uZXdfYXBwLAogICAgLy8gICAgIGFwcF9hcmdzPSgKICAgIC8vICAgICAgICAgQnl0ZXMoYiJceDVjXHg5YVx4ODNceDZiIiksCiAgICAvLyAgICAgICAgIGFyYzQuVUludDY0KGVzY3Jvd19hbW91bnQpLmJ5dGVzLAogICAgLy8gICAgICksCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjMzNgogICAgLy8gZXhwX2lkLmFzX3VpbnQ2NCgpICogVUludDY0KDQyOTQ5NjcyOTYpICsgdmFyX2lkLmFzX3VpbnQ2NCgpCiAgICBkaWcgMTYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToyNjItMjYzCiAgICAvLyAjIENyZWF0ZSB0aGUgZXhwZXJpbWVudCBncm91cAogICAgLy8gZXhwX2lkID0gYXJjNC5VSW50MzIoc2VsZi5leHBlcmltZW50X2NvdW50LnZhbHVlKQogICAgaW50Y18zIC8vIDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTozMzYKICAgIC8vIGV4cF9pZC5hc191aW50NjQoKSAqIFVJbnQ2NCg0Mjk0OTY3Mjk2KSArIHZhcl9pZC5hc191aW50NjQoKQogICAgZXh0cmFjdF91aW50MzIKICAgIGludGMgNSAvLyA0Mjk0OTY3Mjk2CiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MzM0LTMzNwogICAgLy8gIyBTdG9yZSB2YXJpYXRpb24gaW5mbwogICAgLy8gdmFyaWF0aW9uX2tleSA9IGFyYzQuVUludDY0KAogICAgLy8gICAgIGV4cF9pZC5hc191aW50NjQoKSAqIFVJbnQ2NCg0Mjk0OTY3Mjk2KSArIHZhcl9pZC5hc191aW50NjQoKQogICAgLy8gKQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjM0MAogICAgLy8gYXBwX2lkPWFyYzQuVUludDY0KG5ld19hcHAuaWQpLAogICAgc3dhcAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjM0MgogICAgLy8gY3JlYXRlZF9hdD1hcmM0LlVJbnQ2NChHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCksCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MjczLTI3NAogICAgLy8gIyBDcmVhdGUgdGhlIGZpcnN0IHZhcmlhdGlvbiAodmFyX2lkID0gMCkKICAgIC8vIHZhcl9pZCA9IGFyYzQuVUludDMyKDApCiAgICBieXRlYyAxMiAvLyAweDAwMDAwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MzM4LTM0MwogICAgLy8gc2VsZi52YXJpYXRpb25zW3ZhcmlhdGlvbl9rZXldID0gVmFyaWF0aW9uSW5mbygKICAgIC8vICAgICB2YXJfaWQ9dmFyX2lkLAogICAgLy8gICAgIGFwcF9pZD1hcmM0LlVJbnQ2NChuZXdfYXBwLmlkKSwKICAgIC8vICAgICBsYWJlbD1sYWJlbCwKICAgIC8vICAgICBjcmVhdGVkX2F0PWFyYzQuVUludDY0KEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wKSwKICAgIC8vICkKICAgIGRpZyAyCiAgICBjb25jYXQKICAgIGJ5dGVjIDExIC8vIDB4MDAxNgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGRpZyAxMgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MzM4CiAgICAvLyBzZWxmLnZhcmlhdGlvbnNbdmFyaWF0aW9uX2tleV0gPSBWYXJpYXRpb25JbmZvKAogICAgYnl0ZWMgNyAvLyAweDc2NWYKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MzM4LTM0MwogICAgLy8gc2VsZi52YXJpYXRpb25zW3ZhcmlhdGlvbl9rZXldID0gVmFyaWF0aW9uSW5mbygKICAgIC8vICAgICB2YXJfaWQ9dmFyX2lkLAogICAgLy8gICAgIGFwcF9pZD1hcmM0LlVJbnQ2NChuZXdfYXBwLmlkKSwKICAgIC8vICAgICBsYWJlbD1sYWJlbCwKICAgIC8vICAgICBjcmVhdGVkX2F0PWFyYzQuVUludDY0KEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wKSwKICAgIC8vICkKICAgIGR1cAogICAgYm94X2RlbAogICAgcG9wCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MzQ4CiAgICAvLyBvd25lcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MzUwCiAgICAvLyBjcmVhdGVkX2F0PXNlbGYuZXhwZXJpbWVudHNbZXhwX2lkXS5jcmVhdGVkX2F0LAogICAgZGlnIDE2CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIHB1c2hpbnQgMzggLy8gMzgKICAgIGludGNfMiAvLyA4CiAgICBib3hfZXh0cmFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjM0NS0zNTIKICAgIC8vICMgU2V0IHZhcmlhdGlvbl9jb3VudCB0byAxCiAgICAvLyBzZWxmLmV4cGVyaW1lbnRzW2V4cF9pZF0gPSBFeHBlcmltZW50R3JvdXAoCiAgICAvLyAgICAgZXhwX2lkPWV4cF9pZCwKICAgIC8vICAgICBvd25lcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgbmFtZT1uYW1lLAogICAgLy8gICAgIGNyZWF0ZWRfYXQ9c2VsZi5leHBlcmltZW50c1tleHBfaWRdLmNyZWF0ZWRfYXQsCiAgICAvLyAgICAgdmFyaWF0aW9uX2NvdW50PWFyYzQuVUludDY0KDEpLAogICAgLy8gKQogICAgZGlnIDE3CiAgICBkdXAKICAgIGNvdmVyIDQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBieXRlYyA1IC8vIDB4MDAzNgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTozNTEKICAgIC8vIHZhcmlhdGlvbl9jb3VudD1hcmM0LlVJbnQ2NCgxKSwKICAgIHB1c2hieXRlcyAweDAwMDAwMDAwMDAwMDAwMDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTozNDUtMzUyCiAgICAvLyAjIFNldCB2YXJpYXRpb25fY291bnQgdG8gMQogICAgLy8gc2VsZi5leHBlcmltZW50c1tleHBfaWRdID0gRXhwZXJpbWVudEdyb3VwKAogICAgLy8gICAgIGV4cF9pZD1leHBfaWQsCiAgICAvLyAgICAgb3duZXI9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgIG5hbWU9bmFtZSwKICAgIC8vICAgICBjcmVhdGVkX2F0PXNlbGYuZXhwZXJpbWVudHNbZXhwX2lkXS5jcmVhdGVkX2F0LAogICAgLy8gICAgIHZhcmlhdGlvbl9jb3VudD1hcmM0LlVJbnQ2NCgxKSwKICAgIC8vICkKICAgIGNvbmNhdAogICAgZGlnIDE0CiAgICBjb25jYXQKICAgIGRpZyAxCiAgICBib3hfZGVsCiAgICBwb3AKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToyMjIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgc3dhcAogICAgY29uY2F0CiAgICBieXRlY18zIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgpjcmVhdGVfZXhwZXJpbWVudF93aXRoX3ZhcmlhdGlvbl9lbHNlX2JvZHlAMTI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MzE2LTMyMQogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgLy8gICAgIHhmZXJfYXNzZXQ9QXNzZXQoYXNzZXRfaWRfdmFsdWUpLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPW5ld19hcHAuYWRkcmVzcywKICAgIC8vICAgICBhc3NldF9hbW91bnQ9ZXNjcm93X2Ftb3VudCwKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTozMTgKICAgIC8vIGFzc2V0X3JlY2VpdmVyPW5ld19hcHAuYWRkcmVzcywKICAgIGRpZyAxMgogICAgYXBwX3BhcmFtc19nZXQgQXBwQWRkcmVzcwogICAgYXNzZXJ0IC8vIGFwcGxpY2F0aW9uIGV4aXN0cwogICAgZGlnIDEyCiAgICBpdHhuX2ZpZWxkIEFzc2V0QW1vdW50CiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIGR1cAogICAgaXR4bl9maWVsZCBYZmVyQXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTozMTYKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIGludGNfMyAvLyBheGZlcgogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjMyMAogICAgLy8gZmVlPTAsCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTozMTYtMzIxCiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1Bc3NldChhc3NldF9pZF92YWx1ZSksCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9bmV3X2FwcC5hZGRyZXNzLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1lc2Nyb3dfYW1vdW50LAogICAgLy8gICAgIGZlZT0wLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIGIgY3JlYXRlX2V4cGVyaW1lbnRfd2l0aF92YXJpYXRpb25fYWZ0ZXJfaWZfZWxzZUAxNAoKY3JlYXRlX2V4cGVyaW1lbnRfd2l0aF92YXJpYXRpb25fZWxzZV9ib2R5QDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MjU2CiAgICAvLyBhc3NlcnQgZXNjcm93X2Z1bmRpbmcudHlwZSA9PSBUcmFuc2FjdGlvblR5cGUuQXNzZXRUcmFuc2ZlciwgIkVzY3JvdyBtdXN0IGJlIEFzc2V0VHJhbnNmZXIgZm9yIEFTQSIKICAgIGRpZyAxCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzMgLy8gYXhmZXIKICAgID09CiAgICBhc3NlcnQgLy8gRXNjcm93IG11c3QgYmUgQXNzZXRUcmFuc2ZlciBmb3IgQVNBCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MjU3CiAgICAvLyBhc3NlcnQgZXNjcm93X2Z1bmRpbmcuYXNzZXRfcmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywgIldyb25nIGVzY3JvdyByZWNlaXZlciIKICAgIGR1cAogICAgZ3R4bnMgQXNzZXRSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gV3JvbmcgZXNjcm93IHJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MjU4CiAgICAvLyBhc3NlcnQgZXNjcm93X2Z1bmRpbmcueGZlcl9hc3NldC5pZCA9PSBhc3NldF9pZF92YWx1ZSwgIldyb25nIGFzc2V0IgogICAgZHVwCiAgICBndHhucyBYZmVyQXNzZXQKICAgIGRpZyAyCiAgICA9PQogICAgYXNzZXJ0IC8vIFdyb25nIGFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MjU5CiAgICAvLyBhc3NlcnQgZXNjcm93X2Z1bmRpbmcuYXNzZXRfYW1vdW50ID4gVUludDY0KDApLCAiRXNjcm93IG11c3QgYmUgPiAwIgogICAgZ3R4bnMgQXNzZXRBbW91bnQKICAgIGR1cAogICAgYnVyeSAxMwogICAgYXNzZXJ0IC8vIEVzY3JvdyBtdXN0IGJlID4gMAogICAgYiBjcmVhdGVfZXhwZXJpbWVudF93aXRoX3ZhcmlhdGlvbl9hZnRlcl9pZl9lbHNlQDcKCmNyZWF0ZV9leHBlcmltZW50X3dpdGhfdmFyaWF0aW9uX2Vsc2VfYm9keUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjI0NgogICAgLy8gYXNzZXJ0IG1icl9wYXltZW50LmFtb3VudCA+PSBVSW50NjQoX1ZBUl9BUFBfTUJSX0FTQSksICJNQlIgbXVzdCBiZSA+PSAwLjIgQUxHTyIKICAgIGRpZyAyCiAgICBndHhucyBBbW91bnQKICAgIGludGMgNiAvLyAyMDAwMDAKICAgID49CiAgICBhc3NlcnQgLy8gTUJSIG11c3QgYmUgPj0gMC4yIEFMR08KICAgIGIgY3JlYXRlX2V4cGVyaW1lbnRfd2l0aF92YXJpYXRpb25fYWZ0ZXJfaWZfZWxzZUA0CgoKLy8gc21hcnRfY29udHJhY3RzLnRydXN0X2V4cGVyaW1lbnRzLmNvbnRyYWN0LlRydXN0RXhwZXJpbWVudHMuZ2V0X2V4cGVyaW1lbnRbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfZXhwZXJpbWVudDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTozNTYKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA0CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQzMgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjM1OAogICAgLy8gYXNzZXJ0IGV4cF9pZCBpbiBzZWxmLmV4cGVyaW1lbnRzLCAiRXhwZXJpbWVudCBub3QgZm91bmQiCiAgICBieXRlYyA2IC8vIDB4NjU1ZgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIEV4cGVyaW1lbnQgbm90IGZvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MzU5CiAgICAvLyByZXR1cm4gc2VsZi5leHBlcmltZW50c1tleHBfaWRdCiAgICBib3hfZ2V0CiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTozNTYKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWNfMyAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50cnVzdF9leHBlcmltZW50cy5jb250cmFjdC5UcnVzdEV4cGVyaW1lbnRzLmdldF92YXJpYXRpb25bcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfdmFyaWF0aW9uOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjM2MQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDQKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDMyCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDQKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDMyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MzYzCiAgICAvLyBrZXkgPSBhcmM0LlVJbnQ2NChleHBfaWQuYXNfdWludDY0KCkgKiBVSW50NjQoNDI5NDk2NzI5NikgKyB2YXJfaWQuYXNfdWludDY0KCkpCiAgICBzd2FwCiAgICBidG9pCiAgICBpbnRjIDUgLy8gNDI5NDk2NzI5NgogICAgKgogICAgc3dhcAogICAgYnRvaQogICAgKwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjM2NAogICAgLy8gYXNzZXJ0IGtleSBpbiBzZWxmLnZhcmlhdGlvbnMsICJWYXJpYXRpb24gbm90IGZvdW5kIgogICAgYnl0ZWMgNyAvLyAweDc2NWYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBWYXJpYXRpb24gbm90IGZvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MzY1CiAgICAvLyByZXR1cm4gc2VsZi52YXJpYXRpb25zW2tleV0KICAgIGJveF9nZXQKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjM2MQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlY18zIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCg==","clear":"I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"},"byteCode":{"approval":"CyAHAAEIBKCNBoCAgIAQwJoMJg0LdHZfYXBwcm92YWwIdHZfY2xlYXIQZXhwZXJpbWVudF9jb3VudAQVH3x1DHJlZ2lzdHJ5X2FwcAIANgJlXwJ2XwgAAAAAAAAAAAS424YFBFyag2sCABYEAAAAADEYQAAHJwQiZyoiZzEZFEQxGEEAOYIHBCmcNSEE+DTHXAQwJ3y1BHZjLikE+/vR7QS+YXvKBBrzdq02GgCOBwAeAGUAqwDzAxAFIgU7AIAEJA0vZzYaAI4BAAEANhoBSRUkEkQXJwRMZyNDNhoBSSJZgQIISwEVEkRXAgA2GgJJIlmBAghLARUSRFcCADEWIwlJOBAjEkQxADIJEkQ4BzIKEkQovEgoTwK/KbxIKUy/I0M2GgFJFSQSRDEWIwlJOBAjEkRMF0lOAklESwE4BzIKEkRMOAghBA9EMgpMcABFAUAAErEyCiKyErIUSbIRJbIQIrIBsyNDNhoBSSJZgQIISwEVEkQiKmVESRZJk4EgDkRXBARMIwgqTGcxADIHFksCTwJQJwVQTFAnCFBPAlAnBksCUEm8SEy/K0xQsCNDIkmAAEcCNhoBRwIVJRJENhoCSU4CSSJZgQIITBUSRDYaA0lOAhUkEkQ2GgRJTgIVJBJENhoFSU4CFSQSRDYaBklOAhUkEkQ2GgdJTgJJFSQSRDYaCElOAxUkEkQxFoECCUlOA0k4ECMSRDEWIwlOAycGTwNQSU4DSb1FAURJvkhOAyWBILpJTgMxABJEKL1FAUQpvUUBREwXSU8COAcyChJEQAFtSwU4CCEED0RJQAFCSwRJOBAjEkRJOAcyChJEOAhJRRFESwOBLiS6F0lFEBZJRRRJk4EgDkRXBARJRROxKL5EKb5EMggWMQAiJwRlRBYnCbIaTwKyGksSshpPBLIaTLIaSw6yGksNshpLDLIaSwuyGksKshqyGksIshojsjWBELI0skKyQIEGshAisgGztD1JRRKxcghESwY4CLIIsgcjshAisgGzSUAAjLFLEHIIREsQsgiyByOyECKyAbOxSw8WJwqyGrIaSxBJshiBBrIQIrIBs0sESU4CIiW6SRchBQtLFiVaCBZPAhYyBxZLFksCUCcLUExQSxFQJwdPA1BJvEhMv0sFSYEkWUsBFVJLA4EmJLpLEyMIFk8ESwdQJwVQTwJQTFBMUEsCvEhPAky/K0xQsCNDsUsQcghESxCyErIUSbIRJbIQIrIBs0L/bksESTgQJRJESTgUMgoSREk4EUsCEkQ4EklFEURC/rRLBTgIIQYPREL+kCJHAoAASTYaAUcCIlmBAghMFRJENhoCRwIiWYECCEwVEkQ2GgNJFSQSRDYaBEkVJBJENhoFSRUkEkQ2GgZJFSQSRDYaB0cCFSQSRDYaCElOAhUkEkQxFoECCUlOAkk4ECMSRDEWIwlOAii9RQFEKb1FAURMF0lPAjgHMgoSREABhksCOAghBA9ESUABW0sBSTgQIxJESTgHMgoSRDgISUUNRCIqZURJFklFEkmTgSAORFcEBElOAkUQIwgqTGcxADIHFksCTwJQJwVQTFAnCFBLDFAnBksCUElFEkm8SEy/sSi+RCm+RDIIFjEAIicEZUQWJwmyGk8CshpPBLIaJwyyGkyyGksLshpLCrIaSwmyGksIshpLB7IashpLBbIaI7I1gRCyNLJCskCBBrIQIrIBs7Q9SUUOsXIIREsDOAiyCLIHI7IQIrIBs0lAAIGxSwxyCERLDLIIsgcjshAisgGzsUsLFicKshqyGksMSbIYgQayECKyAbNLECVaIQULFkwWMgcWJwxLAlAnC1BMUEsMUCcHTwNQSbxITL8xAEsQSU4CgSYkuksRSU4ETwJQJwVQTFCACAAAAAAAAAABUEsOUEsBvEi/TFArTFCwI0OxSwxyCERLDLISshRJshElshAisgGzQv95SwFJOBAlEkRJOBQyChJESTgRSwISRDgSSUUNREL+m0sCOAghBg9EQv53NhoBSRUlEkQnBkxQSb1FAUS+SCtMULAjQzYaAUkVJRJENhoCSRUlEkRMFyEFC0wXCBYnB0xQSb1FAUS+SCtMULAjQw==","clear":"C4EBQw=="},"events":[],"templateVariables":{}} as unknown as Arc56Contract
+export const APP_SPEC: Arc56Contract = {"name":"TrustExperiments","structs":{"ExperimentGroup":[{"name":"expId","type":"uint32"},{"name":"owner","type":"address"},{"name":"name","type":"string"},{"name":"createdAt","type":"uint64"},{"name":"variationCount","type":"uint64"}],"Treasury":[{"name":"assetId","type":"uint64"},{"name":"balance","type":"uint64"}],"VariationInfo":[{"name":"varId","type":"uint32"},{"name":"appId","type":"uint64"},{"name":"label","type":"string"},{"name":"createdAt","type":"uint64"}],"VariationParams":[{"name":"label","type":"string"},{"name":"e1","type":"uint64"},{"name":"e2","type":"uint64"},{"name":"multiplier","type":"uint64"},{"name":"unit","type":"uint64"},{"name":"assetId","type":"uint64"},{"name":"maxParticipants","type":"uint64"},{"name":"escrow","type":"uint64"}]},"methods":[{"name":"create","args":[{"type":"uint64","name":"registry_app"}],"returns":{"type":"void"},"actions":{"create":["NoOp"],"call":[]},"readonly":false,"events":[],"recommendations":{}},{"name":"set_trust_variation_program","args":[{"type":"byte[]","name":"approval"},{"type":"byte[]","name":"clear"},{"type":"pay","name":"mbr_payment"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[],"recommendations":{}},{"name":"begin_trust_variation_upload","args":[{"type":"uint64","name":"approval_size"},{"type":"uint64","name":"clear_size"},{"type":"pay","name":"mbr_payment"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Create or resize the program boxes for a chunked upload. Resizing keeps\nexisting bytes, so an interrupted upload of the same program resumes where it stopped. The payment must cover any box growth; spawning is disabled until finalize_trust_variation_program succeeds.","events":[],"recommendations":{}},{"name":"write_trust_variation_chunk","args":[{"type":"uint8","name":"kind"},{"type":"uint64","name":"offset"},{"type":"byte[]","name":"chunk"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Write chunk at offset into the approval or clear box. Chunks are\nindependent, so they can be sent in any order and in parallel groups.","events":[],"recommendations":{}},{"name":"finalize_trust_variation_program","args":[{"type":"byte[]","name":"expected_hash"}],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Check the uploaded boxes against the deployer's program hash, record\nit and bump tv_version. Returns the new version. Hashing 8 KB needs about 1,000 extra opcodes, drawn from op-up calls paid by the group's fees.","events":[],"recommendations":{}},{"name":"opt_in_to_asset","args":[{"type":"uint64","name":"asset_id"},{"type":"pay","name":"mbr_payment"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"One-time per-asset setup: opt the TrustExperiments app account into\nan ASA so it can receive escrow asset-transfer legs from experimenters. Idempotent — no-op if already opted in. Caller pays the 0.1 ALGO MBR that the opt-in adds to this contract's account.","events":[],"recommendations":{}},{"name":"create_experiment","args":[{"type":"string","name":"name"}],"returns":{"type":"uint32"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[{"name":"ExperimentCreated","args":[{"type":"uint32","name":"exp_id"},{"type":"address","name":"owner"}]}],"recommendations":{}},{"name":"create_variation","args":[{"type":"uint32","name":"exp_id"},{"type":"string","name":"label"},{"type":"uint64","name":"e1"},{"type":"uint64","name":"e2"},{"type":"uint64","name":"multiplier"},{"type":"uint64","name":"unit"},{"type":"uint64","name":"asset_id"},{"type":"uint64","name":"max_participants"},{"type":"pay","name":"mbr_payment"},{"type":"txn","name":"escrow_funding"}],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[{"name":"VariationCreated","args":[{"type":"uint32","name":"exp_id"},{"type":"uint32","name":"var_id"},{"type":"uint64","name":"app_id"}]}],"recommendations":{}},{"name":"create_variations","args":[{"type":"uint32","name":"exp_id"},{"type":"(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64)[]","name":"configs"},{"type":"pay","name":"mbr_payment"},{"type":"txn","name":"escrow_funding"}],"returns":{"type":"uint64[]"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Spawn several variations (e.g. every cell of a factorial design) in one\ncall. A single MBR leg covers every variation's app MBR and a single escrow leg carries the sum of the configs' escrow amounts, so all configs must share one payout asset. Any MBR surplus goes to the last variation.\nAt most MAX_VARIATIONS_PER_CALL configs per call. Each variation takes 4 inner transactions; the group needs one extra app call per 4 variations beyond the first 4 to pool enough inner-transaction budget. Returns the new app IDs in config order.","events":[{"name":"VariationCreated","args":[{"type":"uint32","name":"exp_id"},{"type":"uint32","name":"var_id"},{"type":"uint64","name":"app_id"}]}],"recommendations":{}},{"name":"deposit_treasury","args":[{"type":"uint32","name":"exp_id"},{"type":"uint64","name":"asset_id"},{"type":"txn","name":"funding"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Add funds to the experiment treasury. The first deposit fixes the\ntreasury's payout asset; the treasury box MBR comes from the app account.","events":[{"name":"TreasuryDeposited","args":[{"type":"uint32","name":"exp_id"},{"type":"uint64","name":"amount"},{"type":"uint64","name":"balance"}]}],"recommendations":{}},{"name":"withdraw_treasury","args":[{"type":"uint32","name":"exp_id"},{"type":"uint64","name":"amount"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[{"name":"TreasuryWithdrawn","args":[{"type":"uint32","name":"exp_id"},{"type":"uint64","name":"amount"},{"type":"uint64","name":"balance"}]}],"recommendations":{}},{"name":"create_treasury_variation","args":[{"type":"uint32","name":"exp_id"},{"type":"(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64)","struct":"VariationParams","name":"params"},{"type":"pay","name":"mbr_payment"}],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Spawn a variation with no escrow of its own: it draws payouts from the\nexperiment treasury as trustee decisions need them (see draw_escrow). Three inner transactions instead of four, and no capital locked per cell. params.escrow must be 0.","events":[{"name":"VariationCreated","args":[{"type":"uint32","name":"exp_id"},{"type":"uint32","name":"var_id"},{"type":"uint64","name":"app_id"}]}],"recommendations":{}},{"name":"draw_escrow","args":[{"type":"uint32","name":"exp_id"},{"type":"uint32","name":"var_id"},{"type":"uint64","name":"amount"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Inner call from a treasury-funded TrustVariation: send it amount from\nthe experiment treasury. Only the variation app recorded under (exp_id, var_id) may draw.","events":[],"recommendations":{}},{"name":"create_experiment_with_variation","args":[{"type":"string","name":"name"},{"type":"string","name":"label"},{"type":"uint64","name":"e1"},{"type":"uint64","name":"e2"},{"type":"uint64","name":"multiplier"},{"type":"uint64","name":"unit"},{"type":"uint64","name":"asset_id"},{"type":"uint64","name":"max_participants"},{"type":"pay","name":"mbr_payment"},{"type":"txn","name":"escrow_funding"}],"returns":{"type":"(uint32,uint64)"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[{"name":"ExperimentCreated","args":[{"type":"uint32","name":"exp_id"},{"type":"address","name":"owner"}]},{"name":"VariationCreated","args":[{"type":"uint32","name":"exp_id"},{"type":"uint32","name":"var_id"},{"type":"uint64","name":"app_id"}]}],"recommendations":{}},{"name":"get_experiment","args":[{"type":"uint32","name":"exp_id"}],"returns":{"type":"(uint32,address,string,uint64,uint64)","struct":"ExperimentGroup"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_experiments_by_owner","args":[{"type":"address","name":"owner"},{"type":"uint32","name":"start"},{"type":"uint32","name":"count"}],"returns":{"type":"(uint32,address,string,uint64,uint64)[]"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"desc":"The owner's experiments start .. start + count - 1, in creation order.\nLike get_variations, the page stops early at the end of the index or once the encoded result would overflow the return log.","events":[],"recommendations":{}},{"name":"get_treasury","args":[{"type":"uint32","name":"exp_id"}],"returns":{"type":"(uint64,uint64)","struct":"Treasury"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_variation","args":[{"type":"uint32","name":"exp_id"},{"type":"uint32","name":"var_id"}],"returns":{"type":"(uint32,uint64,string,uint64)","struct":"VariationInfo"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_variation_by_app","args":[{"type":"uint64","name":"app_id"}],"returns":{"type":"(uint32,(uint32,uint64,string,uint64))"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"desc":"Resolve a TrustVariation app ID to its exp_id and variation record.","events":[],"recommendations":{}},{"name":"get_variations","args":[{"type":"uint32","name":"exp_id"},{"type":"uint32","name":"start"},{"type":"uint32","name":"count"}],"returns":{"type":"(uint32,uint64,string,uint64)[]"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"desc":"Variations start .. start + count - 1 of an experiment, in var_id order.\nThe page stops early at variation_count, or once the encoded result would overflow the return log (labels are variable length); continue from start + len(page) while that is below variation_count.","events":[],"recommendations":{}}],"arcs":[22,28],"networks":{},"state":{"schema":{"global":{"ints":4,"bytes":1},"local":{"ints":0,"bytes":0}},"keys":{"global":{"registry_app":{"keyType":"AVMString","valueType":"AVMUint64","key":"cmVnaXN0cnlfYXBw"},"experiment_count":{"keyType":"AVMString","valueType":"AVMUint64","key":"ZXhwZXJpbWVudF9jb3VudA=="},"tv_hash":{"keyType":"AVMString","valueType":"AVMBytes","key":"dHZfaGFzaA=="},"tv_version":{"keyType":"AVMString","valueType":"AVMUint64","key":"dHZfdmVyc2lvbg=="},"tv_ready":{"keyType":"AVMString","valueType":"AVMUint64","key":"dHZfcmVhZHk="}},"local":{},"box":{"tv_approval":{"keyType":"AVMBytes","valueType":"AVMBytes","key":"dHZfYXBwcm92YWw="},"tv_clear":{"keyType":"AVMBytes","valueType":"AVMBytes","key":"dHZfY2xlYXI="}}},"maps":{"global":{},"local":{},"box":{"experiments":{"keyType":"uint32","valueType":"ExperimentGroup","prefix":"ZV8="},"variations":{"keyType":"uint64","valueType":"VariationInfo","prefix":"dl8="},"owner_experiments":{"keyType":"address","valueType":"uint32[]","prefix":"b2Vf"},"variation_apps":{"keyType":"uint64","valueType":"uint64","prefix":"dmFf"},"treasuries":{"keyType":"uint32","valueType":"Treasury","prefix":"dHJf"}}}},"bareActions":{"create":[],"call":[]},"sourceInfo":{"approval":{"sourceInfo":[{"pc":[915],"errorMessage":"Asset ID must be > 0"},{"pc":[596,598],"errorMessage":"Empty program"},{"pc":[1620,3466,3497],"errorMessage":"Escrow must be > 0"},{"pc":[3475],"errorMessage":"Escrow must be AssetTransfer for ASA"},{"pc":[3452],"errorMessage":"Escrow must be Payment for ALGO"},{"pc":[1671],"errorMessage":"Escrow must equal config total"},{"pc":[1171,1480,1909,2015,2154,2720,3076],"errorMessage":"Experiment not found"},{"pc":[680,1660,2233],"errorMessage":"Insufficient MBR"},{"pc":[2046,2403],"errorMessage":"Insufficient treasury"},{"pc":[930,1215,2558],"errorMessage":"MBR must be >= 0.1 ALGO"},{"pc":[1347,2700],"errorMessage":"MBR must be >= 0.2 ALGO"},{"pc":[1615],"errorMessage":"Mixed payout assets"},{"pc":[1509],"errorMessage":"No configs"},{"pc":[2034,2189,2391,2927],"errorMessage":"No treasury"},{"pc":[515,578,773,828],"errorMessage":"Not creator"},{"pc":[1188,1497,1918,2024,2171],"errorMessage":"Not experiment owner"},{"pc":[2381],"errorMessage":"Not the variation app"},{"pc":[163],"errorMessage":"OnCompletion must be NoOp"},{"pc":[880],"errorMessage":"Program hash mismatch"},{"pc":[604],"errorMessage":"Program too large"},{"pc":[1514],"errorMessage":"Too many configs"},{"pc":[2208],"errorMessage":"Treasury variations hold no escrow"},{"pc":[1196,1505,2179,2539],"errorMessage":"TrustVariation program not set"},{"pc":[797],"errorMessage":"Unknown program kind"},{"pc":[831,834],"errorMessage":"Upload not started"},{"pc":[2370,2971,2996],"errorMessage":"Variation not found"},{"pc":[521,584,923,1202,1648,2215,2545],"errorMessage":"Wrong MBR receiver"},{"pc":[1948,2201,3491],"errorMessage":"Wrong asset"},{"pc":[3460,3483],"errorMessage":"Wrong escrow receiver"},{"pc":[2424,3676,3802],"errorMessage":"application exists"},{"pc":[979,2567],"errorMessage":"check self.experiment_count exists"},{"pc":[2855],"errorMessage":"check self.experiments entry exists"},{"pc":[3393],"errorMessage":"check self.owner_experiments entry exists"},{"pc":[3588],"errorMessage":"check self.registry_app exists"},{"pc":[1940],"errorMessage":"check self.treasuries entry exists"},{"pc":[615,624,3214,3510],"errorMessage":"check self.tv_approval exists"},{"pc":[647,656,3218,3277,3541],"errorMessage":"check self.tv_clear exists"},{"pc":[1193,1502,2176,2536],"errorMessage":"check self.tv_ready exists"},{"pc":[3356,3371],"errorMessage":"check self.tv_version exists"},{"pc":[3020,3145],"errorMessage":"check self.variations entry exists"},{"pc":[1523,1586,1743],"errorMessage":"index access is out of bounds"},{"pc":[1402],"errorMessage":"invalid array encoding"},{"pc":[473,489,755,812,967,1073,1372,1429,2127,2442,2455],"errorMessage":"invalid array length header"},{"pc":[480,496,762,819,974,1079,2448,2461],"errorMessage":"invalid number of bytes for arc4.dynamic_array<arc4.uint8>"},{"pc":[1450],"errorMessage":"invalid number of bytes for arc4.dynamic_array<smart_contracts.shared.types.VariationParams>"},{"pc":[2742],"errorMessage":"invalid number of bytes for arc4.static_array<arc4.uint8, 32>"},{"pc":[1064,1366,1885,1998,2102,2333,2342,2712,2753,2764,2918,2944,2953,3049,3058,3067],"errorMessage":"invalid number of bytes for arc4.uint32"},{"pc":[460,551,559,749,898,1089,1099,1109,1119,1130,1140,1896,2006,2350,2469,2477,2485,2493,2502,2512,2987],"errorMessage":"invalid number of bytes for arc4.uint64"},{"pc":[739],"errorMessage":"invalid number of bytes for arc4.uint8"},{"pc":[2132],"errorMessage":"invalid number of bytes for smart_contracts.shared.types.VariationParams"},{"pc":[1425,2119],"errorMessage":"invalid tail pointer at index 0 of ((len+utf8[]),uint64,uint64,uint64,uint64,uint64,uint64,uint64)"},{"pc":[1410],"errorMessage":"invalid tail pointer for (len+((len+utf8[]),uint64,uint64,uint64,uint64,uint64,uint64,uint64)[])"},{"pc":[1420,2114],"errorMessage":"invalid tuple encoding"},{"pc":[1782,3397],"errorMessage":"max array length exceeded"},{"pc":[987,1240,1720,2249,2575,3010],"errorMessage":"overflow"},{"pc":[509,572,908,1153,1462,2142,2525],"errorMessage":"transaction type is pay"}],"pcOffsetMethod":"none"},"clear":{"sourceInfo":[],"pcOffsetMethod":"none"}},"source":{"approval":"I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgOCAyIDQwOTYgMTAwMDAwIDQwMCAyMDAwMDAgNDI5NDk2NzI5NgogICAgYnl0ZWNibG9jayAweDc0NzY1ZjYxNzA3MDcyNmY3NjYxNmMgMHg3NDc2NWY2MzZjNjU2MTcyIDB4MTUxZjdjNzUgMHg2NTVmICJ0dl9yZWFkeSIgImV4cGVyaW1lbnRfY291bnQiIDB4MDAzNiAweDc0NzI1ZiAweDc2NWYgMHg2ZjY1NWYgInR2X3ZlcnNpb24iICJyZWdpc3RyeV9hcHAiIDB4MDAwMCAweDA2ODEwMSAweDViNzZjM2M4IDB4MDAzYSAweDAwMDIgMHg3NjYxNWYKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo2MAogICAgLy8gc2VsZi5yZWdpc3RyeV9hcHAgPSBHbG9iYWxTdGF0ZShVSW50NjQoMCkpCiAgICBieXRlYyAxMSAvLyAicmVnaXN0cnlfYXBwIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NjEKICAgIC8vIHNlbGYuZXhwZXJpbWVudF9jb3VudCA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgwKSkKICAgIGJ5dGVjIDUgLy8gImV4cGVyaW1lbnRfY291bnQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo3OAogICAgLy8gc2VsZi50dl92ZXJzaW9uID0gR2xvYmFsU3RhdGUoVUludDY0KDApKQogICAgYnl0ZWMgMTAgLy8gInR2X3ZlcnNpb24iCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo3OQogICAgLy8gc2VsZi50dl9yZWFkeSA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgwKSkKICAgIGJ5dGVjIDQgLy8gInR2X3JlYWR5IgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CgptYWluX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo1OAogICAgLy8gY2xhc3MgVHJ1c3RFeHBlcmltZW50cyhBUkM0Q29udHJhY3QpOgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBtdXN0IGJlIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBieiBtYWluX2NyZWF0ZV9Ob09wQDI1CiAgICBwdXNoYnl0ZXNzIDB4Mjk5YzM1MjEgMHgzZGViMzRjYSAweDQzNjEwNzBlIDB4MzNmMTdmZTUgMHhmODM0Yzc1YyAweDMwMjc3Y2I1IDB4NzY2MzJlMjkgMHhmZDZjOGQ4MSAweGM1MWIxZGY4IDB4NjA5YzAzODkgMHgwN2IxZTgxMyAweDk0NDIyZWYzIDB4ZmJmYmQxZWQgMHhiZTYxN2JjYSAweDljZjM5N2YzIDB4NGQ5YzNhNjEgMHgxYWYzNzZhZCAweDJkMjI3YzA1IDB4ZTkzOTllMTQgLy8gbWV0aG9kICJzZXRfdHJ1c3RfdmFyaWF0aW9uX3Byb2dyYW0oYnl0ZVtdLGJ5dGVbXSxwYXkpdm9pZCIsIG1ldGhvZCAiYmVnaW5fdHJ1c3RfdmFyaWF0aW9uX3VwbG9hZCh1aW50NjQsdWludDY0LHBheSl2b2lkIiwgbWV0aG9kICJ3cml0ZV90cnVzdF92YXJpYXRpb25fY2h1bmsodWludDgsdWludDY0LGJ5dGVbXSl2b2lkIiwgbWV0aG9kICJmaW5hbGl6ZV90cnVzdF92YXJpYXRpb25fcHJvZ3JhbShieXRlW10pdWludDY0IiwgbWV0aG9kICJvcHRfaW5fdG9fYXNzZXQodWludDY0LHBheSl2b2lkIiwgbWV0aG9kICJjcmVhdGVfZXhwZXJpbWVudChzdHJpbmcpdWludDMyIiwgbWV0aG9kICJjcmVhdGVfdmFyaWF0aW9uKHVpbnQzMixzdHJpbmcsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQscGF5LHR4bil1aW50NjQiLCBtZXRob2QgImNyZWF0ZV92YXJpYXRpb25zKHVpbnQzMiwoc3RyaW5nLHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NClbXSxwYXksdHhuKXVpbnQ2NFtdIiwgbWV0aG9kICJkZXBvc2l0X3RyZWFzdXJ5KHVpbnQzMix1aW50NjQsdHhuKXZvaWQiLCBtZXRob2QgIndpdGhkcmF3X3RyZWFzdXJ5KHVpbnQzMix1aW50NjQpdm9pZCIsIG1ldGhvZCAiY3JlYXRlX3RyZWFzdXJ5X3ZhcmlhdGlvbih1aW50MzIsKHN0cmluZyx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQpLHBheSl1aW50NjQiLCBtZXRob2QgImRyYXdfZXNjcm93KHVpbnQzMix1aW50MzIsdWludDY0KXZvaWQiLCBtZXRob2QgImNyZWF0ZV9leHBlcmltZW50X3dpdGhfdmFyaWF0aW9uKHN0cmluZyxzdHJpbmcsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQscGF5LHR4bikodWludDMyLHVpbnQ2NCkiLCBtZXRob2QgImdldF9leHBlcmltZW50KHVpbnQzMikodWludDMyLGFkZHJlc3Msc3RyaW5nLHVpbnQ2NCx1aW50NjQpIiwgbWV0aG9kICJnZXRfZXhwZXJpbWVudHNfYnlfb3duZXIoYWRkcmVzcyx1aW50MzIsdWludDMyKSh1aW50MzIsYWRkcmVzcyxzdHJpbmcsdWludDY0LHVpbnQ2NClbXSIsIG1ldGhvZCAiZ2V0X3RyZWFzdXJ5KHVpbnQzMikodWludDY0LHVpbnQ2NCkiLCBtZXRob2QgImdldF92YXJpYXRpb24odWludDMyLHVpbnQzMikodWludDMyLHVpbnQ2NCxzdHJpbmcsdWludDY0KSIsIG1ldGhvZCAiZ2V0X3ZhcmlhdGlvbl9ieV9hcHAodWludDY0KSh1aW50MzIsKHVpbnQzMix1aW50NjQsc3RyaW5nLHVpbnQ2NCkpIiwgbWV0aG9kICJnZXRfdmFyaWF0aW9ucyh1aW50MzIsdWludDMyLHVpbnQzMikodWludDMyLHVpbnQ2NCxzdHJpbmcsdWludDY0KVtdIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggc2V0X3RydXN0X3ZhcmlhdGlvbl9wcm9ncmFtIGJlZ2luX3RydXN0X3ZhcmlhdGlvbl91cGxvYWQgd3JpdGVfdHJ1c3RfdmFyaWF0aW9uX2NodW5rIGZpbmFsaXplX3RydXN0X3ZhcmlhdGlvbl9wcm9ncmFtIG9wdF9pbl90b19hc3NldCBjcmVhdGVfZXhwZXJpbWVudCBjcmVhdGVfdmFyaWF0aW9uIGNyZWF0ZV92YXJpYXRpb25zIGRlcG9zaXRfdHJlYXN1cnkgd2l0aGRyYXdfdHJlYXN1cnkgY3JlYXRlX3RyZWFzdXJ5X3ZhcmlhdGlvbiBkcmF3X2VzY3JvdyBjcmVhdGVfZXhwZXJpbWVudF93aXRoX3ZhcmlhdGlvbiBnZXRfZXhwZXJpbWVudCBnZXRfZXhwZXJpbWVudHNfYnlfb3duZXIgZ2V0X3RyZWFzdXJ5IGdldF92YXJpYXRpb24gZ2V0X3ZhcmlhdGlvbl9ieV9hcHAgZ2V0X3ZhcmlhdGlvbnMKICAgIGVycgoKbWFpbl9jcmVhdGVfTm9PcEAyNToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo1OAogICAgLy8gY2xhc3MgVHJ1c3RFeHBlcmltZW50cyhBUkM0Q29udHJhY3QpOgogICAgcHVzaGJ5dGVzIDB4MjQwZDJmNjcgLy8gbWV0aG9kICJjcmVhdGUodWludDY0KXZvaWQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBjcmVhdGUKICAgIGVycgoKCi8vIF9wdXlhX2xpYi5hcmM0LmR5bmFtaWNfYXJyYXlfY29uY2F0X2R5bmFtaWNfZWxlbWVudChhcnJheV9pdGVtc19jb3VudDogdWludDY0LCBhcnJheV9oZWFkX2FuZF90YWlsOiBieXRlcywgbmV3X2l0ZW1zX2NvdW50OiB1aW50NjQsIG5ld19oZWFkX2FuZF90YWlsOiBieXRlcykgLT4gYnl0ZXM6CmR5bmFtaWNfYXJyYXlfY29uY2F0X2R5bmFtaWNfZWxlbWVudDoKICAgIHByb3RvIDQgMQogICAgcHVzaGJ5dGVzICIiCiAgICBkdXAKICAgIGZyYW1lX2RpZyAtMgogICAgaW50Y18zIC8vIDIKICAgICoKICAgIGZyYW1lX2RpZyAtNAogICAgaW50Y18zIC8vIDIKICAgICoKICAgIGludGNfMCAvLyAwCgpkeW5hbWljX2FycmF5X2NvbmNhdF9keW5hbWljX2VsZW1lbnRfZm9yX2hlYWRlckAxOgogICAgZnJhbWVfZGlnIDQKICAgIGZyYW1lX2RpZyAzCiAgICA8CiAgICBieiBkeW5hbWljX2FycmF5X2NvbmNhdF9keW5hbWljX2VsZW1lbnRfYWZ0ZXJfZm9yQDQKICAgIGZyYW1lX2RpZyAtMwogICAgZnJhbWVfZGlnIDQKICAgIGR1cAogICAgY292ZXIgMgogICAgZXh0cmFjdF91aW50MTYKICAgIGZyYW1lX2RpZyAyCiAgICArCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgZnJhbWVfZGlnIDEKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfYnVyeSAxCiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgZnJhbWVfYnVyeSA0CiAgICBiIGR5bmFtaWNfYXJyYXlfY29uY2F0X2R5bmFtaWNfZWxlbWVudF9mb3JfaGVhZGVyQDEKCmR5bmFtaWNfYXJyYXlfY29uY2F0X2R5bmFtaWNfZWxlbWVudF9hZnRlcl9mb3JANDoKICAgIGZyYW1lX2RpZyAtMwogICAgbGVuCiAgICBmcmFtZV9idXJ5IDAKICAgIGludGNfMCAvLyAwCiAgICBmcmFtZV9idXJ5IDQKCmR5bmFtaWNfYXJyYXlfY29uY2F0X2R5bmFtaWNfZWxlbWVudF9mb3JfaGVhZGVyQDU6CiAgICBmcmFtZV9kaWcgNAogICAgZnJhbWVfZGlnIDIKICAgIDwKICAgIGJ6IGR5bmFtaWNfYXJyYXlfY29uY2F0X2R5bmFtaWNfZWxlbWVudF9hZnRlcl9mb3JAOAogICAgZnJhbWVfZGlnIC0xCiAgICBmcmFtZV9kaWcgNAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBleHRyYWN0X3VpbnQxNgogICAgZnJhbWVfZGlnIDAKICAgICsKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBmcmFtZV9kaWcgMQogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9idXJ5IDEKICAgIGludGNfMyAvLyAyCiAgICArCiAgICBmcmFtZV9idXJ5IDQKICAgIGIgZHluYW1pY19hcnJheV9jb25jYXRfZHluYW1pY19lbGVtZW50X2Zvcl9oZWFkZXJANQoKZHluYW1pY19hcnJheV9jb25jYXRfZHluYW1pY19lbGVtZW50X2FmdGVyX2ZvckA4OgogICAgZnJhbWVfZGlnIC00CiAgICBmcmFtZV9kaWcgLTIKICAgICsKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBmcmFtZV9kaWcgMQogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTMKICAgIGZyYW1lX2RpZyAzCiAgICBmcmFtZV9kaWcgMAogICAgc3Vic3RyaW5nMwogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTEKICAgIGxlbgogICAgZnJhbWVfZGlnIC0xCiAgICBmcmFtZV9kaWcgMgogICAgdW5jb3ZlciAyCiAgICBzdWJzdHJpbmczCiAgICBjb25jYXQKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnRydXN0X2V4cGVyaW1lbnRzLmNvbnRyYWN0LlRydXN0RXhwZXJpbWVudHMuY3JlYXRlW3JvdXRpbmddKCkgLT4gdm9pZDoKY3JlYXRlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjgxCiAgICAvLyBAYXJjNC5hYmltZXRob2QoY3JlYXRlPSJyZXF1aXJlIikKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo4MwogICAgLy8gc2VsZi5yZWdpc3RyeV9hcHAudmFsdWUgPSByZWdpc3RyeV9hcHAuYXNfdWludDY0KCkKICAgIGJ0b2kKICAgIGJ5dGVjIDExIC8vICJyZWdpc3RyeV9hcHAiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjgxCiAgICAvLyBAYXJjNC5hYmltZXRob2QoY3JlYXRlPSJyZXF1aXJlIikKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMudHJ1c3RfZXhwZXJpbWVudHMuY29udHJhY3QuVHJ1c3RFeHBlcmltZW50cy5zZXRfdHJ1c3RfdmFyaWF0aW9uX3Byb2dyYW1bcm91dGluZ10oKSAtPiB2b2lkOgpzZXRfdHJ1c3RfdmFyaWF0aW9uX3Byb2dyYW06CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6ODUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgaW50Y18zIC8vIDIKICAgICsKICAgIGRpZyAxCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGludGNfMyAvLyAyCiAgICArCiAgICBkaWcgMQogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50OD4KICAgIGV4dHJhY3QgMiAwCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMSAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo5MgogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcywgIk5vdCBjcmVhdG9yIgogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIE5vdCBjcmVhdG9yCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6OTMKICAgIC8vIGFzc2VydCBtYnJfcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLCAiV3JvbmcgTUJSIHJlY2VpdmVyIgogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIFdyb25nIE1CUiByZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5Ojk0CiAgICAvLyBzZWxmLnR2X2FwcHJvdmFsLnZhbHVlID0gYXBwcm92YWwKICAgIGJ5dGVjXzAgLy8gMHg3NDc2NWY2MTcwNzA3MjZmNzY2MTZjCiAgICBib3hfZGVsCiAgICBwb3AKICAgIGJ5dGVjXzAgLy8gMHg3NDc2NWY2MTcwNzA3MjZmNzY2MTZjCiAgICB1bmNvdmVyIDIKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo5NQogICAgLy8gc2VsZi50dl9jbGVhci52YWx1ZSA9IGNsZWFyCiAgICBieXRlY18xIC8vIDB4NzQ3NjVmNjM2YzY1NjE3MgogICAgYm94X2RlbAogICAgcG9wCiAgICBieXRlY18xIC8vIDB4NzQ3NjVmNjM2YzY1NjE3MgogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5Ojk2CiAgICAvLyBzZWxmLl9yZWNvcmRfcHJvZ3JhbShzZWxmLl9wcm9ncmFtX2hhc2goKSkKICAgIGNhbGxzdWIgX3Byb2dyYW1faGFzaAogICAgY2FsbHN1YiBfcmVjb3JkX3Byb2dyYW0KICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5Ojg1CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMudHJ1c3RfZXhwZXJpbWVudHMuY29udHJhY3QuVHJ1c3RFeHBlcmltZW50cy5iZWdpbl90cnVzdF92YXJpYXRpb25fdXBsb2FkW3JvdXRpbmddKCkgLT4gdm9pZDoKYmVnaW5fdHJ1c3RfdmFyaWF0aW9uX3VwbG9hZDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo5OAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgY292ZXIgMwogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjExMAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcywgIk5vdCBjcmVhdG9yIgogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIE5vdCBjcmVhdG9yCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MTExCiAgICAvLyBhc3NlcnQgbWJyX3BheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywgIldyb25nIE1CUiByZWNlaXZlciIKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBXcm9uZyBNQlIgcmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToxMTIKICAgIC8vIGFwcHJvdmFsX2xlbiA9IGFwcHJvdmFsX3NpemUuYXNfdWludDY0KCkKICAgIHN3YXAKICAgIGJ0b2kKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MTEzCiAgICAvLyBjbGVhcl9sZW4gPSBjbGVhcl9zaXplLmFzX3VpbnQ2NCgpCiAgICBidG9pCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToxMTQKICAgIC8vIGFzc2VydCBhcHByb3ZhbF9sZW4gPiBVSW50NjQoMCksICJFbXB0eSBwcm9ncmFtIgogICAgZGlnIDEKICAgIGFzc2VydCAvLyBFbXB0eSBwcm9ncmFtCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MTE1CiAgICAvLyBhc3NlcnQgY2xlYXJfbGVuID4gVUludDY0KDApLCAiRW1wdHkgcHJvZ3JhbSIKICAgIGR1cAogICAgYXNzZXJ0IC8vIEVtcHR5IHByb2dyYW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToxMTYKICAgIC8vIGFzc2VydCBhcHByb3ZhbF9sZW4gKyBjbGVhcl9sZW4gPD0gVUludDY0KF9NQVhfUFJPR1JBTV9CWVRFUyksICJQcm9ncmFtIHRvbyBsYXJnZSIKICAgICsKICAgIHB1c2hpbnQgODE5MiAvLyA4MTkyCiAgICA8PQogICAgYXNzZXJ0IC8vIFByb2dyYW0gdG9vIGxhcmdlCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MTE4LTExOQogICAgLy8gIyBCb3ggTUJSOiAyLDUwMCArIDQwMCAqIChrZXlfbGVuICsgc2l6ZSk7IGtleXMgYXJlIDExIGFuZCA4IGJ5dGVzCiAgICAvLyBjb3N0ID0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjEyMAogICAgLy8gaWYgc2VsZi50dl9hcHByb3ZhbDoKICAgIGJ5dGVjXzAgLy8gMHg3NDc2NWY2MTcwNzA3MjZmNzY2MTZjCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGJ6IGJlZ2luX3RydXN0X3ZhcmlhdGlvbl91cGxvYWRfZWxzZV9ib2R5QDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToxMjEKICAgIC8vIGlmIGFwcHJvdmFsX2xlbiA+IHNlbGYudHZfYXBwcm92YWwubGVuZ3RoOgogICAgYnl0ZWNfMCAvLyAweDc0NzY1ZjYxNzA3MDcyNmY3NjYxNmMKICAgIGJveF9sZW4KICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnR2X2FwcHJvdmFsIGV4aXN0cwogICAgZGlnIDMKICAgIDwKICAgIGJ6IGJlZ2luX3RydXN0X3ZhcmlhdGlvbl91cGxvYWRfYWZ0ZXJfaWZfZWxzZUA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MTIyCiAgICAvLyBjb3N0ICs9IFVJbnQ2NCg0MDApICogKGFwcHJvdmFsX2xlbiAtIHNlbGYudHZfYXBwcm92YWwubGVuZ3RoKQogICAgYnl0ZWNfMCAvLyAweDc0NzY1ZjYxNzA3MDcyNmY3NjYxNmMKICAgIGJveF9sZW4KICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnR2X2FwcHJvdmFsIGV4aXN0cwogICAgZGlnIDMKICAgIHN3YXAKICAgIC0KICAgIGludGMgNiAvLyA0MDAKICAgICoKICAgIGJ1cnkgMQoKYmVnaW5fdHJ1c3RfdmFyaWF0aW9uX3VwbG9hZF9hZnRlcl9pZl9lbHNlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MTIzCiAgICAvLyBzZWxmLnR2X2FwcHJvdmFsLnJlc2l6ZShhcHByb3ZhbF9sZW4pCiAgICBieXRlY18wIC8vIDB4NzQ3NjVmNjE3MDcwNzI2Zjc2NjE2YwogICAgZGlnIDMKICAgIGJveF9yZXNpemUKCmJlZ2luX3RydXN0X3ZhcmlhdGlvbl91cGxvYWRfYWZ0ZXJfaWZfZWxzZUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjEyNwogICAgLy8gaWYgc2VsZi50dl9jbGVhcjoKICAgIGJ5dGVjXzEgLy8gMHg3NDc2NWY2MzZjNjU2MTcyCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGJ6IGJlZ2luX3RydXN0X3ZhcmlhdGlvbl91cGxvYWRfZWxzZV9ib2R5QDEwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MTI4CiAgICAvLyBpZiBjbGVhcl9sZW4gPiBzZWxmLnR2X2NsZWFyLmxlbmd0aDoKICAgIGJ5dGVjXzEgLy8gMHg3NDc2NWY2MzZjNjU2MTcyCiAgICBib3hfbGVuCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50dl9jbGVhciBleGlzdHMKICAgIGRpZyAyCiAgICA8CiAgICBieiBiZWdpbl90cnVzdF92YXJpYXRpb25fdXBsb2FkX2FmdGVyX2lmX2Vsc2VAOQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjEyOQogICAgLy8gY29zdCArPSBVSW50NjQoNDAwKSAqIChjbGVhcl9sZW4gLSBzZWxmLnR2X2NsZWFyLmxlbmd0aCkKICAgIGJ5dGVjXzEgLy8gMHg3NDc2NWY2MzZjNjU2MTcyCiAgICBib3hfbGVuCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50dl9jbGVhciBleGlzdHMKICAgIGRpZyAyCiAgICBzd2FwCiAgICAtCiAgICBpbnRjIDYgLy8gNDAwCiAgICAqCiAgICBkaWcgMQogICAgKwogICAgYnVyeSAxCgpiZWdpbl90cnVzdF92YXJpYXRpb25fdXBsb2FkX2FmdGVyX2lmX2Vsc2VAOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToxMzAKICAgIC8vIHNlbGYudHZfY2xlYXIucmVzaXplKGNsZWFyX2xlbikKICAgIGJ5dGVjXzEgLy8gMHg3NDc2NWY2MzZjNjU2MTcyCiAgICBkaWcgMgogICAgYm94X3Jlc2l6ZQoKYmVnaW5fdHJ1c3RfdmFyaWF0aW9uX3VwbG9hZF9hZnRlcl9pZl9lbHNlQDExOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjEzNAogICAgLy8gYXNzZXJ0IG1icl9wYXltZW50LmFtb3VudCA+PSBjb3N0LCAiSW5zdWZmaWNpZW50IE1CUiIKICAgIGRpZyAzCiAgICBndHhucyBBbW91bnQKICAgIGRpZyAxCiAgICA+PQogICAgYXNzZXJ0IC8vIEluc3VmZmljaWVudCBNQlIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToxMzUKICAgIC8vIHNlbGYudHZfcmVhZHkudmFsdWUgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDQgLy8gInR2X3JlYWR5IgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6OTgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKYmVnaW5fdHJ1c3RfdmFyaWF0aW9uX3VwbG9hZF9lbHNlX2JvZHlAMTA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MTMyCiAgICAvLyBjb3N0ICs9IFVJbnQ2NCgyXzUwMCArIDQwMCAqIDgpICsgVUludDY0KDQwMCkgKiBjbGVhcl9sZW4KICAgIGludGMgNiAvLyA0MDAKICAgIGRpZyAyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgICoKICAgIHB1c2hpbnQgNTcwMCAvLyA1NzAwCiAgICArCiAgICBkaWcgMgogICAgKwogICAgYnVyeSAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MTMzCiAgICAvLyBzZWxmLnR2X2NsZWFyLmNyZWF0ZShzaXplPWNsZWFyX2xlbikKICAgIGJ5dGVjXzEgLy8gMHg3NDc2NWY2MzZjNjU2MTcyCiAgICBzd2FwCiAgICBib3hfY3JlYXRlCiAgICBwb3AKICAgIGIgYmVnaW5fdHJ1c3RfdmFyaWF0aW9uX3VwbG9hZF9hZnRlcl9pZl9lbHNlQDExCgpiZWdpbl90cnVzdF92YXJpYXRpb25fdXBsb2FkX2Vsc2VfYm9keUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjEyNQogICAgLy8gY29zdCArPSBVSW50NjQoMl81MDAgKyA0MDAgKiAxMSkgKyBVSW50NjQoNDAwKSAqIGFwcHJvdmFsX2xlbgogICAgaW50YyA2IC8vIDQwMAogICAgZGlnIDMKICAgIGR1cAogICAgY292ZXIgMgogICAgKgogICAgcHVzaGludCA2OTAwIC8vIDY5MDAKICAgICsKICAgIGJ1cnkgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjEyNgogICAgLy8gc2VsZi50dl9hcHByb3ZhbC5jcmVhdGUoc2l6ZT1hcHByb3ZhbF9sZW4pCiAgICBieXRlY18wIC8vIDB4NzQ3NjVmNjE3MDcwNzI2Zjc2NjE2YwogICAgc3dhcAogICAgYm94X2NyZWF0ZQogICAgcG9wCiAgICBiIGJlZ2luX3RydXN0X3ZhcmlhdGlvbl91cGxvYWRfYWZ0ZXJfaWZfZWxzZUA2CgoKLy8gc21hcnRfY29udHJhY3RzLnRydXN0X2V4cGVyaW1lbnRzLmNvbnRyYWN0LlRydXN0RXhwZXJpbWVudHMud3JpdGVfdHJ1c3RfdmFyaWF0aW9uX2NodW5rW3JvdXRpbmddKCkgLT4gdm9pZDoKd3JpdGVfdHJ1c3RfdmFyaWF0aW9uX2NodW5rOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjEzNwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDgKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgY292ZXIgMgogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGludGNfMyAvLyAyCiAgICArCiAgICBkaWcgMQogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50OD4KICAgIGV4dHJhY3QgMiAwCiAgICBjb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MTQyCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzLCAiTm90IGNyZWF0b3IiCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gTm90IGNyZWF0b3IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToxNDMKICAgIC8vIHNlbGYudHZfcmVhZHkudmFsdWUgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDQgLy8gInR2X3JlYWR5IgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MTQ0CiAgICAvLyBpZiBraW5kLmFzX3VpbnQ2NCgpID09IFVJbnQ2NChQUk9HUkFNX0FQUFJPVkFMKToKICAgIGJ0b2kKICAgIGR1cAogICAgY292ZXIgMgogICAgYm56IHdyaXRlX3RydXN0X3ZhcmlhdGlvbl9jaHVua19lbHNlX2JvZHlAMwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjE0NQogICAgLy8gc2VsZi50dl9hcHByb3ZhbC5yZXBsYWNlKG9mZnNldC5hc191aW50NjQoKSwgY2h1bmspCiAgICBidG9pCiAgICBieXRlY18wIC8vIDB4NzQ3NjVmNjE3MDcwNzI2Zjc2NjE2YwogICAgc3dhcAogICAgZGlnIDMKICAgIGJveF9yZXBsYWNlCgp3cml0ZV90cnVzdF92YXJpYXRpb25fY2h1bmtfYWZ0ZXJfaWZfZWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjEzNwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgp3cml0ZV90cnVzdF92YXJpYXRpb25fY2h1bmtfZWxzZV9ib2R5QDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MTQ3CiAgICAvLyBhc3NlcnQga2luZC5hc191aW50NjQoKSA9PSBVSW50NjQoUFJPR1JBTV9DTEVBUiksICJVbmtub3duIHByb2dyYW0ga2luZCIKICAgIGRpZyAxCiAgICBpbnRjXzEgLy8gMQogICAgPT0KICAgIGFzc2VydCAvLyBVbmtub3duIHByb2dyYW0ga2luZAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjE0OAogICAgLy8gc2VsZi50dl9jbGVhci5yZXBsYWNlKG9mZnNldC5hc191aW50NjQoKSwgY2h1bmspCiAgICBidG9pCiAgICBieXRlY18xIC8vIDB4NzQ3NjVmNjM2YzY1NjE3MgogICAgc3dhcAogICAgZGlnIDMKICAgIGJveF9yZXBsYWNlCiAgICBiIHdyaXRlX3RydXN0X3ZhcmlhdGlvbl9jaHVua19hZnRlcl9pZl9lbHNlQDQKCgovLyBzbWFydF9jb250cmFjdHMudHJ1c3RfZXhwZXJpbWVudHMuY29udHJhY3QuVHJ1c3RFeHBlcmltZW50cy5maW5hbGl6ZV90cnVzdF92YXJpYXRpb25fcHJvZ3JhbVtyb3V0aW5nXSgpIC0+IHZvaWQ6CmZpbmFsaXplX3RydXN0X3ZhcmlhdGlvbl9wcm9ncmFtOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjE1MAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgZGlnIDEKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICBleHRyYWN0IDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjE1NgogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcywgIk5vdCBjcmVhdG9yIgogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIE5vdCBjcmVhdG9yCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MTU3CiAgICAvLyBhc3NlcnQgc2VsZi50dl9hcHByb3ZhbCwgIlVwbG9hZCBub3Qgc3RhcnRlZCIKICAgIGJ5dGVjXzAgLy8gMHg3NDc2NWY2MTcwNzA3MjZmNzY2MTZjCiAgICBib3hfbGVuCiAgICBhc3NlcnQgLy8gVXBsb2FkIG5vdCBzdGFydGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MTU4CiAgICAvLyBhc3NlcnQgc2VsZi50dl9jbGVhciwgIlVwbG9hZCBub3Qgc3RhcnRlZCIKICAgIGJ5dGVjXzEgLy8gMHg3NDc2NWY2MzZjNjU2MTcyCiAgICBib3hfbGVuCiAgICBhc3NlcnQgLy8gVXBsb2FkIG5vdCBzdGFydGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MTYwCiAgICAvLyBVSW50NjQoNzAwKSArIChzZWxmLnR2X2FwcHJvdmFsLmxlbmd0aCArIHNlbGYudHZfY2xlYXIubGVuZ3RoKSAvLyBVSW50NjQoOCksCiAgICArCiAgICBpbnRjXzIgLy8gOAogICAgLwogICAgcHVzaGludCA3MTAgLy8gNzEwCiAgICArCgpmaW5hbGl6ZV90cnVzdF92YXJpYXRpb25fcHJvZ3JhbV93aGlsZV90b3BAMjoKICAgIGR1cAogICAgZ2xvYmFsIE9wY29kZUJ1ZGdldAogICAgPgogICAgYnogZmluYWxpemVfdHJ1c3RfdmFyaWF0aW9uX3Byb2dyYW1fYWZ0ZXJfd2hpbGVANwogICAgaXR4bl9iZWdpbgogICAgcHVzaGludCA2IC8vIGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIHB1c2hpbnQgNSAvLyBEZWxldGVBcHBsaWNhdGlvbgogICAgaXR4bl9maWVsZCBPbkNvbXBsZXRpb24KICAgIGJ5dGVjIDEzIC8vIDB4MDY4MTAxCiAgICBpdHhuX2ZpZWxkIEFwcHJvdmFsUHJvZ3JhbQogICAgYnl0ZWMgMTMgLy8gMHgwNjgxMDEKICAgIGl0eG5fZmllbGQgQ2xlYXJTdGF0ZVByb2dyYW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIGIgZmluYWxpemVfdHJ1c3RfdmFyaWF0aW9uX3Byb2dyYW1fd2hpbGVfdG9wQDIKCmZpbmFsaXplX3RydXN0X3ZhcmlhdGlvbl9wcm9ncmFtX2FmdGVyX3doaWxlQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MTYzCiAgICAvLyBwcm9ncmFtX2hhc2ggPSBzZWxmLl9wcm9ncmFtX2hhc2goKQogICAgY2FsbHN1YiBfcHJvZ3JhbV9oYXNoCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MTY0CiAgICAvLyBhc3NlcnQgcHJvZ3JhbV9oYXNoID09IGV4cGVjdGVkX2hhc2gsICJQcm9ncmFtIGhhc2ggbWlzbWF0Y2giCiAgICBkdXAKICAgIGRpZyAzCiAgICA9PQogICAgYXNzZXJ0IC8vIFByb2dyYW0gaGFzaCBtaXNtYXRjaAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjE2NQogICAgLy8gcmV0dXJuIGFyYzQuVUludDY0KHNlbGYuX3JlY29yZF9wcm9ncmFtKHByb2dyYW1faGFzaCkpCiAgICBjYWxsc3ViIF9yZWNvcmRfcHJvZ3JhbQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjE1MAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBieXRlY18yIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnRydXN0X2V4cGVyaW1lbnRzLmNvbnRyYWN0LlRydXN0RXhwZXJpbWVudHMub3B0X2luX3RvX2Fzc2V0W3JvdXRpbmddKCkgLT4gdm9pZDoKb3B0X2luX3RvX2Fzc2V0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjE5MQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMSAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToyMDIKICAgIC8vIGFzc2VydCBhc3NldF9pZC5hc191aW50NjQoKSA+IFVJbnQ2NCgwKSwgIkFzc2V0IElEIG11c3QgYmUgPiAwIgogICAgc3dhcAogICAgYnRvaQogICAgZHVwCiAgICBjb3ZlciAyCiAgICBkdXAKICAgIGFzc2VydCAvLyBBc3NldCBJRCBtdXN0IGJlID4gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjIwMwogICAgLy8gYXNzZXJ0IG1icl9wYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsICJXcm9uZyBNQlIgcmVjZWl2ZXIiCiAgICBkaWcgMQogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIFdyb25nIE1CUiByZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjIwNAogICAgLy8gYXNzZXJ0IG1icl9wYXltZW50LmFtb3VudCA+PSBVSW50NjQoMTAwXzAwMCksICJNQlIgbXVzdCBiZSA+PSAwLjEgQUxHTyIKICAgIHN3YXAKICAgIGd0eG5zIEFtb3VudAogICAgaW50YyA1IC8vIDEwMDAwMAogICAgPj0KICAgIGFzc2VydCAvLyBNQlIgbXVzdCBiZSA+PSAwLjEgQUxHTwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjIwNwogICAgLy8gaWYgbm90IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MuaXNfb3B0ZWRfaW4oYXNzZXQpOgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIHN3YXAKICAgIGFzc2V0X2hvbGRpbmdfZ2V0IEFzc2V0QmFsYW5jZQogICAgYnVyeSAxCiAgICBibnogb3B0X2luX3RvX2Fzc2V0X2FmdGVyX2lmX2Vsc2VANAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjIwOC0yMTMKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PWFzc2V0LAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PVVJbnQ2NCgwKSwKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToyMTAKICAgIC8vIGFzc2V0X3JlY2VpdmVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjIxMQogICAgLy8gYXNzZXRfYW1vdW50PVVJbnQ2NCgwKSwKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEFzc2V0QW1vdW50CiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIGR1cAogICAgaXR4bl9maWVsZCBYZmVyQXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToyMDgKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIHB1c2hpbnQgNCAvLyBheGZlcgogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjIxMgogICAgLy8gZmVlPTAsCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToyMDgtMjEzCiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1hc3NldCwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1VSW50NjQoMCksCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAoKb3B0X2luX3RvX2Fzc2V0X2FmdGVyX2lmX2Vsc2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToxOTEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50cnVzdF9leHBlcmltZW50cy5jb250cmFjdC5UcnVzdEV4cGVyaW1lbnRzLmNyZWF0ZV9leHBlcmltZW50W3JvdXRpbmddKCkgLT4gdm9pZDoKY3JlYXRlX2V4cGVyaW1lbnQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MjE1CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGludGNfMyAvLyAyCiAgICArCiAgICBkaWcgMQogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50OD4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToyMTcKICAgIC8vIGV4cF9pZCA9IGFyYzQuVUludDMyKHNlbGYuZXhwZXJpbWVudF9jb3VudC52YWx1ZSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA1IC8vICJleHBlcmltZW50X2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmV4cGVyaW1lbnRfY291bnQgZXhpc3RzCiAgICBkdXAKICAgIGl0b2IKICAgIGR1cAogICAgYml0bGVuCiAgICBwdXNoaW50IDMyIC8vIDMyCiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDQgNAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjIxOAogICAgLy8gc2VsZi5leHBlcmltZW50X2NvdW50LnZhbHVlICs9IFVJbnQ2NCgxKQogICAgc3dhcAogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjIDUgLy8gImV4cGVyaW1lbnRfY291bnQiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjIyMQogICAgLy8gb3duZXI9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjIyMwogICAgLy8gY3JlYXRlZF9hdD1hcmM0LlVJbnQ2NChHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCksCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MjE5LTIyNQogICAgLy8gc2VsZi5leHBlcmltZW50c1tleHBfaWRdID0gRXhwZXJpbWVudEdyb3VwKAogICAgLy8gICAgIGV4cF9pZD1leHBfaWQsCiAgICAvLyAgICAgb3duZXI9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgIG5hbWU9bmFtZSwKICAgIC8vICAgICBjcmVhdGVkX2F0PWFyYzQuVUludDY0KEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wKSwKICAgIC8vICAgICB2YXJpYXRpb25fY291bnQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyApCiAgICBkaWcgMgogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIGJ5dGVjIDYgLy8gMHgwMDM2CiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjIyNAogICAgLy8gdmFyaWF0aW9uX2NvdW50PWFyYzQuVUludDY0KDApLAogICAgcHVzaGJ5dGVzIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjIxOS0yMjUKICAgIC8vIHNlbGYuZXhwZXJpbWVudHNbZXhwX2lkXSA9IEV4cGVyaW1lbnRHcm91cCgKICAgIC8vICAgICBleHBfaWQ9ZXhwX2lkLAogICAgLy8gICAgIG93bmVyPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICBuYW1lPW5hbWUsCiAgICAvLyAgICAgY3JlYXRlZF9hdD1hcmM0LlVJbnQ2NChHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCksCiAgICAvLyAgICAgdmFyaWF0aW9uX2NvdW50PWFyYzQuVUludDY0KDApLAogICAgLy8gKQogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjIxOQogICAgLy8gc2VsZi5leHBlcmltZW50c1tleHBfaWRdID0gRXhwZXJpbWVudEdyb3VwKAogICAgYnl0ZWNfMyAvLyAweDY1NWYKICAgIGRpZyAyCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToyMTktMjI1CiAgICAvLyBzZWxmLmV4cGVyaW1lbnRzW2V4cF9pZF0gPSBFeHBlcmltZW50R3JvdXAoCiAgICAvLyAgICAgZXhwX2lkPWV4cF9pZCwKICAgIC8vICAgICBvd25lcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgbmFtZT1uYW1lLAogICAgLy8gICAgIGNyZWF0ZWRfYXQ9YXJjNC5VSW50NjQoR2xvYmFsLmxhdGVzdF90aW1lc3RhbXApLAogICAgLy8gICAgIHZhcmlhdGlvbl9jb3VudD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICkKICAgIGR1cAogICAgYm94X2RlbAogICAgcG9wCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MjI2CiAgICAvLyBzZWxmLl9pbmRleF9vd25lcl9leHBlcmltZW50KGV4cF9pZCkKICAgIGR1cAogICAgY2FsbHN1YiBfaW5kZXhfb3duZXJfZXhwZXJpbWVudAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjIyNwogICAgLy8gYXJjNC5lbWl0KEV4cGVyaW1lbnRDcmVhdGVkKGV4cF9pZD1leHBfaWQsIG93bmVyPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSkpCiAgICBkdXAKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgYnl0ZWMgMTQgLy8gbWV0aG9kICJFeHBlcmltZW50Q3JlYXRlZCh1aW50MzIsYWRkcmVzcykiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjIxNQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBieXRlY18yIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnRydXN0X2V4cGVyaW1lbnRzLmNvbnRyYWN0LlRydXN0RXhwZXJpbWVudHMuY3JlYXRlX3ZhcmlhdGlvbltyb3V0aW5nXSgpIC0+IHZvaWQ6CmNyZWF0ZV92YXJpYXRpb246CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MjM5CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cG4gMgogICAgbGVuCiAgICBwdXNoaW50IDQgLy8gNAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50MzIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgY292ZXIgMgogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgaW50Y18zIC8vIDIKICAgICsKICAgIHN3YXAKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA0CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA1CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA2CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA3CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDgKICAgIGR1cAogICAgY292ZXIgMwogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzMgLy8gMgogICAgLQogICAgZHVwCiAgICBjb3ZlciAzCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGNvdmVyIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToyNTMKICAgIC8vIGFzc2VydCBleHBfaWQgaW4gc2VsZi5leHBlcmltZW50cywgIkV4cGVyaW1lbnQgbm90IGZvdW5kIgogICAgYnl0ZWNfMyAvLyAweDY1NWYKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICBkdXAKICAgIGNvdmVyIDMKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gRXhwZXJpbWVudCBub3QgZm91bmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToyNTQKICAgIC8vIGV4cGVyaW1lbnQgPSBzZWxmLmV4cGVyaW1lbnRzW2V4cF9pZF0uY29weSgpCiAgICBkdXAKICAgIGJveF9nZXQKICAgIHBvcAogICAgY292ZXIgMwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjI1NC0yNTUKICAgIC8vIGV4cGVyaW1lbnQgPSBzZWxmLmV4cGVyaW1lbnRzW2V4cF9pZF0uY29weSgpCiAgICAvLyBhc3NlcnQgZXhwZXJpbWVudC5vd25lciA9PSBhcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksICJOb3QgZXhwZXJpbWVudCBvd25lciIKICAgIHB1c2hpbnRzIDQgMzIgLy8gNCwgMzIKICAgIGJveF9leHRyYWN0CiAgICBkdXAKICAgIGNvdmVyIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToyNTUKICAgIC8vIGFzc2VydCBleHBlcmltZW50Lm93bmVyID09IGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwgIk5vdCBleHBlcmltZW50IG93bmVyIgogICAgdHhuIFNlbmRlcgogICAgPT0KICAgIGFzc2VydCAvLyBOb3QgZXhwZXJpbWVudCBvd25lcgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjI1NgogICAgLy8gYXNzZXJ0IHNlbGYudHZfcmVhZHkudmFsdWUgPT0gVUludDY0KDEpLCAiVHJ1c3RWYXJpYXRpb24gcHJvZ3JhbSBub3Qgc2V0IgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gInR2X3JlYWR5IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnR2X3JlYWR5IGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBhc3NlcnQgLy8gVHJ1c3RWYXJpYXRpb24gcHJvZ3JhbSBub3Qgc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MjU4LTI2MAogICAgLy8gIyBNQlIgbGVnIGZ1bmRzIHRoZSBuZXcgdmFyaWF0aW9uIGFwcCdzIGFjY291bnQ6IDAuMSBBTEdPIGJhc2UgKyAwLjEgQUxHTwogICAgLy8gIyBwZXIgYXNzZXQgb3B0LWluLiBBbHdheXMgcGFpZCBpbiBBTEdPIHJlZ2FyZGxlc3Mgb2YgcGF5b3V0IGFzc2V0LgogICAgLy8gYXNzZXJ0IG1icl9wYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsICJXcm9uZyBNQlIgcmVjZWl2ZXIiCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gV3JvbmcgTUJSIHJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MjYxCiAgICAvLyBpZiBhc3NldF9pZC5hc191aW50NjQoKSA9PSBVSW50NjQoMCk6CiAgICBidG9pCiAgICBkdXAKICAgIGJueiBjcmVhdGVfdmFyaWF0aW9uX2Vsc2VfYm9keUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MjYyCiAgICAvLyBhc3NlcnQgbWJyX3BheW1lbnQuYW1vdW50ID49IFVJbnQ2NChfVkFSX0FQUF9NQlJfQUxHTyksICJNQlIgbXVzdCBiZSA+PSAwLjEgQUxHTyIKICAgIGRpZyA1CiAgICBndHhucyBBbW91bnQKICAgIGludGMgNSAvLyAxMDAwMDAKICAgID49CiAgICBhc3NlcnQgLy8gTUJSIG11c3QgYmUgPj0gMC4xIEFMR08KCmNyZWF0ZV92YXJpYXRpb25fYWZ0ZXJfaWZfZWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjI2NgogICAgLy8gZXNjcm93X2Ftb3VudCA9IHNlbGYuX2NoZWNrX2VzY3Jvdyhlc2Nyb3dfZnVuZGluZywgYXNzZXRfaWQuYXNfdWludDY0KCkpCiAgICBkaWcgNAogICAgZGlnIDEKICAgIGNhbGxzdWIgX2NoZWNrX2VzY3JvdwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjI2NwogICAgLy8gdmFyX2lkID0gYXJjNC5VSW50MzIoZXhwZXJpbWVudC52YXJpYXRpb25fY291bnQuYXNfdWludDY0KCkpCiAgICBkaWcgNAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBwdXNoaW50IDQ2IC8vIDQ2CiAgICBpbnRjXzIgLy8gOAogICAgYm94X2V4dHJhY3QKICAgIGJ0b2kKICAgIGR1cAogICAgaXRvYgogICAgZHVwCiAgICBiaXRsZW4KICAgIHB1c2hpbnQgMzIgLy8gMzIKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGV4dHJhY3QgNCA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6Mjc2CiAgICAvLyBlc2Nyb3c9YXJjNC5VSW50NjQoZXNjcm93X2Ftb3VudCksCiAgICB1bmNvdmVyIDIKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToyNjgtMjc3CiAgICAvLyBwYXJhbXMgPSBWYXJpYXRpb25QYXJhbXMoCiAgICAvLyAgICAgbGFiZWw9bGFiZWwsCiAgICAvLyAgICAgZTE9ZTEsCiAgICAvLyAgICAgZTI9ZTIsCiAgICAvLyAgICAgbXVsdGlwbGllcj1tdWx0aXBsaWVyLAogICAgLy8gICAgIHVuaXQ9dW5pdCwKICAgIC8vICAgICBhc3NldF9pZD1hc3NldF9pZCwKICAgIC8vICAgICBtYXhfcGFydGljaXBhbnRzPW1heF9wYXJ0aWNpcGFudHMsCiAgICAvLyAgICAgZXNjcm93PWFyYzQuVUludDY0KGVzY3Jvd19hbW91bnQpLAogICAgLy8gKQogICAgYnl0ZWMgMTUgLy8gMHgwMDNhCiAgICBkaWcgMTYKICAgIGNvbmNhdAogICAgZGlnIDE1CiAgICBjb25jYXQKICAgIGRpZyAxNAogICAgY29uY2F0CiAgICBkaWcgMTMKICAgIGNvbmNhdAogICAgZGlnIDEyCiAgICBjb25jYXQKICAgIGRpZyAxMQogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGRpZyAxNgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6Mjc4CiAgICAvLyBuZXdfYXBwX2lkID0gc2VsZi5fc3Bhd25fdmFyaWF0aW9uKGV4cF9pZCwgdmFyX2lkLCBwYXJhbXMsIG1icl9wYXltZW50LmFtb3VudCwgdHJlYXN1cnlfZnVuZGVkPUZhbHNlKQogICAgZGlnIDkKICAgIGd0eG5zIEFtb3VudAogICAgZGlnIDE4CiAgICBjb3ZlciAzCiAgICBpbnRjXzAgLy8gMAogICAgY2FsbHN1YiBfc3Bhd25fdmFyaWF0aW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MjgyCiAgICAvLyBleHBfaWQ9ZXhwZXJpbWVudC5leHBfaWQsCiAgICBkaWcgMgogICAgaW50Y18wIC8vIDAKICAgIHB1c2hpbnQgNCAvLyA0CiAgICBib3hfZXh0cmFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjI4NAogICAgLy8gbmFtZT1leHBlcmltZW50Lm5hbWUsCiAgICBkaWcgNgogICAgZHVwCiAgICBwdXNoaW50IDM2IC8vIDM2CiAgICBleHRyYWN0X3VpbnQxNgogICAgZGlnIDEKICAgIGxlbgogICAgc3Vic3RyaW5nMwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjI4NQogICAgLy8gY3JlYXRlZF9hdD1leHBlcmltZW50LmNyZWF0ZWRfYXQsCiAgICBkaWcgNAogICAgcHVzaGludCAzOCAvLyAzOAogICAgaW50Y18yIC8vIDgKICAgIGJveF9leHRyYWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6Mjg2CiAgICAvLyB2YXJpYXRpb25fY291bnQ9YXJjNC5VSW50NjQoZXhwZXJpbWVudC52YXJpYXRpb25fY291bnQuYXNfdWludDY0KCkgKyBVSW50NjQoMSkpLAogICAgdW5jb3ZlciA0CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjI4MC0yODcKICAgIC8vICMgSW5jcmVtZW50IGV4cGVyaW1lbnQgdmFyaWF0aW9uIGNvdW50CiAgICAvLyBzZWxmLmV4cGVyaW1lbnRzW2V4cF9pZF0gPSBFeHBlcmltZW50R3JvdXAoCiAgICAvLyAgICAgZXhwX2lkPWV4cGVyaW1lbnQuZXhwX2lkLAogICAgLy8gICAgIG93bmVyPWV4cGVyaW1lbnQub3duZXIuY29weSgpLAogICAgLy8gICAgIG5hbWU9ZXhwZXJpbWVudC5uYW1lLAogICAgLy8gICAgIGNyZWF0ZWRfYXQ9ZXhwZXJpbWVudC5jcmVhdGVkX2F0LAogICAgLy8gICAgIHZhcmlhdGlvbl9jb3VudD1hcmM0LlVJbnQ2NChleHBlcmltZW50LnZhcmlhdGlvbl9jb3VudC5hc191aW50NjQoKSArIFVJbnQ2NCgxKSksCiAgICAvLyApCiAgICB1bmNvdmVyIDMKICAgIGRpZyA3CiAgICBjb25jYXQKICAgIGJ5dGVjIDYgLy8gMHgwMDM2CiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZGlnIDIKICAgIGJveF9kZWwKICAgIHBvcAogICAgdW5jb3ZlciAyCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MjM5CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGJ5dGVjXzIgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCmNyZWF0ZV92YXJpYXRpb25fZWxzZV9ib2R5QDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MjY0CiAgICAvLyBhc3NlcnQgbWJyX3BheW1lbnQuYW1vdW50ID49IFVJbnQ2NChfVkFSX0FQUF9NQlJfQVNBKSwgIk1CUiBtdXN0IGJlID49IDAuMiBBTEdPIgogICAgZGlnIDUKICAgIGd0eG5zIEFtb3VudAogICAgaW50YyA3IC8vIDIwMDAwMAogICAgPj0KICAgIGFzc2VydCAvLyBNQlIgbXVzdCBiZSA+PSAwLjIgQUxHTwogICAgYiBjcmVhdGVfdmFyaWF0aW9uX2FmdGVyX2lmX2Vsc2VANAoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50cnVzdF9leHBlcmltZW50cy5jb250cmFjdC5UcnVzdEV4cGVyaW1lbnRzLmNyZWF0ZV92YXJpYXRpb25zW3JvdXRpbmddKCkgLT4gdm9pZDoKY3JlYXRlX3ZhcmlhdGlvbnM6CiAgICBpbnRjXzAgLy8gMAogICAgZHVwbiAzCiAgICBwdXNoYnl0ZXMgIiIKICAgIGR1cG4gOQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjI5MQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCA0IC8vIDQKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDMyCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGludGNfMyAvLyAyCiAgICAqCiAgICBzd2FwCiAgICBkdXAKICAgIGxlbgogICAgc3dhcAogICAgZXh0cmFjdCAyIDAKICAgIGludGNfMCAvLyAwCgpjcmVhdGVfdmFyaWF0aW9uc19mb3JfaGVhZGVyQDE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MjkxCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGR1cAogICAgZGlnIDUKICAgIDwKICAgIGJ6IGNyZWF0ZV92YXJpYXRpb25zX2FmdGVyX2ZvckA0CiAgICBkdXBuIDIKICAgIGludGNfMyAvLyAyCiAgICAqCiAgICBkaWcgMwogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGVuY29kaW5nCiAgICBkdXAKICAgIGRpZyA3CiAgICBkdXAKICAgIGNvdmVyIDQKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCB0YWlsIHBvaW50ZXIgZm9yIChsZW4rKChsZW4rdXRmOFtdKSx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQpW10pCiAgICBkaWcgMQogICAgbGVuCiAgICBzdWJzdHJpbmczCiAgICBkdXAKICAgIGxlbgogICAgZGlnIDEKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCB0dXBsZSBlbmNvZGluZwogICAgZHVwCiAgICBwdXNoaW50IDU4IC8vIDU4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgdGFpbCBwb2ludGVyIGF0IGluZGV4IDAgb2YgKChsZW4rdXRmOFtdKSx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQpCiAgICBzd2FwCiAgICBzdWJzdHJpbmczCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgcHVzaGludCA2MCAvLyA2MAogICAgKwogICAgKwogICAgYnVyeSA1CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnVyeSAxCiAgICBiIGNyZWF0ZV92YXJpYXRpb25zX2Zvcl9oZWFkZXJAMQoKY3JlYXRlX3ZhcmlhdGlvbnNfYWZ0ZXJfZm9yQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MjkxCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGRpZyAzCiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgZGlnIDMKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxzbWFydF9jb250cmFjdHMuc2hhcmVkLnR5cGVzLlZhcmlhdGlvblBhcmFtcz4KICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzMgLy8gMgogICAgLQogICAgZHVwCiAgICBidXJ5IDExCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBidXJ5IDE0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MzA5CiAgICAvLyBhc3NlcnQgZXhwX2lkIGluIHNlbGYuZXhwZXJpbWVudHMsICJFeHBlcmltZW50IG5vdCBmb3VuZCIKICAgIGJ5dGVjXzMgLy8gMHg2NTVmCiAgICBkaWcgNgogICAgY29uY2F0CiAgICBkdXAKICAgIGJ1cnkgMTkKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gRXhwZXJpbWVudCBub3QgZm91bmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTozMTAKICAgIC8vIGV4cGVyaW1lbnQgPSBzZWxmLmV4cGVyaW1lbnRzW2V4cF9pZF0uY29weSgpCiAgICBkdXAKICAgIGJveF9nZXQKICAgIHBvcAogICAgYnVyeSAxOAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjMxMC0zMTEKICAgIC8vIGV4cGVyaW1lbnQgPSBzZWxmLmV4cGVyaW1lbnRzW2V4cF9pZF0uY29weSgpCiAgICAvLyBhc3NlcnQgZXhwZXJpbWVudC5vd25lciA9PSBhcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksICJOb3QgZXhwZXJpbWVudCBvd25lciIKICAgIHB1c2hpbnRzIDQgMzIgLy8gNCwgMzIKICAgIGJveF9leHRyYWN0CiAgICBkdXAKICAgIGJ1cnkgMjAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTozMTEKICAgIC8vIGFzc2VydCBleHBlcmltZW50Lm93bmVyID09IGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwgIk5vdCBleHBlcmltZW50IG93bmVyIgogICAgdHhuIFNlbmRlcgogICAgPT0KICAgIGFzc2VydCAvLyBOb3QgZXhwZXJpbWVudCBvd25lcgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjMxMgogICAgLy8gYXNzZXJ0IHNlbGYudHZfcmVhZHkudmFsdWUgPT0gVUludDY0KDEpLCAiVHJ1c3RWYXJpYXRpb24gcHJvZ3JhbSBub3Qgc2V0IgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gInR2X3JlYWR5IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnR2X3JlYWR5IGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBhc3NlcnQgLy8gVHJ1c3RWYXJpYXRpb24gcHJvZ3JhbSBub3Qgc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MzEzCiAgICAvLyBhc3NlcnQgY29uZmlncy5sZW5ndGggPiBVSW50NjQoMCksICJObyBjb25maWdzIgogICAgZGlnIDQKICAgIGR1cAogICAgYXNzZXJ0IC8vIE5vIGNvbmZpZ3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTozMTQKICAgIC8vIGFzc2VydCBjb25maWdzLmxlbmd0aCA8PSBVSW50NjQoTUFYX1ZBUklBVElPTlNfUEVSX0NBTEwpLCAiVG9vIG1hbnkgY29uZmlncyIKICAgIGR1cAogICAgcHVzaGludCAzMSAvLyAzMQogICAgPD0KICAgIGFzc2VydCAvLyBUb28gbWFueSBjb25maWdzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MzE2CiAgICAvLyBhc3NldF9pZF92YWx1ZSA9IGNvbmZpZ3NbMF0uYXNzZXRfaWQuYXNfdWludDY0KCkKICAgIGRpZyAyCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgdW5jb3ZlciAyCiAgICBpbnRjXzEgLy8gMQogICAgLSAvLyBvbiBlcnJvcjogaW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGR1cAogICAgY292ZXIgMgogICAgYnVyeSAxNAogICAgZGlnIDIKICAgIGxlbgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBidXJ5IDIwCiAgICBkaWcgMwogICAgaW50Y18zIC8vIDIKICAgIGV4dHJhY3RfdWludDE2CiAgICB1bmNvdmVyIDIKICAgIHN3YXAKICAgIHVuY292ZXIgMwogICAgc2VsZWN0CiAgICBzdWJzdHJpbmczCiAgICBwdXNoaW50IDM0IC8vIDM0CiAgICBleHRyYWN0X3VpbnQ2NAogICAgYnVyeSAxNQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjMxNwogICAgLy8gdG90YWxfZXNjcm93ID0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgYnVyeSA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MzE4CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoY29uZmlncy5sZW5ndGgpOgogICAgaW50Y18wIC8vIDAKICAgIGJ1cnkgMTIKCmNyZWF0ZV92YXJpYXRpb25zX2Zvcl9oZWFkZXJANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTozMTgKICAgIC8vIGZvciBpIGluIHVyYW5nZShjb25maWdzLmxlbmd0aCk6CiAgICBkaWcgMTEKICAgIGRpZyA1CiAgICA8CiAgICBieiBjcmVhdGVfdmFyaWF0aW9uc19hZnRlcl9mb3JAOQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjMxOQogICAgLy8gYXNzZXJ0IGNvbmZpZ3NbaV0uYXNzZXRfaWQuYXNfdWludDY0KCkgPT0gYXNzZXRfaWRfdmFsdWUsICJNaXhlZCBwYXlvdXQgYXNzZXRzIgogICAgZGlnIDExCiAgICBkdXAKICAgIGludGNfMyAvLyAyCiAgICAqCiAgICBkaWcgMwogICAgZHVwCiAgICBjb3ZlciAzCiAgICBzd2FwCiAgICBleHRyYWN0X3VpbnQxNgogICAgc3dhcAogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGRpZyA3CiAgICBkaWcgMQogICAgLSAvLyBvbiBlcnJvcjogaW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGRpZyAxCiAgICBpbnRjXzMgLy8gMgogICAgKgogICAgZGlnIDQKICAgIHN3YXAKICAgIGV4dHJhY3RfdWludDE2CiAgICBkaWcgMjAKICAgIHN3YXAKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICB1bmNvdmVyIDMKICAgIHVuY292ZXIgMwogICAgdW5jb3ZlciAyCiAgICBzdWJzdHJpbmczCiAgICBkdXAKICAgIHB1c2hpbnQgMzQgLy8gMzQKICAgIGV4dHJhY3RfdWludDY0CiAgICBkaWcgMTcKICAgID09CiAgICBhc3NlcnQgLy8gTWl4ZWQgcGF5b3V0IGFzc2V0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjMxOS0zMjAKICAgIC8vIGFzc2VydCBjb25maWdzW2ldLmFzc2V0X2lkLmFzX3VpbnQ2NCgpID09IGFzc2V0X2lkX3ZhbHVlLCAiTWl4ZWQgcGF5b3V0IGFzc2V0cyIKICAgIC8vIGFzc2VydCBjb25maWdzW2ldLmVzY3Jvdy5hc191aW50NjQoKSA+IFVJbnQ2NCgwKSwgIkVzY3JvdyBtdXN0IGJlID4gMCIKICAgIHB1c2hpbnQgNTAgLy8gNTAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTozMjAKICAgIC8vIGFzc2VydCBjb25maWdzW2ldLmVzY3Jvdy5hc191aW50NjQoKSA+IFVJbnQ2NCgwKSwgIkVzY3JvdyBtdXN0IGJlID4gMCIKICAgIGV4dHJhY3RfdWludDY0CiAgICBkdXAKICAgIGFzc2VydCAvLyBFc2Nyb3cgbXVzdCBiZSA+IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTozMjEKICAgIC8vIHRvdGFsX2VzY3JvdyArPSBjb25maWdzW2ldLmVzY3Jvdy5hc191aW50NjQoKQogICAgZGlnIDkKICAgICsKICAgIGJ1cnkgOQogICAgYnVyeSAxMgogICAgYiBjcmVhdGVfdmFyaWF0aW9uc19mb3JfaGVhZGVyQDYKCmNyZWF0ZV92YXJpYXRpb25zX2FmdGVyX2ZvckA5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjQ4NwogICAgLy8gaWYgYXNzZXRfaWQgPT0gVUludDY0KDApOgogICAgZGlnIDE0CiAgICBibnogY3JlYXRlX3ZhcmlhdGlvbnNfYWZ0ZXJfaWZfZWxzZUAxOAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjQ4OAogICAgLy8gcmV0dXJuIFVJbnQ2NChfVkFSX0FQUF9NQlJfQUxHTykKICAgIGludGMgNSAvLyAxMDAwMDAKICAgIGJ1cnkgNwoKY3JlYXRlX3ZhcmlhdGlvbnNfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMudHJ1c3RfZXhwZXJpbWVudHMuY29udHJhY3QuVHJ1c3RFeHBlcmltZW50cy5fdmFyaWF0aW9uX21ickAxOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTozMjQKICAgIC8vIGFzc2VydCBtYnJfcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLCAiV3JvbmcgTUJSIHJlY2VpdmVyIgogICAgZGlnIDkKICAgIGR1cAogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIFdyb25nIE1CUiByZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjMyNQogICAgLy8gYXNzZXJ0IG1icl9wYXltZW50LmFtb3VudCA+PSB2YXJfbWJyICogY29uZmlncy5sZW5ndGgsICJJbnN1ZmZpY2llbnQgTUJSIgogICAgZ3R4bnMgQW1vdW50CiAgICBkdXAKICAgIGJ1cnkgMTAKICAgIGRpZyA3CiAgICBkaWcgNgogICAgKgogICAgPj0KICAgIGFzc2VydCAvLyBJbnN1ZmZpY2llbnQgTUJSCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MzI2CiAgICAvLyBhc3NlcnQgc2VsZi5fY2hlY2tfZXNjcm93KGVzY3Jvd19mdW5kaW5nLCBhc3NldF9pZF92YWx1ZSkgPT0gdG90YWxfZXNjcm93LCAiRXNjcm93IG11c3QgZXF1YWwgY29uZmlnIHRvdGFsIgogICAgZGlnIDEzCiAgICBkaWcgMTUKICAgIGNhbGxzdWIgX2NoZWNrX2VzY3JvdwogICAgZGlnIDgKICAgID09CiAgICBhc3NlcnQgLy8gRXNjcm93IG11c3QgZXF1YWwgY29uZmlnIHRvdGFsCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MzI4CiAgICAvLyBmaXJzdF92YXJfaWQgPSBleHBlcmltZW50LnZhcmlhdGlvbl9jb3VudC5hc191aW50NjQoKQogICAgZGlnIDE3CiAgICBwdXNoaW50IDQ2IC8vIDQ2CiAgICBpbnRjXzIgLy8gOAogICAgYm94X2V4dHJhY3QKICAgIGJ0b2kKICAgIGJ1cnkgMTMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTozMzAKICAgIC8vIGFwcF9pZHMgPSBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlVJbnQ2NF0oKQogICAgYnl0ZWMgMTIgLy8gMHgwMDAwCiAgICBidXJ5IDIwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MzMxCiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoY29uZmlncy5sZW5ndGgpOgogICAgaW50Y18wIC8vIDAKICAgIGJ1cnkgMTIKCmNyZWF0ZV92YXJpYXRpb25zX2Zvcl9oZWFkZXJAMTA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MzMxCiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoY29uZmlncy5sZW5ndGgpOgogICAgZGlnIDExCiAgICBkaWcgNQogICAgPAogICAgYnogY3JlYXRlX3ZhcmlhdGlvbnNfYWZ0ZXJfZm9yQDE1CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MzMzCiAgICAvLyBpZiBpID09IGxhc3Q6CiAgICBkaWcgMTEKICAgIGRpZyAxMQogICAgPT0KICAgIGJueiBjcmVhdGVfdmFyaWF0aW9uc19pZl9ib2R5QDEyCiAgICBkaWcgNgoKY3JlYXRlX3ZhcmlhdGlvbnNfYWZ0ZXJfaWZfZWxzZUAxMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTozMzUKICAgIC8vIHZhcl9pZCA9IGFyYzQuVUludDMyKGZpcnN0X3Zhcl9pZCArIGkpCiAgICBkaWcgMTMKICAgIGRpZyAxMwogICAgZHVwCiAgICBjb3ZlciAyCiAgICArCiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgcHVzaGludCAzMiAvLyAzMgogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZXh0cmFjdCA0IDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTozMzYKICAgIC8vIGFwcF9pZHMuYXBwZW5kKHNlbGYuX3NwYXduX3ZhcmlhdGlvbihleHBfaWQsIHZhcl9pZCwgY29uZmlnc1tpXSwgbWJyX2Ftb3VudCwgdHJlYXN1cnlfZnVuZGVkPUZhbHNlKSkKICAgIGRpZyAxCiAgICBpbnRjXzMgLy8gMgogICAgKgogICAgZGlnIDUKICAgIGR1cAogICAgY292ZXIgMwogICAgc3dhcAogICAgZXh0cmFjdF91aW50MTYKICAgIHVuY292ZXIgMwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGRpZyA5CiAgICBkaWcgMQogICAgLSAvLyBvbiBlcnJvcjogaW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGRpZyAxCiAgICBpbnRjXzMgLy8gMgogICAgKgogICAgZGlnIDUKICAgIHN3YXAKICAgIGV4dHJhY3RfdWludDE2CiAgICBkaWcgMjIKICAgIHN3YXAKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICB1bmNvdmVyIDQKICAgIHVuY292ZXIgMwogICAgdW5jb3ZlciAyCiAgICBzdWJzdHJpbmczCiAgICBkaWcgOQogICAgdW5jb3ZlciAzCiAgICB1bmNvdmVyIDIKICAgIHVuY292ZXIgNAogICAgaW50Y18wIC8vIDAKICAgIGNhbGxzdWIgX3NwYXduX3ZhcmlhdGlvbgogICAgZGlnIDIxCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgY29uY2F0IC8vIG9uIGVycm9yOiBtYXggYXJyYXkgbGVuZ3RoIGV4Y2VlZGVkCiAgICBzd2FwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgcmVwbGFjZTIgMAogICAgYnVyeSAyMQogICAgYnVyeSAxMgogICAgYiBjcmVhdGVfdmFyaWF0aW9uc19mb3JfaGVhZGVyQDEwCgpjcmVhdGVfdmFyaWF0aW9uc19pZl9ib2R5QDEyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjMzNAogICAgLy8gbWJyX2Ftb3VudCA9IG1icl9wYXltZW50LmFtb3VudCAtIHZhcl9tYnIgKiBsYXN0CiAgICBkaWcgNgogICAgZGlnIDExCiAgICAqCiAgICBkaWcgOQogICAgc3dhcAogICAgLQogICAgYiBjcmVhdGVfdmFyaWF0aW9uc19hZnRlcl9pZl9lbHNlQDEzCgpjcmVhdGVfdmFyaWF0aW9uc19hZnRlcl9mb3JAMTU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MzM5CiAgICAvLyBleHBfaWQ9ZXhwZXJpbWVudC5leHBfaWQsCiAgICBkaWcgMTcKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIHB1c2hpbnQgNCAvLyA0CiAgICBib3hfZXh0cmFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjM0MQogICAgLy8gbmFtZT1leHBlcmltZW50Lm5hbWUsCiAgICBkaWcgMTgKICAgIGR1cAogICAgcHVzaGludCAzNiAvLyAzNgogICAgZXh0cmFjdF91aW50MTYKICAgIGRpZyAxCiAgICBsZW4KICAgIHN1YnN0cmluZzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTozNDIKICAgIC8vIGNyZWF0ZWRfYXQ9ZXhwZXJpbWVudC5jcmVhdGVkX2F0LAogICAgZGlnIDIKICAgIHB1c2hpbnQgMzggLy8gMzgKICAgIGludGNfMiAvLyA4CiAgICBib3hfZXh0cmFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjM0MwogICAgLy8gdmFyaWF0aW9uX2NvdW50PWFyYzQuVUludDY0KGZpcnN0X3Zhcl9pZCArIGNvbmZpZ3MubGVuZ3RoKSwKICAgIGRpZyAxNgogICAgZGlnIDkKICAgICsKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTozMzgtMzQ0CiAgICAvLyBzZWxmLmV4cGVyaW1lbnRzW2V4cF9pZF0gPSBFeHBlcmltZW50R3JvdXAoCiAgICAvLyAgICAgZXhwX2lkPWV4cGVyaW1lbnQuZXhwX2lkLAogICAgLy8gICAgIG93bmVyPWV4cGVyaW1lbnQub3duZXIuY29weSgpLAogICAgLy8gICAgIG5hbWU9ZXhwZXJpbWVudC5uYW1lLAogICAgLy8gICAgIGNyZWF0ZWRfYXQ9ZXhwZXJpbWVudC5jcmVhdGVkX2F0LAogICAgLy8gICAgIHZhcmlhdGlvbl9jb3VudD1hcmM0LlVJbnQ2NChmaXJzdF92YXJfaWQgKyBjb25maWdzLmxlbmd0aCksCiAgICAvLyApCiAgICB1bmNvdmVyIDMKICAgIGRpZyAyMwogICAgY29uY2F0CiAgICBieXRlYyA2IC8vIDB4MDAzNgogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGRpZyAxCiAgICBib3hfZGVsCiAgICBwb3AKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToyOTEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgYnl0ZWNfMiAvLyAweDE1MWY3Yzc1CiAgICBkaWcgMjAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgpjcmVhdGVfdmFyaWF0aW9uc19hZnRlcl9pZl9lbHNlQDE4OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjQ4OQogICAgLy8gcmV0dXJuIFVJbnQ2NChfVkFSX0FQUF9NQlJfQVNBKQogICAgaW50YyA3IC8vIDIwMDAwMAogICAgYnVyeSA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MzIzCiAgICAvLyB2YXJfbWJyID0gc2VsZi5fdmFyaWF0aW9uX21icihhc3NldF9pZF92YWx1ZSkKICAgIGIgY3JlYXRlX3ZhcmlhdGlvbnNfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMudHJ1c3RfZXhwZXJpbWVudHMuY29udHJhY3QuVHJ1c3RFeHBlcmltZW50cy5fdmFyaWF0aW9uX21ickAxOQoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50cnVzdF9leHBlcmltZW50cy5jb250cmFjdC5UcnVzdEV4cGVyaW1lbnRzLmRlcG9zaXRfdHJlYXN1cnlbcm91dGluZ10oKSAtPiB2b2lkOgpkZXBvc2l0X3RyZWFzdXJ5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjM0NwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXBuIDIKICAgIGxlbgogICAgcHVzaGludCA0IC8vIDQKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDMyCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjM1MgogICAgLy8gYXNzZXJ0IGV4cF9pZCBpbiBzZWxmLmV4cGVyaW1lbnRzLCAiRXhwZXJpbWVudCBub3QgZm91bmQiCiAgICBieXRlY18zIC8vIDB4NjU1ZgogICAgZGlnIDMKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBFeHBlcmltZW50IG5vdCBmb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjM1MwogICAgLy8gYXNzZXJ0IHNlbGYuZXhwZXJpbWVudHNbZXhwX2lkXS5vd25lciA9PSBhcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksICJOb3QgZXhwZXJpbWVudCBvd25lciIKICAgIHB1c2hpbnRzIDQgMzIgLy8gNCwgMzIKICAgIGJveF9leHRyYWN0CiAgICB0eG4gU2VuZGVyCiAgICA9PQogICAgYXNzZXJ0IC8vIE5vdCBleHBlcmltZW50IG93bmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MzU0CiAgICAvLyBhbW91bnQgPSBzZWxmLl9jaGVja19lc2Nyb3coZnVuZGluZywgYXNzZXRfaWQuYXNfdWludDY0KCkpCiAgICBzd2FwCiAgICBidG9pCiAgICBjYWxsc3ViIF9jaGVja19lc2Nyb3cKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTozNTUKICAgIC8vIGJhbGFuY2UgPSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MzU2CiAgICAvLyBpZiBleHBfaWQgaW4gc2VsZi50cmVhc3VyaWVzOgogICAgYnl0ZWMgNyAvLyAweDc0NzI1ZgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYnogZGVwb3NpdF90cmVhc3VyeV9hZnRlcl9pZl9lbHNlQDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTozNTcKICAgIC8vIHRyZWFzdXJ5ID0gc2VsZi50cmVhc3VyaWVzW2V4cF9pZF0KICAgIGR1cAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudHJlYXN1cmllcyBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTozNTgKICAgIC8vIGFzc2VydCB0cmVhc3VyeS5hc3NldF9pZCA9PSBhc3NldF9pZCwgIldyb25nIGFzc2V0IgogICAgZHVwCiAgICBleHRyYWN0IDAgOAogICAgZGlnIDUKICAgIGI9PQogICAgYXNzZXJ0IC8vIFdyb25nIGFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MzU5CiAgICAvLyBiYWxhbmNlID0gdHJlYXN1cnkuYmFsYW5jZS5hc191aW50NjQoKQogICAgaW50Y18yIC8vIDgKICAgIGV4dHJhY3RfdWludDY0CiAgICBidXJ5IDIKCmRlcG9zaXRfdHJlYXN1cnlfYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjM2MAogICAgLy8gc2VsZi50cmVhc3VyaWVzW2V4cF9pZF0gPSBUcmVhc3VyeShhc3NldF9pZD1hc3NldF9pZCwgYmFsYW5jZT1hcmM0LlVJbnQ2NChiYWxhbmNlICsgYW1vdW50KSkKICAgIGRpZyAxCiAgICBkaWcgMwogICAgZHVwCiAgICBjb3ZlciAyCiAgICArCiAgICBpdG9iCiAgICBkaWcgNQogICAgZGlnIDEKICAgIGNvbmNhdAogICAgZGlnIDMKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTozNjEKICAgIC8vIGFyYzQuZW1pdChUcmVhc3VyeURlcG9zaXRlZChleHBfaWQ9ZXhwX2lkLCBhbW91bnQ9YXJjNC5VSW50NjQoYW1vdW50KSwgYmFsYW5jZT1hcmM0LlVJbnQ2NChiYWxhbmNlICsgYW1vdW50KSkpCiAgICBzd2FwCiAgICBpdG9iCiAgICBkaWcgNgogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIHB1c2hieXRlcyAweGE0NjBkZWNiIC8vIG1ldGhvZCAiVHJlYXN1cnlEZXBvc2l0ZWQodWludDMyLHVpbnQ2NCx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTozNDcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50cnVzdF9leHBlcmltZW50cy5jb250cmFjdC5UcnVzdEV4cGVyaW1lbnRzLndpdGhkcmF3X3RyZWFzdXJ5W3JvdXRpbmddKCkgLT4gdm9pZDoKd2l0aGRyYXdfdHJlYXN1cnk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MzYzCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDQgLy8gNAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50MzIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTozNjUKICAgIC8vIGFzc2VydCBleHBfaWQgaW4gc2VsZi5leHBlcmltZW50cywgIkV4cGVyaW1lbnQgbm90IGZvdW5kIgogICAgYnl0ZWNfMyAvLyAweDY1NWYKICAgIGRpZyAyCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gRXhwZXJpbWVudCBub3QgZm91bmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTozNjYKICAgIC8vIGFzc2VydCBzZWxmLmV4cGVyaW1lbnRzW2V4cF9pZF0ub3duZXIgPT0gYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLCAiTm90IGV4cGVyaW1lbnQgb3duZXIiCiAgICBwdXNoaW50cyA0IDMyIC8vIDQsIDMyCiAgICBib3hfZXh0cmFjdAogICAgdHhuIFNlbmRlcgogICAgPT0KICAgIGFzc2VydCAvLyBOb3QgZXhwZXJpbWVudCBvd25lcgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjM2NwogICAgLy8gYXNzZXJ0IGV4cF9pZCBpbiBzZWxmLnRyZWFzdXJpZXMsICJObyB0cmVhc3VyeSIKICAgIGJ5dGVjIDcgLy8gMHg3NDcyNWYKICAgIGRpZyAyCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gTm8gdHJlYXN1cnkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTozNjgKICAgIC8vIHRyZWFzdXJ5ID0gc2VsZi50cmVhc3VyaWVzW2V4cF9pZF0KICAgIGR1cAogICAgYm94X2dldAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MzY5CiAgICAvLyBhc3NlcnQgdHJlYXN1cnkuYmFsYW5jZS5hc191aW50NjQoKSA+PSBhbW91bnQuYXNfdWludDY0KCksICJJbnN1ZmZpY2llbnQgdHJlYXN1cnkiCiAgICBkdXAKICAgIGludGNfMiAvLyA4CiAgICBleHRyYWN0X3VpbnQ2NAogICAgZGlnIDMKICAgIGJ0b2kKICAgIGR1cDIKICAgID49CiAgICBhc3NlcnQgLy8gSW5zdWZmaWNpZW50IHRyZWFzdXJ5CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MzcwCiAgICAvLyBiYWxhbmNlID0gdHJlYXN1cnkuYmFsYW5jZS5hc191aW50NjQoKSAtIGFtb3VudC5hc191aW50NjQoKQogICAgc3dhcAogICAgZGlnIDEKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTozNzEKICAgIC8vIHNlbGYudHJlYXN1cmllc1tleHBfaWRdID0gVHJlYXN1cnkoYXNzZXRfaWQ9dHJlYXN1cnkuYXNzZXRfaWQsIGJhbGFuY2U9YXJjNC5VSW50NjQoYmFsYW5jZSkpCiAgICBkaWcgMgogICAgZXh0cmFjdCAwIDgKICAgIHN3YXAKICAgIGl0b2IKICAgIHN3YXAKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIHVuY292ZXIgNAogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjM3MgogICAgLy8gc2VsZi5fc2VuZF9mdW5kcyhUeG4uc2VuZGVyLCB0cmVhc3VyeS5hc3NldF9pZC5hc191aW50NjQoKSwgYW1vdW50LmFzX3VpbnQ2NCgpKQogICAgdHhuIFNlbmRlcgogICAgdW5jb3ZlciAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MzcxCiAgICAvLyBzZWxmLnRyZWFzdXJpZXNbZXhwX2lkXSA9IFRyZWFzdXJ5KGFzc2V0X2lkPXRyZWFzdXJ5LmFzc2V0X2lkLCBiYWxhbmNlPWFyYzQuVUludDY0KGJhbGFuY2UpKQogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTozNzIKICAgIC8vIHNlbGYuX3NlbmRfZnVuZHMoVHhuLnNlbmRlciwgdHJlYXN1cnkuYXNzZXRfaWQuYXNfdWludDY0KCksIGFtb3VudC5hc191aW50NjQoKSkKICAgIGV4dHJhY3RfdWludDY0CiAgICB1bmNvdmVyIDMKICAgIGNhbGxzdWIgX3NlbmRfZnVuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTozNzMKICAgIC8vIGFyYzQuZW1pdChUcmVhc3VyeVdpdGhkcmF3bihleHBfaWQ9ZXhwX2lkLCBhbW91bnQ9YW1vdW50LCBiYWxhbmNlPWFyYzQuVUludDY0KGJhbGFuY2UpKSkKICAgIGNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBwdXNoYnl0ZXMgMHgxOGI0ZTI1NiAvLyBtZXRob2QgIlRyZWFzdXJ5V2l0aGRyYXduKHVpbnQzMix1aW50NjQsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MzYzCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMudHJ1c3RfZXhwZXJpbWVudHMuY29udHJhY3QuVHJ1c3RFeHBlcmltZW50cy5jcmVhdGVfdHJlYXN1cnlfdmFyaWF0aW9uW3JvdXRpbmddKCkgLT4gdm9pZDoKY3JlYXRlX3RyZWFzdXJ5X3ZhcmlhdGlvbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTozNzUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwbiAyCiAgICBsZW4KICAgIHB1c2hpbnQgNCAvLyA0CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQzMgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBkdXAKICAgIGxlbgogICAgZGlnIDEKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCB0dXBsZSBlbmNvZGluZwogICAgZHVwCiAgICBwdXNoaW50IDU4IC8vIDU4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgdGFpbCBwb2ludGVyIGF0IGluZGV4IDAgb2YgKChsZW4rdXRmOFtdKSx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQpCiAgICBkaWcgMgogICAgc3dhcAogICAgZGlnIDIKICAgIHN1YnN0cmluZzMKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBwdXNoaW50IDYwIC8vIDYwCiAgICArCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBzbWFydF9jb250cmFjdHMuc2hhcmVkLnR5cGVzLlZhcmlhdGlvblBhcmFtcwogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6Mzg3CiAgICAvLyBhc3NlcnQgZXhwX2lkIGluIHNlbGYuZXhwZXJpbWVudHMsICJFeHBlcmltZW50IG5vdCBmb3VuZCIKICAgIGJ5dGVjXzMgLy8gMHg2NTVmCiAgICBkaWcgMwogICAgY29uY2F0CiAgICBkdXAKICAgIGNvdmVyIDQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gRXhwZXJpbWVudCBub3QgZm91bmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTozODgKICAgIC8vIGV4cGVyaW1lbnQgPSBzZWxmLmV4cGVyaW1lbnRzW2V4cF9pZF0uY29weSgpCiAgICBkdXAKICAgIGJveF9nZXQKICAgIHBvcAogICAgY292ZXIgNAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjM4OC0zODkKICAgIC8vIGV4cGVyaW1lbnQgPSBzZWxmLmV4cGVyaW1lbnRzW2V4cF9pZF0uY29weSgpCiAgICAvLyBhc3NlcnQgZXhwZXJpbWVudC5vd25lciA9PSBhcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksICJOb3QgZXhwZXJpbWVudCBvd25lciIKICAgIHB1c2hpbnRzIDQgMzIgLy8gNCwgMzIKICAgIGJveF9leHRyYWN0CiAgICBkdXAKICAgIGNvdmVyIDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTozODkKICAgIC8vIGFzc2VydCBleHBlcmltZW50Lm93bmVyID09IGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwgIk5vdCBleHBlcmltZW50IG93bmVyIgogICAgdHhuIFNlbmRlcgogICAgPT0KICAgIGFzc2VydCAvLyBOb3QgZXhwZXJpbWVudCBvd25lcgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjM5MAogICAgLy8gYXNzZXJ0IHNlbGYudHZfcmVhZHkudmFsdWUgPT0gVUludDY0KDEpLCAiVHJ1c3RWYXJpYXRpb24gcHJvZ3JhbSBub3Qgc2V0IgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gInR2X3JlYWR5IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnR2X3JlYWR5IGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBhc3NlcnQgLy8gVHJ1c3RWYXJpYXRpb24gcHJvZ3JhbSBub3Qgc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MzkxCiAgICAvLyBhc3NlcnQgZXhwX2lkIGluIHNlbGYudHJlYXN1cmllcywgIk5vIHRyZWFzdXJ5IgogICAgYnl0ZWMgNyAvLyAweDc0NzI1ZgogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gTm8gdHJlYXN1cnkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTozOTIKICAgIC8vIGFzc2VydCBzZWxmLnRyZWFzdXJpZXNbZXhwX2lkXS5hc3NldF9pZCA9PSBwYXJhbXMuYXNzZXRfaWQsICJXcm9uZyBhc3NldCIKICAgIGJveF9nZXQKICAgIHBvcAogICAgZXh0cmFjdCAwIDgKICAgIGRpZyAyCiAgICBleHRyYWN0IDM0IDgKICAgIGI9PQogICAgYXNzZXJ0IC8vIFdyb25nIGFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MzkzCiAgICAvLyBhc3NlcnQgcGFyYW1zLmVzY3Jvdy5hc191aW50NjQoKSA9PSBVSW50NjQoMCksICJUcmVhc3VyeSB2YXJpYXRpb25zIGhvbGQgbm8gZXNjcm93IgogICAgZGlnIDEKICAgIHB1c2hpbnQgNTAgLy8gNTAKICAgIGV4dHJhY3RfdWludDY0CiAgICAhCiAgICBhc3NlcnQgLy8gVHJlYXN1cnkgdmFyaWF0aW9ucyBob2xkIG5vIGVzY3JvdwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjM5NQogICAgLy8gYXNzZXJ0IG1icl9wYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsICJXcm9uZyBNQlIgcmVjZWl2ZXIiCiAgICBkdXAKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBXcm9uZyBNQlIgcmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTozOTYKICAgIC8vIGFzc2VydCBtYnJfcGF5bWVudC5hbW91bnQgPj0gc2VsZi5fdmFyaWF0aW9uX21icihwYXJhbXMuYXNzZXRfaWQuYXNfdWludDY0KCkpLCAiSW5zdWZmaWNpZW50IE1CUiIKICAgIGd0eG5zIEFtb3VudAogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjM5MgogICAgLy8gYXNzZXJ0IHNlbGYudHJlYXN1cmllc1tleHBfaWRdLmFzc2V0X2lkID09IHBhcmFtcy5hc3NldF9pZCwgIldyb25nIGFzc2V0IgogICAgcHVzaGludCAzNCAvLyAzNAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjM5NgogICAgLy8gYXNzZXJ0IG1icl9wYXltZW50LmFtb3VudCA+PSBzZWxmLl92YXJpYXRpb25fbWJyKHBhcmFtcy5hc3NldF9pZC5hc191aW50NjQoKSksICJJbnN1ZmZpY2llbnQgTUJSIgogICAgZXh0cmFjdF91aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo0ODcKICAgIC8vIGlmIGFzc2V0X2lkID09IFVJbnQ2NCgwKToKICAgIGJueiBjcmVhdGVfdHJlYXN1cnlfdmFyaWF0aW9uX2FmdGVyX2lmX2Vsc2VAMwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjQ4OAogICAgLy8gcmV0dXJuIFVJbnQ2NChfVkFSX0FQUF9NQlJfQUxHTykKICAgIGludGMgNSAvLyAxMDAwMDAKCmNyZWF0ZV90cmVhc3VyeV92YXJpYXRpb25fYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMudHJ1c3RfZXhwZXJpbWVudHMuY29udHJhY3QuVHJ1c3RFeHBlcmltZW50cy5fdmFyaWF0aW9uX21ickA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjM5NgogICAgLy8gYXNzZXJ0IG1icl9wYXltZW50LmFtb3VudCA+PSBzZWxmLl92YXJpYXRpb25fbWJyKHBhcmFtcy5hc3NldF9pZC5hc191aW50NjQoKSksICJJbnN1ZmZpY2llbnQgTUJSIgogICAgZGlnIDEKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICA+PQogICAgYXNzZXJ0IC8vIEluc3VmZmljaWVudCBNQlIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTozOTgKICAgIC8vIHZhcl9pZCA9IGFyYzQuVUludDMyKGV4cGVyaW1lbnQudmFyaWF0aW9uX2NvdW50LmFzX3VpbnQ2NCgpKQogICAgZGlnIDQKICAgIGR1cAogICAgcHVzaGludCA0NiAvLyA0NgogICAgaW50Y18yIC8vIDgKICAgIGJveF9leHRyYWN0CiAgICBidG9pCiAgICBkdXAKICAgIGl0b2IKICAgIGR1cAogICAgYml0bGVuCiAgICBwdXNoaW50IDMyIC8vIDMyCiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDQgNAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjM5OQogICAgLy8gbmV3X2FwcF9pZCA9IHNlbGYuX3NwYXduX3ZhcmlhdGlvbihleHBfaWQsIHZhcl9pZCwgcGFyYW1zLCBtYnJfcGF5bWVudC5hbW91bnQsIHRyZWFzdXJ5X2Z1bmRlZD1UcnVlKQogICAgZGlnIDkKICAgIHN3YXAKICAgIGRpZyA5CiAgICB1bmNvdmVyIDUKICAgIGludGNfMSAvLyAxCiAgICBjYWxsc3ViIF9zcGF3bl92YXJpYXRpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo0MDIKICAgIC8vIGV4cF9pZD1leHBlcmltZW50LmV4cF9pZCwKICAgIGRpZyAyCiAgICBpbnRjXzAgLy8gMAogICAgcHVzaGludCA0IC8vIDQKICAgIGJveF9leHRyYWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NDA0CiAgICAvLyBuYW1lPWV4cGVyaW1lbnQubmFtZSwKICAgIGRpZyA2CiAgICBkdXAKICAgIHB1c2hpbnQgMzYgLy8gMzYKICAgIGV4dHJhY3RfdWludDE2CiAgICBkaWcgMQogICAgbGVuCiAgICBzdWJzdHJpbmczCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NDA1CiAgICAvLyBjcmVhdGVkX2F0PWV4cGVyaW1lbnQuY3JlYXRlZF9hdCwKICAgIGRpZyA0CiAgICBwdXNoaW50IDM4IC8vIDM4CiAgICBpbnRjXzIgLy8gOAogICAgYm94X2V4dHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo0MDYKICAgIC8vIHZhcmlhdGlvbl9jb3VudD1hcmM0LlVJbnQ2NChleHBlcmltZW50LnZhcmlhdGlvbl9jb3VudC5hc191aW50NjQoKSArIFVJbnQ2NCgxKSksCiAgICB1bmNvdmVyIDQKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NDAxLTQwNwogICAgLy8gc2VsZi5leHBlcmltZW50c1tleHBfaWRdID0gRXhwZXJpbWVudEdyb3VwKAogICAgLy8gICAgIGV4cF9pZD1leHBlcmltZW50LmV4cF9pZCwKICAgIC8vICAgICBvd25lcj1leHBlcmltZW50Lm93bmVyLmNvcHkoKSwKICAgIC8vICAgICBuYW1lPWV4cGVyaW1lbnQubmFtZSwKICAgIC8vICAgICBjcmVhdGVkX2F0PWV4cGVyaW1lbnQuY3JlYXRlZF9hdCwKICAgIC8vICAgICB2YXJpYXRpb25fY291bnQ9YXJjNC5VSW50NjQoZXhwZXJpbWVudC52YXJpYXRpb25fY291bnQuYXNfdWludDY0KCkgKyBVSW50NjQoMSkpLAogICAgLy8gKQogICAgdW5jb3ZlciAzCiAgICBkaWcgNwogICAgY29uY2F0CiAgICBieXRlYyA2IC8vIDB4MDAzNgogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGRpZyAyCiAgICBib3hfZGVsCiAgICBwb3AKICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjM3NQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBieXRlY18yIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgpjcmVhdGVfdHJlYXN1cnlfdmFyaWF0aW9uX2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo0ODkKICAgIC8vIHJldHVybiBVSW50NjQoX1ZBUl9BUFBfTUJSX0FTQSkKICAgIGludGMgNyAvLyAyMDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTozOTYKICAgIC8vIGFzc2VydCBtYnJfcGF5bWVudC5hbW91bnQgPj0gc2VsZi5fdmFyaWF0aW9uX21icihwYXJhbXMuYXNzZXRfaWQuYXNfdWludDY0KCkpLCAiSW5zdWZmaWNpZW50IE1CUiIKICAgIGIgY3JlYXRlX3RyZWFzdXJ5X3ZhcmlhdGlvbl9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy50cnVzdF9leHBlcmltZW50cy5jb250cmFjdC5UcnVzdEV4cGVyaW1lbnRzLl92YXJpYXRpb25fbWJyQDQKCgovLyBzbWFydF9jb250cmFjdHMudHJ1c3RfZXhwZXJpbWVudHMuY29udHJhY3QuVHJ1c3RFeHBlcmltZW50cy5kcmF3X2VzY3Jvd1tyb3V0aW5nXSgpIC0+IHZvaWQ6CmRyYXdfZXNjcm93OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjQxMAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCA0IC8vIDQKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDMyCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCA0IC8vIDQKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDMyCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NDE2CiAgICAvLyBrZXkgPSBhcmM0LlVJbnQ2NChleHBfaWQuYXNfdWludDY0KCkgKiBVSW50NjQoNDI5NDk2NzI5NikgKyB2YXJfaWQuYXNfdWludDY0KCkpCiAgICBkaWcgMgogICAgYnRvaQogICAgaW50YyA4IC8vIDQyOTQ5NjcyOTYKICAgICoKICAgIHVuY292ZXIgMgogICAgYnRvaQogICAgKwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjQxNwogICAgLy8gYXNzZXJ0IGtleSBpbiBzZWxmLnZhcmlhdGlvbnMsICJWYXJpYXRpb24gbm90IGZvdW5kIgogICAgYnl0ZWMgOCAvLyAweDc2NWYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBWYXJpYXRpb24gbm90IGZvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NDE4CiAgICAvLyB2YXJpYXRpb25fYXBwID0gc2VsZi52YXJpYXRpb25zW2tleV0uYXBwX2lkLmFzX3VpbnQ2NCgpCiAgICBwdXNoaW50IDQgLy8gNAogICAgaW50Y18yIC8vIDgKICAgIGJveF9leHRyYWN0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NDE5CiAgICAvLyBhc3NlcnQgR2xvYmFsLmNhbGxlcl9hcHBsaWNhdGlvbl9pZCA9PSB2YXJpYXRpb25fYXBwLCAiTm90IHRoZSB2YXJpYXRpb24gYXBwIgogICAgZ2xvYmFsIENhbGxlckFwcGxpY2F0aW9uSUQKICAgIGRpZyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIE5vdCB0aGUgdmFyaWF0aW9uIGFwcAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjQyMAogICAgLy8gYXNzZXJ0IGV4cF9pZCBpbiBzZWxmLnRyZWFzdXJpZXMsICJObyB0cmVhc3VyeSIKICAgIGJ5dGVjIDcgLy8gMHg3NDcyNWYKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIE5vIHRyZWFzdXJ5CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NDIxCiAgICAvLyB0cmVhc3VyeSA9IHNlbGYudHJlYXN1cmllc1tleHBfaWRdCiAgICBkdXAKICAgIGJveF9nZXQKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjQyMgogICAgLy8gYXNzZXJ0IHRyZWFzdXJ5LmJhbGFuY2UuYXNfdWludDY0KCkgPj0gYW1vdW50LmFzX3VpbnQ2NCgpLCAiSW5zdWZmaWNpZW50IHRyZWFzdXJ5IgogICAgZHVwCiAgICBpbnRjXzIgLy8gOAogICAgZXh0cmFjdF91aW50NjQKICAgIHVuY292ZXIgNAogICAgYnRvaQogICAgZHVwMgogICAgPj0KICAgIGFzc2VydCAvLyBJbnN1ZmZpY2llbnQgdHJlYXN1cnkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo0MjQKICAgIC8vIGFzc2V0X2lkPXRyZWFzdXJ5LmFzc2V0X2lkLAogICAgZGlnIDIKICAgIGV4dHJhY3QgMCA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NDI1CiAgICAvLyBiYWxhbmNlPWFyYzQuVUludDY0KHRyZWFzdXJ5LmJhbGFuY2UuYXNfdWludDY0KCkgLSBhbW91bnQuYXNfdWludDY0KCkpLAogICAgdW5jb3ZlciAyCiAgICBkaWcgMgogICAgLQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjQyMy00MjYKICAgIC8vIHNlbGYudHJlYXN1cmllc1tleHBfaWRdID0gVHJlYXN1cnkoCiAgICAvLyAgICAgYXNzZXRfaWQ9dHJlYXN1cnkuYXNzZXRfaWQsCiAgICAvLyAgICAgYmFsYW5jZT1hcmM0LlVJbnQ2NCh0cmVhc3VyeS5iYWxhbmNlLmFzX3VpbnQ2NCgpIC0gYW1vdW50LmFzX3VpbnQ2NCgpKSwKICAgIC8vICkKICAgIGNvbmNhdAogICAgdW5jb3ZlciAzCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NDI3CiAgICAvLyBzZWxmLl9zZW5kX2Z1bmRzKEFwcGxpY2F0aW9uKHZhcmlhdGlvbl9hcHApLmFkZHJlc3MsIHRyZWFzdXJ5LmFzc2V0X2lkLmFzX3VpbnQ2NCgpLCBhbW91bnQuYXNfdWludDY0KCkpCiAgICB1bmNvdmVyIDIKICAgIGFwcF9wYXJhbXNfZ2V0IEFwcEFkZHJlc3MKICAgIGFzc2VydCAvLyBhcHBsaWNhdGlvbiBleGlzdHMKICAgIHVuY292ZXIgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjQyNAogICAgLy8gYXNzZXRfaWQ9dHJlYXN1cnkuYXNzZXRfaWQsCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjQyNwogICAgLy8gc2VsZi5fc2VuZF9mdW5kcyhBcHBsaWNhdGlvbih2YXJpYXRpb25fYXBwKS5hZGRyZXNzLCB0cmVhc3VyeS5hc3NldF9pZC5hc191aW50NjQoKSwgYW1vdW50LmFzX3VpbnQ2NCgpKQogICAgZXh0cmFjdF91aW50NjQKICAgIHVuY292ZXIgMgogICAgY2FsbHN1YiBfc2VuZF9mdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjQxMAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnRydXN0X2V4cGVyaW1lbnRzLmNvbnRyYWN0LlRydXN0RXhwZXJpbWVudHMuY3JlYXRlX2V4cGVyaW1lbnRfd2l0aF92YXJpYXRpb25bcm91dGluZ10oKSAtPiB2b2lkOgpjcmVhdGVfZXhwZXJpbWVudF93aXRoX3ZhcmlhdGlvbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo0MjkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwbiAyCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgaW50Y18zIC8vIDIKICAgICsKICAgIHN3YXAKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXBuIDIKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgc3dhcAogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50OD4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDQKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDUKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDYKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDcKICAgIGR1cG4gMgogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDgKICAgIGR1cAogICAgY292ZXIgMgogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzMgLy8gMgogICAgLQogICAgZHVwCiAgICBjb3ZlciAyCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo0NDMKICAgIC8vIGFzc2VydCBzZWxmLnR2X3JlYWR5LnZhbHVlID09IFVJbnQ2NCgxKSwgIlRydXN0VmFyaWF0aW9uIHByb2dyYW0gbm90IHNldCIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0IC8vICJ0dl9yZWFkeSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50dl9yZWFkeSBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIFRydXN0VmFyaWF0aW9uIHByb2dyYW0gbm90IHNldAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjQ0NS00NDYKICAgIC8vICMgTUJSIGxlZyBmdW5kcyB0aGUgbmV3IHZhcmlhdGlvbiBhcHAncyBhY2NvdW50OyBhbHdheXMgQUxHTy4KICAgIC8vIGFzc2VydCBtYnJfcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLCAiV3JvbmcgTUJSIHJlY2VpdmVyIgogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIFdyb25nIE1CUiByZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjQ0NwogICAgLy8gaWYgYXNzZXRfaWQuYXNfdWludDY0KCkgPT0gVUludDY0KDApOgogICAgYnRvaQogICAgZHVwCiAgICBibnogY3JlYXRlX2V4cGVyaW1lbnRfd2l0aF92YXJpYXRpb25fZWxzZV9ib2R5QDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo0NDgKICAgIC8vIGFzc2VydCBtYnJfcGF5bWVudC5hbW91bnQgPj0gVUludDY0KF9WQVJfQVBQX01CUl9BTEdPKSwgIk1CUiBtdXN0IGJlID49IDAuMSBBTEdPIgogICAgZGlnIDIKICAgIGd0eG5zIEFtb3VudAogICAgaW50YyA1IC8vIDEwMDAwMAogICAgPj0KICAgIGFzc2VydCAvLyBNQlIgbXVzdCBiZSA+PSAwLjEgQUxHTwoKY3JlYXRlX2V4cGVyaW1lbnRfd2l0aF92YXJpYXRpb25fYWZ0ZXJfaWZfZWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjQ1MgogICAgLy8gZXNjcm93X2Ftb3VudCA9IHNlbGYuX2NoZWNrX2VzY3Jvdyhlc2Nyb3dfZnVuZGluZywgYXNzZXRfaWQuYXNfdWludDY0KCkpCiAgICBkdXAyCiAgICBjYWxsc3ViIF9jaGVja19lc2Nyb3cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo0NTQtNDU1CiAgICAvLyAjIENyZWF0ZSB0aGUgZXhwZXJpbWVudCBncm91cAogICAgLy8gZXhwX2lkID0gYXJjNC5VSW50MzIoc2VsZi5leHBlcmltZW50X2NvdW50LnZhbHVlKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDUgLy8gImV4cGVyaW1lbnRfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZXhwZXJpbWVudF9jb3VudCBleGlzdHMKICAgIGR1cAogICAgaXRvYgogICAgZHVwCiAgICBiaXRsZW4KICAgIHB1c2hpbnQgMzIgLy8gMzIKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGV4dHJhY3QgNCA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NDU2CiAgICAvLyBzZWxmLmV4cGVyaW1lbnRfY291bnQudmFsdWUgKz0gVUludDY0KDEpCiAgICBzd2FwCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnl0ZWMgNSAvLyAiZXhwZXJpbWVudF9jb3VudCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NDU3CiAgICAvLyBjcmVhdGVkX2F0ID0gYXJjNC5VSW50NjQoR2xvYmFsLmxhdGVzdF90aW1lc3RhbXApCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NDU4CiAgICAvLyBzZWxmLl9pbmRleF9vd25lcl9leHBlcmltZW50KGV4cF9pZCkKICAgIGRpZyAxCiAgICBjYWxsc3ViIF9pbmRleF9vd25lcl9leHBlcmltZW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NDYwCiAgICAvLyBhcmM0LmVtaXQoRXhwZXJpbWVudENyZWF0ZWQoZXhwX2lkPWV4cF9pZCwgb3duZXI9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpKSkKICAgIGRpZyAxCiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIGJ5dGVjIDE0IC8vIG1ldGhvZCAiRXhwZXJpbWVudENyZWF0ZWQodWludDMyLGFkZHJlc3MpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo0NzEKICAgIC8vIGVzY3Jvdz1hcmM0LlVJbnQ2NChlc2Nyb3dfYW1vdW50KSwKICAgIHVuY292ZXIgMgogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjQ2Mi00NzIKICAgIC8vICMgQ3JlYXRlIHRoZSBmaXJzdCB2YXJpYXRpb24gKHZhcl9pZCA9IDApCiAgICAvLyBwYXJhbXMgPSBWYXJpYXRpb25QYXJhbXMoCiAgICAvLyAgICAgbGFiZWw9bGFiZWwsCiAgICAvLyAgICAgZTE9ZTEsCiAgICAvLyAgICAgZTI9ZTIsCiAgICAvLyAgICAgbXVsdGlwbGllcj1tdWx0aXBsaWVyLAogICAgLy8gICAgIHVuaXQ9dW5pdCwKICAgIC8vICAgICBhc3NldF9pZD1hc3NldF9pZCwKICAgIC8vICAgICBtYXhfcGFydGljaXBhbnRzPW1heF9wYXJ0aWNpcGFudHMsCiAgICAvLyAgICAgZXNjcm93PWFyYzQuVUludDY0KGVzY3Jvd19hbW91bnQpLAogICAgLy8gKQogICAgYnl0ZWMgMTUgLy8gMHgwMDNhCiAgICBkaWcgMTIKICAgIGNvbmNhdAogICAgZGlnIDExCiAgICBjb25jYXQKICAgIGRpZyAxMAogICAgY29uY2F0CiAgICBkaWcgOQogICAgY29uY2F0CiAgICBkaWcgOAogICAgY29uY2F0CiAgICBkaWcgNwogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGRpZyAxMgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NDczCiAgICAvLyBuZXdfYXBwX2lkID0gc2VsZi5fc3Bhd25fdmFyaWF0aW9uKGV4cF9pZCwgYXJjNC5VSW50MzIoMCksIHBhcmFtcywgbWJyX3BheW1lbnQuYW1vdW50LCB0cmVhc3VyeV9mdW5kZWQ9RmFsc2UpCiAgICBkaWcgNQogICAgZ3R4bnMgQW1vdW50CiAgICBkaWcgMwogICAgcHVzaGJ5dGVzIDB4MDAwMDAwMDAKICAgIHVuY292ZXIgMwogICAgdW5jb3ZlciAzCiAgICBpbnRjXzAgLy8gMAogICAgY2FsbHN1YiBfc3Bhd25fdmFyaWF0aW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NDc1LTQ4MQogICAgLy8gc2VsZi5leHBlcmltZW50c1tleHBfaWRdID0gRXhwZXJpbWVudEdyb3VwKAogICAgLy8gICAgIGV4cF9pZD1leHBfaWQsCiAgICAvLyAgICAgb3duZXI9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgIG5hbWU9bmFtZSwKICAgIC8vICAgICBjcmVhdGVkX2F0PWNyZWF0ZWRfYXQsCiAgICAvLyAgICAgdmFyaWF0aW9uX2NvdW50PWFyYzQuVUludDY0KDEpLAogICAgLy8gKQogICAgZGlnIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo0NzcKICAgIC8vIG93bmVyPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo0NzUtNDgxCiAgICAvLyBzZWxmLmV4cGVyaW1lbnRzW2V4cF9pZF0gPSBFeHBlcmltZW50R3JvdXAoCiAgICAvLyAgICAgZXhwX2lkPWV4cF9pZCwKICAgIC8vICAgICBvd25lcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgbmFtZT1uYW1lLAogICAgLy8gICAgIGNyZWF0ZWRfYXQ9Y3JlYXRlZF9hdCwKICAgIC8vICAgICB2YXJpYXRpb25fY291bnQ9YXJjNC5VSW50NjQoMSksCiAgICAvLyApCiAgICBjb25jYXQKICAgIGJ5dGVjIDYgLy8gMHgwMDM2CiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NDgwCiAgICAvLyB2YXJpYXRpb25fY291bnQ9YXJjNC5VSW50NjQoMSksCiAgICBwdXNoYnl0ZXMgMHgwMDAwMDAwMDAwMDAwMDAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NDc1LTQ4MQogICAgLy8gc2VsZi5leHBlcmltZW50c1tleHBfaWRdID0gRXhwZXJpbWVudEdyb3VwKAogICAgLy8gICAgIGV4cF9pZD1leHBfaWQsCiAgICAvLyAgICAgb3duZXI9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgIG5hbWU9bmFtZSwKICAgIC8vICAgICBjcmVhdGVkX2F0PWNyZWF0ZWRfYXQsCiAgICAvLyAgICAgdmFyaWF0aW9uX2NvdW50PWFyYzQuVUludDY0KDEpLAogICAgLy8gKQogICAgY29uY2F0CiAgICBkaWcgMTMKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjQ3NQogICAgLy8gc2VsZi5leHBlcmltZW50c1tleHBfaWRdID0gRXhwZXJpbWVudEdyb3VwKAogICAgYnl0ZWNfMyAvLyAweDY1NWYKICAgIGRpZyAzCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo0NzUtNDgxCiAgICAvLyBzZWxmLmV4cGVyaW1lbnRzW2V4cF9pZF0gPSBFeHBlcmltZW50R3JvdXAoCiAgICAvLyAgICAgZXhwX2lkPWV4cF9pZCwKICAgIC8vICAgICBvd25lcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgbmFtZT1uYW1lLAogICAgLy8gICAgIGNyZWF0ZWRfYXQ9Y3JlYXRlZF9hdCwKICAgIC8vICAgICB2YXJpYXRpb25fY291bnQ9YXJjNC5VSW50NjQoMSksCiAgICAvLyApCiAgICBkdXAKICAgIGJveF9kZWwKICAgIHBvcAogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjQyOQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjb25jYXQKICAgIGJ5dGVjXzIgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCmNyZWF0ZV9leHBlcmltZW50X3dpdGhfdmFyaWF0aW9uX2Vsc2VfYm9keUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjQ1MAogICAgLy8gYXNzZXJ0IG1icl9wYXltZW50LmFtb3VudCA+PSBVSW50NjQoX1ZBUl9BUFBfTUJSX0FTQSksICJNQlIgbXVzdCBiZSA+PSAwLjIgQUxHTyIKICAgIGRpZyAyCiAgICBndHhucyBBbW91bnQKICAgIGludGMgNyAvLyAyMDAwMDAKICAgID49CiAgICBhc3NlcnQgLy8gTUJSIG11c3QgYmUgPj0gMC4yIEFMR08KICAgIGIgY3JlYXRlX2V4cGVyaW1lbnRfd2l0aF92YXJpYXRpb25fYWZ0ZXJfaWZfZWxzZUA0CgoKLy8gc21hcnRfY29udHJhY3RzLnRydXN0X2V4cGVyaW1lbnRzLmNvbnRyYWN0LlRydXN0RXhwZXJpbWVudHMuZ2V0X2V4cGVyaW1lbnRbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfZXhwZXJpbWVudDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo2MTYKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgNCAvLyA0CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQzMgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjYxOAogICAgLy8gYXNzZXJ0IGV4cF9pZCBpbiBzZWxmLmV4cGVyaW1lbnRzLCAiRXhwZXJpbWVudCBub3QgZm91bmQiCiAgICBieXRlY18zIC8vIDB4NjU1ZgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIEV4cGVyaW1lbnQgbm90IGZvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NjE5CiAgICAvLyByZXR1cm4gc2VsZi5leHBlcmltZW50c1tleHBfaWRdCiAgICBib3hfZ2V0CiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo2MTYKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWNfMiAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50cnVzdF9leHBlcmltZW50cy5jb250cmFjdC5UcnVzdEV4cGVyaW1lbnRzLmdldF9leHBlcmltZW50c19ieV9vd25lcltyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9leHBlcmltZW50c19ieV9vd25lcjoKICAgIGludGNfMCAvLyAwCiAgICBwdXNoYnl0ZXMgIiIKICAgIGR1cG4gMwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjYyMQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCAzMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGxlbgogICAgcHVzaGludCA0IC8vIDQKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDMyCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGxlbgogICAgcHVzaGludCA0IC8vIDQKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDMyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NjI5CiAgICAvLyBwYWdlID0gYXJjNC5EeW5hbWljQXJyYXlbRXhwZXJpbWVudEdyb3VwXSgpCiAgICBieXRlYyAxMiAvLyAweDAwMDAKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo2MzAKICAgIC8vIGlmIG93bmVyIG5vdCBpbiBzZWxmLm93bmVyX2V4cGVyaW1lbnRzOgogICAgYnl0ZWMgOSAvLyAweDZmNjU1ZgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYm56IGdldF9leHBlcmltZW50c19ieV9vd25lcl9hZnRlcl9pZl9lbHNlQDMKICAgIGRpZyAxCgpnZXRfZXhwZXJpbWVudHNfYnlfb3duZXJfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMudHJ1c3RfZXhwZXJpbWVudHMuY29udHJhY3QuVHJ1c3RFeHBlcmltZW50cy5nZXRfZXhwZXJpbWVudHNfYnlfb3duZXJAMTI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NjIxCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzIgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCmdldF9leHBlcmltZW50c19ieV9vd25lcl9hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NjM0CiAgICAvLyBlbmQgPSBzdGFydC5hc191aW50NjQoKSArIGNvdW50LmFzX3VpbnQ2NCgpCiAgICBkaWcgMwogICAgYnRvaQogICAgZHVwCiAgICBidXJ5IDYKICAgIGRpZyAzCiAgICBidG9pCiAgICArCiAgICBkdXAKICAgIGJ1cnkgOQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjYzNQogICAgLy8gaWYgZW5kID4gZXhwX2lkcy5sZW5ndGg6CiAgICBkaWcgMQogICAgaW50Y18wIC8vIDAKICAgIGludGNfMyAvLyAyCiAgICBib3hfZXh0cmFjdAogICAgYnRvaQogICAgPgogICAgYnogZ2V0X2V4cGVyaW1lbnRzX2J5X293bmVyX2FmdGVyX2lmX2Vsc2VANQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjYzNgogICAgLy8gZW5kID0gZXhwX2lkcy5sZW5ndGgKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGludGNfMyAvLyAyCiAgICBib3hfZXh0cmFjdAogICAgYnRvaQogICAgYnVyeSA4CgpnZXRfZXhwZXJpbWVudHNfYnlfb3duZXJfYWZ0ZXJfaWZfZWxzZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjYzOAogICAgLy8gc2l6ZSA9IFVJbnQ2NCgyKSAgIyBhcnJheSBsZW5ndGggcHJlZml4CiAgICBpbnRjXzMgLy8gMgogICAgYnVyeSA2CiAgICBkaWcgNAogICAgYnVyeSA3CgpnZXRfZXhwZXJpbWVudHNfYnlfb3duZXJfZm9yX2hlYWRlckA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjYzOQogICAgLy8gZm9yIGkgaW4gdXJhbmdlKHN0YXJ0LmFzX3VpbnQ2NCgpLCBlbmQpOgogICAgZGlnIDYKICAgIGRpZyA4CiAgICA8CiAgICBieiBnZXRfZXhwZXJpbWVudHNfYnlfb3duZXJfYWZ0ZXJfZm9yQDExCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NjQwCiAgICAvLyBleHBlcmltZW50ID0gc2VsZi5leHBlcmltZW50c1tleHBfaWRzW2ldXQogICAgZGlnIDYKICAgIHB1c2hpbnQgNCAvLyA0CiAgICAqCiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgZGlnIDEKICAgIHN3YXAKICAgIHB1c2hpbnQgNCAvLyA0CiAgICBib3hfZXh0cmFjdAogICAgYnl0ZWNfMyAvLyAweDY1NWYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgc3dhcAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBidXJ5IDExCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5leHBlcmltZW50cyBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo2NDEKICAgIC8vIHNpemUgKz0gZXhwZXJpbWVudC5ieXRlcy5sZW5ndGggKyBVSW50NjQoMikgICMgZWxlbWVudCArIGl0cyBoZWFkIG9mZnNldAogICAgbGVuCiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgZGlnIDYKICAgICsKICAgIGR1cAogICAgYnVyeSA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NjQyCiAgICAvLyBpZiBzaXplID4gVUludDY0KF9SRVRVUk5fUEFHRV9CWVRFUyk6CiAgICBwdXNoaW50IDEwMjAgLy8gMTAyMAogICAgPgogICAgYm56IGdldF9leHBlcmltZW50c19ieV9vd25lcl9hZnRlcl9mb3JAMTEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo2NDQKICAgIC8vIHBhZ2UuYXBwZW5kKGV4cGVyaW1lbnQpCiAgICBkaWcgMQogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIHN3YXAKICAgIGV4dHJhY3QgMiAwCiAgICBieXRlYyAxNiAvLyAweDAwMDIKICAgIGRpZyAxMQogICAgY29uY2F0CiAgICBjb3ZlciAyCiAgICBpbnRjXzEgLy8gMQogICAgdW5jb3ZlciAzCiAgICBjYWxsc3ViIGR5bmFtaWNfYXJyYXlfY29uY2F0X2R5bmFtaWNfZWxlbWVudAogICAgYnVyeSAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NjM5CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2Uoc3RhcnQuYXNfdWludDY0KCksIGVuZCk6CiAgICBkaWcgNgogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ1cnkgNwogICAgYiBnZXRfZXhwZXJpbWVudHNfYnlfb3duZXJfZm9yX2hlYWRlckA2CgpnZXRfZXhwZXJpbWVudHNfYnlfb3duZXJfYWZ0ZXJfZm9yQDExOgogICAgZGlnIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo2MjEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYiBnZXRfZXhwZXJpbWVudHNfYnlfb3duZXJfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMudHJ1c3RfZXhwZXJpbWVudHMuY29udHJhY3QuVHJ1c3RFeHBlcmltZW50cy5nZXRfZXhwZXJpbWVudHNfYnlfb3duZXJAMTIKCgovLyBzbWFydF9jb250cmFjdHMudHJ1c3RfZXhwZXJpbWVudHMuY29udHJhY3QuVHJ1c3RFeHBlcmltZW50cy5nZXRfdHJlYXN1cnlbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfdHJlYXN1cnk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NjQ3CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDQgLy8gNAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50MzIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo2NDkKICAgIC8vIGFzc2VydCBleHBfaWQgaW4gc2VsZi50cmVhc3VyaWVzLCAiTm8gdHJlYXN1cnkiCiAgICBieXRlYyA3IC8vIDB4NzQ3MjVmCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gTm8gdHJlYXN1cnkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo2NTAKICAgIC8vIHJldHVybiBzZWxmLnRyZWFzdXJpZXNbZXhwX2lkXQogICAgYm94X2dldAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NjQ3CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzIgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMudHJ1c3RfZXhwZXJpbWVudHMuY29udHJhY3QuVHJ1c3RFeHBlcmltZW50cy5nZXRfdmFyaWF0aW9uW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X3ZhcmlhdGlvbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo2NTIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgNCAvLyA0CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQzMgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgNCAvLyA0CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQzMgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjY1NAogICAgLy8ga2V5ID0gYXJjNC5VSW50NjQoZXhwX2lkLmFzX3VpbnQ2NCgpICogVUludDY0KDQyOTQ5NjcyOTYpICsgdmFyX2lkLmFzX3VpbnQ2NCgpKQogICAgc3dhcAogICAgYnRvaQogICAgaW50YyA4IC8vIDQyOTQ5NjcyOTYKICAgICoKICAgIHN3YXAKICAgIGJ0b2kKICAgICsKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo2NTUKICAgIC8vIGFzc2VydCBrZXkgaW4gc2VsZi52YXJpYXRpb25zLCAiVmFyaWF0aW9uIG5vdCBmb3VuZCIKICAgIGJ5dGVjIDggLy8gMHg3NjVmCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gVmFyaWF0aW9uIG5vdCBmb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjY1NgogICAgLy8gcmV0dXJuIHNlbGYudmFyaWF0aW9uc1trZXldCiAgICBib3hfZ2V0CiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo2NTIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWNfMiAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50cnVzdF9leHBlcmltZW50cy5jb250cmFjdC5UcnVzdEV4cGVyaW1lbnRzLmdldF92YXJpYXRpb25fYnlfYXBwW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X3ZhcmlhdGlvbl9ieV9hcHA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NjU4CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo2NjEKICAgIC8vIGFzc2VydCBhcHBfaWQgaW4gc2VsZi52YXJpYXRpb25fYXBwcywgIlZhcmlhdGlvbiBub3QgZm91bmQiCiAgICBieXRlYyAxNyAvLyAweDc2NjE1ZgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIFZhcmlhdGlvbiBub3QgZm91bmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo2NjIKICAgIC8vIGtleSA9IHNlbGYudmFyaWF0aW9uX2FwcHNbYXBwX2lkXQogICAgYm94X2dldAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NjYzCiAgICAvLyByZXR1cm4gYXJjNC5VSW50MzIoa2V5LmFzX3VpbnQ2NCgpID4+IFVJbnQ2NCgzMikpLCBzZWxmLnZhcmlhdGlvbnNba2V5XQogICAgZHVwCiAgICBidG9pCiAgICBwdXNoaW50IDMyIC8vIDMyCiAgICBzaHIKICAgIGl0b2IKICAgIGR1cAogICAgYml0bGVuCiAgICBwdXNoaW50IDMyIC8vIDMyCiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDQgNAogICAgYnl0ZWMgOCAvLyAweDc2NWYKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52YXJpYXRpb25zIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjY1OAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBzd2FwCiAgICBwdXNoYnl0ZXMgMHgwMDA2CiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYnl0ZWNfMiAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50cnVzdF9leHBlcmltZW50cy5jb250cmFjdC5UcnVzdEV4cGVyaW1lbnRzLmdldF92YXJpYXRpb25zW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X3ZhcmlhdGlvbnM6CiAgICBpbnRjXzAgLy8gMAogICAgZHVwCiAgICBwdXNoYnl0ZXMgIiIKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjY2NQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXBuIDIKICAgIGxlbgogICAgcHVzaGludCA0IC8vIDQKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDMyCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCA0IC8vIDQKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDMyCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCA0IC8vIDQKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDMyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6Njc0CiAgICAvLyBhc3NlcnQgZXhwX2lkIGluIHNlbGYuZXhwZXJpbWVudHMsICJFeHBlcmltZW50IG5vdCBmb3VuZCIKICAgIGJ5dGVjXzMgLy8gMHg2NTVmCiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBFeHBlcmltZW50IG5vdCBmb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjY3NQogICAgLy8gZW5kID0gc3RhcnQuYXNfdWludDY0KCkgKyBjb3VudC5hc191aW50NjQoKQogICAgdW5jb3ZlciAyCiAgICBidG9pCiAgICBkdXAKICAgIGNvdmVyIDMKICAgIHVuY292ZXIgMgogICAgYnRvaQogICAgKwogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo2NzYKICAgIC8vIHZhcmlhdGlvbl9jb3VudCA9IHNlbGYuZXhwZXJpbWVudHNbZXhwX2lkXS52YXJpYXRpb25fY291bnQuYXNfdWludDY0KCkKICAgIHB1c2hpbnQgNDYgLy8gNDYKICAgIGludGNfMiAvLyA4CiAgICBib3hfZXh0cmFjdAogICAgYnRvaQogICAgZHVwCiAgICBjb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6Njc3CiAgICAvLyBpZiBlbmQgPiB2YXJpYXRpb25fY291bnQ6CiAgICA+CiAgICBieiBnZXRfdmFyaWF0aW9uc19hZnRlcl9pZl9lbHNlQDMKICAgIGR1cAogICAgYnVyeSAyCgpnZXRfdmFyaWF0aW9uc19hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NjgwCiAgICAvLyBwYWdlID0gYXJjNC5EeW5hbWljQXJyYXlbVmFyaWF0aW9uSW5mb10oKQogICAgYnl0ZWMgMTIgLy8gMHgwMDAwCiAgICBidXJ5IDcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo2ODEKICAgIC8vIHNpemUgPSBVSW50NjQoMikgICMgYXJyYXkgbGVuZ3RoIHByZWZpeAogICAgaW50Y18zIC8vIDIKICAgIGJ1cnkgNgogICAgZGlnIDIKICAgIGJ1cnkgNQoKZ2V0X3ZhcmlhdGlvbnNfZm9yX2hlYWRlckA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjY4MgogICAgLy8gZm9yIHZhcl9pZCBpbiB1cmFuZ2Uoc3RhcnQuYXNfdWludDY0KCksIGVuZCk6CiAgICBkaWcgNAogICAgZGlnIDIKICAgIDwKICAgIGJ6IGdldF92YXJpYXRpb25zX2FmdGVyX2ZvckA5CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NjgzCiAgICAvLyBpbmZvID0gc2VsZi52YXJpYXRpb25zW2FyYzQuVUludDY0KGV4cF9pZC5hc191aW50NjQoKSAqIFVJbnQ2NCg0Mjk0OTY3Mjk2KSArIHZhcl9pZCldCiAgICBkaWcgMwogICAgYnRvaQogICAgaW50YyA4IC8vIDQyOTQ5NjcyOTYKICAgICoKICAgIGRpZyA1CiAgICArCiAgICBpdG9iCiAgICBieXRlYyA4IC8vIDB4NzY1ZgogICAgc3dhcAogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGJ1cnkgMTAKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZhcmlhdGlvbnMgZW50cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6Njg0CiAgICAvLyBzaXplICs9IGluZm8uYnl0ZXMubGVuZ3RoICsgVUludDY0KDIpICAjIGVsZW1lbnQgKyBpdHMgaGVhZCBvZmZzZXQKICAgIGxlbgogICAgaW50Y18zIC8vIDIKICAgICsKICAgIGRpZyA2CiAgICArCiAgICBkdXAKICAgIGJ1cnkgNwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjY4NQogICAgLy8gaWYgc2l6ZSA+IFVJbnQ2NChfUkVUVVJOX1BBR0VfQllURVMpOgogICAgcHVzaGludCAxMDIwIC8vIDEwMjAKICAgID4KICAgIGJueiBnZXRfdmFyaWF0aW9uc19hZnRlcl9mb3JAOQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjY4NwogICAgLy8gcGFnZS5hcHBlbmQoaW5mbykKICAgIGRpZyA2CiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgc3dhcAogICAgZXh0cmFjdCAyIDAKICAgIGJ5dGVjIDE2IC8vIDB4MDAwMgogICAgZGlnIDEwCiAgICBjb25jYXQKICAgIGNvdmVyIDIKICAgIGludGNfMSAvLyAxCiAgICB1bmNvdmVyIDMKICAgIGNhbGxzdWIgZHluYW1pY19hcnJheV9jb25jYXRfZHluYW1pY19lbGVtZW50CiAgICBidXJ5IDcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo2ODIKICAgIC8vIGZvciB2YXJfaWQgaW4gdXJhbmdlKHN0YXJ0LmFzX3VpbnQ2NCgpLCBlbmQpOgogICAgZGlnIDQKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBidXJ5IDUKICAgIGIgZ2V0X3ZhcmlhdGlvbnNfZm9yX2hlYWRlckA0CgpnZXRfdmFyaWF0aW9uc19hZnRlcl9mb3JAOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo2NjUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWNfMiAvLyAweDE1MWY3Yzc1CiAgICBkaWcgNwogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMudHJ1c3RfZXhwZXJpbWVudHMuY29udHJhY3QuVHJ1c3RFeHBlcmltZW50cy5fcHJvZ3JhbV9oYXNoKCkgLT4gYnl0ZXM6Cl9wcm9ncmFtX2hhc2g6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MTY3LTE2OAogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBfcHJvZ3JhbV9oYXNoKHNlbGYpIC0+IEJ5dGVzOgogICAgcHJvdG8gMCAxCiAgICBwdXNoYnl0ZXMgIiIKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjE2OQogICAgLy8gZGlnZXN0cyA9IG9wLml0b2Ioc2VsZi50dl9hcHByb3ZhbC5sZW5ndGgpICsgb3AuaXRvYihzZWxmLnR2X2NsZWFyLmxlbmd0aCkKICAgIGJ5dGVjXzAgLy8gMHg3NDc2NWY2MTcwNzA3MjZmNzY2MTZjCiAgICBib3hfbGVuCiAgICBzd2FwCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudHZfYXBwcm92YWwgZXhpc3RzCiAgICBpdG9iCiAgICBieXRlY18xIC8vIDB4NzQ3NjVmNjM2YzY1NjE3MgogICAgYm94X2xlbgogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudHZfY2xlYXIgZXhpc3RzCiAgICBpdG9iCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToxNzEKICAgIC8vIGZvciBzdGFydCBpbiB1cmFuZ2UoVUludDY0KDApLCBhcHByb3ZhbF9sZW4sIFVJbnQ2NChQUk9HUkFNX0hBU0hfQ0hVTkspKToKICAgIGludGNfMCAvLyAwCgpfcHJvZ3JhbV9oYXNoX2Zvcl9oZWFkZXJAMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToxNzEKICAgIC8vIGZvciBzdGFydCBpbiB1cmFuZ2UoVUludDY0KDApLCBhcHByb3ZhbF9sZW4sIFVJbnQ2NChQUk9HUkFNX0hBU0hfQ0hVTkspKToKICAgIGZyYW1lX2RpZyA0CiAgICBmcmFtZV9kaWcgMgogICAgPAogICAgYnogX3Byb2dyYW1faGFzaF9hZnRlcl9mb3JANgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjE3MgogICAgLy8gbGVuZ3RoID0gYXBwcm92YWxfbGVuIC0gc3RhcnQKICAgIGZyYW1lX2RpZyAyCiAgICBmcmFtZV9kaWcgNAogICAgLQogICAgZHVwCiAgICBmcmFtZV9idXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToxNzMKICAgIC8vIGlmIGxlbmd0aCA+IFVJbnQ2NChQUk9HUkFNX0hBU0hfQ0hVTkspOgogICAgaW50YyA0IC8vIDQwOTYKICAgID4KICAgIGJ6IF9wcm9ncmFtX2hhc2hfYWZ0ZXJfaWZfZWxzZUA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MTc0CiAgICAvLyBsZW5ndGggPSBVSW50NjQoUFJPR1JBTV9IQVNIX0NIVU5LKQogICAgaW50YyA0IC8vIDQwOTYKICAgIGZyYW1lX2J1cnkgMQoKX3Byb2dyYW1faGFzaF9hZnRlcl9pZl9lbHNlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MTc1CiAgICAvLyBkaWdlc3RzICs9IG9wLnNoYTUxMl8yNTYoc2VsZi50dl9hcHByb3ZhbC5leHRyYWN0KHN0YXJ0LCBsZW5ndGgpKQogICAgYnl0ZWNfMCAvLyAweDc0NzY1ZjYxNzA3MDcyNmY3NjYxNmMKICAgIGZyYW1lX2RpZyA0CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGZyYW1lX2RpZyAxCiAgICBib3hfZXh0cmFjdAogICAgc2hhNTEyXzI1NgogICAgZnJhbWVfZGlnIDMKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfYnVyeSAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MTcxCiAgICAvLyBmb3Igc3RhcnQgaW4gdXJhbmdlKFVJbnQ2NCgwKSwgYXBwcm92YWxfbGVuLCBVSW50NjQoUFJPR1JBTV9IQVNIX0NIVU5LKSk6CiAgICBpbnRjIDQgLy8gNDA5NgogICAgKwogICAgZnJhbWVfYnVyeSA0CiAgICBiIF9wcm9ncmFtX2hhc2hfZm9yX2hlYWRlckAxCgpfcHJvZ3JhbV9oYXNoX2FmdGVyX2ZvckA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjE3NgogICAgLy8gY2xlYXJfbGVuID0gc2VsZi50dl9jbGVhci5sZW5ndGgKICAgIGJ5dGVjXzEgLy8gMHg3NDc2NWY2MzZjNjU2MTcyCiAgICBib3hfbGVuCiAgICBzd2FwCiAgICBmcmFtZV9idXJ5IDAKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnR2X2NsZWFyIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjE3NwogICAgLy8gZm9yIHN0YXJ0IGluIHVyYW5nZShVSW50NjQoMCksIGNsZWFyX2xlbiwgVUludDY0KFBST0dSQU1fSEFTSF9DSFVOSykpOgogICAgaW50Y18wIC8vIDAKICAgIGZyYW1lX2J1cnkgNAoKX3Byb2dyYW1faGFzaF9mb3JfaGVhZGVyQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MTc3CiAgICAvLyBmb3Igc3RhcnQgaW4gdXJhbmdlKFVJbnQ2NCgwKSwgY2xlYXJfbGVuLCBVSW50NjQoUFJPR1JBTV9IQVNIX0NIVU5LKSk6CiAgICBmcmFtZV9kaWcgNAogICAgZnJhbWVfZGlnIDAKICAgIDwKICAgIGJ6IF9wcm9ncmFtX2hhc2hfYWZ0ZXJfZm9yQDEyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MTc4CiAgICAvLyBsZW5ndGggPSBjbGVhcl9sZW4gLSBzdGFydAogICAgZnJhbWVfZGlnIDAKICAgIGZyYW1lX2RpZyA0CiAgICAtCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjE3OQogICAgLy8gaWYgbGVuZ3RoID4gVUludDY0KFBST0dSQU1fSEFTSF9DSFVOSyk6CiAgICBpbnRjIDQgLy8gNDA5NgogICAgPgogICAgYnogX3Byb2dyYW1faGFzaF9hZnRlcl9pZl9lbHNlQDEwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MTgwCiAgICAvLyBsZW5ndGggPSBVSW50NjQoUFJPR1JBTV9IQVNIX0NIVU5LKQogICAgaW50YyA0IC8vIDQwOTYKICAgIGZyYW1lX2J1cnkgMQoKX3Byb2dyYW1faGFzaF9hZnRlcl9pZl9lbHNlQDEwOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjE4MQogICAgLy8gZGlnZXN0cyArPSBvcC5zaGE1MTJfMjU2KHNlbGYudHZfY2xlYXIuZXh0cmFjdChzdGFydCwgbGVuZ3RoKSkKICAgIGJ5dGVjXzEgLy8gMHg3NDc2NWY2MzZjNjU2MTcyCiAgICBmcmFtZV9kaWcgNAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBmcmFtZV9kaWcgMQogICAgYm94X2V4dHJhY3QKICAgIHNoYTUxMl8yNTYKICAgIGZyYW1lX2RpZyAzCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2J1cnkgMwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjE3NwogICAgLy8gZm9yIHN0YXJ0IGluIHVyYW5nZShVSW50NjQoMCksIGNsZWFyX2xlbiwgVUludDY0KFBST0dSQU1fSEFTSF9DSFVOSykpOgogICAgaW50YyA0IC8vIDQwOTYKICAgICsKICAgIGZyYW1lX2J1cnkgNAogICAgYiBfcHJvZ3JhbV9oYXNoX2Zvcl9oZWFkZXJANwoKX3Byb2dyYW1faGFzaF9hZnRlcl9mb3JAMTI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MTgyCiAgICAvLyByZXR1cm4gb3Auc2hhNTEyXzI1NihkaWdlc3RzKQogICAgZnJhbWVfZGlnIDMKICAgIHNoYTUxMl8yNTYKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnRydXN0X2V4cGVyaW1lbnRzLmNvbnRyYWN0LlRydXN0RXhwZXJpbWVudHMuX3JlY29yZF9wcm9ncmFtKHByb2dyYW1faGFzaDogYnl0ZXMpIC0+IHVpbnQ2NDoKX3JlY29yZF9wcm9ncmFtOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjE4NC0xODUKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX3JlY29yZF9wcm9ncmFtKHNlbGYsIHByb2dyYW1faGFzaDogQnl0ZXMpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjE4NgogICAgLy8gc2VsZi50dl9oYXNoLnZhbHVlID0gcHJvZ3JhbV9oYXNoCiAgICBwdXNoYnl0ZXMgInR2X2hhc2giCiAgICBmcmFtZV9kaWcgLTEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MTg3CiAgICAvLyBzZWxmLnR2X3ZlcnNpb24udmFsdWUgKz0gVUludDY0KDEpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTAgLy8gInR2X3ZlcnNpb24iCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudHZfdmVyc2lvbiBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBieXRlYyAxMCAvLyAidHZfdmVyc2lvbiIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6MTg4CiAgICAvLyBzZWxmLnR2X3JlYWR5LnZhbHVlID0gVUludDY0KDEpCiAgICBieXRlYyA0IC8vICJ0dl9yZWFkeSIKICAgIGludGNfMSAvLyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjE4OQogICAgLy8gcmV0dXJuIHNlbGYudHZfdmVyc2lvbi52YWx1ZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEwIC8vICJ0dl92ZXJzaW9uIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnR2X3ZlcnNpb24gZXhpc3RzCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudHJ1c3RfZXhwZXJpbWVudHMuY29udHJhY3QuVHJ1c3RFeHBlcmltZW50cy5faW5kZXhfb3duZXJfZXhwZXJpbWVudChleHBfaWQ6IGJ5dGVzKSAtPiB2b2lkOgpfaW5kZXhfb3duZXJfZXhwZXJpbWVudDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToyMzAtMjMxCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9pbmRleF9vd25lcl9leHBlcmltZW50KHNlbGYsIGV4cF9pZDogYXJjNC5VSW50MzIpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToyMzIKICAgIC8vIGlmIFR4bi5zZW5kZXIgaW4gc2VsZi5vd25lcl9leHBlcmltZW50czoKICAgIGJ5dGVjIDkgLy8gMHg2ZjY1NWYKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBieiBfaW5kZXhfb3duZXJfZXhwZXJpbWVudF9lbHNlX2JvZHlAMgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjIzMwogICAgLy8gZXhwX2lkcyA9IHNlbGYub3duZXJfZXhwZXJpbWVudHNbVHhuLnNlbmRlcl0uY29weSgpCiAgICBieXRlYyA5IC8vIDB4NmY2NTVmCiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm93bmVyX2V4cGVyaW1lbnRzIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjIzNAogICAgLy8gZXhwX2lkcy5hcHBlbmQoZXhwX2lkKQogICAgZHVwCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdCAvLyBvbiBlcnJvcjogbWF4IGFycmF5IGxlbmd0aCBleGNlZWRlZAogICAgc3dhcAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHJlcGxhY2UyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToyMzUKICAgIC8vIHNlbGYub3duZXJfZXhwZXJpbWVudHNbVHhuLnNlbmRlcl0gPSBleHBfaWRzLmNvcHkoKQogICAgYnl0ZWMgOSAvLyAweDZmNjU1ZgogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9kZWwKICAgIHBvcAogICAgc3dhcAogICAgYm94X3B1dAogICAgcmV0c3ViCgpfaW5kZXhfb3duZXJfZXhwZXJpbWVudF9lbHNlX2JvZHlAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weToyMzcKICAgIC8vIHNlbGYub3duZXJfZXhwZXJpbWVudHNbVHhuLnNlbmRlcl0gPSBhcmM0LkR5bmFtaWNBcnJheShleHBfaWQpCiAgICBwdXNoYnl0ZXMgMHgwMDAxCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgYnl0ZWMgOSAvLyAweDZmNjU1ZgogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9kZWwKICAgIHBvcAogICAgc3dhcAogICAgYm94X3B1dAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnRydXN0X2V4cGVyaW1lbnRzLmNvbnRyYWN0LlRydXN0RXhwZXJpbWVudHMuX2NoZWNrX2VzY3Jvdyhlc2Nyb3dfZnVuZGluZzogdWludDY0LCBhc3NldF9pZDogdWludDY0KSAtPiB1aW50NjQ6Cl9jaGVja19lc2Nyb3c6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NDkxLTQ5MgogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBfY2hlY2tfZXNjcm93KHNlbGYsIGVzY3Jvd19mdW5kaW5nOiBndHhuLlRyYW5zYWN0aW9uLCBhc3NldF9pZDogVUludDY0KSAtPiBVSW50NjQ6CiAgICBwcm90byAyIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo0OTYKICAgIC8vIGlmIGFzc2V0X2lkID09IFVJbnQ2NCgwKToKICAgIGZyYW1lX2RpZyAtMQogICAgYm56IF9jaGVja19lc2Nyb3dfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NDk3CiAgICAvLyBhc3NlcnQgZXNjcm93X2Z1bmRpbmcudHlwZSA9PSBUcmFuc2FjdGlvblR5cGUuUGF5bWVudCwgIkVzY3JvdyBtdXN0IGJlIFBheW1lbnQgZm9yIEFMR08iCiAgICBmcmFtZV9kaWcgLTIKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIEVzY3JvdyBtdXN0IGJlIFBheW1lbnQgZm9yIEFMR08KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo0OTgKICAgIC8vIGFzc2VydCBlc2Nyb3dfZnVuZGluZy5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLCAiV3JvbmcgZXNjcm93IHJlY2VpdmVyIgogICAgZnJhbWVfZGlnIC0yCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gV3JvbmcgZXNjcm93IHJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NDk5CiAgICAvLyBhc3NlcnQgZXNjcm93X2Z1bmRpbmcuYW1vdW50ID4gVUludDY0KDApLCAiRXNjcm93IG11c3QgYmUgPiAwIgogICAgZnJhbWVfZGlnIC0yCiAgICBndHhucyBBbW91bnQKICAgIGR1cAogICAgYXNzZXJ0IC8vIEVzY3JvdyBtdXN0IGJlID4gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjUwMAogICAgLy8gcmV0dXJuIGVzY3Jvd19mdW5kaW5nLmFtb3VudAogICAgcmV0c3ViCgpfY2hlY2tfZXNjcm93X2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo1MDEKICAgIC8vIGFzc2VydCBlc2Nyb3dfZnVuZGluZy50eXBlID09IFRyYW5zYWN0aW9uVHlwZS5Bc3NldFRyYW5zZmVyLCAiRXNjcm93IG11c3QgYmUgQXNzZXRUcmFuc2ZlciBmb3IgQVNBIgogICAgZnJhbWVfZGlnIC0yCiAgICBndHhucyBUeXBlRW51bQogICAgcHVzaGludCA0IC8vIGF4ZmVyCiAgICA9PQogICAgYXNzZXJ0IC8vIEVzY3JvdyBtdXN0IGJlIEFzc2V0VHJhbnNmZXIgZm9yIEFTQQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjUwMgogICAgLy8gYXNzZXJ0IGVzY3Jvd19mdW5kaW5nLmFzc2V0X3JlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsICJXcm9uZyBlc2Nyb3cgcmVjZWl2ZXIiCiAgICBmcmFtZV9kaWcgLTIKICAgIGd0eG5zIEFzc2V0UmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIFdyb25nIGVzY3JvdyByZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjUwMwogICAgLy8gYXNzZXJ0IGVzY3Jvd19mdW5kaW5nLnhmZXJfYXNzZXQuaWQgPT0gYXNzZXRfaWQsICJXcm9uZyBhc3NldCIKICAgIGZyYW1lX2RpZyAtMgogICAgZ3R4bnMgWGZlckFzc2V0CiAgICBmcmFtZV9kaWcgLTEKICAgID09CiAgICBhc3NlcnQgLy8gV3JvbmcgYXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo1MDQKICAgIC8vIGFzc2VydCBlc2Nyb3dfZnVuZGluZy5hc3NldF9hbW91bnQgPiBVSW50NjQoMCksICJFc2Nyb3cgbXVzdCBiZSA+IDAiCiAgICBmcmFtZV9kaWcgLTIKICAgIGd0eG5zIEFzc2V0QW1vdW50CiAgICBkdXAKICAgIGFzc2VydCAvLyBFc2Nyb3cgbXVzdCBiZSA+IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo1MDUKICAgIC8vIHJldHVybiBlc2Nyb3dfZnVuZGluZy5hc3NldF9hbW91bnQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50cnVzdF9leHBlcmltZW50cy5jb250cmFjdC5UcnVzdEV4cGVyaW1lbnRzLl9zcGF3bl92YXJpYXRpb24oZXhwX2lkOiBieXRlcywgdmFyX2lkOiBieXRlcywgcGFyYW1zOiBieXRlcywgbWJyX2Ftb3VudDogdWludDY0LCB0cmVhc3VyeV9mdW5kZWQ6IHVpbnQ2NCkgLT4gYnl0ZXM6Cl9zcGF3bl92YXJpYXRpb246CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NTA3LTUxNgogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBfc3Bhd25fdmFyaWF0aW9uKAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgZXhwX2lkOiBhcmM0LlVJbnQzMiwKICAgIC8vICAgICB2YXJfaWQ6IGFyYzQuVUludDMyLAogICAgLy8gICAgIHBhcmFtczogVmFyaWF0aW9uUGFyYW1zLAogICAgLy8gICAgIG1icl9hbW91bnQ6IFVJbnQ2NCwKICAgIC8vICAgICAqLAogICAgLy8gICAgIHRyZWFzdXJ5X2Z1bmRlZDogYm9vbCwKICAgIC8vICkgLT4gYXJjNC5VSW50NjQ6CiAgICBwcm90byA1IDEKICAgIHB1c2hieXRlcyAiIgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjUyMi01MjQKICAgIC8vICMgUHJvZ3JhbXMgb3ZlciA0LDA5NiBieXRlcyBkb24ndCBmaXQgb25lIHN0YWNrIHZhbHVlLCBzbyB0aGUgYXBwcm92YWwKICAgIC8vICMgcHJvZ3JhbSBpcyBwYXNzZWQgYXMgdHdvIHBhZ2VzICh0aGUgc2Vjb25kIG1heSBiZSBlbXB0eSkKICAgIC8vIGFwcHJvdmFsX2xlbiA9IHNlbGYudHZfYXBwcm92YWwubGVuZ3RoCiAgICBieXRlY18wIC8vIDB4NzQ3NjVmNjE3MDcwNzI2Zjc2NjE2YwogICAgYm94X2xlbgogICAgc3dhcAogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnR2X2FwcHJvdmFsIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjUyNgogICAgLy8gaWYgZmlyc3RfcGFnZSA+IFVJbnQ2NCg0MDk2KToKICAgIGludGMgNCAvLyA0MDk2CiAgICA+CiAgICBibnogX3NwYXduX3ZhcmlhdGlvbl9pZl9ib2R5QDEKICAgIGZyYW1lX2RpZyAxCgpfc3Bhd25fdmFyaWF0aW9uX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo1MjktNTU1CiAgICAvLyAjIERlcGxveSBUcnVzdFZhcmlhdGlvbiBhbmQgY2FsbCBjcmVhdGUoKSBpbiBvbmUgdHJhbnNhY3Rpb24KICAgIC8vICMgU2VsZWN0b3I6IGNyZWF0ZSh1aW50NjQsdWludDMyLHVpbnQzMixhZGRyZXNzLHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCl2b2lkCiAgICAvLyBkZXBsb3llZCA9IGl0eG4uQXBwbGljYXRpb25DYWxsKAogICAgLy8gICAgIGFwcHJvdmFsX3Byb2dyYW09KAogICAgLy8gICAgICAgICBzZWxmLnR2X2FwcHJvdmFsLmV4dHJhY3QoMCwgZmlyc3RfcGFnZSksCiAgICAvLyAgICAgICAgIHNlbGYudHZfYXBwcm92YWwuZXh0cmFjdChmaXJzdF9wYWdlLCBhcHByb3ZhbF9sZW4gLSBmaXJzdF9wYWdlKSwKICAgIC8vICAgICApLAogICAgLy8gICAgIGNsZWFyX3N0YXRlX3Byb2dyYW09c2VsZi50dl9jbGVhci52YWx1ZSwKICAgIC8vICAgICBleHRyYV9wcm9ncmFtX3BhZ2VzPShhcHByb3ZhbF9sZW4gKyBzZWxmLnR2X2NsZWFyLmxlbmd0aCAtIFVJbnQ2NCgxKSkgLy8gVUludDY0KF9QUk9HUkFNX1BBR0VfQllURVMpLAogICAgLy8gICAgIGdsb2JhbF9udW1fdWludD1fVFJVU1RfVkFSX0dMT0JBTF9VSU5ULAogICAgLy8gICAgIGdsb2JhbF9udW1fYnl0ZXM9X1RSVVNUX1ZBUl9HTE9CQUxfQllURVMsCiAgICAvLyAgICAgYXBwX2FyZ3M9KAogICAgLy8gICAgICAgICBCeXRlcyhiIlx4YjhceGRiXHg4Nlx4MDUiKSwKICAgIC8vICAgICAgICAgYXJjNC5VSW50NjQoR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQuaWQpLmJ5dGVzLAogICAgLy8gICAgICAgICBleHBfaWQuYnl0ZXMsCiAgICAvLyAgICAgICAgIHZhcl9pZC5ieXRlcywKICAgIC8vICAgICAgICAgYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLmJ5dGVzLAogICAgLy8gICAgICAgICBwYXJhbXMuZTEuYnl0ZXMsCiAgICAvLyAgICAgICAgIHBhcmFtcy5lMi5ieXRlcywKICAgIC8vICAgICAgICAgcGFyYW1zLm11bHRpcGxpZXIuYnl0ZXMsCiAgICAvLyAgICAgICAgIHBhcmFtcy51bml0LmJ5dGVzLAogICAgLy8gICAgICAgICBwYXJhbXMuYXNzZXRfaWQuYnl0ZXMsCiAgICAvLyAgICAgICAgIGFyYzQuVUludDY0KHNlbGYucmVnaXN0cnlfYXBwLnZhbHVlKS5ieXRlcywKICAgIC8vICAgICAgICAgcGFyYW1zLm1heF9wYXJ0aWNpcGFudHMuYnl0ZXMsCiAgICAvLyAgICAgKSwKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo1MzMKICAgIC8vIHNlbGYudHZfYXBwcm92YWwuZXh0cmFjdCgwLCBmaXJzdF9wYWdlKSwKICAgIGJ5dGVjXzAgLy8gMHg3NDc2NWY2MTcwNzA3MjZmNzY2MTZjCiAgICBpbnRjXzAgLy8gMAogICAgZGlnIDIKICAgIGJveF9leHRyYWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NTM0CiAgICAvLyBzZWxmLnR2X2FwcHJvdmFsLmV4dHJhY3QoZmlyc3RfcGFnZSwgYXBwcm92YWxfbGVuIC0gZmlyc3RfcGFnZSksCiAgICBmcmFtZV9kaWcgMQogICAgZHVwCiAgICBjb3ZlciAyCiAgICBkaWcgMwogICAgLQogICAgYnl0ZWNfMCAvLyAweDc0NzY1ZjYxNzA3MDcyNmY3NjYxNmMKICAgIHVuY292ZXIgNAogICAgdW5jb3ZlciAyCiAgICBib3hfZXh0cmFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjUzNgogICAgLy8gY2xlYXJfc3RhdGVfcHJvZ3JhbT1zZWxmLnR2X2NsZWFyLnZhbHVlLAogICAgYnl0ZWNfMSAvLyAweDc0NzY1ZjYzNmM2NTYxNzIKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnR2X2NsZWFyIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjUzNwogICAgLy8gZXh0cmFfcHJvZ3JhbV9wYWdlcz0oYXBwcm92YWxfbGVuICsgc2VsZi50dl9jbGVhci5sZW5ndGggLSBVSW50NjQoMSkpIC8vIFVJbnQ2NChfUFJPR1JBTV9QQUdFX0JZVEVTKSwKICAgIGJ5dGVjXzEgLy8gMHg3NDc2NWY2MzZjNjU2MTcyCiAgICBib3hfbGVuCiAgICBwb3AKICAgIHVuY292ZXIgNAogICAgKwogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIHB1c2hpbnQgMjA0OCAvLyAyMDQ4CiAgICAvCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NTQyCiAgICAvLyBhcmM0LlVJbnQ2NChHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9pZC5pZCkuYnl0ZXMsCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uSUQKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo1NDUKICAgIC8vIGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKS5ieXRlcywKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo1NDYKICAgIC8vIHBhcmFtcy5lMS5ieXRlcywKICAgIGZyYW1lX2RpZyAtMwogICAgZXh0cmFjdCAyIDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo1NDcKICAgIC8vIHBhcmFtcy5lMi5ieXRlcywKICAgIGZyYW1lX2RpZyAtMwogICAgZXh0cmFjdCAxMCA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NTQ4CiAgICAvLyBwYXJhbXMubXVsdGlwbGllci5ieXRlcywKICAgIGZyYW1lX2RpZyAtMwogICAgZXh0cmFjdCAxOCA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NTQ5CiAgICAvLyBwYXJhbXMudW5pdC5ieXRlcywKICAgIGZyYW1lX2RpZyAtMwogICAgZXh0cmFjdCAyNiA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NTUwCiAgICAvLyBwYXJhbXMuYXNzZXRfaWQuYnl0ZXMsCiAgICBmcmFtZV9kaWcgLTMKICAgIGV4dHJhY3QgMzQgOAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjU1MQogICAgLy8gYXJjNC5VSW50NjQoc2VsZi5yZWdpc3RyeV9hcHAudmFsdWUpLmJ5dGVzLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDExIC8vICJyZWdpc3RyeV9hcHAiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmVnaXN0cnlfYXBwIGV4aXN0cwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjU1MgogICAgLy8gcGFyYW1zLm1heF9wYXJ0aWNpcGFudHMuYnl0ZXMsCiAgICBmcmFtZV9kaWcgLTMKICAgIGV4dHJhY3QgNDIgOAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjU0MQogICAgLy8gQnl0ZXMoYiJceGI4XHhkYlx4ODZceDA1IiksCiAgICBwdXNoYnl0ZXMgMHhiOGRiODYwNQogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIHVuY292ZXIgOAogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGZyYW1lX2RpZyAtNQogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGZyYW1lX2RpZyAtNAogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIHVuY292ZXIgNwogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIHVuY292ZXIgNgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIHVuY292ZXIgNQogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIHVuY292ZXIgNAogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIHVuY292ZXIgMwogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIHVuY292ZXIgMgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIHN3YXAKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjUzOQogICAgLy8gZ2xvYmFsX251bV9ieXRlcz1fVFJVU1RfVkFSX0dMT0JBTF9CWVRFUywKICAgIGludGNfMyAvLyAyCiAgICBpdHhuX2ZpZWxkIEdsb2JhbE51bUJ5dGVTbGljZQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjUzOAogICAgLy8gZ2xvYmFsX251bV91aW50PV9UUlVTVF9WQVJfR0xPQkFMX1VJTlQsCiAgICBwdXNoaW50IDIzIC8vIDIzCiAgICBpdHhuX2ZpZWxkIEdsb2JhbE51bVVpbnQKICAgIGl0eG5fZmllbGQgRXh0cmFQcm9ncmFtUGFnZXMKICAgIGl0eG5fZmllbGQgQ2xlYXJTdGF0ZVByb2dyYW1QYWdlcwogICAgc3dhcAogICAgaXR4bl9maWVsZCBBcHByb3ZhbFByb2dyYW1QYWdlcwogICAgaXR4bl9maWVsZCBBcHByb3ZhbFByb2dyYW1QYWdlcwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjUyOS01MzEKICAgIC8vICMgRGVwbG95IFRydXN0VmFyaWF0aW9uIGFuZCBjYWxsIGNyZWF0ZSgpIGluIG9uZSB0cmFuc2FjdGlvbgogICAgLy8gIyBTZWxlY3RvcjogY3JlYXRlKHVpbnQ2NCx1aW50MzIsdWludDMyLGFkZHJlc3MsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0KXZvaWQKICAgIC8vIGRlcGxveWVkID0gaXR4bi5BcHBsaWNhdGlvbkNhbGwoCiAgICBwdXNoaW50IDYgLy8gYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjU1NAogICAgLy8gZmVlPTAsCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo1MjktNTU1CiAgICAvLyAjIERlcGxveSBUcnVzdFZhcmlhdGlvbiBhbmQgY2FsbCBjcmVhdGUoKSBpbiBvbmUgdHJhbnNhY3Rpb24KICAgIC8vICMgU2VsZWN0b3I6IGNyZWF0ZSh1aW50NjQsdWludDMyLHVpbnQzMixhZGRyZXNzLHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCl2b2lkCiAgICAvLyBkZXBsb3llZCA9IGl0eG4uQXBwbGljYXRpb25DYWxsKAogICAgLy8gICAgIGFwcHJvdmFsX3Byb2dyYW09KAogICAgLy8gICAgICAgICBzZWxmLnR2X2FwcHJvdmFsLmV4dHJhY3QoMCwgZmlyc3RfcGFnZSksCiAgICAvLyAgICAgICAgIHNlbGYudHZfYXBwcm92YWwuZXh0cmFjdChmaXJzdF9wYWdlLCBhcHByb3ZhbF9sZW4gLSBmaXJzdF9wYWdlKSwKICAgIC8vICAgICApLAogICAgLy8gICAgIGNsZWFyX3N0YXRlX3Byb2dyYW09c2VsZi50dl9jbGVhci52YWx1ZSwKICAgIC8vICAgICBleHRyYV9wcm9ncmFtX3BhZ2VzPShhcHByb3ZhbF9sZW4gKyBzZWxmLnR2X2NsZWFyLmxlbmd0aCAtIFVJbnQ2NCgxKSkgLy8gVUludDY0KF9QUk9HUkFNX1BBR0VfQllURVMpLAogICAgLy8gICAgIGdsb2JhbF9udW1fdWludD1fVFJVU1RfVkFSX0dMT0JBTF9VSU5ULAogICAgLy8gICAgIGdsb2JhbF9udW1fYnl0ZXM9X1RSVVNUX1ZBUl9HTE9CQUxfQllURVMsCiAgICAvLyAgICAgYXBwX2FyZ3M9KAogICAgLy8gICAgICAgICBCeXRlcyhiIlx4YjhceGRiXHg4Nlx4MDUiKSwKICAgIC8vICAgICAgICAgYXJjNC5VSW50NjQoR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQuaWQpLmJ5dGVzLAogICAgLy8gICAgICAgICBleHBfaWQuYnl0ZXMsCiAgICAvLyAgICAgICAgIHZhcl9pZC5ieXRlcywKICAgIC8vICAgICAgICAgYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLmJ5dGVzLAogICAgLy8gICAgICAgICBwYXJhbXMuZTEuYnl0ZXMsCiAgICAvLyAgICAgICAgIHBhcmFtcy5lMi5ieXRlcywKICAgIC8vICAgICAgICAgcGFyYW1zLm11bHRpcGxpZXIuYnl0ZXMsCiAgICAvLyAgICAgICAgIHBhcmFtcy51bml0LmJ5dGVzLAogICAgLy8gICAgICAgICBwYXJhbXMuYXNzZXRfaWQuYnl0ZXMsCiAgICAvLyAgICAgICAgIGFyYzQuVUludDY0KHNlbGYucmVnaXN0cnlfYXBwLnZhbHVlKS5ieXRlcywKICAgIC8vICAgICAgICAgcGFyYW1zLm1heF9wYXJ0aWNpcGFudHMuYnl0ZXMsCiAgICAvLyAgICAgKSwKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICBpdHhuIENyZWF0ZWRBcHBsaWNhdGlvbklECiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjU1OC01NjMKICAgIC8vICMgRnVuZCB0aGUgbmV3IHZhcmlhdGlvbiBhcHAncyBhY2NvdW50IHdpdGggTUJSIChjb3ZlcnMgYmFzZSArIG9wdC1pbikuCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9bmV3X2FwcC5hZGRyZXNzLAogICAgLy8gICAgIGFtb3VudD1tYnJfYW1vdW50LAogICAgLy8gICAgIGZlZT0wLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjU2MAogICAgLy8gcmVjZWl2ZXI9bmV3X2FwcC5hZGRyZXNzLAogICAgYXBwX3BhcmFtc19nZXQgQXBwQWRkcmVzcwogICAgYXNzZXJ0IC8vIGFwcGxpY2F0aW9uIGV4aXN0cwogICAgZnJhbWVfZGlnIC0yCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjU1OC01NTkKICAgIC8vICMgRnVuZCB0aGUgbmV3IHZhcmlhdGlvbiBhcHAncyBhY2NvdW50IHdpdGggTUJSIChjb3ZlcnMgYmFzZSArIG9wdC1pbikuCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NTYyCiAgICAvLyBmZWU9MCwKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjU1OC01NjMKICAgIC8vICMgRnVuZCB0aGUgbmV3IHZhcmlhdGlvbiBhcHAncyBhY2NvdW50IHdpdGggTUJSIChjb3ZlcnMgYmFzZSArIG9wdC1pbikuCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9bmV3X2FwcC5hZGRyZXNzLAogICAgLy8gICAgIGFtb3VudD1tYnJfYW1vdW50LAogICAgLy8gICAgIGZlZT0wLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo1NjUKICAgIC8vIGlmIHRyZWFzdXJ5X2Z1bmRlZDoKICAgIGZyYW1lX2RpZyAtMQogICAgYnogX3NwYXduX3ZhcmlhdGlvbl9lbHNlX2JvZHlANwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjU2Ni01NzEKICAgIC8vICMgU2VsZWN0b3I6IGVuYWJsZV90cmVhc3VyeV9mdW5kaW5nKCl2b2lkCiAgICAvLyBpdHhuLkFwcGxpY2F0aW9uQ2FsbCgKICAgIC8vICAgICBhcHBfaWQ9bmV3X2FwcCwKICAgIC8vICAgICBhcHBfYXJncz0oQnl0ZXMoYiJceDA5XHhjMVx4YzNceGU3IiksKSwKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo1NjkKICAgIC8vIGFwcF9hcmdzPShCeXRlcyhiIlx4MDlceGMxXHhjM1x4ZTciKSwpLAogICAgcHVzaGJ5dGVzIDB4MDljMWMzZTcKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBmcmFtZV9kaWcgMAogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbklECiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NTY2LTU2NwogICAgLy8gIyBTZWxlY3RvcjogZW5hYmxlX3RyZWFzdXJ5X2Z1bmRpbmcoKXZvaWQKICAgIC8vIGl0eG4uQXBwbGljYXRpb25DYWxsKAogICAgcHVzaGludCA2IC8vIGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo1NzAKICAgIC8vIGZlZT0wLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NTY2LTU3MQogICAgLy8gIyBTZWxlY3RvcjogZW5hYmxlX3RyZWFzdXJ5X2Z1bmRpbmcoKXZvaWQKICAgIC8vIGl0eG4uQXBwbGljYXRpb25DYWxsKAogICAgLy8gICAgIGFwcF9pZD1uZXdfYXBwLAogICAgLy8gICAgIGFwcF9hcmdzPShCeXRlcyhiIlx4MDlceGMxXHhjM1x4ZTciKSwpLAogICAgLy8gICAgIGZlZT0wLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKCl9zcGF3bl92YXJpYXRpb25fYWZ0ZXJfaWZfZWxzZUA5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjU4Ny01ODgKICAgIC8vICMgUGFja2VkIGNvbXBvc2l0ZSBrZXk6IGhpZ2ggMzIgYml0cyA9IGV4cF9pZCwgbG93IDMyIGJpdHMgPSB2YXJfaWQKICAgIC8vIHZhcmlhdGlvbl9rZXkgPSBhcmM0LlVJbnQ2NChleHBfaWQuYXNfdWludDY0KCkgKiBVSW50NjQoNDI5NDk2NzI5NikgKyB2YXJfaWQuYXNfdWludDY0KCkpCiAgICBmcmFtZV9kaWcgLTUKICAgIGJ0b2kKICAgIGludGMgOCAvLyA0Mjk0OTY3Mjk2CiAgICAqCiAgICBmcmFtZV9kaWcgLTQKICAgIGJ0b2kKICAgICsKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo1OTEKICAgIC8vIGFwcF9pZD1hcmM0LlVJbnQ2NChuZXdfYXBwLmlkKSwKICAgIGZyYW1lX2RpZyAwCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NTkyCiAgICAvLyBsYWJlbD1wYXJhbXMubGFiZWwsCiAgICBmcmFtZV9kaWcgLTMKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZnJhbWVfZGlnIC0zCiAgICBsZW4KICAgIGZyYW1lX2RpZyAtMwogICAgY292ZXIgMgogICAgc3Vic3RyaW5nMwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjU5MwogICAgLy8gY3JlYXRlZF9hdD1hcmM0LlVJbnQ2NChHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCksCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NTg5LTU5NAogICAgLy8gc2VsZi52YXJpYXRpb25zW3ZhcmlhdGlvbl9rZXldID0gVmFyaWF0aW9uSW5mbygKICAgIC8vICAgICB2YXJfaWQ9dmFyX2lkLAogICAgLy8gICAgIGFwcF9pZD1hcmM0LlVJbnQ2NChuZXdfYXBwLmlkKSwKICAgIC8vICAgICBsYWJlbD1wYXJhbXMubGFiZWwsCiAgICAvLyAgICAgY3JlYXRlZF9hdD1hcmM0LlVJbnQ2NChHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCksCiAgICAvLyApCiAgICBmcmFtZV9kaWcgLTQKICAgIGRpZyAzCiAgICBjb25jYXQKICAgIHB1c2hieXRlcyAweDAwMTYKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo1ODkKICAgIC8vIHNlbGYudmFyaWF0aW9uc1t2YXJpYXRpb25fa2V5XSA9IFZhcmlhdGlvbkluZm8oCiAgICBieXRlYyA4IC8vIDB4NzY1ZgogICAgZGlnIDMKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjU4OS01OTQKICAgIC8vIHNlbGYudmFyaWF0aW9uc1t2YXJpYXRpb25fa2V5XSA9IFZhcmlhdGlvbkluZm8oCiAgICAvLyAgICAgdmFyX2lkPXZhcl9pZCwKICAgIC8vICAgICBhcHBfaWQ9YXJjNC5VSW50NjQobmV3X2FwcC5pZCksCiAgICAvLyAgICAgbGFiZWw9cGFyYW1zLmxhYmVsLAogICAgLy8gICAgIGNyZWF0ZWRfYXQ9YXJjNC5VSW50NjQoR2xvYmFsLmxhdGVzdF90aW1lc3RhbXApLAogICAgLy8gKQogICAgZHVwCiAgICBib3hfZGVsCiAgICBwb3AKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo1OTUKICAgIC8vIHNlbGYudmFyaWF0aW9uX2FwcHNbYXJjNC5VSW50NjQobmV3X2FwcC5pZCldID0gdmFyaWF0aW9uX2tleQogICAgYnl0ZWMgMTcgLy8gMHg3NjYxNWYKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjU5NgogICAgLy8gYXJjNC5lbWl0KFZhcmlhdGlvbkNyZWF0ZWQoZXhwX2lkPWV4cF9pZCwgdmFyX2lkPXZhcl9pZCwgYXBwX2lkPWFyYzQuVUludDY0KG5ld19hcHAuaWQpKSkKICAgIGZyYW1lX2RpZyAtNQogICAgZnJhbWVfZGlnIC00CiAgICBjb25jYXQKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIHB1c2hieXRlcyAweDYyMTczYzM2IC8vIG1ldGhvZCAiVmFyaWF0aW9uQ3JlYXRlZCh1aW50MzIsdWludDMyLHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjU5OAogICAgLy8gcmV0dXJuIGFyYzQuVUludDY0KG5ld19hcHAuaWQpCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKX3NwYXduX3ZhcmlhdGlvbl9lbHNlX2JvZHlANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo1NzMtNTc0CiAgICAvLyAjIEZvcndhcmQgZXNjcm93IHRvIHRoZSBuZXcgVHJ1c3RWYXJpYXRpb24gYXBwIGFjY291bnQuCiAgICAvLyBzZWxmLl9zZW5kX2Z1bmRzKG5ld19hcHAuYWRkcmVzcywgcGFyYW1zLmFzc2V0X2lkLmFzX3VpbnQ2NCgpLCBwYXJhbXMuZXNjcm93LmFzX3VpbnQ2NCgpKQogICAgZnJhbWVfZGlnIDAKICAgIGR1cAogICAgYXBwX3BhcmFtc19nZXQgQXBwQWRkcmVzcwogICAgYXNzZXJ0IC8vIGFwcGxpY2F0aW9uIGV4aXN0cwogICAgZnJhbWVfZGlnIC0zCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NTUwCiAgICAvLyBwYXJhbXMuYXNzZXRfaWQuYnl0ZXMsCiAgICBwdXNoaW50IDM0IC8vIDM0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NTczLTU3NAogICAgLy8gIyBGb3J3YXJkIGVzY3JvdyB0byB0aGUgbmV3IFRydXN0VmFyaWF0aW9uIGFwcCBhY2NvdW50LgogICAgLy8gc2VsZi5fc2VuZF9mdW5kcyhuZXdfYXBwLmFkZHJlc3MsIHBhcmFtcy5hc3NldF9pZC5hc191aW50NjQoKSwgcGFyYW1zLmVzY3Jvdy5hc191aW50NjQoKSkKICAgIGV4dHJhY3RfdWludDY0CiAgICBmcmFtZV9kaWcgLTMKICAgIGV4dHJhY3QgNTAgOAogICAgZnJhbWVfZGlnIC0zCiAgICBwdXNoaW50IDUwIC8vIDUwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgdW5jb3ZlciAzCiAgICB1bmNvdmVyIDMKICAgIHVuY292ZXIgMgogICAgY2FsbHN1YiBfc2VuZF9mdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjU3Ni01ODUKICAgIC8vICMgUmVjb3JkIHRoZSBkZXBvc2l0IGluIFRydXN0VmFyaWF0aW9uCiAgICAvLyAjIFNlbGVjdG9yOiByZWNvcmRfZXNjcm93KHVpbnQ2NCl2b2lkCiAgICAvLyBpdHhuLkFwcGxpY2F0aW9uQ2FsbCgKICAgIC8vICAgICBhcHBfaWQ9bmV3X2FwcCwKICAgIC8vICAgICBhcHBfYXJncz0oCiAgICAvLyAgICAgICAgIEJ5dGVzKGIiXHg1Y1x4OWFceDgzXHg2YiIpLAogICAgLy8gICAgICAgICBwYXJhbXMuZXNjcm93LmJ5dGVzLAogICAgLy8gICAgICksCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NTgxCiAgICAvLyBCeXRlcyhiIlx4NWNceDlhXHg4M1x4NmIiKSwKICAgIHB1c2hieXRlcyAweDVjOWE4MzZiCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25JRAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjU3Ni01NzgKICAgIC8vICMgUmVjb3JkIHRoZSBkZXBvc2l0IGluIFRydXN0VmFyaWF0aW9uCiAgICAvLyAjIFNlbGVjdG9yOiByZWNvcmRfZXNjcm93KHVpbnQ2NCl2b2lkCiAgICAvLyBpdHhuLkFwcGxpY2F0aW9uQ2FsbCgKICAgIHB1c2hpbnQgNiAvLyBhcHBsCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NTg0CiAgICAvLyBmZWU9MCwKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjU3Ni01ODUKICAgIC8vICMgUmVjb3JkIHRoZSBkZXBvc2l0IGluIFRydXN0VmFyaWF0aW9uCiAgICAvLyAjIFNlbGVjdG9yOiByZWNvcmRfZXNjcm93KHVpbnQ2NCl2b2lkCiAgICAvLyBpdHhuLkFwcGxpY2F0aW9uQ2FsbCgKICAgIC8vICAgICBhcHBfaWQ9bmV3X2FwcCwKICAgIC8vICAgICBhcHBfYXJncz0oCiAgICAvLyAgICAgICAgIEJ5dGVzKGIiXHg1Y1x4OWFceDgzXHg2YiIpLAogICAgLy8gICAgICAgICBwYXJhbXMuZXNjcm93LmJ5dGVzLAogICAgLy8gICAgICksCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgYiBfc3Bhd25fdmFyaWF0aW9uX2FmdGVyX2lmX2Vsc2VAOQoKX3NwYXduX3ZhcmlhdGlvbl9pZl9ib2R5QDE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NTI3CiAgICAvLyBmaXJzdF9wYWdlID0gVUludDY0KDQwOTYpCiAgICBpbnRjIDQgLy8gNDA5NgogICAgYiBfc3Bhd25fdmFyaWF0aW9uX2FmdGVyX2lmX2Vsc2VAMgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50cnVzdF9leHBlcmltZW50cy5jb250cmFjdC5UcnVzdEV4cGVyaW1lbnRzLl9zZW5kX2Z1bmRzKHJlY2VpdmVyOiBieXRlcywgYXNzZXRfaWQ6IHVpbnQ2NCwgYW1vdW50OiB1aW50NjQpIC0+IHZvaWQ6Cl9zZW5kX2Z1bmRzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjYwMC02MDEKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX3NlbmRfZnVuZHMoc2VsZiwgcmVjZWl2ZXI6IEFjY291bnQsIGFzc2V0X2lkOiBVSW50NjQsIGFtb3VudDogVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NjAyCiAgICAvLyBpZiBhc3NldF9pZCA9PSBVSW50NjQoMCk6CiAgICBmcmFtZV9kaWcgLTIKICAgIGJueiBfc2VuZF9mdW5kc19lbHNlX2JvZHlAMwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjYwMy02MDcKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1yZWNlaXZlciwKICAgIC8vICAgICBhbW91bnQ9YW1vdW50LAogICAgLy8gICAgIGZlZT0wLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgZnJhbWVfZGlnIC0xCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgZnJhbWVfZGlnIC0zCiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NjAzCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NjA2CiAgICAvLyBmZWU9MCwKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X2V4cGVyaW1lbnRzL2NvbnRyYWN0LnB5OjYwMy02MDcKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1yZWNlaXZlciwKICAgIC8vICAgICBhbW91bnQ9YW1vdW50LAogICAgLy8gICAgIGZlZT0wLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIHJldHN1YgoKX3NlbmRfZnVuZHNfZWxzZV9ib2R5QDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NjA5LTYxNAogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgLy8gICAgIHhmZXJfYXNzZXQ9QXNzZXQoYXNzZXRfaWQpLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPXJlY2VpdmVyLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1hbW91bnQsCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0eG5fZmllbGQgQXNzZXRBbW91bnQKICAgIGZyYW1lX2RpZyAtMwogICAgaXR4bl9maWVsZCBBc3NldFJlY2VpdmVyCiAgICBmcmFtZV9kaWcgLTIKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NjA5CiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICBwdXNoaW50IDQgLy8gYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF9leHBlcmltZW50cy9jb250cmFjdC5weTo2MTMKICAgIC8vIGZlZT0wLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfZXhwZXJpbWVudHMvY29udHJhY3QucHk6NjA5LTYxNAogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgLy8gICAgIHhmZXJfYXNzZXQ9QXNzZXQoYXNzZXRfaWQpLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPXJlY2VpdmVyLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1hbW91bnQsCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgcmV0c3ViCg==","clear":"I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"},"byteCode":{"approval":"CyAJAAEIAoAgoI0GkAPAmgyAgICAECYSC3R2X2FwcHJvdmFsCHR2X2NsZWFyBBUffHUCZV8IdHZfcmVhZHkQZXhwZXJpbWVudF9jb3VudAIANgN0cl8Cdl8Db2VfCnR2X3ZlcnNpb24McmVnaXN0cnlfYXBwAgAAAwaBAQRbdsPIAgA6AgACA3ZhXzEYQAAQJwsiZycFImcnCiJnJwQiZzEZFEQxGEEAjYITBCmcNSEEPes0ygRDYQcOBDPxf+UE+DTHXAQwJ3y1BHZjLikE/WyNgQTFGx34BGCcA4kEB7HoEwSUQi7zBPv70e0EvmF7ygSc85fzBE2cOmEEGvN2rQQtInwFBOk5nhQ2GgCOEwCfAOsBpwHyAkYCjQLqBBIGHwaRBvgH4AhPCVsJdAopCkMKbwqmAIAEJA0vZzYaAI4BAIIAigQBgABJi/4lC4v8JQsiiwSLAwxBAByL/YsESU4CWYsCCBZXBgKLAUxQjAElCIwEQv/ci/0VjAAijASLBIsCDEEAHIv/iwRJTgJZiwAIFlcGAosBTFCMASUIjARC/9yL/Iv+CBZXBgKLAVCL/YsDiwBSUIv/FYv/iwJPAlJQjACJNhoBSRUkEkQXJwtMZyNDNhoBSSJZJQhLARUSRFcCADYaAkkiWSUISwEVEkRXAgAxFiMJSTgQIxJEMQAyCRJEOAcyChJEKLxIKE8Cvym8SClMv4gKaIgK7EgjQzYaAUkVJBJENhoCSRUkEkQxFiMJSU4DSTgQIxJEMQAyCRJEOAcyChJETBdJTwIXSU4CSwFESUQIgYBADkQiKL1FAUEAYii9REsDDEEADCi9REsDTAkhBgtFAShLA9MpvUUBQQAqKb1ESwIMQQAPKb1ESwJMCSEGC0sBCEUBKUsC00sDOAhLAQ9EJwQiZyNDIQZLAklOAguBxCwISwIIRQIpTLlIQv/aIQZLA0lOAguB9DUIRQIoTLlIQv+iNhoBSRUjEkQ2GgJJTgIVJBJENhoDSSJZJQhLARUSRFcCAE4CMQAyCRJEJwQiZxdJTgJAAAgXKExLA7sjQ0sBIxJEFylMSwO7Qv/wNhoBSSJZJQhLARUSRFcCADEAMgkSRCi9RCm9RAgkCoHGBQhJMgwNQQAYsYEGshCBBbIZJw2yHicNsh8isgGzQv/hiAkWSUsDEkSICZUWKkxQsCNDNhoBSRUkEkQxFiMJSTgQIxJETBdJTgJJREsBOAcyChJETDgIIQUPRDIKTHAARQFAABOxMgoishKyFEmyEYEEshAisgGzI0M2GgFJIlklCEsBFRJEIicFZURJFkmTgSAORFcEBEwjCCcFTGcxADIHFksCTwJQJwZQTFCACAAAAAAAAAAAUE8CUCtLAlBJvEhMv0mICR1JMQBQJw5MULAqTFCwI0M2GgFHAhWBBBJENhoCSU4CSSJZJQhMFRJENhoDSU4CFSQSRDYaBElOAhUkEkQ2GgVJTgIVJBJENhoGSU4CFSQSRDYaB0lOAkkVJBJENhoISU4DFSQSRDEWJQlJTgNJOBAjEkQxFiMJTgMrTwNQSU4DSb1FAURJvkhOA4MCBCC6SU4DMQASRCInBGVEIxJEOAcyChJEF0lAAIRLBTgIIQUPREsESwGICKdLBElOAoEuJLoXSRZJk4EgDkRXBARPAhYnD0sQUEsPUEsOUEsNUEsMUEsLUExQSxBQSwk4CEsSTgMiiAinSwIigQS6SwZJgSRZSwEVUksEgSYkuk8EIwgWTwNLB1AnBlBPAlBMUExQSwK8SE8CTL8qTFCwI0NLBTgIIQcPREL/eSJHA4AARwk2GgFJFYEEEkQ2GgJJIllJTgIlC0xJFUxXAgAiSUsFDEEAMkcCJQtLA0lPAllJSwdJTgQSREsBFVJJFUsBIllJgToSRExSIlmBPAgIRQUjCEUBQv/HSwMlCEsDEkQxFiUJSUULOBAjEkQxFiMJRQ4rSwZQSUUTSb1FAURJvkhFEoMCBCC6SUUUMQASRCInBGVEIxJESwRJREmBHw5ESwJJIllPAiMJSU4CRQ5LAhVJTgJFFEsDJVlPAkxPA01SgSJbRQ8iRQgiRQxLC0sFDEEAQEsLSSULSwNJTgNMWUwjCEsHSwEJSwElC0sETFlLFExPAk1PA08DTwJSSYEiW0sREkSBMltJREsJCEUJRQxC/7hLDkAA6SEFRQdLCUk4BzIKEkQ4CElFCksHSwYLD0RLDUsPiAbqSwgSREsRgS4kuhdFDScMRRQiRQxLC0sFDEEAdUsLSwsSQABhSwZLDUsNSU4CCBZJk4EgDkRXBARLASULSwVJTgNMWU8DIwhLCUsBCUsBJQtLBUxZSxZMTwJNTwRPA08CUksJTwNPAk8EIogGuksVSU8CUEwiWSMIFlcGAlwARRVFDEL/j0sGSwsLSwlMCUL/lUsRSSKBBLpLEkmBJFlLARVSSwKBJiS6SxBLCQgWTwNLF1AnBlBPAlBMUExQSwG8SL8qSxRQsCNDIQdFB0L/FDYaAUcCFYEEEkQ2GgJJTgJJFSQSRDEWIwkrSwNQSb1FAUSDAgQgujEAEkRMF4gF6kwiTCcHTFBJvUUBQQAPSb5ESVcACEsFqEQkW0UCSwFLA0lOAggWSwVLAVBLA0y/TBZLBkxQTFCABKRg3stMULAjQzYaAUkVgQQSRDYaAkkVJBJEK0sCUEm9RQFEgwIEILoxABJEJwdLAlBJvUUBREm+SEkkW0sDF0oPRExLAQlLAlcACEwWTEsBUE8ETL8xAE8DIltPA4gG804CUExQgAQYtOJWTFCwI0M2GgFHAhWBBBJENhoCSU4CSRVLASJZSYE6EkRLAkxLAlIiWYE8CBJEMRYjCUk4ECMSRCtLA1BJTgRJvUUBREm+SE4EgwIEILpJTgQxABJEIicEZUQjEkQnB08DUEm9RQFEvkhXAAhLAlciCKhESwGBMlsUREk4BzIKEkQ4CEyBIltAAF8hBUsBSU8CD0RLBEmBLiS6F0kWSZOBIA5EVwQESwlMSwlPBSOIBNNLAiKBBLpLBkmBJFlLARVSSwSBJiS6TwQjCBZPA0sHUCcGUE8CUExQTFBLArxITwJMvypMULAjQyEHQv+eNhoBSRWBBBJENhoCSRWBBBJENhoDSRUkEkRLAhchCAtPAhcIFicITFBJvUUBRIEEJLoXMg1LARJEJwdPA1BJvUUBREm+SEkkW08EF0oPREsCVwAITwJLAgkWUE8DTL9PAnIIRE8CIltPAogFjiNDNhoBRwIiWSUITBUSRDYaAkcCIlklCEwVEkQ2GgNJFSQSRDYaBEkVJBJENhoFSRUkEkQ2GgZJFSQSRDYaB0cCFSQSRDYaCElOAhUkEkQxFiUJSU4CSTgQIxJEMRYjCU4CIicEZUQjEkQ4BzIKEkQXSUAAjksCOAghBQ9ESogDayInBWVESRZJk4EgDkRXBARMIwgnBUxnMgcWSwGIAwtLATEAUCcOTFCwTwIWJw9LDFBLC1BLClBLCVBLCFBLB1BMUEsMUEsFOAhLA4AEAAAAAE8DTwMiiANPSwIxAFAnBlBPAlCACAAAAAAAAAABUEsNUCtLA1BJvEhMv1AqTFCwI0NLAjgIIQcPREL/bzYaAUkVgQQSRCtMUEm9RQFEvkgqTFCwI0MigABHAzYaAUkVgSASRDYaAklOAhWBBBJENhoDSU4CFYEEEkQnDEwnCUxQSb1FAUAACEsBKkxQsCNDSwMXSUUGSwMXCElFCUsBIiW6Fw1BAAdJIiW6F0UIJUUGSwRFB0sGSwgMQQBJSwaBBAslCEsBTIEEuitMUL5MSU4CRQtEFSUISwYISUUHgfwHDUAAIUsBSSJZTFcCACcQSwtQTgIjTwOI9fZFAksGIwhFB0L/r0sBQv9/NhoBSRWBBBJEJwdMUEm9RQFEvkgqTFCwI0M2GgFJFYEEEkQ2GgJJFYEEEkRMFyEIC0wXCBYnCExQSb1FAUS+SCpMULAjQzYaAUkVJBJEJxFMUEm9RQFEvkhJF4EgkRZJk4EgDkRXBAQnCE8CUL5ETIACAAZQTFAqTFCwI0MiSYAASTYaAUcCFYEEEkQ2GgJJFYEEEkQ2GgNJFYEEEkQrTwNQSb1FAURPAhdJTgNPAhcISU8CgS4kuhdJTgINQQADSUUCJwxFByVFBksCRQVLBEsCDEEAR0sDFyEIC0sFCBYnCExQvkxJTgJFCkQVJQhLBghJRQeB/AcNQAAhSwZJIllMVwIAJxBLClBOAiNPA4j01EUHSwQjCEUFQv+xKksHULAjQ4oAAYAASSi9TElPAkQWKb1EFlAiiwSLAgxBACqLAosECUmMASEEDUEABCEEjAEoiwRJTgKLAboDiwNMUIwDIQQIjARC/84pvUyMAEQijASLBIsADEEAKosAiwQJSYwBIQQNQQAEIQSMASmLBElOAosBugOLA0xQjAMhBAiMBEL/zosDA4wAiYoBAYAHdHZfaGFzaIv/ZyInCmVEIwgnCkxnJwQjZyInCmVEiYoBACcJMQBQvUUBQQAhJwkxAFC+REmL/1BMIlkjCBZXBgJcACcJMQBQSbxITL+JgAIAAYv/UCcJMQBQSbxITL+JigIBi/9AABaL/jgQIxJEi/44BzIKEkSL/jgISUSJi/44EIEEEkSL/jgUMgoSRIv+OBGL/xJEi/44EklEiYoFAYAAKL1MSU8CRCEEDUABTosBsSgiSwK6iwFJTgJLAwkoTwRPAropvkQpvUhPBAgjCYGAEAoyCBYxAIv9VwIIi/1XCgiL/VcSCIv9VxoIi/1XIggiJwtlRBaL/VcqCIAEuNuGBbIaTwiyGov7shqL/LIaTweyGk8GshpPBbIaTwSyGk8DshpPArIaTLIasholsjWBF7I0sjiyQkyyQLJAgQayECKyAbO0PUmMALFyCESL/rIIsgcjshAisgGzi/9BAGaxgAQJwcPnshqLALIYgQayECKyAbOL+xchCAuL/BcIFosAFov9IlmL/RWL/U4CUjIHFov8SwNQgAIAFlBMUExQJwhLA1BJvEhMvycRSwFQTwK/i/uL/FBLAVCABGIXPDZMULCMAImLAElyCESL/YEiW4v9VzIIi/2BMltPA08DTwKIAB2xgARcmoNrshqyGrIYgQayECKyAbNC/3khBEL+r4oDAIv+QAARsYv/sgiL/bIHI7IQIrIBs4mxi/+yEov9shSL/rIRgQSyECKyAbOJ","clear":"C4EBQw=="},"events":[{"name":"ExperimentCreated","args":[{"type":"uint32","name":"exp_id"},{"type":"address","name":"owner"}]},{"name":"VariationCreated","args":[{"type":"uint32","name":"exp_id"},{"type":"uint32","name":"var_id"},{"type":"uint64","name":"app_id"}]},{"name":"TreasuryDeposited","args":[{"type":"uint32","name":"exp_id"},{"type":"uint64","name":"amount"},{"type":"uint64","name":"balance"}]},{"name":"TreasuryWithdrawn","args":[{"type":"uint32","name":"exp_id"},{"type":"uint64","name":"amount"},{"type":"uint64","name":"balance"}]}],"templateVariables":{}} as unknown as Arc56Contract
 
 /**
  * A state record containing binary data
@@ -72,6 +72,20 @@ export function ExperimentGroupFromTuple(abiTuple: [number, string, string, bigi
   return getStructValueFromTupleValue(abiStructType, abiTuple) as ExperimentGroup
 }
 
+export type Treasury = {
+  assetId: bigint,
+  balance: bigint
+}
+
+
+/**
+ * Converts the ABI tuple representation of a Treasury to the struct representation
+ */
+export function TreasuryFromTuple(abiTuple: [bigint, bigint]) {
+  const abiStructType = ABIStructType.fromStruct('Treasury', APP_SPEC.structs)
+  return getStructValueFromTupleValue(abiStructType, abiTuple) as Treasury
+}
+
 export type VariationInfo = {
   varId: number,
   appId: bigint,
@@ -88,6 +102,26 @@ export function VariationInfoFromTuple(abiTuple: [number, bigint, string, bigint
   return getStructValueFromTupleValue(abiStructType, abiTuple) as VariationInfo
 }
 
+export type VariationParams = {
+  label: string,
+  e1: bigint,
+  e2: bigint,
+  multiplier: bigint,
+  unit: bigint,
+  assetId: bigint,
+  maxParticipants: bigint,
+  escrow: bigint
+}
+
+
+/**
+ * Converts the ABI tuple representation of a VariationParams to the struct representation
+ */
+export function VariationParamsFromTuple(abiTuple: [string, bigint, bigint, bigint, bigint, bigint, bigint, bigint]) {
+  const abiStructType = ABIStructType.fromStruct('VariationParams', APP_SPEC.structs)
+  return getStructValueFromTupleValue(abiStructType, abiTuple) as VariationParams
+}
+
 /**
  * The argument types for the TrustExperiments contract
  */
@@ -104,6 +138,19 @@ export type TrustExperimentsArgs = {
       clear: Uint8Array
       mbrPayment: AppMethodCallTransactionArgument
     }
+    'begin_trust_variation_upload(uint64,uint64,pay)void': {
+      approvalSize: bigint | number
+      clearSize: bigint | number
+      mbrPayment: AppMethodCallTransactionArgument
+    }
+    'write_trust_variation_chunk(uint8,uint64,byte[])void': {
+      kind: bigint | number
+      offset: bigint | number
+      chunk: Uint8Array
+    }
+    'finalize_trust_variation_program(byte[])uint64': {
+      expectedHash: Uint8Array
+    }
     'opt_in_to_asset(uint64,pay)void': {
       assetId: bigint | number
       mbrPayment: AppMethodCallTransactionArgument
@@ -123,6 +170,31 @@ export type TrustExperimentsArgs = {
       mbrPayment?: AppMethodCallTransactionArgument
       escrowFunding: AppMethodCallTransactionArgument
     }
+    'create_variations(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64)[],pay,txn)uint64[]': {
+      expId: bigint | number
+      configs: [string, bigint | number, bigint | number, bigint | number, bigint | number, bigint | number, bigint | number, bigint | number][]
+      mbrPayment?: AppMethodCallTransactionArgument
+      escrowFunding: AppMethodCallTransactionArgument
+    }
+    'deposit_treasury(uint32,uint64,txn)void': {
+      expId: bigint | number
+      assetId: bigint | number
+      funding: AppMethodCallTransactionArgument
+    }
+    'withdraw_treasury(uint32,uint64)void': {
+      expId: bigint | number
+      amount: bigint | number
+    }
+    'create_treasury_variation(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64),pay)uint64': {
+      expId: bigint | number
+      params: VariationParams
+      mbrPayment: AppMethodCallTransactionArgument
+    }
+    'draw_escrow(uint32,uint32,uint64)void': {
+      expId: bigint | number
+      varId: bigint | number
+      amount: bigint | number
+    }
     'create_experiment_with_variation(string,string,uint64,uint64,uint64,uint64,uint64,uint64,pay,txn)(uint32,uint64)': {
       name: string
       label: string
@@ -138,10 +210,26 @@ export type TrustExperimentsArgs = {
     'get_experiment(uint32)(uint32,address,string,uint64,uint64)': {
       expId: bigint | number
     }
+    'get_experiments_by_owner(address,uint32,uint32)(uint32,address,string,uint64,uint64)[]': {
+      owner: string
+      start: bigint | number
+      count: bigint | number
+    }
+    'get_treasury(uint32)(uint64,uint64)': {
+      expId: bigint | number
+    }
     'get_variation(uint32,uint32)(uint32,uint64,string,uint64)': {
       expId: bigint | number
       varId: bigint | number
     }
+    'get_variation_by_app(uint64)(uint32,(uint32,uint64,string,uint64))': {
+      appId: bigint | number
+    }
+    'get_variations(uint32,uint32,uint32)(uint32,uint64,string,uint64)[]': {
+      expId: bigint | number
+      start: bigint | number
+      count: bigint | number
+    }
   }
   /**
    * The tuple representation of the arguments for each method
@@ -149,12 +237,24 @@ export type TrustExperimentsArgs = {
   tuple: {
     'create(uint64)void': [registryApp: bigint | number]
     'set_trust_variation_program(byte[],byte[],pay)void': [approval: Uint8Array, clear: Uint8Array, mbrPayment: AppMethodCallTransactionArgument]
+    'begin_trust_variation_upload(uint64,uint64,pay)void': [approvalSize: bigint | number, clearSize: bigint | number, mbrPayment: AppMethodCallTransactionArgument]
+    'write_trust_variation_chunk(uint8,uint64,byte[])void': [kind: bigint | number, offset: bigint | number, chunk: Uint8Array]
+    'finalize_trust_variation_program(byte[])uint64': [expectedHash: Uint8Array]
     'opt_in_to_asset(uint64,pay)void': [assetId: bigint | number, mbrPayment: AppMethodCallTransactionArgument]
     'create_experiment(string)uint32': [name: string]
     'create_variation(uint32,string,uint64,uint64,uint64,uint64,uint64,uint64,pay,txn)uint64': [expId: bigint | number, label: string, e1: bigint | number, e2: bigint | number, multiplier: bigint | number, unit: bigint | number, assetId: bigint | number, maxParticipants: bigint | number, mbrPayment: AppMethodCallTransactionArgument | undefined, escrowFunding: AppMethodCallTransactionArgument]
+    'create_variations(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64)[],pay,txn)uint64[]': [expId: bigint | number, configs: [string, bigint | number, bigint | number, bigint | number, bigint | number, bigint | number, bigint | number, bigint | number][], mbrPayment: AppMethodCallTransactionArgument | undefined, escrowFunding: AppMethodCallTransactionArgument]
+    'deposit_treasury(uint32,uint64,txn)void': [expId: bigint | number, assetId: bigint | number, funding: AppMethodCallTransactionArgument]
+    'withdraw_treasury(uint32,uint64)void': [expId: bigint | number, amount: bigint | number]
+    'create_treasury_variation(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64),pay)uint64': [expId: bigint | number, params: VariationParams, mbrPayment: AppMethodCallTransactionArgument]
+    'draw_escrow(uint32,uint32,uint64)void': [expId: bigint | number, varId: bigint | number, amount: bigint | number]
     'create_experiment_with_variation(string,string,uint64,uint64,uint64,uint64,uint64,uint64,pay,txn)(uint32,uint64)': [name: string, label: string, e1: bigint | number, e2: bigint | number, multiplier: bigint | number, unit: bigint | number, assetId: bigint | number, maxParticipants: bigint | number, mbrPayment: AppMethodCallTransactionArgument | undefined, escrowFunding: AppMethodCallTransactionArgument]
     'get_experiment(uint32)(uint32,address,string,uint64,uint64)': [expId: bigint | number]
+    'get_experiments_by_owner(address,uint32,uint32)(uint32,address,string,uint64,uint64)[]': [owner: string, start: bigint | number, count: bigint | number]
+    'get_treasury(uint32)(uint64,uint64)': [expId: bigint | number]
     'get_variation(uint32,uint32)(uint32,uint64,string,uint64)': [expId: bigint | number, varId: bigint | number]
+    'get_variation_by_app(uint64)(uint32,(uint32,uint64,string,uint64))': [appId: bigint | number]
+    'get_variations(uint32,uint32,uint32)(uint32,uint64,string,uint64)[]': [expId: bigint | number, start: bigint | number, count: bigint | number]
   }
 }
 
@@ -164,12 +264,24 @@ export type TrustExperimentsArgs = {
 export type TrustExperimentsReturns = {
   'create(uint64)void': void
   'set_trust_variation_program(byte[],byte[],pay)void': void
+  'begin_trust_variation_upload(uint64,uint64,pay)void': void
+  'write_trust_variation_chunk(uint8,uint64,byte[])void': void
+  'finalize_trust_variation_program(byte[])uint64': bigint
   'opt_in_to_asset(uint64,pay)void': void
   'create_experiment(string)uint32': number
   'create_variation(uint32,string,uint64,uint64,uint64,uint64,uint64,uint64,pay,txn)uint64': bigint
+  'create_variations(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64)[],pay,txn)uint64[]': bigint[]
+  'deposit_treasury(uint32,uint64,txn)void': void
+  'withdraw_treasury(uint32,uint64)void': void
+  'create_treasury_variation(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64),pay)uint64': bigint
+  'draw_escrow(uint32,uint32,uint64)void': void
   'create_experiment_with_variation(string,string,uint64,uint64,uint64,uint64,uint64,uint64,pay,txn)(uint32,uint64)': [number, bigint]
   'get_experiment(uint32)(uint32,address,string,uint64,uint64)': ExperimentGroup
+  'get_experiments_by_owner(address,uint32,uint32)(uint32,address,string,uint64,uint64)[]': [number, string, string, bigint, bigint][]
+  'get_treasury(uint32)(uint64,uint64)': Treasury
   'get_variation(uint32,uint32)(uint32,uint64,string,uint64)': VariationInfo
+  'get_variation_by_app(uint64)(uint32,(uint32,uint64,string,uint64))': [number, [number, bigint, string, bigint]]
+  'get_variations(uint32,uint32,uint32)(uint32,uint64,string,uint64)[]': [number, bigint, string, bigint][]
 }
 
 /**
@@ -190,6 +302,21 @@ export type TrustExperimentsTypes = {
       argsTuple: TrustExperimentsArgs['tuple']['set_trust_variation_program(byte[],byte[],pay)void']
       returns: TrustExperimentsReturns['set_trust_variation_program(byte[],byte[],pay)void']
     }>
+    & Record<'begin_trust_variation_upload(uint64,uint64,pay)void' | 'begin_trust_variation_upload', {
+      argsObj: TrustExperimentsArgs['obj']['begin_trust_variation_upload(uint64,uint64,pay)void']
+      argsTuple: TrustExperimentsArgs['tuple']['begin_trust_variation_upload(uint64,uint64,pay)void']
+      returns: TrustExperimentsReturns['begin_trust_variation_upload(uint64,uint64,pay)void']
+    }>
+    & Record<'write_trust_variation_chunk(uint8,uint64,byte[])void' | 'write_trust_variation_chunk', {
+      argsObj: TrustExperimentsArgs['obj']['write_trust_variation_chunk(uint8,uint64,byte[])void']
+      argsTuple: TrustExperimentsArgs['tuple']['write_trust_variation_chunk(uint8,uint64,byte[])void']
+      returns: TrustExperimentsReturns['write_trust_variation_chunk(uint8,uint64,byte[])void']
+    }>
+    & Record<'finalize_trust_variation_program(byte[])uint64' | 'finalize_trust_variation_program', {
+      argsObj: TrustExperimentsArgs['obj']['finalize_trust_variation_program(byte[])uint64']
+      argsTuple: TrustExperimentsArgs['tuple']['finalize_trust_variation_program(byte[])uint64']
+      returns: TrustExperimentsReturns['finalize_trust_variation_program(byte[])uint64']
+    }>
     & Record<'opt_in_to_asset(uint64,pay)void' | 'opt_in_to_asset', {
       argsObj: TrustExperimentsArgs['obj']['opt_in_to_asset(uint64,pay)void']
       argsTuple: TrustExperimentsArgs['tuple']['opt_in_to_asset(uint64,pay)void']
@@ -205,6 +332,31 @@ export type TrustExperimentsTypes = {
       argsTuple: TrustExperimentsArgs['tuple']['create_variation(uint32,string,uint64,uint64,uint64,uint64,uint64,uint64,pay,txn)uint64']
       returns: TrustExperimentsReturns['create_variation(uint32,string,uint64,uint64,uint64,uint64,uint64,uint64,pay,txn)uint64']
     }>
+    & Record<'create_variations(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64)[],pay,txn)uint64[]' | 'create_variations', {
+      argsObj: TrustExperimentsArgs['obj']['create_variations(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64)[],pay,txn)uint64[]']
+      argsTuple: TrustExperimentsArgs['tuple']['create_variations(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64)[],pay,txn)uint64[]']
+      returns: TrustExperimentsReturns['create_variations(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64)[],pay,txn)uint64[]']
+    }>
+    & Record<'deposit_treasury(uint32,uint64,txn)void' | 'deposit_treasury', {
+      argsObj: TrustExperimentsArgs['obj']['deposit_treasury(uint32,uint64,txn)void']
+      argsTuple: TrustExperimentsArgs['tuple']['deposit_treasury(uint32,uint64,txn)void']
+      returns: TrustExperimentsReturns['deposit_treasury(uint32,uint64,txn)void']
+    }>
+    & Record<'withdraw_treasury(uint32,uint64)void' | 'withdraw_treasury', {
+      argsObj: TrustExperimentsArgs['obj']['withdraw_treasury(uint32,uint64)void']
+      argsTuple: TrustExperimentsArgs['tuple']['withdraw_treasury(uint32,uint64)void']
+      returns: TrustExperimentsReturns['withdraw_treasury(uint32,uint64)void']
+    }>
+    & Record<'create_treasury_variation(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64),pay)uint64' | 'create_treasury_variation', {
+      argsObj: TrustExperimentsArgs['obj']['create_treasury_variation(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64),pay)uint64']
+      argsTuple: TrustExperimentsArgs['tuple']['create_treasury_variation(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64),pay)uint64']
+      returns: TrustExperimentsReturns['create_treasury_variation(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64),pay)uint64']
+    }>
+    & Record<'draw_escrow(uint32,uint32,uint64)void' | 'draw_escrow', {
+      argsObj: TrustExperimentsArgs['obj']['draw_escrow(uint32,uint32,uint64)void']
+      argsTuple: TrustExperimentsArgs['tuple']['draw_escrow(uint32,uint32,uint64)void']
+      returns: TrustExperimentsReturns['draw_escrow(uint32,uint32,uint64)void']
+    }>
     & Record<'create_experiment_with_variation(string,string,uint64,uint64,uint64,uint64,uint64,uint64,pay,txn)(uint32,uint64)' | 'create_experiment_with_variation', {
       argsObj: TrustExperimentsArgs['obj']['create_experiment_with_variation(string,string,uint64,uint64,uint64,uint64,uint64,uint64,pay,txn)(uint32,uint64)']
       argsTuple: TrustExperimentsArgs['tuple']['create_experiment_with_variation(string,string,uint64,uint64,uint64,uint64,uint64,uint64,pay,txn)(uint32,uint64)']
@@ -215,11 +367,31 @@ export type TrustExperimentsTypes = {
       argsTuple: TrustExperimentsArgs['tuple']['get_experiment(uint32)(uint32,address,string,uint64,uint64)']
       returns: TrustExperimentsReturns['get_experiment(uint32)(uint32,address,string,uint64,uint64)']
     }>
+    & Record<'get_experiments_by_owner(address,uint32,uint32)(uint32,address,string,uint64,uint64)[]' | 'get_experiments_by_owner', {
+      argsObj: TrustExperimentsArgs['obj']['get_experiments_by_owner(address,uint32,uint32)(uint32,address,string,uint64,uint64)[]']
+      argsTuple: TrustExperimentsArgs['tuple']['get_experiments_by_owner(address,uint32,uint32)(uint32,address,string,uint64,uint64)[]']
+      returns: TrustExperimentsReturns['get_experiments_by_owner(address,uint32,uint32)(uint32,address,string,uint64,uint64)[]']
+    }>
+    & Record<'get_treasury(uint32)(uint64,uint64)' | 'get_treasury', {
+      argsObj: TrustExperimentsArgs['obj']['get_treasury(uint32)(uint64,uint64)']
+      argsTuple: TrustExperimentsArgs['tuple']['get_treasury(uint32)(uint64,uint64)']
+      returns: TrustExperimentsReturns['get_treasury(uint32)(uint64,uint64)']
+    }>
     & Record<'get_variation(uint32,uint32)(uint32,uint64,string,uint64)' | 'get_variation', {
       argsObj: TrustExperimentsArgs['obj']['get_variation(uint32,uint32)(uint32,uint64,string,uint64)']
       argsTuple: TrustExperimentsArgs['tuple']['get_variation(uint32,uint32)(uint32,uint64,string,uint64)']
       returns: TrustExperimentsReturns['get_variation(uint32,uint32)(uint32,uint64,string,uint64)']
     }>
+    & Record<'get_variation_by_app(uint64)(uint32,(uint32,uint64,string,uint64))' | 'get_variation_by_app', {
+      argsObj: TrustExperimentsArgs['obj']['get_variation_by_app(uint64)(uint32,(uint32,uint64,string,uint64))']
+      argsTuple: TrustExperimentsArgs['tuple']['get_variation_by_app(uint64)(uint32,(uint32,uint64,string,uint64))']
+      returns: TrustExperimentsReturns['get_variation_by_app(uint64)(uint32,(uint32,uint64,string,uint64))']
+    }>
+    & Record<'get_variations(uint32,uint32,uint32)(uint32,uint64,string,uint64)[]' | 'get_variations', {
+      argsObj: TrustExperimentsArgs['obj']['get_variations(uint32,uint32,uint32)(uint32,uint64,string,uint64)[]']
+      argsTuple: TrustExperimentsArgs['tuple']['get_variations(uint32,uint32,uint32)(uint32,uint64,string,uint64)[]']
+      returns: TrustExperimentsReturns['get_variations(uint32,uint32,uint32)(uint32,uint64,string,uint64)[]']
+    }>
   /**
    * Defines the shape of the state of the application.
    */
@@ -228,6 +400,9 @@ export type TrustExperimentsTypes = {
       keys: {
         registryApp: bigint
         experimentCount: bigint
+        tvHash: BinaryState
+        tvVersion: bigint
+        tvReady: bigint
       }
       maps: {}
     }
@@ -239,6 +414,9 @@ export type TrustExperimentsTypes = {
       maps: {
         experiments: Map<bigint | number, ExperimentGroup>
         variations: Map<bigint | number, VariationInfo>
+        ownerExperiments: Map<string, number[]>
+        variationApps: Map<bigint | number, bigint>
+        treasuries: Map<bigint | number, Treasury>
       }
     }
   }
@@ -346,6 +524,57 @@ export abstract class TrustExperimentsParamsFactory {
       args: Array.isArray(params.args) ? params.args : [params.args.approval, params.args.clear, params.args.mbrPayment],
     }
   }
+  /**
+   * Constructs a no op call for the begin_trust_variation_upload(uint64,uint64,pay)void ABI method
+   *
+  * Create or resize the program boxes for a chunked upload. Resizing keeps
+  existing bytes, so an interrupted upload of the same program resumes where it stopped. The payment must cover any box growth; spawning is disabled until finalize_trust_variation_program succeeds.
+
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static beginTrustVariationUpload(params: CallParams<TrustExperimentsArgs['obj']['begin_trust_variation_upload(uint64,uint64,pay)void'] | TrustExperimentsArgs['tuple']['begin_trust_variation_upload(uint64,uint64,pay)void']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'begin_trust_variation_upload(uint64,uint64,pay)void' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.approvalSize, params.args.clearSize, params.args.mbrPayment],
+    }
+  }
+  /**
+   * Constructs a no op call for the write_trust_variation_chunk(uint8,uint64,byte[])void ABI method
+   *
+  * Write chunk at offset into the approval or clear box. Chunks are
+  independent, so they can be sent in any order and in parallel groups.
+
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static writeTrustVariationChunk(params: CallParams<TrustExperimentsArgs['obj']['write_trust_variation_chunk(uint8,uint64,byte[])void'] | TrustExperimentsArgs['tuple']['write_trust_variation_chunk(uint8,uint64,byte[])void']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'write_trust_variation_chunk(uint8,uint64,byte[])void' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.kind, params.args.offset, params.args.chunk],
+    }
+  }
+  /**
+   * Constructs a no op call for the finalize_trust_variation_program(byte[])uint64 ABI method
+   *
+  * Check the uploaded boxes against the deployer's program hash, record
+  it and bump tv_version. Returns the new version. Hashing 8 KB needs about 1,000 extra opcodes, drawn from op-up calls paid by the group's fees.
+
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static finalizeTrustVariationProgram(params: CallParams<TrustExperimentsArgs['obj']['finalize_trust_variation_program(byte[])uint64'] | TrustExperimentsArgs['tuple']['finalize_trust_variation_program(byte[])uint64']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'finalize_trust_variation_program(byte[])uint64' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.expectedHash],
+    }
+  }
   /**
    * Constructs a no op call for the opt_in_to_asset(uint64,pay)void ABI method
    *
@@ -389,6 +618,88 @@ export abstract class TrustExperimentsParamsFactory {
       args: Array.isArray(params.args) ? params.args : [params.args.expId, params.args.label, params.args.e1, params.args.e2, params.args.multiplier, params.args.unit, params.args.assetId, params.args.maxParticipants, params.args.mbrPayment, params.args.escrowFunding],
     }
   }
+  /**
+   * Constructs a no op call for the create_variations(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64)[],pay,txn)uint64[] ABI method
+   *
+  * Spawn several variations (e.g. every cell of a factorial design) in one
+  call. A single MBR leg covers every variation's app MBR and a single escrow leg carries the sum of the configs' escrow amounts, so all configs must share one payout asset. Any MBR surplus goes to the last variation.
+  At most MAX_VARIATIONS_PER_CALL configs per call. Each variation takes 4 inner transactions; the group needs one extra app call per 4 variations beyond the first 4 to pool enough inner-transaction budget. Returns the new app IDs in config order.
+
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static createVariations(params: CallParams<TrustExperimentsArgs['obj']['create_variations(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64)[],pay,txn)uint64[]'] | TrustExperimentsArgs['tuple']['create_variations(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64)[],pay,txn)uint64[]']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'create_variations(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64)[],pay,txn)uint64[]' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.expId, params.args.configs, params.args.mbrPayment, params.args.escrowFunding],
+    }
+  }
+  /**
+   * Constructs a no op call for the deposit_treasury(uint32,uint64,txn)void ABI method
+   *
+  * Add funds to the experiment treasury. The first deposit fixes the
+  treasury's payout asset; the treasury box MBR comes from the app account.
+
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static depositTreasury(params: CallParams<TrustExperimentsArgs['obj']['deposit_treasury(uint32,uint64,txn)void'] | TrustExperimentsArgs['tuple']['deposit_treasury(uint32,uint64,txn)void']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'deposit_treasury(uint32,uint64,txn)void' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.expId, params.args.assetId, params.args.funding],
+    }
+  }
+  /**
+   * Constructs a no op call for the withdraw_treasury(uint32,uint64)void ABI method
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static withdrawTreasury(params: CallParams<TrustExperimentsArgs['obj']['withdraw_treasury(uint32,uint64)void'] | TrustExperimentsArgs['tuple']['withdraw_treasury(uint32,uint64)void']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'withdraw_treasury(uint32,uint64)void' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.expId, params.args.amount],
+    }
+  }
+  /**
+   * Constructs a no op call for the create_treasury_variation(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64),pay)uint64 ABI method
+   *
+  * Spawn a variation with no escrow of its own: it draws payouts from the
+  experiment treasury as trustee decisions need them (see draw_escrow). Three inner transactions instead of four, and no capital locked per cell. params.escrow must be 0.
+
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static createTreasuryVariation(params: CallParams<TrustExperimentsArgs['obj']['create_treasury_variation(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64),pay)uint64'] | TrustExperimentsArgs['tuple']['create_treasury_variation(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64),pay)uint64']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'create_treasury_variation(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64),pay)uint64' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.expId, params.args.params, params.args.mbrPayment],
+    }
+  }
+  /**
+   * Constructs a no op call for the draw_escrow(uint32,uint32,uint64)void ABI method
+   *
+  * Inner call from a treasury-funded TrustVariation: send it amount from
+  the experiment treasury. Only the variation app recorded under (exp_id, var_id) may draw.
+
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static drawEscrow(params: CallParams<TrustExperimentsArgs['obj']['draw_escrow(uint32,uint32,uint64)void'] | TrustExperimentsArgs['tuple']['draw_escrow(uint32,uint32,uint64)void']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'draw_escrow(uint32,uint32,uint64)void' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.expId, params.args.varId, params.args.amount],
+    }
+  }
   /**
    * Constructs a no op call for the create_experiment_with_variation(string,string,uint64,uint64,uint64,uint64,uint64,uint64,pay,txn)(uint32,uint64) ABI method
    *
@@ -415,6 +726,36 @@ export abstract class TrustExperimentsParamsFactory {
       args: Array.isArray(params.args) ? params.args : [params.args.expId],
     }
   }
+  /**
+   * Constructs a no op call for the get_experiments_by_owner(address,uint32,uint32)(uint32,address,string,uint64,uint64)[] ABI method
+   *
+  * The owner's experiments start .. start + count - 1, in creation order.
+  Like get_variations, the page stops early at the end of the index or once the encoded result would overflow the return log.
+
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static getExperimentsByOwner(params: CallParams<TrustExperimentsArgs['obj']['get_experiments_by_owner(address,uint32,uint32)(uint32,address,string,uint64,uint64)[]'] | TrustExperimentsArgs['tuple']['get_experiments_by_owner(address,uint32,uint32)(uint32,address,string,uint64,uint64)[]']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'get_experiments_by_owner(address,uint32,uint32)(uint32,address,string,uint64,uint64)[]' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.owner, params.args.start, params.args.count],
+    }
+  }
+  /**
+   * Constructs a no op call for the get_treasury(uint32)(uint64,uint64) ABI method
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static getTreasury(params: CallParams<TrustExperimentsArgs['obj']['get_treasury(uint32)(uint64,uint64)'] | TrustExperimentsArgs['tuple']['get_treasury(uint32)(uint64,uint64)']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'get_treasury(uint32)(uint64,uint64)' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.expId],
+    }
+  }
   /**
    * Constructs a no op call for the get_variation(uint32,uint32)(uint32,uint64,string,uint64) ABI method
    *
@@ -428,6 +769,39 @@ export abstract class TrustExperimentsParamsFactory {
       args: Array.isArray(params.args) ? params.args : [params.args.expId, params.args.varId],
     }
   }
+  /**
+   * Constructs a no op call for the get_variation_by_app(uint64)(uint32,(uint32,uint64,string,uint64)) ABI method
+   *
+  * Resolve a TrustVariation app ID to its exp_id and variation record.
+
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static getVariationByApp(params: CallParams<TrustExperimentsArgs['obj']['get_variation_by_app(uint64)(uint32,(uint32,uint64,string,uint64))'] | TrustExperimentsArgs['tuple']['get_variation_by_app(uint64)(uint32,(uint32,uint64,string,uint64))']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'get_variation_by_app(uint64)(uint32,(uint32,uint64,string,uint64))' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.appId],
+    }
+  }
+  /**
+   * Constructs a no op call for the get_variations(uint32,uint32,uint32)(uint32,uint64,string,uint64)[] ABI method
+   *
+  * Variations start .. start + count - 1 of an experiment, in var_id order.
+  The page stops early at variation_count, or once the encoded result would overflow the return log (labels are variable length); continue from start + len(page) while that is below variation_count.
+
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static getVariations(params: CallParams<TrustExperimentsArgs['obj']['get_variations(uint32,uint32,uint32)(uint32,uint64,string,uint64)[]'] | TrustExperimentsArgs['tuple']['get_variations(uint32,uint32,uint32)(uint32,uint64,string,uint64)[]']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'get_variations(uint32,uint32,uint32)(uint32,uint64,string,uint64)[]' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.expId, params.args.start, params.args.count],
+    }
+  }
 }
 
 /**
@@ -671,6 +1045,48 @@ export class TrustExperimentsClient {
       return this.appClient.params.call(TrustExperimentsParamsFactory.setTrustVariationProgram(params))
     },
 
+    /**
+     * Makes a call to the TrustExperiments smart contract using the `begin_trust_variation_upload(uint64,uint64,pay)void` ABI method.
+     *
+    * Create or resize the program boxes for a chunked upload. Resizing keeps
+    existing bytes, so an interrupted upload of the same program resumes where it stopped. The payment must cover any box growth; spawning is disabled until finalize_trust_variation_program succeeds.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    beginTrustVariationUpload: (params: CallParams<TrustExperimentsArgs['obj']['begin_trust_variation_upload(uint64,uint64,pay)void'] | TrustExperimentsArgs['tuple']['begin_trust_variation_upload(uint64,uint64,pay)void']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.params.call(TrustExperimentsParamsFactory.beginTrustVariationUpload(params))
+    },
+
+    /**
+     * Makes a call to the TrustExperiments smart contract using the `write_trust_variation_chunk(uint8,uint64,byte[])void` ABI method.
+     *
+    * Write chunk at offset into the approval or clear box. Chunks are
+    independent, so they can be sent in any order and in parallel groups.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    writeTrustVariationChunk: (params: CallParams<TrustExperimentsArgs['obj']['write_trust_variation_chunk(uint8,uint64,byte[])void'] | TrustExperimentsArgs['tuple']['write_trust_variation_chunk(uint8,uint64,byte[])void']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.params.call(TrustExperimentsParamsFactory.writeTrustVariationChunk(params))
+    },
+
+    /**
+     * Makes a call to the TrustExperiments smart contract using the `finalize_trust_variation_program(byte[])uint64` ABI method.
+     *
+    * Check the uploaded boxes against the deployer's program hash, record
+    it and bump tv_version. Returns the new version. Hashing 8 KB needs about 1,000 extra opcodes, drawn from op-up calls paid by the group's fees.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    finalizeTrustVariationProgram: (params: CallParams<TrustExperimentsArgs['obj']['finalize_trust_variation_program(byte[])uint64'] | TrustExperimentsArgs['tuple']['finalize_trust_variation_program(byte[])uint64']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.params.call(TrustExperimentsParamsFactory.finalizeTrustVariationProgram(params))
+    },
+
     /**
      * Makes a call to the TrustExperiments smart contract using the `opt_in_to_asset(uint64,pay)void` ABI method.
      *
@@ -706,86 +1122,254 @@ export class TrustExperimentsClient {
     },
 
     /**
-     * Makes a call to the TrustExperiments smart contract using the `create_experiment_with_variation(string,string,uint64,uint64,uint64,uint64,uint64,uint64,pay,txn)(uint32,uint64)` ABI method.
+     * Makes a call to the TrustExperiments smart contract using the `create_variations(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64)[],pay,txn)uint64[]` ABI method.
+     *
+    * Spawn several variations (e.g. every cell of a factorial design) in one
+    call. A single MBR leg covers every variation's app MBR and a single escrow leg carries the sum of the configs' escrow amounts, so all configs must share one payout asset. Any MBR surplus goes to the last variation.
+    At most MAX_VARIATIONS_PER_CALL configs per call. Each variation takes 4 inner transactions; the group needs one extra app call per 4 variations beyond the first 4 to pool enough inner-transaction budget. Returns the new app IDs in config order.
+
      *
      * @param params The params for the smart contract call
      * @returns The call params
      */
-    createExperimentWithVariation: (params: CallParams<TrustExperimentsArgs['obj']['create_experiment_with_variation(string,string,uint64,uint64,uint64,uint64,uint64,uint64,pay,txn)(uint32,uint64)'] | TrustExperimentsArgs['tuple']['create_experiment_with_variation(string,string,uint64,uint64,uint64,uint64,uint64,uint64,pay,txn)(uint32,uint64)']> & { onComplete?: OnApplicationComplete.NoOp }) => {
-      return this.appClient.params.call(TrustExperimentsParamsFactory.createExperimentWithVariation(params))
+    createVariations: (params: CallParams<TrustExperimentsArgs['obj']['create_variations(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64)[],pay,txn)uint64[]'] | TrustExperimentsArgs['tuple']['create_variations(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64)[],pay,txn)uint64[]']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.params.call(TrustExperimentsParamsFactory.createVariations(params))
     },
 
     /**
-     * Makes a call to the TrustExperiments smart contract using the `get_experiment(uint32)(uint32,address,string,uint64,uint64)` ABI method.
-     * 
-     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     * Makes a call to the TrustExperiments smart contract using the `deposit_treasury(uint32,uint64,txn)void` ABI method.
+     *
+    * Add funds to the experiment treasury. The first deposit fixes the
+    treasury's payout asset; the treasury box MBR comes from the app account.
+
      *
      * @param params The params for the smart contract call
      * @returns The call params
      */
-    getExperiment: (params: CallParams<TrustExperimentsArgs['obj']['get_experiment(uint32)(uint32,address,string,uint64,uint64)'] | TrustExperimentsArgs['tuple']['get_experiment(uint32)(uint32,address,string,uint64,uint64)']> & { onComplete?: OnApplicationComplete.NoOp }) => {
-      return this.appClient.params.call(TrustExperimentsParamsFactory.getExperiment(params))
+    depositTreasury: (params: CallParams<TrustExperimentsArgs['obj']['deposit_treasury(uint32,uint64,txn)void'] | TrustExperimentsArgs['tuple']['deposit_treasury(uint32,uint64,txn)void']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.params.call(TrustExperimentsParamsFactory.depositTreasury(params))
     },
 
     /**
-     * Makes a call to the TrustExperiments smart contract using the `get_variation(uint32,uint32)(uint32,uint64,string,uint64)` ABI method.
-     * 
-     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     * Makes a call to the TrustExperiments smart contract using the `withdraw_treasury(uint32,uint64)void` ABI method.
      *
      * @param params The params for the smart contract call
      * @returns The call params
      */
-    getVariation: (params: CallParams<TrustExperimentsArgs['obj']['get_variation(uint32,uint32)(uint32,uint64,string,uint64)'] | TrustExperimentsArgs['tuple']['get_variation(uint32,uint32)(uint32,uint64,string,uint64)']> & { onComplete?: OnApplicationComplete.NoOp }) => {
-      return this.appClient.params.call(TrustExperimentsParamsFactory.getVariation(params))
+    withdrawTreasury: (params: CallParams<TrustExperimentsArgs['obj']['withdraw_treasury(uint32,uint64)void'] | TrustExperimentsArgs['tuple']['withdraw_treasury(uint32,uint64)void']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.params.call(TrustExperimentsParamsFactory.withdrawTreasury(params))
     },
 
-  }
-
-  /**
-   * Create transactions for the current app
-   */
-  readonly createTransaction = {
     /**
-     * Makes a clear_state call to an existing instance of the TrustExperiments smart contract.
+     * Makes a call to the TrustExperiments smart contract using the `create_treasury_variation(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64),pay)uint64` ABI method.
      *
-     * @param params The params for the bare (raw) call
-     * @returns The clearState result
-     */
-    clearState: (params?: Expand<AppClientBareCallParams>) => {
-      return this.appClient.createTransaction.bare.clearState(params)
-    },
+    * Spawn a variation with no escrow of its own: it draws payouts from the
+    experiment treasury as trustee decisions need them (see draw_escrow). Three inner transactions instead of four, and no capital locked per cell. params.escrow must be 0.
 
-    /**
-     * Makes a call to the TrustExperiments smart contract using the `set_trust_variation_program(byte[],byte[],pay)void` ABI method.
      *
      * @param params The params for the smart contract call
-     * @returns The call transaction
+     * @returns The call params
      */
-    setTrustVariationProgram: (params: CallParams<TrustExperimentsArgs['obj']['set_trust_variation_program(byte[],byte[],pay)void'] | TrustExperimentsArgs['tuple']['set_trust_variation_program(byte[],byte[],pay)void']> & { onComplete?: OnApplicationComplete.NoOp }) => {
-      return this.appClient.createTransaction.call(TrustExperimentsParamsFactory.setTrustVariationProgram(params))
+    createTreasuryVariation: (params: CallParams<TrustExperimentsArgs['obj']['create_treasury_variation(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64),pay)uint64'] | TrustExperimentsArgs['tuple']['create_treasury_variation(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64),pay)uint64']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.params.call(TrustExperimentsParamsFactory.createTreasuryVariation(params))
     },
 
     /**
-     * Makes a call to the TrustExperiments smart contract using the `opt_in_to_asset(uint64,pay)void` ABI method.
+     * Makes a call to the TrustExperiments smart contract using the `draw_escrow(uint32,uint32,uint64)void` ABI method.
      *
-    * One-time per-asset setup: opt the TrustExperiments app account into
-    an ASA so it can receive escrow asset-transfer legs from experimenters. Idempotent — no-op if already opted in. Caller pays the 0.1 ALGO MBR that the opt-in adds to this contract's account.
+    * Inner call from a treasury-funded TrustVariation: send it amount from
+    the experiment treasury. Only the variation app recorded under (exp_id, var_id) may draw.
 
      *
      * @param params The params for the smart contract call
-     * @returns The call transaction
+     * @returns The call params
      */
-    optInToAsset: (params: CallParams<TrustExperimentsArgs['obj']['opt_in_to_asset(uint64,pay)void'] | TrustExperimentsArgs['tuple']['opt_in_to_asset(uint64,pay)void']> & { onComplete?: OnApplicationComplete.NoOp }) => {
-      return this.appClient.createTransaction.call(TrustExperimentsParamsFactory.optInToAsset(params))
+    drawEscrow: (params: CallParams<TrustExperimentsArgs['obj']['draw_escrow(uint32,uint32,uint64)void'] | TrustExperimentsArgs['tuple']['draw_escrow(uint32,uint32,uint64)void']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.params.call(TrustExperimentsParamsFactory.drawEscrow(params))
     },
 
     /**
-     * Makes a call to the TrustExperiments smart contract using the `create_experiment(string)uint32` ABI method.
+     * Makes a call to the TrustExperiments smart contract using the `create_experiment_with_variation(string,string,uint64,uint64,uint64,uint64,uint64,uint64,pay,txn)(uint32,uint64)` ABI method.
      *
      * @param params The params for the smart contract call
-     * @returns The call transaction
+     * @returns The call params
      */
-    createExperiment: (params: CallParams<TrustExperimentsArgs['obj']['create_experiment(string)uint32'] | TrustExperimentsArgs['tuple']['create_experiment(string)uint32']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+    createExperimentWithVariation: (params: CallParams<TrustExperimentsArgs['obj']['create_experiment_with_variation(string,string,uint64,uint64,uint64,uint64,uint64,uint64,pay,txn)(uint32,uint64)'] | TrustExperimentsArgs['tuple']['create_experiment_with_variation(string,string,uint64,uint64,uint64,uint64,uint64,uint64,pay,txn)(uint32,uint64)']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.params.call(TrustExperimentsParamsFactory.createExperimentWithVariation(params))
+    },
+
+    /**
+     * Makes a call to the TrustExperiments smart contract using the `get_experiment(uint32)(uint32,address,string,uint64,uint64)` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    getExperiment: (params: CallParams<TrustExperimentsArgs['obj']['get_experiment(uint32)(uint32,address,string,uint64,uint64)'] | TrustExperimentsArgs['tuple']['get_experiment(uint32)(uint32,address,string,uint64,uint64)']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.params.call(TrustExperimentsParamsFactory.getExperiment(params))
+    },
+
+    /**
+     * Makes a call to the TrustExperiments smart contract using the `get_experiments_by_owner(address,uint32,uint32)(uint32,address,string,uint64,uint64)[]` ABI method.
+     *
+    * The owner's experiments start .. start + count - 1, in creation order.
+    Like get_variations, the page stops early at the end of the index or once the encoded result would overflow the return log.
+
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    getExperimentsByOwner: (params: CallParams<TrustExperimentsArgs['obj']['get_experiments_by_owner(address,uint32,uint32)(uint32,address,string,uint64,uint64)[]'] | TrustExperimentsArgs['tuple']['get_experiments_by_owner(address,uint32,uint32)(uint32,address,string,uint64,uint64)[]']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.params.call(TrustExperimentsParamsFactory.getExperimentsByOwner(params))
+    },
+
+    /**
+     * Makes a call to the TrustExperiments smart contract using the `get_treasury(uint32)(uint64,uint64)` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    getTreasury: (params: CallParams<TrustExperimentsArgs['obj']['get_treasury(uint32)(uint64,uint64)'] | TrustExperimentsArgs['tuple']['get_treasury(uint32)(uint64,uint64)']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.params.call(TrustExperimentsParamsFactory.getTreasury(params))
+    },
+
+    /**
+     * Makes a call to the TrustExperiments smart contract using the `get_variation(uint32,uint32)(uint32,uint64,string,uint64)` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    getVariation: (params: CallParams<TrustExperimentsArgs['obj']['get_variation(uint32,uint32)(uint32,uint64,string,uint64)'] | TrustExperimentsArgs['tuple']['get_variation(uint32,uint32)(uint32,uint64,string,uint64)']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.params.call(TrustExperimentsParamsFactory.getVariation(params))
+    },
+
+    /**
+     * Makes a call to the TrustExperiments smart contract using the `get_variation_by_app(uint64)(uint32,(uint32,uint64,string,uint64))` ABI method.
+     *
+    * Resolve a TrustVariation app ID to its exp_id and variation record.
+
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    getVariationByApp: (params: CallParams<TrustExperimentsArgs['obj']['get_variation_by_app(uint64)(uint32,(uint32,uint64,string,uint64))'] | TrustExperimentsArgs['tuple']['get_variation_by_app(uint64)(uint32,(uint32,uint64,string,uint64))']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.params.call(TrustExperimentsParamsFactory.getVariationByApp(params))
+    },
+
+    /**
+     * Makes a call to the TrustExperiments smart contract using the `get_variations(uint32,uint32,uint32)(uint32,uint64,string,uint64)[]` ABI method.
+     *
+    * Variations start .. start + count - 1 of an experiment, in var_id order.
+    The page stops early at variation_count, or once the encoded result would overflow the return log (labels are variable length); continue from start + len(page) while that is below variation_count.
+
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    getVariations: (params: CallParams<TrustExperimentsArgs['obj']['get_variations(uint32,uint32,uint32)(uint32,uint64,string,uint64)[]'] | TrustExperimentsArgs['tuple']['get_variations(uint32,uint32,uint32)(uint32,uint64,string,uint64)[]']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.params.call(TrustExperimentsParamsFactory.getVariations(params))
+    },
+
+  }
+
+  /**
+   * Create transactions for the current app
+   */
+  readonly createTransaction = {
+    /**
+     * Makes a clear_state call to an existing instance of the TrustExperiments smart contract.
+     *
+     * @param params The params for the bare (raw) call
+     * @returns The clearState result
+     */
+    clearState: (params?: Expand<AppClientBareCallParams>) => {
+      return this.appClient.createTransaction.bare.clearState(params)
+    },
+
+    /**
+     * Makes a call to the TrustExperiments smart contract using the `set_trust_variation_program(byte[],byte[],pay)void` ABI method.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    setTrustVariationProgram: (params: CallParams<TrustExperimentsArgs['obj']['set_trust_variation_program(byte[],byte[],pay)void'] | TrustExperimentsArgs['tuple']['set_trust_variation_program(byte[],byte[],pay)void']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.createTransaction.call(TrustExperimentsParamsFactory.setTrustVariationProgram(params))
+    },
+
+    /**
+     * Makes a call to the TrustExperiments smart contract using the `begin_trust_variation_upload(uint64,uint64,pay)void` ABI method.
+     *
+    * Create or resize the program boxes for a chunked upload. Resizing keeps
+    existing bytes, so an interrupted upload of the same program resumes where it stopped. The payment must cover any box growth; spawning is disabled until finalize_trust_variation_program succeeds.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    beginTrustVariationUpload: (params: CallParams<TrustExperimentsArgs['obj']['begin_trust_variation_upload(uint64,uint64,pay)void'] | TrustExperimentsArgs['tuple']['begin_trust_variation_upload(uint64,uint64,pay)void']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.createTransaction.call(TrustExperimentsParamsFactory.beginTrustVariationUpload(params))
+    },
+
+    /**
+     * Makes a call to the TrustExperiments smart contract using the `write_trust_variation_chunk(uint8,uint64,byte[])void` ABI method.
+     *
+    * Write chunk at offset into the approval or clear box. Chunks are
+    independent, so they can be sent in any order and in parallel groups.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    writeTrustVariationChunk: (params: CallParams<TrustExperimentsArgs['obj']['write_trust_variation_chunk(uint8,uint64,byte[])void'] | TrustExperimentsArgs['tuple']['write_trust_variation_chunk(uint8,uint64,byte[])void']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.createTransaction.call(TrustExperimentsParamsFactory.writeTrustVariationChunk(params))
+    },
+
+    /**
+     * Makes a call to the TrustExperiments smart contract using the `finalize_trust_variation_program(byte[])uint64` ABI method.
+     *
+    * Check the uploaded boxes against the deployer's program hash, record
+    it and bump tv_version. Returns the new version. Hashing 8 KB needs about 1,000 extra opcodes, drawn from op-up calls paid by the group's fees.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    finalizeTrustVariationProgram: (params: CallParams<TrustExperimentsArgs['obj']['finalize_trust_variation_program(byte[])uint64'] | TrustExperimentsArgs['tuple']['finalize_trust_variation_program(byte[])uint64']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.createTransaction.call(TrustExperimentsParamsFactory.finalizeTrustVariationProgram(params))
+    },
+
+    /**
+     * Makes a call to the TrustExperiments smart contract using the `opt_in_to_asset(uint64,pay)void` ABI method.
+     *
+    * One-time per-asset setup: opt the TrustExperiments app account into
+    an ASA so it can receive escrow asset-transfer legs from experimenters. Idempotent — no-op if already opted in. Caller pays the 0.1 ALGO MBR that the opt-in adds to this contract's account.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    optInToAsset: (params: CallParams<TrustExperimentsArgs['obj']['opt_in_to_asset(uint64,pay)void'] | TrustExperimentsArgs['tuple']['opt_in_to_asset(uint64,pay)void']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.createTransaction.call(TrustExperimentsParamsFactory.optInToAsset(params))
+    },
+
+    /**
+     * Makes a call to the TrustExperiments smart contract using the `create_experiment(string)uint32` ABI method.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    createExperiment: (params: CallParams<TrustExperimentsArgs['obj']['create_experiment(string)uint32'] | TrustExperimentsArgs['tuple']['create_experiment(string)uint32']> & { onComplete?: OnApplicationComplete.NoOp }) => {
       return this.appClient.createTransaction.call(TrustExperimentsParamsFactory.createExperiment(params))
     },
 
@@ -799,6 +1383,73 @@ export class TrustExperimentsClient {
       return this.appClient.createTransaction.call(TrustExperimentsParamsFactory.createVariation(params))
     },
 
+    /**
+     * Makes a call to the TrustExperiments smart contract using the `create_variations(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64)[],pay,txn)uint64[]` ABI method.
+     *
+    * Spawn several variations (e.g. every cell of a factorial design) in one
+    call. A single MBR leg covers every variation's app MBR and a single escrow leg carries the sum of the configs' escrow amounts, so all configs must share one payout asset. Any MBR surplus goes to the last variation.
+    At most MAX_VARIATIONS_PER_CALL configs per call. Each variation takes 4 inner transactions; the group needs one extra app call per 4 variations beyond the first 4 to pool enough inner-transaction budget. Returns the new app IDs in config order.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    createVariations: (params: CallParams<TrustExperimentsArgs['obj']['create_variations(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64)[],pay,txn)uint64[]'] | TrustExperimentsArgs['tuple']['create_variations(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64)[],pay,txn)uint64[]']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.createTransaction.call(TrustExperimentsParamsFactory.createVariations(params))
+    },
+
+    /**
+     * Makes a call to the TrustExperiments smart contract using the `deposit_treasury(uint32,uint64,txn)void` ABI method.
+     *
+    * Add funds to the experiment treasury. The first deposit fixes the
+    treasury's payout asset; the treasury box MBR comes from the app account.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    depositTreasury: (params: CallParams<TrustExperimentsArgs['obj']['deposit_treasury(uint32,uint64,txn)void'] | TrustExperimentsArgs['tuple']['deposit_treasury(uint32,uint64,txn)void']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.createTransaction.call(TrustExperimentsParamsFactory.depositTreasury(params))
+    },
+
+    /**
+     * Makes a call to the TrustExperiments smart contract using the `withdraw_treasury(uint32,uint64)void` ABI method.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    withdrawTreasury: (params: CallParams<TrustExperimentsArgs['obj']['withdraw_treasury(uint32,uint64)void'] | TrustExperimentsArgs['tuple']['withdraw_treasury(uint32,uint64)void']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.createTransaction.call(TrustExperimentsParamsFactory.withdrawTreasury(params))
+    },
+
+    /**
+     * Makes a call to the TrustExperiments smart contract using the `create_treasury_variation(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64),pay)uint64` ABI method.
+     *
+    * Spawn a variation with no escrow of its own: it draws payouts from the
+    experiment treasury as trustee decisions need them (see draw_escrow). Three inner transactions instead of four, and no capital locked per cell. params.escrow must be 0.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    createTreasuryVariation: (params: CallParams<TrustExperimentsArgs['obj']['create_treasury_variation(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64),pay)uint64'] | TrustExperimentsArgs['tuple']['create_treasury_variation(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64),pay)uint64']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.createTransaction.call(TrustExperimentsParamsFactory.createTreasuryVariation(params))
+    },
+
+    /**
+     * Makes a call to the TrustExperiments smart contract using the `draw_escrow(uint32,uint32,uint64)void` ABI method.
+     *
+    * Inner call from a treasury-funded TrustVariation: send it amount from
+    the experiment treasury. Only the variation app recorded under (exp_id, var_id) may draw.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    drawEscrow: (params: CallParams<TrustExperimentsArgs['obj']['draw_escrow(uint32,uint32,uint64)void'] | TrustExperimentsArgs['tuple']['draw_escrow(uint32,uint32,uint64)void']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.createTransaction.call(TrustExperimentsParamsFactory.drawEscrow(params))
+    },
+
     /**
      * Makes a call to the TrustExperiments smart contract using the `create_experiment_with_variation(string,string,uint64,uint64,uint64,uint64,uint64,uint64,pay,txn)(uint32,uint64)` ABI method.
      *
@@ -821,6 +1472,34 @@ export class TrustExperimentsClient {
       return this.appClient.createTransaction.call(TrustExperimentsParamsFactory.getExperiment(params))
     },
 
+    /**
+     * Makes a call to the TrustExperiments smart contract using the `get_experiments_by_owner(address,uint32,uint32)(uint32,address,string,uint64,uint64)[]` ABI method.
+     *
+    * The owner's experiments start .. start + count - 1, in creation order.
+    Like get_variations, the page stops early at the end of the index or once the encoded result would overflow the return log.
+
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    getExperimentsByOwner: (params: CallParams<TrustExperimentsArgs['obj']['get_experiments_by_owner(address,uint32,uint32)(uint32,address,string,uint64,uint64)[]'] | TrustExperimentsArgs['tuple']['get_experiments_by_owner(address,uint32,uint32)(uint32,address,string,uint64,uint64)[]']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.createTransaction.call(TrustExperimentsParamsFactory.getExperimentsByOwner(params))
+    },
+
+    /**
+     * Makes a call to the TrustExperiments smart contract using the `get_treasury(uint32)(uint64,uint64)` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    getTreasury: (params: CallParams<TrustExperimentsArgs['obj']['get_treasury(uint32)(uint64,uint64)'] | TrustExperimentsArgs['tuple']['get_treasury(uint32)(uint64,uint64)']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.createTransaction.call(TrustExperimentsParamsFactory.getTreasury(params))
+    },
+
     /**
      * Makes a call to the TrustExperiments smart contract using the `get_variation(uint32,uint32)(uint32,uint64,string,uint64)` ABI method.
      * 
@@ -833,6 +1512,37 @@ export class TrustExperimentsClient {
       return this.appClient.createTransaction.call(TrustExperimentsParamsFactory.getVariation(params))
     },
 
+    /**
+     * Makes a call to the TrustExperiments smart contract using the `get_variation_by_app(uint64)(uint32,(uint32,uint64,string,uint64))` ABI method.
+     *
+    * Resolve a TrustVariation app ID to its exp_id and variation record.
+
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    getVariationByApp: (params: CallParams<TrustExperimentsArgs['obj']['get_variation_by_app(uint64)(uint32,(uint32,uint64,string,uint64))'] | TrustExperimentsArgs['tuple']['get_variation_by_app(uint64)(uint32,(uint32,uint64,string,uint64))']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.createTransaction.call(TrustExperimentsParamsFactory.getVariationByApp(params))
+    },
+
+    /**
+     * Makes a call to the TrustExperiments smart contract using the `get_variations(uint32,uint32,uint32)(uint32,uint64,string,uint64)[]` ABI method.
+     *
+    * Variations start .. start + count - 1 of an experiment, in var_id order.
+    The page stops early at variation_count, or once the encoded result would overflow the return log (labels are variable length); continue from start + len(page) while that is below variation_count.
+
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    getVariations: (params: CallParams<TrustExperimentsArgs['obj']['get_variations(uint32,uint32,uint32)(uint32,uint64,string,uint64)[]'] | TrustExperimentsArgs['tuple']['get_variations(uint32,uint32,uint32)(uint32,uint64,string,uint64)[]']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.createTransaction.call(TrustExperimentsParamsFactory.getVariations(params))
+    },
+
   }
 
   /**
@@ -860,6 +1570,51 @@ export class TrustExperimentsClient {
       return {...result, return: result.return as unknown as (undefined | TrustExperimentsReturns['set_trust_variation_program(byte[],byte[],pay)void'])}
     },
 
+    /**
+     * Makes a call to the TrustExperiments smart contract using the `begin_trust_variation_upload(uint64,uint64,pay)void` ABI method.
+     *
+    * Create or resize the program boxes for a chunked upload. Resizing keeps
+    existing bytes, so an interrupted upload of the same program resumes where it stopped. The payment must cover any box growth; spawning is disabled until finalize_trust_variation_program succeeds.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    beginTrustVariationUpload: async (params: CallParams<TrustExperimentsArgs['obj']['begin_trust_variation_upload(uint64,uint64,pay)void'] | TrustExperimentsArgs['tuple']['begin_trust_variation_upload(uint64,uint64,pay)void']> & SendParams & { onComplete?: OnApplicationComplete.NoOp }) => {
+      const result = await this.appClient.send.call(TrustExperimentsParamsFactory.beginTrustVariationUpload(params))
+      return {...result, return: result.return as unknown as (undefined | TrustExperimentsReturns['begin_trust_variation_upload(uint64,uint64,pay)void'])}
+    },
+
+    /**
+     * Makes a call to the TrustExperiments smart contract using the `write_trust_variation_chunk(uint8,uint64,byte[])void` ABI method.
+     *
+    * Write chunk at offset into the approval or clear box. Chunks are
+    independent, so they can be sent in any order and in parallel groups.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    writeTrustVariationChunk: async (params: CallParams<TrustExperimentsArgs['obj']['write_trust_variation_chunk(uint8,uint64,byte[])void'] | TrustExperimentsArgs['tuple']['write_trust_variation_chunk(uint8,uint64,byte[])void']> & SendParams & { onComplete?: OnApplicationComplete.NoOp }) => {
+      const result = await this.appClient.send.call(TrustExperimentsParamsFactory.writeTrustVariationChunk(params))
+      return {...result, return: result.return as unknown as (undefined | TrustExperimentsReturns['write_trust_variation_chunk(uint8,uint64,byte[])void'])}
+    },
+
+    /**
+     * Makes a call to the TrustExperiments smart contract using the `finalize_trust_variation_program(byte[])uint64` ABI method.
+     *
+    * Check the uploaded boxes against the deployer's program hash, record
+    it and bump tv_version. Returns the new version. Hashing 8 KB needs about 1,000 extra opcodes, drawn from op-up calls paid by the group's fees.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    finalizeTrustVariationProgram: async (params: CallParams<TrustExperimentsArgs['obj']['finalize_trust_variation_program(byte[])uint64'] | TrustExperimentsArgs['tuple']['finalize_trust_variation_program(byte[])uint64']> & SendParams & { onComplete?: OnApplicationComplete.NoOp }) => {
+      const result = await this.appClient.send.call(TrustExperimentsParamsFactory.finalizeTrustVariationProgram(params))
+      return {...result, return: result.return as unknown as (undefined | TrustExperimentsReturns['finalize_trust_variation_program(byte[])uint64'])}
+    },
+
     /**
      * Makes a call to the TrustExperiments smart contract using the `opt_in_to_asset(uint64,pay)void` ABI method.
      *
@@ -870,68 +1625,203 @@ export class TrustExperimentsClient {
      * @param params The params for the smart contract call
      * @returns The call result
      */
-    optInToAsset: async (params: CallParams<TrustExperimentsArgs['obj']['opt_in_to_asset(uint64,pay)void'] | TrustExperimentsArgs['tuple']['opt_in_to_asset(uint64,pay)void']> & SendParams & { onComplete?: OnApplicationComplete.NoOp }) => {
-      const result = await this.appClient.send.call(TrustExperimentsParamsFactory.optInToAsset(params))
-      return {...result, return: result.return as unknown as (undefined | TrustExperimentsReturns['opt_in_to_asset(uint64,pay)void'])}
+    optInToAsset: async (params: CallParams<TrustExperimentsArgs['obj']['opt_in_to_asset(uint64,pay)void'] | TrustExperimentsArgs['tuple']['opt_in_to_asset(uint64,pay)void']> & SendParams & { onComplete?: OnApplicationComplete.NoOp }) => {
+      const result = await this.appClient.send.call(TrustExperimentsParamsFactory.optInToAsset(params))
+      return {...result, return: result.return as unknown as (undefined | TrustExperimentsReturns['opt_in_to_asset(uint64,pay)void'])}
+    },
+
+    /**
+     * Makes a call to the TrustExperiments smart contract using the `create_experiment(string)uint32` ABI method.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    createExperiment: async (params: CallParams<TrustExperimentsArgs['obj']['create_experiment(string)uint32'] | TrustExperimentsArgs['tuple']['create_experiment(string)uint32']> & SendParams & { onComplete?: OnApplicationComplete.NoOp }) => {
+      const result = await this.appClient.send.call(TrustExperimentsParamsFactory.createExperiment(params))
+      return {...result, return: result.return as unknown as (undefined | TrustExperimentsReturns['create_experiment(string)uint32'])}
+    },
+
+    /**
+     * Makes a call to the TrustExperiments smart contract using the `create_variation(uint32,string,uint64,uint64,uint64,uint64,uint64,uint64,pay,txn)uint64` ABI method.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    createVariation: async (params: CallParams<TrustExperimentsArgs['obj']['create_variation(uint32,string,uint64,uint64,uint64,uint64,uint64,uint64,pay,txn)uint64'] | TrustExperimentsArgs['tuple']['create_variation(uint32,string,uint64,uint64,uint64,uint64,uint64,uint64,pay,txn)uint64']> & SendParams & { onComplete?: OnApplicationComplete.NoOp }) => {
+      const result = await this.appClient.send.call(TrustExperimentsParamsFactory.createVariation(params))
+      return {...result, return: result.return as unknown as (undefined | TrustExperimentsReturns['create_variation(uint32,string,uint64,uint64,uint64,uint64,uint64,uint64,pay,txn)uint64'])}
+    },
+
+    /**
+     * Makes a call to the TrustExperiments smart contract using the `create_variations(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64)[],pay,txn)uint64[]` ABI method.
+     *
+    * Spawn several variations (e.g. every cell of a factorial design) in one
+    call. A single MBR leg covers every variation's app MBR and a single escrow leg carries the sum of the configs' escrow amounts, so all configs must share one payout asset. Any MBR surplus goes to the last variation.
+    At most MAX_VARIATIONS_PER_CALL configs per call. Each variation takes 4 inner transactions; the group needs one extra app call per 4 variations beyond the first 4 to pool enough inner-transaction budget. Returns the new app IDs in config order.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    createVariations: async (params: CallParams<TrustExperimentsArgs['obj']['create_variations(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64)[],pay,txn)uint64[]'] | TrustExperimentsArgs['tuple']['create_variations(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64)[],pay,txn)uint64[]']> & SendParams & { onComplete?: OnApplicationComplete.NoOp }) => {
+      const result = await this.appClient.send.call(TrustExperimentsParamsFactory.createVariations(params))
+      return {...result, return: result.return as unknown as (undefined | TrustExperimentsReturns['create_variations(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64)[],pay,txn)uint64[]'])}
+    },
+
+    /**
+     * Makes a call to the TrustExperiments smart contract using the `deposit_treasury(uint32,uint64,txn)void` ABI method.
+     *
+    * Add funds to the experiment treasury. The first deposit fixes the
+    treasury's payout asset; the treasury box MBR comes from the app account.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    depositTreasury: async (params: CallParams<TrustExperimentsArgs['obj']['deposit_treasury(uint32,uint64,txn)void'] | TrustExperimentsArgs['tuple']['deposit_treasury(uint32,uint64,txn)void']> & SendParams & { onComplete?: OnApplicationComplete.NoOp }) => {
+      const result = await this.appClient.send.call(TrustExperimentsParamsFactory.depositTreasury(params))
+      return {...result, return: result.return as unknown as (undefined | TrustExperimentsReturns['deposit_treasury(uint32,uint64,txn)void'])}
+    },
+
+    /**
+     * Makes a call to the TrustExperiments smart contract using the `withdraw_treasury(uint32,uint64)void` ABI method.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    withdrawTreasury: async (params: CallParams<TrustExperimentsArgs['obj']['withdraw_treasury(uint32,uint64)void'] | TrustExperimentsArgs['tuple']['withdraw_treasury(uint32,uint64)void']> & SendParams & { onComplete?: OnApplicationComplete.NoOp }) => {
+      const result = await this.appClient.send.call(TrustExperimentsParamsFactory.withdrawTreasury(params))
+      return {...result, return: result.return as unknown as (undefined | TrustExperimentsReturns['withdraw_treasury(uint32,uint64)void'])}
+    },
+
+    /**
+     * Makes a call to the TrustExperiments smart contract using the `create_treasury_variation(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64),pay)uint64` ABI method.
+     *
+    * Spawn a variation with no escrow of its own: it draws payouts from the
+    experiment treasury as trustee decisions need them (see draw_escrow). Three inner transactions instead of four, and no capital locked per cell. params.escrow must be 0.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    createTreasuryVariation: async (params: CallParams<TrustExperimentsArgs['obj']['create_treasury_variation(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64),pay)uint64'] | TrustExperimentsArgs['tuple']['create_treasury_variation(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64),pay)uint64']> & SendParams & { onComplete?: OnApplicationComplete.NoOp }) => {
+      const result = await this.appClient.send.call(TrustExperimentsParamsFactory.createTreasuryVariation(params))
+      return {...result, return: result.return as unknown as (undefined | TrustExperimentsReturns['create_treasury_variation(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64),pay)uint64'])}
+    },
+
+    /**
+     * Makes a call to the TrustExperiments smart contract using the `draw_escrow(uint32,uint32,uint64)void` ABI method.
+     *
+    * Inner call from a treasury-funded TrustVariation: send it amount from
+    the experiment treasury. Only the variation app recorded under (exp_id, var_id) may draw.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    drawEscrow: async (params: CallParams<TrustExperimentsArgs['obj']['draw_escrow(uint32,uint32,uint64)void'] | TrustExperimentsArgs['tuple']['draw_escrow(uint32,uint32,uint64)void']> & SendParams & { onComplete?: OnApplicationComplete.NoOp }) => {
+      const result = await this.appClient.send.call(TrustExperimentsParamsFactory.drawEscrow(params))
+      return {...result, return: result.return as unknown as (undefined | TrustExperimentsReturns['draw_escrow(uint32,uint32,uint64)void'])}
+    },
+
+    /**
+     * Makes a call to the TrustExperiments smart contract using the `create_experiment_with_variation(string,string,uint64,uint64,uint64,uint64,uint64,uint64,pay,txn)(uint32,uint64)` ABI method.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    createExperimentWithVariation: async (params: CallParams<TrustExperimentsArgs['obj']['create_experiment_with_variation(string,string,uint64,uint64,uint64,uint64,uint64,uint64,pay,txn)(uint32,uint64)'] | TrustExperimentsArgs['tuple']['create_experiment_with_variation(string,string,uint64,uint64,uint64,uint64,uint64,uint64,pay,txn)(uint32,uint64)']> & SendParams & { onComplete?: OnApplicationComplete.NoOp }) => {
+      const result = await this.appClient.send.call(TrustExperimentsParamsFactory.createExperimentWithVariation(params))
+      return {...result, return: result.return as unknown as (undefined | TrustExperimentsReturns['create_experiment_with_variation(string,string,uint64,uint64,uint64,uint64,uint64,uint64,pay,txn)(uint32,uint64)'])}
+    },
+
+    /**
+     * Makes a call to the TrustExperiments smart contract using the `get_experiment(uint32)(uint32,address,string,uint64,uint64)` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    getExperiment: async (params: CallParams<TrustExperimentsArgs['obj']['get_experiment(uint32)(uint32,address,string,uint64,uint64)'] | TrustExperimentsArgs['tuple']['get_experiment(uint32)(uint32,address,string,uint64,uint64)']> & SendParams & { onComplete?: OnApplicationComplete.NoOp }) => {
+      const result = await this.appClient.send.call(TrustExperimentsParamsFactory.getExperiment(params))
+      return {...result, return: result.return as unknown as (undefined | TrustExperimentsReturns['get_experiment(uint32)(uint32,address,string,uint64,uint64)'])}
     },
 
     /**
-     * Makes a call to the TrustExperiments smart contract using the `create_experiment(string)uint32` ABI method.
+     * Makes a call to the TrustExperiments smart contract using the `get_experiments_by_owner(address,uint32,uint32)(uint32,address,string,uint64,uint64)[]` ABI method.
+     *
+    * The owner's experiments start .. start + count - 1, in creation order.
+    Like get_variations, the page stops early at the end of the index or once the encoded result would overflow the return log.
+
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
      * @param params The params for the smart contract call
      * @returns The call result
      */
-    createExperiment: async (params: CallParams<TrustExperimentsArgs['obj']['create_experiment(string)uint32'] | TrustExperimentsArgs['tuple']['create_experiment(string)uint32']> & SendParams & { onComplete?: OnApplicationComplete.NoOp }) => {
-      const result = await this.appClient.send.call(TrustExperimentsParamsFactory.createExperiment(params))
-      return {...result, return: result.return as unknown as (undefined | TrustExperimentsReturns['create_experiment(string)uint32'])}
+    getExperimentsByOwner: async (params: CallParams<TrustExperimentsArgs['obj']['get_experiments_by_owner(address,uint32,uint32)(uint32,address,string,uint64,uint64)[]'] | TrustExperimentsArgs['tuple']['get_experiments_by_owner(address,uint32,uint32)(uint32,address,string,uint64,uint64)[]']> & SendParams & { onComplete?: OnApplicationComplete.NoOp }) => {
+      const result = await this.appClient.send.call(TrustExperimentsParamsFactory.getExperimentsByOwner(params))
+      return {...result, return: result.return as unknown as (undefined | TrustExperimentsReturns['get_experiments_by_owner(address,uint32,uint32)(uint32,address,string,uint64,uint64)[]'])}
     },
 
     /**
-     * Makes a call to the TrustExperiments smart contract using the `create_variation(uint32,string,uint64,uint64,uint64,uint64,uint64,uint64,pay,txn)uint64` ABI method.
+     * Makes a call to the TrustExperiments smart contract using the `get_treasury(uint32)(uint64,uint64)` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
      * @param params The params for the smart contract call
      * @returns The call result
      */
-    createVariation: async (params: CallParams<TrustExperimentsArgs['obj']['create_variation(uint32,string,uint64,uint64,uint64,uint64,uint64,uint64,pay,txn)uint64'] | TrustExperimentsArgs['tuple']['create_variation(uint32,string,uint64,uint64,uint64,uint64,uint64,uint64,pay,txn)uint64']> & SendParams & { onComplete?: OnApplicationComplete.NoOp }) => {
-      const result = await this.appClient.send.call(TrustExperimentsParamsFactory.createVariation(params))
-      return {...result, return: result.return as unknown as (undefined | TrustExperimentsReturns['create_variation(uint32,string,uint64,uint64,uint64,uint64,uint64,uint64,pay,txn)uint64'])}
+    getTreasury: async (params: CallParams<TrustExperimentsArgs['obj']['get_treasury(uint32)(uint64,uint64)'] | TrustExperimentsArgs['tuple']['get_treasury(uint32)(uint64,uint64)']> & SendParams & { onComplete?: OnApplicationComplete.NoOp }) => {
+      const result = await this.appClient.send.call(TrustExperimentsParamsFactory.getTreasury(params))
+      return {...result, return: result.return as unknown as (undefined | TrustExperimentsReturns['get_treasury(uint32)(uint64,uint64)'])}
     },
 
     /**
-     * Makes a call to the TrustExperiments smart contract using the `create_experiment_with_variation(string,string,uint64,uint64,uint64,uint64,uint64,uint64,pay,txn)(uint32,uint64)` ABI method.
+     * Makes a call to the TrustExperiments smart contract using the `get_variation(uint32,uint32)(uint32,uint64,string,uint64)` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
      * @param params The params for the smart contract call
      * @returns The call result
      */
-    createExperimentWithVariation: async (params: CallParams<TrustExperimentsArgs['obj']['create_experiment_with_variation(string,string,uint64,uint64,uint64,uint64,uint64,uint64,pay,txn)(uint32,uint64)'] | TrustExperimentsArgs['tuple']['create_experiment_with_variation(string,string,uint64,uint64,uint64,uint64,uint64,uint64,pay,txn)(uint32,uint64)']> & SendParams & { onComplete?: OnApplicationComplete.NoOp }) => {
-      const result = await this.appClient.send.call(TrustExperimentsParamsFactory.createExperimentWithVariation(params))
-      return {...result, return: result.return as unknown as (undefined | TrustExperimentsReturns['create_experiment_with_variation(string,string,uint64,uint64,uint64,uint64,uint64,uint64,pay,txn)(uint32,uint64)'])}
+    getVariation: async (params: CallParams<TrustExperimentsArgs['obj']['get_variation(uint32,uint32)(uint32,uint64,string,uint64)'] | TrustExperimentsArgs['tuple']['get_variation(uint32,uint32)(uint32,uint64,string,uint64)']> & SendParams & { onComplete?: OnApplicationComplete.NoOp }) => {
+      const result = await this.appClient.send.call(TrustExperimentsParamsFactory.getVariation(params))
+      return {...result, return: result.return as unknown as (undefined | TrustExperimentsReturns['get_variation(uint32,uint32)(uint32,uint64,string,uint64)'])}
     },
 
     /**
-     * Makes a call to the TrustExperiments smart contract using the `get_experiment(uint32)(uint32,address,string,uint64,uint64)` ABI method.
+     * Makes a call to the TrustExperiments smart contract using the `get_variation_by_app(uint64)(uint32,(uint32,uint64,string,uint64))` ABI method.
+     *
+    * Resolve a TrustVariation app ID to its exp_id and variation record.
+
      * 
      * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
      * @param params The params for the smart contract call
      * @returns The call result
      */
-    getExperiment: async (params: CallParams<TrustExperimentsArgs['obj']['get_experiment(uint32)(uint32,address,string,uint64,uint64)'] | TrustExperimentsArgs['tuple']['get_experiment(uint32)(uint32,address,string,uint64,uint64)']> & SendParams & { onComplete?: OnApplicationComplete.NoOp }) => {
-      const result = await this.appClient.send.call(TrustExperimentsParamsFactory.getExperiment(params))
-      return {...result, return: result.return as unknown as (undefined | TrustExperimentsReturns['get_experiment(uint32)(uint32,address,string,uint64,uint64)'])}
+    getVariationByApp: async (params: CallParams<TrustExperimentsArgs['obj']['get_variation_by_app(uint64)(uint32,(uint32,uint64,string,uint64))'] | TrustExperimentsArgs['tuple']['get_variation_by_app(uint64)(uint32,(uint32,uint64,string,uint64))']> & SendParams & { onComplete?: OnApplicationComplete.NoOp }) => {
+      const result = await this.appClient.send.call(TrustExperimentsParamsFactory.getVariationByApp(params))
+      return {...result, return: result.return as unknown as (undefined | TrustExperimentsReturns['get_variation_by_app(uint64)(uint32,(uint32,uint64,string,uint64))'])}
     },
 
     /**
-     * Makes a call to the TrustExperiments smart contract using the `get_variation(uint32,uint32)(uint32,uint64,string,uint64)` ABI method.
+     * Makes a call to the TrustExperiments smart contract using the `get_variations(uint32,uint32,uint32)(uint32,uint64,string,uint64)[]` ABI method.
+     *
+    * Variations start .. start + count - 1 of an experiment, in var_id order.
+    The page stops early at variation_count, or once the encoded result would overflow the return log (labels are variable length); continue from start + len(page) while that is below variation_count.
+
      * 
      * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
      * @param params The params for the smart contract call
      * @returns The call result
      */
-    getVariation: async (params: CallParams<TrustExperimentsArgs['obj']['get_variation(uint32,uint32)(uint32,uint64,string,uint64)'] | TrustExperimentsArgs['tuple']['get_variation(uint32,uint32)(uint32,uint64,string,uint64)']> & SendParams & { onComplete?: OnApplicationComplete.NoOp }) => {
-      const result = await this.appClient.send.call(TrustExperimentsParamsFactory.getVariation(params))
-      return {...result, return: result.return as unknown as (undefined | TrustExperimentsReturns['get_variation(uint32,uint32)(uint32,uint64,string,uint64)'])}
+    getVariations: async (params: CallParams<TrustExperimentsArgs['obj']['get_variations(uint32,uint32,uint32)(uint32,uint64,string,uint64)[]'] | TrustExperimentsArgs['tuple']['get_variations(uint32,uint32,uint32)(uint32,uint64,string,uint64)[]']> & SendParams & { onComplete?: OnApplicationComplete.NoOp }) => {
+      const result = await this.appClient.send.call(TrustExperimentsParamsFactory.getVariations(params))
+      return {...result, return: result.return as unknown as (undefined | TrustExperimentsReturns['get_variations(uint32,uint32,uint32)(uint32,uint64,string,uint64)[]'])}
     },
 
   }
@@ -959,6 +1849,36 @@ export class TrustExperimentsClient {
     return result.return as unknown as TrustExperimentsReturns['get_experiment(uint32)(uint32,address,string,uint64,uint64)']
   }
 
+  /**
+   * Makes a readonly (simulated) call to the TrustExperiments smart contract using the `get_experiments_by_owner(address,uint32,uint32)(uint32,address,string,uint64,uint64)[]` ABI method.
+   *
+  * The owner's experiments start .. start + count - 1, in creation order.
+  Like get_variations, the page stops early at the end of the index or once the encoded result would overflow the return log.
+
+   * 
+   * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+   *
+   * @param params The params for the smart contract call
+   * @returns The call result
+   */
+  async getExperimentsByOwner(params: CallParams<TrustExperimentsArgs['obj']['get_experiments_by_owner(address,uint32,uint32)(uint32,address,string,uint64,uint64)[]'] | TrustExperimentsArgs['tuple']['get_experiments_by_owner(address,uint32,uint32)(uint32,address,string,uint64,uint64)[]']>) {
+    const result = await this.appClient.send.call(TrustExperimentsParamsFactory.getExperimentsByOwner(params))
+    return result.return as unknown as TrustExperimentsReturns['get_experiments_by_owner(address,uint32,uint32)(uint32,address,string,uint64,uint64)[]']
+  }
+
+  /**
+   * Makes a readonly (simulated) call to the TrustExperiments smart contract using the `get_treasury(uint32)(uint64,uint64)` ABI method.
+   * 
+   * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+   *
+   * @param params The params for the smart contract call
+   * @returns The call result
+   */
+  async getTreasury(params: CallParams<TrustExperimentsArgs['obj']['get_treasury(uint32)(uint64,uint64)'] | TrustExperimentsArgs['tuple']['get_treasury(uint32)(uint64,uint64)']>) {
+    const result = await this.appClient.send.call(TrustExperimentsParamsFactory.getTreasury(params))
+    return result.return as unknown as TrustExperimentsReturns['get_treasury(uint32)(uint64,uint64)']
+  }
+
   /**
    * Makes a readonly (simulated) call to the TrustExperiments smart contract using the `get_variation(uint32,uint32)(uint32,uint64,string,uint64)` ABI method.
    * 
@@ -972,6 +1892,39 @@ export class TrustExperimentsClient {
     return result.return as unknown as TrustExperimentsReturns['get_variation(uint32,uint32)(uint32,uint64,string,uint64)']
   }
 
+  /**
+   * Makes a readonly (simulated) call to the TrustExperiments smart contract using the `get_variation_by_app(uint64)(uint32,(uint32,uint64,string,uint64))` ABI method.
+   *
+  * Resolve a TrustVariation app ID to its exp_id and variation record.
+
+   * 
+   * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+   *
+   * @param params The params for the smart contract call
+   * @returns The call result
+   */
+  async getVariationByApp(params: CallParams<TrustExperimentsArgs['obj']['get_variation_by_app(uint64)(uint32,(uint32,uint64,string,uint64))'] | TrustExperimentsArgs['tuple']['get_variation_by_app(uint64)(uint32,(uint32,uint64,string,uint64))']>) {
+    const result = await this.appClient.send.call(TrustExperimentsParamsFactory.getVariationByApp(params))
+    return result.return as unknown as TrustExperimentsReturns['get_variation_by_app(uint64)(uint32,(uint32,uint64,string,uint64))']
+  }
+
+  /**
+   * Makes a readonly (simulated) call to the TrustExperiments smart contract using the `get_variations(uint32,uint32,uint32)(uint32,uint64,string,uint64)[]` ABI method.
+   *
+  * Variations start .. start + count - 1 of an experiment, in var_id order.
+  The page stops early at variation_count, or once the encoded result would overflow the return log (labels are variable length); continue from start + len(page) while that is below variation_count.
+
+   * 
+   * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+   *
+   * @param params The params for the smart contract call
+   * @returns The call result
+   */
+  async getVariations(params: CallParams<TrustExperimentsArgs['obj']['get_variations(uint32,uint32,uint32)(uint32,uint64,string,uint64)[]'] | TrustExperimentsArgs['tuple']['get_variations(uint32,uint32,uint32)(uint32,uint64,string,uint64)[]']>) {
+    const result = await this.appClient.send.call(TrustExperimentsParamsFactory.getVariations(params))
+    return result.return as unknown as TrustExperimentsReturns['get_variations(uint32,uint32,uint32)(uint32,uint64,string,uint64)[]']
+  }
+
   /**
    * Methods to access state for the current TrustExperiments app
    */
@@ -988,6 +1941,9 @@ export class TrustExperimentsClient {
         return {
           registryApp: result.registry_app,
           experimentCount: result.experiment_count,
+          tvHash: new BinaryStateValue(result.tv_hash),
+          tvVersion: result.tv_version,
+          tvReady: result.tv_ready,
         }
       },
       /**
@@ -998,6 +1954,18 @@ export class TrustExperimentsClient {
        * Get the current value of the experiment_count key in global state
        */
       experimentCount: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("experiment_count")) as bigint | undefined },
+      /**
+       * Get the current value of the tv_hash key in global state
+       */
+      tvHash: async (): Promise<BinaryState> => { return new BinaryStateValue((await this.appClient.state.global.getValue("tv_hash")) as Uint8Array | undefined) },
+      /**
+       * Get the current value of the tv_version key in global state
+       */
+      tvVersion: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("tv_version")) as bigint | undefined },
+      /**
+       * Get the current value of the tv_ready key in global state
+       */
+      tvReady: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("tv_ready")) as bigint | undefined },
     },
     /**
      * Methods to access box state for the current TrustExperiments app
@@ -1047,6 +2015,45 @@ export class TrustExperimentsClient {
          */
         value: async (key: bigint | number): Promise<VariationInfo | undefined> => { return await this.appClient.state.box.getMapValue("variations", key) as VariationInfo | undefined },
       },
+      /**
+       * Get values from the owner_experiments map in box state
+       */
+      ownerExperiments: {
+        /**
+         * Get all current values of the owner_experiments map in box state
+         */
+        getMap: async (): Promise<Map<string, number[]>> => { return (await this.appClient.state.box.getMap("owner_experiments")) as Map<string, number[]> },
+        /**
+         * Get a current value of the owner_experiments map by key from box state
+         */
+        value: async (key: string): Promise<number[] | undefined> => { return await this.appClient.state.box.getMapValue("owner_experiments", key) as number[] | undefined },
+      },
+      /**
+       * Get values from the variation_apps map in box state
+       */
+      variationApps: {
+        /**
+         * Get all current values of the variation_apps map in box state
+         */
+        getMap: async (): Promise<Map<bigint, bigint>> => { return (await this.appClient.state.box.getMap("variation_apps")) as Map<bigint, bigint> },
+        /**
+         * Get a current value of the variation_apps map by key from box state
+         */
+        value: async (key: bigint | number): Promise<bigint | undefined> => { return await this.appClient.state.box.getMapValue("variation_apps", key) as bigint | undefined },
+      },
+      /**
+       * Get values from the treasuries map in box state
+       */
+      treasuries: {
+        /**
+         * Get all current values of the treasuries map in box state
+         */
+        getMap: async (): Promise<Map<number, Treasury>> => { return (await this.appClient.state.box.getMap("treasuries")) as Map<number, Treasury> },
+        /**
+         * Get a current value of the treasuries map by key from box state
+         */
+        value: async (key: bigint | number): Promise<Treasury | undefined> => { return await this.appClient.state.box.getMapValue("treasuries", key) as Treasury | undefined },
+      },
     },
   }
 
@@ -1062,6 +2069,27 @@ export class TrustExperimentsClient {
         promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.setTrustVariationProgram(params)))
         return this
       },
+      /**
+       * Add a begin_trust_variation_upload(uint64,uint64,pay)void method call against the TrustExperiments contract
+       */
+      beginTrustVariationUpload(params: CallParams<TrustExperimentsArgs['obj']['begin_trust_variation_upload(uint64,uint64,pay)void'] | TrustExperimentsArgs['tuple']['begin_trust_variation_upload(uint64,uint64,pay)void']> & { onComplete?: OnApplicationComplete.NoOp }) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.beginTrustVariationUpload(params)))
+        return this
+      },
+      /**
+       * Add a write_trust_variation_chunk(uint8,uint64,byte[])void method call against the TrustExperiments contract
+       */
+      writeTrustVariationChunk(params: CallParams<TrustExperimentsArgs['obj']['write_trust_variation_chunk(uint8,uint64,byte[])void'] | TrustExperimentsArgs['tuple']['write_trust_variation_chunk(uint8,uint64,byte[])void']> & { onComplete?: OnApplicationComplete.NoOp }) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.writeTrustVariationChunk(params)))
+        return this
+      },
+      /**
+       * Add a finalize_trust_variation_program(byte[])uint64 method call against the TrustExperiments contract
+       */
+      finalizeTrustVariationProgram(params: CallParams<TrustExperimentsArgs['obj']['finalize_trust_variation_program(byte[])uint64'] | TrustExperimentsArgs['tuple']['finalize_trust_variation_program(byte[])uint64']> & { onComplete?: OnApplicationComplete.NoOp }) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.finalizeTrustVariationProgram(params)))
+        return this
+      },
       /**
        * Add a opt_in_to_asset(uint64,pay)void method call against the TrustExperiments contract
        */
@@ -1083,6 +2111,41 @@ export class TrustExperimentsClient {
         promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.createVariation(params)))
         return this
       },
+      /**
+       * Add a create_variations(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64)[],pay,txn)uint64[] method call against the TrustExperiments contract
+       */
+      createVariations(params: CallParams<TrustExperimentsArgs['obj']['create_variations(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64)[],pay,txn)uint64[]'] | TrustExperimentsArgs['tuple']['create_variations(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64)[],pay,txn)uint64[]']> & { onComplete?: OnApplicationComplete.NoOp }) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.createVariations(params)))
+        return this
+      },
+      /**
+       * Add a deposit_treasury(uint32,uint64,txn)void method call against the TrustExperiments contract
+       */
+      depositTreasury(params: CallParams<TrustExperimentsArgs['obj']['deposit_treasury(uint32,uint64,txn)void'] | TrustExperimentsArgs['tuple']['deposit_treasury(uint32,uint64,txn)void']> & { onComplete?: OnApplicationComplete.NoOp }) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.depositTreasury(params)))
+        return this
+      },
+      /**
+       * Add a withdraw_treasury(uint32,uint64)void method call against the TrustExperiments contract
+       */
+      withdrawTreasury(params: CallParams<TrustExperimentsArgs['obj']['withdraw_treasury(uint32,uint64)void'] | TrustExperimentsArgs['tuple']['withdraw_treasury(uint32,uint64)void']> & { onComplete?: OnApplicationComplete.NoOp }) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.withdrawTreasury(params)))
+        return this
+      },
+      /**
+       * Add a create_treasury_variation(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64),pay)uint64 method call against the TrustExperiments contract
+       */
+      createTreasuryVariation(params: CallParams<TrustExperimentsArgs['obj']['create_treasury_variation(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64),pay)uint64'] | TrustExperimentsArgs['tuple']['create_treasury_variation(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64),pay)uint64']> & { onComplete?: OnApplicationComplete.NoOp }) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.createTreasuryVariation(params)))
+        return this
+      },
+      /**
+       * Add a draw_escrow(uint32,uint32,uint64)void method call against the TrustExperiments contract
+       */
+      drawEscrow(params: CallParams<TrustExperimentsArgs['obj']['draw_escrow(uint32,uint32,uint64)void'] | TrustExperimentsArgs['tuple']['draw_escrow(uint32,uint32,uint64)void']> & { onComplete?: OnApplicationComplete.NoOp }) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.drawEscrow(params)))
+        return this
+      },
       /**
        * Add a create_experiment_with_variation(string,string,uint64,uint64,uint64,uint64,uint64,uint64,pay,txn)(uint32,uint64) method call against the TrustExperiments contract
        */
@@ -1097,6 +2160,20 @@ export class TrustExperimentsClient {
         promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getExperiment(params)))
         return this
       },
+      /**
+       * Add a get_experiments_by_owner(address,uint32,uint32)(uint32,address,string,uint64,uint64)[] method call against the TrustExperiments contract
+       */
+      getExperimentsByOwner(params: CallParams<TrustExperimentsArgs['obj']['get_experiments_by_owner(address,uint32,uint32)(uint32,address,string,uint64,uint64)[]'] | TrustExperimentsArgs['tuple']['get_experiments_by_owner(address,uint32,uint32)(uint32,address,string,uint64,uint64)[]']> & { onComplete?: OnApplicationComplete.NoOp }) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getExperimentsByOwner(params)))
+        return this
+      },
+      /**
+       * Add a get_treasury(uint32)(uint64,uint64) method call against the TrustExperiments contract
+       */
+      getTreasury(params: CallParams<TrustExperimentsArgs['obj']['get_treasury(uint32)(uint64,uint64)'] | TrustExperimentsArgs['tuple']['get_treasury(uint32)(uint64,uint64)']> & { onComplete?: OnApplicationComplete.NoOp }) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getTreasury(params)))
+        return this
+      },
       /**
        * Add a get_variation(uint32,uint32)(uint32,uint64,string,uint64) method call against the TrustExperiments contract
        */
@@ -1104,6 +2181,20 @@ export class TrustExperimentsClient {
         promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getVariation(params)))
         return this
       },
+      /**
+       * Add a get_variation_by_app(uint64)(uint32,(uint32,uint64,string,uint64)) method call against the TrustExperiments contract
+       */
+      getVariationByApp(params: CallParams<TrustExperimentsArgs['obj']['get_variation_by_app(uint64)(uint32,(uint32,uint64,string,uint64))'] | TrustExperimentsArgs['tuple']['get_variation_by_app(uint64)(uint32,(uint32,uint64,string,uint64))']> & { onComplete?: OnApplicationComplete.NoOp }) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getVariationByApp(params)))
+        return this
+      },
+      /**
+       * Add a get_variations(uint32,uint32,uint32)(uint32,uint64,string,uint64)[] method call against the TrustExperiments contract
+       */
+      getVariations(params: CallParams<TrustExperimentsArgs['obj']['get_variations(uint32,uint32,uint32)(uint32,uint64,string,uint64)[]'] | TrustExperimentsArgs['tuple']['get_variations(uint32,uint32,uint32)(uint32,uint64,string,uint64)[]']> & { onComplete?: OnApplicationComplete.NoOp }) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getVariations(params)))
+        return this
+      },
       /**
        * Add a clear state call to the TrustExperiments contract
        */
@@ -1147,6 +2238,42 @@ export type TrustExperimentsComposer<TReturns extends [...any[]] = []> = {
    */
   setTrustVariationProgram(params?: CallParams<TrustExperimentsArgs['obj']['set_trust_variation_program(byte[],byte[],pay)void'] | TrustExperimentsArgs['tuple']['set_trust_variation_program(byte[],byte[],pay)void']>): TrustExperimentsComposer<[...TReturns, TrustExperimentsReturns['set_trust_variation_program(byte[],byte[],pay)void'] | undefined]>
 
+  /**
+   * Calls the begin_trust_variation_upload(uint64,uint64,pay)void ABI method.
+   *
+  * Create or resize the program boxes for a chunked upload. Resizing keeps
+  existing bytes, so an interrupted upload of the same program resumes where it stopped. The payment must cover any box growth; spawning is disabled until finalize_trust_variation_program succeeds.
+
+   *
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  beginTrustVariationUpload(params?: CallParams<TrustExperimentsArgs['obj']['begin_trust_variation_upload(uint64,uint64,pay)void'] | TrustExperimentsArgs['tuple']['begin_trust_variation_upload(uint64,uint64,pay)void']>): TrustExperimentsComposer<[...TReturns, TrustExperimentsReturns['begin_trust_variation_upload(uint64,uint64,pay)void'] | undefined]>
+
+  /**
+   * Calls the write_trust_variation_chunk(uint8,uint64,byte[])void ABI method.
+   *
+  * Write chunk at offset into the approval or clear box. Chunks are
+  independent, so they can be sent in any order and in parallel groups.
+
+   *
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  writeTrustVariationChunk(params?: CallParams<TrustExperimentsArgs['obj']['write_trust_variation_chunk(uint8,uint64,byte[])void'] | TrustExperimentsArgs['tuple']['write_trust_variation_chunk(uint8,uint64,byte[])void']>): TrustExperimentsComposer<[...TReturns, TrustExperimentsReturns['write_trust_variation_chunk(uint8,uint64,byte[])void'] | undefined]>
+
+  /**
+   * Calls the finalize_trust_variation_program(byte[])uint64 ABI method.
+   *
+  * Check the uploaded boxes against the deployer's program hash, record
+  it and bump tv_version. Returns the new version. Hashing 8 KB needs about 1,000 extra opcodes, drawn from op-up calls paid by the group's fees.
+
+   *
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  finalizeTrustVariationProgram(params?: CallParams<TrustExperimentsArgs['obj']['finalize_trust_variation_program(byte[])uint64'] | TrustExperimentsArgs['tuple']['finalize_trust_variation_program(byte[])uint64']>): TrustExperimentsComposer<[...TReturns, TrustExperimentsReturns['finalize_trust_variation_program(byte[])uint64'] | undefined]>
+
   /**
    * Calls the opt_in_to_asset(uint64,pay)void ABI method.
    *
@@ -1175,6 +2302,63 @@ export type TrustExperimentsComposer<TReturns extends [...any[]] = []> = {
    */
   createVariation(params?: CallParams<TrustExperimentsArgs['obj']['create_variation(uint32,string,uint64,uint64,uint64,uint64,uint64,uint64,pay,txn)uint64'] | TrustExperimentsArgs['tuple']['create_variation(uint32,string,uint64,uint64,uint64,uint64,uint64,uint64,pay,txn)uint64']>): TrustExperimentsComposer<[...TReturns, TrustExperimentsReturns['create_variation(uint32,string,uint64,uint64,uint64,uint64,uint64,uint64,pay,txn)uint64'] | undefined]>
 
+  /**
+   * Calls the create_variations(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64)[],pay,txn)uint64[] ABI method.
+   *
+  * Spawn several variations (e.g. every cell of a factorial design) in one
+  call. A single MBR leg covers every variation's app MBR and a single escrow leg carries the sum of the configs' escrow amounts, so all configs must share one payout asset. Any MBR surplus goes to the last variation.
+  At most MAX_VARIATIONS_PER_CALL configs per call. Each variation takes 4 inner transactions; the group needs one extra app call per 4 variations beyond the first 4 to pool enough inner-transaction budget. Returns the new app IDs in config order.
+
+   *
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  createVariations(params?: CallParams<TrustExperimentsArgs['obj']['create_variations(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64)[],pay,txn)uint64[]'] | TrustExperimentsArgs['tuple']['create_variations(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64)[],pay,txn)uint64[]']>): TrustExperimentsComposer<[...TReturns, TrustExperimentsReturns['create_variations(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64)[],pay,txn)uint64[]'] | undefined]>
+
+  /**
+   * Calls the deposit_treasury(uint32,uint64,txn)void ABI method.
+   *
+  * Add funds to the experiment treasury. The first deposit fixes the
+  treasury's payout asset; the treasury box MBR comes from the app account.
+
+   *
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  depositTreasury(params?: CallParams<TrustExperimentsArgs['obj']['deposit_treasury(uint32,uint64,txn)void'] | TrustExperimentsArgs['tuple']['deposit_treasury(uint32,uint64,txn)void']>): TrustExperimentsComposer<[...TReturns, TrustExperimentsReturns['deposit_treasury(uint32,uint64,txn)void'] | undefined]>
+
+  /**
+   * Calls the withdraw_treasury(uint32,uint64)void ABI method.
+   *
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  withdrawTreasury(params?: CallParams<TrustExperimentsArgs['obj']['withdraw_treasury(uint32,uint64)void'] | TrustExperimentsArgs['tuple']['withdraw_treasury(uint32,uint64)void']>): TrustExperimentsComposer<[...TReturns, TrustExperimentsReturns['withdraw_treasury(uint32,uint64)void'] | undefined]>
+
+  /**
+   * Calls the create_treasury_variation(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64),pay)uint64 ABI method.
+   *
+  * Spawn a variation with no escrow of its own: it draws payouts from the
+  experiment treasury as trustee decisions need them (see draw_escrow). Three inner transactions instead of four, and no capital locked per cell. params.escrow must be 0.
+
+   *
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  createTreasuryVariation(params?: CallParams<TrustExperimentsArgs['obj']['create_treasury_variation(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64),pay)uint64'] | TrustExperimentsArgs['tuple']['create_treasury_variation(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64),pay)uint64']>): TrustExperimentsComposer<[...TReturns, TrustExperimentsReturns['create_treasury_variation(uint32,(string,uint64,uint64,uint64,uint64,uint64,uint64,uint64),pay)uint64'] | undefined]>
+
+  /**
+   * Calls the draw_escrow(uint32,uint32,uint64)void ABI method.
+   *
+  * Inner call from a treasury-funded TrustVariation: send it amount from
+  the experiment treasury. Only the variation app recorded under (exp_id, var_id) may draw.
+
+   *
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  drawEscrow(params?: CallParams<TrustExperimentsArgs['obj']['draw_escrow(uint32,uint32,uint64)void'] | TrustExperimentsArgs['tuple']['draw_escrow(uint32,uint32,uint64)void']>): TrustExperimentsComposer<[...TReturns, TrustExperimentsReturns['draw_escrow(uint32,uint32,uint64)void'] | undefined]>
+
   /**
    * Calls the create_experiment_with_variation(string,string,uint64,uint64,uint64,uint64,uint64,uint64,pay,txn)(uint32,uint64) ABI method.
    *
@@ -1191,6 +2375,26 @@ export type TrustExperimentsComposer<TReturns extends [...any[]] = []> = {
    */
   getExperiment(params?: CallParams<TrustExperimentsArgs['obj']['get_experiment(uint32)(uint32,address,string,uint64,uint64)'] | TrustExperimentsArgs['tuple']['get_experiment(uint32)(uint32,address,string,uint64,uint64)']>): TrustExperimentsComposer<[...TReturns, TrustExperimentsReturns['get_experiment(uint32)(uint32,address,string,uint64,uint64)'] | undefined]>
 
+  /**
+   * Calls the get_experiments_by_owner(address,uint32,uint32)(uint32,address,string,uint64,uint64)[] ABI method.
+   *
+  * The owner's experiments start .. start + count - 1, in creation order.
+  Like get_variations, the page stops early at the end of the index or once the encoded result would overflow the return log.
+
+   *
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  getExperimentsByOwner(params?: CallParams<TrustExperimentsArgs['obj']['get_experiments_by_owner(address,uint32,uint32)(uint32,address,string,uint64,uint64)[]'] | TrustExperimentsArgs['tuple']['get_experiments_by_owner(address,uint32,uint32)(uint32,address,string,uint64,uint64)[]']>): TrustExperimentsComposer<[...TReturns, TrustExperimentsReturns['get_experiments_by_owner(address,uint32,uint32)(uint32,address,string,uint64,uint64)[]'] | undefined]>
+
+  /**
+   * Calls the get_treasury(uint32)(uint64,uint64) ABI method.
+   *
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  getTreasury(params?: CallParams<TrustExperimentsArgs['obj']['get_treasury(uint32)(uint64,uint64)'] | TrustExperimentsArgs['tuple']['get_treasury(uint32)(uint64,uint64)']>): TrustExperimentsComposer<[...TReturns, TrustExperimentsReturns['get_treasury(uint32)(uint64,uint64)'] | undefined]>
+
   /**
    * Calls the get_variation(uint32,uint32)(uint32,uint64,string,uint64) ABI method.
    *
@@ -1199,6 +2403,29 @@ export type TrustExperimentsComposer<TReturns extends [...any[]] = []> = {
    */
   getVariation(params?: CallParams<TrustExperimentsArgs['obj']['get_variation(uint32,uint32)(uint32,uint64,string,uint64)'] | TrustExperimentsArgs['tuple']['get_variation(uint32,uint32)(uint32,uint64,string,uint64)']>): TrustExperimentsComposer<[...TReturns, TrustExperimentsReturns['get_variation(uint32,uint32)(uint32,uint64,string,uint64)'] | undefined]>
 
+  /**
+   * Calls the get_variation_by_app(uint64)(uint32,(uint32,uint64,string,uint64)) ABI method.
+   *
+  * Resolve a TrustVariation app ID to its exp_id and variation record.
+
+   *
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  getVariationByApp(params?: CallParams<TrustExperimentsArgs['obj']['get_variation_by_app(uint64)(uint32,(uint32,uint64,string,uint64))'] | TrustExperimentsArgs['tuple']['get_variation_by_app(uint64)(uint32,(uint32,uint64,string,uint64))']>): TrustExperimentsComposer<[...TReturns, TrustExperimentsReturns['get_variation_by_app(uint64)(uint32,(uint32,uint64,string,uint64))'] | undefined]>
+
+  /**
+   * Calls the get_variations(uint32,uint32,uint32)(uint32,uint64,string,uint64)[] ABI method.
+   *
+  * Variations start .. start + count - 1 of an experiment, in var_id order.
+  The page stops early at variation_count, or once the encoded result would overflow the return log (labels are variable length); continue from start + len(page) while that is below variation_count.
+
+   *
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  getVariations(params?: CallParams<TrustExperimentsArgs['obj']['get_variations(uint32,uint32,uint32)(uint32,uint64,string,uint64)[]'] | TrustExperimentsArgs['tuple']['get_variations(uint32,uint32,uint32)(uint32,uint64,string,uint64)[]']>): TrustExperimentsComposer<[...TReturns, TrustExperimentsReturns['get_variations(uint32,uint32,uint32)(uint32,uint64,string,uint64)[]'] | undefined]>
+
   /**
    * Makes a clear_state call to an existing instance of the TrustExperiments smart contract.
    *
@@ -14,7 +14,7 @@ import { SendParams,SendTransactionComposerResults  } from '@algorandfoundation/
 import { AppFactoryCreateMethodCallParams, AppFactoryAppClientParams, AppFactoryDeployParams, AppFactoryParams, AppFactory as _AppFactory, AppFactoryResolveAppClientByCreatorAndNameParams, CreateSchema  } from '@algorandfoundation/algokit-utils/app-factory'
 import { TransactionComposer, TransactionComposerConfig, SkipSignaturesSimulateOptions, RawSimulateOptions, SimulateOptions, AppMethodCallTransactionArgument } from '@algorandfoundation/algokit-utils/composer'
 
-export const APP_SPEC: Arc56Contract = {"name":"TrustVariation","structs":{"Match":[{"name":"matchId","type":"uint32"},{"name":"investor","type":"address"},{"name":"trustee","type":"address"},{"name":"phase","type":"uint8"},{"name":"createdAt","type":"uint64"},{"name":"investment","type":"uint64"},{"name":"returnAmount","type":"uint64"},{"name":"investorPayout","type":"uint64"},{"name":"trusteePayout","type":"uint64"},{"name":"completedAt","type":"uint64"},{"name":"paidOut","type":"uint8"}],"ParticipantInfo":[{"name":"enrolled","type":"uint8"},{"name":"assigned","type":"uint8"}],"VariationConfig":[{"name":"e1","type":"uint64"},{"name":"e2","type":"uint64"},{"name":"multiplier","type":"uint64"},{"name":"unit","type":"uint64"},{"name":"assetId","type":"uint64"},{"name":"status","type":"uint8"},{"name":"maxParticipants","type":"uint64"}]},"methods":[{"name":"create","args":[{"type":"uint64","name":"experiments_app"},{"type":"uint32","name":"exp_id"},{"type":"uint32","name":"var_id"},{"type":"address","name":"owner"},{"type":"uint64","name":"e1"},{"type":"uint64","name":"e2"},{"type":"uint64","name":"multiplier"},{"type":"uint64","name":"unit"},{"type":"uint64","name":"asset_id"},{"type":"uint64","name":"registry_app"},{"type":"uint64","name":"max_participants"}],"returns":{"type":"void"},"actions":{"create":["NoOp"],"call":[]},"readonly":false,"events":[],"recommendations":{}},{"name":"deposit_escrow","args":[{"type":"pay","name":"payment"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[],"recommendations":{}},{"name":"record_escrow","args":[{"type":"uint64","name":"amount"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[],"recommendations":{}},{"name":"end_variation","args":[],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[],"recommendations":{}},{"name":"add_participants","args":[{"type":"address[]","name":"addresses"},{"type":"pay","name":"mbr_payment"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[],"recommendations":{}},{"name":"self_enroll","args":[{"type":"pay","name":"mbr_payment"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[],"recommendations":{}},{"name":"create_match","args":[{"type":"address","name":"investor"},{"type":"address","name":"trustee"},{"type":"pay","name":"mbr_payment"}],"returns":{"type":"uint32"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[],"recommendations":{}},{"name":"close_registration","args":[],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[],"recommendations":{}},{"name":"submit_investor_decision","args":[{"type":"uint32","name":"match_id"},{"type":"uint64","name":"investment"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[],"recommendations":{}},{"name":"submit_trustee_decision","args":[{"type":"uint32","name":"match_id"},{"type":"uint64","name":"return_amount"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[],"recommendations":{}},{"name":"withdraw_escrow","args":[],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[],"recommendations":{}},{"name":"get_config","args":[],"returns":{"type":"(uint64,uint64,uint64,uint64,uint64,uint8,uint64)","struct":"VariationConfig"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_match","args":[{"type":"uint32","name":"match_id"}],"returns":{"type":"(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)","struct":"Match"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_player_match","args":[{"type":"address","name":"addr"}],"returns":{"type":"uint32"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_participant_count","args":[],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_escrow_balance","args":[],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}}],"arcs":[22,28],"networks":{},"state":{"schema":{"global":{"ints":16,"bytes":1},"local":{"ints":0,"bytes":0}},"keys":{"global":{"experiments_app":{"keyType":"AVMString","valueType":"AVMUint64","key":"ZXhwZXJpbWVudHNfYXBw"},"exp_id":{"keyType":"AVMString","valueType":"AVMUint64","key":"ZXhwX2lk"},"var_id":{"keyType":"AVMString","valueType":"AVMUint64","key":"dmFyX2lk"},"owner":{"keyType":"AVMString","valueType":"address","key":"b3duZXI="},"status":{"keyType":"AVMString","valueType":"AVMUint64","key":"c3RhdHVz"},"match_count":{"keyType":"AVMString","valueType":"AVMUint64","key":"bWF0Y2hfY291bnQ="},"paid_out_count":{"keyType":"AVMString","valueType":"AVMUint64","key":"cGFpZF9vdXRfY291bnQ="},"e1":{"keyType":"AVMString","valueType":"AVMUint64","key":"ZTE="},"e2":{"keyType":"AVMString","valueType":"AVMUint64","key":"ZTI="},"multiplier":{"keyType":"AVMString","valueType":"AVMUint64","key":"bXVsdGlwbGllcg=="},"unit":{"keyType":"AVMString","valueType":"AVMUint64","key":"dW5pdA=="},"asset_id":{"keyType":"AVMString","valueType":"AVMUint64","key":"YXNzZXRfaWQ="},"escrow_deposited":{"keyType":"AVMString","valueType":"AVMUint64","key":"ZXNjcm93X2RlcG9zaXRlZA=="},"escrow_paid_out":{"keyType":"AVMString","valueType":"AVMUint64","key":"ZXNjcm93X3BhaWRfb3V0"},"registry_app":{"keyType":"AVMString","valueType":"AVMUint64","key":"cmVnaXN0cnlfYXBw"},"participant_count":{"keyType":"AVMString","valueType":"AVMUint64","key":"cGFydGljaXBhbnRfY291bnQ="},"max_participants":{"keyType":"AVMString","valueType":"AVMUint64","key":"bWF4X3BhcnRpY2lwYW50cw=="}},"local":{},"box":{}},"maps":{"global":{},"local":{},"box":{"participants":{"keyType":"address","valueType":"ParticipantInfo","prefix":"cF8="},"matches":{"keyType":"uint32","valueType":"Match","prefix":"bV8="},"player_match":{"keyType":"address","valueType":"uint32","prefix":"cG1f"}}}},"bareActions":{"create":[],"call":[]},"sourceInfo":{"approval":{"sourceInfo":[{"pc":[1488,1507,1601,1625],"errorMessage":"Address length is 32 bytes"},{"pc":[722],"errorMessage":"Already ended"},{"pc":[898,948],"errorMessage":"Already enrolled"},{"pc":[663,696],"errorMessage":"Amount must be > 0"},{"pc":[968],"errorMessage":"Full"},{"pc":[866,983,1077],"errorMessage":"Insufficient MBR"},{"pc":[1333],"errorMessage":"Investment exceeds endowment"},{"pc":[1116],"errorMessage":"Investor already assigned"},{"pc":[1109],"errorMessage":"Investor not active"},{"pc":[1087],"errorMessage":"Investor not enrolled"},{"pc":[1301,1393,1833],"errorMessage":"Match not found"},{"pc":[1664],"errorMessage":"Matches not all paid out"},{"pc":[1859],"errorMessage":"No active match"},{"pc":[1676],"errorMessage":"No remaining escrow"},{"pc":[1341,1448],"errorMessage":"Not a multiple of unit"},{"pc":[850,937,1269],"errorMessage":"Not active"},{"pc":[693],"errorMessage":"Not experiments app"},{"pc":[652,714,844,1062,1263,1652],"errorMessage":"Not owner"},{"pc":[1313],"errorMessage":"Not the investor"},{"pc":[1410],"errorMessage":"Not the trustee"},{"pc":[288],"errorMessage":"OnCompletion must be NoOp"},{"pc":[1437],"errorMessage":"Return exceeds maximum"},{"pc":[1134],"errorMessage":"Trustee already assigned"},{"pc":[1127],"errorMessage":"Trustee not active"},{"pc":[1097],"errorMessage":"Trustee not enrolled"},{"pc":[515],"errorMessage":"Unit must be > 0"},{"pc":[1380],"errorMessage":"Variation ended"},{"pc":[857,1069],"errorMessage":"Wrong MBR receiver"},{"pc":[1321,1418],"errorMessage":"Wrong phase"},{"pc":[659,977],"errorMessage":"Wrong receiver"},{"pc":[691],"errorMessage":"application exists"},{"pc":[740,782,1474,1591,1680,1718,1769],"errorMessage":"check self.asset_id exists"},{"pc":[1329,1453,1746],"errorMessage":"check self.e1 exists"},{"pc":[1466,1752],"errorMessage":"check self.e2 exists"},{"pc":[667,700,726,765,1668,1705,1885],"errorMessage":"check self.escrow_deposited exists"},{"pc":[731,1525,1673,1890],"errorMessage":"check self.escrow_paid_out exists"},{"pc":[688],"errorMessage":"check self.experiments_app exists"},{"pc":[1139,1662],"errorMessage":"check self.match_count exists"},{"pc":[953,966,1788],"errorMessage":"check self.max_participants exists"},{"pc":[1426,1758],"errorMessage":"check self.multiplier exists"},{"pc":[650,712,748,786,842,1060,1261,1650,1688,1722],"errorMessage":"check self.owner exists"},{"pc":[1546,1657],"errorMessage":"check self.paid_out_count exists"},{"pc":[906,961,1020,1873],"errorMessage":"check self.participant_count exists"},{"pc":[989],"errorMessage":"check self.registry_app exists"},{"pc":[718,848,935,1267,1376,1774],"errorMessage":"check self.status exists"},{"pc":[1338,1442,1764],"errorMessage":"check self.unit exists"},{"pc":[888],"errorMessage":"index access is out of bounds"},{"pc":[812],"errorMessage":"invalid array length header"},{"pc":[826],"errorMessage":"invalid number of bytes for arc4.dynamic_array<arc4.static_array<arc4.uint8, 32>>"},{"pc":[454,1036,1044,1850],"errorMessage":"invalid number of bytes for arc4.static_array<arc4.uint8, 32>"},{"pc":[437,446,1283,1361,1824],"errorMessage":"invalid number of bytes for arc4.uint32"},{"pc":[428,462,470,478,486,494,502,510,681,1291,1372],"errorMessage":"invalid number of bytes for arc4.uint64"},{"pc":[1146,1780],"errorMessage":"overflow"},{"pc":[644,836,931,1054],"errorMessage":"transaction type is pay"}],"pcOffsetMethod":"none"},"clear":{"sourceInfo":[],"pcOffsetMethod":"none"}},"source":{"approval":"I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgOCAzMiAxNjkwMAogICAgYnl0ZWNibG9jayAiZXNjcm93X2RlcG9zaXRlZCIgIm93bmVyIiAic3RhdHVzIiAiYXNzZXRfaWQiICJwYXJ0aWNpcGFudF9jb3VudCIgImVzY3Jvd19wYWlkX291dCIgMHgxNTFmN2M3NSAibWF0Y2hfY291bnQiICJwYWlkX291dF9jb3VudCIgImUxIiAidW5pdCIgIm1heF9wYXJ0aWNpcGFudHMiIDB4MDEgImUyIiAibXVsdGlwbGllciIgMHg3MDVmIDB4MDAgMHg2ZDVmICJleHBlcmltZW50c19hcHAiICJyZWdpc3RyeV9hcHAiIDB4NzA2ZDVmICJleHBfaWQiICJ2YXJfaWQiIDB4MDEwMCAweDAxMDEKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NDAKICAgIC8vIHNlbGYuZXhwZXJpbWVudHNfYXBwID0gR2xvYmFsU3RhdGUoVUludDY0KDApKQogICAgYnl0ZWMgMTggLy8gImV4cGVyaW1lbnRzX2FwcCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo0MQogICAgLy8gc2VsZi5leHBfaWQgPSBHbG9iYWxTdGF0ZShVSW50NjQoMCkpCiAgICBieXRlYyAyMSAvLyAiZXhwX2lkIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjQyCiAgICAvLyBzZWxmLnZhcl9pZCA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgwKSkKICAgIGJ5dGVjIDIyIC8vICJ2YXJfaWQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NDQKICAgIC8vIHNlbGYuc3RhdHVzID0gR2xvYmFsU3RhdGUoVUludDY0KDApKQogICAgYnl0ZWNfMiAvLyAic3RhdHVzIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjQ1CiAgICAvLyBzZWxmLm1hdGNoX2NvdW50ID0gR2xvYmFsU3RhdGUoVUludDY0KDApKQogICAgYnl0ZWMgNyAvLyAibWF0Y2hfY291bnQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NDYKICAgIC8vIHNlbGYucGFpZF9vdXRfY291bnQgPSBHbG9iYWxTdGF0ZShVSW50NjQoMCkpCiAgICBieXRlYyA4IC8vICJwYWlkX291dF9jb3VudCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo0NwogICAgLy8gc2VsZi5lMSA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgwKSkKICAgIGJ5dGVjIDkgLy8gImUxIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjQ4CiAgICAvLyBzZWxmLmUyID0gR2xvYmFsU3RhdGUoVUludDY0KDApKQogICAgYnl0ZWMgMTMgLy8gImUyIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjQ5CiAgICAvLyBzZWxmLm11bHRpcGxpZXIgPSBHbG9iYWxTdGF0ZShVSW50NjQoMCkpCiAgICBieXRlYyAxNCAvLyAibXVsdGlwbGllciIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo1MAogICAgLy8gc2VsZi51bml0ID0gR2xvYmFsU3RhdGUoVUludDY0KDApKQogICAgYnl0ZWMgMTAgLy8gInVuaXQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NTEKICAgIC8vIHNlbGYuYXNzZXRfaWQgPSBHbG9iYWxTdGF0ZShVSW50NjQoMCkpCiAgICBieXRlY18zIC8vICJhc3NldF9pZCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo1MgogICAgLy8gc2VsZi5lc2Nyb3dfZGVwb3NpdGVkID0gR2xvYmFsU3RhdGUoVUludDY0KDApKQogICAgYnl0ZWNfMCAvLyAiZXNjcm93X2RlcG9zaXRlZCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo1MwogICAgLy8gc2VsZi5lc2Nyb3dfcGFpZF9vdXQgPSBHbG9iYWxTdGF0ZShVSW50NjQoMCkpCiAgICBieXRlYyA1IC8vICJlc2Nyb3dfcGFpZF9vdXQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NTQKICAgIC8vIHNlbGYucmVnaXN0cnlfYXBwID0gR2xvYmFsU3RhdGUoVUludDY0KDApKQogICAgYnl0ZWMgMTkgLy8gInJlZ2lzdHJ5X2FwcCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo1NQogICAgLy8gc2VsZi5wYXJ0aWNpcGFudF9jb3VudCA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgwKSkKICAgIGJ5dGVjIDQgLy8gInBhcnRpY2lwYW50X2NvdW50IgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjU2CiAgICAvLyBzZWxmLm1heF9wYXJ0aWNpcGFudHMgPSBHbG9iYWxTdGF0ZShVSW50NjQoMCkpCiAgICBieXRlYyAxMSAvLyAibWF4X3BhcnRpY2lwYW50cyIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAoKbWFpbl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjM4CiAgICAvLyBjbGFzcyBUcnVzdFZhcmlhdGlvbihBUkM0Q29udHJhY3QpOgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBtdXN0IGJlIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBieiBtYWluX2NyZWF0ZV9Ob09wQDIxCiAgICBwdXNoYnl0ZXNzIDB4OGRlYjQ1OWIgMHg1YzlhODM2YiAweDM4ZTJlNzczIDB4NTFkYjEwOTAgMHgxZmQwNDA2MyAweDZjMWZiOGJmIDB4ZjEwYmE2ZDggMHgxZTMwNzc5MCAweDQ4M2FiNTM1IDB4NmIyNGZkOTYgMHhjODFlZDU2MiAweDViOWUwNTU4IDB4ZTVlYTI5YTUgMHg5YmI5MjBlYyAweDIxYTFkNTQwIC8vIG1ldGhvZCAiZGVwb3NpdF9lc2Nyb3cocGF5KXZvaWQiLCBtZXRob2QgInJlY29yZF9lc2Nyb3codWludDY0KXZvaWQiLCBtZXRob2QgImVuZF92YXJpYXRpb24oKXZvaWQiLCBtZXRob2QgImFkZF9wYXJ0aWNpcGFudHMoYWRkcmVzc1tdLHBheSl2b2lkIiwgbWV0aG9kICJzZWxmX2Vucm9sbChwYXkpdm9pZCIsIG1ldGhvZCAiY3JlYXRlX21hdGNoKGFkZHJlc3MsYWRkcmVzcyxwYXkpdWludDMyIiwgbWV0aG9kICJjbG9zZV9yZWdpc3RyYXRpb24oKXZvaWQiLCBtZXRob2QgInN1Ym1pdF9pbnZlc3Rvcl9kZWNpc2lvbih1aW50MzIsdWludDY0KXZvaWQiLCBtZXRob2QgInN1Ym1pdF90cnVzdGVlX2RlY2lzaW9uKHVpbnQzMix1aW50NjQpdm9pZCIsIG1ldGhvZCAid2l0aGRyYXdfZXNjcm93KCl2b2lkIiwgbWV0aG9kICJnZXRfY29uZmlnKCkodWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50OCx1aW50NjQpIiwgbWV0aG9kICJnZXRfbWF0Y2godWludDMyKSh1aW50MzIsYWRkcmVzcyxhZGRyZXNzLHVpbnQ4LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ4KSIsIG1ldGhvZCAiZ2V0X3BsYXllcl9tYXRjaChhZGRyZXNzKXVpbnQzMiIsIG1ldGhvZCAiZ2V0X3BhcnRpY2lwYW50X2NvdW50KCl1aW50NjQiLCBtZXRob2QgImdldF9lc2Nyb3dfYmFsYW5jZSgpdWludDY0IgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggZGVwb3NpdF9lc2Nyb3cgcmVjb3JkX2VzY3JvdyBlbmRfdmFyaWF0aW9uIGFkZF9wYXJ0aWNpcGFudHMgc2VsZl9lbnJvbGwgY3JlYXRlX21hdGNoIGNsb3NlX3JlZ2lzdHJhdGlvbiBzdWJtaXRfaW52ZXN0b3JfZGVjaXNpb24gc3VibWl0X3RydXN0ZWVfZGVjaXNpb24gd2l0aGRyYXdfZXNjcm93IGdldF9jb25maWcgZ2V0X21hdGNoIGdldF9wbGF5ZXJfbWF0Y2ggZ2V0X3BhcnRpY2lwYW50X2NvdW50IGdldF9lc2Nyb3dfYmFsYW5jZQogICAgZXJyCgptYWluX2NyZWF0ZV9Ob09wQDIxOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTozOAogICAgLy8gY2xhc3MgVHJ1c3RWYXJpYXRpb24oQVJDNENvbnRyYWN0KToKICAgIHB1c2hieXRlcyAweGI4ZGI4NjA1IC8vIG1ldGhvZCAiY3JlYXRlKHVpbnQ2NCx1aW50MzIsdWludDMyLGFkZHJlc3MsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0KXZvaWQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBjcmVhdGUKICAgIGVycgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50cnVzdF92YXJpYXRpb24uY29udHJhY3QuVHJ1c3RWYXJpYXRpb24uY3JlYXRlW3JvdXRpbmddKCkgLT4gdm9pZDoKY3JlYXRlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo2NQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGNyZWF0ZT0icmVxdWlyZSIpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCA0IC8vIDQKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDMyCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCA0IC8vIDQKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDMyCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA0CiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDUKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDYKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDcKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDgKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDkKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEwCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo4MAogICAgLy8gYXNzZXJ0IHVuaXQuYXNfdWludDY0KCkgPiBVSW50NjQoMCksICJVbml0IG11c3QgYmUgPiAwIgogICAgdW5jb3ZlciAzCiAgICBidG9pCiAgICBkdXAKICAgIGFzc2VydCAvLyBVbml0IG11c3QgYmUgPiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjgxCiAgICAvLyBzZWxmLmV4cGVyaW1lbnRzX2FwcC52YWx1ZSA9IGV4cGVyaW1lbnRzX2FwcC5hc191aW50NjQoKQogICAgdW5jb3ZlciAxMAogICAgYnRvaQogICAgYnl0ZWMgMTggLy8gImV4cGVyaW1lbnRzX2FwcCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjgyCiAgICAvLyBzZWxmLmV4cF9pZC52YWx1ZSA9IGV4cF9pZC5hc191aW50NjQoKQogICAgdW5jb3ZlciA5CiAgICBidG9pCiAgICBieXRlYyAyMSAvLyAiZXhwX2lkIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6ODMKICAgIC8vIHNlbGYudmFyX2lkLnZhbHVlID0gdmFyX2lkLmFzX3VpbnQ2NCgpCiAgICB1bmNvdmVyIDgKICAgIGJ0b2kKICAgIGJ5dGVjIDIyIC8vICJ2YXJfaWQiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo4NAogICAgLy8gc2VsZi5vd25lci52YWx1ZSA9IG93bmVyCiAgICBieXRlY18xIC8vICJvd25lciIKICAgIHVuY292ZXIgOAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6ODUKICAgIC8vIHNlbGYuc3RhdHVzLnZhbHVlID0gVUludDY0KFNUQVRVU19BQ1RJVkUpCiAgICBieXRlY18yIC8vICJzdGF0dXMiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6ODYKICAgIC8vIHNlbGYubWF0Y2hfY291bnQudmFsdWUgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDcgLy8gIm1hdGNoX2NvdW50IgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5Ojg3CiAgICAvLyBzZWxmLnBhaWRfb3V0X2NvdW50LnZhbHVlID0gVUludDY0KDApCiAgICBieXRlYyA4IC8vICJwYWlkX291dF9jb3VudCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo4OAogICAgLy8gc2VsZi5lMS52YWx1ZSA9IGUxLmFzX3VpbnQ2NCgpCiAgICB1bmNvdmVyIDYKICAgIGJ0b2kKICAgIGJ5dGVjIDkgLy8gImUxIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6ODkKICAgIC8vIHNlbGYuZTIudmFsdWUgPSBlMi5hc191aW50NjQoKQogICAgdW5jb3ZlciA1CiAgICBidG9pCiAgICBieXRlYyAxMyAvLyAiZTIiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo5MAogICAgLy8gc2VsZi5tdWx0aXBsaWVyLnZhbHVlID0gbXVsdGlwbGllci5hc191aW50NjQoKQogICAgdW5jb3ZlciA0CiAgICBidG9pCiAgICBieXRlYyAxNCAvLyAibXVsdGlwbGllciIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjkxCiAgICAvLyBzZWxmLnVuaXQudmFsdWUgPSB1bml0LmFzX3VpbnQ2NCgpCiAgICBieXRlYyAxMCAvLyAidW5pdCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjkyCiAgICAvLyBzZWxmLmFzc2V0X2lkLnZhbHVlID0gYXNzZXRfaWQuYXNfdWludDY0KCkKICAgIHVuY292ZXIgMgogICAgYnRvaQogICAgZHVwCiAgICBjb3ZlciAzCiAgICBieXRlY18zIC8vICJhc3NldF9pZCIKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo5MwogICAgLy8gc2VsZi5lc2Nyb3dfZGVwb3NpdGVkLnZhbHVlID0gVUludDY0KDApCiAgICBieXRlY18wIC8vICJlc2Nyb3dfZGVwb3NpdGVkIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5Ojk0CiAgICAvLyBzZWxmLmVzY3Jvd19wYWlkX291dC52YWx1ZSA9IFVJbnQ2NCgwKQogICAgYnl0ZWMgNSAvLyAiZXNjcm93X3BhaWRfb3V0IgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5Ojk1CiAgICAvLyBzZWxmLnJlZ2lzdHJ5X2FwcC52YWx1ZSA9IHJlZ2lzdHJ5X2FwcC5hc191aW50NjQoKQogICAgdW5jb3ZlciAyCiAgICBidG9pCiAgICBieXRlYyAxOSAvLyAicmVnaXN0cnlfYXBwIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6OTYKICAgIC8vIHNlbGYucGFydGljaXBhbnRfY291bnQudmFsdWUgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDQgLy8gInBhcnRpY2lwYW50X2NvdW50IgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5Ojk3CiAgICAvLyBzZWxmLm1heF9wYXJ0aWNpcGFudHMudmFsdWUgPSBtYXhfcGFydGljaXBhbnRzLmFzX3VpbnQ2NCgpCiAgICBzd2FwCiAgICBidG9pCiAgICBieXRlYyAxMSAvLyAibWF4X3BhcnRpY2lwYW50cyIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5Ojk5CiAgICAvLyBpZiBhc3NldF9pZC5hc191aW50NjQoKSA+IFVJbnQ2NCgwKToKICAgIGJ6IGNyZWF0ZV9hZnRlcl9pZl9lbHNlQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTAwLTEwNQogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgLy8gICAgIHhmZXJfYXNzZXQ9QXNzZXQoYXNzZXRfaWQuYXNfdWludDY0KCkpLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PVVJbnQ2NCgwKSwKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTAyCiAgICAvLyBhc3NldF9yZWNlaXZlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTAzCiAgICAvLyBhc3NldF9hbW91bnQ9VUludDY0KDApLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgQXNzZXRBbW91bnQKICAgIGl0eG5fZmllbGQgQXNzZXRSZWNlaXZlcgogICAgZHVwCiAgICBpdHhuX2ZpZWxkIFhmZXJBc3NldAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxMDAKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIHB1c2hpbnQgNCAvLyBheGZlcgogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxMDQKICAgIC8vIGZlZT0wLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjEwMC0xMDUKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PUFzc2V0KGFzc2V0X2lkLmFzX3VpbnQ2NCgpKSwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1VSW50NjQoMCksCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAoKY3JlYXRlX2FmdGVyX2lmX2Vsc2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NjUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChjcmVhdGU9InJlcXVpcmUiKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50cnVzdF92YXJpYXRpb24uY29udHJhY3QuVHJ1c3RWYXJpYXRpb24uZGVwb3NpdF9lc2Nyb3dbcm91dGluZ10oKSAtPiB2b2lkOgpkZXBvc2l0X2VzY3JvdzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTA3CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxMDkKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYub3duZXIudmFsdWUsICJOb3Qgb3duZXIiCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAib3duZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYub3duZXIgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIE5vdCBvd25lcgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxMTAKICAgIC8vIGFzc2VydCBwYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsICJXcm9uZyByZWNlaXZlciIKICAgIGR1cAogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIFdyb25nIHJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjExMQogICAgLy8gYXNzZXJ0IHBheW1lbnQuYW1vdW50ID4gVUludDY0KDApLCAiQW1vdW50IG11c3QgYmUgPiAwIgogICAgZ3R4bnMgQW1vdW50CiAgICBkdXAKICAgIGFzc2VydCAvLyBBbW91bnQgbXVzdCBiZSA+IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTEyCiAgICAvLyBzZWxmLmVzY3Jvd19kZXBvc2l0ZWQudmFsdWUgKz0gcGF5bWVudC5hbW91bnQKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJlc2Nyb3dfZGVwb3NpdGVkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmVzY3Jvd19kZXBvc2l0ZWQgZXhpc3RzCiAgICArCiAgICBieXRlY18wIC8vICJlc2Nyb3dfZGVwb3NpdGVkIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTA3CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMudHJ1c3RfdmFyaWF0aW9uLmNvbnRyYWN0LlRydXN0VmFyaWF0aW9uLnJlY29yZF9lc2Nyb3dbcm91dGluZ10oKSAtPiB2b2lkOgpyZWNvcmRfZXNjcm93OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxMTQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxMTYKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IEFwcGxpY2F0aW9uKHNlbGYuZXhwZXJpbWVudHNfYXBwLnZhbHVlKS5hZGRyZXNzLCAiTm90IGV4cGVyaW1lbnRzIGFwcCIKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxOCAvLyAiZXhwZXJpbWVudHNfYXBwIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmV4cGVyaW1lbnRzX2FwcCBleGlzdHMKICAgIGFwcF9wYXJhbXNfZ2V0IEFwcEFkZHJlc3MKICAgIGFzc2VydCAvLyBhcHBsaWNhdGlvbiBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gTm90IGV4cGVyaW1lbnRzIGFwcAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxMTcKICAgIC8vIGFzc2VydCBhbW91bnQuYXNfdWludDY0KCkgPiBVSW50NjQoMCksICJBbW91bnQgbXVzdCBiZSA+IDAiCiAgICBidG9pCiAgICBkdXAKICAgIGFzc2VydCAvLyBBbW91bnQgbXVzdCBiZSA+IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTE4CiAgICAvLyBzZWxmLmVzY3Jvd19kZXBvc2l0ZWQudmFsdWUgKz0gYW1vdW50LmFzX3VpbnQ2NCgpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAiZXNjcm93X2RlcG9zaXRlZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5lc2Nyb3dfZGVwb3NpdGVkIGV4aXN0cwogICAgKwogICAgYnl0ZWNfMCAvLyAiZXNjcm93X2RlcG9zaXRlZCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjExNAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnRydXN0X3ZhcmlhdGlvbi5jb250cmFjdC5UcnVzdFZhcmlhdGlvbi5lbmRfdmFyaWF0aW9uW3JvdXRpbmddKCkgLT4gdm9pZDoKZW5kX3ZhcmlhdGlvbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTIyCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLm93bmVyLnZhbHVlLCAiTm90IG93bmVyIgogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gIm93bmVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm93bmVyIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBOb3Qgb3duZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTIzCiAgICAvLyBhc3NlcnQgc2VsZi5zdGF0dXMudmFsdWUgIT0gVUludDY0KFNUQVRVU19DT01QTEVURUQpLCAiQWxyZWFkeSBlbmRlZCIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJzdGF0dXMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3RhdHVzIGV4aXN0cwogICAgcHVzaGludCAyIC8vIDIKICAgICE9CiAgICBhc3NlcnQgLy8gQWxyZWFkeSBlbmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxMjUKICAgIC8vIHJlbWFpbmluZyA9IHNlbGYuZXNjcm93X2RlcG9zaXRlZC52YWx1ZSAtIHNlbGYuZXNjcm93X3BhaWRfb3V0LnZhbHVlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAiZXNjcm93X2RlcG9zaXRlZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5lc2Nyb3dfZGVwb3NpdGVkIGV4aXN0cwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDUgLy8gImVzY3Jvd19wYWlkX291dCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5lc2Nyb3dfcGFpZF9vdXQgZXhpc3RzCiAgICAtCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTI2CiAgICAvLyBpZiByZW1haW5pbmcgPiBVSW50NjQoMCk6CiAgICBieiBlbmRfdmFyaWF0aW9uX2FmdGVyX2lmX2Vsc2VAOAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxMjcKICAgIC8vIGlmIHNlbGYuYXNzZXRfaWQudmFsdWUgPT0gVUludDY0KDApOgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gImFzc2V0X2lkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFzc2V0X2lkIGV4aXN0cwogICAgYm56IGVuZF92YXJpYXRpb25fZWxzZV9ib2R5QDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTI4LTEzMgogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPXNlbGYub3duZXIudmFsdWUsCiAgICAvLyAgICAgYW1vdW50PXJlbWFpbmluZywKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTI5CiAgICAvLyByZWNlaXZlcj1zZWxmLm93bmVyLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gIm93bmVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm93bmVyIGV4aXN0cwogICAgZGlnIDEKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjEyOAogICAgLy8gaXR4bi5QYXltZW50KAogICAgaW50Y18xIC8vIHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxMzEKICAgIC8vIGZlZT0wLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjEyOC0xMzIKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1zZWxmLm93bmVyLnZhbHVlLAogICAgLy8gICAgIGFtb3VudD1yZW1haW5pbmcsCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAoKZW5kX3ZhcmlhdGlvbl9hZnRlcl9pZl9lbHNlQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjE0MAogICAgLy8gc2VsZi5lc2Nyb3dfZGVwb3NpdGVkLnZhbHVlIC09IHJlbWFpbmluZwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gImVzY3Jvd19kZXBvc2l0ZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZXNjcm93X2RlcG9zaXRlZCBleGlzdHMKICAgIGRpZyAxCiAgICAtCiAgICBieXRlY18wIC8vICJlc2Nyb3dfZGVwb3NpdGVkIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKCmVuZF92YXJpYXRpb25fYWZ0ZXJfaWZfZWxzZUA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxNDIKICAgIC8vIHNlbGYuc3RhdHVzLnZhbHVlID0gVUludDY0KFNUQVRVU19DT01QTEVURUQpCiAgICBieXRlY18yIC8vICJzdGF0dXMiCiAgICBwdXNoaW50IDIgLy8gMgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTIwCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCmVuZF92YXJpYXRpb25fZWxzZV9ib2R5QDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjEzNC0xMzkKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PUFzc2V0KHNlbGYuYXNzZXRfaWQudmFsdWUpLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPXNlbGYub3duZXIudmFsdWUsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PXJlbWFpbmluZywKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTM1CiAgICAvLyB4ZmVyX2Fzc2V0PUFzc2V0KHNlbGYuYXNzZXRfaWQudmFsdWUpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gImFzc2V0X2lkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFzc2V0X2lkIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxMzYKICAgIC8vIGFzc2V0X3JlY2VpdmVyPXNlbGYub3duZXIudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAib3duZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYub3duZXIgZXhpc3RzCiAgICBkaWcgMgogICAgaXR4bl9maWVsZCBBc3NldEFtb3VudAogICAgaXR4bl9maWVsZCBBc3NldFJlY2VpdmVyCiAgICBpdHhuX2ZpZWxkIFhmZXJBc3NldAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxMzQKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIHB1c2hpbnQgNCAvLyBheGZlcgogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxMzgKICAgIC8vIGZlZT0wLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjEzNC0xMzkKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PUFzc2V0KHNlbGYuYXNzZXRfaWQudmFsdWUpLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPXNlbGYub3duZXIudmFsdWUsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PXJlbWFpbmluZywKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICBiIGVuZF92YXJpYXRpb25fYWZ0ZXJfaWZfZWxzZUA3CgoKLy8gc21hcnRfY29udHJhY3RzLnRydXN0X3ZhcmlhdGlvbi5jb250cmFjdC5UcnVzdFZhcmlhdGlvbi5hZGRfcGFydGljaXBhbnRzW3JvdXRpbmddKCkgLT4gdm9pZDoKYWRkX3BhcnRpY2lwYW50czoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTQ0CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cG4gMgogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGR1cAogICAgY292ZXIgMgogICAgZHVwCiAgICBpbnRjXzMgLy8gMzIKICAgICoKICAgIHB1c2hpbnQgMiAvLyAyCiAgICArCiAgICB1bmNvdmVyIDIKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPj4KICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxNDYKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYub3duZXIudmFsdWUsICJOb3Qgb3duZXIiCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAib3duZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYub3duZXIgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIE5vdCBvd25lcgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxNDcKICAgIC8vIGFzc2VydCBzZWxmLnN0YXR1cy52YWx1ZSA9PSBVSW50NjQoU1RBVFVTX0FDVElWRSksICJOb3QgYWN0aXZlIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gInN0YXR1cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdGF0dXMgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQgLy8gTm90IGFjdGl2ZQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxNDgKICAgIC8vIGFzc2VydCBtYnJfcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLCAiV3JvbmcgTUJSIHJlY2VpdmVyIgogICAgZHVwCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gV3JvbmcgTUJSIHJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjE0OQogICAgLy8gYXNzZXJ0IG1icl9wYXltZW50LmFtb3VudCA+PSBVSW50NjQoUEFSVElDSVBBTlRfTUJSKSAqIGFkZHJlc3Nlcy5sZW5ndGgsICJJbnN1ZmZpY2llbnQgTUJSIgogICAgZ3R4bnMgQW1vdW50CiAgICBpbnRjIDQgLy8gMTY5MDAKICAgIHVuY292ZXIgMgogICAgKgogICAgPj0KICAgIGFzc2VydCAvLyBJbnN1ZmZpY2llbnQgTUJSCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjE1MAogICAgLy8gZm9yIGkgaW4gdXJhbmdlKGFkZHJlc3Nlcy5sZW5ndGgpOgogICAgaW50Y18wIC8vIDAKCmFkZF9wYXJ0aWNpcGFudHNfZm9yX2hlYWRlckAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxNTAKICAgIC8vIGZvciBpIGluIHVyYW5nZShhZGRyZXNzZXMubGVuZ3RoKToKICAgIGR1cAogICAgZGlnIDIKICAgIDwKICAgIGJ6IGFkZF9wYXJ0aWNpcGFudHNfYWZ0ZXJfZm9yQDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTUxCiAgICAvLyBhZGRyID0gYWRkcmVzc2VzW2ldLmNvcHkoKQogICAgZGlnIDIKICAgIGV4dHJhY3QgMiAwCiAgICBkaWcgMQogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpbnRjXzMgLy8gMzIKICAgICoKICAgIGludGNfMyAvLyAzMgogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IGluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjE1MgogICAgLy8gYXNzZXJ0IGFkZHIgbm90IGluIHNlbGYucGFydGljaXBhbnRzLCAiQWxyZWFkeSBlbnJvbGxlZCIKICAgIGJ5dGVjIDE1IC8vIDB4NzA1ZgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgIQogICAgYXNzZXJ0IC8vIEFscmVhZHkgZW5yb2xsZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTUzLTE1NgogICAgLy8gc2VsZi5wYXJ0aWNpcGFudHNbYWRkcl0gPSBQYXJ0aWNpcGFudEluZm8oCiAgICAvLyAgICAgZW5yb2xsZWQ9YXJjNC5VSW50OCgxKSwKICAgIC8vICAgICBhc3NpZ25lZD1hcmM0LlVJbnQ4KDApLAogICAgLy8gKQogICAgYnl0ZWMgMjMgLy8gMHgwMTAwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjE1NwogICAgLy8gc2VsZi5wYXJ0aWNpcGFudF9jb3VudC52YWx1ZSArPSBVSW50NjQoMSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0IC8vICJwYXJ0aWNpcGFudF9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wYXJ0aWNpcGFudF9jb3VudCBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBieXRlYyA0IC8vICJwYXJ0aWNpcGFudF9jb3VudCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjE1MAogICAgLy8gZm9yIGkgaW4gdXJhbmdlKGFkZHJlc3Nlcy5sZW5ndGgpOgogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ1cnkgMQogICAgYiBhZGRfcGFydGljaXBhbnRzX2Zvcl9oZWFkZXJAMgoKYWRkX3BhcnRpY2lwYW50c19hZnRlcl9mb3JANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTQ0CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMudHJ1c3RfdmFyaWF0aW9uLmNvbnRyYWN0LlRydXN0VmFyaWF0aW9uLnNlbGZfZW5yb2xsW3JvdXRpbmddKCkgLT4gdm9pZDoKc2VsZl9lbnJvbGw6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjE1OQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMSAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTYxCiAgICAvLyBhc3NlcnQgc2VsZi5zdGF0dXMudmFsdWUgPT0gVUludDY0KFNUQVRVU19BQ1RJVkUpLCAiTm90IGFjdGl2ZSIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJzdGF0dXMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3RhdHVzIGV4aXN0cwogICAgIQogICAgYXNzZXJ0IC8vIE5vdCBhY3RpdmUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTYzCiAgICAvLyBhc3NlcnQgYWRkciBub3QgaW4gc2VsZi5wYXJ0aWNpcGFudHMsICJBbHJlYWR5IGVucm9sbGVkIgogICAgYnl0ZWMgMTUgLy8gMHg3MDVmCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjE2MgogICAgLy8gYWRkciA9IGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKQogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxNjMKICAgIC8vIGFzc2VydCBhZGRyIG5vdCBpbiBzZWxmLnBhcnRpY2lwYW50cywgIkFscmVhZHkgZW5yb2xsZWQiCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICAhCiAgICBhc3NlcnQgLy8gQWxyZWFkeSBlbnJvbGxlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxNjQKICAgIC8vIGlmIHNlbGYubWF4X3BhcnRpY2lwYW50cy52YWx1ZSA+IFVJbnQ2NCgwKToKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMSAvLyAibWF4X3BhcnRpY2lwYW50cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5tYXhfcGFydGljaXBhbnRzIGV4aXN0cwogICAgYnogc2VsZl9lbnJvbGxfYWZ0ZXJfaWZfZWxzZUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjE2NQogICAgLy8gYXNzZXJ0IHNlbGYucGFydGljaXBhbnRfY291bnQudmFsdWUgPCBzZWxmLm1heF9wYXJ0aWNpcGFudHMudmFsdWUsICJGdWxsIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gInBhcnRpY2lwYW50X2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBhcnRpY2lwYW50X2NvdW50IGV4aXN0cwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDExIC8vICJtYXhfcGFydGljaXBhbnRzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1heF9wYXJ0aWNpcGFudHMgZXhpc3RzCiAgICA8CiAgICBhc3NlcnQgLy8gRnVsbAoKc2VsZl9lbnJvbGxfYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxNjYKICAgIC8vIGFzc2VydCBtYnJfcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLCAiV3JvbmcgcmVjZWl2ZXIiCiAgICBkaWcgMQogICAgZHVwCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gV3JvbmcgcmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTY3CiAgICAvLyBhc3NlcnQgbWJyX3BheW1lbnQuYW1vdW50ID49IFVJbnQ2NCgxNl85MDApLCAiSW5zdWZmaWNpZW50IE1CUiIKICAgIGd0eG5zIEFtb3VudAogICAgaW50YyA0IC8vIDE2OTAwCiAgICA+PQogICAgYXNzZXJ0IC8vIEluc3VmZmljaWVudCBNQlIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTY4LTE3NgogICAgLy8gIyBWZXJpZnkgc2VuZGVyIGlzIHJlZ2lzdGVyZWQgaW4gQnhIaXZlUmVnaXN0cnkKICAgIC8vIGl0eG4uQXBwbGljYXRpb25DYWxsKAogICAgLy8gICAgIGFwcF9pZD1BcHBsaWNhdGlvbihzZWxmLnJlZ2lzdHJ5X2FwcC52YWx1ZSksCiAgICAvLyAgICAgYXBwX2FyZ3M9KAogICAgLy8gICAgICAgICBCeXRlcyhiIlx4NmZceGFkXHg0YVx4NjUiKSwgICMgZ2V0X3VzZXIoYWRkcmVzcykgc2VsZWN0b3IKICAgIC8vICAgICAgICAgYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLmJ5dGVzLAogICAgLy8gICAgICksCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjE3MAogICAgLy8gYXBwX2lkPUFwcGxpY2F0aW9uKHNlbGYucmVnaXN0cnlfYXBwLnZhbHVlKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxOSAvLyAicmVnaXN0cnlfYXBwIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJlZ2lzdHJ5X2FwcCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTczCiAgICAvLyBhcmM0LkFkZHJlc3MoVHhuLnNlbmRlcikuYnl0ZXMsCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjE3MgogICAgLy8gQnl0ZXMoYiJceDZmXHhhZFx4NGFceDY1IiksICAjIGdldF91c2VyKGFkZHJlc3MpIHNlbGVjdG9yCiAgICBwdXNoYnl0ZXMgMHg2ZmFkNGE2NQogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTY4LTE2OQogICAgLy8gIyBWZXJpZnkgc2VuZGVyIGlzIHJlZ2lzdGVyZWQgaW4gQnhIaXZlUmVnaXN0cnkKICAgIC8vIGl0eG4uQXBwbGljYXRpb25DYWxsKAogICAgcHVzaGludCA2IC8vIGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTc1CiAgICAvLyBmZWU9MCwKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxNjgtMTc2CiAgICAvLyAjIFZlcmlmeSBzZW5kZXIgaXMgcmVnaXN0ZXJlZCBpbiBCeEhpdmVSZWdpc3RyeQogICAgLy8gaXR4bi5BcHBsaWNhdGlvbkNhbGwoCiAgICAvLyAgICAgYXBwX2lkPUFwcGxpY2F0aW9uKHNlbGYucmVnaXN0cnlfYXBwLnZhbHVlKSwKICAgIC8vICAgICBhcHBfYXJncz0oCiAgICAvLyAgICAgICAgIEJ5dGVzKGIiXHg2Zlx4YWRceDRhXHg2NSIpLCAgIyBnZXRfdXNlcihhZGRyZXNzKSBzZWxlY3RvcgogICAgLy8gICAgICAgICBhcmM0LkFkZHJlc3MoVHhuLnNlbmRlcikuYnl0ZXMsCiAgICAvLyAgICAgKSwKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjE3Ny0xODAKICAgIC8vIHNlbGYucGFydGljaXBhbnRzW2FkZHJdID0gUGFydGljaXBhbnRJbmZvKAogICAgLy8gICAgIGVucm9sbGVkPWFyYzQuVUludDgoMSksCiAgICAvLyAgICAgYXNzaWduZWQ9YXJjNC5VSW50OCgwKSwKICAgIC8vICkKICAgIGR1cAogICAgYnl0ZWMgMjMgLy8gMHgwMTAwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjE4MQogICAgLy8gc2VsZi5wYXJ0aWNpcGFudF9jb3VudC52YWx1ZSArPSBVSW50NjQoMSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0IC8vICJwYXJ0aWNpcGFudF9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wYXJ0aWNpcGFudF9jb3VudCBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBieXRlYyA0IC8vICJwYXJ0aWNpcGFudF9jb3VudCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjE1OQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnRydXN0X3ZhcmlhdGlvbi5jb250cmFjdC5UcnVzdFZhcmlhdGlvbi5jcmVhdGVfbWF0Y2hbcm91dGluZ10oKSAtPiB2b2lkOgpjcmVhdGVfbWF0Y2g6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjE4MwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjE4NQogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5vd25lci52YWx1ZSwgIk5vdCBvd25lciIKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJvd25lciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vd25lciBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gTm90IG93bmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjE4NgogICAgLy8gYXNzZXJ0IG1icl9wYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsICJXcm9uZyBNQlIgcmVjZWl2ZXIiCiAgICBkdXAKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBXcm9uZyBNQlIgcmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTg3CiAgICAvLyBhc3NlcnQgbWJyX3BheW1lbnQuYW1vdW50ID49IFVJbnQ2NChNQVRDSF9NQlIpLCAiSW5zdWZmaWNpZW50IE1CUiIKICAgIGd0eG5zIEFtb3VudAogICAgcHVzaGludCA4ODMwMCAvLyA4ODMwMAogICAgPj0KICAgIGFzc2VydCAvLyBJbnN1ZmZpY2llbnQgTUJSCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjE4OAogICAgLy8gYXNzZXJ0IGludmVzdG9yIGluIHNlbGYucGFydGljaXBhbnRzLCAiSW52ZXN0b3Igbm90IGVucm9sbGVkIgogICAgYnl0ZWMgMTUgLy8gMHg3MDVmCiAgICBkaWcgMgogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIEludmVzdG9yIG5vdCBlbnJvbGxlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxODkKICAgIC8vIGFzc2VydCB0cnVzdGVlIGluIHNlbGYucGFydGljaXBhbnRzLCAiVHJ1c3RlZSBub3QgZW5yb2xsZWQiCiAgICBieXRlYyAxNSAvLyAweDcwNWYKICAgIGRpZyAyCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gVHJ1c3RlZSBub3QgZW5yb2xsZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTkxCiAgICAvLyBpbnZlc3Rvcl9pbmZvID0gc2VsZi5wYXJ0aWNpcGFudHNbaW52ZXN0b3JdLmNvcHkoKQogICAgZGlnIDEKICAgIGJveF9nZXQKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxOTIKICAgIC8vIGFzc2VydCBpbnZlc3Rvcl9pbmZvLmVucm9sbGVkID09IGFyYzQuVUludDgoMSksICJJbnZlc3RvciBub3QgYWN0aXZlIgogICAgZHVwCiAgICBleHRyYWN0IDAgMQogICAgYnl0ZWMgMTIgLy8gMHgwMQogICAgYj09CiAgICBhc3NlcnQgLy8gSW52ZXN0b3Igbm90IGFjdGl2ZQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxOTMKICAgIC8vIGFzc2VydCBpbnZlc3Rvcl9pbmZvLmFzc2lnbmVkID09IGFyYzQuVUludDgoMCksICJJbnZlc3RvciBhbHJlYWR5IGFzc2lnbmVkIgogICAgZXh0cmFjdCAxIDEKICAgIGJ5dGVjIDE2IC8vIDB4MDAKICAgIGI9PQogICAgYXNzZXJ0IC8vIEludmVzdG9yIGFscmVhZHkgYXNzaWduZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTk1CiAgICAvLyB0cnVzdGVlX2luZm8gPSBzZWxmLnBhcnRpY2lwYW50c1t0cnVzdGVlXS5jb3B5KCkKICAgIGR1cAogICAgYm94X2dldAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjE5NgogICAgLy8gYXNzZXJ0IHRydXN0ZWVfaW5mby5lbnJvbGxlZCA9PSBhcmM0LlVJbnQ4KDEpLCAiVHJ1c3RlZSBub3QgYWN0aXZlIgogICAgZHVwCiAgICBleHRyYWN0IDAgMQogICAgYnl0ZWMgMTIgLy8gMHgwMQogICAgYj09CiAgICBhc3NlcnQgLy8gVHJ1c3RlZSBub3QgYWN0aXZlCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjE5NwogICAgLy8gYXNzZXJ0IHRydXN0ZWVfaW5mby5hc3NpZ25lZCA9PSBhcmM0LlVJbnQ4KDApLCAiVHJ1c3RlZSBhbHJlYWR5IGFzc2lnbmVkIgogICAgZXh0cmFjdCAxIDEKICAgIGJ5dGVjIDE2IC8vIDB4MDAKICAgIGI9PQogICAgYXNzZXJ0IC8vIFRydXN0ZWUgYWxyZWFkeSBhc3NpZ25lZAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxOTkKICAgIC8vIG1hdGNoX2lkID0gYXJjNC5VSW50MzIoc2VsZi5tYXRjaF9jb3VudC52YWx1ZSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA3IC8vICJtYXRjaF9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5tYXRjaF9jb3VudCBleGlzdHMKICAgIGR1cAogICAgaXRvYgogICAgZHVwCiAgICBiaXRsZW4KICAgIGludGNfMyAvLyAzMgogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZXh0cmFjdCA0IDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MjAwCiAgICAvLyBzZWxmLm1hdGNoX2NvdW50LnZhbHVlICs9IFVJbnQ2NCgxKQogICAgc3dhcAogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjIDcgLy8gIm1hdGNoX2NvdW50IgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MjA3CiAgICAvLyBjcmVhdGVkX2F0PWFyYzQuVUludDY0KEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wKSwKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MjAyLTIxNAogICAgLy8gc2VsZi5tYXRjaGVzW21hdGNoX2lkXSA9IE1hdGNoKAogICAgLy8gICAgIG1hdGNoX2lkPW1hdGNoX2lkLAogICAgLy8gICAgIGludmVzdG9yPWludmVzdG9yLmNvcHkoKSwKICAgIC8vICAgICB0cnVzdGVlPXRydXN0ZWUuY29weSgpLAogICAgLy8gICAgIHBoYXNlPWFyYzQuVUludDgoUEhBU0VfSU5WRVNUT1JfREVDSVNJT04pLAogICAgLy8gICAgIGNyZWF0ZWRfYXQ9YXJjNC5VSW50NjQoR2xvYmFsLmxhdGVzdF90aW1lc3RhbXApLAogICAgLy8gICAgIGludmVzdG1lbnQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgcmV0dXJuX2Ftb3VudD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBpbnZlc3Rvcl9wYXlvdXQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgdHJ1c3RlZV9wYXlvdXQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgY29tcGxldGVkX2F0PWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIHBhaWRfb3V0PWFyYzQuVUludDgoMCksCiAgICAvLyApCiAgICBkaWcgMQogICAgZGlnIDYKICAgIGNvbmNhdAogICAgZGlnIDUKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToyMDYKICAgIC8vIHBoYXNlPWFyYzQuVUludDgoUEhBU0VfSU5WRVNUT1JfREVDSVNJT04pLAogICAgYnl0ZWMgMTYgLy8gMHgwMAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToyMDItMjE0CiAgICAvLyBzZWxmLm1hdGNoZXNbbWF0Y2hfaWRdID0gTWF0Y2goCiAgICAvLyAgICAgbWF0Y2hfaWQ9bWF0Y2hfaWQsCiAgICAvLyAgICAgaW52ZXN0b3I9aW52ZXN0b3IuY29weSgpLAogICAgLy8gICAgIHRydXN0ZWU9dHJ1c3RlZS5jb3B5KCksCiAgICAvLyAgICAgcGhhc2U9YXJjNC5VSW50OChQSEFTRV9JTlZFU1RPUl9ERUNJU0lPTiksCiAgICAvLyAgICAgY3JlYXRlZF9hdD1hcmM0LlVJbnQ2NChHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCksCiAgICAvLyAgICAgaW52ZXN0bWVudD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICByZXR1cm5fYW1vdW50PWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIGludmVzdG9yX3BheW91dD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICB0cnVzdGVlX3BheW91dD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBjb21wbGV0ZWRfYXQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgcGFpZF9vdXQ9YXJjNC5VSW50OCgwKSwKICAgIC8vICkKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBwdXNoYnl0ZXMgMHgwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MjAyCiAgICAvLyBzZWxmLm1hdGNoZXNbbWF0Y2hfaWRdID0gTWF0Y2goCiAgICBieXRlYyAxNyAvLyAweDZkNWYKICAgIGRpZyAyCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MjAyLTIxNAogICAgLy8gc2VsZi5tYXRjaGVzW21hdGNoX2lkXSA9IE1hdGNoKAogICAgLy8gICAgIG1hdGNoX2lkPW1hdGNoX2lkLAogICAgLy8gICAgIGludmVzdG9yPWludmVzdG9yLmNvcHkoKSwKICAgIC8vICAgICB0cnVzdGVlPXRydXN0ZWUuY29weSgpLAogICAgLy8gICAgIHBoYXNlPWFyYzQuVUludDgoUEhBU0VfSU5WRVNUT1JfREVDSVNJT04pLAogICAgLy8gICAgIGNyZWF0ZWRfYXQ9YXJjNC5VSW50NjQoR2xvYmFsLmxhdGVzdF90aW1lc3RhbXApLAogICAgLy8gICAgIGludmVzdG1lbnQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgcmV0dXJuX2Ftb3VudD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBpbnZlc3Rvcl9wYXlvdXQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgdHJ1c3RlZV9wYXlvdXQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgY29tcGxldGVkX2F0PWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIHBhaWRfb3V0PWFyYzQuVUludDgoMCksCiAgICAvLyApCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjIxNQogICAgLy8gc2VsZi5wbGF5ZXJfbWF0Y2hbaW52ZXN0b3JdID0gbWF0Y2hfaWQKICAgIGJ5dGVjIDIwIC8vIDB4NzA2ZDVmCiAgICB1bmNvdmVyIDUKICAgIGNvbmNhdAogICAgZGlnIDEKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MjE2CiAgICAvLyBzZWxmLnBsYXllcl9tYXRjaFt0cnVzdGVlXSA9IG1hdGNoX2lkCiAgICBieXRlYyAyMCAvLyAweDcwNmQ1ZgogICAgdW5jb3ZlciA0CiAgICBjb25jYXQKICAgIGRpZyAxCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjIxOAogICAgLy8gc2VsZi5wYXJ0aWNpcGFudHNbaW52ZXN0b3JdID0gUGFydGljaXBhbnRJbmZvKGVucm9sbGVkPWFyYzQuVUludDgoMSksIGFzc2lnbmVkPWFyYzQuVUludDgoMSkpCiAgICB1bmNvdmVyIDIKICAgIGJ5dGVjIDI0IC8vIDB4MDEwMQogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToyMTkKICAgIC8vIHNlbGYucGFydGljaXBhbnRzW3RydXN0ZWVdID0gUGFydGljaXBhbnRJbmZvKGVucm9sbGVkPWFyYzQuVUludDgoMSksIGFzc2lnbmVkPWFyYzQuVUludDgoMSkpCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjIxOAogICAgLy8gc2VsZi5wYXJ0aWNpcGFudHNbaW52ZXN0b3JdID0gUGFydGljaXBhbnRJbmZvKGVucm9sbGVkPWFyYzQuVUludDgoMSksIGFzc2lnbmVkPWFyYzQuVUludDgoMSkpCiAgICBieXRlYyAyNCAvLyAweDAxMDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MjE5CiAgICAvLyBzZWxmLnBhcnRpY2lwYW50c1t0cnVzdGVlXSA9IFBhcnRpY2lwYW50SW5mbyhlbnJvbGxlZD1hcmM0LlVJbnQ4KDEpLCBhc3NpZ25lZD1hcmM0LlVJbnQ4KDEpKQogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxODMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgYnl0ZWMgNiAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50cnVzdF92YXJpYXRpb24uY29udHJhY3QuVHJ1c3RWYXJpYXRpb24uY2xvc2VfcmVnaXN0cmF0aW9uW3JvdXRpbmddKCkgLT4gdm9pZDoKY2xvc2VfcmVnaXN0cmF0aW9uOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToyMjUKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYub3duZXIudmFsdWUsICJOb3Qgb3duZXIiCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAib3duZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYub3duZXIgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIE5vdCBvd25lcgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToyMjYKICAgIC8vIGFzc2VydCBzZWxmLnN0YXR1cy52YWx1ZSA9PSBVSW50NjQoU1RBVFVTX0FDVElWRSksICJOb3QgYWN0aXZlIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gInN0YXR1cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdGF0dXMgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQgLy8gTm90IGFjdGl2ZQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToyMjcKICAgIC8vIHNlbGYuc3RhdHVzLnZhbHVlID0gVUludDY0KFNUQVRVU19DTE9TRUQpCiAgICBieXRlY18yIC8vICJzdGF0dXMiCiAgICBpbnRjXzEgLy8gMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MjIzCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMudHJ1c3RfdmFyaWF0aW9uLmNvbnRyYWN0LlRydXN0VmFyaWF0aW9uLnN1Ym1pdF9pbnZlc3Rvcl9kZWNpc2lvbltyb3V0aW5nXSgpIC0+IHZvaWQ6CnN1Ym1pdF9pbnZlc3Rvcl9kZWNpc2lvbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MjMzCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDQgLy8gNAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50MzIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MjM1CiAgICAvLyBhc3NlcnQgbWF0Y2hfaWQgaW4gc2VsZi5tYXRjaGVzLCAiTWF0Y2ggbm90IGZvdW5kIgogICAgYnl0ZWMgMTcgLy8gMHg2ZDVmCiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBNYXRjaCBub3QgZm91bmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MjM2CiAgICAvLyBtYXRjaCA9IHNlbGYubWF0Y2hlc1ttYXRjaF9pZF0uY29weSgpCiAgICBkdXAKICAgIGJveF9nZXQKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToyMzgKICAgIC8vIHNlbmRlcl9hZGRyID0gYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjIzOQogICAgLy8gYXNzZXJ0IHNlbmRlcl9hZGRyID09IG1hdGNoLmludmVzdG9yLCAiTm90IHRoZSBpbnZlc3RvciIKICAgIGRpZyAxCiAgICBleHRyYWN0IDQgMzIKICAgID09CiAgICBhc3NlcnQgLy8gTm90IHRoZSBpbnZlc3RvcgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToyNDAKICAgIC8vIGFzc2VydCBtYXRjaC5waGFzZSA9PSBhcmM0LlVJbnQ4KFBIQVNFX0lOVkVTVE9SX0RFQ0lTSU9OKSwgIldyb25nIHBoYXNlIgogICAgZHVwCiAgICBleHRyYWN0IDY4IDEKICAgIGJ5dGVjIDE2IC8vIDB4MDAKICAgIGI9PQogICAgYXNzZXJ0IC8vIFdyb25nIHBoYXNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjI0MgogICAgLy8gaW52X2Ftb3VudCA9IGludmVzdG1lbnQuYXNfdWludDY0KCkKICAgIGRpZyAyCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjI0MwogICAgLy8gYXNzZXJ0IGludl9hbW91bnQgPD0gc2VsZi5lMS52YWx1ZSwgIkludmVzdG1lbnQgZXhjZWVkcyBlbmRvd21lbnQiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOSAvLyAiZTEiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZTEgZXhpc3RzCiAgICBkaWcgMQogICAgPj0KICAgIGFzc2VydCAvLyBJbnZlc3RtZW50IGV4Y2VlZHMgZW5kb3dtZW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjI0NAogICAgLy8gYXNzZXJ0IGludl9hbW91bnQgJSBzZWxmLnVuaXQudmFsdWUgPT0gVUludDY0KDApLCAiTm90IGEgbXVsdGlwbGUgb2YgdW5pdCIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMCAvLyAidW5pdCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi51bml0IGV4aXN0cwogICAgJQogICAgIQogICAgYXNzZXJ0IC8vIE5vdCBhIG11bHRpcGxlIG9mIHVuaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MjQ2CiAgICAvLyBtYXRjaC5waGFzZSA9IGFyYzQuVUludDgoUEhBU0VfVFJVU1RFRV9ERUNJU0lPTikKICAgIGJ5dGVjIDEyIC8vIDB4MDEKICAgIHJlcGxhY2UyIDY4CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjI0NwogICAgLy8gbWF0Y2guaW52ZXN0bWVudCA9IGludmVzdG1lbnQKICAgIHVuY292ZXIgMgogICAgcmVwbGFjZTIgNzcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MjQ4CiAgICAvLyBzZWxmLm1hdGNoZXNbbWF0Y2hfaWRdID0gbWF0Y2guY29weSgpCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjIzMwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnRydXN0X3ZhcmlhdGlvbi5jb250cmFjdC5UcnVzdFZhcmlhdGlvbi5zdWJtaXRfdHJ1c3RlZV9kZWNpc2lvbltyb3V0aW5nXSgpIC0+IHZvaWQ6CnN1Ym1pdF90cnVzdGVlX2RlY2lzaW9uOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToyNTAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgNCAvLyA0CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQzMgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjI1MgogICAgLy8gYXNzZXJ0IHNlbGYuc3RhdHVzLnZhbHVlICE9IFVJbnQ2NChTVEFUVVNfQ09NUExFVEVEKSwgIlZhcmlhdGlvbiBlbmRlZCIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJzdGF0dXMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3RhdHVzIGV4aXN0cwogICAgcHVzaGludCAyIC8vIDIKICAgICE9CiAgICBhc3NlcnQgLy8gVmFyaWF0aW9uIGVuZGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjI1MwogICAgLy8gYXNzZXJ0IG1hdGNoX2lkIGluIHNlbGYubWF0Y2hlcywgIk1hdGNoIG5vdCBmb3VuZCIKICAgIGJ5dGVjIDE3IC8vIDB4NmQ1ZgogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIGR1cAogICAgY292ZXIgMgogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBNYXRjaCBub3QgZm91bmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MjU0CiAgICAvLyBtYXRjaCA9IHNlbGYubWF0Y2hlc1ttYXRjaF9pZF0uY29weSgpCiAgICBib3hfZ2V0CiAgICBwb3AKICAgIGR1cAogICAgY292ZXIgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToyNTYKICAgIC8vIHNlbmRlcl9hZGRyID0gYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjI1NwogICAgLy8gYXNzZXJ0IHNlbmRlcl9hZGRyID09IG1hdGNoLnRydXN0ZWUsICJOb3QgdGhlIHRydXN0ZWUiCiAgICBkaWcgMQogICAgZXh0cmFjdCAzNiAzMgogICAgZHVwCiAgICBjb3ZlciA0CiAgICA9PQogICAgYXNzZXJ0IC8vIE5vdCB0aGUgdHJ1c3RlZQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToyNTgKICAgIC8vIGFzc2VydCBtYXRjaC5waGFzZSA9PSBhcmM0LlVJbnQ4KFBIQVNFX1RSVVNURUVfREVDSVNJT04pLCAiV3JvbmcgcGhhc2UiCiAgICBkdXAKICAgIGV4dHJhY3QgNjggMQogICAgYnl0ZWMgMTIgLy8gMHgwMQogICAgYj09CiAgICBhc3NlcnQgLy8gV3JvbmcgcGhhc2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MjYwCiAgICAvLyBzID0gbWF0Y2guaW52ZXN0bWVudC5hc191aW50NjQoKQogICAgcHVzaGludCA3NyAvLyA3NwogICAgZXh0cmFjdF91aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MjYxCiAgICAvLyBtID0gc2VsZi5tdWx0aXBsaWVyLnZhbHVlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTQgLy8gIm11bHRpcGxpZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubXVsdGlwbGllciBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MjYyCiAgICAvLyByID0gcmV0dXJuX2Ftb3VudC5hc191aW50NjQoKQogICAgdW5jb3ZlciAyCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjI2MwogICAgLy8gbWF4X3JldHVybiA9IHMgKiBtCiAgICBkaWcgMgogICAgdW5jb3ZlciAyCiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjI2NQogICAgLy8gYXNzZXJ0IHIgPD0gbWF4X3JldHVybiwgIlJldHVybiBleGNlZWRzIG1heGltdW0iCiAgICBkdXAyCiAgICA8PQogICAgYXNzZXJ0IC8vIFJldHVybiBleGNlZWRzIG1heGltdW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MjY2CiAgICAvLyBhc3NlcnQgciAlIHNlbGYudW5pdC52YWx1ZSA9PSBVSW50NjQoMCksICJOb3QgYSBtdWx0aXBsZSBvZiB1bml0IgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEwIC8vICJ1bml0IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnVuaXQgZXhpc3RzCiAgICBkaWcgMgogICAgc3dhcAogICAgJQogICAgIQogICAgYXNzZXJ0IC8vIE5vdCBhIG11bHRpcGxlIG9mIHVuaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MjY4CiAgICAvLyBpbnZlc3Rvcl9wYXlvdXQgPSBzZWxmLmUxLnZhbHVlIC0gcyArIHIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA5IC8vICJlMSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5lMSBleGlzdHMKICAgIHVuY292ZXIgMwogICAgLQogICAgZGlnIDIKICAgICsKICAgIGNvdmVyIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MjY5CiAgICAvLyB0cnVzdGVlX3BheW91dCA9IHNlbGYuZTIudmFsdWUgKyBtYXhfcmV0dXJuIC0gcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEzIC8vICJlMiIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5lMiBleGlzdHMKICAgICsKICAgIHN3YXAKICAgIC0KICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MjcxCiAgICAvLyBpZiBzZWxmLmFzc2V0X2lkLnZhbHVlID09IFVJbnQ2NCgwKToKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJhc3NldF9pZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hc3NldF9pZCBleGlzdHMKICAgIGJueiBzdWJtaXRfdHJ1c3RlZV9kZWNpc2lvbl9lbHNlX2JvZHlANQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToyNzItMjc2CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9QWNjb3VudChtYXRjaC5pbnZlc3Rvci5ieXRlcyksCiAgICAvLyAgICAgYW1vdW50PWludmVzdG9yX3BheW91dCwKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MjczCiAgICAvLyByZWNlaXZlcj1BY2NvdW50KG1hdGNoLmludmVzdG9yLmJ5dGVzKSwKICAgIGRpZyAzCiAgICBleHRyYWN0IDQgMzIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gQWRkcmVzcyBsZW5ndGggaXMgMzIgYnl0ZXMKICAgIGRpZyAzCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToyNzIKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIGludGNfMSAvLyBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6Mjc1CiAgICAvLyBmZWU9MCwKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToyNzItMjc2CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9QWNjb3VudChtYXRjaC5pbnZlc3Rvci5ieXRlcyksCiAgICAvLyAgICAgYW1vdW50PWludmVzdG9yX3BheW91dCwKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjI3OC0yODIKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1BY2NvdW50KG1hdGNoLnRydXN0ZWUuYnl0ZXMpLAogICAgLy8gICAgIGFtb3VudD10cnVzdGVlX3BheW91dCwKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6Mjc5CiAgICAvLyByZWNlaXZlcj1BY2NvdW50KG1hdGNoLnRydXN0ZWUuYnl0ZXMpLAogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBBZGRyZXNzIGxlbmd0aCBpcyAzMiBieXRlcwogICAgZGlnIDEKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjI3OAogICAgLy8gaXR4bi5QYXltZW50KAogICAgaW50Y18xIC8vIHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToyODEKICAgIC8vIGZlZT0wLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjI3OC0yODIKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1BY2NvdW50KG1hdGNoLnRydXN0ZWUuYnl0ZXMpLAogICAgLy8gICAgIGFtb3VudD10cnVzdGVlX3BheW91dCwKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CgpzdWJtaXRfdHJ1c3RlZV9kZWNpc2lvbl9hZnRlcl9pZl9lbHNlQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjI5OAogICAgLy8gc2VsZi5lc2Nyb3dfcGFpZF9vdXQudmFsdWUgKz0gaW52ZXN0b3JfcGF5b3V0ICsgdHJ1c3RlZV9wYXlvdXQKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA1IC8vICJlc2Nyb3dfcGFpZF9vdXQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZXNjcm93X3BhaWRfb3V0IGV4aXN0cwogICAgZGlnIDIKICAgIGR1cAogICAgY292ZXIgMgogICAgZGlnIDMKICAgIGR1cAogICAgY292ZXIgNAogICAgKwogICAgKwogICAgYnl0ZWMgNSAvLyAiZXNjcm93X3BhaWRfb3V0IgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6Mjk5CiAgICAvLyBzZWxmLnBhaWRfb3V0X2NvdW50LnZhbHVlICs9IFVJbnQ2NCgxKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDggLy8gInBhaWRfb3V0X2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBhaWRfb3V0X2NvdW50IGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjIDggLy8gInBhaWRfb3V0X2NvdW50IgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MzAxCiAgICAvLyBtYXRjaC5waGFzZSA9IGFyYzQuVUludDgoUEhBU0VfQ09NUExFVEVEKQogICAgZGlnIDQKICAgIHB1c2hieXRlcyAweDAyCiAgICByZXBsYWNlMiA2OAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTozMDIKICAgIC8vIG1hdGNoLnJldHVybl9hbW91bnQgPSByZXR1cm5fYW1vdW50CiAgICBkaWcgNwogICAgcmVwbGFjZTIgODUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MzAzCiAgICAvLyBtYXRjaC5pbnZlc3Rvcl9wYXlvdXQgPSBhcmM0LlVJbnQ2NChpbnZlc3Rvcl9wYXlvdXQpCiAgICBzd2FwCiAgICBpdG9iCiAgICByZXBsYWNlMiA5MwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTozMDQKICAgIC8vIG1hdGNoLnRydXN0ZWVfcGF5b3V0ID0gYXJjNC5VSW50NjQodHJ1c3RlZV9wYXlvdXQpCiAgICBzd2FwCiAgICBpdG9iCiAgICByZXBsYWNlMiAxMDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MzA1CiAgICAvLyBtYXRjaC5jb21wbGV0ZWRfYXQgPSBhcmM0LlVJbnQ2NChHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCkKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgIGl0b2IKICAgIHJlcGxhY2UyIDEwOQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTozMDYKICAgIC8vIG1hdGNoLnBhaWRfb3V0ID0gYXJjNC5VSW50OCgxKQogICAgYnl0ZWMgMTIgLy8gMHgwMQogICAgcmVwbGFjZTIgMTE3CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjMwNwogICAgLy8gc2VsZi5tYXRjaGVzW21hdGNoX2lkXSA9IG1hdGNoLmNvcHkoKQogICAgZGlnIDQKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MjUwCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCnN1Ym1pdF90cnVzdGVlX2RlY2lzaW9uX2Vsc2VfYm9keUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToyODQtMjg5CiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1Bc3NldChzZWxmLmFzc2V0X2lkLnZhbHVlKSwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1BY2NvdW50KG1hdGNoLmludmVzdG9yLmJ5dGVzKSwKICAgIC8vICAgICBhc3NldF9hbW91bnQ9aW52ZXN0b3JfcGF5b3V0LAogICAgLy8gICAgIGZlZT0wLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToyODUKICAgIC8vIHhmZXJfYXNzZXQ9QXNzZXQoc2VsZi5hc3NldF9pZC52YWx1ZSksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAiYXNzZXRfaWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYXNzZXRfaWQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjI4NgogICAgLy8gYXNzZXRfcmVjZWl2ZXI9QWNjb3VudChtYXRjaC5pbnZlc3Rvci5ieXRlcyksCiAgICBkaWcgNAogICAgZXh0cmFjdCA0IDMyCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIEFkZHJlc3MgbGVuZ3RoIGlzIDMyIGJ5dGVzCiAgICBkaWcgNAogICAgaXR4bl9maWVsZCBBc3NldEFtb3VudAogICAgaXR4bl9maWVsZCBBc3NldFJlY2VpdmVyCiAgICBkdXAKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjI4NAogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgcHVzaGludCA0IC8vIGF4ZmVyCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjI4OAogICAgLy8gZmVlPTAsCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6Mjg0LTI4OQogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgLy8gICAgIHhmZXJfYXNzZXQ9QXNzZXQoc2VsZi5hc3NldF9pZC52YWx1ZSksCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9QWNjb3VudChtYXRjaC5pbnZlc3Rvci5ieXRlcyksCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PWludmVzdG9yX3BheW91dCwKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjI5MS0yOTYKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PUFzc2V0KHNlbGYuYXNzZXRfaWQudmFsdWUpLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPUFjY291bnQobWF0Y2gudHJ1c3RlZS5ieXRlcyksCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PXRydXN0ZWVfcGF5b3V0LAogICAgLy8gICAgIGZlZT0wLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToyOTMKICAgIC8vIGFzc2V0X3JlY2VpdmVyPUFjY291bnQobWF0Y2gudHJ1c3RlZS5ieXRlcyksCiAgICBzd2FwCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIEFkZHJlc3MgbGVuZ3RoIGlzIDMyIGJ5dGVzCiAgICBkaWcgMgogICAgaXR4bl9maWVsZCBBc3NldEFtb3VudAogICAgaXR4bl9maWVsZCBBc3NldFJlY2VpdmVyCiAgICBpdHhuX2ZpZWxkIFhmZXJBc3NldAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToyOTEKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIHB1c2hpbnQgNCAvLyBheGZlcgogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToyOTUKICAgIC8vIGZlZT0wLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjI5MS0yOTYKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PUFzc2V0KHNlbGYuYXNzZXRfaWQudmFsdWUpLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPUFjY291bnQobWF0Y2gudHJ1c3RlZS5ieXRlcyksCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PXRydXN0ZWVfcGF5b3V0LAogICAgLy8gICAgIGZlZT0wLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIGIgc3VibWl0X3RydXN0ZWVfZGVjaXNpb25fYWZ0ZXJfaWZfZWxzZUA4CgoKLy8gc21hcnRfY29udHJhY3RzLnRydXN0X3ZhcmlhdGlvbi5jb250cmFjdC5UcnVzdFZhcmlhdGlvbi53aXRoZHJhd19lc2Nyb3dbcm91dGluZ10oKSAtPiB2b2lkOgp3aXRoZHJhd19lc2Nyb3c6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjMxMQogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5vd25lci52YWx1ZSwgIk5vdCBvd25lciIKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJvd25lciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vd25lciBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gTm90IG93bmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjMxMgogICAgLy8gYXNzZXJ0IHNlbGYucGFpZF9vdXRfY291bnQudmFsdWUgPT0gc2VsZi5tYXRjaF9jb3VudC52YWx1ZSwgIk1hdGNoZXMgbm90IGFsbCBwYWlkIG91dCIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA4IC8vICJwYWlkX291dF9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wYWlkX291dF9jb3VudCBleGlzdHMKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA3IC8vICJtYXRjaF9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5tYXRjaF9jb3VudCBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gTWF0Y2hlcyBub3QgYWxsIHBhaWQgb3V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjMxNAogICAgLy8gcmVtYWluaW5nID0gc2VsZi5lc2Nyb3dfZGVwb3NpdGVkLnZhbHVlIC0gc2VsZi5lc2Nyb3dfcGFpZF9vdXQudmFsdWUKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJlc2Nyb3dfZGVwb3NpdGVkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmVzY3Jvd19kZXBvc2l0ZWQgZXhpc3RzCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNSAvLyAiZXNjcm93X3BhaWRfb3V0IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmVzY3Jvd19wYWlkX291dCBleGlzdHMKICAgIC0KICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTozMTUKICAgIC8vIGFzc2VydCByZW1haW5pbmcgPiBVSW50NjQoMCksICJObyByZW1haW5pbmcgZXNjcm93IgogICAgYXNzZXJ0IC8vIE5vIHJlbWFpbmluZyBlc2Nyb3cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MzE3CiAgICAvLyBpZiBzZWxmLmFzc2V0X2lkLnZhbHVlID09IFVJbnQ2NCgwKToKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJhc3NldF9pZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hc3NldF9pZCBleGlzdHMKICAgIGJueiB3aXRoZHJhd19lc2Nyb3dfZWxzZV9ib2R5QDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MzE4LTMyMgogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPXNlbGYub3duZXIudmFsdWUsCiAgICAvLyAgICAgYW1vdW50PXJlbWFpbmluZywKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MzE5CiAgICAvLyByZWNlaXZlcj1zZWxmLm93bmVyLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gIm93bmVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm93bmVyIGV4aXN0cwogICAgZGlnIDEKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjMxOAogICAgLy8gaXR4bi5QYXltZW50KAogICAgaW50Y18xIC8vIHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTozMjEKICAgIC8vIGZlZT0wLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjMxOC0zMjIKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1zZWxmLm93bmVyLnZhbHVlLAogICAgLy8gICAgIGFtb3VudD1yZW1haW5pbmcsCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAoKd2l0aGRyYXdfZXNjcm93X2FmdGVyX2lmX2Vsc2VANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MzMxCiAgICAvLyBzZWxmLmVzY3Jvd19kZXBvc2l0ZWQudmFsdWUgLT0gcmVtYWluaW5nCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAiZXNjcm93X2RlcG9zaXRlZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5lc2Nyb3dfZGVwb3NpdGVkIGV4aXN0cwogICAgZGlnIDEKICAgIC0KICAgIGJ5dGVjXzAgLy8gImVzY3Jvd19kZXBvc2l0ZWQiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTozMDkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKd2l0aGRyYXdfZXNjcm93X2Vsc2VfYm9keUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTozMjQtMzI5CiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1Bc3NldChzZWxmLmFzc2V0X2lkLnZhbHVlKSwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1zZWxmLm93bmVyLnZhbHVlLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1yZW1haW5pbmcsCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjMyNQogICAgLy8geGZlcl9hc3NldD1Bc3NldChzZWxmLmFzc2V0X2lkLnZhbHVlKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJhc3NldF9pZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hc3NldF9pZCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MzI2CiAgICAvLyBhc3NldF9yZWNlaXZlcj1zZWxmLm93bmVyLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gIm93bmVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm93bmVyIGV4aXN0cwogICAgZGlnIDIKICAgIGl0eG5fZmllbGQgQXNzZXRBbW91bnQKICAgIGl0eG5fZmllbGQgQXNzZXRSZWNlaXZlcgogICAgaXR4bl9maWVsZCBYZmVyQXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MzI0CiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICBwdXNoaW50IDQgLy8gYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MzI4CiAgICAvLyBmZWU9MCwKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTozMjQtMzI5CiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1Bc3NldChzZWxmLmFzc2V0X2lkLnZhbHVlKSwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1zZWxmLm93bmVyLnZhbHVlLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1yZW1haW5pbmcsCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgYiB3aXRoZHJhd19lc2Nyb3dfYWZ0ZXJfaWZfZWxzZUA2CgoKLy8gc21hcnRfY29udHJhY3RzLnRydXN0X3ZhcmlhdGlvbi5jb250cmFjdC5UcnVzdFZhcmlhdGlvbi5nZXRfY29uZmlnW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X2NvbmZpZzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MzQwCiAgICAvLyBlMT1hcmM0LlVJbnQ2NChzZWxmLmUxLnZhbHVlKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA5IC8vICJlMSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5lMSBleGlzdHMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MzQxCiAgICAvLyBlMj1hcmM0LlVJbnQ2NChzZWxmLmUyLnZhbHVlKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMyAvLyAiZTIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZTIgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjM0MgogICAgLy8gbXVsdGlwbGllcj1hcmM0LlVJbnQ2NChzZWxmLm11bHRpcGxpZXIudmFsdWUpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE0IC8vICJtdWx0aXBsaWVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm11bHRpcGxpZXIgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjM0MwogICAgLy8gdW5pdD1hcmM0LlVJbnQ2NChzZWxmLnVuaXQudmFsdWUpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEwIC8vICJ1bml0IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnVuaXQgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjM0NAogICAgLy8gYXNzZXRfaWQ9YXJjNC5VSW50NjQoc2VsZi5hc3NldF9pZC52YWx1ZSksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAiYXNzZXRfaWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYXNzZXRfaWQgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjM0NQogICAgLy8gc3RhdHVzPWFyYzQuVUludDgoc2VsZi5zdGF0dXMudmFsdWUpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gInN0YXR1cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdGF0dXMgZXhpc3RzCiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgaW50Y18yIC8vIDgKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGV4dHJhY3QgNyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjM0NgogICAgLy8gbWF4X3BhcnRpY2lwYW50cz1hcmM0LlVJbnQ2NChzZWxmLm1heF9wYXJ0aWNpcGFudHMudmFsdWUpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDExIC8vICJtYXhfcGFydGljaXBhbnRzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1heF9wYXJ0aWNpcGFudHMgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjMzOS0zNDcKICAgIC8vIHJldHVybiBWYXJpYXRpb25Db25maWcoCiAgICAvLyAgICAgZTE9YXJjNC5VSW50NjQoc2VsZi5lMS52YWx1ZSksCiAgICAvLyAgICAgZTI9YXJjNC5VSW50NjQoc2VsZi5lMi52YWx1ZSksCiAgICAvLyAgICAgbXVsdGlwbGllcj1hcmM0LlVJbnQ2NChzZWxmLm11bHRpcGxpZXIudmFsdWUpLAogICAgLy8gICAgIHVuaXQ9YXJjNC5VSW50NjQoc2VsZi51bml0LnZhbHVlKSwKICAgIC8vICAgICBhc3NldF9pZD1hcmM0LlVJbnQ2NChzZWxmLmFzc2V0X2lkLnZhbHVlKSwKICAgIC8vICAgICBzdGF0dXM9YXJjNC5VSW50OChzZWxmLnN0YXR1cy52YWx1ZSksCiAgICAvLyAgICAgbWF4X3BhcnRpY2lwYW50cz1hcmM0LlVJbnQ2NChzZWxmLm1heF9wYXJ0aWNpcGFudHMudmFsdWUpLAogICAgLy8gKQogICAgdW5jb3ZlciA2CiAgICB1bmNvdmVyIDYKICAgIGNvbmNhdAogICAgdW5jb3ZlciA1CiAgICBjb25jYXQKICAgIHVuY292ZXIgNAogICAgY29uY2F0CiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTozMzcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWMgNiAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50cnVzdF92YXJpYXRpb24uY29udHJhY3QuVHJ1c3RWYXJpYXRpb24uZ2V0X21hdGNoW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X21hdGNoOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTozNDkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgNCAvLyA0CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQzMgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTozNTEKICAgIC8vIGFzc2VydCBtYXRjaF9pZCBpbiBzZWxmLm1hdGNoZXMsICJNYXRjaCBub3QgZm91bmQiCiAgICBieXRlYyAxNyAvLyAweDZkNWYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBNYXRjaCBub3QgZm91bmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MzUyCiAgICAvLyByZXR1cm4gc2VsZi5tYXRjaGVzW21hdGNoX2lkXS5jb3B5KCkKICAgIGJveF9nZXQKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTozNDkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWMgNiAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50cnVzdF92YXJpYXRpb24uY29udHJhY3QuVHJ1c3RWYXJpYXRpb24uZ2V0X3BsYXllcl9tYXRjaFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9wbGF5ZXJfbWF0Y2g6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjM1NAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MzU2CiAgICAvLyBhc3NlcnQgYWRkciBpbiBzZWxmLnBsYXllcl9tYXRjaCwgIk5vIGFjdGl2ZSBtYXRjaCIKICAgIGJ5dGVjIDIwIC8vIDB4NzA2ZDVmCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gTm8gYWN0aXZlIG1hdGNoCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjM1NwogICAgLy8gcmV0dXJuIHNlbGYucGxheWVyX21hdGNoW2FkZHJdCiAgICBib3hfZ2V0CiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MzU0CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjIDYgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMudHJ1c3RfdmFyaWF0aW9uLmNvbnRyYWN0LlRydXN0VmFyaWF0aW9uLmdldF9wYXJ0aWNpcGFudF9jb3VudFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9wYXJ0aWNpcGFudF9jb3VudDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MzYxCiAgICAvLyByZXR1cm4gYXJjNC5VSW50NjQoc2VsZi5wYXJ0aWNpcGFudF9jb3VudC52YWx1ZSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0IC8vICJwYXJ0aWNpcGFudF9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wYXJ0aWNpcGFudF9jb3VudCBleGlzdHMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MzU5CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjIDYgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMudHJ1c3RfdmFyaWF0aW9uLmNvbnRyYWN0LlRydXN0VmFyaWF0aW9uLmdldF9lc2Nyb3dfYmFsYW5jZVtyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9lc2Nyb3dfYmFsYW5jZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MzY1CiAgICAvLyByZXR1cm4gYXJjNC5VSW50NjQoc2VsZi5lc2Nyb3dfZGVwb3NpdGVkLnZhbHVlIC0gc2VsZi5lc2Nyb3dfcGFpZF9vdXQudmFsdWUpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAiZXNjcm93X2RlcG9zaXRlZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5lc2Nyb3dfZGVwb3NpdGVkIGV4aXN0cwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDUgLy8gImVzY3Jvd19wYWlkX291dCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5lc2Nyb3dfcGFpZF9vdXQgZXhpc3RzCiAgICAtCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjM2MwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlYyA2IC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCg==","clear":"I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"},"byteCode":{"approval":"CyAFAAEIIISEASYZEGVzY3Jvd19kZXBvc2l0ZWQFb3duZXIGc3RhdHVzCGFzc2V0X2lkEXBhcnRpY2lwYW50X2NvdW50D2VzY3Jvd19wYWlkX291dAQVH3x1C21hdGNoX2NvdW50DnBhaWRfb3V0X2NvdW50AmUxBHVuaXQQbWF4X3BhcnRpY2lwYW50cwEBAmUyCm11bHRpcGxpZXICcF8BAAJtXw9leHBlcmltZW50c19hcHAMcmVnaXN0cnlfYXBwA3BtXwZleHBfaWQGdmFyX2lkAgEAAgEBMRhAAD0nEiJnJxUiZycWImcqImcnByJnJwgiZycJImcnDSJnJw4iZycKImcrImcoImcnBSJnJxMiZycEImcnCyJnMRkURDEYQQBxgg8EjetFmwRcmoNrBDji53MEUdsQkAQf0EBjBGwfuL8E8Qum2AQeMHeQBEg6tTUEayT9lgTIHtViBFueBVgE5eoppQSbuSDsBCGh1UA2GgCODwDlAQwBLQGQAgQCbwNSA2UDswTXBTgFggWdBbcFxACABLjbhgU2GgCOAQABADYaAUkVJBJENhoCSRWBBBJENhoDSRWBBBJENhoESRUlEkQ2GgVJFSQSRDYaBkkVJBJENhoHSRUkEkQ2GghJFSQSRDYaCUkVJBJENhoKSRUkEkQ2GgtJFSQSRE8DF0lETwoXJxJMZ08JFycVTGdPCBcnFkxnKU8IZyoiZycHImcnCCJnTwYXJwlMZ08FFycNTGdPBBcnDkxnJwpMZ08CF0lOAytLAWcoImcnBSJnTwIXJxNMZycEImdMFycLTGdBABOxMgoishKyFEmyEYEEshAisgGzI0MxFiMJSTgQIxJEMQAiKWVEEkRJOAcyChJEOAhJRCIoZUQIKExnI0M2GgFJFSQSRDEAIicSZURyCEQSRBdJRCIoZUQIKExnI0MxACIpZUQSRCIqZUSBAhNEIihlRCInBWVECUlBACMiK2VEQAAisSIpZURLAbIIsgcjshAisgGzIihlREsBCShMZyqBAmcjQ7EiK2VEIillREsCshKyFLIRgQSyECKyAbNC/9Q2GgFHAiJZSU4CSSULgQIITwIVEkQxFiMJSTgQIxJEMQAiKWVEEkQiKmVEFERJOAcyChJEOAghBE8CCw9EIklLAgxBAC1LAlcCAEsBSU4CJQslWCcPTFBJvUUBFEQnF78iJwRlRCMIJwRMZyMIRQFC/8wjQzEWIwlJOBAjEkQiKmVEFEQnDzEAUEm9RQEURCInC2VEQQAMIicEZUQiJwtlRAxESwFJOAcyChJEOAghBA9EsSInE2VEMQCABG+tSmWyGrIashiBBrIQIrIBs0knF78iJwRlRCMIJwRMZyNDNhoBSRUlEkQ2GgJJFSUSRDEWIwlJOBAjEkQxACIpZUQSREk4BzIKEkQ4CIHssQUPRCcPSwJQSb1FAUQnD0sCUEm9RQFESwG+SElXAAEnDKhEVwEBJxCoREm+SElXAAEnDKhEVwEBJxCoRCInB2VESRZJkyUORFcEBEwjCCcHTGcyBxZLAUsGUEsFUCcQUExQgCkAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFAnEUsCUEy/JxRPBVBLAb8nFE8EUEsBv08CJxi/TCcYvycGTFCwI0MxACIpZUQSRCIqZUQURCojZyNDNhoBSRWBBBJENhoCSRUkEkQnEU8CUEm9RQFESb5IMQBLAVcEIBJESVdEAScQqERLAhciJwllREsBD0QiJwplRBgURCcMXERPAlxNvyNDNhoBSRWBBBJENhoCSU4CSRUkEkQiKmVEgQITRCcRTwJQSU4CSb1FAUS+SElOAjEASwFXJCBJTgQSRElXRAEnDKhEgU1bIicOZURPAhdLAk8CC0oORCInCmVESwJMGBREIicJZURPAwlLAghOAyInDWVECEwJTCIrZURAAG2xSwNXBCBJFSUSREsDsgiyByOyECKyAbOxSRUlEkRLAbIIsgcjshAisgGzIicFZURLAklOAksDSU4ECAgnBUxnIicIZUQjCCcITGdLBIABAlxESwdcVUwWXF1MFlxlMgcWXG0nDFx1SwRMvyNDsSIrZURLBFcEIEkVJRJESwSyErIUSbIRgQSyECKyAbOxTEkVJRJESwKyErIUshGBBLIQIrIBs0L/hDEAIillRBJEIicIZUQiJwdlRBJEIihlRCInBWVECUlEIitlREAAHrEiKWVESwGyCLIHI7IQIrIBsyIoZURLAQkoTGcjQ7EiK2VEIillREsCshKyFLIRgQSyECKyAbNC/9giJwllRBYiJw1lRBYiJw5lRBYiJwplRBYiK2VEFiIqZUQWSZMkDkRXBwEiJwtlRBZPBk8GUE8FUE8EUE8DUE8CUExQJwZMULAjQzYaAUkVgQQSRCcRTFBJvUUBRL5IJwZMULAjQzYaAUkVJRJEJxRMUEm9RQFEvkgnBkxQsCNDIicEZUQWJwZMULAjQyIoZUQiJwVlRAkWJwZMULAjQw==","clear":"C4EBQw=="},"events":[],"templateVariables":{}} as unknown as Arc56Contract
+export const APP_SPEC: Arc56Contract = {"name":"TrustVariation","structs":{"Match":[{"name":"matchId","type":"uint32"},{"name":"investor","type":"address"},{"name":"trustee","type":"address"},{"name":"phase","type":"uint8"},{"name":"createdAt","type":"uint64"},{"name":"investment","type":"uint64"},{"name":"returnAmount","type":"uint64"},{"name":"investorPayout","type":"uint64"},{"name":"trusteePayout","type":"uint64"},{"name":"completedAt","type":"uint64"},{"name":"paidOut","type":"uint8"}],"ParticipantInfo":[{"name":"enrolled","type":"uint8"},{"name":"assigned","type":"uint8"},{"name":"matchId","type":"uint32"}],"PlayerState":[{"name":"participant","type":"ParticipantInfo"},{"name":"hasMatch","type":"uint8"},{"name":"match","type":"Match"},{"name":"config","type":"VariationConfig"}],"VariationConfig":[{"name":"e1","type":"uint64"},{"name":"e2","type":"uint64"},{"name":"multiplier","type":"uint64"},{"name":"unit","type":"uint64"},{"name":"assetId","type":"uint64"},{"name":"status","type":"uint8"},{"name":"maxParticipants","type":"uint64"}],"VariationStats":[{"name":"investedCount","type":"uint64"},{"name":"completedCount","type":"uint64"},{"name":"sumInvestment","type":"uint64"},{"name":"sumsqInvestment","type":"uint128"},{"name":"sumReturn","type":"uint64"},{"name":"sumsqReturn","type":"uint128"},{"name":"sumInvestorPayout","type":"uint64"},{"name":"sumsqInvestorPayout","type":"uint128"},{"name":"sumTrusteePayout","type":"uint64"},{"name":"sumsqTrusteePayout","type":"uint128"}]},"methods":[{"name":"create","args":[{"type":"uint64","name":"experiments_app"},{"type":"uint32","name":"exp_id"},{"type":"uint32","name":"var_id"},{"type":"address","name":"owner"},{"type":"uint64","name":"e1"},{"type":"uint64","name":"e2"},{"type":"uint64","name":"multiplier"},{"type":"uint64","name":"unit"},{"type":"uint64","name":"asset_id"},{"type":"uint64","name":"registry_app"},{"type":"uint64","name":"max_participants"}],"returns":{"type":"void"},"actions":{"create":["NoOp"],"call":[]},"readonly":false,"events":[],"recommendations":{}},{"name":"deposit_escrow","args":[{"type":"pay","name":"payment"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[{"name":"EscrowDeposited","args":[{"type":"uint64","name":"amount"},{"type":"uint64","name":"deposited"}]}],"recommendations":{}},{"name":"record_escrow","args":[{"type":"uint64","name":"amount"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[{"name":"EscrowDeposited","args":[{"type":"uint64","name":"amount"},{"type":"uint64","name":"deposited"}]}],"recommendations":{}},{"name":"enable_treasury_funding","args":[],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Called by TrustExperiments right after create for treasury-funded\nvariations: instead of holding a prefunded escrow, the variation draws each payout shortfall from the experiment treasury when it is needed.","events":[],"recommendations":{}},{"name":"end_variation","args":[],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[{"name":"VariationEnded","args":[{"type":"uint64","name":"refunded"},{"type":"uint64","name":"retained"}]}],"recommendations":{}},{"name":"sweep_boxes","args":[{"type":"uint8","name":"kind"},{"type":"byte[][]","name":"keys"}],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Delete boxes of one SWEEP_* kind from an ended variation and refund\ntheir MBR to the owner in one payment; returns the amount. keys are the box keys without prefix (32-byte address or 4-byte uint32). Missing keys and matches with an unsettled deferred payout are skipped, so sweeps can be retried. Swept data is gone from get_match/get_matches; the events remain the record. The payment also returns the MBR of claim boxes claimed since the last refund, so a call with no keys collects just that.","events":[{"name":"BoxesSwept","args":[{"type":"uint8","name":"kind"},{"type":"uint64","name":"count"},{"type":"uint64","name":"refunded"}]}],"recommendations":{}},{"name":"set_settlement_mode","args":[{"type":"uint8","name":"mode"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"SETTLEMENT_IMMEDIATE pays both players inside submit_trustee_decision.\nSETTLEMENT_DEFERRED only records the payouts; the owner pushes them later in bulk with settle(). SETTLEMENT_CLAIM credits them to the claim ledger and each player pulls their balance with claim().\nThe mode is fixed once the first match exists, because match MBR depends on it (claim boxes are prepaid at match creation).","events":[],"recommendations":{}},{"name":"enable_auto_match","args":[],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Record every later enrollment's position in an o_ box so auto_match can\npair in enrollment order. Must precede the first enrollment, since earlier participants would have no position; each enrollment then costs PARTICIPANT_MBR + ORDER_BOX_MBR.","events":[],"recommendations":{}},{"name":"add_participants","args":[{"type":"address[]","name":"addresses"},{"type":"pay","name":"mbr_payment"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[{"name":"ParticipantsEnrolled","args":[{"type":"uint32","name":"first_position"},{"type":"uint32","name":"count"}]}],"recommendations":{}},{"name":"self_enroll","args":[{"type":"pay","name":"mbr_payment"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[{"name":"ParticipantEnrolled","args":[{"type":"address","name":"addr"},{"type":"uint32","name":"position"}]}],"recommendations":{}},{"name":"self_enroll_grouped","args":[{"type":"appl","name":"registry_call"},{"type":"pay","name":"mbr_payment"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"self_enroll without the inner call: the sender puts their own\nBxHiveRegistry.get_user(sender) call in the group instead. get_user fails for unregistered accounts and groups are atomic, so its presence proves registration at the minimum fee; its return log carries the user_id that is checked against the roster.","events":[{"name":"ParticipantEnrolled","args":[{"type":"address","name":"addr"},{"type":"uint32","name":"position"}]}],"recommendations":{}},{"name":"self_enroll_with_proof","args":[{"type":"uint32","name":"user_id"},{"type":"byte[]","name":"proof"},{"type":"pay","name":"mbr_payment"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"self_enroll without any registry call: proof is the sender's path in\nthe registry member tree (registry/membership.py member_proof), checked against the registry's member root globals read directly. The hashes need about 1,200 opcodes; pool them with another app call in the group or pay one extra minimum fee for the op-up.","events":[{"name":"ParticipantEnrolled","args":[{"type":"address","name":"addr"},{"type":"uint32","name":"position"}]}],"recommendations":{}},{"name":"enroll_user_ids","args":[{"type":"uint32[]","name":"user_ids"},{"type":"pay","name":"mbr_payment"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Enroll registry users into the roster bitmap instead of p_ boxes. The\nbitmap grows to cover the highest user_id; the MBR payment must cover the added bytes (plus ROSTER_BOX_MBR the first time). No per-user event is emitted, so large batches stay within the log limits. Roster users count towards max_participants; ones that also hold a p_ box are rejected by create_match_by_ids, and self-enrollment rejects roster user_ids.","events":[],"recommendations":{}},{"name":"create_match","args":[{"type":"address","name":"investor"},{"type":"address","name":"trustee"},{"type":"pay","name":"mbr_payment"}],"returns":{"type":"uint32"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[{"name":"MatchCreated","args":[{"type":"uint32","name":"match_id"},{"type":"address","name":"investor"},{"type":"address","name":"trustee"}]}],"recommendations":{}},{"name":"create_matches","args":[{"type":"(address,address)[]","name":"pairs"},{"type":"pay","name":"mbr_payment"}],"returns":{"type":"uint32"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Pair several (investor, trustee) tuples in one call, funded by a single\naggregate MBR payment. Match IDs are assigned sequentially; returns the first one. Emits a single MatchesCreated for the whole batch.","events":[{"name":"MatchesCreated","args":[{"type":"uint32","name":"first_match_id"},{"type":"uint32","name":"count"}]}],"recommendations":{}},{"name":"auto_match","args":[{"type":"uint64","name":"n"},{"type":"pay","name":"mbr_payment"}],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Pair up to n unassigned participants in enrollment order, starting at\nmatch_cursor. Within a pair the earlier enrollee is the investor and the later one the trustee; participants already paired via create_match are skipped. An odd leftover stays unpaired and the cursor parks on it so the next call picks it up. MBR is charged for n / 2 matches up front. Requires enable_auto_match. Emits one MatchesCreated and returns the number of matches created.","events":[{"name":"MatchesCreated","args":[{"type":"uint32","name":"first_match_id"},{"type":"uint32","name":"count"}]}],"recommendations":{}},{"name":"create_match_by_ids","args":[{"type":"uint32","name":"investor_id"},{"type":"address","name":"investor"},{"type":"uint32","name":"trustee_id"},{"type":"address","name":"trustee"},{"type":"pay","name":"mbr_payment"}],"returns":{"type":"uint32"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Pair two roster participants. Each address is checked against its\nuser_id in BxHiveRegistry, since the roster only stores flags. Roster players have no p_ box: they find their match through the MatchCreated event or get_matches rather than get_player_match.","events":[{"name":"MatchCreated","args":[{"type":"uint32","name":"match_id"},{"type":"address","name":"investor"},{"type":"address","name":"trustee"}]}],"recommendations":{}},{"name":"close_registration","args":[],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[],"recommendations":{}},{"name":"submit_investor_decision","args":[{"type":"uint32","name":"match_id"},{"type":"uint64","name":"investment"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[{"name":"InvestorDecided","args":[{"type":"uint32","name":"match_id"},{"type":"uint64","name":"investment"}]}],"recommendations":{}},{"name":"submit_trustee_decision","args":[{"type":"uint32","name":"match_id"},{"type":"uint64","name":"return_amount"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[{"name":"EscrowDeposited","args":[{"type":"uint64","name":"amount"},{"type":"uint64","name":"deposited"}]},{"name":"MatchPaidOut","args":[{"type":"uint32","name":"match_id"},{"type":"uint64","name":"investor_payout"},{"type":"uint64","name":"trustee_payout"}]},{"name":"TrusteeDecided","args":[{"type":"uint32","name":"match_id"},{"type":"uint64","name":"return_amount"},{"type":"uint64","name":"investor_payout"},{"type":"uint64","name":"trustee_payout"}]}],"recommendations":{}},{"name":"settle","args":[{"type":"uint32[]","name":"match_ids"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Push the recorded payouts of completed, unpaid matches, at most\nMAX_SETTLE_PER_CALL per call. Each match costs two inner transactions, so one group (four settle calls pooling their budget) can settle up to 128.","events":[{"name":"MatchPaidOut","args":[{"type":"uint32","name":"match_id"},{"type":"uint64","name":"investor_payout"},{"type":"uint64","name":"trustee_payout"}]}],"recommendations":{}},{"name":"claim","args":[],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Pay out everything the claim ledger owes the sender in one transfer.","events":[{"name":"PayoutClaimed","args":[{"type":"address","name":"addr"},{"type":"uint64","name":"amount"}]}],"recommendations":{}},{"name":"withdraw_escrow","args":[],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[{"name":"EscrowWithdrawn","args":[{"type":"address","name":"receiver"},{"type":"uint64","name":"amount"}]}],"recommendations":{}},{"name":"get_config","args":[],"returns":{"type":"(uint64,uint64,uint64,uint64,uint64,uint8,uint64)","struct":"VariationConfig"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_player_state","args":[{"type":"address","name":"addr"}],"returns":{"type":"((uint8,uint8,uint32),uint8,(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8),(uint64,uint64,uint64,uint64,uint64,uint8,uint64))","struct":"PlayerState"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"desc":"Participant record, their match and the variation config in one call.\nUnknown addresses get enrolled == 0; match is zeroed when has_match == 0, which includes an assigned player whose m_ box sweep_boxes has deleted.","events":[],"recommendations":{}},{"name":"get_match","args":[{"type":"uint32","name":"match_id"}],"returns":{"type":"(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)","struct":"Match"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_matches","args":[{"type":"uint32","name":"start"},{"type":"uint32","name":"count"}],"returns":{"type":"(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)[]"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"desc":"Matches start .. start + count - 1, capped at MATCHES_PAGE_SIZE ids and\nat match_count. Match ids whose m_ box was swept are skipped, so a short page does not mean the end: continue from start + min(count, MATCHES_PAGE_SIZE) while that is below match_count.","events":[],"recommendations":{}},{"name":"get_player_match","args":[{"type":"address","name":"addr"}],"returns":{"type":"uint32"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_roster_flags","args":[{"type":"uint32","name":"user_id"}],"returns":{"type":"uint8"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"desc":"ROSTER_ENROLLED | ROSTER_ASSIGNED bits for a roster user_id.","events":[],"recommendations":{}},{"name":"get_roster_count","args":[],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_stats","args":[],"returns":{"type":"(uint64,uint64,uint64,uint128,uint64,uint128,uint64,uint128,uint64,uint128)","struct":"VariationStats"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_claimable","args":[{"type":"address","name":"addr"}],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_participant_count","args":[],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_escrow_balance","args":[],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}}],"arcs":[22,28],"networks":{},"state":{"schema":{"global":{"ints":23,"bytes":2},"local":{"ints":0,"bytes":0}},"keys":{"global":{"experiments_app":{"keyType":"AVMString","valueType":"AVMUint64","key":"ZXhwZXJpbWVudHNfYXBw"},"exp_id":{"keyType":"AVMString","valueType":"AVMUint64","key":"ZXhwX2lk"},"var_id":{"keyType":"AVMString","valueType":"AVMUint64","key":"dmFyX2lk"},"owner":{"keyType":"AVMString","valueType":"address","key":"b3duZXI="},"status":{"keyType":"AVMString","valueType":"AVMUint64","key":"c3RhdHVz"},"match_count":{"keyType":"AVMString","valueType":"AVMUint64","key":"bWF0Y2hfY291bnQ="},"paid_out_count":{"keyType":"AVMString","valueType":"AVMUint64","key":"cGFpZF9vdXRfY291bnQ="},"e1":{"keyType":"AVMString","valueType":"AVMUint64","key":"ZTE="},"e2":{"keyType":"AVMString","valueType":"AVMUint64","key":"ZTI="},"multiplier":{"keyType":"AVMString","valueType":"AVMUint64","key":"bXVsdGlwbGllcg=="},"unit":{"keyType":"AVMString","valueType":"AVMUint64","key":"dW5pdA=="},"asset_id":{"keyType":"AVMString","valueType":"AVMUint64","key":"YXNzZXRfaWQ="},"escrow_deposited":{"keyType":"AVMString","valueType":"AVMUint64","key":"ZXNjcm93X2RlcG9zaXRlZA=="},"escrow_paid_out":{"keyType":"AVMString","valueType":"AVMUint64","key":"ZXNjcm93X3BhaWRfb3V0"},"registry_app":{"keyType":"AVMString","valueType":"AVMUint64","key":"cmVnaXN0cnlfYXBw"},"participant_count":{"keyType":"AVMString","valueType":"AVMUint64","key":"cGFydGljaXBhbnRfY291bnQ="},"max_participants":{"keyType":"AVMString","valueType":"AVMUint64","key":"bWF4X3BhcnRpY2lwYW50cw=="},"match_cursor":{"keyType":"AVMString","valueType":"AVMUint64","key":"bWF0Y2hfY3Vyc29y"},"settlement_mode":{"keyType":"AVMString","valueType":"AVMUint64","key":"c2V0dGxlbWVudF9tb2Rl"},"escrow_pending":{"keyType":"AVMString","valueType":"AVMUint64","key":"ZXNjcm93X3BlbmRpbmc="},"stats":{"keyType":"AVMString","valueType":"VariationStats","key":"c3RhdHM="},"roster_count":{"keyType":"AVMString","valueType":"AVMUint64","key":"cm9zdGVyX2NvdW50"},"treasury_funded":{"keyType":"AVMString","valueType":"AVMUint64","key":"dHJlYXN1cnlfZnVuZGVk"},"auto_match_enabled":{"keyType":"AVMString","valueType":"AVMUint64","key":"YXV0b19tYXRjaF9lbmFibGVk"},"claim_mbr_refund":{"keyType":"AVMString","valueType":"AVMUint64","key":"Y2xhaW1fbWJyX3JlZnVuZA=="}},"local":{},"box":{"roster":{"keyType":"AVMBytes","valueType":"AVMBytes","key":"cm9zdGVy"}}},"maps":{"global":{},"local":{},"box":{"participants":{"keyType":"address","valueType":"ParticipantInfo","prefix":"cF8="},"matches":{"keyType":"uint32","valueType":"Match","prefix":"bV8="},"enrollment_order":{"keyType":"uint32","valueType":"address","prefix":"b18="},"claimable":{"keyType":"address","valueType":"uint64","prefix":"Y18="}}}},"bareActions":{"create":[],"call":[]},"sourceInfo":{"approval":{"sourceInfo":[{"pc":[1521,5317,5353,5366],"errorMessage":"Address length is 32 bytes"},{"pc":[1236,1742],"errorMessage":"Already ended"},{"pc":[1894,2569,4811],"errorMessage":"Already enrolled"},{"pc":[1959,2083,2321],"errorMessage":"Already on roster"},{"pc":[3988],"errorMessage":"Already paid out"},{"pc":[1137,1185],"errorMessage":"Amount must be > 0"},{"pc":[2877],"errorMessage":"Auto-match not enabled"},{"pc":[1518,1566,1630],"errorMessage":"Bad key"},{"pc":[2212],"errorMessage":"Bad proof index"},{"pc":[2206],"errorMessage":"Bad proof length"},{"pc":[4865],"errorMessage":"Full"},{"pc":[1848,2539,2675,2756,2910,3144,4832],"errorMessage":"Insufficient MBR"},{"pc":[3834],"errorMessage":"Insufficient escrow"},{"pc":[2314],"errorMessage":"Invalid membership proof"},{"pc":[3328],"errorMessage":"Investment exceeds endowment"},{"pc":[3165,5173],"errorMessage":"Investor already assigned"},{"pc":[3190],"errorMessage":"Investor enrolled outside the roster"},{"pc":[3209],"errorMessage":"Investor id mismatch"},{"pc":[5166],"errorMessage":"Investor not active"},{"pc":[3161,5144],"errorMessage":"Investor not enrolled"},{"pc":[3980],"errorMessage":"Match not completed"},{"pc":[3296,3448,3969,4442],"errorMessage":"Match not found"},{"pc":[1749],"errorMessage":"Matches already created"},{"pc":[4154],"errorMessage":"Matches not all paid out"},{"pc":[4613,4623],"errorMessage":"No active match"},{"pc":[2739],"errorMessage":"No pairs"},{"pc":[4159],"errorMessage":"No remaining escrow"},{"pc":[2444],"errorMessage":"No user ids"},{"pc":[2027],"errorMessage":"Not a get_user call"},{"pc":[3339,3506],"errorMessage":"Not a multiple of unit"},{"pc":[2004],"errorMessage":"Not a registry call"},{"pc":[1774,1831,2441,3263,4801],"errorMessage":"Not active"},{"pc":[1439],"errorMessage":"Not completed"},{"pc":[1181,1215],"errorMessage":"Not experiments app"},{"pc":[1126,1229,1432,1735,1768,1825,2435,2661,2736,2869,3130,3257,3932,4142],"errorMessage":"Not owner"},{"pc":[3308],"errorMessage":"Not the investor"},{"pc":[3465],"errorMessage":"Not the trustee"},{"pc":[4054],"errorMessage":"Nothing to claim"},{"pc":[464],"errorMessage":"OnCompletion must be NoOp"},{"pc":[1781],"errorMessage":"Participants already enrolled"},{"pc":[2036],"errorMessage":"Registry call for another address"},{"pc":[2012],"errorMessage":"Registry call from another sender"},{"pc":[2018],"errorMessage":"Registry call not NoOp"},{"pc":[2156],"errorMessage":"Registry has no member roots"},{"pc":[3495],"errorMessage":"Return exceeds maximum"},{"pc":[3150],"errorMessage":"Same player"},{"pc":[3935],"errorMessage":"Too many matches"},{"pc":[3180,5191],"errorMessage":"Trustee already assigned"},{"pc":[3200],"errorMessage":"Trustee enrolled outside the roster"},{"pc":[3218],"errorMessage":"Trustee id mismatch"},{"pc":[5184],"errorMessage":"Trustee not active"},{"pc":[3176,5154],"errorMessage":"Trustee not enrolled"},{"pc":[847],"errorMessage":"Unit must be > 0"},{"pc":[1449],"errorMessage":"Unknown box kind"},{"pc":[1754],"errorMessage":"Unknown settlement mode"},{"pc":[3435],"errorMessage":"Variation ended"},{"pc":[1838,2454,2668,2746,2897,3137],"errorMessage":"Wrong MBR receiver"},{"pc":[3316,3473],"errorMessage":"Wrong phase"},{"pc":[1133,4823],"errorMessage":"Wrong receiver"},{"pc":[1179,1213],"errorMessage":"application exists"},{"pc":[2075,4931],"errorMessage":"application log value is not the result of an ABI return"},{"pc":[5430,5456,5521],"errorMessage":"check self.asset_id exists"},{"pc":[2874,4779,4993],"errorMessage":"check self.auto_match_enabled exists"},{"pc":[1293,1309,1667,4075],"errorMessage":"check self.claim_mbr_refund exists"},{"pc":[4061,4706,5332],"errorMessage":"check self.claimable entry exists"},{"pc":[3324,3511,5497],"errorMessage":"check self.e1 exists"},{"pc":[3527,5503],"errorMessage":"check self.e2 exists"},{"pc":[2973],"errorMessage":"check self.enrollment_order entry exists"},{"pc":[1141,1189,1259,3629,4172,5479],"errorMessage":"check self.escrow_deposited exists"},{"pc":[4096,5378,5484],"errorMessage":"check self.escrow_paid_out exists"},{"pc":[1326,3839,4023,4108,5490],"errorMessage":"check self.escrow_pending exists"},{"pc":[3570],"errorMessage":"check self.exp_id exists"},{"pc":[1176,1210,3565],"errorMessage":"check self.experiments_app exists"},{"pc":[1279,1747,2761,2915,4152,4501,4515,5223],"errorMessage":"check self.match_count exists"},{"pc":[2930],"errorMessage":"check self.match_cursor exists"},{"pc":[1589,4405,4561],"errorMessage":"check self.matches entry exists"},{"pc":[4841,4863,5541],"errorMessage":"check self.max_participants exists"},{"pc":[3481,5509],"errorMessage":"check self.multiplier exists"},{"pc":[1124,1227,1247,1430,1733,1766,1823,2433,2659,2734,2867,3128,3255,3930,4140,4163,4182,4760],"errorMessage":"check self.owner exists"},{"pc":[3877,4147,5393],"errorMessage":"check self.paid_out_count exists"},{"pc":[1779,1853,2944,4730,4849,4979,5011],"errorMessage":"check self.participant_count exists"},{"pc":[2979,4367],"errorMessage":"check self.participants entry exists"},{"pc":[2002,2147,4875],"errorMessage":"check self.registry_app exists"},{"pc":[2598,2608,5046],"errorMessage":"check self.roster exists"},{"pc":[2585,4666,4854],"errorMessage":"check self.roster_count exists"},{"pc":[1269,3648,3849,5118],"errorMessage":"check self.settlement_mode exists"},{"pc":[1284,3369,3743,4678],"errorMessage":"check self.stats exists"},{"pc":[1233,1436,1739,1772,1829,2439,3261,3432,4799,5526],"errorMessage":"check self.status exists"},{"pc":[3540],"errorMessage":"check self.treasury_funded exists"},{"pc":[3333,3500,5515],"errorMessage":"check self.unit exists"},{"pc":[3584],"errorMessage":"check self.var_id exists"},{"pc":[1485,1884,2794,3959],"errorMessage":"index access is out of bounds"},{"pc":[1390],"errorMessage":"invalid array encoding"},{"pc":[1360,1404,1794,2063,2109,2400,2704,3910,4919],"errorMessage":"invalid array length header"},{"pc":[1424],"errorMessage":"invalid number of bytes for arc4.dynamic_array<arc4.dynamic_array<arc4.uint8>>"},{"pc":[1807],"errorMessage":"invalid number of bytes for arc4.dynamic_array<arc4.static_array<arc4.uint8, 32>>"},{"pc":[2718],"errorMessage":"invalid number of bytes for arc4.dynamic_array<arc4.tuple<arc4.static_array<arc4.uint8, 32>,arc4.static_array<arc4.uint8, 32>>>"},{"pc":[2414,3924],"errorMessage":"invalid number of bytes for arc4.dynamic_array<arc4.uint32>"},{"pc":[2116],"errorMessage":"invalid number of bytes for arc4.dynamic_array<arc4.uint8>"},{"pc":[779,2635,2643,3095,3112,4214,4604,4692],"errorMessage":"invalid number of bytes for arc4.static_array<arc4.uint8, 32>"},{"pc":[762,771,2103,3087,3104,3277,3416,4433,4463,4472,4641],"errorMessage":"invalid number of bytes for arc4.uint32"},{"pc":[753,788,797,806,815,824,833,842,1169,2851,3286,3428],"errorMessage":"invalid number of bytes for arc4.uint64"},{"pc":[1354,1727],"errorMessage":"invalid number of bytes for arc4.uint8"},{"pc":[2068,4924],"errorMessage":"invalid number of bytes for smart_contracts.shared.types.User"},{"pc":[2055,4911],"errorMessage":"invalid tail pointer at index 2 of (uint32,uint8,(len+utf8[]),uint64)"},{"pc":[1398],"errorMessage":"invalid tail pointer for (len+(len+uint8[])[])"},{"pc":[2050,4906],"errorMessage":"invalid tuple encoding"},{"pc":[4567],"errorMessage":"max array length exceeded"},{"pc":[2884],"errorMessage":"n must be > 0"},{"pc":[2889],"errorMessage":"n must be even"},{"pc":[739,1859,1913,2767,2821,2921,2958,3059,3576,3590,4541,4652,4985,5230,5533],"errorMessage":"overflow"},{"pc":[1975],"errorMessage":"transaction type is appl"},{"pc":[1118,1817,1941,1985,2129,2427,2653,2728,2861,3122],"errorMessage":"transaction type is pay"}],"pcOffsetMethod":"none"},"clear":{"sourceInfo":[],"pcOffsetMethod":"none"}},"source":{"approval":"I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgMzIgMiAxODUwMCA1MjEwMAogICAgYnl0ZWNibG9jayAib3duZXIiIDB4MTUxZjdjNzUgInN0YXR1cyIgImVzY3Jvd19kZXBvc2l0ZWQiICJtYXRjaF9jb3VudCIgMHg3MDVmIDB4MDEgInBhcnRpY2lwYW50X2NvdW50IiAiZXNjcm93X3BlbmRpbmciIDB4NzI2ZjczNzQ2NTcyICJjbGFpbV9tYnJfcmVmdW5kIiAweDZkNWYgMHgwMCAicGFpZF9vdXRfY291bnQiICJlc2Nyb3dfcGFpZF9vdXQiICJzZXR0bGVtZW50X21vZGUiICJzdGF0cyIgInJvc3Rlcl9jb3VudCIgImF1dG9fbWF0Y2hfZW5hYmxlZCIgImV4cGVyaW1lbnRzX2FwcCIgImUxIiAidW5pdCIgImFzc2V0X2lkIiAicmVnaXN0cnlfYXBwIiAibWF4X3BhcnRpY2lwYW50cyIgMHg2MzVmICJlMiIgIm11bHRpcGxpZXIiICJtYXRjaF9jdXJzb3IiICJ0cmVhc3VyeV9mdW5kZWQiICJleHBfaWQiICJ2YXJfaWQiIDB4MzEwNDRhYzIgMHgwMiAweDZmNWYgMHg2ZmFkNGE2NSAweDA2ODEwMSAweDE5ZGRlYTMwIDB4ZDNkNDA1NmMKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTAyCiAgICAvLyBzZWxmLmV4cGVyaW1lbnRzX2FwcCA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgwKSkKICAgIGJ5dGVjIDE5IC8vICJleHBlcmltZW50c19hcHAiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTAzCiAgICAvLyBzZWxmLmV4cF9pZCA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgwKSkKICAgIGJ5dGVjIDMwIC8vICJleHBfaWQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTA0CiAgICAvLyBzZWxmLnZhcl9pZCA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgwKSkKICAgIGJ5dGVjIDMxIC8vICJ2YXJfaWQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTA2CiAgICAvLyBzZWxmLnN0YXR1cyA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgwKSkKICAgIGJ5dGVjXzIgLy8gInN0YXR1cyIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxMDcKICAgIC8vIHNlbGYubWF0Y2hfY291bnQgPSBHbG9iYWxTdGF0ZShVSW50NjQoMCkpCiAgICBieXRlYyA0IC8vICJtYXRjaF9jb3VudCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxMDgKICAgIC8vIHNlbGYucGFpZF9vdXRfY291bnQgPSBHbG9iYWxTdGF0ZShVSW50NjQoMCkpCiAgICBieXRlYyAxMyAvLyAicGFpZF9vdXRfY291bnQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTA5CiAgICAvLyBzZWxmLmUxID0gR2xvYmFsU3RhdGUoVUludDY0KDApKQogICAgYnl0ZWMgMjAgLy8gImUxIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjExMAogICAgLy8gc2VsZi5lMiA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgwKSkKICAgIGJ5dGVjIDI2IC8vICJlMiIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxMTEKICAgIC8vIHNlbGYubXVsdGlwbGllciA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgwKSkKICAgIGJ5dGVjIDI3IC8vICJtdWx0aXBsaWVyIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjExMgogICAgLy8gc2VsZi51bml0ID0gR2xvYmFsU3RhdGUoVUludDY0KDApKQogICAgYnl0ZWMgMjEgLy8gInVuaXQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTEzCiAgICAvLyBzZWxmLmFzc2V0X2lkID0gR2xvYmFsU3RhdGUoVUludDY0KDApKQogICAgYnl0ZWMgMjIgLy8gImFzc2V0X2lkIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjExNAogICAgLy8gc2VsZi5lc2Nyb3dfZGVwb3NpdGVkID0gR2xvYmFsU3RhdGUoVUludDY0KDApKQogICAgYnl0ZWNfMyAvLyAiZXNjcm93X2RlcG9zaXRlZCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxMTUKICAgIC8vIHNlbGYuZXNjcm93X3BhaWRfb3V0ID0gR2xvYmFsU3RhdGUoVUludDY0KDApKQogICAgYnl0ZWMgMTQgLy8gImVzY3Jvd19wYWlkX291dCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxMTYKICAgIC8vIHNlbGYucmVnaXN0cnlfYXBwID0gR2xvYmFsU3RhdGUoVUludDY0KDApKQogICAgYnl0ZWMgMjMgLy8gInJlZ2lzdHJ5X2FwcCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxMTcKICAgIC8vIHNlbGYucGFydGljaXBhbnRfY291bnQgPSBHbG9iYWxTdGF0ZShVSW50NjQoMCkpCiAgICBieXRlYyA3IC8vICJwYXJ0aWNpcGFudF9jb3VudCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxMTgKICAgIC8vIHNlbGYubWF4X3BhcnRpY2lwYW50cyA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgwKSkKICAgIGJ5dGVjIDI0IC8vICJtYXhfcGFydGljaXBhbnRzIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjExOQogICAgLy8gc2VsZi5tYXRjaF9jdXJzb3IgPSBHbG9iYWxTdGF0ZShVSW50NjQoMCkpCiAgICBieXRlYyAyOCAvLyAibWF0Y2hfY3Vyc29yIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjEyMAogICAgLy8gc2VsZi5zZXR0bGVtZW50X21vZGUgPSBHbG9iYWxTdGF0ZShVSW50NjQoMCkpCiAgICBieXRlYyAxNSAvLyAic2V0dGxlbWVudF9tb2RlIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjEyMS0xMjIKICAgIC8vICMgUGF5b3V0cyByZWNvcmRlZCBieSB0cnVzdGVlIGRlY2lzaW9ucyBidXQgbm90IHlldCBzZW50IChkZWZlcnJlZCBzZXR0bGVtZW50KQogICAgLy8gc2VsZi5lc2Nyb3dfcGVuZGluZyA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgwKSkKICAgIGJ5dGVjIDggLy8gImVzY3Jvd19wZW5kaW5nIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjEyNS0xMjYKICAgIC8vICMgVXNlcnMgZW5yb2xsZWQgdGhyb3VnaCB0aGUgcm9zdGVyIGJpdG1hcCAobm90IGNvdW50ZWQgaW4gcGFydGljaXBhbnRfY291bnQpCiAgICAvLyBzZWxmLnJvc3Rlcl9jb3VudCA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgwKSkKICAgIGJ5dGVjIDE3IC8vICJyb3N0ZXJfY291bnQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTI3LTEyOAogICAgLy8gIyAxIHdoZW4gcGF5b3V0cyBhcmUgZHJhd24gb24gZGVtYW5kIGZyb20gdGhlIGV4cGVyaW1lbnQgdHJlYXN1cnkKICAgIC8vIHNlbGYudHJlYXN1cnlfZnVuZGVkID0gR2xvYmFsU3RhdGUoVUludDY0KDApKQogICAgYnl0ZWMgMjkgLy8gInRyZWFzdXJ5X2Z1bmRlZCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxMjktMTMwCiAgICAvLyAjIDEgd2hlbiBlbnJvbGxtZW50cyByZWNvcmQgdGhlaXIgcG9zaXRpb24gZm9yIGF1dG9fbWF0Y2gKICAgIC8vIHNlbGYuYXV0b19tYXRjaF9lbmFibGVkID0gR2xvYmFsU3RhdGUoVUludDY0KDApKQogICAgYnl0ZWMgMTggLy8gImF1dG9fbWF0Y2hfZW5hYmxlZCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxMzEtMTMzCiAgICAvLyAjIFByZXBhaWQgY2xhaW0gYm94IE1CUiBubyBsb25nZXIgbmVlZGVkIChib3ggY2xhaW1lZCwgb3IgbWF0Y2ggbmV2ZXIKICAgIC8vICMgY29tcGxldGVkKSwgb3dlZCBiYWNrIHRvIHRoZSBvd25lciBieSBlbmRfdmFyaWF0aW9uIC8gc3dlZXBfYm94ZXMKICAgIC8vIHNlbGYuY2xhaW1fbWJyX3JlZnVuZCA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgwKSkKICAgIGJ5dGVjIDEwIC8vICJjbGFpbV9tYnJfcmVmdW5kIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CgptYWluX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTAwCiAgICAvLyBjbGFzcyBUcnVzdFZhcmlhdGlvbihBUkM0Q29udHJhY3QpOgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBtdXN0IGJlIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBieiBtYWluX2NyZWF0ZV9Ob09wQDM5CiAgICBwdXNoYnl0ZXNzIDB4OGRlYjQ1OWIgMHg1YzlhODM2YiAweDA5YzFjM2U3IDB4MzhlMmU3NzMgMHhmYjQ4ZWQ4MiAweDU0ZWVmMzg2IDB4MzdkYTJkYzcgMHg1MWRiMTA5MCAweDFmZDA0MDYzIDB4ZjExYjM5ZjEgMHhlNzJmOTQxNSAweGMzY2IzNGJhIDB4NmMxZmI4YmYgMHhkZTkxMDQ2NSAweDk2OTYwMzc4IDB4MTdhNzk1NjUgMHhmMTBiYTZkOCAweDFlMzA3NzkwIDB4NDgzYWI1MzUgMHg5NTU1YzljOCAweGNjODJhYjk5IDB4NmIyNGZkOTYgMHhjODFlZDU2MiAweDY4NWI5NTkzIDB4NWI5ZTA1NTggMHg1ZGYzMTk4MiAweGU1ZWEyOWE1IDB4YjBmNDVlYWMgMHgxMTAxNTZkNCAweDdhNzQ5MGFjIDB4N2YwNmMyMDkgMHg5YmI5MjBlYyAweDIxYTFkNTQwIC8vIG1ldGhvZCAiZGVwb3NpdF9lc2Nyb3cocGF5KXZvaWQiLCBtZXRob2QgInJlY29yZF9lc2Nyb3codWludDY0KXZvaWQiLCBtZXRob2QgImVuYWJsZV90cmVhc3VyeV9mdW5kaW5nKCl2b2lkIiwgbWV0aG9kICJlbmRfdmFyaWF0aW9uKCl2b2lkIiwgbWV0aG9kICJzd2VlcF9ib3hlcyh1aW50OCxieXRlW11bXSl1aW50NjQiLCBtZXRob2QgInNldF9zZXR0bGVtZW50X21vZGUodWludDgpdm9pZCIsIG1ldGhvZCAiZW5hYmxlX2F1dG9fbWF0Y2goKXZvaWQiLCBtZXRob2QgImFkZF9wYXJ0aWNpcGFudHMoYWRkcmVzc1tdLHBheSl2b2lkIiwgbWV0aG9kICJzZWxmX2Vucm9sbChwYXkpdm9pZCIsIG1ldGhvZCAic2VsZl9lbnJvbGxfZ3JvdXBlZChhcHBsLHBheSl2b2lkIiwgbWV0aG9kICJzZWxmX2Vucm9sbF93aXRoX3Byb29mKHVpbnQzMixieXRlW10scGF5KXZvaWQiLCBtZXRob2QgImVucm9sbF91c2VyX2lkcyh1aW50MzJbXSxwYXkpdm9pZCIsIG1ldGhvZCAiY3JlYXRlX21hdGNoKGFkZHJlc3MsYWRkcmVzcyxwYXkpdWludDMyIiwgbWV0aG9kICJjcmVhdGVfbWF0Y2hlcygoYWRkcmVzcyxhZGRyZXNzKVtdLHBheSl1aW50MzIiLCBtZXRob2QgImF1dG9fbWF0Y2godWludDY0LHBheSl1aW50NjQiLCBtZXRob2QgImNyZWF0ZV9tYXRjaF9ieV9pZHModWludDMyLGFkZHJlc3MsdWludDMyLGFkZHJlc3MscGF5KXVpbnQzMiIsIG1ldGhvZCAiY2xvc2VfcmVnaXN0cmF0aW9uKCl2b2lkIiwgbWV0aG9kICJzdWJtaXRfaW52ZXN0b3JfZGVjaXNpb24odWludDMyLHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJzdWJtaXRfdHJ1c3RlZV9kZWNpc2lvbih1aW50MzIsdWludDY0KXZvaWQiLCBtZXRob2QgInNldHRsZSh1aW50MzJbXSl2b2lkIiwgbWV0aG9kICJjbGFpbSgpdWludDY0IiwgbWV0aG9kICJ3aXRoZHJhd19lc2Nyb3coKXZvaWQiLCBtZXRob2QgImdldF9jb25maWcoKSh1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ4LHVpbnQ2NCkiLCBtZXRob2QgImdldF9wbGF5ZXJfc3RhdGUoYWRkcmVzcykoKHVpbnQ4LHVpbnQ4LHVpbnQzMiksdWludDgsKHVpbnQzMixhZGRyZXNzLGFkZHJlc3MsdWludDgsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDgpLCh1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ4LHVpbnQ2NCkpIiwgbWV0aG9kICJnZXRfbWF0Y2godWludDMyKSh1aW50MzIsYWRkcmVzcyxhZGRyZXNzLHVpbnQ4LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ4KSIsIG1ldGhvZCAiZ2V0X21hdGNoZXModWludDMyLHVpbnQzMikodWludDMyLGFkZHJlc3MsYWRkcmVzcyx1aW50OCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50OClbXSIsIG1ldGhvZCAiZ2V0X3BsYXllcl9tYXRjaChhZGRyZXNzKXVpbnQzMiIsIG1ldGhvZCAiZ2V0X3Jvc3Rlcl9mbGFncyh1aW50MzIpdWludDgiLCBtZXRob2QgImdldF9yb3N0ZXJfY291bnQoKXVpbnQ2NCIsIG1ldGhvZCAiZ2V0X3N0YXRzKCkodWludDY0LHVpbnQ2NCx1aW50NjQsdWludDEyOCx1aW50NjQsdWludDEyOCx1aW50NjQsdWludDEyOCx1aW50NjQsdWludDEyOCkiLCBtZXRob2QgImdldF9jbGFpbWFibGUoYWRkcmVzcyl1aW50NjQiLCBtZXRob2QgImdldF9wYXJ0aWNpcGFudF9jb3VudCgpdWludDY0IiwgbWV0aG9kICJnZXRfZXNjcm93X2JhbGFuY2UoKXVpbnQ2NCIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIGRlcG9zaXRfZXNjcm93IHJlY29yZF9lc2Nyb3cgZW5hYmxlX3RyZWFzdXJ5X2Z1bmRpbmcgZW5kX3ZhcmlhdGlvbiBzd2VlcF9ib3hlcyBzZXRfc2V0dGxlbWVudF9tb2RlIGVuYWJsZV9hdXRvX21hdGNoIGFkZF9wYXJ0aWNpcGFudHMgc2VsZl9lbnJvbGwgc2VsZl9lbnJvbGxfZ3JvdXBlZCBzZWxmX2Vucm9sbF93aXRoX3Byb29mIGVucm9sbF91c2VyX2lkcyBjcmVhdGVfbWF0Y2ggY3JlYXRlX21hdGNoZXMgYXV0b19tYXRjaCBjcmVhdGVfbWF0Y2hfYnlfaWRzIGNsb3NlX3JlZ2lzdHJhdGlvbiBzdWJtaXRfaW52ZXN0b3JfZGVjaXNpb24gc3VibWl0X3RydXN0ZWVfZGVjaXNpb24gc2V0dGxlIGNsYWltIHdpdGhkcmF3X2VzY3JvdyBnZXRfY29uZmlnIGdldF9wbGF5ZXJfc3RhdGUgZ2V0X21hdGNoIGdldF9tYXRjaGVzIGdldF9wbGF5ZXJfbWF0Y2ggZ2V0X3Jvc3Rlcl9mbGFncyBnZXRfcm9zdGVyX2NvdW50IGdldF9zdGF0cyBnZXRfY2xhaW1hYmxlIGdldF9wYXJ0aWNpcGFudF9jb3VudCBnZXRfZXNjcm93X2JhbGFuY2UKICAgIGVycgoKbWFpbl9jcmVhdGVfTm9PcEAzOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTAwCiAgICAvLyBjbGFzcyBUcnVzdFZhcmlhdGlvbihBUkM0Q29udHJhY3QpOgogICAgcHVzaGJ5dGVzIDB4YjhkYjg2MDUgLy8gbWV0aG9kICJjcmVhdGUodWludDY0LHVpbnQzMix1aW50MzIsYWRkcmVzcyx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQpdm9pZCIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIGNyZWF0ZQogICAgZXJyCgoKLy8gc21hcnRfY29udHJhY3RzLnRydXN0X3ZhcmlhdGlvbi5jb250cmFjdC5fYWRkX3NxdWFyZShhY2M6IGJ5dGVzLCB4OiB1aW50NjQpIC0+IGJ5dGVzOgpfYWRkX3NxdWFyZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6OTUtOTYKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX2FkZF9zcXVhcmUoYWNjOiBhcmM0LlVJbnQxMjgsIHg6IFVJbnQ2NCkgLT4gYXJjNC5VSW50MTI4OgogICAgcHJvdG8gMiAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5Ojk3CiAgICAvLyByZXR1cm4gYXJjNC5VSW50MTI4KGFjYy5hc19iaWd1aW50KCkgKyBCaWdVSW50KHgpICogQmlnVUludCh4KSkKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgZHVwCiAgICBiKgogICAgZnJhbWVfZGlnIC0yCiAgICBiKwogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgMTYgLy8gMTYKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIHB1c2hpbnQgMTYgLy8gMTYKICAgIGJ6ZXJvCiAgICBifAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnRydXN0X3ZhcmlhdGlvbi5jb250cmFjdC5UcnVzdFZhcmlhdGlvbi5jcmVhdGVbcm91dGluZ10oKSAtPiB2b2lkOgpjcmVhdGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjE0OAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGNyZWF0ZT0icmVxdWlyZSIpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCA4IC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCA0IC8vIDQKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDMyCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCA0IC8vIDQKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDMyCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA0CiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDUKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDggLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDYKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDggLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDcKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDggLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDgKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDggLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDkKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDggLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEwCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCA4IC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxMQogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgOCAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxNjMKICAgIC8vIGFzc2VydCB1bml0LmFzX3VpbnQ2NCgpID4gVUludDY0KDApLCAiVW5pdCBtdXN0IGJlID4gMCIKICAgIHVuY292ZXIgMwogICAgYnRvaQogICAgZHVwCiAgICBhc3NlcnQgLy8gVW5pdCBtdXN0IGJlID4gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxNjQKICAgIC8vIHNlbGYuZXhwZXJpbWVudHNfYXBwLnZhbHVlID0gZXhwZXJpbWVudHNfYXBwLmFzX3VpbnQ2NCgpCiAgICB1bmNvdmVyIDEwCiAgICBidG9pCiAgICBieXRlYyAxOSAvLyAiZXhwZXJpbWVudHNfYXBwIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTY1CiAgICAvLyBzZWxmLmV4cF9pZC52YWx1ZSA9IGV4cF9pZC5hc191aW50NjQoKQogICAgdW5jb3ZlciA5CiAgICBidG9pCiAgICBieXRlYyAzMCAvLyAiZXhwX2lkIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTY2CiAgICAvLyBzZWxmLnZhcl9pZC52YWx1ZSA9IHZhcl9pZC5hc191aW50NjQoKQogICAgdW5jb3ZlciA4CiAgICBidG9pCiAgICBieXRlYyAzMSAvLyAidmFyX2lkIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTY3CiAgICAvLyBzZWxmLm93bmVyLnZhbHVlID0gb3duZXIKICAgIGJ5dGVjXzAgLy8gIm93bmVyIgogICAgdW5jb3ZlciA4CiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxNjgKICAgIC8vIHNlbGYuc3RhdHVzLnZhbHVlID0gVUludDY0KFNUQVRVU19BQ1RJVkUpCiAgICBieXRlY18yIC8vICJzdGF0dXMiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTY5CiAgICAvLyBzZWxmLm1hdGNoX2NvdW50LnZhbHVlID0gVUludDY0KDApCiAgICBieXRlYyA0IC8vICJtYXRjaF9jb3VudCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxNzAKICAgIC8vIHNlbGYucGFpZF9vdXRfY291bnQudmFsdWUgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDEzIC8vICJwYWlkX291dF9jb3VudCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxNzEKICAgIC8vIHNlbGYuZTEudmFsdWUgPSBlMS5hc191aW50NjQoKQogICAgdW5jb3ZlciA2CiAgICBidG9pCiAgICBieXRlYyAyMCAvLyAiZTEiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxNzIKICAgIC8vIHNlbGYuZTIudmFsdWUgPSBlMi5hc191aW50NjQoKQogICAgdW5jb3ZlciA1CiAgICBidG9pCiAgICBieXRlYyAyNiAvLyAiZTIiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxNzMKICAgIC8vIHNlbGYubXVsdGlwbGllci52YWx1ZSA9IG11bHRpcGxpZXIuYXNfdWludDY0KCkKICAgIHVuY292ZXIgNAogICAgYnRvaQogICAgYnl0ZWMgMjcgLy8gIm11bHRpcGxpZXIiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxNzQKICAgIC8vIHNlbGYudW5pdC52YWx1ZSA9IHVuaXQuYXNfdWludDY0KCkKICAgIGJ5dGVjIDIxIC8vICJ1bml0IgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTc1CiAgICAvLyBzZWxmLmFzc2V0X2lkLnZhbHVlID0gYXNzZXRfaWQuYXNfdWludDY0KCkKICAgIHVuY292ZXIgMgogICAgYnRvaQogICAgZHVwCiAgICBjb3ZlciAzCiAgICBieXRlYyAyMiAvLyAiYXNzZXRfaWQiCiAgICBkaWcgMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTc2CiAgICAvLyBzZWxmLmVzY3Jvd19kZXBvc2l0ZWQudmFsdWUgPSBVSW50NjQoMCkKICAgIGJ5dGVjXzMgLy8gImVzY3Jvd19kZXBvc2l0ZWQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTc3CiAgICAvLyBzZWxmLmVzY3Jvd19wYWlkX291dC52YWx1ZSA9IFVJbnQ2NCgwKQogICAgYnl0ZWMgMTQgLy8gImVzY3Jvd19wYWlkX291dCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxNzgKICAgIC8vIHNlbGYucmVnaXN0cnlfYXBwLnZhbHVlID0gcmVnaXN0cnlfYXBwLmFzX3VpbnQ2NCgpCiAgICB1bmNvdmVyIDIKICAgIGJ0b2kKICAgIGJ5dGVjIDIzIC8vICJyZWdpc3RyeV9hcHAiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxNzkKICAgIC8vIHNlbGYucGFydGljaXBhbnRfY291bnQudmFsdWUgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDcgLy8gInBhcnRpY2lwYW50X2NvdW50IgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjE4MAogICAgLy8gc2VsZi5tYXhfcGFydGljaXBhbnRzLnZhbHVlID0gbWF4X3BhcnRpY2lwYW50cy5hc191aW50NjQoKQogICAgc3dhcAogICAgYnRvaQogICAgYnl0ZWMgMjQgLy8gIm1heF9wYXJ0aWNpcGFudHMiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxODEKICAgIC8vIHNlbGYubWF0Y2hfY3Vyc29yLnZhbHVlID0gVUludDY0KDApCiAgICBieXRlYyAyOCAvLyAibWF0Y2hfY3Vyc29yIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjE4MgogICAgLy8gc2VsZi5zZXR0bGVtZW50X21vZGUudmFsdWUgPSBVSW50NjQoU0VUVExFTUVOVF9JTU1FRElBVEUpCiAgICBieXRlYyAxNSAvLyAic2V0dGxlbWVudF9tb2RlIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjE4MwogICAgLy8gc2VsZi5lc2Nyb3dfcGVuZGluZy52YWx1ZSA9IFVJbnQ2NCgwKQogICAgYnl0ZWMgOCAvLyAiZXNjcm93X3BlbmRpbmciCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTg0CiAgICAvLyBzZWxmLnJvc3Rlcl9jb3VudC52YWx1ZSA9IFVJbnQ2NCgwKQogICAgYnl0ZWMgMTcgLy8gInJvc3Rlcl9jb3VudCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxODUKICAgIC8vIHNlbGYudHJlYXN1cnlfZnVuZGVkLnZhbHVlID0gVUludDY0KDApCiAgICBieXRlYyAyOSAvLyAidHJlYXN1cnlfZnVuZGVkIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjE4NgogICAgLy8gc2VsZi5hdXRvX21hdGNoX2VuYWJsZWQudmFsdWUgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDE4IC8vICJhdXRvX21hdGNoX2VuYWJsZWQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTg3CiAgICAvLyBzZWxmLnN0YXRzLnZhbHVlID0gVmFyaWF0aW9uU3RhdHMoCiAgICBieXRlYyAxNiAvLyAic3RhdHMiCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjE4Ny0xOTgKICAgIC8vIHNlbGYuc3RhdHMudmFsdWUgPSBWYXJpYXRpb25TdGF0cygKICAgIC8vICAgICBpbnZlc3RlZF9jb3VudD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBjb21wbGV0ZWRfY291bnQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgc3VtX2ludmVzdG1lbnQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgc3Vtc3FfaW52ZXN0bWVudD1hcmM0LlVJbnQxMjgoMCksCiAgICAvLyAgICAgc3VtX3JldHVybj1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBzdW1zcV9yZXR1cm49YXJjNC5VSW50MTI4KDApLAogICAgLy8gICAgIHN1bV9pbnZlc3Rvcl9wYXlvdXQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgc3Vtc3FfaW52ZXN0b3JfcGF5b3V0PWFyYzQuVUludDEyOCgwKSwKICAgIC8vICAgICBzdW1fdHJ1c3RlZV9wYXlvdXQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgc3Vtc3FfdHJ1c3RlZV9wYXlvdXQ9YXJjNC5VSW50MTI4KDApLAogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4MDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjIwMAogICAgLy8gaWYgYXNzZXRfaWQuYXNfdWludDY0KCkgPiBVSW50NjQoMCk6CiAgICBieiBjcmVhdGVfYWZ0ZXJfaWZfZWxzZUA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjIwMS0yMDYKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PUFzc2V0KGFzc2V0X2lkLmFzX3VpbnQ2NCgpKSwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1VSW50NjQoMCksCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjIwMwogICAgLy8gYXNzZXRfcmVjZWl2ZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjIwNAogICAgLy8gYXNzZXRfYW1vdW50PVVJbnQ2NCgwKSwKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEFzc2V0QW1vdW50CiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIGR1cAogICAgaXR4bl9maWVsZCBYZmVyQXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MjAxCiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICBwdXNoaW50IDQgLy8gYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MjA1CiAgICAvLyBmZWU9MCwKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToyMDEtMjA2CiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1Bc3NldChhc3NldF9pZC5hc191aW50NjQoKSksCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBhc3NldF9hbW91bnQ9VUludDY0KDApLAogICAgLy8gICAgIGZlZT0wLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKCmNyZWF0ZV9hZnRlcl9pZl9lbHNlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjE0OAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGNyZWF0ZT0icmVxdWlyZSIpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnRydXN0X3ZhcmlhdGlvbi5jb250cmFjdC5UcnVzdFZhcmlhdGlvbi5kZXBvc2l0X2VzY3Jvd1tyb3V0aW5nXSgpIC0+IHZvaWQ6CmRlcG9zaXRfZXNjcm93OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToyMDgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjIxMAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5vd25lci52YWx1ZSwgIk5vdCBvd25lciIKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJvd25lciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vd25lciBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gTm90IG93bmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjIxMQogICAgLy8gYXNzZXJ0IHBheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywgIldyb25nIHJlY2VpdmVyIgogICAgZHVwCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gV3JvbmcgcmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MjEyCiAgICAvLyBhc3NlcnQgcGF5bWVudC5hbW91bnQgPiBVSW50NjQoMCksICJBbW91bnQgbXVzdCBiZSA+IDAiCiAgICBndHhucyBBbW91bnQKICAgIGR1cAogICAgYXNzZXJ0IC8vIEFtb3VudCBtdXN0IGJlID4gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToyMTMKICAgIC8vIHNlbGYuZXNjcm93X2RlcG9zaXRlZC52YWx1ZSArPSBwYXltZW50LmFtb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gImVzY3Jvd19kZXBvc2l0ZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZXNjcm93X2RlcG9zaXRlZCBleGlzdHMKICAgIGRpZyAxCiAgICArCiAgICBieXRlY18zIC8vICJlc2Nyb3dfZGVwb3NpdGVkIgogICAgZGlnIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjIxNgogICAgLy8gYW1vdW50PWFyYzQuVUludDY0KHBheW1lbnQuYW1vdW50KSwgZGVwb3NpdGVkPWFyYzQuVUludDY0KHNlbGYuZXNjcm93X2RlcG9zaXRlZC52YWx1ZSkKICAgIHN3YXAKICAgIGl0b2IKICAgIHN3YXAKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MjE1LTIxNwogICAgLy8gRXNjcm93RGVwb3NpdGVkKAogICAgLy8gICAgIGFtb3VudD1hcmM0LlVJbnQ2NChwYXltZW50LmFtb3VudCksIGRlcG9zaXRlZD1hcmM0LlVJbnQ2NChzZWxmLmVzY3Jvd19kZXBvc2l0ZWQudmFsdWUpCiAgICAvLyApCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MjE0LTIxOAogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIEVzY3Jvd0RlcG9zaXRlZCgKICAgIC8vICAgICAgICAgYW1vdW50PWFyYzQuVUludDY0KHBheW1lbnQuYW1vdW50KSwgZGVwb3NpdGVkPWFyYzQuVUludDY0KHNlbGYuZXNjcm93X2RlcG9zaXRlZC52YWx1ZSkKICAgIC8vICAgICApCiAgICAvLyApCiAgICBieXRlYyAzMiAvLyBtZXRob2QgIkVzY3Jvd0RlcG9zaXRlZCh1aW50NjQsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjIwOAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnRydXN0X3ZhcmlhdGlvbi5jb250cmFjdC5UcnVzdFZhcmlhdGlvbi5yZWNvcmRfZXNjcm93W3JvdXRpbmddKCkgLT4gdm9pZDoKcmVjb3JkX2VzY3JvdzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MjIwCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDggLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MjIyCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBBcHBsaWNhdGlvbihzZWxmLmV4cGVyaW1lbnRzX2FwcC52YWx1ZSkuYWRkcmVzcywgIk5vdCBleHBlcmltZW50cyBhcHAiCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTkgLy8gImV4cGVyaW1lbnRzX2FwcCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5leHBlcmltZW50c19hcHAgZXhpc3RzCiAgICBhcHBfcGFyYW1zX2dldCBBcHBBZGRyZXNzCiAgICBhc3NlcnQgLy8gYXBwbGljYXRpb24gZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIE5vdCBleHBlcmltZW50cyBhcHAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MjIzCiAgICAvLyBhc3NlcnQgYW1vdW50LmFzX3VpbnQ2NCgpID4gVUludDY0KDApLCAiQW1vdW50IG11c3QgYmUgPiAwIgogICAgZHVwCiAgICBidG9pCiAgICBkdXAKICAgIGFzc2VydCAvLyBBbW91bnQgbXVzdCBiZSA+IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MjI0CiAgICAvLyBzZWxmLmVzY3Jvd19kZXBvc2l0ZWQudmFsdWUgKz0gYW1vdW50LmFzX3VpbnQ2NCgpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAiZXNjcm93X2RlcG9zaXRlZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5lc2Nyb3dfZGVwb3NpdGVkIGV4aXN0cwogICAgKwogICAgYnl0ZWNfMyAvLyAiZXNjcm93X2RlcG9zaXRlZCIKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToyMjUKICAgIC8vIGFyYzQuZW1pdChFc2Nyb3dEZXBvc2l0ZWQoYW1vdW50PWFtb3VudCwgZGVwb3NpdGVkPWFyYzQuVUludDY0KHNlbGYuZXNjcm93X2RlcG9zaXRlZC52YWx1ZSkpKQogICAgaXRvYgogICAgY29uY2F0CiAgICBieXRlYyAzMiAvLyBtZXRob2QgIkVzY3Jvd0RlcG9zaXRlZCh1aW50NjQsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjIyMAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnRydXN0X3ZhcmlhdGlvbi5jb250cmFjdC5UcnVzdFZhcmlhdGlvbi5lbmFibGVfdHJlYXN1cnlfZnVuZGluZ1tyb3V0aW5nXSgpIC0+IHZvaWQ6CmVuYWJsZV90cmVhc3VyeV9mdW5kaW5nOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToyMzMKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IEFwcGxpY2F0aW9uKHNlbGYuZXhwZXJpbWVudHNfYXBwLnZhbHVlKS5hZGRyZXNzLCAiTm90IGV4cGVyaW1lbnRzIGFwcCIKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxOSAvLyAiZXhwZXJpbWVudHNfYXBwIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmV4cGVyaW1lbnRzX2FwcCBleGlzdHMKICAgIGFwcF9wYXJhbXNfZ2V0IEFwcEFkZHJlc3MKICAgIGFzc2VydCAvLyBhcHBsaWNhdGlvbiBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gTm90IGV4cGVyaW1lbnRzIGFwcAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToyMzQKICAgIC8vIHNlbGYudHJlYXN1cnlfZnVuZGVkLnZhbHVlID0gVUludDY0KDEpCiAgICBieXRlYyAyOSAvLyAidHJlYXN1cnlfZnVuZGVkIgogICAgaW50Y18xIC8vIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjIyNwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnRydXN0X3ZhcmlhdGlvbi5jb250cmFjdC5UcnVzdFZhcmlhdGlvbi5lbmRfdmFyaWF0aW9uW3JvdXRpbmddKCkgLT4gdm9pZDoKZW5kX3ZhcmlhdGlvbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MjY1CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLm93bmVyLnZhbHVlLCAiTm90IG93bmVyIgogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gIm93bmVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm93bmVyIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBOb3Qgb3duZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MjY2CiAgICAvLyBhc3NlcnQgc2VsZi5zdGF0dXMudmFsdWUgIT0gVUludDY0KFNUQVRVU19DT01QTEVURUQpLCAiQWxyZWFkeSBlbmRlZCIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJzdGF0dXMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3RhdHVzIGV4aXN0cwogICAgaW50Y18zIC8vIDIKICAgICE9CiAgICBhc3NlcnQgLy8gQWxyZWFkeSBlbmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToyNjgtMjY5CiAgICAvLyAjIEVzY3JvdyBvd2VkIHRvIHVuc2V0dGxlZCBtYXRjaGVzIHN0YXlzIGJlaGluZCBmb3Igc2V0dGxlKCkKICAgIC8vIHJlbWFpbmluZyA9IHNlbGYuX2F2YWlsYWJsZV9lc2Nyb3coKQogICAgY2FsbHN1YiBfYXZhaWxhYmxlX2VzY3JvdwogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjI3MAogICAgLy8gaWYgcmVtYWluaW5nID4gVUludDY0KDApOgogICAgYnogZW5kX3ZhcmlhdGlvbl9hZnRlcl9pZl9lbHNlQDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MjcxCiAgICAvLyBzZWxmLl9zZW5kX3BheW91dChzZWxmLm93bmVyLnZhbHVlLCByZW1haW5pbmcpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAib3duZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYub3duZXIgZXhpc3RzCiAgICBkaWcgMQogICAgZHVwCiAgICBjb3ZlciAyCiAgICBjYWxsc3ViIF9zZW5kX3BheW91dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToyNzIKICAgIC8vIHNlbGYuZXNjcm93X2RlcG9zaXRlZC52YWx1ZSAtPSByZW1haW5pbmcKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJlc2Nyb3dfZGVwb3NpdGVkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmVzY3Jvd19kZXBvc2l0ZWQgZXhpc3RzCiAgICBzd2FwCiAgICAtCiAgICBieXRlY18zIC8vICJlc2Nyb3dfZGVwb3NpdGVkIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKCmVuZF92YXJpYXRpb25fYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToyNzQtMjc1CiAgICAvLyAjIE5vIG1vcmUgdHJ1c3RlZSBkZWNpc2lvbnMsIHNvIGluY29tcGxldGUgbWF0Y2hlcyBuZXZlciB1c2UgdGhlaXIgY2xhaW0gYm94ZXMKICAgIC8vIGlmIHNlbGYuc2V0dGxlbWVudF9tb2RlLnZhbHVlID09IFVJbnQ2NChTRVRUTEVNRU5UX0NMQUlNKToKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxNSAvLyAic2V0dGxlbWVudF9tb2RlIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnNldHRsZW1lbnRfbW9kZSBleGlzdHMKICAgIGludGNfMyAvLyAyCiAgICA9PQogICAgYnogZW5kX3ZhcmlhdGlvbl9hZnRlcl9pZl9lbHNlQDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6Mjc2CiAgICAvLyBpbmNvbXBsZXRlID0gc2VsZi5tYXRjaF9jb3VudC52YWx1ZSAtIHNlbGYuc3RhdHMudmFsdWUuY29tcGxldGVkX2NvdW50LmFzX3VpbnQ2NCgpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAibWF0Y2hfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWF0Y2hfY291bnQgZXhpc3RzCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTYgLy8gInN0YXRzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnN0YXRzIGV4aXN0cwogICAgcHVzaGludCA4IC8vIDgKICAgIGV4dHJhY3RfdWludDY0CiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjI3NwogICAgLy8gc2VsZi5jbGFpbV9tYnJfcmVmdW5kLnZhbHVlICs9IGluY29tcGxldGUgKiBVSW50NjQoMiAqIENMQUlNX01CUikKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMCAvLyAiY2xhaW1fbWJyX3JlZnVuZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jbGFpbV9tYnJfcmVmdW5kIGV4aXN0cwogICAgc3dhcAogICAgcHVzaGludCAzODYwMCAvLyAzODYwMAogICAgKgogICAgKwogICAgYnl0ZWMgMTAgLy8gImNsYWltX21icl9yZWZ1bmQiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAoKZW5kX3ZhcmlhdGlvbl9hZnRlcl9pZl9lbHNlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjMzNAogICAgLy8gYW1vdW50ID0gc2VsZi5jbGFpbV9tYnJfcmVmdW5kLnZhbHVlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTAgLy8gImNsYWltX21icl9yZWZ1bmQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY2xhaW1fbWJyX3JlZnVuZCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MzM1CiAgICAvLyBzZWxmLmNsYWltX21icl9yZWZ1bmQudmFsdWUgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDEwIC8vICJjbGFpbV9tYnJfcmVmdW5kIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjI3OAogICAgLy8gc2VsZi5fcmVmdW5kX21icihzZWxmLl90YWtlX2NsYWltX21icl9yZWZ1bmQoKSkKICAgIGNhbGxzdWIgX3JlZnVuZF9tYnIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MjgwCiAgICAvLyBzZWxmLnN0YXR1cy52YWx1ZSA9IFVJbnQ2NChTVEFUVVNfQ09NUExFVEVEKQogICAgYnl0ZWNfMiAvLyAic3RhdHVzIgogICAgaW50Y18zIC8vIDIKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjI4MQogICAgLy8gYXJjNC5lbWl0KFZhcmlhdGlvbkVuZGVkKHJlZnVuZGVkPWFyYzQuVUludDY0KHJlbWFpbmluZyksIHJldGFpbmVkPWFyYzQuVUludDY0KHNlbGYuZXNjcm93X3BlbmRpbmcudmFsdWUpKSkKICAgIGR1cAogICAgaXRvYgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDggLy8gImVzY3Jvd19wZW5kaW5nIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmVzY3Jvd19wZW5kaW5nIGV4aXN0cwogICAgaXRvYgogICAgY29uY2F0CiAgICBwdXNoYnl0ZXMgMHgzZDZkNTkwMSAvLyBtZXRob2QgIlZhcmlhdGlvbkVuZGVkKHVpbnQ2NCx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MjYzCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMudHJ1c3RfdmFyaWF0aW9uLmNvbnRyYWN0LlRydXN0VmFyaWF0aW9uLnN3ZWVwX2JveGVzW3JvdXRpbmddKCkgLT4gdm9pZDoKc3dlZXBfYm94ZXM6CiAgICBpbnRjXzAgLy8gMAogICAgZHVwbiA0CiAgICBwdXNoYnl0ZXMgIiIKICAgIGR1cG4gNQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToyODMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ4CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGludGNfMyAvLyAyCiAgICAqCiAgICBzd2FwCiAgICBkdXAKICAgIGxlbgogICAgc3dhcAogICAgZXh0cmFjdCAyIDAKICAgIGludGNfMCAvLyAwCgpzd2VlcF9ib3hlc19mb3JfaGVhZGVyQDE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjI4MwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBkdXAKICAgIGRpZyA1CiAgICA8CiAgICBieiBzd2VlcF9ib3hlc19hZnRlcl9mb3JANAogICAgZHVwbiAyCiAgICBpbnRjXzMgLy8gMgogICAgKgogICAgZGlnIDMKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBlbmNvZGluZwogICAgZHVwCiAgICBkaWcgNwogICAgZHVwCiAgICBjb3ZlciA0CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgdGFpbCBwb2ludGVyIGZvciAobGVuKyhsZW4rdWludDhbXSlbXSkKICAgIGRpZyAxCiAgICBsZW4KICAgIHN1YnN0cmluZzMKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgKwogICAgYnVyeSA1CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnVyeSAxCiAgICBiIHN3ZWVwX2JveGVzX2Zvcl9oZWFkZXJAMQoKc3dlZXBfYm94ZXNfYWZ0ZXJfZm9yQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjI4MwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBkaWcgMwogICAgaW50Y18zIC8vIDIKICAgICsKICAgIGRpZyAzCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+PgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToyOTMKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYub3duZXIudmFsdWUsICJOb3Qgb3duZXIiCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAib3duZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYub3duZXIgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIE5vdCBvd25lcgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToyOTQKICAgIC8vIGFzc2VydCBzZWxmLnN0YXR1cy52YWx1ZSA9PSBVSW50NjQoU1RBVFVTX0NPTVBMRVRFRCksICJOb3QgY29tcGxldGVkIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gInN0YXR1cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdGF0dXMgZXhpc3RzCiAgICBpbnRjXzMgLy8gMgogICAgPT0KICAgIGFzc2VydCAvLyBOb3QgY29tcGxldGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjI5NQogICAgLy8gYXNzZXJ0IGtpbmQuYXNfdWludDY0KCkgPD0gVUludDY0KFNXRUVQX0VOUk9MTE1FTlRfT1JERVIpLCAiVW5rbm93biBib3gga2luZCIKICAgIGRpZyA1CiAgICBidG9pCiAgICBkdXAKICAgIGJ1cnkgOQogICAgZHVwCiAgICBpbnRjXzMgLy8gMgogICAgPD0KICAgIGFzc2VydCAvLyBVbmtub3duIGJveCBraW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjI5NwogICAgLy8gYm94X21iciA9IFVJbnQ2NChQQVJUSUNJUEFOVF9NQlIpCiAgICBpbnRjIDQgLy8gMTg1MDAKICAgIGJ1cnkgMTMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6Mjk4CiAgICAvLyBpZiBraW5kLmFzX3VpbnQ2NCgpID09IFVJbnQ2NChTV0VFUF9NQVRDSEVTKToKICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgZHVwCiAgICBidXJ5IDgKICAgIGJ6IHN3ZWVwX2JveGVzX2Vsc2VfYm9keUA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjI5OQogICAgLy8gYm94X21iciA9IFVJbnQ2NChNQVRDSF9NQlIpCiAgICBpbnRjIDUgLy8gNTIxMDAKICAgIGJ1cnkgMTIKCnN3ZWVwX2JveGVzX2FmdGVyX2lmX2Vsc2VAMTA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjMwMwogICAgLy8gc3dlcHQgPSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBidXJ5IDkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MzA0CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2Uoa2V5cy5sZW5ndGgpOgogICAgaW50Y18wIC8vIDAKICAgIGJ1cnkgMTAKCnN3ZWVwX2JveGVzX2Zvcl9oZWFkZXJAMTE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjMwNAogICAgLy8gZm9yIGkgaW4gdXJhbmdlKGtleXMubGVuZ3RoKToKICAgIGRpZyA5CiAgICBkaWcgNQogICAgPAogICAgZHVwCiAgICBidXJ5IDEyCiAgICBieiBzd2VlcF9ib3hlc19hZnRlcl9mb3JAMjkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MzA1CiAgICAvLyBrZXkgPSBrZXlzW2ldLm5hdGl2ZQogICAgZGlnIDEwCiAgICBhc3NlcnQgLy8gaW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGRpZyA5CiAgICBpbnRjXzMgLy8gMgogICAgKgogICAgZGlnIDIKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBleHRyYWN0X3VpbnQxNgogICAgZHVwMgogICAgZXh0cmFjdF91aW50MTYKICAgIGludGNfMyAvLyAyCiAgICArCiAgICBleHRyYWN0MwogICAgZXh0cmFjdCAyIDAKICAgIGJ1cnkgMTQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MzA2CiAgICAvLyBpZiBraW5kLmFzX3VpbnQ2NCgpID09IFVJbnQ2NChTV0VFUF9QQVJUSUNJUEFOVFMpOgogICAgZGlnIDcKICAgIGJueiBzd2VlcF9ib3hlc19lbHNlX2JvZHlAMTYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MzA3CiAgICAvLyBhc3NlcnQga2V5Lmxlbmd0aCA9PSBVSW50NjQoMzIpLCAiQmFkIGtleSIKICAgIGRpZyAxMwogICAgZHVwCiAgICBsZW4KICAgIGR1cAogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIEJhZCBrZXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MzA4CiAgICAvLyBhZGRyID0gYXJjNC5BZGRyZXNzKGtleSkKICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBBZGRyZXNzIGxlbmd0aCBpcyAzMiBieXRlcwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTozMDkKICAgIC8vIGlmIGFkZHIgaW4gc2VsZi5wYXJ0aWNpcGFudHM6CiAgICBieXRlYyA1IC8vIDB4NzA1ZgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJ1cnkgMTgKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYnogc3dlZXBfYm94ZXNfYWZ0ZXJfaWZfZWxzZUAyNwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTozMTAKICAgIC8vIGRlbCBzZWxmLnBhcnRpY2lwYW50c1thZGRyXQogICAgZGlnIDE2CiAgICBib3hfZGVsCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MzExCiAgICAvLyBzd2VwdCArPSBVSW50NjQoMSkKICAgIGRpZyA4CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnVyeSA5Cgpzd2VlcF9ib3hlc19hZnRlcl9pZl9lbHNlQDI3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTozMDQKICAgIC8vIGZvciBpIGluIHVyYW5nZShrZXlzLmxlbmd0aCk6CiAgICBkaWcgOQogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ1cnkgMTAKICAgIGIgc3dlZXBfYm94ZXNfZm9yX2hlYWRlckAxMQoKc3dlZXBfYm94ZXNfZWxzZV9ib2R5QDE2OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTozMTIKICAgIC8vIGVsaWYga2luZC5hc191aW50NjQoKSA9PSBVSW50NjQoU1dFRVBfTUFUQ0hFUyk6CiAgICBkaWcgNgogICAgYnogc3dlZXBfYm94ZXNfZWxzZV9ib2R5QDIzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjMxMwogICAgLy8gYXNzZXJ0IGtleS5sZW5ndGggPT0gVUludDY0KDQpLCAiQmFkIGtleSIKICAgIGRpZyAxMwogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgNCAvLyA0CiAgICA9PQogICAgYXNzZXJ0IC8vIEJhZCBrZXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MzE1CiAgICAvLyBpZiBtYXRjaF9pZCBpbiBzZWxmLm1hdGNoZXM6CiAgICBieXRlYyAxMSAvLyAweDZkNWYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBidXJ5IDE3CiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGJ6IHN3ZWVwX2JveGVzX2FmdGVyX2lmX2Vsc2VAMjcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MzE2CiAgICAvLyBtYXRjaCA9IHNlbGYubWF0Y2hlc1ttYXRjaF9pZF0uY29weSgpCiAgICBkaWcgMTUKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGR1cAogICAgY292ZXIgMgogICAgYnVyeSAxNQogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWF0Y2hlcyBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MzE3CiAgICAvLyBpZiBtYXRjaC5waGFzZSAhPSBhcmM0LlVJbnQ4KFBIQVNFX0NPTVBMRVRFRCkgb3IgbWF0Y2gucGFpZF9vdXQgPT0gYXJjNC5VSW50OCgxKToKICAgIGV4dHJhY3QgNjggMQogICAgYnl0ZWMgMzMgLy8gMHgwMgogICAgYiE9CiAgICBibnogc3dlZXBfYm94ZXNfaWZfYm9keUAyMAogICAgZGlnIDEyCiAgICBleHRyYWN0IDExNyAxCiAgICBieXRlYyA2IC8vIDB4MDEKICAgIGI9PQogICAgYnogc3dlZXBfYm94ZXNfYWZ0ZXJfaWZfZWxzZUAyNwoKc3dlZXBfYm94ZXNfaWZfYm9keUAyMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MzE4CiAgICAvLyBkZWwgc2VsZi5tYXRjaGVzW21hdGNoX2lkXQogICAgZGlnIDE1CiAgICBib3hfZGVsCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MzE5CiAgICAvLyBzd2VwdCArPSBVSW50NjQoMSkKICAgIGRpZyA4CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnVyeSA5CiAgICBiIHN3ZWVwX2JveGVzX2FmdGVyX2lmX2Vsc2VAMjcKCnN3ZWVwX2JveGVzX2Vsc2VfYm9keUAyMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MzIxCiAgICAvLyBhc3NlcnQga2V5Lmxlbmd0aCA9PSBVSW50NjQoNCksICJCYWQga2V5IgogICAgZGlnIDEzCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCA0IC8vIDQKICAgID09CiAgICBhc3NlcnQgLy8gQmFkIGtleQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTozMjMKICAgIC8vIGlmIHBvc2l0aW9uIGluIHNlbGYuZW5yb2xsbWVudF9vcmRlcjoKICAgIGJ5dGVjIDM0IC8vIDB4NmY1ZgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJ1cnkgMTYKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYnogc3dlZXBfYm94ZXNfYWZ0ZXJfaWZfZWxzZUAyNwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTozMjQKICAgIC8vIGRlbCBzZWxmLmVucm9sbG1lbnRfb3JkZXJbcG9zaXRpb25dCiAgICBkaWcgMTQKICAgIGJveF9kZWwKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTozMjUKICAgIC8vIHN3ZXB0ICs9IFVJbnQ2NCgxKQogICAgZGlnIDgKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBidXJ5IDkKICAgIGIgc3dlZXBfYm94ZXNfYWZ0ZXJfaWZfZWxzZUAyNwoKc3dlZXBfYm94ZXNfYWZ0ZXJfZm9yQDI5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTozMjcKICAgIC8vIHJlZnVuZGVkID0gc3dlcHQgKiBib3hfbWJyICsgc2VsZi5fdGFrZV9jbGFpbV9tYnJfcmVmdW5kKCkKICAgIGRpZyA4CiAgICBkdXAKICAgIGRpZyAxMwogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTozMzQKICAgIC8vIGFtb3VudCA9IHNlbGYuY2xhaW1fbWJyX3JlZnVuZC52YWx1ZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEwIC8vICJjbGFpbV9tYnJfcmVmdW5kIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNsYWltX21icl9yZWZ1bmQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjMzNQogICAgLy8gc2VsZi5jbGFpbV9tYnJfcmVmdW5kLnZhbHVlID0gVUludDY0KDApCiAgICBieXRlYyAxMCAvLyAiY2xhaW1fbWJyX3JlZnVuZCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTozMjcKICAgIC8vIHJlZnVuZGVkID0gc3dlcHQgKiBib3hfbWJyICsgc2VsZi5fdGFrZV9jbGFpbV9tYnJfcmVmdW5kKCkKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MzI4CiAgICAvLyBzZWxmLl9yZWZ1bmRfbWJyKHJlZnVuZGVkKQogICAgZHVwCiAgICBjYWxsc3ViIF9yZWZ1bmRfbWJyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjMyOQogICAgLy8gYXJjNC5lbWl0KEJveGVzU3dlcHQoa2luZD1raW5kLCBjb3VudD1hcmM0LlVJbnQ2NChzd2VwdCksIHJlZnVuZGVkPWFyYzQuVUludDY0KHJlZnVuZGVkKSkpCiAgICBzd2FwCiAgICBpdG9iCiAgICBzd2FwCiAgICBpdG9iCiAgICBkaWcgNwogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIHB1c2hieXRlcyAweGFiNzczZGM2IC8vIG1ldGhvZCAiQm94ZXNTd2VwdCh1aW50OCx1aW50NjQsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjI4MwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBieXRlY18xIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgpzd2VlcF9ib3hlc19lbHNlX2JvZHlANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MzAwCiAgICAvLyBlbGlmIGtpbmQuYXNfdWludDY0KCkgPT0gVUludDY0KFNXRUVQX0VOUk9MTE1FTlRfT1JERVIpOgogICAgZGlnIDcKICAgIGludGNfMyAvLyAyCiAgICA9PQogICAgYnogc3dlZXBfYm94ZXNfYWZ0ZXJfaWZfZWxzZUAxMAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTozMDEKICAgIC8vIGJveF9tYnIgPSBVSW50NjQoT1JERVJfQk9YX01CUikKICAgIHB1c2hpbnQgMTc3MDAgLy8gMTc3MDAKICAgIGJ1cnkgMTIKICAgIGIgc3dlZXBfYm94ZXNfYWZ0ZXJfaWZfZWxzZUAxMAoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50cnVzdF92YXJpYXRpb24uY29udHJhY3QuVHJ1c3RWYXJpYXRpb24uc2V0X3NldHRsZW1lbnRfbW9kZVtyb3V0aW5nXSgpIC0+IHZvaWQ6CnNldF9zZXR0bGVtZW50X21vZGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjM0OAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MzU4CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLm93bmVyLnZhbHVlLCAiTm90IG93bmVyIgogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gIm93bmVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm93bmVyIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBOb3Qgb3duZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MzU5CiAgICAvLyBhc3NlcnQgc2VsZi5zdGF0dXMudmFsdWUgIT0gVUludDY0KFNUQVRVU19DT01QTEVURUQpLCAiQWxyZWFkeSBlbmRlZCIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJzdGF0dXMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3RhdHVzIGV4aXN0cwogICAgaW50Y18zIC8vIDIKICAgICE9CiAgICBhc3NlcnQgLy8gQWxyZWFkeSBlbmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTozNjAKICAgIC8vIGFzc2VydCBzZWxmLm1hdGNoX2NvdW50LnZhbHVlID09IFVJbnQ2NCgwKSwgIk1hdGNoZXMgYWxyZWFkeSBjcmVhdGVkIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gIm1hdGNoX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1hdGNoX2NvdW50IGV4aXN0cwogICAgIQogICAgYXNzZXJ0IC8vIE1hdGNoZXMgYWxyZWFkeSBjcmVhdGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjM2MQogICAgLy8gYXNzZXJ0IG1vZGUuYXNfdWludDY0KCkgPD0gVUludDY0KFNFVFRMRU1FTlRfQ0xBSU0pLCAiVW5rbm93biBzZXR0bGVtZW50IG1vZGUiCiAgICBidG9pCiAgICBkdXAKICAgIGludGNfMyAvLyAyCiAgICA8PQogICAgYXNzZXJ0IC8vIFVua25vd24gc2V0dGxlbWVudCBtb2RlCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjM2MgogICAgLy8gc2VsZi5zZXR0bGVtZW50X21vZGUudmFsdWUgPSBtb2RlLmFzX3VpbnQ2NCgpCiAgICBieXRlYyAxNSAvLyAic2V0dGxlbWVudF9tb2RlIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MzQ4CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMudHJ1c3RfdmFyaWF0aW9uLmNvbnRyYWN0LlRydXN0VmFyaWF0aW9uLmVuYWJsZV9hdXRvX21hdGNoW3JvdXRpbmddKCkgLT4gdm9pZDoKZW5hYmxlX2F1dG9fbWF0Y2g6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjM3MQogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5vd25lci52YWx1ZSwgIk5vdCBvd25lciIKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJvd25lciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vd25lciBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gTm90IG93bmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjM3MgogICAgLy8gYXNzZXJ0IHNlbGYuc3RhdHVzLnZhbHVlID09IFVJbnQ2NChTVEFUVVNfQUNUSVZFKSwgIk5vdCBhY3RpdmUiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAic3RhdHVzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnN0YXR1cyBleGlzdHMKICAgICEKICAgIGFzc2VydCAvLyBOb3QgYWN0aXZlCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjM3MwogICAgLy8gYXNzZXJ0IHNlbGYucGFydGljaXBhbnRfY291bnQudmFsdWUgPT0gVUludDY0KDApLCAiUGFydGljaXBhbnRzIGFscmVhZHkgZW5yb2xsZWQiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNyAvLyAicGFydGljaXBhbnRfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucGFydGljaXBhbnRfY291bnQgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQgLy8gUGFydGljaXBhbnRzIGFscmVhZHkgZW5yb2xsZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6Mzc0CiAgICAvLyBzZWxmLmF1dG9fbWF0Y2hfZW5hYmxlZC52YWx1ZSA9IFVJbnQ2NCgxKQogICAgYnl0ZWMgMTggLy8gImF1dG9fbWF0Y2hfZW5hYmxlZCIKICAgIGludGNfMSAvLyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTozNjQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50cnVzdF92YXJpYXRpb24uY29udHJhY3QuVHJ1c3RWYXJpYXRpb24uYWRkX3BhcnRpY2lwYW50c1tyb3V0aW5nXSgpIC0+IHZvaWQ6CmFkZF9wYXJ0aWNpcGFudHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjM4MgogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXBuIDIKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGR1cAogICAgaW50Y18yIC8vIDMyCiAgICAqCiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgdW5jb3ZlciAyCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4+CiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMSAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6Mzg0CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLm93bmVyLnZhbHVlLCAiTm90IG93bmVyIgogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gIm93bmVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm93bmVyIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBOb3Qgb3duZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6Mzg1CiAgICAvLyBhc3NlcnQgc2VsZi5zdGF0dXMudmFsdWUgPT0gVUludDY0KFNUQVRVU19BQ1RJVkUpLCAiTm90IGFjdGl2ZSIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJzdGF0dXMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3RhdHVzIGV4aXN0cwogICAgIQogICAgYXNzZXJ0IC8vIE5vdCBhY3RpdmUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6Mzg2CiAgICAvLyBhc3NlcnQgbWJyX3BheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywgIldyb25nIE1CUiByZWNlaXZlciIKICAgIGR1cAogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIFdyb25nIE1CUiByZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTozODcKICAgIC8vIGFzc2VydCBtYnJfcGF5bWVudC5hbW91bnQgPj0gc2VsZi5fcGFydGljaXBhbnRfbWJyKCkgKiBhZGRyZXNzZXMubGVuZ3RoLCAiSW5zdWZmaWNpZW50IE1CUiIKICAgIGd0eG5zIEFtb3VudAogICAgY2FsbHN1YiBfcGFydGljaXBhbnRfbWJyCiAgICB1bmNvdmVyIDIKICAgICoKICAgID49CiAgICBhc3NlcnQgLy8gSW5zdWZmaWNpZW50IE1CUgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTozODgKICAgIC8vIGZpcnN0X3Bvc2l0aW9uID0gYXJjNC5VSW50MzIoc2VsZi5wYXJ0aWNpcGFudF9jb3VudC52YWx1ZSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA3IC8vICJwYXJ0aWNpcGFudF9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wYXJ0aWNpcGFudF9jb3VudCBleGlzdHMKICAgIGl0b2IKICAgIGR1cAogICAgYml0bGVuCiAgICBpbnRjXzIgLy8gMzIKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGV4dHJhY3QgNCA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjM4OQogICAgLy8gZm9yIGkgaW4gdXJhbmdlKGFkZHJlc3Nlcy5sZW5ndGgpOgogICAgaW50Y18wIC8vIDAKCmFkZF9wYXJ0aWNpcGFudHNfZm9yX2hlYWRlckAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTozODkKICAgIC8vIGZvciBpIGluIHVyYW5nZShhZGRyZXNzZXMubGVuZ3RoKToKICAgIGR1cAogICAgZGlnIDMKICAgIDwKICAgIGJ6IGFkZF9wYXJ0aWNpcGFudHNfYWZ0ZXJfZm9yQDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MzkwCiAgICAvLyBhZGRyID0gYWRkcmVzc2VzW2ldLmNvcHkoKQogICAgZGlnIDMKICAgIGV4dHJhY3QgMiAwCiAgICBkaWcgMQogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpbnRjXzIgLy8gMzIKICAgICoKICAgIGludGNfMiAvLyAzMgogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IGluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjM5MQogICAgLy8gYXNzZXJ0IGFkZHIgbm90IGluIHNlbGYucGFydGljaXBhbnRzLCAiQWxyZWFkeSBlbnJvbGxlZCIKICAgIGJ5dGVjIDUgLy8gMHg3MDVmCiAgICBkaWcgMQogICAgY29uY2F0CiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgICEKICAgIGFzc2VydCAvLyBBbHJlYWR5IGVucm9sbGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjM5MgogICAgLy8gc2VsZi5fc3RvcmVfcGFydGljaXBhbnQoYWRkcikKICAgIGNhbGxzdWIgX3N0b3JlX3BhcnRpY2lwYW50CiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6Mzg5CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoYWRkcmVzc2VzLmxlbmd0aCk6CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnVyeSAxCiAgICBiIGFkZF9wYXJ0aWNpcGFudHNfZm9yX2hlYWRlckAyCgphZGRfcGFydGljaXBhbnRzX2FmdGVyX2ZvckA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTozOTMKICAgIC8vIGFyYzQuZW1pdChQYXJ0aWNpcGFudHNFbnJvbGxlZChmaXJzdF9wb3NpdGlvbj1maXJzdF9wb3NpdGlvbiwgY291bnQ9YXJjNC5VSW50MzIoYWRkcmVzc2VzLmxlbmd0aCkpKQogICAgZGlnIDIKICAgIGl0b2IKICAgIGR1cAogICAgYml0bGVuCiAgICBpbnRjXzIgLy8gMzIKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGV4dHJhY3QgNCA0CiAgICBkaWcgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBwdXNoYnl0ZXMgMHgzYmY3YTM4OCAvLyBtZXRob2QgIlBhcnRpY2lwYW50c0Vucm9sbGVkKHVpbnQzMix1aW50MzIpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MzgyCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMudHJ1c3RfdmFyaWF0aW9uLmNvbnRyYWN0LlRydXN0VmFyaWF0aW9uLnNlbGZfZW5yb2xsW3JvdXRpbmddKCkgLT4gdm9pZDoKc2VsZl9lbnJvbGw6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjM5NQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMSAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6Mzk3CiAgICAvLyBhZGRyID0gYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjM5OAogICAgLy8gc2VsZi5fY2hlY2tfc2VsZl9lbnJvbGwoYWRkciwgbWJyX3BheW1lbnQpCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgY2FsbHN1YiBfY2hlY2tfc2VsZl9lbnJvbGwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6Mzk5LTQwMAogICAgLy8gIyBWZXJpZnkgc2VuZGVyIGlzIHJlZ2lzdGVyZWQgaW4gQnhIaXZlUmVnaXN0cnkKICAgIC8vIHVzZXJfaWQgPSBzZWxmLl9yZWdpc3RyeV91c2VyX2lkKGFkZHIpCiAgICBkdXAKICAgIGNhbGxzdWIgX3JlZ2lzdHJ5X3VzZXJfaWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NDAxCiAgICAvLyBhc3NlcnQgc2VsZi5fcm9zdGVyX2ZsYWdzKHVzZXJfaWQuYXNfdWludDY0KCkpID09IFVJbnQ2NCgwKSwgIkFscmVhZHkgb24gcm9zdGVyIgogICAgYnRvaQogICAgY2FsbHN1YiBfcm9zdGVyX2ZsYWdzCiAgICAhCiAgICBhc3NlcnQgLy8gQWxyZWFkeSBvbiByb3N0ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NDAyCiAgICAvLyBzZWxmLl9lbnJvbGwoYWRkcikKICAgIGNhbGxzdWIgX2Vucm9sbAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTozOTUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50cnVzdF92YXJpYXRpb24uY29udHJhY3QuVHJ1c3RWYXJpYXRpb24uc2VsZl9lbnJvbGxfZ3JvdXBlZFtyb3V0aW5nXSgpIC0+IHZvaWQ6CnNlbGZfZW5yb2xsX2dyb3VwZWQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjQwNAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18zIC8vIDIKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIHB1c2hpbnQgNiAvLyBhcHBsCiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgYXBwbAogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjQxNgogICAgLy8gYWRkciA9IGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKQogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo0MTcKICAgIC8vIHNlbGYuX2NoZWNrX3NlbGZfZW5yb2xsKGFkZHIsIG1icl9wYXltZW50KQogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIGNhbGxzdWIgX2NoZWNrX3NlbGZfZW5yb2xsCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjQxOAogICAgLy8gYXNzZXJ0IHJlZ2lzdHJ5X2NhbGwuYXBwX2lkID09IEFwcGxpY2F0aW9uKHNlbGYucmVnaXN0cnlfYXBwLnZhbHVlKSwgIk5vdCBhIHJlZ2lzdHJ5IGNhbGwiCiAgICBkaWcgMQogICAgZ3R4bnMgQXBwbGljYXRpb25JRAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDIzIC8vICJyZWdpc3RyeV9hcHAiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmVnaXN0cnlfYXBwIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBOb3QgYSByZWdpc3RyeSBjYWxsCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjQxOQogICAgLy8gYXNzZXJ0IHJlZ2lzdHJ5X2NhbGwuc2VuZGVyID09IFR4bi5zZW5kZXIsICJSZWdpc3RyeSBjYWxsIGZyb20gYW5vdGhlciBzZW5kZXIiCiAgICBkaWcgMQogICAgZ3R4bnMgU2VuZGVyCiAgICB0eG4gU2VuZGVyCiAgICA9PQogICAgYXNzZXJ0IC8vIFJlZ2lzdHJ5IGNhbGwgZnJvbSBhbm90aGVyIHNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo0MjAKICAgIC8vIGFzc2VydCByZWdpc3RyeV9jYWxsLm9uX2NvbXBsZXRpb24gPT0gT25Db21wbGV0ZUFjdGlvbi5Ob09wLCAiUmVnaXN0cnkgY2FsbCBub3QgTm9PcCIKICAgIGRpZyAxCiAgICBndHhucyBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBSZWdpc3RyeSBjYWxsIG5vdCBOb09wCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjQyMQogICAgLy8gYXNzZXJ0IHJlZ2lzdHJ5X2NhbGwuYXBwX2FyZ3MoMCkgPT0gQnl0ZXMoYiJceDZmXHhhZFx4NGFceDY1IiksICJOb3QgYSBnZXRfdXNlciBjYWxsIiAgIyBnZXRfdXNlcihhZGRyZXNzKQogICAgZGlnIDEKICAgIGludGNfMCAvLyAwCiAgICBndHhuc2FzIEFwcGxpY2F0aW9uQXJncwogICAgYnl0ZWMgMzUgLy8gMHg2ZmFkNGE2NQogICAgPT0KICAgIGFzc2VydCAvLyBOb3QgYSBnZXRfdXNlciBjYWxsCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjQyMgogICAgLy8gYXNzZXJ0IHJlZ2lzdHJ5X2NhbGwuYXBwX2FyZ3MoMSkgPT0gYWRkci5ieXRlcywgIlJlZ2lzdHJ5IGNhbGwgZm9yIGFub3RoZXIgYWRkcmVzcyIKICAgIGRpZyAxCiAgICBpbnRjXzEgLy8gMQogICAgZ3R4bnNhcyBBcHBsaWNhdGlvbkFyZ3MKICAgIGRpZyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIFJlZ2lzdHJ5IGNhbGwgZm9yIGFub3RoZXIgYWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo0MjMKICAgIC8vIHVzZXJfaWQgPSBVc2VyLmZyb21fbG9nKHJlZ2lzdHJ5X2NhbGwubGFzdF9sb2cpLnVzZXJfaWQKICAgIHN3YXAKICAgIGd0eG5zIExhc3RMb2cKICAgIGR1cAogICAgZXh0cmFjdCA0IDAKICAgIGR1cAogICAgbGVuCiAgICBkaWcgMQogICAgcHVzaGludCA1IC8vIDUKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIHR1cGxlIGVuY29kaW5nCiAgICBkdXAKICAgIHB1c2hpbnQgMTUgLy8gMTUKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCB0YWlsIHBvaW50ZXIgYXQgaW5kZXggMiBvZiAodWludDMyLHVpbnQ4LChsZW4rdXRmOFtdKSx1aW50NjQpCiAgICB1bmNvdmVyIDIKICAgIHN3YXAKICAgIGRpZyAyCiAgICBzdWJzdHJpbmczCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgcHVzaGludCAxNyAvLyAxNwogICAgKwogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3Igc21hcnRfY29udHJhY3RzLnNoYXJlZC50eXBlcy5Vc2VyCiAgICBkdXAKICAgIGV4dHJhY3QgMCA0CiAgICBieXRlY18xIC8vIDB4MTUxZjdjNzUKICAgID09CiAgICBhc3NlcnQgLy8gYXBwbGljYXRpb24gbG9nIHZhbHVlIGlzIG5vdCB0aGUgcmVzdWx0IG9mIGFuIEFCSSByZXR1cm4KICAgIHB1c2hpbnQgNCAvLyA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjQyNAogICAgLy8gYXNzZXJ0IHNlbGYuX3Jvc3Rlcl9mbGFncyh1c2VyX2lkLmFzX3VpbnQ2NCgpKSA9PSBVSW50NjQoMCksICJBbHJlYWR5IG9uIHJvc3RlciIKICAgIGV4dHJhY3RfdWludDMyCiAgICBjYWxsc3ViIF9yb3N0ZXJfZmxhZ3MKICAgICEKICAgIGFzc2VydCAvLyBBbHJlYWR5IG9uIHJvc3RlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo0MjUKICAgIC8vIHNlbGYuX2Vucm9sbChhZGRyKQogICAgY2FsbHN1YiBfZW5yb2xsCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjQwNAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnRydXN0X3ZhcmlhdGlvbi5jb250cmFjdC5UcnVzdFZhcmlhdGlvbi5zZWxmX2Vucm9sbF93aXRoX3Byb29mW3JvdXRpbmddKCkgLT4gdm9pZDoKc2VsZl9lbnJvbGxfd2l0aF9wcm9vZjoKICAgIGludGNfMCAvLyAwCiAgICBkdXAKICAgIHB1c2hieXRlcyAiIgogICAgZHVwbiA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjQyNwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCA0IC8vIDQKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDMyCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgZGlnIDEKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICBleHRyYWN0IDIgMAogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjQ0MAogICAgLy8gYWRkciA9IGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKQogICAgdHhuIFNlbmRlcgogICAgZHVwCiAgICBjb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjQ0MQogICAgLy8gc2VsZi5fY2hlY2tfc2VsZl9lbnJvbGwoYWRkciwgbWJyX3BheW1lbnQpCiAgICBzd2FwCiAgICBjYWxsc3ViIF9jaGVja19zZWxmX2Vucm9sbAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo0NDIKICAgIC8vIHJlZ2lzdHJ5ID0gQXBwbGljYXRpb24oc2VsZi5yZWdpc3RyeV9hcHAudmFsdWUpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMjMgLy8gInJlZ2lzdHJ5X2FwcCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBzd2FwCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmVnaXN0cnlfYXBwIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3NoYXJlZC9tZW1iZXJzaGlwLnB5OjQyCiAgICAvLyByZXR1cm4gQnl0ZXMoYiJtciIpICsgb3AuZXh0cmFjdChCeXRlcyhiIjAxMjM0NTY3IiksIHNsb3QsIDEpCiAgICBwdXNoYnl0ZXMgMHg2ZDcyMzAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NDQzCiAgICAvLyBfcm9vdHMsIGV4aXN0cyA9IG9wLkFwcEdsb2JhbC5nZXRfZXhfYnl0ZXMocmVnaXN0cnksIG1lbWJlcl9yb290c19rZXkoVUludDY0KDApKSkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBidXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NDQ0CiAgICAvLyBhc3NlcnQgZXhpc3RzLCAiUmVnaXN0cnkgaGFzIG5vIG1lbWJlciByb290cyIKICAgIGFzc2VydCAvLyBSZWdpc3RyeSBoYXMgbm8gbWVtYmVyIHJvb3RzCgpzZWxmX2Vucm9sbF93aXRoX3Byb29mX3doaWxlX3RvcEAyOgogICAgcHVzaGludCAxMjEwIC8vIDEyMTAKICAgIGdsb2JhbCBPcGNvZGVCdWRnZXQKICAgID4KICAgIGJ6IHNlbGZfZW5yb2xsX3dpdGhfcHJvb2ZfYWZ0ZXJfd2hpbGVANwogICAgaXR4bl9iZWdpbgogICAgcHVzaGludCA2IC8vIGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIHB1c2hpbnQgNSAvLyBEZWxldGVBcHBsaWNhdGlvbgogICAgaXR4bl9maWVsZCBPbkNvbXBsZXRpb24KICAgIGJ5dGVjIDM2IC8vIDB4MDY4MTAxCiAgICBpdHhuX2ZpZWxkIEFwcHJvdmFsUHJvZ3JhbQogICAgYnl0ZWMgMzYgLy8gMHgwNjgxMDEKICAgIGl0eG5fZmllbGQgQ2xlYXJTdGF0ZVByb2dyYW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIGIgc2VsZl9lbnJvbGxfd2l0aF9wcm9vZl93aGlsZV90b3BAMgoKc2VsZl9lbnJvbGxfd2l0aF9wcm9vZl9hZnRlcl93aGlsZUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo0NDYKICAgIC8vIHJvb3QgPSBtZW1iZXJfcm9vdF9mcm9tX3Byb29mKG9wLnNoYTI1NihhZGRyLmJ5dGVzKSwgdXNlcl9pZC5hc191aW50NjQoKSwgcHJvb2YpCiAgICBkaWcgMQogICAgc2hhMjU2CiAgICBkaWcgNAogICAgYnRvaQogICAgZHVwCiAgICBidXJ5IDExCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2hhcmVkL21lbWJlcnNoaXAucHk6MjAKICAgIC8vIGFzc2VydCBwcm9vZi5sZW5ndGggPT0gVUludDY0KE1FTUJFUl9QUk9PRl9CWVRFUyksICJCYWQgcHJvb2YgbGVuZ3RoIgogICAgZGlnIDQKICAgIGxlbgogICAgcHVzaGludCA2NDAgLy8gNjQwCiAgICA9PQogICAgYXNzZXJ0IC8vIEJhZCBwcm9vZiBsZW5ndGgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zaGFyZWQvbWVtYmVyc2hpcC5weToyMQogICAgLy8gYXNzZXJ0IGluZGV4IDwgVUludDY0KE1FTUJFUl9UUkVFX1NJWkUpLCAiQmFkIHByb29mIGluZGV4IgogICAgcHVzaGludCAxMDQ4NTc2IC8vIDEwNDg1NzYKICAgIDwKICAgIGFzc2VydCAvLyBCYWQgcHJvb2YgaW5kZXgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zaGFyZWQvbWVtYmVyc2hpcC5weToyMwogICAgLy8gZm9yIGxldmVsIGluIHVyYW5nZShNRU1CRVJfVFJFRV9ERVBUSCk6CiAgICBpbnRjXzAgLy8gMAogICAgc3dhcAogICAgYnVyeSAxMgogICAgYnVyeSA4CgpzZWxmX2Vucm9sbF93aXRoX3Byb29mX2Zvcl9oZWFkZXJAMTA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2hhcmVkL21lbWJlcnNoaXAucHk6MjMKICAgIC8vIGZvciBsZXZlbCBpbiB1cmFuZ2UoTUVNQkVSX1RSRUVfREVQVEgpOgogICAgZGlnIDcKICAgIHB1c2hpbnQgMjAgLy8gMjAKICAgIDwKICAgIGJ6IHNlbGZfZW5yb2xsX3dpdGhfcHJvb2ZfYWZ0ZXJfZm9yQDE1CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2hhcmVkL21lbWJlcnNoaXAucHk6MjQKICAgIC8vIHNpYmxpbmcgPSBvcC5leHRyYWN0KHByb29mLCBsZXZlbCAqIFVJbnQ2NCgzMiksIDMyKQogICAgZGlnIDcKICAgIGR1cAogICAgaW50Y18yIC8vIDMyCiAgICAqCiAgICBkaWcgNAogICAgc3dhcAogICAgaW50Y18yIC8vIDMyCiAgICBleHRyYWN0MwogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL3NoYXJlZC9tZW1iZXJzaGlwLnB5OjI1CiAgICAvLyBpZiAoaW5kZXggPj4gbGV2ZWwpICYgVUludDY0KDEpOgogICAgZGlnIDEwCiAgICBzd2FwCiAgICBzaHIKICAgIGludGNfMSAvLyAxCiAgICAmCiAgICBieiBzZWxmX2Vucm9sbF93aXRoX3Byb29mX2Vsc2VfYm9keUAxMwogICAgLy8gc21hcnRfY29udHJhY3RzL3NoYXJlZC9tZW1iZXJzaGlwLnB5OjI2CiAgICAvLyBub2RlID0gb3Auc2hhMjU2KHNpYmxpbmcgKyBub2RlKQogICAgZGlnIDExCiAgICBjb25jYXQKICAgIHNoYTI1NgogICAgYnVyeSAxMQoKc2VsZl9lbnJvbGxfd2l0aF9wcm9vZl9hZnRlcl9pZl9lbHNlQDE0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3NoYXJlZC9tZW1iZXJzaGlwLnB5OjIzCiAgICAvLyBmb3IgbGV2ZWwgaW4gdXJhbmdlKE1FTUJFUl9UUkVFX0RFUFRIKToKICAgIGRpZyA3CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnVyeSA4CiAgICBiIHNlbGZfZW5yb2xsX3dpdGhfcHJvb2ZfZm9yX2hlYWRlckAxMAoKc2VsZl9lbnJvbGxfd2l0aF9wcm9vZl9lbHNlX2JvZHlAMTM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2hhcmVkL21lbWJlcnNoaXAucHk6MjgKICAgIC8vIG5vZGUgPSBvcC5zaGEyNTYobm9kZSArIHNpYmxpbmcpCiAgICBkaWcgMTEKICAgIHN3YXAKICAgIGNvbmNhdAogICAgc2hhMjU2CiAgICBidXJ5IDExCiAgICBiIHNlbGZfZW5yb2xsX3dpdGhfcHJvb2ZfYWZ0ZXJfaWZfZWxzZUAxNAoKc2VsZl9lbnJvbGxfd2l0aF9wcm9vZl9hZnRlcl9mb3JAMTU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2hhcmVkL21lbWJlcnNoaXAucHk6NDkKICAgIC8vIGZvciBzbG90IGluIHVyYW5nZShNRU1CRVJfUk9PVF9TTE9UUyk6CiAgICBpbnRjXzAgLy8gMAogICAgYnVyeSA2CgpzZWxmX2Vucm9sbF93aXRoX3Byb29mX2Zvcl9oZWFkZXJAMTg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2hhcmVkL21lbWJlcnNoaXAucHk6NDkKICAgIC8vIGZvciBzbG90IGluIHVyYW5nZShNRU1CRVJfUk9PVF9TTE9UUyk6CiAgICBkaWcgNQogICAgcHVzaGludCA4IC8vIDgKICAgIDwKICAgIGJ6IHNlbGZfZW5yb2xsX3dpdGhfcHJvb2ZfYWZ0ZXJfZm9yQDMwCiAgICAvLyBzbWFydF9jb250cmFjdHMvc2hhcmVkL21lbWJlcnNoaXAucHk6NDIKICAgIC8vIHJldHVybiBCeXRlcyhiIm1yIikgKyBvcC5leHRyYWN0KEJ5dGVzKGIiMDEyMzQ1NjciKSwgc2xvdCwgMSkKICAgIHB1c2hieXRlcyAweDMwMzEzMjMzMzQzNTM2MzcKICAgIGRpZyA2CiAgICBpbnRjXzEgLy8gMQogICAgZXh0cmFjdDMKICAgIHB1c2hieXRlcyAweDZkNzIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3NoYXJlZC9tZW1iZXJzaGlwLnB5OjUwCiAgICAvLyByb290cywgZXhpc3RzID0gb3AuQXBwR2xvYmFsLmdldF9leF9ieXRlcyhyZWdpc3RyeSwgbWVtYmVyX3Jvb3RzX2tleShzbG90KSkKICAgIGRpZyAxCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgc3dhcAogICAgYnVyeSAxMQogICAgLy8gc21hcnRfY29udHJhY3RzL3NoYXJlZC9tZW1iZXJzaGlwLnB5OjUxCiAgICAvLyBpZiBub3QgZXhpc3RzOgogICAgYm56IHNlbGZfZW5yb2xsX3dpdGhfcHJvb2ZfYWZ0ZXJfaWZfZWxzZUAyMQogICAgLy8gc21hcnRfY29udHJhY3RzL3NoYXJlZC9tZW1iZXJzaGlwLnB5OjUyCiAgICAvLyByZXR1cm4gRmFsc2UKICAgIGludGNfMCAvLyAwCgpzZWxmX2Vucm9sbF93aXRoX3Byb29mX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLnNoYXJlZC5tZW1iZXJzaGlwLm1lbWJlcl9yb290X3JlZ2lzdGVyZWRAMzE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjQ0NwogICAgLy8gYXNzZXJ0IG1lbWJlcl9yb290X3JlZ2lzdGVyZWQocmVnaXN0cnksIHJvb3QpLCAiSW52YWxpZCBtZW1iZXJzaGlwIHByb29mIgogICAgYXNzZXJ0IC8vIEludmFsaWQgbWVtYmVyc2hpcCBwcm9vZgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo0NDgKICAgIC8vIGFzc2VydCBzZWxmLl9yb3N0ZXJfZmxhZ3ModXNlcl9pZC5hc191aW50NjQoKSkgPT0gVUludDY0KDApLCAiQWxyZWFkeSBvbiByb3N0ZXIiCiAgICBkaWcgOAogICAgY2FsbHN1YiBfcm9zdGVyX2ZsYWdzCiAgICAhCiAgICBhc3NlcnQgLy8gQWxyZWFkeSBvbiByb3N0ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NDQ5CiAgICAvLyBzZWxmLl9lbnJvbGwoYWRkcikKICAgIGRpZyAxCiAgICBjYWxsc3ViIF9lbnJvbGwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NDI3CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCnNlbGZfZW5yb2xsX3dpdGhfcHJvb2ZfYWZ0ZXJfaWZfZWxzZUAyMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zaGFyZWQvbWVtYmVyc2hpcC5weTozNAogICAgLy8gZm9yIG9mZnNldCBpbiB1cmFuZ2UoVUludDY0KDApLCByb290cy5sZW5ndGgsIFVJbnQ2NCgzMikpOgogICAgZGlnIDkKICAgIGxlbgogICAgYnVyeSA1CiAgICBpbnRjXzAgLy8gMAogICAgYnVyeSA3CgpzZWxmX2Vucm9sbF93aXRoX3Byb29mX2Zvcl9oZWFkZXJAMjI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2hhcmVkL21lbWJlcnNoaXAucHk6MzQKICAgIC8vIGZvciBvZmZzZXQgaW4gdXJhbmdlKFVJbnQ2NCgwKSwgcm9vdHMubGVuZ3RoLCBVSW50NjQoMzIpKToKICAgIGRpZyA2CiAgICBkaWcgNQogICAgPAogICAgYnogc2VsZl9lbnJvbGxfd2l0aF9wcm9vZl9hZnRlcl9mb3JAMjYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zaGFyZWQvbWVtYmVyc2hpcC5weTozNQogICAgLy8gaWYgb3AuZXh0cmFjdChyb290cywgb2Zmc2V0LCAzMikgPT0gcm9vdDoKICAgIGRpZyA5CiAgICBkaWcgNwogICAgaW50Y18yIC8vIDMyCiAgICBleHRyYWN0MwogICAgZGlnIDExCiAgICA9PQogICAgYnogc2VsZl9lbnJvbGxfd2l0aF9wcm9vZl9hZnRlcl9pZl9lbHNlQDI1CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2hhcmVkL21lbWJlcnNoaXAucHk6MzYKICAgIC8vIHJldHVybiBUcnVlCiAgICBpbnRjXzEgLy8gMQoKc2VsZl9lbnJvbGxfd2l0aF9wcm9vZl9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5zaGFyZWQubWVtYmVyc2hpcC5tZW1iZXJfcm9vdF9rbm93bkAyNzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zaGFyZWQvbWVtYmVyc2hpcC5weTo1MwogICAgLy8gaWYgbWVtYmVyX3Jvb3Rfa25vd24ocm9vdHMsIHJvb3QpOgogICAgYnogc2VsZl9lbnJvbGxfd2l0aF9wcm9vZl9hZnRlcl9pZl9lbHNlQDI5CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2hhcmVkL21lbWJlcnNoaXAucHk6NTQKICAgIC8vIHJldHVybiBUcnVlCiAgICBpbnRjXzEgLy8gMQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo0NDcKICAgIC8vIGFzc2VydCBtZW1iZXJfcm9vdF9yZWdpc3RlcmVkKHJlZ2lzdHJ5LCByb290KSwgIkludmFsaWQgbWVtYmVyc2hpcCBwcm9vZiIKICAgIGIgc2VsZl9lbnJvbGxfd2l0aF9wcm9vZl9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5zaGFyZWQubWVtYmVyc2hpcC5tZW1iZXJfcm9vdF9yZWdpc3RlcmVkQDMxCgpzZWxmX2Vucm9sbF93aXRoX3Byb29mX2FmdGVyX2lmX2Vsc2VAMjk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2hhcmVkL21lbWJlcnNoaXAucHk6NDkKICAgIC8vIGZvciBzbG90IGluIHVyYW5nZShNRU1CRVJfUk9PVF9TTE9UUyk6CiAgICBkaWcgNQogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ1cnkgNgogICAgYiBzZWxmX2Vucm9sbF93aXRoX3Byb29mX2Zvcl9oZWFkZXJAMTgKCnNlbGZfZW5yb2xsX3dpdGhfcHJvb2ZfYWZ0ZXJfaWZfZWxzZUAyNToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zaGFyZWQvbWVtYmVyc2hpcC5weTozNAogICAgLy8gZm9yIG9mZnNldCBpbiB1cmFuZ2UoVUludDY0KDApLCByb290cy5sZW5ndGgsIFVJbnQ2NCgzMikpOgogICAgZGlnIDYKICAgIGludGNfMiAvLyAzMgogICAgKwogICAgYnVyeSA3CiAgICBiIHNlbGZfZW5yb2xsX3dpdGhfcHJvb2ZfZm9yX2hlYWRlckAyMgoKc2VsZl9lbnJvbGxfd2l0aF9wcm9vZl9hZnRlcl9mb3JAMjY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvc2hhcmVkL21lbWJlcnNoaXAucHk6MzcKICAgIC8vIHJldHVybiBGYWxzZQogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zaGFyZWQvbWVtYmVyc2hpcC5weTo1MwogICAgLy8gaWYgbWVtYmVyX3Jvb3Rfa25vd24ocm9vdHMsIHJvb3QpOgogICAgYiBzZWxmX2Vucm9sbF93aXRoX3Byb29mX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLnNoYXJlZC5tZW1iZXJzaGlwLm1lbWJlcl9yb290X2tub3duQDI3CgpzZWxmX2Vucm9sbF93aXRoX3Byb29mX2FmdGVyX2ZvckAzMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9zaGFyZWQvbWVtYmVyc2hpcC5weTo1NQogICAgLy8gcmV0dXJuIEZhbHNlCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo0NDcKICAgIC8vIGFzc2VydCBtZW1iZXJfcm9vdF9yZWdpc3RlcmVkKHJlZ2lzdHJ5LCByb290KSwgIkludmFsaWQgbWVtYmVyc2hpcCBwcm9vZiIKICAgIGIgc2VsZl9lbnJvbGxfd2l0aF9wcm9vZl9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5zaGFyZWQubWVtYmVyc2hpcC5tZW1iZXJfcm9vdF9yZWdpc3RlcmVkQDMxCgoKLy8gc21hcnRfY29udHJhY3RzLnRydXN0X3ZhcmlhdGlvbi5jb250cmFjdC5UcnVzdFZhcmlhdGlvbi5lbnJvbGxfdXNlcl9pZHNbcm91dGluZ10oKSAtPiB2b2lkOgplbnJvbGxfdXNlcl9pZHM6CiAgICBwdXNoYnl0ZXMgIiIKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo0OTgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwbiAyCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBkdXAKICAgIHB1c2hpbnQgNCAvLyA0CiAgICAqCiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgdW5jb3ZlciAyCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQzMj4KICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBjb3ZlciAyCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjUxMQogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5vd25lci52YWx1ZSwgIk5vdCBvd25lciIKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJvd25lciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vd25lciBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gTm90IG93bmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjUxMgogICAgLy8gYXNzZXJ0IHNlbGYuc3RhdHVzLnZhbHVlID09IFVJbnQ2NChTVEFUVVNfQUNUSVZFKSwgIk5vdCBhY3RpdmUiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAic3RhdHVzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnN0YXR1cyBleGlzdHMKICAgICEKICAgIGFzc2VydCAvLyBOb3QgYWN0aXZlCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjUxMwogICAgLy8gYXNzZXJ0IHVzZXJfaWRzLmxlbmd0aCA+IFVJbnQ2NCgwKSwgIk5vIHVzZXIgaWRzIgogICAgZGlnIDEKICAgIGFzc2VydCAvLyBObyB1c2VyIGlkcwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo1MTQKICAgIC8vIHNlbGYuX2NoZWNrX2NhcGFjaXR5KHVzZXJfaWRzLmxlbmd0aCkKICAgIHN3YXAKICAgIGNhbGxzdWIgX2NoZWNrX2NhcGFjaXR5CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjUxNQogICAgLy8gYXNzZXJ0IG1icl9wYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsICJXcm9uZyBNQlIgcmVjZWl2ZXIiCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gV3JvbmcgTUJSIHJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjUxNwogICAgLy8gc2l6ZSA9IFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NTE4CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UodXNlcl9pZHMubGVuZ3RoKToKICAgIGR1cAoKZW5yb2xsX3VzZXJfaWRzX2Zvcl9oZWFkZXJAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NTE4CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UodXNlcl9pZHMubGVuZ3RoKToKICAgIGR1cAogICAgZGlnIDQKICAgIDwKICAgIGJ6IGVucm9sbF91c2VyX2lkc19hZnRlcl9mb3JANwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo1MTkKICAgIC8vIG5lZWRlZCA9IHVzZXJfaWRzW2ldLmFzX3VpbnQ2NCgpIC8vIFVJbnQ2NCg0KSArIFVJbnQ2NCgxKQogICAgZGlnIDQKICAgIGV4dHJhY3QgMiAwCiAgICBkaWcgMQogICAgcHVzaGludCA0IC8vIDQKICAgICoKICAgIGV4dHJhY3RfdWludDMyCiAgICBwdXNoaW50IDQgLy8gNAogICAgLwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGR1cAogICAgYnVyeSA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjUyMAogICAgLy8gaWYgbmVlZGVkID4gc2l6ZToKICAgIGRpZyAyCiAgICA+CiAgICBieiBlbnJvbGxfdXNlcl9pZHNfYWZ0ZXJfaWZfZWxzZUA1CiAgICBkaWcgNQogICAgYnVyeSAyCgplbnJvbGxfdXNlcl9pZHNfYWZ0ZXJfaWZfZWxzZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo1MTgKICAgIC8vIGZvciBpIGluIHVyYW5nZSh1c2VyX2lkcy5sZW5ndGgpOgogICAgZHVwCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnVyeSAxCiAgICBiIGVucm9sbF91c2VyX2lkc19mb3JfaGVhZGVyQDIKCmVucm9sbF91c2VyX2lkc19hZnRlcl9mb3JANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NTIzCiAgICAvLyBjb3N0ID0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgYnVyeSA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjUyNAogICAgLy8gaWYgbm90IHNlbGYucm9zdGVyOgogICAgYnl0ZWMgOSAvLyAweDcyNmY3Mzc0NjU3MgogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBibnogZW5yb2xsX3VzZXJfaWRzX2Vsc2VfYm9keUA5CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjUyNQogICAgLy8gY29zdCA9IFVJbnQ2NChST1NURVJfQk9YX01CUikgKyBVSW50NjQoUk9TVEVSX0JZVEVfTUJSKSAqIHNpemUKICAgIHB1c2hpbnQgNDAwIC8vIDQwMAogICAgZGlnIDIKICAgIGR1cAogICAgY292ZXIgMgogICAgKgogICAgcHVzaGludCA0OTAwIC8vIDQ5MDAKICAgICsKICAgIGJ1cnkgOAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo1MjYKICAgIC8vIHNlbGYucm9zdGVyLmNyZWF0ZShzaXplPXNpemUpCiAgICBieXRlYyA5IC8vIDB4NzI2ZjczNzQ2NTcyCiAgICBzd2FwCiAgICBib3hfY3JlYXRlCiAgICBwb3AKCmVucm9sbF91c2VyX2lkc19hZnRlcl9pZl9lbHNlQDEyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo1MzAKICAgIC8vIGFzc2VydCBtYnJfcGF5bWVudC5hbW91bnQgPj0gY29zdCwgIkluc3VmZmljaWVudCBNQlIiCiAgICBkaWcgMgogICAgZ3R4bnMgQW1vdW50CiAgICBkaWcgNwogICAgPj0KICAgIGFzc2VydCAvLyBJbnN1ZmZpY2llbnQgTUJSCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjUzMgogICAgLy8gZm9yIGkgaW4gdXJhbmdlKHVzZXJfaWRzLmxlbmd0aCk6CiAgICBpbnRjXzAgLy8gMAogICAgYnVyeSAxCgplbnJvbGxfdXNlcl9pZHNfZm9yX2hlYWRlckAxMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NTMyCiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UodXNlcl9pZHMubGVuZ3RoKToKICAgIGR1cAogICAgZGlnIDQKICAgIDwKICAgIGJ6IGVucm9sbF91c2VyX2lkc19hZnRlcl9mb3JAMTYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NTMzCiAgICAvLyB1c2VyX2lkID0gdXNlcl9pZHNbaV0uYXNfdWludDY0KCkKICAgIGRpZyA0CiAgICBleHRyYWN0IDIgMAogICAgZGlnIDEKICAgIGR1cAogICAgY292ZXIgMgogICAgcHVzaGludCA0IC8vIDQKICAgICoKICAgIGV4dHJhY3RfdWludDMyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjUzNAogICAgLy8gYXNzZXJ0IHNlbGYuX3Jvc3Rlcl9mbGFncyh1c2VyX2lkKSA9PSBVSW50NjQoMCksICJBbHJlYWR5IGVucm9sbGVkIgogICAgZHVwCiAgICBjYWxsc3ViIF9yb3N0ZXJfZmxhZ3MKICAgICEKICAgIGFzc2VydCAvLyBBbHJlYWR5IGVucm9sbGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjUzNQogICAgLy8gc2VsZi5fc2V0X3Jvc3Rlcl9mbGFnKHVzZXJfaWQsIFVJbnQ2NCgwKSkKICAgIGludGNfMCAvLyAwCiAgICBjYWxsc3ViIF9zZXRfcm9zdGVyX2ZsYWcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NTMyCiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UodXNlcl9pZHMubGVuZ3RoKToKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBidXJ5IDEKICAgIGIgZW5yb2xsX3VzZXJfaWRzX2Zvcl9oZWFkZXJAMTMKCmVucm9sbF91c2VyX2lkc19hZnRlcl9mb3JAMTY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjUzNgogICAgLy8gc2VsZi5yb3N0ZXJfY291bnQudmFsdWUgKz0gdXNlcl9pZHMubGVuZ3RoCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTcgLy8gInJvc3Rlcl9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yb3N0ZXJfY291bnQgZXhpc3RzCiAgICBkaWcgNAogICAgKwogICAgYnl0ZWMgMTcgLy8gInJvc3Rlcl9jb3VudCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjQ5OAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgplbnJvbGxfdXNlcl9pZHNfZWxzZV9ib2R5QDk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjUyNwogICAgLy8gZWxpZiBzaXplID4gc2VsZi5yb3N0ZXIubGVuZ3RoOgogICAgYnl0ZWMgOSAvLyAweDcyNmY3Mzc0NjU3MgogICAgYm94X2xlbgogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucm9zdGVyIGV4aXN0cwogICAgZGlnIDIKICAgIDwKICAgIGJ6IGVucm9sbF91c2VyX2lkc19hZnRlcl9pZl9lbHNlQDEyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjUyOAogICAgLy8gY29zdCA9IFVJbnQ2NChST1NURVJfQllURV9NQlIpICogKHNpemUgLSBzZWxmLnJvc3Rlci5sZW5ndGgpCiAgICBieXRlYyA5IC8vIDB4NzI2ZjczNzQ2NTcyCiAgICBib3hfbGVuCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yb3N0ZXIgZXhpc3RzCiAgICBkaWcgMgogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIC0KICAgIHB1c2hpbnQgNDAwIC8vIDQwMAogICAgKgogICAgYnVyeSA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjUyOQogICAgLy8gc2VsZi5yb3N0ZXIucmVzaXplKHNpemUpCiAgICBieXRlYyA5IC8vIDB4NzI2ZjczNzQ2NTcyCiAgICBzd2FwCiAgICBib3hfcmVzaXplCiAgICBiIGVucm9sbF91c2VyX2lkc19hZnRlcl9pZl9lbHNlQDEyCgoKLy8gc21hcnRfY29udHJhY3RzLnRydXN0X3ZhcmlhdGlvbi5jb250cmFjdC5UcnVzdFZhcmlhdGlvbi5jcmVhdGVfbWF0Y2hbcm91dGluZ10oKSAtPiB2b2lkOgpjcmVhdGVfbWF0Y2g6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjU1MwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjU1NQogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5vd25lci52YWx1ZSwgIk5vdCBvd25lciIKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJvd25lciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vd25lciBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gTm90IG93bmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjU1NgogICAgLy8gYXNzZXJ0IG1icl9wYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsICJXcm9uZyBNQlIgcmVjZWl2ZXIiCiAgICBkdXAKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBXcm9uZyBNQlIgcmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NTU3CiAgICAvLyBhc3NlcnQgbWJyX3BheW1lbnQuYW1vdW50ID49IHNlbGYuX21hdGNoX21icigpLCAiSW5zdWZmaWNpZW50IE1CUiIKICAgIGd0eG5zIEFtb3VudAogICAgY2FsbHN1YiBfbWF0Y2hfbWJyCiAgICA+PQogICAgYXNzZXJ0IC8vIEluc3VmZmljaWVudCBNQlIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NTU4CiAgICAvLyBtYXRjaF9pZCA9IHNlbGYuX2NyZWF0ZV9tYXRjaChpbnZlc3RvciwgdHJ1c3RlZSkKICAgIGR1cDIKICAgIGNhbGxzdWIgX2NyZWF0ZV9tYXRjaAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo1NTkKICAgIC8vIGFyYzQuZW1pdChNYXRjaENyZWF0ZWQobWF0Y2hfaWQ9bWF0Y2hfaWQsIGludmVzdG9yPWludmVzdG9yLmNvcHkoKSwgdHJ1c3RlZT10cnVzdGVlLmNvcHkoKSkpCiAgICBkdXAKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgYnl0ZWMgMzcgLy8gbWV0aG9kICJNYXRjaENyZWF0ZWQodWludDMyLGFkZHJlc3MsYWRkcmVzcykiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo1NTMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50cnVzdF92YXJpYXRpb24uY29udHJhY3QuVHJ1c3RWYXJpYXRpb24uY3JlYXRlX21hdGNoZXNbcm91dGluZ10oKSAtPiB2b2lkOgpjcmVhdGVfbWF0Y2hlczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NTYyCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cG4gMgogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGR1cAogICAgY292ZXIgMgogICAgZHVwCiAgICBwdXNoaW50IDY0IC8vIDY0CiAgICAqCiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgdW5jb3ZlciAyCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnR1cGxlPGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPixhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4+PgogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjU3MgogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5vd25lci52YWx1ZSwgIk5vdCBvd25lciIKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJvd25lciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vd25lciBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gTm90IG93bmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjU3MwogICAgLy8gYXNzZXJ0IHBhaXJzLmxlbmd0aCA+IFVJbnQ2NCgwKSwgIk5vIHBhaXJzIgogICAgZGlnIDEKICAgIGFzc2VydCAvLyBObyBwYWlycwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo1NzQKICAgIC8vIGFzc2VydCBtYnJfcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLCAiV3JvbmcgTUJSIHJlY2VpdmVyIgogICAgZHVwCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gV3JvbmcgTUJSIHJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjU3NQogICAgLy8gYXNzZXJ0IG1icl9wYXltZW50LmFtb3VudCA+PSBzZWxmLl9tYXRjaF9tYnIoKSAqIHBhaXJzLmxlbmd0aCwgIkluc3VmZmljaWVudCBNQlIiCiAgICBndHhucyBBbW91bnQKICAgIGNhbGxzdWIgX21hdGNoX21icgogICAgdW5jb3ZlciAyCiAgICAqCiAgICA+PQogICAgYXNzZXJ0IC8vIEluc3VmZmljaWVudCBNQlIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NTc3CiAgICAvLyBmaXJzdF9tYXRjaF9pZCA9IGFyYzQuVUludDMyKHNlbGYubWF0Y2hfY291bnQudmFsdWUpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAibWF0Y2hfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWF0Y2hfY291bnQgZXhpc3RzCiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDQgNAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo1NzgKICAgIC8vIGZvciBpIGluIHVyYW5nZShwYWlycy5sZW5ndGgpOgogICAgaW50Y18wIC8vIDAKCmNyZWF0ZV9tYXRjaGVzX2Zvcl9oZWFkZXJAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NTc4CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UocGFpcnMubGVuZ3RoKToKICAgIGR1cAogICAgZGlnIDMKICAgIDwKICAgIGJ6IGNyZWF0ZV9tYXRjaGVzX2FmdGVyX2ZvckA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjU3OS01ODAKICAgIC8vIHBhaXIgPSBwYWlyc1tpXS5jb3B5KCkKICAgIC8vIHNlbGYuX2NyZWF0ZV9tYXRjaChwYWlyWzBdLCBwYWlyWzFdKQogICAgZGlnIDMKICAgIGV4dHJhY3QgMiAwCiAgICBkaWcgMQogICAgZHVwCiAgICBjb3ZlciAyCiAgICBwdXNoaW50IDY0IC8vIDY0CiAgICAqCiAgICBwdXNoaW50IDY0IC8vIDY0CiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogaW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGR1cAogICAgZXh0cmFjdCAwIDMyCiAgICBzd2FwCiAgICBleHRyYWN0IDMyIDMyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjU4MAogICAgLy8gc2VsZi5fY3JlYXRlX21hdGNoKHBhaXJbMF0sIHBhaXJbMV0pCiAgICBjYWxsc3ViIF9jcmVhdGVfbWF0Y2gKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo1NzgKICAgIC8vIGZvciBpIGluIHVyYW5nZShwYWlycy5sZW5ndGgpOgogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ1cnkgMQogICAgYiBjcmVhdGVfbWF0Y2hlc19mb3JfaGVhZGVyQDIKCmNyZWF0ZV9tYXRjaGVzX2FmdGVyX2ZvckA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo1ODEKICAgIC8vIGFyYzQuZW1pdChNYXRjaGVzQ3JlYXRlZChmaXJzdF9tYXRjaF9pZD1maXJzdF9tYXRjaF9pZCwgY291bnQ9YXJjNC5VSW50MzIocGFpcnMubGVuZ3RoKSkpCiAgICBkaWcgMgogICAgaXRvYgogICAgZHVwCiAgICBiaXRsZW4KICAgIGludGNfMiAvLyAzMgogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZXh0cmFjdCA0IDQKICAgIGRpZyAyCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBieXRlYyAzOCAvLyBtZXRob2QgIk1hdGNoZXNDcmVhdGVkKHVpbnQzMix1aW50MzIpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NTYyCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGJ5dGVjXzEgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMudHJ1c3RfdmFyaWF0aW9uLmNvbnRyYWN0LlRydXN0VmFyaWF0aW9uLmF1dG9fbWF0Y2hbcm91dGluZ10oKSAtPiB2b2lkOgphdXRvX21hdGNoOgogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NTg0CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDggLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo1OTQKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYub3duZXIudmFsdWUsICJOb3Qgb3duZXIiCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAib3duZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYub3duZXIgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIE5vdCBvd25lcgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo1OTUKICAgIC8vIGFzc2VydCBzZWxmLmF1dG9fbWF0Y2hfZW5hYmxlZC52YWx1ZSA9PSBVSW50NjQoMSksICJBdXRvLW1hdGNoIG5vdCBlbmFibGVkIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE4IC8vICJhdXRvX21hdGNoX2VuYWJsZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYXV0b19tYXRjaF9lbmFibGVkIGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBhc3NlcnQgLy8gQXV0by1tYXRjaCBub3QgZW5hYmxlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo1OTYKICAgIC8vIGNvdW50ID0gbi5hc191aW50NjQoKQogICAgc3dhcAogICAgYnRvaQogICAgZHVwCiAgICBjb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjU5NwogICAgLy8gYXNzZXJ0IGNvdW50ID4gVUludDY0KDApLCAibiBtdXN0IGJlID4gMCIKICAgIGR1cAogICAgYXNzZXJ0IC8vIG4gbXVzdCBiZSA+IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NTk4CiAgICAvLyBhc3NlcnQgY291bnQgJSBVSW50NjQoMikgPT0gVUludDY0KDApLCAibiBtdXN0IGJlIGV2ZW4iCiAgICBkdXAKICAgIGludGNfMyAvLyAyCiAgICAlCiAgICAhCiAgICBhc3NlcnQgLy8gbiBtdXN0IGJlIGV2ZW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NTk5CiAgICAvLyBhc3NlcnQgbWJyX3BheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywgIldyb25nIE1CUiByZWNlaXZlciIKICAgIGRpZyAxCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gV3JvbmcgTUJSIHJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjYwMAogICAgLy8gYXNzZXJ0IG1icl9wYXltZW50LmFtb3VudCA+PSBzZWxmLl9tYXRjaF9tYnIoKSAqIChjb3VudCAvLyBVSW50NjQoMikpLCAiSW5zdWZmaWNpZW50IE1CUiIKICAgIHN3YXAKICAgIGd0eG5zIEFtb3VudAogICAgY2FsbHN1YiBfbWF0Y2hfbWJyCiAgICB1bmNvdmVyIDIKICAgIGludGNfMyAvLyAyCiAgICAvCiAgICAqCiAgICA+PQogICAgYXNzZXJ0IC8vIEluc3VmZmljaWVudCBNQlIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NjAyCiAgICAvLyBmaXJzdF9tYXRjaF9pZCA9IGFyYzQuVUludDMyKHNlbGYubWF0Y2hfY291bnQudmFsdWUpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAibWF0Y2hfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWF0Y2hfY291bnQgZXhpc3RzCiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDQgNAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo2MDMKICAgIC8vIGNyZWF0ZWQgPSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjYwNAogICAgLy8gY3Vyc29yID0gc2VsZi5tYXRjaF9jdXJzb3IudmFsdWUKICAgIGR1cAogICAgYnl0ZWMgMjggLy8gIm1hdGNoX2N1cnNvciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5tYXRjaF9jdXJzb3IgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjYwNQogICAgLy8gcGVuZGluZyA9IGFyYzQuQWRkcmVzcygpCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NjA2CiAgICAvLyBwZW5kaW5nX3BvcyA9IFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NjA3CiAgICAvLyBoYXNfcGVuZGluZyA9IEZhbHNlCiAgICBkdXAKCmF1dG9fbWF0Y2hfd2hpbGVfdG9wQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjYwOAogICAgLy8gd2hpbGUgY291bnQgPiBVSW50NjQoMCkgYW5kIGN1cnNvciA8IHNlbGYucGFydGljaXBhbnRfY291bnQudmFsdWU6CiAgICBkaWcgNgogICAgYnogYXV0b19tYXRjaF9hZnRlcl93aGlsZUAxMAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDcgLy8gInBhcnRpY2lwYW50X2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBhcnRpY2lwYW50X2NvdW50IGV4aXN0cwogICAgZGlnIDQKICAgID4KICAgIGJ6IGF1dG9fbWF0Y2hfYWZ0ZXJfd2hpbGVAMTAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NjA5CiAgICAvLyBhZGRyID0gc2VsZi5lbnJvbGxtZW50X29yZGVyW2FyYzQuVUludDMyKGN1cnNvcildLmNvcHkoKQogICAgZGlnIDMKICAgIGl0b2IKICAgIGR1cAogICAgYml0bGVuCiAgICBpbnRjXzIgLy8gMzIKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGV4dHJhY3QgNCA0CiAgICBieXRlYyAzNCAvLyAweDZmNWYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgc3dhcAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBidXJ5IDEwCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5lbnJvbGxtZW50X29yZGVyIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo2MTAKICAgIC8vIGlmIHNlbGYucGFydGljaXBhbnRzW2FkZHJdLmFzc2lnbmVkID09IGFyYzQuVUludDgoMCk6CiAgICBieXRlYyA1IC8vIDB4NzA1ZgogICAgc3dhcAogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wYXJ0aWNpcGFudHMgZW50cnkgZXhpc3RzCiAgICBleHRyYWN0IDEgMQogICAgYnl0ZWMgMTIgLy8gMHgwMAogICAgYj09CiAgICBieiBhdXRvX21hdGNoX2FmdGVyX2lmX2Vsc2VAOQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo2MTEKICAgIC8vIGlmIGhhc19wZW5kaW5nOgogICAgZHVwCiAgICBieiBhdXRvX21hdGNoX2Vsc2VfYm9keUA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjYxMgogICAgLy8gc2VsZi5fY3JlYXRlX21hdGNoKHBlbmRpbmcsIGFkZHIpCiAgICBkaWcgMgogICAgZGlnIDgKICAgIGNhbGxzdWIgX2NyZWF0ZV9tYXRjaAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjYxMwogICAgLy8gY3JlYXRlZCArPSBVSW50NjQoMSkKICAgIGRpZyA0CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnVyeSA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjYxNAogICAgLy8gaGFzX3BlbmRpbmcgPSBGYWxzZQogICAgaW50Y18wIC8vIDAKICAgIGJ1cnkgMQoKYXV0b19tYXRjaF9hZnRlcl9pZl9lbHNlQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjYxOQogICAgLy8gY291bnQgLT0gVUludDY0KDEpCiAgICBkaWcgNgogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGJ1cnkgNwoKYXV0b19tYXRjaF9hZnRlcl9pZl9lbHNlQDk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjYyMAogICAgLy8gY3Vyc29yICs9IFVJbnQ2NCgxKQogICAgZGlnIDMKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBidXJ5IDQKICAgIGIgYXV0b19tYXRjaF93aGlsZV90b3BAMgoKYXV0b19tYXRjaF9lbHNlX2JvZHlANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NjE4CiAgICAvLyBoYXNfcGVuZGluZyA9IFRydWUKICAgIGludGNfMSAvLyAxCiAgICBidXJ5IDEKICAgIGRpZyAzCiAgICBidXJ5IDIKICAgIGRpZyA3CiAgICBidXJ5IDMKICAgIGIgYXV0b19tYXRjaF9hZnRlcl9pZl9lbHNlQDgKCmF1dG9fbWF0Y2hfYWZ0ZXJfd2hpbGVAMTA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjYyMgogICAgLy8gaWYgaGFzX3BlbmRpbmc6CiAgICBkdXAKICAgIGJ6IGF1dG9fbWF0Y2hfYWZ0ZXJfaWZfZWxzZUAxMgogICAgZGlnIDEKICAgIGJ1cnkgNAoKYXV0b19tYXRjaF9hZnRlcl9pZl9lbHNlQDEyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo2MjQKICAgIC8vIHNlbGYubWF0Y2hfY3Vyc29yLnZhbHVlID0gY3Vyc29yCiAgICBieXRlYyAyOCAvLyAibWF0Y2hfY3Vyc29yIgogICAgZGlnIDQKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjYyNQogICAgLy8gYXJjNC5lbWl0KE1hdGNoZXNDcmVhdGVkKGZpcnN0X21hdGNoX2lkPWZpcnN0X21hdGNoX2lkLCBjb3VudD1hcmM0LlVJbnQzMihjcmVhdGVkKSkpCiAgICBkaWcgNAogICAgaXRvYgogICAgZHVwCiAgICBiaXRsZW4KICAgIGludGNfMiAvLyAzMgogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZHVwCiAgICBleHRyYWN0IDQgNAogICAgZGlnIDcKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYnl0ZWMgMzggLy8gbWV0aG9kICJNYXRjaGVzQ3JlYXRlZCh1aW50MzIsdWludDMyKSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjU4NAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBieXRlY18xIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnRydXN0X3ZhcmlhdGlvbi5jb250cmFjdC5UcnVzdFZhcmlhdGlvbi5jcmVhdGVfbWF0Y2hfYnlfaWRzW3JvdXRpbmddKCkgLT4gdm9pZDoKY3JlYXRlX21hdGNoX2J5X2lkczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NjI4CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDQgLy8gNAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50MzIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgNCAvLyA0CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQzMgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNAogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMSAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NjQyCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLm93bmVyLnZhbHVlLCAiTm90IG93bmVyIgogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gIm93bmVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm93bmVyIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBOb3Qgb3duZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NjQzCiAgICAvLyBhc3NlcnQgbWJyX3BheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywgIldyb25nIE1CUiByZWNlaXZlciIKICAgIGR1cAogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIFdyb25nIE1CUiByZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo2NDQKICAgIC8vIGFzc2VydCBtYnJfcGF5bWVudC5hbW91bnQgPj0gc2VsZi5fbWF0Y2hfbWJyKCksICJJbnN1ZmZpY2llbnQgTUJSIgogICAgZ3R4bnMgQW1vdW50CiAgICBjYWxsc3ViIF9tYXRjaF9tYnIKICAgID49CiAgICBhc3NlcnQgLy8gSW5zdWZmaWNpZW50IE1CUgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo2NDUKICAgIC8vIGFzc2VydCBpbnZlc3Rvcl9pZCAhPSB0cnVzdGVlX2lkLCAiU2FtZSBwbGF5ZXIiCiAgICBkaWcgMwogICAgZGlnIDIKICAgIGIhPQogICAgYXNzZXJ0IC8vIFNhbWUgcGxheWVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjY0NwogICAgLy8gaW52ZXN0b3JfZmxhZ3MgPSBzZWxmLl9yb3N0ZXJfZmxhZ3MoaW52ZXN0b3JfaWQuYXNfdWludDY0KCkpCiAgICBkaWcgMwogICAgYnRvaQogICAgZHVwCiAgICBjYWxsc3ViIF9yb3N0ZXJfZmxhZ3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NjQ4CiAgICAvLyBhc3NlcnQgaW52ZXN0b3JfZmxhZ3MgJiBVSW50NjQoUk9TVEVSX0VOUk9MTEVEKSwgIkludmVzdG9yIG5vdCBlbnJvbGxlZCIKICAgIGR1cAogICAgaW50Y18xIC8vIDEKICAgICYKICAgIGFzc2VydCAvLyBJbnZlc3RvciBub3QgZW5yb2xsZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NjQ5CiAgICAvLyBhc3NlcnQgbm90IGludmVzdG9yX2ZsYWdzICYgVUludDY0KFJPU1RFUl9BU1NJR05FRCksICJJbnZlc3RvciBhbHJlYWR5IGFzc2lnbmVkIgogICAgaW50Y18zIC8vIDIKICAgICYKICAgICEKICAgIGFzc2VydCAvLyBJbnZlc3RvciBhbHJlYWR5IGFzc2lnbmVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjY1MQogICAgLy8gdHJ1c3RlZV9mbGFncyA9IHNlbGYuX3Jvc3Rlcl9mbGFncyh0cnVzdGVlX2lkLmFzX3VpbnQ2NCgpKQogICAgZGlnIDIKICAgIGJ0b2kKICAgIGR1cAogICAgY2FsbHN1YiBfcm9zdGVyX2ZsYWdzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjY1MgogICAgLy8gYXNzZXJ0IHRydXN0ZWVfZmxhZ3MgJiBVSW50NjQoUk9TVEVSX0VOUk9MTEVEKSwgIlRydXN0ZWUgbm90IGVucm9sbGVkIgogICAgZHVwCiAgICBpbnRjXzEgLy8gMQogICAgJgogICAgYXNzZXJ0IC8vIFRydXN0ZWUgbm90IGVucm9sbGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjY1MwogICAgLy8gYXNzZXJ0IG5vdCB0cnVzdGVlX2ZsYWdzICYgVUludDY0KFJPU1RFUl9BU1NJR05FRCksICJUcnVzdGVlIGFscmVhZHkgYXNzaWduZWQiCiAgICBpbnRjXzMgLy8gMgogICAgJgogICAgIQogICAgYXNzZXJ0IC8vIFRydXN0ZWUgYWxyZWFkeSBhc3NpZ25lZAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo2NTUKICAgIC8vIGFzc2VydCBpbnZlc3RvciBub3QgaW4gc2VsZi5wYXJ0aWNpcGFudHMsICJJbnZlc3RvciBlbnJvbGxlZCBvdXRzaWRlIHRoZSByb3N0ZXIiCiAgICBieXRlYyA1IC8vIDB4NzA1ZgogICAgZGlnIDUKICAgIGNvbmNhdAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICAhCiAgICBhc3NlcnQgLy8gSW52ZXN0b3IgZW5yb2xsZWQgb3V0c2lkZSB0aGUgcm9zdGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjY1NgogICAgLy8gYXNzZXJ0IHRydXN0ZWUgbm90IGluIHNlbGYucGFydGljaXBhbnRzLCAiVHJ1c3RlZSBlbnJvbGxlZCBvdXRzaWRlIHRoZSByb3N0ZXIiCiAgICBieXRlYyA1IC8vIDB4NzA1ZgogICAgZGlnIDMKICAgIGNvbmNhdAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICAhCiAgICBhc3NlcnQgLy8gVHJ1c3RlZSBlbnJvbGxlZCBvdXRzaWRlIHRoZSByb3N0ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NjU3CiAgICAvLyBhc3NlcnQgc2VsZi5fcmVnaXN0cnlfdXNlcl9pZChpbnZlc3RvcikgPT0gaW52ZXN0b3JfaWQsICJJbnZlc3RvciBpZCBtaXNtYXRjaCIKICAgIGRpZyA0CiAgICBjYWxsc3ViIF9yZWdpc3RyeV91c2VyX2lkCiAgICB1bmNvdmVyIDYKICAgIGI9PQogICAgYXNzZXJ0IC8vIEludmVzdG9yIGlkIG1pc21hdGNoCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjY1OAogICAgLy8gYXNzZXJ0IHNlbGYuX3JlZ2lzdHJ5X3VzZXJfaWQodHJ1c3RlZSkgPT0gdHJ1c3RlZV9pZCwgIlRydXN0ZWUgaWQgbWlzbWF0Y2giCiAgICBkaWcgMgogICAgY2FsbHN1YiBfcmVnaXN0cnlfdXNlcl9pZAogICAgdW5jb3ZlciA0CiAgICBiPT0KICAgIGFzc2VydCAvLyBUcnVzdGVlIGlkIG1pc21hdGNoCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjY2MAogICAgLy8gc2VsZi5fc2V0X3Jvc3Rlcl9mbGFnKGludmVzdG9yX2lkLmFzX3VpbnQ2NCgpLCBVSW50NjQoMSkpCiAgICBzd2FwCiAgICBpbnRjXzEgLy8gMQogICAgY2FsbHN1YiBfc2V0X3Jvc3Rlcl9mbGFnCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjY2MQogICAgLy8gc2VsZi5fc2V0X3Jvc3Rlcl9mbGFnKHRydXN0ZWVfaWQuYXNfdWludDY0KCksIFVJbnQ2NCgxKSkKICAgIGludGNfMSAvLyAxCiAgICBjYWxsc3ViIF9zZXRfcm9zdGVyX2ZsYWcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NjYyCiAgICAvLyBtYXRjaF9pZCA9IHNlbGYuX25ld19tYXRjaChpbnZlc3RvciwgdHJ1c3RlZSkKICAgIGR1cDIKICAgIGNhbGxzdWIgX25ld19tYXRjaAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo2NjMKICAgIC8vIGFyYzQuZW1pdChNYXRjaENyZWF0ZWQobWF0Y2hfaWQ9bWF0Y2hfaWQsIGludmVzdG9yPWludmVzdG9yLmNvcHkoKSwgdHJ1c3RlZT10cnVzdGVlLmNvcHkoKSkpCiAgICBkdXAKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgYnl0ZWMgMzcgLy8gbWV0aG9kICJNYXRjaENyZWF0ZWQodWludDMyLGFkZHJlc3MsYWRkcmVzcykiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo2MjgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50cnVzdF92YXJpYXRpb24uY29udHJhY3QuVHJ1c3RWYXJpYXRpb24uY2xvc2VfcmVnaXN0cmF0aW9uW3JvdXRpbmddKCkgLT4gdm9pZDoKY2xvc2VfcmVnaXN0cmF0aW9uOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo3MTYKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYub3duZXIudmFsdWUsICJOb3Qgb3duZXIiCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAib3duZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYub3duZXIgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIE5vdCBvd25lcgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo3MTcKICAgIC8vIGFzc2VydCBzZWxmLnN0YXR1cy52YWx1ZSA9PSBVSW50NjQoU1RBVFVTX0FDVElWRSksICJOb3QgYWN0aXZlIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gInN0YXR1cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdGF0dXMgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQgLy8gTm90IGFjdGl2ZQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo3MTgKICAgIC8vIHNlbGYuc3RhdHVzLnZhbHVlID0gVUludDY0KFNUQVRVU19DTE9TRUQpCiAgICBieXRlY18yIC8vICJzdGF0dXMiCiAgICBpbnRjXzEgLy8gMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NzE0CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMudHJ1c3RfdmFyaWF0aW9uLmNvbnRyYWN0LlRydXN0VmFyaWF0aW9uLnN1Ym1pdF9pbnZlc3Rvcl9kZWNpc2lvbltyb3V0aW5nXSgpIC0+IHZvaWQ6CnN1Ym1pdF9pbnZlc3Rvcl9kZWNpc2lvbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NzI0CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDQgLy8gNAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50MzIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDggLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NzI2CiAgICAvLyBhc3NlcnQgbWF0Y2hfaWQgaW4gc2VsZi5tYXRjaGVzLCAiTWF0Y2ggbm90IGZvdW5kIgogICAgYnl0ZWMgMTEgLy8gMHg2ZDVmCiAgICBkaWcgMgogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIE1hdGNoIG5vdCBmb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo3MjcKICAgIC8vIG1hdGNoID0gc2VsZi5tYXRjaGVzW21hdGNoX2lkXS5jb3B5KCkKICAgIGR1cAogICAgYm94X2dldAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjcyOQogICAgLy8gc2VuZGVyX2FkZHIgPSBhcmM0LkFkZHJlc3MoVHhuLnNlbmRlcikKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NzMwCiAgICAvLyBhc3NlcnQgc2VuZGVyX2FkZHIgPT0gbWF0Y2guaW52ZXN0b3IsICJOb3QgdGhlIGludmVzdG9yIgogICAgZGlnIDEKICAgIGV4dHJhY3QgNCAzMgogICAgPT0KICAgIGFzc2VydCAvLyBOb3QgdGhlIGludmVzdG9yCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjczMQogICAgLy8gYXNzZXJ0IG1hdGNoLnBoYXNlID09IGFyYzQuVUludDgoUEhBU0VfSU5WRVNUT1JfREVDSVNJT04pLCAiV3JvbmcgcGhhc2UiCiAgICBkdXAKICAgIGV4dHJhY3QgNjggMQogICAgYnl0ZWMgMTIgLy8gMHgwMAogICAgYj09CiAgICBhc3NlcnQgLy8gV3JvbmcgcGhhc2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NzMzCiAgICAvLyBpbnZfYW1vdW50ID0gaW52ZXN0bWVudC5hc191aW50NjQoKQogICAgZGlnIDIKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NzM0CiAgICAvLyBhc3NlcnQgaW52X2Ftb3VudCA8PSBzZWxmLmUxLnZhbHVlLCAiSW52ZXN0bWVudCBleGNlZWRzIGVuZG93bWVudCIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyMCAvLyAiZTEiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZTEgZXhpc3RzCiAgICBkaWcgMQogICAgPj0KICAgIGFzc2VydCAvLyBJbnZlc3RtZW50IGV4Y2VlZHMgZW5kb3dtZW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjczNQogICAgLy8gYXNzZXJ0IGludl9hbW91bnQgJSBzZWxmLnVuaXQudmFsdWUgPT0gVUludDY0KDApLCAiTm90IGEgbXVsdGlwbGUgb2YgdW5pdCIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyMSAvLyAidW5pdCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi51bml0IGV4aXN0cwogICAgZGlnIDEKICAgIHN3YXAKICAgICUKICAgICEKICAgIGFzc2VydCAvLyBOb3QgYSBtdWx0aXBsZSBvZiB1bml0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjczNwogICAgLy8gbWF0Y2gucGhhc2UgPSBhcmM0LlVJbnQ4KFBIQVNFX1RSVVNURUVfREVDSVNJT04pCiAgICBzd2FwCiAgICBieXRlYyA2IC8vIDB4MDEKICAgIHJlcGxhY2UyIDY4CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjczOAogICAgLy8gbWF0Y2guaW52ZXN0bWVudCA9IGludmVzdG1lbnQKICAgIGRpZyAzCiAgICByZXBsYWNlMiA3NwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo3MzkKICAgIC8vIHNlbGYubWF0Y2hlc1ttYXRjaF9pZF0gPSBtYXRjaC5jb3B5KCkKICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo3NDAKICAgIC8vIGFyYzQuZW1pdChJbnZlc3RvckRlY2lkZWQobWF0Y2hfaWQ9bWF0Y2hfaWQsIGludmVzdG1lbnQ9aW52ZXN0bWVudCkpCiAgICBjb3ZlciAyCiAgICBjb25jYXQKICAgIHB1c2hieXRlcyAweDQ2Y2JkNjdlIC8vIG1ldGhvZCAiSW52ZXN0b3JEZWNpZGVkKHVpbnQzMix1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NzQyCiAgICAvLyBzdGF0cyA9IHNlbGYuc3RhdHMudmFsdWUuY29weSgpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTYgLy8gInN0YXRzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnN0YXRzIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo3NDMKICAgIC8vIHN0YXRzLmludmVzdGVkX2NvdW50ID0gYXJjNC5VSW50NjQoc3RhdHMuaW52ZXN0ZWRfY291bnQuYXNfdWludDY0KCkgKyBVSW50NjQoMSkpCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGl0b2IKICAgIHJlcGxhY2UyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NzQ0CiAgICAvLyBzdGF0cy5zdW1faW52ZXN0bWVudCA9IGFyYzQuVUludDY0KHN0YXRzLnN1bV9pbnZlc3RtZW50LmFzX3VpbnQ2NCgpICsgaW52X2Ftb3VudCkKICAgIGR1cAogICAgcHVzaGludCAxNiAvLyAxNgogICAgZXh0cmFjdF91aW50NjQKICAgIGRpZyAyCiAgICArCiAgICBpdG9iCiAgICByZXBsYWNlMiAxNgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo3NDUKICAgIC8vIHN0YXRzLnN1bXNxX2ludmVzdG1lbnQgPSBfYWRkX3NxdWFyZShzdGF0cy5zdW1zcV9pbnZlc3RtZW50LCBpbnZfYW1vdW50KQogICAgZHVwCiAgICBleHRyYWN0IDI0IDE2CiAgICB1bmNvdmVyIDIKICAgIGNhbGxzdWIgX2FkZF9zcXVhcmUKICAgIHJlcGxhY2UyIDI0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5Ojc0NgogICAgLy8gc2VsZi5zdGF0cy52YWx1ZSA9IHN0YXRzLmNvcHkoKQogICAgYnl0ZWMgMTYgLy8gInN0YXRzIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NzI0CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMudHJ1c3RfdmFyaWF0aW9uLmNvbnRyYWN0LlRydXN0VmFyaWF0aW9uLnN1Ym1pdF90cnVzdGVlX2RlY2lzaW9uW3JvdXRpbmddKCkgLT4gdm9pZDoKc3VibWl0X3RydXN0ZWVfZGVjaXNpb246CiAgICBwdXNoYnl0ZXMgIiIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NzQ4CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cG4gMgogICAgbGVuCiAgICBwdXNoaW50IDQgLy8gNAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50MzIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgY292ZXIgMgogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgOCAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo3NTAKICAgIC8vIGFzc2VydCBzZWxmLnN0YXR1cy52YWx1ZSAhPSBVSW50NjQoU1RBVFVTX0NPTVBMRVRFRCksICJWYXJpYXRpb24gZW5kZWQiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAic3RhdHVzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnN0YXR1cyBleGlzdHMKICAgIGludGNfMyAvLyAyCiAgICAhPQogICAgYXNzZXJ0IC8vIFZhcmlhdGlvbiBlbmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo3NTEKICAgIC8vIGFzc2VydCBtYXRjaF9pZCBpbiBzZWxmLm1hdGNoZXMsICJNYXRjaCBub3QgZm91bmQiCiAgICBieXRlYyAxMSAvLyAweDZkNWYKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gTWF0Y2ggbm90IGZvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5Ojc1MgogICAgLy8gbWF0Y2ggPSBzZWxmLm1hdGNoZXNbbWF0Y2hfaWRdLmNvcHkoKQogICAgYm94X2dldAogICAgcG9wCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NzU0CiAgICAvLyBzZW5kZXJfYWRkciA9IGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKQogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo3NTUKICAgIC8vIGFzc2VydCBzZW5kZXJfYWRkciA9PSBtYXRjaC50cnVzdGVlLCAiTm90IHRoZSB0cnVzdGVlIgogICAgZGlnIDEKICAgIGV4dHJhY3QgMzYgMzIKICAgIGR1cAogICAgY292ZXIgNAogICAgPT0KICAgIGFzc2VydCAvLyBOb3QgdGhlIHRydXN0ZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NzU2CiAgICAvLyBhc3NlcnQgbWF0Y2gucGhhc2UgPT0gYXJjNC5VSW50OChQSEFTRV9UUlVTVEVFX0RFQ0lTSU9OKSwgIldyb25nIHBoYXNlIgogICAgZHVwCiAgICBleHRyYWN0IDY4IDEKICAgIGJ5dGVjIDYgLy8gMHgwMQogICAgYj09CiAgICBhc3NlcnQgLy8gV3JvbmcgcGhhc2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NzU4CiAgICAvLyBzID0gbWF0Y2guaW52ZXN0bWVudC5hc191aW50NjQoKQogICAgcHVzaGludCA3NyAvLyA3NwogICAgZXh0cmFjdF91aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NzU5CiAgICAvLyBtID0gc2VsZi5tdWx0aXBsaWVyLnZhbHVlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMjcgLy8gIm11bHRpcGxpZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubXVsdGlwbGllciBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NzYwCiAgICAvLyByID0gcmV0dXJuX2Ftb3VudC5hc191aW50NjQoKQogICAgdW5jb3ZlciAyCiAgICBidG9pCiAgICBkdXAKICAgIGNvdmVyIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NzYxCiAgICAvLyBtYXhfcmV0dXJuID0gcyAqIG0KICAgIGRpZyAyCiAgICB1bmNvdmVyIDIKICAgICoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NzYzCiAgICAvLyBhc3NlcnQgciA8PSBtYXhfcmV0dXJuLCAiUmV0dXJuIGV4Y2VlZHMgbWF4aW11bSIKICAgIGR1cDIKICAgIDw9CiAgICBhc3NlcnQgLy8gUmV0dXJuIGV4Y2VlZHMgbWF4aW11bQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo3NjQKICAgIC8vIGFzc2VydCByICUgc2VsZi51bml0LnZhbHVlID09IFVJbnQ2NCgwKSwgIk5vdCBhIG11bHRpcGxlIG9mIHVuaXQiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMjEgLy8gInVuaXQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudW5pdCBleGlzdHMKICAgIGRpZyAyCiAgICBzd2FwCiAgICAlCiAgICAhCiAgICBhc3NlcnQgLy8gTm90IGEgbXVsdGlwbGUgb2YgdW5pdAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo3NjYKICAgIC8vIGludmVzdG9yX3BheW91dCA9IHNlbGYuZTEudmFsdWUgLSBzICsgcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDIwIC8vICJlMSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5lMSBleGlzdHMKICAgIHVuY292ZXIgMwogICAgLQogICAgZGlnIDIKICAgICsKICAgIGR1cAogICAgY292ZXIgMgogICAgY292ZXIgMwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo3NjcKICAgIC8vIHRydXN0ZWVfcGF5b3V0ID0gc2VsZi5lMi52YWx1ZSArIG1heF9yZXR1cm4gLSByCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMjYgLy8gImUyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmUyIGV4aXN0cwogICAgKwogICAgdW5jb3ZlciAyCiAgICAtCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NzY4CiAgICAvLyBzZWxmLl9yZXNlcnZlX2VzY3JvdyhpbnZlc3Rvcl9wYXlvdXQgKyB0cnVzdGVlX3BheW91dCkKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MjQxCiAgICAvLyBpZiBzZWxmLnRyZWFzdXJ5X2Z1bmRlZC52YWx1ZSA9PSBVSW50NjQoMCk6CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMjkgLy8gInRyZWFzdXJ5X2Z1bmRlZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50cmVhc3VyeV9mdW5kZWQgZXhpc3RzCiAgICBieiBzdWJtaXRfdHJ1c3RlZV9kZWNpc2lvbl9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy50cnVzdF92YXJpYXRpb24uY29udHJhY3QuVHJ1c3RWYXJpYXRpb24uX3Jlc2VydmVfZXNjcm93QDEzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjI0MwogICAgLy8gYXZhaWxhYmxlID0gc2VsZi5fYXZhaWxhYmxlX2VzY3JvdygpCiAgICBjYWxsc3ViIF9hdmFpbGFibGVfZXNjcm93CiAgICBkdXAKICAgIGJ1cnkgMTEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MjQ0CiAgICAvLyBpZiBhdmFpbGFibGUgPj0gYW1vdW50OgogICAgZGlnIDEKICAgID49CiAgICBibnogc3VibWl0X3RydXN0ZWVfZGVjaXNpb25fYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMudHJ1c3RfdmFyaWF0aW9uLmNvbnRyYWN0LlRydXN0VmFyaWF0aW9uLl9yZXNlcnZlX2VzY3Jvd0AxMwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToyNDYKICAgIC8vIHNob3J0ZmFsbCA9IGFtb3VudCAtIGF2YWlsYWJsZQogICAgZHVwCiAgICBkaWcgMTAKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MjQ3LTI1NwogICAgLy8gIyBTZWxlY3RvcjogZHJhd19lc2Nyb3codWludDMyLHVpbnQzMix1aW50NjQpdm9pZAogICAgLy8gaXR4bi5BcHBsaWNhdGlvbkNhbGwoCiAgICAvLyAgICAgYXBwX2lkPUFwcGxpY2F0aW9uKHNlbGYuZXhwZXJpbWVudHNfYXBwLnZhbHVlKSwKICAgIC8vICAgICBhcHBfYXJncz0oCiAgICAvLyAgICAgICAgIEJ5dGVzKGIiXHg5NFx4NDJceDJlXHhmMyIpLAogICAgLy8gICAgICAgICBhcmM0LlVJbnQzMihzZWxmLmV4cF9pZC52YWx1ZSkuYnl0ZXMsCiAgICAvLyAgICAgICAgIGFyYzQuVUludDMyKHNlbGYudmFyX2lkLnZhbHVlKS5ieXRlcywKICAgIC8vICAgICAgICAgYXJjNC5VSW50NjQoc2hvcnRmYWxsKS5ieXRlcywKICAgIC8vICAgICApLAogICAgLy8gICAgIGZlZT0wLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToyNDkKICAgIC8vIGFwcF9pZD1BcHBsaWNhdGlvbihzZWxmLmV4cGVyaW1lbnRzX2FwcC52YWx1ZSksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTkgLy8gImV4cGVyaW1lbnRzX2FwcCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5leHBlcmltZW50c19hcHAgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjI1MgogICAgLy8gYXJjNC5VSW50MzIoc2VsZi5leHBfaWQudmFsdWUpLmJ5dGVzLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDMwIC8vICJleHBfaWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZXhwX2lkIGV4aXN0cwogICAgaXRvYgogICAgZHVwCiAgICBiaXRsZW4KICAgIGludGNfMiAvLyAzMgogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZXh0cmFjdCA0IDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MjUzCiAgICAvLyBhcmM0LlVJbnQzMihzZWxmLnZhcl9pZC52YWx1ZSkuYnl0ZXMsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMzEgLy8gInZhcl9pZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52YXJfaWQgZXhpc3RzCiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDQgNAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToyNTQKICAgIC8vIGFyYzQuVUludDY0KHNob3J0ZmFsbCkuYnl0ZXMsCiAgICBkaWcgMwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToyNTEKICAgIC8vIEJ5dGVzKGIiXHg5NFx4NDJceDJlXHhmMyIpLAogICAgcHVzaGJ5dGVzIDB4OTQ0MjJlZjMKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICB1bmNvdmVyIDIKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBzd2FwCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgZHVwCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgc3dhcAogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbklECiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjI0Ny0yNDgKICAgIC8vICMgU2VsZWN0b3I6IGRyYXdfZXNjcm93KHVpbnQzMix1aW50MzIsdWludDY0KXZvaWQKICAgIC8vIGl0eG4uQXBwbGljYXRpb25DYWxsKAogICAgcHVzaGludCA2IC8vIGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MjU2CiAgICAvLyBmZWU9MCwKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToyNDctMjU3CiAgICAvLyAjIFNlbGVjdG9yOiBkcmF3X2VzY3Jvdyh1aW50MzIsdWludDMyLHVpbnQ2NCl2b2lkCiAgICAvLyBpdHhuLkFwcGxpY2F0aW9uQ2FsbCgKICAgIC8vICAgICBhcHBfaWQ9QXBwbGljYXRpb24oc2VsZi5leHBlcmltZW50c19hcHAudmFsdWUpLAogICAgLy8gICAgIGFwcF9hcmdzPSgKICAgIC8vICAgICAgICAgQnl0ZXMoYiJceDk0XHg0Mlx4MmVceGYzIiksCiAgICAvLyAgICAgICAgIGFyYzQuVUludDMyKHNlbGYuZXhwX2lkLnZhbHVlKS5ieXRlcywKICAgIC8vICAgICAgICAgYXJjNC5VSW50MzIoc2VsZi52YXJfaWQudmFsdWUpLmJ5dGVzLAogICAgLy8gICAgICAgICBhcmM0LlVJbnQ2NChzaG9ydGZhbGwpLmJ5dGVzLAogICAgLy8gICAgICksCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToyNTgKICAgIC8vIHNlbGYuZXNjcm93X2RlcG9zaXRlZC52YWx1ZSArPSBzaG9ydGZhbGwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJlc2Nyb3dfZGVwb3NpdGVkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmVzY3Jvd19kZXBvc2l0ZWQgZXhpc3RzCiAgICB1bmNvdmVyIDIKICAgICsKICAgIGJ5dGVjXzMgLy8gImVzY3Jvd19kZXBvc2l0ZWQiCiAgICBkaWcgMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MjYwCiAgICAvLyBFc2Nyb3dEZXBvc2l0ZWQoYW1vdW50PWFyYzQuVUludDY0KHNob3J0ZmFsbCksIGRlcG9zaXRlZD1hcmM0LlVJbnQ2NChzZWxmLmVzY3Jvd19kZXBvc2l0ZWQudmFsdWUpKQogICAgaXRvYgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjI1OS0yNjEKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBFc2Nyb3dEZXBvc2l0ZWQoYW1vdW50PWFyYzQuVUludDY0KHNob3J0ZmFsbCksIGRlcG9zaXRlZD1hcmM0LlVJbnQ2NChzZWxmLmVzY3Jvd19kZXBvc2l0ZWQudmFsdWUpKQogICAgLy8gKQogICAgYnl0ZWMgMzIgLy8gbWV0aG9kICJFc2Nyb3dEZXBvc2l0ZWQodWludDY0LHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwoKc3VibWl0X3RydXN0ZWVfZGVjaXNpb25fYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMudHJ1c3RfdmFyaWF0aW9uLmNvbnRyYWN0LlRydXN0VmFyaWF0aW9uLl9yZXNlcnZlX2VzY3Jvd0AxMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NzcwCiAgICAvLyBpZiBzZWxmLnNldHRsZW1lbnRfbW9kZS52YWx1ZSA9PSBVSW50NjQoU0VUVExFTUVOVF9JTU1FRElBVEUpOgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE1IC8vICJzZXR0bGVtZW50X21vZGUiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc2V0dGxlbWVudF9tb2RlIGV4aXN0cwogICAgYm56IHN1Ym1pdF90cnVzdGVlX2RlY2lzaW9uX2Vsc2VfYm9keUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5Ojc3MQogICAgLy8gc2VsZi5fcGF5X21hdGNoKG1hdGNoX2lkLCBtYXRjaC5pbnZlc3Rvci5jb3B5KCksIG1hdGNoLnRydXN0ZWUuY29weSgpLCBpbnZlc3Rvcl9wYXlvdXQsIHRydXN0ZWVfcGF5b3V0KQogICAgZGlnIDUKICAgIGR1cAogICAgZXh0cmFjdCA0IDMyCiAgICBkaWcgMTAKICAgIHN3YXAKICAgIGRpZyA3CiAgICBkaWcgNgogICAgZGlnIDYKICAgIGNhbGxzdWIgX3BheV9tYXRjaAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo3NzIKICAgIC8vIG1hdGNoLnBhaWRfb3V0ID0gYXJjNC5VSW50OCgxKQogICAgYnl0ZWMgNiAvLyAweDAxCiAgICByZXBsYWNlMiAxMTcKICAgIGJ1cnkgNgoKc3VibWl0X3RydXN0ZWVfZGVjaXNpb25fYWZ0ZXJfaWZfZWxzZUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo3ODYKICAgIC8vIG1hdGNoLnBoYXNlID0gYXJjNC5VSW50OChQSEFTRV9DT01QTEVURUQpCiAgICBkaWcgNQogICAgYnl0ZWMgMzMgLy8gMHgwMgogICAgcmVwbGFjZTIgNjgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6Nzg3CiAgICAvLyBtYXRjaC5yZXR1cm5fYW1vdW50ID0gcmV0dXJuX2Ftb3VudAogICAgZGlnIDgKICAgIGR1cAogICAgY292ZXIgMgogICAgcmVwbGFjZTIgODUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6Nzg4CiAgICAvLyBtYXRjaC5pbnZlc3Rvcl9wYXlvdXQgPSBhcmM0LlVJbnQ2NChpbnZlc3Rvcl9wYXlvdXQpCiAgICBkaWcgNAogICAgZHVwCiAgICBjb3ZlciAzCiAgICBpdG9iCiAgICBzd2FwCiAgICBkaWcgMQogICAgcmVwbGFjZTIgOTMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6Nzg5CiAgICAvLyBtYXRjaC50cnVzdGVlX3BheW91dCA9IGFyYzQuVUludDY0KHRydXN0ZWVfcGF5b3V0KQogICAgZGlnIDUKICAgIGR1cAogICAgY292ZXIgNQogICAgaXRvYgogICAgc3dhcAogICAgZGlnIDEKICAgIHJlcGxhY2UyIDEwMQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo3OTAKICAgIC8vIG1hdGNoLmNvbXBsZXRlZF9hdCA9IGFyYzQuVUludDY0KEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wKQogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgaXRvYgogICAgcmVwbGFjZTIgMTA5CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5Ojc5MQogICAgLy8gc2VsZi5tYXRjaGVzW21hdGNoX2lkXSA9IG1hdGNoLmNvcHkoKQogICAgZGlnIDEyCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5Ojc5My03OTgKICAgIC8vIFRydXN0ZWVEZWNpZGVkKAogICAgLy8gICAgIG1hdGNoX2lkPW1hdGNoX2lkLAogICAgLy8gICAgIHJldHVybl9hbW91bnQ9cmV0dXJuX2Ftb3VudCwKICAgIC8vICAgICBpbnZlc3Rvcl9wYXlvdXQ9YXJjNC5VSW50NjQoaW52ZXN0b3JfcGF5b3V0KSwKICAgIC8vICAgICB0cnVzdGVlX3BheW91dD1hcmM0LlVJbnQ2NCh0cnVzdGVlX3BheW91dCksCiAgICAvLyApCiAgICBkaWcgMTMKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5Ojc5Mi03OTkKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBUcnVzdGVlRGVjaWRlZCgKICAgIC8vICAgICAgICAgbWF0Y2hfaWQ9bWF0Y2hfaWQsCiAgICAvLyAgICAgICAgIHJldHVybl9hbW91bnQ9cmV0dXJuX2Ftb3VudCwKICAgIC8vICAgICAgICAgaW52ZXN0b3JfcGF5b3V0PWFyYzQuVUludDY0KGludmVzdG9yX3BheW91dCksCiAgICAvLyAgICAgICAgIHRydXN0ZWVfcGF5b3V0PWFyYzQuVUludDY0KHRydXN0ZWVfcGF5b3V0KSwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHhhYjA0ZjgyMiAvLyBtZXRob2QgIlRydXN0ZWVEZWNpZGVkKHVpbnQzMix1aW50NjQsdWludDY0LHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo4MDEKICAgIC8vIHN0YXRzID0gc2VsZi5zdGF0cy52YWx1ZS5jb3B5KCkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxNiAvLyAic3RhdHMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3RhdHMgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjgwMgogICAgLy8gc3RhdHMuY29tcGxldGVkX2NvdW50ID0gYXJjNC5VSW50NjQoc3RhdHMuY29tcGxldGVkX2NvdW50LmFzX3VpbnQ2NCgpICsgVUludDY0KDEpKQogICAgZHVwCiAgICBwdXNoaW50IDggLy8gOAogICAgZXh0cmFjdF91aW50NjQKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBpdG9iCiAgICByZXBsYWNlMiA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjgwMwogICAgLy8gc3RhdHMuc3VtX3JldHVybiA9IGFyYzQuVUludDY0KHN0YXRzLnN1bV9yZXR1cm4uYXNfdWludDY0KCkgKyByKQogICAgZHVwCiAgICBwdXNoaW50IDQwIC8vIDQwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZGlnIDcKICAgIGR1cAogICAgY292ZXIgMwogICAgKwogICAgaXRvYgogICAgcmVwbGFjZTIgNDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6ODA0CiAgICAvLyBzdGF0cy5zdW1zcV9yZXR1cm4gPSBfYWRkX3NxdWFyZShzdGF0cy5zdW1zcV9yZXR1cm4sIHIpCiAgICBkdXAKICAgIGV4dHJhY3QgNDggMTYKICAgIHVuY292ZXIgMgogICAgY2FsbHN1YiBfYWRkX3NxdWFyZQogICAgcmVwbGFjZTIgNDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6ODA1CiAgICAvLyBzdGF0cy5zdW1faW52ZXN0b3JfcGF5b3V0ID0gYXJjNC5VSW50NjQoc3RhdHMuc3VtX2ludmVzdG9yX3BheW91dC5hc191aW50NjQoKSArIGludmVzdG9yX3BheW91dCkKICAgIGR1cAogICAgcHVzaGludCA2NCAvLyA2NAogICAgZXh0cmFjdF91aW50NjQKICAgIGRpZyAyCiAgICArCiAgICBpdG9iCiAgICByZXBsYWNlMiA2NAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo4MDYKICAgIC8vIHN0YXRzLnN1bXNxX2ludmVzdG9yX3BheW91dCA9IF9hZGRfc3F1YXJlKHN0YXRzLnN1bXNxX2ludmVzdG9yX3BheW91dCwgaW52ZXN0b3JfcGF5b3V0KQogICAgZHVwCiAgICBleHRyYWN0IDcyIDE2CiAgICB1bmNvdmVyIDIKICAgIGNhbGxzdWIgX2FkZF9zcXVhcmUKICAgIHJlcGxhY2UyIDcyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjgwNwogICAgLy8gc3RhdHMuc3VtX3RydXN0ZWVfcGF5b3V0ID0gYXJjNC5VSW50NjQoc3RhdHMuc3VtX3RydXN0ZWVfcGF5b3V0LmFzX3VpbnQ2NCgpICsgdHJ1c3RlZV9wYXlvdXQpCiAgICBkdXAKICAgIHB1c2hpbnQgODggLy8gODgKICAgIGV4dHJhY3RfdWludDY0CiAgICBkaWcgMgogICAgKwogICAgaXRvYgogICAgcmVwbGFjZTIgODgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6ODA4CiAgICAvLyBzdGF0cy5zdW1zcV90cnVzdGVlX3BheW91dCA9IF9hZGRfc3F1YXJlKHN0YXRzLnN1bXNxX3RydXN0ZWVfcGF5b3V0LCB0cnVzdGVlX3BheW91dCkKICAgIGR1cAogICAgZXh0cmFjdCA5NiAxNgogICAgdW5jb3ZlciAyCiAgICBjYWxsc3ViIF9hZGRfc3F1YXJlCiAgICByZXBsYWNlMiA5NgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo4MDkKICAgIC8vIHNlbGYuc3RhdHMudmFsdWUgPSBzdGF0cy5jb3B5KCkKICAgIGJ5dGVjIDE2IC8vICJzdGF0cyIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5Ojc0OAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgpzdWJtaXRfdHJ1c3RlZV9kZWNpc2lvbl9lbHNlX2JvZHlAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6Nzc0CiAgICAvLyBhc3NlcnQgc2VsZi5fYXZhaWxhYmxlX2VzY3JvdygpID49IGludmVzdG9yX3BheW91dCArIHRydXN0ZWVfcGF5b3V0LCAiSW5zdWZmaWNpZW50IGVzY3JvdyIKICAgIGNhbGxzdWIgX2F2YWlsYWJsZV9lc2Nyb3cKICAgIGRpZyAxCiAgICBkdXAKICAgIGNvdmVyIDIKICAgID49CiAgICBhc3NlcnQgLy8gSW5zdWZmaWNpZW50IGVzY3JvdwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo3NzUKICAgIC8vIHNlbGYuZXNjcm93X3BlbmRpbmcudmFsdWUgKz0gaW52ZXN0b3JfcGF5b3V0ICsgdHJ1c3RlZV9wYXlvdXQKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA4IC8vICJlc2Nyb3dfcGVuZGluZyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5lc2Nyb3dfcGVuZGluZyBleGlzdHMKICAgICsKICAgIGJ5dGVjIDggLy8gImVzY3Jvd19wZW5kaW5nIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6Nzc2CiAgICAvLyBpZiBzZWxmLnNldHRsZW1lbnRfbW9kZS52YWx1ZSA9PSBVSW50NjQoU0VUVExFTUVOVF9DTEFJTSk6CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTUgLy8gInNldHRsZW1lbnRfbW9kZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zZXR0bGVtZW50X21vZGUgZXhpc3RzCiAgICBpbnRjXzMgLy8gMgogICAgPT0KICAgIGJ6IHN1Ym1pdF90cnVzdGVlX2RlY2lzaW9uX2Vsc2VfYm9keUA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5Ojc3Ny03NzgKICAgIC8vICMgUmVsZWFzZWQgdG8gdGhlIGNsYWltIGxlZGdlcjsgZnVuZHMgbGVhdmUgb24gY2xhaW0oKQogICAgLy8gc2VsZi5fY3JlZGl0KG1hdGNoLmludmVzdG9yLmNvcHkoKSwgaW52ZXN0b3JfcGF5b3V0KQogICAgZGlnIDUKICAgIGR1cAogICAgZXh0cmFjdCA0IDMyCiAgICBkaWcgNAogICAgY2FsbHN1YiBfY3JlZGl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5Ojc3OQogICAgLy8gc2VsZi5fY3JlZGl0KG1hdGNoLnRydXN0ZWUuY29weSgpLCB0cnVzdGVlX3BheW91dCkKICAgIGRpZyA1CiAgICBkaWcgMwogICAgY2FsbHN1YiBfY3JlZGl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5Ojc4MAogICAgLy8gc2VsZi5wYWlkX291dF9jb3VudC52YWx1ZSArPSBVSW50NjQoMSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMyAvLyAicGFpZF9vdXRfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucGFpZF9vdXRfY291bnQgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnl0ZWMgMTMgLy8gInBhaWRfb3V0X2NvdW50IgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NzgxCiAgICAvLyBtYXRjaC5wYWlkX291dCA9IGFyYzQuVUludDgoMSkKICAgIGJ5dGVjIDYgLy8gMHgwMQogICAgcmVwbGFjZTIgMTE3CiAgICBidXJ5IDYKICAgIGIgc3VibWl0X3RydXN0ZWVfZGVjaXNpb25fYWZ0ZXJfaWZfZWxzZUA3CgpzdWJtaXRfdHJ1c3RlZV9kZWNpc2lvbl9lbHNlX2JvZHlANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NzgzLTc4NAogICAgLy8gIyBSZWNvcmQgb25seTsgc2V0dGxlKCkgc2VuZHMgdGhlIHBheW91dHMgbGF0ZXIKICAgIC8vIG1hdGNoLnBhaWRfb3V0ID0gYXJjNC5VSW50OCgwKQogICAgZGlnIDUKICAgIGJ5dGVjIDEyIC8vIDB4MDAKICAgIHJlcGxhY2UyIDExNwogICAgYnVyeSA2CiAgICBiIHN1Ym1pdF90cnVzdGVlX2RlY2lzaW9uX2FmdGVyX2lmX2Vsc2VANwoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50cnVzdF92YXJpYXRpb24uY29udHJhY3QuVHJ1c3RWYXJpYXRpb24uc2V0dGxlW3JvdXRpbmddKCkgLT4gdm9pZDoKc2V0dGxlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo4MTEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwbiAyCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBkdXAKICAgIHB1c2hpbnQgNCAvLyA0CiAgICAqCiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgdW5jb3ZlciAyCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6ODE3CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLm93bmVyLnZhbHVlLCAiTm90IG93bmVyIgogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gIm93bmVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm93bmVyIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBOb3Qgb3duZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6ODE4CiAgICAvLyBhc3NlcnQgbWF0Y2hfaWRzLmxlbmd0aCA8PSBVSW50NjQoTUFYX1NFVFRMRV9QRVJfQ0FMTCksICJUb28gbWFueSBtYXRjaGVzIgogICAgaW50Y18yIC8vIDMyCiAgICA8PQogICAgYXNzZXJ0IC8vIFRvbyBtYW55IG1hdGNoZXMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6ODE5CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UobWF0Y2hfaWRzLmxlbmd0aCk6CiAgICBpbnRjXzAgLy8gMAoKc2V0dGxlX2Zvcl9oZWFkZXJAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6ODE5CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UobWF0Y2hfaWRzLmxlbmd0aCk6CiAgICBkdXAKICAgIGRpZyAyCiAgICA8CiAgICBieiBzZXR0bGVfYWZ0ZXJfZm9yQDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6ODIwCiAgICAvLyBtYXRjaF9pZCA9IG1hdGNoX2lkc1tpXQogICAgZGlnIDIKICAgIGV4dHJhY3QgMiAwCiAgICBkaWcgMQogICAgZHVwCiAgICBjb3ZlciAyCiAgICBwdXNoaW50IDQgLy8gNAogICAgKgogICAgcHVzaGludCA0IC8vIDQKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBpbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo4MjEKICAgIC8vIGFzc2VydCBtYXRjaF9pZCBpbiBzZWxmLm1hdGNoZXMsICJNYXRjaCBub3QgZm91bmQiCiAgICBieXRlYyAxMSAvLyAweDZkNWYKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gTWF0Y2ggbm90IGZvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjgyMgogICAgLy8gbWF0Y2ggPSBzZWxmLm1hdGNoZXNbbWF0Y2hfaWRdLmNvcHkoKQogICAgZHVwCiAgICBib3hfZ2V0CiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6ODIzCiAgICAvLyBhc3NlcnQgbWF0Y2gucGhhc2UgPT0gYXJjNC5VSW50OChQSEFTRV9DT01QTEVURUQpLCAiTWF0Y2ggbm90IGNvbXBsZXRlZCIKICAgIGR1cAogICAgZXh0cmFjdCA2OCAxCiAgICBieXRlYyAzMyAvLyAweDAyCiAgICBiPT0KICAgIGFzc2VydCAvLyBNYXRjaCBub3QgY29tcGxldGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjgyNAogICAgLy8gYXNzZXJ0IG1hdGNoLnBhaWRfb3V0ID09IGFyYzQuVUludDgoMCksICJBbHJlYWR5IHBhaWQgb3V0IgogICAgZHVwCiAgICBleHRyYWN0IDExNyAxCiAgICBieXRlYyAxMiAvLyAweDAwCiAgICBiPT0KICAgIGFzc2VydCAvLyBBbHJlYWR5IHBhaWQgb3V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjgyNgogICAgLy8gaW52ZXN0b3JfcGF5b3V0ID0gbWF0Y2guaW52ZXN0b3JfcGF5b3V0LmFzX3VpbnQ2NCgpCiAgICBkdXAKICAgIHB1c2hpbnQgOTMgLy8gOTMKICAgIGV4dHJhY3RfdWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjgyNwogICAgLy8gdHJ1c3RlZV9wYXlvdXQgPSBtYXRjaC50cnVzdGVlX3BheW91dC5hc191aW50NjQoKQogICAgZGlnIDEKICAgIHB1c2hpbnQgMTAxIC8vIDEwMQogICAgZXh0cmFjdF91aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6ODI4CiAgICAvLyBzZWxmLl9wYXlfbWF0Y2gobWF0Y2hfaWQsIG1hdGNoLmludmVzdG9yLmNvcHkoKSwgbWF0Y2gudHJ1c3RlZS5jb3B5KCksIGludmVzdG9yX3BheW91dCwgdHJ1c3RlZV9wYXlvdXQpCiAgICBkaWcgMgogICAgZXh0cmFjdCA0IDMyCiAgICB1bmNvdmVyIDMKICAgIGV4dHJhY3QgMzYgMzIKICAgIHVuY292ZXIgNQogICAgY292ZXIgMgogICAgZGlnIDQKICAgIGRpZyA0CiAgICBjYWxsc3ViIF9wYXlfbWF0Y2gKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6ODI5CiAgICAvLyBzZWxmLmVzY3Jvd19wZW5kaW5nLnZhbHVlIC09IGludmVzdG9yX3BheW91dCArIHRydXN0ZWVfcGF5b3V0CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOCAvLyAiZXNjcm93X3BlbmRpbmciCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZXNjcm93X3BlbmRpbmcgZXhpc3RzCiAgICBjb3ZlciAyCiAgICArCiAgICAtCiAgICBieXRlYyA4IC8vICJlc2Nyb3dfcGVuZGluZyIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjgzMS04MzIKICAgIC8vIG1hdGNoLnBhaWRfb3V0ID0gYXJjNC5VSW50OCgxKQogICAgLy8gc2VsZi5tYXRjaGVzW21hdGNoX2lkXSA9IG1hdGNoLmNvcHkoKQogICAgcHVzaGludCAxMTcgLy8gMTE3CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjgzMQogICAgLy8gbWF0Y2gucGFpZF9vdXQgPSBhcmM0LlVJbnQ4KDEpCiAgICBieXRlYyA2IC8vIDB4MDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6ODMxLTgzMgogICAgLy8gbWF0Y2gucGFpZF9vdXQgPSBhcmM0LlVJbnQ4KDEpCiAgICAvLyBzZWxmLm1hdGNoZXNbbWF0Y2hfaWRdID0gbWF0Y2guY29weSgpCiAgICBib3hfcmVwbGFjZQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo4MTkKICAgIC8vIGZvciBpIGluIHVyYW5nZShtYXRjaF9pZHMubGVuZ3RoKToKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBidXJ5IDEKICAgIGIgc2V0dGxlX2Zvcl9oZWFkZXJAMgoKc2V0dGxlX2FmdGVyX2ZvckA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo4MTEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50cnVzdF92YXJpYXRpb24uY29udHJhY3QuVHJ1c3RWYXJpYXRpb24uY2xhaW1bcm91dGluZ10oKSAtPiB2b2lkOgpjbGFpbToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6ODM3CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciBpbiBzZWxmLmNsYWltYWJsZSwgIk5vdGhpbmcgdG8gY2xhaW0iCiAgICBieXRlYyAyNSAvLyAweDYzNWYKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gTm90aGluZyB0byBjbGFpbQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo4MzgKICAgIC8vIGFtb3VudCA9IHNlbGYuY2xhaW1hYmxlW1R4bi5zZW5kZXJdLmFzX3VpbnQ2NCgpCiAgICBieXRlYyAyNSAvLyAweDYzNWYKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY2xhaW1hYmxlIGVudHJ5IGV4aXN0cwogICAgZHVwCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjgzOQogICAgLy8gZGVsIHNlbGYuY2xhaW1hYmxlW1R4bi5zZW5kZXJdCiAgICBieXRlYyAyNSAvLyAweDYzNWYKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgYm94X2RlbAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5Ojg0MAogICAgLy8gc2VsZi5jbGFpbV9tYnJfcmVmdW5kLnZhbHVlICs9IFVJbnQ2NChDTEFJTV9NQlIpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTAgLy8gImNsYWltX21icl9yZWZ1bmQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY2xhaW1fbWJyX3JlZnVuZCBleGlzdHMKICAgIHB1c2hpbnQgMTkzMDAgLy8gMTkzMDAKICAgICsKICAgIGJ5dGVjIDEwIC8vICJjbGFpbV9tYnJfcmVmdW5kIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6ODQyCiAgICAvLyBzZWxmLl9zZW5kX3BheW91dChUeG4uc2VuZGVyLCBhbW91bnQpCiAgICB0eG4gU2VuZGVyCiAgICBkaWcgMQogICAgY2FsbHN1YiBfc2VuZF9wYXlvdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6ODQzCiAgICAvLyBzZWxmLmVzY3Jvd19wYWlkX291dC52YWx1ZSArPSBhbW91bnQKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxNCAvLyAiZXNjcm93X3BhaWRfb3V0IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmVzY3Jvd19wYWlkX291dCBleGlzdHMKICAgIGRpZyAxCiAgICArCiAgICBieXRlYyAxNCAvLyAiZXNjcm93X3BhaWRfb3V0IgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6ODQ0CiAgICAvLyBzZWxmLmVzY3Jvd19wZW5kaW5nLnZhbHVlIC09IGFtb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDggLy8gImVzY3Jvd19wZW5kaW5nIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmVzY3Jvd19wZW5kaW5nIGV4aXN0cwogICAgc3dhcAogICAgLQogICAgYnl0ZWMgOCAvLyAiZXNjcm93X3BlbmRpbmciCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo4NDUKICAgIC8vIGFyYzQuZW1pdChQYXlvdXRDbGFpbWVkKGFkZHI9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLCBhbW91bnQ9YXJjNC5VSW50NjQoYW1vdW50KSkpCiAgICB0eG4gU2VuZGVyCiAgICBkaWcgMQogICAgY29uY2F0CiAgICBwdXNoYnl0ZXMgMHhiZmM3MDJjMSAvLyBtZXRob2QgIlBheW91dENsYWltZWQoYWRkcmVzcyx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6ODM0CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGJ5dGVjXzEgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMudHJ1c3RfdmFyaWF0aW9uLmNvbnRyYWN0LlRydXN0VmFyaWF0aW9uLndpdGhkcmF3X2VzY3Jvd1tyb3V0aW5nXSgpIC0+IHZvaWQ6CndpdGhkcmF3X2VzY3JvdzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6ODk5CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLm93bmVyLnZhbHVlLCAiTm90IG93bmVyIgogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gIm93bmVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm93bmVyIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBOb3Qgb3duZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6OTAwCiAgICAvLyBhc3NlcnQgc2VsZi5wYWlkX291dF9jb3VudC52YWx1ZSA9PSBzZWxmLm1hdGNoX2NvdW50LnZhbHVlLCAiTWF0Y2hlcyBub3QgYWxsIHBhaWQgb3V0IgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEzIC8vICJwYWlkX291dF9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wYWlkX291dF9jb3VudCBleGlzdHMKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0IC8vICJtYXRjaF9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5tYXRjaF9jb3VudCBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gTWF0Y2hlcyBub3QgYWxsIHBhaWQgb3V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjkwMgogICAgLy8gcmVtYWluaW5nID0gc2VsZi5fYXZhaWxhYmxlX2VzY3JvdygpCiAgICBjYWxsc3ViIF9hdmFpbGFibGVfZXNjcm93CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjkwMwogICAgLy8gYXNzZXJ0IHJlbWFpbmluZyA+IFVJbnQ2NCgwKSwgIk5vIHJlbWFpbmluZyBlc2Nyb3ciCiAgICBkdXAKICAgIGFzc2VydCAvLyBObyByZW1haW5pbmcgZXNjcm93CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjkwNQogICAgLy8gc2VsZi5fc2VuZF9wYXlvdXQoc2VsZi5vd25lci52YWx1ZSwgcmVtYWluaW5nKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gIm93bmVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm93bmVyIGV4aXN0cwogICAgZGlnIDEKICAgIGNhbGxzdWIgX3NlbmRfcGF5b3V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjkwNgogICAgLy8gc2VsZi5lc2Nyb3dfZGVwb3NpdGVkLnZhbHVlIC09IHJlbWFpbmluZwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gImVzY3Jvd19kZXBvc2l0ZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZXNjcm93X2RlcG9zaXRlZCBleGlzdHMKICAgIGRpZyAxCiAgICAtCiAgICBieXRlY18zIC8vICJlc2Nyb3dfZGVwb3NpdGVkIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6OTA3CiAgICAvLyBhcmM0LmVtaXQoRXNjcm93V2l0aGRyYXduKHJlY2VpdmVyPWFyYzQuQWRkcmVzcyhzZWxmLm93bmVyLnZhbHVlKSwgYW1vdW50PWFyYzQuVUludDY0KHJlbWFpbmluZykpKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gIm93bmVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm93bmVyIGV4aXN0cwogICAgc3dhcAogICAgaXRvYgogICAgY29uY2F0CiAgICBwdXNoYnl0ZXMgMHhjN2U3ZDFhMyAvLyBtZXRob2QgIkVzY3Jvd1dpdGhkcmF3bihhZGRyZXNzLHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo4OTcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50cnVzdF92YXJpYXRpb24uY29udHJhY3QuVHJ1c3RWYXJpYXRpb24uZ2V0X2NvbmZpZ1tyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9jb25maWc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjkxNQogICAgLy8gcmV0dXJuIHNlbGYuX2NvbmZpZygpCiAgICBjYWxsc3ViIF9jb25maWcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6OTEzCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzEgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMudHJ1c3RfdmFyaWF0aW9uLmNvbnRyYWN0LlRydXN0VmFyaWF0aW9uLmdldF9wbGF5ZXJfc3RhdGVbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfcGxheWVyX3N0YXRlOgogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6OTE3CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo5MjMKICAgIC8vIGluZm8gPSBQYXJ0aWNpcGFudEluZm8oZW5yb2xsZWQ9YXJjNC5VSW50OCgwKSwgYXNzaWduZWQ9YXJjNC5VSW50OCgwKSwgbWF0Y2hfaWQ9YXJjNC5VSW50MzIoMCkpCiAgICBwdXNoYnl0ZXMgMHgwMDAwMDAwMDAwMDAKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6OTI0CiAgICAvLyBoYXNfbWF0Y2ggPSBhcmM0LlVJbnQ4KDApCiAgICBieXRlYyAxMiAvLyAweDAwCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjkyNS05MzcKICAgIC8vIG1hdGNoID0gTWF0Y2goCiAgICAvLyAgICAgbWF0Y2hfaWQ9YXJjNC5VSW50MzIoMCksCiAgICAvLyAgICAgaW52ZXN0b3I9YXJjNC5BZGRyZXNzKCksCiAgICAvLyAgICAgdHJ1c3RlZT1hcmM0LkFkZHJlc3MoKSwKICAgIC8vICAgICBwaGFzZT1hcmM0LlVJbnQ4KDApLAogICAgLy8gICAgIGNyZWF0ZWRfYXQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgaW52ZXN0bWVudD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICByZXR1cm5fYW1vdW50PWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIGludmVzdG9yX3BheW91dD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICB0cnVzdGVlX3BheW91dD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBjb21wbGV0ZWRfYXQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgcGFpZF9vdXQ9YXJjNC5VSW50OCgwKSwKICAgIC8vICkKICAgIHB1c2hieXRlcyBiYXNlMzIoQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBKQogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo5MzgKICAgIC8vIGlmIGFkZHIgaW4gc2VsZi5wYXJ0aWNpcGFudHM6CiAgICBieXRlYyA1IC8vIDB4NzA1ZgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYnogZ2V0X3BsYXllcl9zdGF0ZV9hZnRlcl9pZl9lbHNlQDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6OTM5CiAgICAvLyBpbmZvID0gc2VsZi5wYXJ0aWNpcGFudHNbYWRkcl0KICAgIGR1cAogICAgYm94X2dldAogICAgc3dhcAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBidXJ5IDYKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBhcnRpY2lwYW50cyBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6OTQwCiAgICAvLyBpZiBpbmZvLmFzc2lnbmVkID09IGFyYzQuVUludDgoMSkgYW5kIGluZm8ubWF0Y2hfaWQgaW4gc2VsZi5tYXRjaGVzOgogICAgZXh0cmFjdCAxIDEKICAgIGJ5dGVjIDYgLy8gMHgwMQogICAgYj09CiAgICBieiBnZXRfcGxheWVyX3N0YXRlX2FmdGVyX2lmX2Vsc2VANgogICAgZGlnIDMKICAgIGV4dHJhY3QgMiA0CiAgICBieXRlYyAxMSAvLyAweDZkNWYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBidXJ5IDYKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYnogZ2V0X3BsYXllcl9zdGF0ZV9hZnRlcl9pZl9lbHNlQDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6OTQxCiAgICAvLyBoYXNfbWF0Y2ggPSBhcmM0LlVJbnQ4KDEpCiAgICBieXRlYyA2IC8vIDB4MDEKICAgIGJ1cnkgMwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo5NDIKICAgIC8vIG1hdGNoID0gc2VsZi5tYXRjaGVzW2luZm8ubWF0Y2hfaWRdLmNvcHkoKQogICAgZGlnIDQKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGJ1cnkgMwogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWF0Y2hlcyBlbnRyeSBleGlzdHMKCmdldF9wbGF5ZXJfc3RhdGVfYWZ0ZXJfaWZfZWxzZUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo5NDgKICAgIC8vIGNvbmZpZz1zZWxmLl9jb25maWcoKSwKICAgIGNhbGxzdWIgX2NvbmZpZwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo5NDQtOTQ5CiAgICAvLyByZXR1cm4gUGxheWVyU3RhdGUoCiAgICAvLyAgICAgcGFydGljaXBhbnQ9aW5mbywKICAgIC8vICAgICBoYXNfbWF0Y2g9aGFzX21hdGNoLAogICAgLy8gICAgIG1hdGNoPW1hdGNoLmNvcHkoKSwKICAgIC8vICAgICBjb25maWc9c2VsZi5fY29uZmlnKCksCiAgICAvLyApCiAgICBkaWcgNAogICAgZGlnIDQKICAgIGNvbmNhdAogICAgZGlnIDMKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjkxNwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlY18xIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnRydXN0X3ZhcmlhdGlvbi5jb250cmFjdC5UcnVzdFZhcmlhdGlvbi5nZXRfbWF0Y2hbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfbWF0Y2g6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5Ojk2MwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCA0IC8vIDQKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDMyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5Ojk2NQogICAgLy8gYXNzZXJ0IG1hdGNoX2lkIGluIHNlbGYubWF0Y2hlcywgIk1hdGNoIG5vdCBmb3VuZCIKICAgIGJ5dGVjIDExIC8vIDB4NmQ1ZgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIE1hdGNoIG5vdCBmb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo5NjYKICAgIC8vIHJldHVybiBzZWxmLm1hdGNoZXNbbWF0Y2hfaWRdLmNvcHkoKQogICAgYm94X2dldAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5Ojk2MwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlY18xIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnRydXN0X3ZhcmlhdGlvbi5jb250cmFjdC5UcnVzdFZhcmlhdGlvbi5nZXRfbWF0Y2hlc1tyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9tYXRjaGVzOgogICAgaW50Y18wIC8vIDAKICAgIGR1cAogICAgcHVzaGJ5dGVzICIiCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5Ojk2OAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCA0IC8vIDQKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDMyCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCA0IC8vIDQKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDMyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5Ojk3NQogICAgLy8gZW5kID0gc3RhcnQuYXNfdWludDY0KCkgKyBjb3VudC5hc191aW50NjQoKQogICAgc3dhcAogICAgYnRvaQogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIGJ0b2kKICAgIHN3YXAKICAgIGRpZyAxCiAgICArCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5Ojk3NgogICAgLy8gaWYgY291bnQuYXNfdWludDY0KCkgPiBVSW50NjQoTUFUQ0hFU19QQUdFX1NJWkUpOgogICAgcHVzaGludCA4IC8vIDgKICAgID4KICAgIGJ6IGdldF9tYXRjaGVzX2FmdGVyX2lmX2Vsc2VAMwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo5NzcKICAgIC8vIGVuZCA9IHN0YXJ0LmFzX3VpbnQ2NCgpICsgVUludDY0KE1BVENIRVNfUEFHRV9TSVpFKQogICAgZGlnIDEKICAgIHB1c2hpbnQgOCAvLyA4CiAgICArCiAgICBidXJ5IDEKCmdldF9tYXRjaGVzX2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6OTc4CiAgICAvLyBpZiBlbmQgPiBzZWxmLm1hdGNoX2NvdW50LnZhbHVlOgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gIm1hdGNoX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1hdGNoX2NvdW50IGV4aXN0cwogICAgZGlnIDEKICAgIDwKICAgIGJ6IGdldF9tYXRjaGVzX2FmdGVyX2lmX2Vsc2VANQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo5NzkKICAgIC8vIGVuZCA9IHNlbGYubWF0Y2hfY291bnQudmFsdWUKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0IC8vICJtYXRjaF9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBzd2FwCiAgICBidXJ5IDIKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1hdGNoX2NvdW50IGV4aXN0cwoKZ2V0X21hdGNoZXNfYWZ0ZXJfaWZfZWxzZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo5ODEKICAgIC8vIHBhZ2UgPSBhcmM0LkR5bmFtaWNBcnJheVtNYXRjaF0oKQogICAgcHVzaGJ5dGVzIDB4MDAwMAogICAgYnVyeSA0CiAgICBkaWcgMQogICAgYnVyeSAzCgpnZXRfbWF0Y2hlc19mb3JfaGVhZGVyQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5Ojk4MgogICAgLy8gZm9yIG1hdGNoX2lkIGluIHVyYW5nZShzdGFydC5hc191aW50NjQoKSwgZW5kKToKICAgIGRpZyAyCiAgICBkaWcgMQogICAgPAogICAgYnogZ2V0X21hdGNoZXNfYWZ0ZXJfZm9yQDExCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5Ojk4MwogICAgLy8gaWYgYXJjNC5VSW50MzIobWF0Y2hfaWQpIGluIHNlbGYubWF0Y2hlczoKICAgIGRpZyAyCiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDQgNAogICAgYnl0ZWMgMTEgLy8gMHg2ZDVmCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYnVyeSA2CiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGJ6IGdldF9tYXRjaGVzX2FmdGVyX2lmX2Vsc2VAOQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo5ODQKICAgIC8vIHBhZ2UuYXBwZW5kKHNlbGYubWF0Y2hlc1thcmM0LlVJbnQzMihtYXRjaF9pZCldLmNvcHkoKSkKICAgIGRpZyA0CiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5tYXRjaGVzIGVudHJ5IGV4aXN0cwogICAgZGlnIDQKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQgLy8gb24gZXJyb3I6IG1heCBhcnJheSBsZW5ndGggZXhjZWVkZWQKICAgIHN3YXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICByZXBsYWNlMiAwCiAgICBidXJ5IDQKCmdldF9tYXRjaGVzX2FmdGVyX2lmX2Vsc2VAOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6OTgyCiAgICAvLyBmb3IgbWF0Y2hfaWQgaW4gdXJhbmdlKHN0YXJ0LmFzX3VpbnQ2NCgpLCBlbmQpOgogICAgZGlnIDIKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBidXJ5IDMKICAgIGIgZ2V0X21hdGNoZXNfZm9yX2hlYWRlckA2CgpnZXRfbWF0Y2hlc19hZnRlcl9mb3JAMTE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5Ojk2OAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlY18xIC8vIDB4MTUxZjdjNzUKICAgIGRpZyA0CiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50cnVzdF92YXJpYXRpb24uY29udHJhY3QuVHJ1c3RWYXJpYXRpb24uZ2V0X3BsYXllcl9tYXRjaFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9wbGF5ZXJfbWF0Y2g6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5Ojk4NwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6OTg5CiAgICAvLyBhc3NlcnQgYWRkciBpbiBzZWxmLnBhcnRpY2lwYW50cywgIk5vIGFjdGl2ZSBtYXRjaCIKICAgIGJ5dGVjIDUgLy8gMHg3MDVmCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gTm8gYWN0aXZlIG1hdGNoCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5Ojk5MAogICAgLy8gaW5mbyA9IHNlbGYucGFydGljaXBhbnRzW2FkZHJdLmNvcHkoKQogICAgYm94X2dldAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5Ojk5MQogICAgLy8gYXNzZXJ0IGluZm8uYXNzaWduZWQgPT0gYXJjNC5VSW50OCgxKSwgIk5vIGFjdGl2ZSBtYXRjaCIKICAgIGR1cAogICAgZXh0cmFjdCAxIDEKICAgIGJ5dGVjIDYgLy8gMHgwMQogICAgYj09CiAgICBhc3NlcnQgLy8gTm8gYWN0aXZlIG1hdGNoCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5Ojk5MgogICAgLy8gcmV0dXJuIGluZm8ubWF0Y2hfaWQKICAgIGV4dHJhY3QgMiA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5Ojk4NwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlY18xIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnRydXN0X3ZhcmlhdGlvbi5jb250cmFjdC5UcnVzdFZhcmlhdGlvbi5nZXRfcm9zdGVyX2ZsYWdzW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X3Jvc3Rlcl9mbGFnczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6OTk0CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDQgLy8gNAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50MzIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6OTk3CiAgICAvLyByZXR1cm4gYXJjNC5VSW50OChzZWxmLl9yb3N0ZXJfZmxhZ3ModXNlcl9pZC5hc191aW50NjQoKSkpCiAgICBidG9pCiAgICBjYWxsc3ViIF9yb3N0ZXJfZmxhZ3MKICAgIGl0b2IKICAgIGR1cAogICAgYml0bGVuCiAgICBwdXNoaW50IDggLy8gOAogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZXh0cmFjdCA3IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6OTk0CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzEgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMudHJ1c3RfdmFyaWF0aW9uLmNvbnRyYWN0LlRydXN0VmFyaWF0aW9uLmdldF9yb3N0ZXJfY291bnRbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfcm9zdGVyX2NvdW50OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxMDAxCiAgICAvLyByZXR1cm4gYXJjNC5VSW50NjQoc2VsZi5yb3N0ZXJfY291bnQudmFsdWUpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTcgLy8gInJvc3Rlcl9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yb3N0ZXJfY291bnQgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5Ojk5OQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlY18xIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnRydXN0X3ZhcmlhdGlvbi5jb250cmFjdC5UcnVzdFZhcmlhdGlvbi5nZXRfc3RhdHNbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfc3RhdHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjEwMDUKICAgIC8vIHJldHVybiBzZWxmLnN0YXRzLnZhbHVlLmNvcHkoKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE2IC8vICJzdGF0cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdGF0cyBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTAwMwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlY18xIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnRydXN0X3ZhcmlhdGlvbi5jb250cmFjdC5UcnVzdFZhcmlhdGlvbi5nZXRfY2xhaW1hYmxlW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X2NsYWltYWJsZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTAwNwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTAwOQogICAgLy8gaWYgYWRkciBpbiBzZWxmLmNsYWltYWJsZToKICAgIGJ5dGVjIDI1IC8vIDB4NjM1ZgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYnogZ2V0X2NsYWltYWJsZV9hZnRlcl9pZl9lbHNlQDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTAxMAogICAgLy8gcmV0dXJuIHNlbGYuY2xhaW1hYmxlW2FkZHJdCiAgICBkdXAKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNsYWltYWJsZSBlbnRyeSBleGlzdHMKCmdldF9jbGFpbWFibGVfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMudHJ1c3RfdmFyaWF0aW9uLmNvbnRyYWN0LlRydXN0VmFyaWF0aW9uLmdldF9jbGFpbWFibGVANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTAwNwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlY18xIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgpnZXRfY2xhaW1hYmxlX2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTAxMQogICAgLy8gcmV0dXJuIGFyYzQuVUludDY0KDApCiAgICBwdXNoYnl0ZXMgMHgwMDAwMDAwMDAwMDAwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjEwMDcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYiBnZXRfY2xhaW1hYmxlX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLnRydXN0X3ZhcmlhdGlvbi5jb250cmFjdC5UcnVzdFZhcmlhdGlvbi5nZXRfY2xhaW1hYmxlQDQKCgovLyBzbWFydF9jb250cmFjdHMudHJ1c3RfdmFyaWF0aW9uLmNvbnRyYWN0LlRydXN0VmFyaWF0aW9uLmdldF9wYXJ0aWNpcGFudF9jb3VudFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9wYXJ0aWNpcGFudF9jb3VudDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MTAxNQogICAgLy8gcmV0dXJuIGFyYzQuVUludDY0KHNlbGYucGFydGljaXBhbnRfY291bnQudmFsdWUpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNyAvLyAicGFydGljaXBhbnRfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucGFydGljaXBhbnRfY291bnQgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjEwMTMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50cnVzdF92YXJpYXRpb24uY29udHJhY3QuVHJ1c3RWYXJpYXRpb24uZ2V0X2VzY3Jvd19iYWxhbmNlW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X2VzY3Jvd19iYWxhbmNlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxMDE5CiAgICAvLyByZXR1cm4gYXJjNC5VSW50NjQoc2VsZi5fYXZhaWxhYmxlX2VzY3JvdygpKQogICAgY2FsbHN1YiBfYXZhaWxhYmxlX2VzY3JvdwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weToxMDE3CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzEgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMudHJ1c3RfdmFyaWF0aW9uLmNvbnRyYWN0LlRydXN0VmFyaWF0aW9uLl9yZWZ1bmRfbWJyKGFtb3VudDogdWludDY0KSAtPiB2b2lkOgpfcmVmdW5kX21icjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MzM4LTMzOQogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBfcmVmdW5kX21icihzZWxmLCBhbW91bnQ6IFVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTozNDEKICAgIC8vIGlmIGFtb3VudCA+IFVJbnQ2NCgwKToKICAgIGZyYW1lX2RpZyAtMQogICAgYnogX3JlZnVuZF9tYnJfYWZ0ZXJfaWZfZWxzZUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjM0Mi0zNDYKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1zZWxmLm93bmVyLnZhbHVlLAogICAgLy8gICAgIGFtb3VudD1hbW91bnQsCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjM0MwogICAgLy8gcmVjZWl2ZXI9c2VsZi5vd25lci52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJvd25lciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vd25lciBleGlzdHMKICAgIGZyYW1lX2RpZyAtMQogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MzQyCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjM0NQogICAgLy8gZmVlPTAsCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6MzQyLTM0NgogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPXNlbGYub3duZXIudmFsdWUsCiAgICAvLyAgICAgYW1vdW50PWFtb3VudCwKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CgpfcmVmdW5kX21icl9hZnRlcl9pZl9lbHNlQDM6CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudHJ1c3RfdmFyaWF0aW9uLmNvbnRyYWN0LlRydXN0VmFyaWF0aW9uLl9wYXJ0aWNpcGFudF9tYnIoKSAtPiB1aW50NjQ6Cl9wYXJ0aWNpcGFudF9tYnI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjM3OAogICAgLy8gaWYgc2VsZi5hdXRvX21hdGNoX2VuYWJsZWQudmFsdWUgPT0gVUludDY0KDEpOgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE4IC8vICJhdXRvX21hdGNoX2VuYWJsZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYXV0b19tYXRjaF9lbmFibGVkIGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBieiBfcGFydGljaXBhbnRfbWJyX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTozNzkKICAgIC8vIHJldHVybiBVSW50NjQoUEFSVElDSVBBTlRfTUJSICsgT1JERVJfQk9YX01CUikKICAgIHB1c2hpbnQgMzYyMDAgLy8gMzYyMDAKICAgIHJldHN1YgoKX3BhcnRpY2lwYW50X21icl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjM4MAogICAgLy8gcmV0dXJuIFVJbnQ2NChQQVJUSUNJUEFOVF9NQlIpCiAgICBpbnRjIDQgLy8gMTg1MDAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50cnVzdF92YXJpYXRpb24uY29udHJhY3QuVHJ1c3RWYXJpYXRpb24uX2NoZWNrX3NlbGZfZW5yb2xsKGFkZHI6IGJ5dGVzLCBtYnJfcGF5bWVudDogdWludDY0KSAtPiB2b2lkOgpfY2hlY2tfc2VsZl9lbnJvbGw6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjQ1MS00NTIKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX2NoZWNrX3NlbGZfZW5yb2xsKHNlbGYsIGFkZHI6IGFyYzQuQWRkcmVzcywgbWJyX3BheW1lbnQ6IGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uKSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjQ1MwogICAgLy8gYXNzZXJ0IHNlbGYuc3RhdHVzLnZhbHVlID09IFVJbnQ2NChTVEFUVVNfQUNUSVZFKSwgIk5vdCBhY3RpdmUiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAic3RhdHVzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnN0YXR1cyBleGlzdHMKICAgICEKICAgIGFzc2VydCAvLyBOb3QgYWN0aXZlCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjQ1NAogICAgLy8gYXNzZXJ0IGFkZHIgbm90IGluIHNlbGYucGFydGljaXBhbnRzLCAiQWxyZWFkeSBlbnJvbGxlZCIKICAgIGJ5dGVjIDUgLy8gMHg3MDVmCiAgICBmcmFtZV9kaWcgLTIKICAgIGNvbmNhdAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICAhCiAgICBhc3NlcnQgLy8gQWxyZWFkeSBlbnJvbGxlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo0NTUKICAgIC8vIHNlbGYuX2NoZWNrX2NhcGFjaXR5KFVJbnQ2NCgxKSkKICAgIGludGNfMSAvLyAxCiAgICBjYWxsc3ViIF9jaGVja19jYXBhY2l0eQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo0NTYKICAgIC8vIGFzc2VydCBtYnJfcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLCAiV3JvbmcgcmVjZWl2ZXIiCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBXcm9uZyByZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo0NTcKICAgIC8vIGFzc2VydCBtYnJfcGF5bWVudC5hbW91bnQgPj0gc2VsZi5fcGFydGljaXBhbnRfbWJyKCksICJJbnN1ZmZpY2llbnQgTUJSIgogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBBbW91bnQKICAgIGNhbGxzdWIgX3BhcnRpY2lwYW50X21icgogICAgPj0KICAgIGFzc2VydCAvLyBJbnN1ZmZpY2llbnQgTUJSCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudHJ1c3RfdmFyaWF0aW9uLmNvbnRyYWN0LlRydXN0VmFyaWF0aW9uLl9jaGVja19jYXBhY2l0eShhZGRlZDogdWludDY0KSAtPiB2b2lkOgpfY2hlY2tfY2FwYWNpdHk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjQ1OS00NjAKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX2NoZWNrX2NhcGFjaXR5KHNlbGYsIGFkZGVkOiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NDYyCiAgICAvLyBpZiBzZWxmLm1heF9wYXJ0aWNpcGFudHMudmFsdWUgPiBVSW50NjQoMCk6CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMjQgLy8gIm1heF9wYXJ0aWNpcGFudHMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWF4X3BhcnRpY2lwYW50cyBleGlzdHMKICAgIGJ6IF9jaGVja19jYXBhY2l0eV9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NDYzCiAgICAvLyBlbnJvbGxlZCA9IHNlbGYucGFydGljaXBhbnRfY291bnQudmFsdWUgKyBzZWxmLnJvc3Rlcl9jb3VudC52YWx1ZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDcgLy8gInBhcnRpY2lwYW50X2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBhcnRpY2lwYW50X2NvdW50IGV4aXN0cwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE3IC8vICJyb3N0ZXJfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucm9zdGVyX2NvdW50IGV4aXN0cwogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo0NjQKICAgIC8vIGFzc2VydCBlbnJvbGxlZCArIGFkZGVkIDw9IHNlbGYubWF4X3BhcnRpY2lwYW50cy52YWx1ZSwgIkZ1bGwiCiAgICBmcmFtZV9kaWcgLTEKICAgICsKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyNCAvLyAibWF4X3BhcnRpY2lwYW50cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5tYXhfcGFydGljaXBhbnRzIGV4aXN0cwogICAgPD0KICAgIGFzc2VydCAvLyBGdWxsCgpfY2hlY2tfY2FwYWNpdHlfYWZ0ZXJfaWZfZWxzZUAyOgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnRydXN0X3ZhcmlhdGlvbi5jb250cmFjdC5UcnVzdFZhcmlhdGlvbi5fcmVnaXN0cnlfdXNlcl9pZChhZGRyOiBieXRlcykgLT4gYnl0ZXM6Cl9yZWdpc3RyeV91c2VyX2lkOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo0NjYtNDY3CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9yZWdpc3RyeV91c2VyX2lkKHNlbGYsIGFkZHI6IGFyYzQuQWRkcmVzcykgLT4gYXJjNC5VSW50MzI6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NDY5LTQ3NgogICAgLy8gcmVzdWx0ID0gaXR4bi5BcHBsaWNhdGlvbkNhbGwoCiAgICAvLyAgICAgYXBwX2lkPUFwcGxpY2F0aW9uKHNlbGYucmVnaXN0cnlfYXBwLnZhbHVlKSwKICAgIC8vICAgICBhcHBfYXJncz0oCiAgICAvLyAgICAgICAgIEJ5dGVzKGIiXHg2Zlx4YWRceDRhXHg2NSIpLCAgIyBnZXRfdXNlcihhZGRyZXNzKSBzZWxlY3RvcgogICAgLy8gICAgICAgICBhZGRyLmJ5dGVzLAogICAgLy8gICAgICksCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjQ3MAogICAgLy8gYXBwX2lkPUFwcGxpY2F0aW9uKHNlbGYucmVnaXN0cnlfYXBwLnZhbHVlKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyMyAvLyAicmVnaXN0cnlfYXBwIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJlZ2lzdHJ5X2FwcCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NDcyCiAgICAvLyBCeXRlcyhiIlx4NmZceGFkXHg0YVx4NjUiKSwgICMgZ2V0X3VzZXIoYWRkcmVzcykgc2VsZWN0b3IKICAgIGJ5dGVjIDM1IC8vIDB4NmZhZDRhNjUKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NDY5CiAgICAvLyByZXN1bHQgPSBpdHhuLkFwcGxpY2F0aW9uQ2FsbCgKICAgIHB1c2hpbnQgNiAvLyBhcHBsCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjQ3NQogICAgLy8gZmVlPTAsCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NDY5LTQ3NgogICAgLy8gcmVzdWx0ID0gaXR4bi5BcHBsaWNhdGlvbkNhbGwoCiAgICAvLyAgICAgYXBwX2lkPUFwcGxpY2F0aW9uKHNlbGYucmVnaXN0cnlfYXBwLnZhbHVlKSwKICAgIC8vICAgICBhcHBfYXJncz0oCiAgICAvLyAgICAgICAgIEJ5dGVzKGIiXHg2Zlx4YWRceDRhXHg2NSIpLCAgIyBnZXRfdXNlcihhZGRyZXNzKSBzZWxlY3RvcgogICAgLy8gICAgICAgICBhZGRyLmJ5dGVzLAogICAgLy8gICAgICksCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgaXR4biBMYXN0TG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjQ3NwogICAgLy8gcmV0dXJuIFVzZXIuZnJvbV9sb2cocmVzdWx0Lmxhc3RfbG9nKS51c2VyX2lkCiAgICBkdXAKICAgIGV4dHJhY3QgNCAwCiAgICBkdXAKICAgIGxlbgogICAgZGlnIDEKICAgIHB1c2hpbnQgNSAvLyA1CiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCB0dXBsZSBlbmNvZGluZwogICAgZHVwCiAgICBwdXNoaW50IDE1IC8vIDE1CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgdGFpbCBwb2ludGVyIGF0IGluZGV4IDIgb2YgKHVpbnQzMix1aW50OCwobGVuK3V0ZjhbXSksdWludDY0KQogICAgdW5jb3ZlciAyCiAgICBzd2FwCiAgICBkaWcgMgogICAgc3Vic3RyaW5nMwogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIHB1c2hpbnQgMTcgLy8gMTcKICAgICsKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIHNtYXJ0X2NvbnRyYWN0cy5zaGFyZWQudHlwZXMuVXNlcgogICAgZHVwCiAgICBleHRyYWN0IDAgNAogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICA9PQogICAgYXNzZXJ0IC8vIGFwcGxpY2F0aW9uIGxvZyB2YWx1ZSBpcyBub3QgdGhlIHJlc3VsdCBvZiBhbiBBQkkgcmV0dXJuCiAgICBleHRyYWN0IDQgNAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnRydXN0X3ZhcmlhdGlvbi5jb250cmFjdC5UcnVzdFZhcmlhdGlvbi5fZW5yb2xsKGFkZHI6IGJ5dGVzKSAtPiB2b2lkOgpfZW5yb2xsOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo0NzktNDgwCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9lbnJvbGwoc2VsZiwgYWRkcjogYXJjNC5BZGRyZXNzKSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjQ4MQogICAgLy8gcG9zaXRpb24gPSBzZWxmLl9zdG9yZV9wYXJ0aWNpcGFudChhZGRyKQogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIF9zdG9yZV9wYXJ0aWNpcGFudAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo0ODIKICAgIC8vIGFyYzQuZW1pdChQYXJ0aWNpcGFudEVucm9sbGVkKGFkZHI9YWRkci5jb3B5KCksIHBvc2l0aW9uPXBvc2l0aW9uKSkKICAgIGZyYW1lX2RpZyAtMQogICAgc3dhcAogICAgY29uY2F0CiAgICBwdXNoYnl0ZXMgMHgwYWU2MDgyZiAvLyBtZXRob2QgIlBhcnRpY2lwYW50RW5yb2xsZWQoYWRkcmVzcyx1aW50MzIpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50cnVzdF92YXJpYXRpb24uY29udHJhY3QuVHJ1c3RWYXJpYXRpb24uX3N0b3JlX3BhcnRpY2lwYW50KGFkZHI6IGJ5dGVzKSAtPiBieXRlczoKX3N0b3JlX3BhcnRpY2lwYW50OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo0ODQtNDg1CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9zdG9yZV9wYXJ0aWNpcGFudChzZWxmLCBhZGRyOiBhcmM0LkFkZHJlc3MpIC0+IGFyYzQuVUludDMyOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjQ4NwogICAgLy8gc2VsZi5wYXJ0aWNpcGFudHNbYWRkcl0gPSBQYXJ0aWNpcGFudEluZm8oCiAgICBieXRlYyA1IC8vIDB4NzA1ZgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NDg3LTQ5MQogICAgLy8gc2VsZi5wYXJ0aWNpcGFudHNbYWRkcl0gPSBQYXJ0aWNpcGFudEluZm8oCiAgICAvLyAgICAgZW5yb2xsZWQ9YXJjNC5VSW50OCgxKSwKICAgIC8vICAgICBhc3NpZ25lZD1hcmM0LlVJbnQ4KDApLAogICAgLy8gICAgIG1hdGNoX2lkPWFyYzQuVUludDMyKDApLAogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4MDEwMDAwMDAwMDAwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjQ5MgogICAgLy8gcG9zaXRpb24gPSBhcmM0LlVJbnQzMihzZWxmLnBhcnRpY2lwYW50X2NvdW50LnZhbHVlKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDcgLy8gInBhcnRpY2lwYW50X2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBhcnRpY2lwYW50X2NvdW50IGV4aXN0cwogICAgaXRvYgogICAgZHVwCiAgICBiaXRsZW4KICAgIGludGNfMiAvLyAzMgogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZXh0cmFjdCA0IDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NDkzCiAgICAvLyBpZiBzZWxmLmF1dG9fbWF0Y2hfZW5hYmxlZC52YWx1ZSA9PSBVSW50NjQoMSk6CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTggLy8gImF1dG9fbWF0Y2hfZW5hYmxlZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hdXRvX21hdGNoX2VuYWJsZWQgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgPT0KICAgIGJ6IF9zdG9yZV9wYXJ0aWNpcGFudF9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NDk0CiAgICAvLyBzZWxmLmVucm9sbG1lbnRfb3JkZXJbcG9zaXRpb25dID0gYWRkci5jb3B5KCkKICAgIGJ5dGVjIDM0IC8vIDB4NmY1ZgogICAgZnJhbWVfZGlnIDAKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC0xCiAgICBib3hfcHV0Cgpfc3RvcmVfcGFydGljaXBhbnRfYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo0OTUKICAgIC8vIHNlbGYucGFydGljaXBhbnRfY291bnQudmFsdWUgKz0gVUludDY0KDEpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNyAvLyAicGFydGljaXBhbnRfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucGFydGljaXBhbnRfY291bnQgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnl0ZWMgNyAvLyAicGFydGljaXBhbnRfY291bnQiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo0OTYKICAgIC8vIHJldHVybiBwb3NpdGlvbgogICAgZnJhbWVfZGlnIDAKICAgIHN3YXAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50cnVzdF92YXJpYXRpb24uY29udHJhY3QuVHJ1c3RWYXJpYXRpb24uX3Jvc3Rlcl9mbGFncyh1c2VyX2lkOiB1aW50NjQpIC0+IHVpbnQ2NDoKX3Jvc3Rlcl9mbGFnczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NTM4LTUzOQogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBfcm9zdGVyX2ZsYWdzKHNlbGYsIHVzZXJfaWQ6IFVJbnQ2NCkgLT4gVUludDY0OgogICAgcHJvdG8gMSAxCiAgICBwdXNoYnl0ZXMgIiIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NTQwCiAgICAvLyBpZiBub3Qgc2VsZi5yb3N0ZXIgb3IgdXNlcl9pZCAvLyBVSW50NjQoNCkgPj0gc2VsZi5yb3N0ZXIubGVuZ3RoOgogICAgYnl0ZWMgOSAvLyAweDcyNmY3Mzc0NjU3MgogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBieiBfcm9zdGVyX2ZsYWdzX2lmX2JvZHlAMgogICAgZnJhbWVfZGlnIC0xCiAgICBwdXNoaW50IDQgLy8gNAogICAgLwogICAgZHVwCiAgICBmcmFtZV9idXJ5IDAKICAgIGJ5dGVjIDkgLy8gMHg3MjZmNzM3NDY1NzIKICAgIGJveF9sZW4KICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJvc3RlciBleGlzdHMKICAgID49CiAgICBieiBfcm9zdGVyX2ZsYWdzX2FmdGVyX2lmX2Vsc2VAMwoKX3Jvc3Rlcl9mbGFnc19pZl9ib2R5QDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjU0MQogICAgLy8gcmV0dXJuIFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIHN3YXAKICAgIHJldHN1YgoKX3Jvc3Rlcl9mbGFnc19hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjU0MgogICAgLy8gYnl0ZSA9IHNlbGYucm9zdGVyLmV4dHJhY3QodXNlcl9pZCAvLyBVSW50NjQoNCksIFVJbnQ2NCgxKSkKICAgIGJ5dGVjIDkgLy8gMHg3MjZmNzM3NDY1NzIKICAgIGZyYW1lX2RpZyAwCiAgICBpbnRjXzEgLy8gMQogICAgYm94X2V4dHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NTQzCiAgICAvLyBiaXQgPSAodXNlcl9pZCAlIFVJbnQ2NCg0KSkgKiBVSW50NjQoMikKICAgIGZyYW1lX2RpZyAtMQogICAgcHVzaGludCA0IC8vIDQKICAgICUKICAgIGludGNfMyAvLyAyCiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjU0NAogICAgLy8gcmV0dXJuIG9wLmdldGJpdChieXRlLCBiaXQpIHwgKG9wLmdldGJpdChieXRlLCBiaXQgKyBVSW50NjQoMSkpIDw8IFVJbnQ2NCgxKSkKICAgIGR1cDIKICAgIGdldGJpdAogICAgc3dhcAogICAgaW50Y18xIC8vIDEKICAgICsKICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgZ2V0Yml0CiAgICBpbnRjXzEgLy8gMQogICAgc2hsCiAgICB8CiAgICBzd2FwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudHJ1c3RfdmFyaWF0aW9uLmNvbnRyYWN0LlRydXN0VmFyaWF0aW9uLl9zZXRfcm9zdGVyX2ZsYWcodXNlcl9pZDogdWludDY0LCBmbGFnX2JpdDogdWludDY0KSAtPiB2b2lkOgpfc2V0X3Jvc3Rlcl9mbGFnOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo1NDYtNTQ3CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9zZXRfcm9zdGVyX2ZsYWcoc2VsZiwgdXNlcl9pZDogVUludDY0LCBmbGFnX2JpdDogVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjU0OAogICAgLy8gaW5kZXggPSB1c2VyX2lkIC8vIFVJbnQ2NCg0KQogICAgZnJhbWVfZGlnIC0yCiAgICBwdXNoaW50IDQgLy8gNAogICAgLwogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo1NDkKICAgIC8vIGJpdCA9ICh1c2VyX2lkICUgVUludDY0KDQpKSAqIFVJbnQ2NCgyKSArIGZsYWdfYml0CiAgICBmcmFtZV9kaWcgLTIKICAgIHB1c2hpbnQgNCAvLyA0CiAgICAlCiAgICBpbnRjXzMgLy8gMgogICAgKgogICAgZnJhbWVfZGlnIC0xCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjU1MAogICAgLy8gYnl0ZSA9IG9wLnNldGJpdF9ieXRlcyhzZWxmLnJvc3Rlci5leHRyYWN0KGluZGV4LCBVSW50NjQoMSkpLCBiaXQsIFRydWUpICAjIG5vcWE6IEZCVDAwMwogICAgYnl0ZWMgOSAvLyAweDcyNmY3Mzc0NjU3MgogICAgZGlnIDIKICAgIGludGNfMSAvLyAxCiAgICBib3hfZXh0cmFjdAogICAgc3dhcAogICAgaW50Y18xIC8vIDEKICAgIHNldGJpdAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo1NTEKICAgIC8vIHNlbGYucm9zdGVyLnJlcGxhY2UoaW5kZXgsIGJ5dGUpCiAgICBieXRlYyA5IC8vIDB4NzI2ZjczNzQ2NTcyCiAgICBjb3ZlciAyCiAgICBib3hfcmVwbGFjZQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnRydXN0X3ZhcmlhdGlvbi5jb250cmFjdC5UcnVzdFZhcmlhdGlvbi5fbWF0Y2hfbWJyKCkgLT4gdWludDY0OgpfbWF0Y2hfbWJyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo2NjgKICAgIC8vIGlmIHNlbGYuc2V0dGxlbWVudF9tb2RlLnZhbHVlID09IFVJbnQ2NChTRVRUTEVNRU5UX0NMQUlNKToKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxNSAvLyAic2V0dGxlbWVudF9tb2RlIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnNldHRsZW1lbnRfbW9kZSBleGlzdHMKICAgIGludGNfMyAvLyAyCiAgICA9PQogICAgYnogX21hdGNoX21icl9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NjY5CiAgICAvLyByZXR1cm4gVUludDY0KE1BVENIX01CUiArIDIgKiBDTEFJTV9NQlIpCiAgICBwdXNoaW50IDkwNzAwIC8vIDkwNzAwCiAgICByZXRzdWIKCl9tYXRjaF9tYnJfYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo2NzAKICAgIC8vIHJldHVybiBVSW50NjQoTUFUQ0hfTUJSKQogICAgaW50YyA1IC8vIDUyMTAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudHJ1c3RfdmFyaWF0aW9uLmNvbnRyYWN0LlRydXN0VmFyaWF0aW9uLl9jcmVhdGVfbWF0Y2goaW52ZXN0b3I6IGJ5dGVzLCB0cnVzdGVlOiBieXRlcykgLT4gYnl0ZXM6Cl9jcmVhdGVfbWF0Y2g6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjY3Mi02NzMKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX2NyZWF0ZV9tYXRjaChzZWxmLCBpbnZlc3RvcjogYXJjNC5BZGRyZXNzLCB0cnVzdGVlOiBhcmM0LkFkZHJlc3MpIC0+IGFyYzQuVUludDMyOgogICAgcHJvdG8gMiAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjY3NAogICAgLy8gYXNzZXJ0IGludmVzdG9yIGluIHNlbGYucGFydGljaXBhbnRzLCAiSW52ZXN0b3Igbm90IGVucm9sbGVkIgogICAgYnl0ZWMgNSAvLyAweDcwNWYKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIEludmVzdG9yIG5vdCBlbnJvbGxlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo2NzUKICAgIC8vIGFzc2VydCB0cnVzdGVlIGluIHNlbGYucGFydGljaXBhbnRzLCAiVHJ1c3RlZSBub3QgZW5yb2xsZWQiCiAgICBieXRlYyA1IC8vIDB4NzA1ZgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gVHJ1c3RlZSBub3QgZW5yb2xsZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6Njc3CiAgICAvLyBpbnZlc3Rvcl9pbmZvID0gc2VsZi5wYXJ0aWNpcGFudHNbaW52ZXN0b3JdLmNvcHkoKQogICAgZGlnIDEKICAgIGJveF9nZXQKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo2NzgKICAgIC8vIGFzc2VydCBpbnZlc3Rvcl9pbmZvLmVucm9sbGVkID09IGFyYzQuVUludDgoMSksICJJbnZlc3RvciBub3QgYWN0aXZlIgogICAgZHVwCiAgICBleHRyYWN0IDAgMQogICAgYnl0ZWMgNiAvLyAweDAxCiAgICBiPT0KICAgIGFzc2VydCAvLyBJbnZlc3RvciBub3QgYWN0aXZlCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjY3OQogICAgLy8gYXNzZXJ0IGludmVzdG9yX2luZm8uYXNzaWduZWQgPT0gYXJjNC5VSW50OCgwKSwgIkludmVzdG9yIGFscmVhZHkgYXNzaWduZWQiCiAgICBleHRyYWN0IDEgMQogICAgYnl0ZWMgMTIgLy8gMHgwMAogICAgYj09CiAgICBhc3NlcnQgLy8gSW52ZXN0b3IgYWxyZWFkeSBhc3NpZ25lZAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo2ODEKICAgIC8vIHRydXN0ZWVfaW5mbyA9IHNlbGYucGFydGljaXBhbnRzW3RydXN0ZWVdLmNvcHkoKQogICAgZHVwCiAgICBib3hfZ2V0CiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NjgyCiAgICAvLyBhc3NlcnQgdHJ1c3RlZV9pbmZvLmVucm9sbGVkID09IGFyYzQuVUludDgoMSksICJUcnVzdGVlIG5vdCBhY3RpdmUiCiAgICBkdXAKICAgIGV4dHJhY3QgMCAxCiAgICBieXRlYyA2IC8vIDB4MDEKICAgIGI9PQogICAgYXNzZXJ0IC8vIFRydXN0ZWUgbm90IGFjdGl2ZQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo2ODMKICAgIC8vIGFzc2VydCB0cnVzdGVlX2luZm8uYXNzaWduZWQgPT0gYXJjNC5VSW50OCgwKSwgIlRydXN0ZWUgYWxyZWFkeSBhc3NpZ25lZCIKICAgIGV4dHJhY3QgMSAxCiAgICBieXRlYyAxMiAvLyAweDAwCiAgICBiPT0KICAgIGFzc2VydCAvLyBUcnVzdGVlIGFscmVhZHkgYXNzaWduZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6Njg1CiAgICAvLyBtYXRjaF9pZCA9IHNlbGYuX25ld19tYXRjaChpbnZlc3RvciwgdHJ1c3RlZSkKICAgIGZyYW1lX2RpZyAtMgogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIF9uZXdfbWF0Y2gKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6Njg2LTY4OAogICAgLy8gc2VsZi5wYXJ0aWNpcGFudHNbaW52ZXN0b3JdID0gUGFydGljaXBhbnRJbmZvKAogICAgLy8gICAgIGVucm9sbGVkPWFyYzQuVUludDgoMSksIGFzc2lnbmVkPWFyYzQuVUludDgoMSksIG1hdGNoX2lkPW1hdGNoX2lkCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHgwMTAxCiAgICBkaWcgMQogICAgY29uY2F0CiAgICB1bmNvdmVyIDMKICAgIGRpZyAxCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjY4OS02OTEKICAgIC8vIHNlbGYucGFydGljaXBhbnRzW3RydXN0ZWVdID0gUGFydGljaXBhbnRJbmZvKAogICAgLy8gICAgIGVucm9sbGVkPWFyYzQuVUludDgoMSksIGFzc2lnbmVkPWFyYzQuVUludDgoMSksIG1hdGNoX2lkPW1hdGNoX2lkCiAgICAvLyApCiAgICB1bmNvdmVyIDIKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6NjkyCiAgICAvLyByZXR1cm4gbWF0Y2hfaWQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50cnVzdF92YXJpYXRpb24uY29udHJhY3QuVHJ1c3RWYXJpYXRpb24uX25ld19tYXRjaChpbnZlc3RvcjogYnl0ZXMsIHRydXN0ZWU6IGJ5dGVzKSAtPiBieXRlczoKX25ld19tYXRjaDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6Njk0LTY5NQogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBfbmV3X21hdGNoKHNlbGYsIGludmVzdG9yOiBhcmM0LkFkZHJlc3MsIHRydXN0ZWU6IGFyYzQuQWRkcmVzcykgLT4gYXJjNC5VSW50MzI6CiAgICBwcm90byAyIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6Njk2CiAgICAvLyBtYXRjaF9pZCA9IGFyYzQuVUludDMyKHNlbGYubWF0Y2hfY291bnQudmFsdWUpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAibWF0Y2hfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWF0Y2hfY291bnQgZXhpc3RzCiAgICBkdXAKICAgIGl0b2IKICAgIGR1cAogICAgYml0bGVuCiAgICBpbnRjXzIgLy8gMzIKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGV4dHJhY3QgNCA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjY5NwogICAgLy8gc2VsZi5tYXRjaF9jb3VudC52YWx1ZSArPSBVSW50NjQoMSkKICAgIHN3YXAKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBieXRlYyA0IC8vICJtYXRjaF9jb3VudCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjcwNAogICAgLy8gY3JlYXRlZF9hdD1hcmM0LlVJbnQ2NChHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCksCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjY5OS03MTEKICAgIC8vIHNlbGYubWF0Y2hlc1ttYXRjaF9pZF0gPSBNYXRjaCgKICAgIC8vICAgICBtYXRjaF9pZD1tYXRjaF9pZCwKICAgIC8vICAgICBpbnZlc3Rvcj1pbnZlc3Rvci5jb3B5KCksCiAgICAvLyAgICAgdHJ1c3RlZT10cnVzdGVlLmNvcHkoKSwKICAgIC8vICAgICBwaGFzZT1hcmM0LlVJbnQ4KFBIQVNFX0lOVkVTVE9SX0RFQ0lTSU9OKSwKICAgIC8vICAgICBjcmVhdGVkX2F0PWFyYzQuVUludDY0KEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wKSwKICAgIC8vICAgICBpbnZlc3RtZW50PWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIHJldHVybl9hbW91bnQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgaW52ZXN0b3JfcGF5b3V0PWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIHRydXN0ZWVfcGF5b3V0PWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIGNvbXBsZXRlZF9hdD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBwYWlkX291dD1hcmM0LlVJbnQ4KDApLAogICAgLy8gKQogICAgZGlnIDEKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo3MDMKICAgIC8vIHBoYXNlPWFyYzQuVUludDgoUEhBU0VfSU5WRVNUT1JfREVDSVNJT04pLAogICAgYnl0ZWMgMTIgLy8gMHgwMAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo2OTktNzExCiAgICAvLyBzZWxmLm1hdGNoZXNbbWF0Y2hfaWRdID0gTWF0Y2goCiAgICAvLyAgICAgbWF0Y2hfaWQ9bWF0Y2hfaWQsCiAgICAvLyAgICAgaW52ZXN0b3I9aW52ZXN0b3IuY29weSgpLAogICAgLy8gICAgIHRydXN0ZWU9dHJ1c3RlZS5jb3B5KCksCiAgICAvLyAgICAgcGhhc2U9YXJjNC5VSW50OChQSEFTRV9JTlZFU1RPUl9ERUNJU0lPTiksCiAgICAvLyAgICAgY3JlYXRlZF9hdD1hcmM0LlVJbnQ2NChHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCksCiAgICAvLyAgICAgaW52ZXN0bWVudD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICByZXR1cm5fYW1vdW50PWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIGludmVzdG9yX3BheW91dD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICB0cnVzdGVlX3BheW91dD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBjb21wbGV0ZWRfYXQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgcGFpZF9vdXQ9YXJjNC5VSW50OCgwKSwKICAgIC8vICkKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBwdXNoYnl0ZXMgMHgwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6Njk5CiAgICAvLyBzZWxmLm1hdGNoZXNbbWF0Y2hfaWRdID0gTWF0Y2goCiAgICBieXRlYyAxMSAvLyAweDZkNWYKICAgIGRpZyAyCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6Njk5LTcxMQogICAgLy8gc2VsZi5tYXRjaGVzW21hdGNoX2lkXSA9IE1hdGNoKAogICAgLy8gICAgIG1hdGNoX2lkPW1hdGNoX2lkLAogICAgLy8gICAgIGludmVzdG9yPWludmVzdG9yLmNvcHkoKSwKICAgIC8vICAgICB0cnVzdGVlPXRydXN0ZWUuY29weSgpLAogICAgLy8gICAgIHBoYXNlPWFyYzQuVUludDgoUEhBU0VfSU5WRVNUT1JfREVDSVNJT04pLAogICAgLy8gICAgIGNyZWF0ZWRfYXQ9YXJjNC5VSW50NjQoR2xvYmFsLmxhdGVzdF90aW1lc3RhbXApLAogICAgLy8gICAgIGludmVzdG1lbnQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgcmV0dXJuX2Ftb3VudD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBpbnZlc3Rvcl9wYXlvdXQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgdHJ1c3RlZV9wYXlvdXQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgY29tcGxldGVkX2F0PWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIHBhaWRfb3V0PWFyYzQuVUludDgoMCksCiAgICAvLyApCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5OjcxMgogICAgLy8gcmV0dXJuIG1hdGNoX2lkCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudHJ1c3RfdmFyaWF0aW9uLmNvbnRyYWN0LlRydXN0VmFyaWF0aW9uLl9jcmVkaXQoYWRkcjogYnl0ZXMsIGFtb3VudDogdWludDY0KSAtPiB2b2lkOgpfY3JlZGl0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo4NDgtODQ5CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9jcmVkaXQoc2VsZiwgYWRkcjogYXJjNC5BZGRyZXNzLCBhbW91bnQ6IFVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo4NTAKICAgIC8vIGFjY291bnQgPSBBY2NvdW50KGFkZHIuYnl0ZXMpCiAgICBmcmFtZV9kaWcgLTIKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIEFkZHJlc3MgbGVuZ3RoIGlzIDMyIGJ5dGVzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5Ojg1MQogICAgLy8gaWYgYWNjb3VudCBpbiBzZWxmLmNsYWltYWJsZToKICAgIGJ5dGVjIDI1IC8vIDB4NjM1ZgogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBieiBfY3JlZGl0X2Vsc2VfYm9keUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5Ojg1MgogICAgLy8gc2VsZi5jbGFpbWFibGVbYWNjb3VudF0gPSBhcmM0LlVJbnQ2NChzZWxmLmNsYWltYWJsZVthY2NvdW50XS5hc191aW50NjQoKSArIGFtb3VudCkKICAgIGR1cAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY2xhaW1hYmxlIGVudHJ5IGV4aXN0cwogICAgYnRvaQogICAgZnJhbWVfZGlnIC0xCiAgICArCiAgICBpdG9iCiAgICBib3hfcHV0CiAgICByZXRzdWIKCl9jcmVkaXRfZWxzZV9ib2R5QDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5Ojg1NAogICAgLy8gc2VsZi5jbGFpbWFibGVbYWNjb3VudF0gPSBhcmM0LlVJbnQ2NChhbW91bnQpCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIGJveF9wdXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50cnVzdF92YXJpYXRpb24uY29udHJhY3QuVHJ1c3RWYXJpYXRpb24uX3BheV9tYXRjaChtYXRjaF9pZDogYnl0ZXMsIGludmVzdG9yOiBieXRlcywgdHJ1c3RlZTogYnl0ZXMsIGludmVzdG9yX3BheW91dDogdWludDY0LCB0cnVzdGVlX3BheW91dDogdWludDY0KSAtPiB2b2lkOgpfcGF5X21hdGNoOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo4NTYtODY0CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9wYXlfbWF0Y2goCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICBtYXRjaF9pZDogYXJjNC5VSW50MzIsCiAgICAvLyAgICAgaW52ZXN0b3I6IGFyYzQuQWRkcmVzcywKICAgIC8vICAgICB0cnVzdGVlOiBhcmM0LkFkZHJlc3MsCiAgICAvLyAgICAgaW52ZXN0b3JfcGF5b3V0OiBVSW50NjQsCiAgICAvLyAgICAgdHJ1c3RlZV9wYXlvdXQ6IFVJbnQ2NCwKICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDUgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo4NjUKICAgIC8vIHNlbGYuX3NlbmRfcGF5b3V0KEFjY291bnQoaW52ZXN0b3IuYnl0ZXMpLCBpbnZlc3Rvcl9wYXlvdXQpCiAgICBmcmFtZV9kaWcgLTQKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIEFkZHJlc3MgbGVuZ3RoIGlzIDMyIGJ5dGVzCiAgICBmcmFtZV9kaWcgLTQKICAgIGZyYW1lX2RpZyAtMgogICAgY2FsbHN1YiBfc2VuZF9wYXlvdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6ODY2CiAgICAvLyBzZWxmLl9zZW5kX3BheW91dChBY2NvdW50KHRydXN0ZWUuYnl0ZXMpLCB0cnVzdGVlX3BheW91dCkKICAgIGZyYW1lX2RpZyAtMwogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gQWRkcmVzcyBsZW5ndGggaXMgMzIgYnl0ZXMKICAgIGZyYW1lX2RpZyAtMwogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIF9zZW5kX3BheW91dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo4NjcKICAgIC8vIHNlbGYuZXNjcm93X3BhaWRfb3V0LnZhbHVlICs9IGludmVzdG9yX3BheW91dCArIHRydXN0ZWVfcGF5b3V0CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTQgLy8gImVzY3Jvd19wYWlkX291dCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5lc2Nyb3dfcGFpZF9vdXQgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAtMQogICAgKwogICAgKwogICAgYnl0ZWMgMTQgLy8gImVzY3Jvd19wYWlkX291dCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5Ojg2OAogICAgLy8gc2VsZi5wYWlkX291dF9jb3VudC52YWx1ZSArPSBVSW50NjQoMSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMyAvLyAicGFpZF9vdXRfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucGFpZF9vdXRfY291bnQgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnl0ZWMgMTMgLy8gInBhaWRfb3V0X2NvdW50IgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6ODcyCiAgICAvLyBpbnZlc3Rvcl9wYXlvdXQ9YXJjNC5VSW50NjQoaW52ZXN0b3JfcGF5b3V0KSwKICAgIGZyYW1lX2RpZyAtMgogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo4NzMKICAgIC8vIHRydXN0ZWVfcGF5b3V0PWFyYzQuVUludDY0KHRydXN0ZWVfcGF5b3V0KSwKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo4NzAtODc0CiAgICAvLyBNYXRjaFBhaWRPdXQoCiAgICAvLyAgICAgbWF0Y2hfaWQ9bWF0Y2hfaWQsCiAgICAvLyAgICAgaW52ZXN0b3JfcGF5b3V0PWFyYzQuVUludDY0KGludmVzdG9yX3BheW91dCksCiAgICAvLyAgICAgdHJ1c3RlZV9wYXlvdXQ9YXJjNC5VSW50NjQodHJ1c3RlZV9wYXlvdXQpLAogICAgLy8gKQogICAgZnJhbWVfZGlnIC01CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5Ojg2OS04NzUKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBNYXRjaFBhaWRPdXQoCiAgICAvLyAgICAgICAgIG1hdGNoX2lkPW1hdGNoX2lkLAogICAgLy8gICAgICAgICBpbnZlc3Rvcl9wYXlvdXQ9YXJjNC5VSW50NjQoaW52ZXN0b3JfcGF5b3V0KSwKICAgIC8vICAgICAgICAgdHJ1c3RlZV9wYXlvdXQ9YXJjNC5VSW50NjQodHJ1c3RlZV9wYXlvdXQpLAogICAgLy8gICAgICkKICAgIC8vICkKICAgIHB1c2hieXRlcyAweDcyYzljMjU4IC8vIG1ldGhvZCAiTWF0Y2hQYWlkT3V0KHVpbnQzMix1aW50NjQsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudHJ1c3RfdmFyaWF0aW9uLmNvbnRyYWN0LlRydXN0VmFyaWF0aW9uLl9zZW5kX3BheW91dChyZWNlaXZlcjogYnl0ZXMsIGFtb3VudDogdWludDY0KSAtPiB2b2lkOgpfc2VuZF9wYXlvdXQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5Ojg3Ny04NzgKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX3NlbmRfcGF5b3V0KHNlbGYsIHJlY2VpdmVyOiBBY2NvdW50LCBhbW91bnQ6IFVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo4NzkKICAgIC8vIGlmIHNlbGYuYXNzZXRfaWQudmFsdWUgPT0gVUludDY0KDApOgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDIyIC8vICJhc3NldF9pZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hc3NldF9pZCBleGlzdHMKICAgIGJueiBfc2VuZF9wYXlvdXRfZWxzZV9ib2R5QDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6ODgwLTg4NAogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPXJlY2VpdmVyLAogICAgLy8gICAgIGFtb3VudD1hbW91bnQsCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBmcmFtZV9kaWcgLTIKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6ODgwCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5Ojg4MwogICAgLy8gZmVlPTAsCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6ODgwLTg4NAogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPXJlY2VpdmVyLAogICAgLy8gICAgIGFtb3VudD1hbW91bnQsCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgcmV0c3ViCgpfc2VuZF9wYXlvdXRfZWxzZV9ib2R5QDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5Ojg4Ni04OTEKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PUFzc2V0KHNlbGYuYXNzZXRfaWQudmFsdWUpLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPXJlY2VpdmVyLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1hbW91bnQsCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5Ojg4NwogICAgLy8geGZlcl9hc3NldD1Bc3NldChzZWxmLmFzc2V0X2lkLnZhbHVlKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyMiAvLyAiYXNzZXRfaWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYXNzZXRfaWQgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0eG5fZmllbGQgQXNzZXRBbW91bnQKICAgIGZyYW1lX2RpZyAtMgogICAgaXR4bl9maWVsZCBBc3NldFJlY2VpdmVyCiAgICBpdHhuX2ZpZWxkIFhmZXJBc3NldAogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo4ODYKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIHB1c2hpbnQgNCAvLyBheGZlcgogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo4OTAKICAgIC8vIGZlZT0wLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5Ojg4Ni04OTEKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PUFzc2V0KHNlbGYuYXNzZXRfaWQudmFsdWUpLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPXJlY2VpdmVyLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1hbW91bnQsCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnRydXN0X3ZhcmlhdGlvbi5jb250cmFjdC5UcnVzdFZhcmlhdGlvbi5fYXZhaWxhYmxlX2VzY3JvdygpIC0+IHVpbnQ2NDoKX2F2YWlsYWJsZV9lc2Nyb3c6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5Ojg5NQogICAgLy8gcmV0dXJuIHNlbGYuZXNjcm93X2RlcG9zaXRlZC52YWx1ZSAtIHNlbGYuZXNjcm93X3BhaWRfb3V0LnZhbHVlIC0gc2VsZi5lc2Nyb3dfcGVuZGluZy52YWx1ZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gImVzY3Jvd19kZXBvc2l0ZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZXNjcm93X2RlcG9zaXRlZCBleGlzdHMKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxNCAvLyAiZXNjcm93X3BhaWRfb3V0IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmVzY3Jvd19wYWlkX291dCBleGlzdHMKICAgIC0KICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA4IC8vICJlc2Nyb3dfcGVuZGluZyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5lc2Nyb3dfcGVuZGluZyBleGlzdHMKICAgIC0KICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50cnVzdF92YXJpYXRpb24uY29udHJhY3QuVHJ1c3RWYXJpYXRpb24uX2NvbmZpZygpIC0+IGJ5dGVzOgpfY29uZmlnOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo5NTQKICAgIC8vIGUxPWFyYzQuVUludDY0KHNlbGYuZTEudmFsdWUpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDIwIC8vICJlMSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5lMSBleGlzdHMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90cnVzdF92YXJpYXRpb24vY29udHJhY3QucHk6OTU1CiAgICAvLyBlMj1hcmM0LlVJbnQ2NChzZWxmLmUyLnZhbHVlKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyNiAvLyAiZTIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZTIgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5Ojk1NgogICAgLy8gbXVsdGlwbGllcj1hcmM0LlVJbnQ2NChzZWxmLm11bHRpcGxpZXIudmFsdWUpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDI3IC8vICJtdWx0aXBsaWVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm11bHRpcGxpZXIgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5Ojk1NwogICAgLy8gdW5pdD1hcmM0LlVJbnQ2NChzZWxmLnVuaXQudmFsdWUpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDIxIC8vICJ1bml0IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnVuaXQgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvdHJ1c3RfdmFyaWF0aW9uL2NvbnRyYWN0LnB5Ojk1OAogICAgLy8gYXNzZXRfaWQ9YXJjNC5VSW50NjQoc2VsZi5hc3NldF9pZC52YWx1ZSksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMjIgLy8gImFzc2V0X2lkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFzc2V0X2lkIGV4aXN0cwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo5NTkKICAgIC8vIHN0YXR1cz1hcmM0LlVJbnQ4KHNlbGYuc3RhdHVzLnZhbHVlKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJzdGF0dXMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3RhdHVzIGV4aXN0cwogICAgaXRvYgogICAgZHVwCiAgICBiaXRsZW4KICAgIHB1c2hpbnQgOCAvLyA4CiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDcgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo5NjAKICAgIC8vIG1heF9wYXJ0aWNpcGFudHM9YXJjNC5VSW50NjQoc2VsZi5tYXhfcGFydGljaXBhbnRzLnZhbHVlKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyNCAvLyAibWF4X3BhcnRpY2lwYW50cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5tYXhfcGFydGljaXBhbnRzIGV4aXN0cwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3RydXN0X3ZhcmlhdGlvbi9jb250cmFjdC5weTo5NTMtOTYxCiAgICAvLyByZXR1cm4gVmFyaWF0aW9uQ29uZmlnKAogICAgLy8gICAgIGUxPWFyYzQuVUludDY0KHNlbGYuZTEudmFsdWUpLAogICAgLy8gICAgIGUyPWFyYzQuVUludDY0KHNlbGYuZTIudmFsdWUpLAogICAgLy8gICAgIG11bHRpcGxpZXI9YXJjNC5VSW50NjQoc2VsZi5tdWx0aXBsaWVyLnZhbHVlKSwKICAgIC8vICAgICB1bml0PWFyYzQuVUludDY0KHNlbGYudW5pdC52YWx1ZSksCiAgICAvLyAgICAgYXNzZXRfaWQ9YXJjNC5VSW50NjQoc2VsZi5hc3NldF9pZC52YWx1ZSksCiAgICAvLyAgICAgc3RhdHVzPWFyYzQuVUludDgoc2VsZi5zdGF0dXMudmFsdWUpLAogICAgLy8gICAgIG1heF9wYXJ0aWNpcGFudHM9YXJjNC5VSW50NjQoc2VsZi5tYXhfcGFydGljaXBhbnRzLnZhbHVlKSwKICAgIC8vICkKICAgIHVuY292ZXIgNgogICAgdW5jb3ZlciA2CiAgICBjb25jYXQKICAgIHVuY292ZXIgNQogICAgY29uY2F0CiAgICB1bmNvdmVyIDQKICAgIGNvbmNhdAogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIHJldHN1Ygo=","clear":"I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"},"byteCode":{"approval":"CyAGAAEgAsSQAYSXAyYnBW93bmVyBBUffHUGc3RhdHVzEGVzY3Jvd19kZXBvc2l0ZWQLbWF0Y2hfY291bnQCcF8BARFwYXJ0aWNpcGFudF9jb3VudA5lc2Nyb3dfcGVuZGluZwZyb3N0ZXIQY2xhaW1fbWJyX3JlZnVuZAJtXwEADnBhaWRfb3V0X2NvdW50D2VzY3Jvd19wYWlkX291dA9zZXR0bGVtZW50X21vZGUFc3RhdHMMcm9zdGVyX2NvdW50EmF1dG9fbWF0Y2hfZW5hYmxlZA9leHBlcmltZW50c19hcHACZTEEdW5pdAhhc3NldF9pZAxyZWdpc3RyeV9hcHAQbWF4X3BhcnRpY2lwYW50cwJjXwJlMgptdWx0aXBsaWVyDG1hdGNoX2N1cnNvcg90cmVhc3VyeV9mdW5kZWQGZXhwX2lkBnZhcl9pZAQxBErCAQICb18Eb61KZQMGgQEEGd3qMATT1AVsMRhAAFonEyJnJx4iZycfImcqImcnBCJnJw0iZycUImcnGiJnJxsiZycVImcnFiJnKyJnJw4iZycXImcnByJnJxgiZyccImcnDyJnJwgiZycRImcnHSJnJxIiZycKImcxGRREMRhBAO+CIQSN60WbBFyag2sECcHD5wQ44udzBPtI7YIEVO7zhgQ32i3HBFHbEJAEH9BAYwTxGznxBOcvlBUEw8s0ugRsH7i/BN6RBGUElpYDeAQXp5VlBPELptgEHjB3kARIOrU1BJVVycgEzIKrmQRrJP2WBMge1WIEaFuVkwRbngVYBF3zGYIE5eoppQSw9F6sBBEBVtQEenSQrAR/BsIJBJu5IOwEIaHVQDYaAI4hAZEBxQHwAgICeAP0BB0EOATIBOkFZQaTB4AHxghWCUMJ7goBCokMfA0KDWMNoQ2qDoUOnw8xD1UPcg9+D4kPsg++AIAEuNuGBTYaAI4BABcAigIBi/8WSaOL/qBJFYEQDkSBEK+riTYaAUkVgQgSRDYaAkkVgQQSRDYaA0kVgQQSRDYaBEkVJBJENhoFSRWBCBJENhoGSRWBCBJENhoHSRWBCBJENhoISRWBCBJENhoJSRWBCBJENhoKSRWBCBJENhoLSRWBCBJETwMXSURPChcnE0xnTwkXJx5MZ08IFycfTGcoTwhnKiJnJwQiZycNImdPBhcnFExnTwUXJxpMZ08EFycbTGcnFUxnTwIXSU4DJxZLAWcrImcnDiJnTwIXJxdMZycHImdMFycYTGcnHCJnJw8iZycIImcnESJnJx0iZycSImcnEIBwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAGdBABOxMgoishKyFEmyEYEEshAisgGzI0MxFiMJSTgQIxJEMQAiKGVEEkRJOAcyChJEOAhJRCIrZURLAQgrSwFnTBZMFlAnIExQsCNDNhoBSRWBCBJEMQAiJxNlRHIIRBJESRdJRCIrZUQIK0sBZxZQJyBMULAjQzEAIicTZURyCEQSRCcdI2cjQzEAIihlRBJEIiplRCUTRIgQjElBABUiKGVESwFJTgKIEEciK2VETAkrTGciJw9lRCUSQQAeIicEZUQiJxBlRIEIWwkiJwplREyByK0CCwgnCkxnIicKZUQnCiJniA1nKiVnSRYiJwhlRBZQgAQ9bVkBTFCwI0MiRwSAAEcFNhoBSRUjEkQ2GgJJIllJTgIlC0xJFUxXAgAiSUsFDEEAJEcCJQtLA0lPAllJSwdJTgQSREsBFVIiWSUICEUFIwhFAUL/1UsDJQhLAxJEMQAiKGVEEkQiKmVEJRJESwUXSUUJSSUORCEERQ0jEklFCEEA8iEFRQwiRQkiRQpLCUsFDElFDEEArksKREsJJQtLAklPAllKWSUIWFcCAEUOSwdAACtLDUkVSSQSRCQSRCcFTFBJRRK9RQFBAApLELxISwgjCEUJSwkjCEUKQv+uSwZBAEBLDUkVgQQSRCcLTFBJRRG9RQFB/91LD75MSU4CRQ9EV0QBJyGpQAALSwxXdQEnBqhB/79LD7xISwgjCEUJQv+ySw1JFYEEEkQnIkxQSUUQvUUBQf+dSw68SEsIIwhFCUL/kEsISUsNCyInCmVEJwoiZwhJiAv/TBZMFksHTwJQSwFQgASrdz3GTFCwKUxQsCNDSwclEkH/C4GkigFFDEL/AjYaAUkVIxJEMQAiKGVEEkQiKmVEJRNEIicEZUQURBdJJQ5EJw9MZyNDMQAiKGVEEkQiKmVEFEQiJwdlRBREJxIjZyNDNhoBRwIiWUlOAkkkCyUITwIVEkQxFiMJSTgQIxJEMQAiKGVEEkQiKmVEFERJOAcyChJEOAiIC3NPAgsPRCInB2VEFkmTJA5EVwQEIklLAwxBACNLA1cCAEsBSU4CJAskWCcFSwFQvUUBFESIC/RIIwhFAUL/1ksCFkmTJA5EVwQESwJMUIAEO/ejiExQsCNDMRYjCUk4ECMSRDEASU8CiAsbSYgLYReIC/gURIgLnSNDMRYlCUk4EIEGEkQxFiMJSTgQIxJEMQBJTwKICu9LATgYIicXZUQSREsBOAAxABJESwE4GRRESwEiwhonIxJESwEjwhpLARJETDg+SVcEAEkVSwGBBVlJgQ8SRE8CTEsCUiJZgREIEkRJVwAEKRJEgQRaiAt8FESICyEjQyJJgABHBDYaAUkVgQQSRDYaAkkiWSUISwEVEkRXAgAxFiMJSTgQIxJEMQBJTgJMiApeIicXZUxJTwJEgANtcjBlRQFEgboJMgwNQQAYsYEGshCBBbIZJySyHicksh8isgGzQv/fSwEBSwQXSUULSwQVgYAFEkSBgIBADEQiTEUMRQhLB4EUDEEALUsHSSQLSwRMJFhMSwpMkSMaQQAPSwtQAUULSwcjCEUIQv/VSwtMUAFFC0L/7SJFBksFgQgMQQBogAgwMTIzNDU2N0sGI1iAAm1yTFBLAUxlTEULQAAQIkRLCIgKjhRESwGICjEjQ0sJFUUFIkUHSwZLBQxBACZLCUsHJFhLCxJBABEjQQAEI0L/zUsFIwhFBkL/nUsGJAhFB0L/0iJC/+MiQv+zgABJNhoBRwIiWUlOAkmBBAslCE8CFRJEMRYjCUlOAkk4ECMSRDEAIihlRBJEIiplRBRESwFETIgJUTgHMgoSRCJJSUsEDEEAJUsEVwIASwGBBAtagQQKIwhJRQdLAg1BAARLBUUCSSMIRQFC/9QiRQcnCb1FAUAAU4GQA0sCSU4CC4GkJghFCCcJTLlISwI4CEsHD0QiRQFJSwQMQQAfSwRXAgBLAUlOAoEEC1pJiAmWFEQiiAnLIwhFAUL/2iInEWVESwQIJxFMZyNDJwm9REsCDEH/tycJvURLAklPAgmBkAMLRQgnCUzTQv+gNhoBSRUkEkQ2GgJJFSQSRDEWIwlJOBAjEkQxACIoZUQSREk4BzIKEkQ4CIgJiA9ESogJlElPA1BPAlAnJUxQsClMULAjQzYaAUcCIllJTgJJgUALJQhPAhUSRDEWIwlJOBAjEkQxACIoZUQSREsBREk4BzIKEkQ4CIgJOk8CCw9EIicEZUQWSZMkDkRXBAQiSUsDDEEAI0sDVwIASwFJTgKBQAuBQFhJVwAgTFcgIIgJFkgjCEUBQv/WSwIWSZMkDkRXBARLAklPAlAnJkxQsClMULAjQyI2GgFJFYEIEkQxFiMJSTgQIxJEMQAiKGVEEkQiJxJlRCMSREwXSU4CSURJJRgUREsBOAcyChJETDgIiAiiTwIlCgsPRCInBGVEFkmTJA5EVwQEIkknHGVEMgMiSUsGQQBjIicHZURLBA1BAFhLAxZJkyQORFcEBCciTFC+TElOAkUKRCcFTFC+RFcBAScMqEEAG0lBACBLAksIiAhUSEsEIwhFBSJFAUsGIwlFB0sDIwhFBEL/piNFAUsDRQJLB0UDQv/jSUEABEsBRQQnHEsEZ0sEFkmTJA5ESVcEBEsHTFAnJkxQsClMULAjQzYaAUkVgQQSRDYaAkkVJBJENhoDSRWBBBJENhoESRUkEkQxFiMJSTgQIxJEMQAiKGVEEkRJOAcyChJEOAiIB7MPREsDSwKpREsDF0mIB0hJIxpEJRoUREsCF0mIBzlJIxpEJRoURCcFSwVQvUUBFEQnBUsDUL1FARRESwSIBn1PBqhESwKIBnRPBKhETCOIB0EjiAc9SogHwElPA1BPAlAnJUxQsClMULAjQzEAIihlRBJEIiplRBREKiNnI0M2GgFJFYEEEkQ2GgJJFYEIEkQnC0sCUEm9RQFESb5IMQBLAVcEIBJESVdEAScMqERLAhciJxRlREsBD0QiJxVlREsBTBgUREwnBlxESwNcTU8CTL9OAlCABEbL1n5MULAiJxBlREkiWyMIFlwASYEQW0sCCBZcEElXGBBPAoj1jlwYJxBMZyNDgAA2GgFHAhWBBBJENhoCSU4CSRWBCBJEIiplRCUTRCcLTwJQSU4CSb1FAUS+SElOAjEASwFXJCBJTgQSRElXRAEnBqhEgU1bIicbZURPAhdJTgNLAk8CC0oORCInFWVESwJMGBREIicUZURPAwlLAghJTgJOAyInGmVECE8CCUlOAggiJx1lREEAZIgHiUlFC0sBD0AAWElLCgmxIicTZUQiJx5lRBZJkyQORFcEBCInH2VEFkmTJA5EVwQESwMWgASUQi7zshpPArIaTLIaSbIaTLIYgQayECKyAbMiK2VETwIIK0sBZxZQJyBMULAiJw9lREAArUsFSVcEIEsKTEsHSwZLBogGiycGXHVFBksFJyFcREsISU4CXFVLBElOAxZMSwFcXUsFSU4FFkxLAVxlMgcWXG1LDEy/Sw1PA1BPAlBMUIAEqwT4IkxQsCInEGVESYEIWyMIFlwISYEoW0sHSU4DCBZcKElXMBBPAoj0FFwwSYFAW0sCCBZcQElXSBBPAojz/1xISYFYW0sCCBZcWElXYBBPAojz6lxgJxBMZyNDiAZwSwFJTgIPRCInCGVECCcITGciJw9lRCUSQQAmSwVJVwQgSwSIBaNLBUsDiAWcIicNZUQjCCcNTGcnBlx1RQZC/ydLBScMXHVFBkL/HDYaAUcCIllJTgJJgQQLJQhPAhUSRDEAIihlRBJEJA5EIklLAgxBAGRLAlcCAEsBSU4CgQQLgQRYJwtLAVBJvUUBREm+SElXRAEnIahESVd1AScMqERJgV1bSwGBZVtLAlcEIE8DVyQgTwVOAksESwSIBS4iJwhlRE4CCAknCExngXUnBrsjCEUBQv+VI0MnGTEAUL1FAUQnGTEAUL5ESRcnGTEAULxIIicKZUSB5JYBCCcKTGcxAEsBiAUzIicOZURLAQgnDkxnIicIZURMCScITGcxAEsBUIAEv8cCwUxQsClMULAjQzEAIihlRBJEIicNZUQiJwRlRBJEiAUmSUQiKGVESwGIBOYiK2VESwEJK0xnIihlREwWUIAEx+fRo0xQsCNDiAUNKUxQsCNDIjYaAUkVJBJEgAYAAAAAAABMJwxMgHYAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAATCcFTFBJvUUBQQAvSb5MSU4CRQZEVwEBJwaoQQAdSwNXAgQnC0xQSUUGvUUBQQALJwZFA0sEvkxFA0SIBDxLBEsEUEsDUExQKUxQsCNDNhoBSRWBBBJEJwtMUEm9RQFEvkgpTFCwI0MiSYAANhoBSRWBBBJENhoCSRWBBBJETBdJTwIXTEsBCEyBCA1BAAdLAYEICEUBIicEZURLAQxBAAgiJwRlTEUCRIACAABFBEsBRQNLAksBDEEAOEsCFkmTJA5EVwQEJwtMUElFBr1FAUEAF0sEvkRLBElPAlBMIlkjCBZXBgJcAEUESwIjCEUDQv/AKUsEULAjQzYaAUkVJBJEJwVMUEm9RQFEvkhJVwEBJwaoRFcCBClMULAjQzYaAUkVgQQSRBeIAXgWSZOBCA5EVwcBKUxQsCNDIicRZUQWKUxQsCNDIicQZUQpTFCwI0M2GgFJFSQSRCcZTFBJvUUBQQAJSb5EKUxQsCNDgAgAAAAAAAAAAEL/7SInB2VEFilMULAjQ4gC3xYpTFCwI0OKAQCL/0EAErEiKGVEi/+yCLIHI7IQIrIBs4kiJxJlRCMSQQAFgeiaAokhBImKAgAiKmVEFEQnBYv+UL1FARREI4gAEov/OAcyChJEi/84CIj/yA9EiYoBACInGGVEQQAVIicHZUQiJxFlRAiL/wgiJxhlRA5EiYoBAbEiJxdlRCcjshqL/7IashiBBrIQIrIBs7Q+SVcEAEkVSwGBBVlJgQ8SRE8CTEsCUiJZgREIEkRJVwAEKRJEVwQEiYoBAIv/iAAOi/9MUIAECuYIL0xQsImKAQEnBYv/UIAGAQAAAAAAvyInB2VEFkmTJA5EVwQEIicSZUQjEkEACCciiwBQi/+/IicHZUQjCCcHTGeLAEyJigEBgAAnCb1FAUEAEIv/gQQKSYwAJwm9RA9BAAMiTIknCYsAI7qL/4EEGCULSlNMIwhPAkxTI5AZTImKAgCL/oEECov+gQQYJQuL/wgnCUsCI7pMI1QnCU4Cu4kiJw9lRCUSQQAFgczEBYkhBYmKAgEnBYv+UEm9RQFEJwWL/1BJvUUBREsBvkhJVwABJwaoRFcBAScMqERJvkhJVwABJwaoRFcBAScMqESL/ov/iAARgAIBAUsBUE8DSwG/TwJMv4mKAgEiJwRlREkWSZMkDkRXBARMIwgnBExnMgcWSwGL/lCL/1AnDFBMUIApAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABQJwtLAlBMv4mKAgCL/hUkEkQnGYv+UEm9RQFBAApJvkQXi/8IFr+Ji/8Wv4mKBQCL/BUkEkSL/Iv+iAA+i/0VJBJEi/2L/4gAMSInDmVEi/6L/wgIJw5MZyInDWVEIwgnDUxni/4Wi/8Wi/tPAlBMUIAEcsnCWExQsImKAgAiJxZlREAAEbGL/7IIi/6yByOyECKyAbOJsSInFmVEi/+yEov+shSyEYEEshAisgGziSIrZUQiJw5lRAkiJwhlRAmJIicUZUQWIicaZUQWIicbZUQWIicVZUQWIicWZUQWIiplRBZJk4EIDkRXBwEiJxhlRBZPBk8GUE8FUE8EUE8DUE8CUExQiQ==","clear":"C4EBQw=="},"events":[{"name":"EscrowDeposited","args":[{"type":"uint64","name":"amount"},{"type":"uint64","name":"deposited"}]},{"name":"VariationEnded","args":[{"type":"uint64","name":"refunded"},{"type":"uint64","name":"retained"}]},{"name":"BoxesSwept","args":[{"type":"uint8","name":"kind"},{"type":"uint64","name":"count"},{"type":"uint64","name":"refunded"}]},{"name":"ParticipantsEnrolled","args":[{"type":"uint32","name":"first_position"},{"type":"uint32","name":"count"}]},{"name":"ParticipantEnrolled","args":[{"type":"address","name":"addr"},{"type":"uint32","name":"position"}]},{"name":"MatchCreated","args":[{"type":"uint32","name":"match_id"},{"type":"address","name":"investor"},{"type":"address","name":"trustee"}]},{"name":"MatchesCreated","args":[{"type":"uint32","name":"first_match_id"},{"type":"uint32","name":"count"}]},{"name":"InvestorDecided","args":[{"type":"uint32","name":"match_id"},{"type":"uint64","name":"investment"}]},{"name":"MatchPaidOut","args":[{"type":"uint32","name":"match_id"},{"type":"uint64","name":"investor_payout"},{"type":"uint64","name":"trustee_payout"}]},{"name":"TrusteeDecided","args":[{"type":"uint32","name":"match_id"},{"type":"uint64","name":"return_amount"},{"type":"uint64","name":"investor_payout"},{"type":"uint64","name":"trustee_payout"}]},{"name":"PayoutClaimed","args":[{"type":"address","name":"addr"},{"type":"uint64","name":"amount"}]},{"name":"EscrowWithdrawn","args":[{"type":"address","name":"receiver"},{"type":"uint64","name":"amount"}]}],"templateVariables":{}} as unknown as Arc56Contract
 
 /**
  * A state record containing binary data
@@ -80,18 +80,35 @@ export function MatchFromTuple(abiTuple: [number, string, string, number, bigint
 
 export type ParticipantInfo = {
   enrolled: number,
-  assigned: number
+  assigned: number,
+  matchId: number
 }
 
 
 /**
  * Converts the ABI tuple representation of a ParticipantInfo to the struct representation
  */
-export function ParticipantInfoFromTuple(abiTuple: [number, number]) {
+export function ParticipantInfoFromTuple(abiTuple: [number, number, number]) {
   const abiStructType = ABIStructType.fromStruct('ParticipantInfo', APP_SPEC.structs)
   return getStructValueFromTupleValue(abiStructType, abiTuple) as ParticipantInfo
 }
 
+export type PlayerState = {
+  participant: ParticipantInfo,
+  hasMatch: number,
+  match: Match,
+  config: VariationConfig
+}
+
+
+/**
+ * Converts the ABI tuple representation of a PlayerState to the struct representation
+ */
+export function PlayerStateFromTuple(abiTuple: [[number, number, number], number, [number, string, string, number, bigint, bigint, bigint, bigint, bigint, bigint, number], [bigint, bigint, bigint, bigint, bigint, number, bigint]]) {
+  const abiStructType = ABIStructType.fromStruct('PlayerState', APP_SPEC.structs)
+  return getStructValueFromTupleValue(abiStructType, abiTuple) as PlayerState
+}
+
 export type VariationConfig = {
   e1: bigint,
   e2: bigint,
@@ -111,6 +128,28 @@ export function VariationConfigFromTuple(abiTuple: [bigint, bigint, bigint, bigi
   return getStructValueFromTupleValue(abiStructType, abiTuple) as VariationConfig
 }
 
+export type VariationStats = {
+  investedCount: bigint,
+  completedCount: bigint,
+  sumInvestment: bigint,
+  sumsqInvestment: bigint,
+  sumReturn: bigint,
+  sumsqReturn: bigint,
+  sumInvestorPayout: bigint,
+  sumsqInvestorPayout: bigint,
+  sumTrusteePayout: bigint,
+  sumsqTrusteePayout: bigint
+}
+
+
+/**
+ * Converts the ABI tuple representation of a VariationStats to the struct representation
+ */
+export function VariationStatsFromTuple(abiTuple: [bigint, bigint, bigint, bigint, bigint, bigint, bigint, bigint, bigint, bigint]) {
+  const abiStructType = ABIStructType.fromStruct('VariationStats', APP_SPEC.structs)
+  return getStructValueFromTupleValue(abiStructType, abiTuple) as VariationStats
+}
+
 /**
  * The argument types for the TrustVariation contract
  */
@@ -138,7 +177,16 @@ export type TrustVariationArgs = {
     'record_escrow(uint64)void': {
       amount: bigint | number
     }
+    'enable_treasury_funding()void': Record<string, never>
     'end_variation()void': Record<string, never>
+    'sweep_boxes(uint8,byte[][])uint64': {
+      kind: bigint | number
+      keys: Uint8Array[]
+    }
+    'set_settlement_mode(uint8)void': {
+      mode: bigint | number
+    }
+    'enable_auto_match()void': Record<string, never>
     'add_participants(address[],pay)void': {
       addresses: string[]
       mbrPayment: AppMethodCallTransactionArgument
@@ -146,11 +194,39 @@ export type TrustVariationArgs = {
     'self_enroll(pay)void': {
       mbrPayment: AppMethodCallTransactionArgument
     }
+    'self_enroll_grouped(appl,pay)void': {
+      registryCall: AppMethodCallTransactionArgument
+      mbrPayment: AppMethodCallTransactionArgument
+    }
+    'self_enroll_with_proof(uint32,byte[],pay)void': {
+      userId: bigint | number
+      proof: Uint8Array
+      mbrPayment: AppMethodCallTransactionArgument
+    }
+    'enroll_user_ids(uint32[],pay)void': {
+      userIds: bigint | number[]
+      mbrPayment: AppMethodCallTransactionArgument
+    }
     'create_match(address,address,pay)uint32': {
       investor: string
       trustee: string
       mbrPayment: AppMethodCallTransactionArgument
     }
+    'create_matches((address,address)[],pay)uint32': {
+      pairs: [string, string][]
+      mbrPayment: AppMethodCallTransactionArgument
+    }
+    'auto_match(uint64,pay)uint64': {
+      n: bigint | number
+      mbrPayment: AppMethodCallTransactionArgument
+    }
+    'create_match_by_ids(uint32,address,uint32,address,pay)uint32': {
+      investorId: bigint | number
+      investor: string
+      trusteeId: bigint | number
+      trustee: string
+      mbrPayment: AppMethodCallTransactionArgument
+    }
     'close_registration()void': Record<string, never>
     'submit_investor_decision(uint32,uint64)void': {
       matchId: bigint | number
@@ -160,14 +236,33 @@ export type TrustVariationArgs = {
       matchId: bigint | number
       returnAmount: bigint | number
     }
+    'settle(uint32[])void': {
+      matchIds: bigint | number[]
+    }
+    'claim()uint64': Record<string, never>
     'withdraw_escrow()void': Record<string, never>
     'get_config()(uint64,uint64,uint64,uint64,uint64,uint8,uint64)': Record<string, never>
+    'get_player_state(address)((uint8,uint8,uint32),uint8,(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8),(uint64,uint64,uint64,uint64,uint64,uint8,uint64))': {
+      addr: string
+    }
     'get_match(uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)': {
       matchId: bigint | number
     }
+    'get_matches(uint32,uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)[]': {
+      start: bigint | number
+      count: bigint | number
+    }
     'get_player_match(address)uint32': {
       addr: string
     }
+    'get_roster_flags(uint32)uint8': {
+      userId: bigint | number
+    }
+    'get_roster_count()uint64': Record<string, never>
+    'get_stats()(uint64,uint64,uint64,uint128,uint64,uint128,uint64,uint128,uint64,uint128)': Record<string, never>
+    'get_claimable(address)uint64': {
+      addr: string
+    }
     'get_participant_count()uint64': Record<string, never>
     'get_escrow_balance()uint64': Record<string, never>
   }
@@ -178,17 +273,35 @@ export type TrustVariationArgs = {
     'create(uint64,uint32,uint32,address,uint64,uint64,uint64,uint64,uint64,uint64,uint64)void': [experimentsApp: bigint | number, expId: bigint | number, varId: bigint | number, owner: string, e1: bigint | number, e2: bigint | number, multiplier: bigint | number, unit: bigint | number, assetId: bigint | number, registryApp: bigint | number, maxParticipants: bigint | number]
     'deposit_escrow(pay)void': [payment: AppMethodCallTransactionArgument]
     'record_escrow(uint64)void': [amount: bigint | number]
+    'enable_treasury_funding()void': []
     'end_variation()void': []
+    'sweep_boxes(uint8,byte[][])uint64': [kind: bigint | number, keys: Uint8Array[]]
+    'set_settlement_mode(uint8)void': [mode: bigint | number]
+    'enable_auto_match()void': []
     'add_participants(address[],pay)void': [addresses: string[], mbrPayment: AppMethodCallTransactionArgument]
     'self_enroll(pay)void': [mbrPayment: AppMethodCallTransactionArgument]
+    'self_enroll_grouped(appl,pay)void': [registryCall: AppMethodCallTransactionArgument, mbrPayment: AppMethodCallTransactionArgument]
+    'self_enroll_with_proof(uint32,byte[],pay)void': [userId: bigint | number, proof: Uint8Array, mbrPayment: AppMethodCallTransactionArgument]
+    'enroll_user_ids(uint32[],pay)void': [userIds: bigint | number[], mbrPayment: AppMethodCallTransactionArgument]
     'create_match(address,address,pay)uint32': [investor: string, trustee: string, mbrPayment: AppMethodCallTransactionArgument]
+    'create_matches((address,address)[],pay)uint32': [pairs: [string, string][], mbrPayment: AppMethodCallTransactionArgument]
+    'auto_match(uint64,pay)uint64': [n: bigint | number, mbrPayment: AppMethodCallTransactionArgument]
+    'create_match_by_ids(uint32,address,uint32,address,pay)uint32': [investorId: bigint | number, investor: string, trusteeId: bigint | number, trustee: string, mbrPayment: AppMethodCallTransactionArgument]
     'close_registration()void': []
     'submit_investor_decision(uint32,uint64)void': [matchId: bigint | number, investment: bigint | number]
     'submit_trustee_decision(uint32,uint64)void': [matchId: bigint | number, returnAmount: bigint | number]
+    'settle(uint32[])void': [matchIds: bigint | number[]]
+    'claim()uint64': []
     'withdraw_escrow()void': []
     'get_config()(uint64,uint64,uint64,uint64,uint64,uint8,uint64)': []
+    'get_player_state(address)((uint8,uint8,uint32),uint8,(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8),(uint64,uint64,uint64,uint64,uint64,uint8,uint64))': [addr: string]
     'get_match(uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)': [matchId: bigint | number]
+    'get_matches(uint32,uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)[]': [start: bigint | number, count: bigint | number]
     'get_player_match(address)uint32': [addr: string]
+    'get_roster_flags(uint32)uint8': [userId: bigint | number]
+    'get_roster_count()uint64': []
+    'get_stats()(uint64,uint64,uint64,uint128,uint64,uint128,uint64,uint128,uint64,uint128)': []
+    'get_claimable(address)uint64': [addr: string]
     'get_participant_count()uint64': []
     'get_escrow_balance()uint64': []
   }
@@ -201,17 +314,35 @@ export type TrustVariationReturns = {
   'create(uint64,uint32,uint32,address,uint64,uint64,uint64,uint64,uint64,uint64,uint64)void': void
   'deposit_escrow(pay)void': void
   'record_escrow(uint64)void': void
+  'enable_treasury_funding()void': void
   'end_variation()void': void
+  'sweep_boxes(uint8,byte[][])uint64': bigint
+  'set_settlement_mode(uint8)void': void
+  'enable_auto_match()void': void
   'add_participants(address[],pay)void': void
   'self_enroll(pay)void': void
+  'self_enroll_grouped(appl,pay)void': void
+  'self_enroll_with_proof(uint32,byte[],pay)void': void
+  'enroll_user_ids(uint32[],pay)void': void
   'create_match(address,address,pay)uint32': number
+  'create_matches((address,address)[],pay)uint32': number
+  'auto_match(uint64,pay)uint64': bigint
+  'create_match_by_ids(uint32,address,uint32,address,pay)uint32': number
   'close_registration()void': void
   'submit_investor_decision(uint32,uint64)void': void
   'submit_trustee_decision(uint32,uint64)void': void
+  'settle(uint32[])void': void
+  'claim()uint64': bigint
   'withdraw_escrow()void': void
   'get_config()(uint64,uint64,uint64,uint64,uint64,uint8,uint64)': VariationConfig
+  'get_player_state(address)((uint8,uint8,uint32),uint8,(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8),(uint64,uint64,uint64,uint64,uint64,uint8,uint64))': PlayerState
   'get_match(uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)': Match
+  'get_matches(uint32,uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)[]': [number, string, string, number, bigint, bigint, bigint, bigint, bigint, bigint, number][]
   'get_player_match(address)uint32': number
+  'get_roster_flags(uint32)uint8': number
+  'get_roster_count()uint64': bigint
+  'get_stats()(uint64,uint64,uint64,uint128,uint64,uint128,uint64,uint128,uint64,uint128)': VariationStats
+  'get_claimable(address)uint64': bigint
   'get_participant_count()uint64': bigint
   'get_escrow_balance()uint64': bigint
 }
@@ -239,11 +370,31 @@ export type TrustVariationTypes = {
       argsTuple: TrustVariationArgs['tuple']['record_escrow(uint64)void']
       returns: TrustVariationReturns['record_escrow(uint64)void']
     }>
+    & Record<'enable_treasury_funding()void' | 'enable_treasury_funding', {
+      argsObj: TrustVariationArgs['obj']['enable_treasury_funding()void']
+      argsTuple: TrustVariationArgs['tuple']['enable_treasury_funding()void']
+      returns: TrustVariationReturns['enable_treasury_funding()void']
+    }>
     & Record<'end_variation()void' | 'end_variation', {
       argsObj: TrustVariationArgs['obj']['end_variation()void']
       argsTuple: TrustVariationArgs['tuple']['end_variation()void']
       returns: TrustVariationReturns['end_variation()void']
     }>
+    & Record<'sweep_boxes(uint8,byte[][])uint64' | 'sweep_boxes', {
+      argsObj: TrustVariationArgs['obj']['sweep_boxes(uint8,byte[][])uint64']
+      argsTuple: TrustVariationArgs['tuple']['sweep_boxes(uint8,byte[][])uint64']
+      returns: TrustVariationReturns['sweep_boxes(uint8,byte[][])uint64']
+    }>
+    & Record<'set_settlement_mode(uint8)void' | 'set_settlement_mode', {
+      argsObj: TrustVariationArgs['obj']['set_settlement_mode(uint8)void']
+      argsTuple: TrustVariationArgs['tuple']['set_settlement_mode(uint8)void']
+      returns: TrustVariationReturns['set_settlement_mode(uint8)void']
+    }>
+    & Record<'enable_auto_match()void' | 'enable_auto_match', {
+      argsObj: TrustVariationArgs['obj']['enable_auto_match()void']
+      argsTuple: TrustVariationArgs['tuple']['enable_auto_match()void']
+      returns: TrustVariationReturns['enable_auto_match()void']
+    }>
     & Record<'add_participants(address[],pay)void' | 'add_participants', {
       argsObj: TrustVariationArgs['obj']['add_participants(address[],pay)void']
       argsTuple: TrustVariationArgs['tuple']['add_participants(address[],pay)void']
@@ -254,11 +405,41 @@ export type TrustVariationTypes = {
       argsTuple: TrustVariationArgs['tuple']['self_enroll(pay)void']
       returns: TrustVariationReturns['self_enroll(pay)void']
     }>
+    & Record<'self_enroll_grouped(appl,pay)void' | 'self_enroll_grouped', {
+      argsObj: TrustVariationArgs['obj']['self_enroll_grouped(appl,pay)void']
+      argsTuple: TrustVariationArgs['tuple']['self_enroll_grouped(appl,pay)void']
+      returns: TrustVariationReturns['self_enroll_grouped(appl,pay)void']
+    }>
+    & Record<'self_enroll_with_proof(uint32,byte[],pay)void' | 'self_enroll_with_proof', {
+      argsObj: TrustVariationArgs['obj']['self_enroll_with_proof(uint32,byte[],pay)void']
+      argsTuple: TrustVariationArgs['tuple']['self_enroll_with_proof(uint32,byte[],pay)void']
+      returns: TrustVariationReturns['self_enroll_with_proof(uint32,byte[],pay)void']
+    }>
+    & Record<'enroll_user_ids(uint32[],pay)void' | 'enroll_user_ids', {
+      argsObj: TrustVariationArgs['obj']['enroll_user_ids(uint32[],pay)void']
+      argsTuple: TrustVariationArgs['tuple']['enroll_user_ids(uint32[],pay)void']
+      returns: TrustVariationReturns['enroll_user_ids(uint32[],pay)void']
+    }>
     & Record<'create_match(address,address,pay)uint32' | 'create_match', {
       argsObj: TrustVariationArgs['obj']['create_match(address,address,pay)uint32']
       argsTuple: TrustVariationArgs['tuple']['create_match(address,address,pay)uint32']
       returns: TrustVariationReturns['create_match(address,address,pay)uint32']
     }>
+    & Record<'create_matches((address,address)[],pay)uint32' | 'create_matches', {
+      argsObj: TrustVariationArgs['obj']['create_matches((address,address)[],pay)uint32']
+      argsTuple: TrustVariationArgs['tuple']['create_matches((address,address)[],pay)uint32']
+      returns: TrustVariationReturns['create_matches((address,address)[],pay)uint32']
+    }>
+    & Record<'auto_match(uint64,pay)uint64' | 'auto_match', {
+      argsObj: TrustVariationArgs['obj']['auto_match(uint64,pay)uint64']
+      argsTuple: TrustVariationArgs['tuple']['auto_match(uint64,pay)uint64']
+      returns: TrustVariationReturns['auto_match(uint64,pay)uint64']
+    }>
+    & Record<'create_match_by_ids(uint32,address,uint32,address,pay)uint32' | 'create_match_by_ids', {
+      argsObj: TrustVariationArgs['obj']['create_match_by_ids(uint32,address,uint32,address,pay)uint32']
+      argsTuple: TrustVariationArgs['tuple']['create_match_by_ids(uint32,address,uint32,address,pay)uint32']
+      returns: TrustVariationReturns['create_match_by_ids(uint32,address,uint32,address,pay)uint32']
+    }>
     & Record<'close_registration()void' | 'close_registration', {
       argsObj: TrustVariationArgs['obj']['close_registration()void']
       argsTuple: TrustVariationArgs['tuple']['close_registration()void']
@@ -274,6 +455,16 @@ export type TrustVariationTypes = {
       argsTuple: TrustVariationArgs['tuple']['submit_trustee_decision(uint32,uint64)void']
       returns: TrustVariationReturns['submit_trustee_decision(uint32,uint64)void']
     }>
+    & Record<'settle(uint32[])void' | 'settle', {
+      argsObj: TrustVariationArgs['obj']['settle(uint32[])void']
+      argsTuple: TrustVariationArgs['tuple']['settle(uint32[])void']
+      returns: TrustVariationReturns['settle(uint32[])void']
+    }>
+    & Record<'claim()uint64' | 'claim', {
+      argsObj: TrustVariationArgs['obj']['claim()uint64']
+      argsTuple: TrustVariationArgs['tuple']['claim()uint64']
+      returns: TrustVariationReturns['claim()uint64']
+    }>
     & Record<'withdraw_escrow()void' | 'withdraw_escrow', {
       argsObj: TrustVariationArgs['obj']['withdraw_escrow()void']
       argsTuple: TrustVariationArgs['tuple']['withdraw_escrow()void']
@@ -284,16 +475,46 @@ export type TrustVariationTypes = {
       argsTuple: TrustVariationArgs['tuple']['get_config()(uint64,uint64,uint64,uint64,uint64,uint8,uint64)']
       returns: TrustVariationReturns['get_config()(uint64,uint64,uint64,uint64,uint64,uint8,uint64)']
     }>
+    & Record<'get_player_state(address)((uint8,uint8,uint32),uint8,(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8),(uint64,uint64,uint64,uint64,uint64,uint8,uint64))' | 'get_player_state', {
+      argsObj: TrustVariationArgs['obj']['get_player_state(address)((uint8,uint8,uint32),uint8,(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8),(uint64,uint64,uint64,uint64,uint64,uint8,uint64))']
+      argsTuple: TrustVariationArgs['tuple']['get_player_state(address)((uint8,uint8,uint32),uint8,(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8),(uint64,uint64,uint64,uint64,uint64,uint8,uint64))']
+      returns: TrustVariationReturns['get_player_state(address)((uint8,uint8,uint32),uint8,(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8),(uint64,uint64,uint64,uint64,uint64,uint8,uint64))']
+    }>
     & Record<'get_match(uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)' | 'get_match', {
       argsObj: TrustVariationArgs['obj']['get_match(uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)']
       argsTuple: TrustVariationArgs['tuple']['get_match(uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)']
       returns: TrustVariationReturns['get_match(uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)']
     }>
+    & Record<'get_matches(uint32,uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)[]' | 'get_matches', {
+      argsObj: TrustVariationArgs['obj']['get_matches(uint32,uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)[]']
+      argsTuple: TrustVariationArgs['tuple']['get_matches(uint32,uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)[]']
+      returns: TrustVariationReturns['get_matches(uint32,uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)[]']
+    }>
     & Record<'get_player_match(address)uint32' | 'get_player_match', {
       argsObj: TrustVariationArgs['obj']['get_player_match(address)uint32']
       argsTuple: TrustVariationArgs['tuple']['get_player_match(address)uint32']
       returns: TrustVariationReturns['get_player_match(address)uint32']
     }>
+    & Record<'get_roster_flags(uint32)uint8' | 'get_roster_flags', {
+      argsObj: TrustVariationArgs['obj']['get_roster_flags(uint32)uint8']
+      argsTuple: TrustVariationArgs['tuple']['get_roster_flags(uint32)uint8']
+      returns: TrustVariationReturns['get_roster_flags(uint32)uint8']
+    }>
+    & Record<'get_roster_count()uint64' | 'get_roster_count', {
+      argsObj: TrustVariationArgs['obj']['get_roster_count()uint64']
+      argsTuple: TrustVariationArgs['tuple']['get_roster_count()uint64']
+      returns: TrustVariationReturns['get_roster_count()uint64']
+    }>
+    & Record<'get_stats()(uint64,uint64,uint64,uint128,uint64,uint128,uint64,uint128,uint64,uint128)' | 'get_stats', {
+      argsObj: TrustVariationArgs['obj']['get_stats()(uint64,uint64,uint64,uint128,uint64,uint128,uint64,uint128,uint64,uint128)']
+      argsTuple: TrustVariationArgs['tuple']['get_stats()(uint64,uint64,uint64,uint128,uint64,uint128,uint64,uint128,uint64,uint128)']
+      returns: TrustVariationReturns['get_stats()(uint64,uint64,uint64,uint128,uint64,uint128,uint64,uint128,uint64,uint128)']
+    }>
+    & Record<'get_claimable(address)uint64' | 'get_claimable', {
+      argsObj: TrustVariationArgs['obj']['get_claimable(address)uint64']
+      argsTuple: TrustVariationArgs['tuple']['get_claimable(address)uint64']
+      returns: TrustVariationReturns['get_claimable(address)uint64']
+    }>
     & Record<'get_participant_count()uint64' | 'get_participant_count', {
       argsObj: TrustVariationArgs['obj']['get_participant_count()uint64']
       argsTuple: TrustVariationArgs['tuple']['get_participant_count()uint64']
@@ -327,15 +548,26 @@ export type TrustVariationTypes = {
         registryApp: bigint
         participantCount: bigint
         maxParticipants: bigint
+        matchCursor: bigint
+        settlementMode: bigint
+        escrowPending: bigint
+        stats: VariationStats
+        rosterCount: bigint
+        treasuryFunded: bigint
+        autoMatchEnabled: bigint
+        claimMbrRefund: bigint
       }
       maps: {}
     }
     box: {
-      keys: {}
+      keys: {
+        roster: BinaryState
+      }
       maps: {
         participants: Map<string, ParticipantInfo>
         matches: Map<bigint | number, Match>
-        playerMatch: Map<string, number>
+        enrollmentOrder: Map<bigint | number, string>
+        claimable: Map<string, bigint>
       }
     }
   }
@@ -456,6 +688,23 @@ export abstract class TrustVariationParamsFactory {
       args: Array.isArray(params.args) ? params.args : [params.args.amount],
     }
   }
+  /**
+   * Constructs a no op call for the enable_treasury_funding()void ABI method
+   *
+  * Called by TrustExperiments right after create for treasury-funded
+  variations: instead of holding a prefunded escrow, the variation draws each payout shortfall from the experiment treasury when it is needed.
+
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static enableTreasuryFunding(params: CallParams<TrustVariationArgs['obj']['enable_treasury_funding()void'] | TrustVariationArgs['tuple']['enable_treasury_funding()void']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'enable_treasury_funding()void' as const,
+      args: Array.isArray(params.args) ? params.args : [],
+    }
+  }
   /**
    * Constructs a no op call for the end_variation()void ABI method
    *
@@ -469,6 +718,58 @@ export abstract class TrustVariationParamsFactory {
       args: Array.isArray(params.args) ? params.args : [],
     }
   }
+  /**
+   * Constructs a no op call for the sweep_boxes(uint8,byte[][])uint64 ABI method
+   *
+  * Delete boxes of one SWEEP_* kind from an ended variation and refund
+  their MBR to the owner in one payment; returns the amount. keys are the box keys without prefix (32-byte address or 4-byte uint32). Missing keys and matches with an unsettled deferred payout are skipped, so sweeps can be retried. Swept data is gone from get_match/get_matches; the events remain the record. The payment also returns the MBR of claim boxes claimed since the last refund, so a call with no keys collects just that.
+
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static sweepBoxes(params: CallParams<TrustVariationArgs['obj']['sweep_boxes(uint8,byte[][])uint64'] | TrustVariationArgs['tuple']['sweep_boxes(uint8,byte[][])uint64']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'sweep_boxes(uint8,byte[][])uint64' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.kind, params.args.keys],
+    }
+  }
+  /**
+   * Constructs a no op call for the set_settlement_mode(uint8)void ABI method
+   *
+  * SETTLEMENT_IMMEDIATE pays both players inside submit_trustee_decision.
+  SETTLEMENT_DEFERRED only records the payouts; the owner pushes them later in bulk with settle(). SETTLEMENT_CLAIM credits them to the claim ledger and each player pulls their balance with claim().
+  The mode is fixed once the first match exists, because match MBR depends on it (claim boxes are prepaid at match creation).
+
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static setSettlementMode(params: CallParams<TrustVariationArgs['obj']['set_settlement_mode(uint8)void'] | TrustVariationArgs['tuple']['set_settlement_mode(uint8)void']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'set_settlement_mode(uint8)void' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.mode],
+    }
+  }
+  /**
+   * Constructs a no op call for the enable_auto_match()void ABI method
+   *
+  * Record every later enrollment's position in an o_ box so auto_match can
+  pair in enrollment order. Must precede the first enrollment, since earlier participants would have no position; each enrollment then costs PARTICIPANT_MBR + ORDER_BOX_MBR.
+
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static enableAutoMatch(params: CallParams<TrustVariationArgs['obj']['enable_auto_match()void'] | TrustVariationArgs['tuple']['enable_auto_match()void']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'enable_auto_match()void' as const,
+      args: Array.isArray(params.args) ? params.args : [],
+    }
+  }
   /**
    * Constructs a no op call for the add_participants(address[],pay)void ABI method
    *
@@ -495,6 +796,57 @@ export abstract class TrustVariationParamsFactory {
       args: Array.isArray(params.args) ? params.args : [params.args.mbrPayment],
     }
   }
+  /**
+   * Constructs a no op call for the self_enroll_grouped(appl,pay)void ABI method
+   *
+  * self_enroll without the inner call: the sender puts their own
+  BxHiveRegistry.get_user(sender) call in the group instead. get_user fails for unregistered accounts and groups are atomic, so its presence proves registration at the minimum fee; its return log carries the user_id that is checked against the roster.
+
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static selfEnrollGrouped(params: CallParams<TrustVariationArgs['obj']['self_enroll_grouped(appl,pay)void'] | TrustVariationArgs['tuple']['self_enroll_grouped(appl,pay)void']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'self_enroll_grouped(appl,pay)void' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.registryCall, params.args.mbrPayment],
+    }
+  }
+  /**
+   * Constructs a no op call for the self_enroll_with_proof(uint32,byte[],pay)void ABI method
+   *
+  * self_enroll without any registry call: proof is the sender's path in
+  the registry member tree (registry/membership.py member_proof), checked against the registry's member root globals read directly. The hashes need about 1,200 opcodes; pool them with another app call in the group or pay one extra minimum fee for the op-up.
+
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static selfEnrollWithProof(params: CallParams<TrustVariationArgs['obj']['self_enroll_with_proof(uint32,byte[],pay)void'] | TrustVariationArgs['tuple']['self_enroll_with_proof(uint32,byte[],pay)void']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'self_enroll_with_proof(uint32,byte[],pay)void' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.userId, params.args.proof, params.args.mbrPayment],
+    }
+  }
+  /**
+   * Constructs a no op call for the enroll_user_ids(uint32[],pay)void ABI method
+   *
+  * Enroll registry users into the roster bitmap instead of p_ boxes. The
+  bitmap grows to cover the highest user_id; the MBR payment must cover the added bytes (plus ROSTER_BOX_MBR the first time). No per-user event is emitted, so large batches stay within the log limits. Roster users count towards max_participants; ones that also hold a p_ box are rejected by create_match_by_ids, and self-enrollment rejects roster user_ids.
+
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static enrollUserIds(params: CallParams<TrustVariationArgs['obj']['enroll_user_ids(uint32[],pay)void'] | TrustVariationArgs['tuple']['enroll_user_ids(uint32[],pay)void']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'enroll_user_ids(uint32[],pay)void' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.userIds, params.args.mbrPayment],
+    }
+  }
   /**
    * Constructs a no op call for the create_match(address,address,pay)uint32 ABI method
    *
@@ -508,6 +860,57 @@ export abstract class TrustVariationParamsFactory {
       args: Array.isArray(params.args) ? params.args : [params.args.investor, params.args.trustee, params.args.mbrPayment],
     }
   }
+  /**
+   * Constructs a no op call for the create_matches((address,address)[],pay)uint32 ABI method
+   *
+  * Pair several (investor, trustee) tuples in one call, funded by a single
+  aggregate MBR payment. Match IDs are assigned sequentially; returns the first one. Emits a single MatchesCreated for the whole batch.
+
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static createMatches(params: CallParams<TrustVariationArgs['obj']['create_matches((address,address)[],pay)uint32'] | TrustVariationArgs['tuple']['create_matches((address,address)[],pay)uint32']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'create_matches((address,address)[],pay)uint32' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.pairs, params.args.mbrPayment],
+    }
+  }
+  /**
+   * Constructs a no op call for the auto_match(uint64,pay)uint64 ABI method
+   *
+  * Pair up to n unassigned participants in enrollment order, starting at
+  match_cursor. Within a pair the earlier enrollee is the investor and the later one the trustee; participants already paired via create_match are skipped. An odd leftover stays unpaired and the cursor parks on it so the next call picks it up. MBR is charged for n / 2 matches up front. Requires enable_auto_match. Emits one MatchesCreated and returns the number of matches created.
+
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static autoMatch(params: CallParams<TrustVariationArgs['obj']['auto_match(uint64,pay)uint64'] | TrustVariationArgs['tuple']['auto_match(uint64,pay)uint64']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'auto_match(uint64,pay)uint64' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.n, params.args.mbrPayment],
+    }
+  }
+  /**
+   * Constructs a no op call for the create_match_by_ids(uint32,address,uint32,address,pay)uint32 ABI method
+   *
+  * Pair two roster participants. Each address is checked against its
+  user_id in BxHiveRegistry, since the roster only stores flags. Roster players have no p_ box: they find their match through the MatchCreated event or get_matches rather than get_player_match.
+
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static createMatchByIds(params: CallParams<TrustVariationArgs['obj']['create_match_by_ids(uint32,address,uint32,address,pay)uint32'] | TrustVariationArgs['tuple']['create_match_by_ids(uint32,address,uint32,address,pay)uint32']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'create_match_by_ids(uint32,address,uint32,address,pay)uint32' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.investorId, params.args.investor, params.args.trusteeId, params.args.trustee, params.args.mbrPayment],
+    }
+  }
   /**
    * Constructs a no op call for the close_registration()void ABI method
    *
@@ -547,6 +950,39 @@ export abstract class TrustVariationParamsFactory {
       args: Array.isArray(params.args) ? params.args : [params.args.matchId, params.args.returnAmount],
     }
   }
+  /**
+   * Constructs a no op call for the settle(uint32[])void ABI method
+   *
+  * Push the recorded payouts of completed, unpaid matches, at most
+  MAX_SETTLE_PER_CALL per call. Each match costs two inner transactions, so one group (four settle calls pooling their budget) can settle up to 128.
+
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static settle(params: CallParams<TrustVariationArgs['obj']['settle(uint32[])void'] | TrustVariationArgs['tuple']['settle(uint32[])void']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'settle(uint32[])void' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.matchIds],
+    }
+  }
+  /**
+   * Constructs a no op call for the claim()uint64 ABI method
+   *
+  * Pay out everything the claim ledger owes the sender in one transfer.
+
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static claim(params: CallParams<TrustVariationArgs['obj']['claim()uint64'] | TrustVariationArgs['tuple']['claim()uint64']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'claim()uint64' as const,
+      args: Array.isArray(params.args) ? params.args : [],
+    }
+  }
   /**
    * Constructs a no op call for the withdraw_escrow()void ABI method
    *
@@ -573,6 +1009,23 @@ export abstract class TrustVariationParamsFactory {
       args: Array.isArray(params.args) ? params.args : [],
     }
   }
+  /**
+   * Constructs a no op call for the get_player_state(address)((uint8,uint8,uint32),uint8,(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8),(uint64,uint64,uint64,uint64,uint64,uint8,uint64)) ABI method
+   *
+  * Participant record, their match and the variation config in one call.
+  Unknown addresses get enrolled == 0; match is zeroed when has_match == 0, which includes an assigned player whose m_ box sweep_boxes has deleted.
+
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static getPlayerState(params: CallParams<TrustVariationArgs['obj']['get_player_state(address)((uint8,uint8,uint32),uint8,(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8),(uint64,uint64,uint64,uint64,uint64,uint8,uint64))'] | TrustVariationArgs['tuple']['get_player_state(address)((uint8,uint8,uint32),uint8,(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8),(uint64,uint64,uint64,uint64,uint64,uint8,uint64))']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'get_player_state(address)((uint8,uint8,uint32),uint8,(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8),(uint64,uint64,uint64,uint64,uint64,uint8,uint64))' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.addr],
+    }
+  }
   /**
    * Constructs a no op call for the get_match(uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8) ABI method
    *
@@ -586,6 +1039,23 @@ export abstract class TrustVariationParamsFactory {
       args: Array.isArray(params.args) ? params.args : [params.args.matchId],
     }
   }
+  /**
+   * Constructs a no op call for the get_matches(uint32,uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)[] ABI method
+   *
+  * Matches start .. start + count - 1, capped at MATCHES_PAGE_SIZE ids and
+  at match_count. Match ids whose m_ box was swept are skipped, so a short page does not mean the end: continue from start + min(count, MATCHES_PAGE_SIZE) while that is below match_count.
+
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static getMatches(params: CallParams<TrustVariationArgs['obj']['get_matches(uint32,uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)[]'] | TrustVariationArgs['tuple']['get_matches(uint32,uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)[]']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'get_matches(uint32,uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)[]' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.start, params.args.count],
+    }
+  }
   /**
    * Constructs a no op call for the get_player_match(address)uint32 ABI method
    *
@@ -599,6 +1069,61 @@ export abstract class TrustVariationParamsFactory {
       args: Array.isArray(params.args) ? params.args : [params.args.addr],
     }
   }
+  /**
+   * Constructs a no op call for the get_roster_flags(uint32)uint8 ABI method
+   *
+  * ROSTER_ENROLLED | ROSTER_ASSIGNED bits for a roster user_id.
+
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static getRosterFlags(params: CallParams<TrustVariationArgs['obj']['get_roster_flags(uint32)uint8'] | TrustVariationArgs['tuple']['get_roster_flags(uint32)uint8']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'get_roster_flags(uint32)uint8' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.userId],
+    }
+  }
+  /**
+   * Constructs a no op call for the get_roster_count()uint64 ABI method
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static getRosterCount(params: CallParams<TrustVariationArgs['obj']['get_roster_count()uint64'] | TrustVariationArgs['tuple']['get_roster_count()uint64']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'get_roster_count()uint64' as const,
+      args: Array.isArray(params.args) ? params.args : [],
+    }
+  }
+  /**
+   * Constructs a no op call for the get_stats()(uint64,uint64,uint64,uint128,uint64,uint128,uint64,uint128,uint64,uint128) ABI method
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static getStats(params: CallParams<TrustVariationArgs['obj']['get_stats()(uint64,uint64,uint64,uint128,uint64,uint128,uint64,uint128,uint64,uint128)'] | TrustVariationArgs['tuple']['get_stats()(uint64,uint64,uint64,uint128,uint64,uint128,uint64,uint128,uint64,uint128)']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'get_stats()(uint64,uint64,uint64,uint128,uint64,uint128,uint64,uint128,uint64,uint128)' as const,
+      args: Array.isArray(params.args) ? params.args : [],
+    }
+  }
+  /**
+   * Constructs a no op call for the get_claimable(address)uint64 ABI method
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static getClaimable(params: CallParams<TrustVariationArgs['obj']['get_claimable(address)uint64'] | TrustVariationArgs['tuple']['get_claimable(address)uint64']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'get_claimable(address)uint64' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.addr],
+    }
+  }
   /**
    * Constructs a no op call for the get_participant_count()uint64 ABI method
    *
@@ -878,6 +1403,20 @@ export class TrustVariationClient {
       return this.appClient.params.call(TrustVariationParamsFactory.recordEscrow(params))
     },
 
+    /**
+     * Makes a call to the TrustVariation smart contract using the `enable_treasury_funding()void` ABI method.
+     *
+    * Called by TrustExperiments right after create for treasury-funded
+    variations: instead of holding a prefunded escrow, the variation draws each payout shortfall from the experiment treasury when it is needed.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    enableTreasuryFunding: (params: CallParams<TrustVariationArgs['obj']['enable_treasury_funding()void'] | TrustVariationArgs['tuple']['enable_treasury_funding()void']> & { onComplete?: OnApplicationComplete.NoOp } = {args: []}) => {
+      return this.appClient.params.call(TrustVariationParamsFactory.enableTreasuryFunding(params))
+    },
+
     /**
      * Makes a call to the TrustVariation smart contract using the `end_variation()void` ABI method.
      *
@@ -888,6 +1427,49 @@ export class TrustVariationClient {
       return this.appClient.params.call(TrustVariationParamsFactory.endVariation(params))
     },
 
+    /**
+     * Makes a call to the TrustVariation smart contract using the `sweep_boxes(uint8,byte[][])uint64` ABI method.
+     *
+    * Delete boxes of one SWEEP_* kind from an ended variation and refund
+    their MBR to the owner in one payment; returns the amount. keys are the box keys without prefix (32-byte address or 4-byte uint32). Missing keys and matches with an unsettled deferred payout are skipped, so sweeps can be retried. Swept data is gone from get_match/get_matches; the events remain the record. The payment also returns the MBR of claim boxes claimed since the last refund, so a call with no keys collects just that.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    sweepBoxes: (params: CallParams<TrustVariationArgs['obj']['sweep_boxes(uint8,byte[][])uint64'] | TrustVariationArgs['tuple']['sweep_boxes(uint8,byte[][])uint64']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.params.call(TrustVariationParamsFactory.sweepBoxes(params))
+    },
+
+    /**
+     * Makes a call to the TrustVariation smart contract using the `set_settlement_mode(uint8)void` ABI method.
+     *
+    * SETTLEMENT_IMMEDIATE pays both players inside submit_trustee_decision.
+    SETTLEMENT_DEFERRED only records the payouts; the owner pushes them later in bulk with settle(). SETTLEMENT_CLAIM credits them to the claim ledger and each player pulls their balance with claim().
+    The mode is fixed once the first match exists, because match MBR depends on it (claim boxes are prepaid at match creation).
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    setSettlementMode: (params: CallParams<TrustVariationArgs['obj']['set_settlement_mode(uint8)void'] | TrustVariationArgs['tuple']['set_settlement_mode(uint8)void']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.params.call(TrustVariationParamsFactory.setSettlementMode(params))
+    },
+
+    /**
+     * Makes a call to the TrustVariation smart contract using the `enable_auto_match()void` ABI method.
+     *
+    * Record every later enrollment's position in an o_ box so auto_match can
+    pair in enrollment order. Must precede the first enrollment, since earlier participants would have no position; each enrollment then costs PARTICIPANT_MBR + ORDER_BOX_MBR.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    enableAutoMatch: (params: CallParams<TrustVariationArgs['obj']['enable_auto_match()void'] | TrustVariationArgs['tuple']['enable_auto_match()void']> & { onComplete?: OnApplicationComplete.NoOp } = {args: []}) => {
+      return this.appClient.params.call(TrustVariationParamsFactory.enableAutoMatch(params))
+    },
+
     /**
      * Makes a call to the TrustVariation smart contract using the `add_participants(address[],pay)void` ABI method.
      *
@@ -908,6 +1490,48 @@ export class TrustVariationClient {
       return this.appClient.params.call(TrustVariationParamsFactory.selfEnroll(params))
     },
 
+    /**
+     * Makes a call to the TrustVariation smart contract using the `self_enroll_grouped(appl,pay)void` ABI method.
+     *
+    * self_enroll without the inner call: the sender puts their own
+    BxHiveRegistry.get_user(sender) call in the group instead. get_user fails for unregistered accounts and groups are atomic, so its presence proves registration at the minimum fee; its return log carries the user_id that is checked against the roster.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    selfEnrollGrouped: (params: CallParams<TrustVariationArgs['obj']['self_enroll_grouped(appl,pay)void'] | TrustVariationArgs['tuple']['self_enroll_grouped(appl,pay)void']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.params.call(TrustVariationParamsFactory.selfEnrollGrouped(params))
+    },
+
+    /**
+     * Makes a call to the TrustVariation smart contract using the `self_enroll_with_proof(uint32,byte[],pay)void` ABI method.
+     *
+    * self_enroll without any registry call: proof is the sender's path in
+    the registry member tree (registry/membership.py member_proof), checked against the registry's member root globals read directly. The hashes need about 1,200 opcodes; pool them with another app call in the group or pay one extra minimum fee for the op-up.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    selfEnrollWithProof: (params: CallParams<TrustVariationArgs['obj']['self_enroll_with_proof(uint32,byte[],pay)void'] | TrustVariationArgs['tuple']['self_enroll_with_proof(uint32,byte[],pay)void']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.params.call(TrustVariationParamsFactory.selfEnrollWithProof(params))
+    },
+
+    /**
+     * Makes a call to the TrustVariation smart contract using the `enroll_user_ids(uint32[],pay)void` ABI method.
+     *
+    * Enroll registry users into the roster bitmap instead of p_ boxes. The
+    bitmap grows to cover the highest user_id; the MBR payment must cover the added bytes (plus ROSTER_BOX_MBR the first time). No per-user event is emitted, so large batches stay within the log limits. Roster users count towards max_participants; ones that also hold a p_ box are rejected by create_match_by_ids, and self-enrollment rejects roster user_ids.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    enrollUserIds: (params: CallParams<TrustVariationArgs['obj']['enroll_user_ids(uint32[],pay)void'] | TrustVariationArgs['tuple']['enroll_user_ids(uint32[],pay)void']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.params.call(TrustVariationParamsFactory.enrollUserIds(params))
+    },
+
     /**
      * Makes a call to the TrustVariation smart contract using the `create_match(address,address,pay)uint32` ABI method.
      *
@@ -918,6 +1542,48 @@ export class TrustVariationClient {
       return this.appClient.params.call(TrustVariationParamsFactory.createMatch(params))
     },
 
+    /**
+     * Makes a call to the TrustVariation smart contract using the `create_matches((address,address)[],pay)uint32` ABI method.
+     *
+    * Pair several (investor, trustee) tuples in one call, funded by a single
+    aggregate MBR payment. Match IDs are assigned sequentially; returns the first one. Emits a single MatchesCreated for the whole batch.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    createMatches: (params: CallParams<TrustVariationArgs['obj']['create_matches((address,address)[],pay)uint32'] | TrustVariationArgs['tuple']['create_matches((address,address)[],pay)uint32']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.params.call(TrustVariationParamsFactory.createMatches(params))
+    },
+
+    /**
+     * Makes a call to the TrustVariation smart contract using the `auto_match(uint64,pay)uint64` ABI method.
+     *
+    * Pair up to n unassigned participants in enrollment order, starting at
+    match_cursor. Within a pair the earlier enrollee is the investor and the later one the trustee; participants already paired via create_match are skipped. An odd leftover stays unpaired and the cursor parks on it so the next call picks it up. MBR is charged for n / 2 matches up front. Requires enable_auto_match. Emits one MatchesCreated and returns the number of matches created.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    autoMatch: (params: CallParams<TrustVariationArgs['obj']['auto_match(uint64,pay)uint64'] | TrustVariationArgs['tuple']['auto_match(uint64,pay)uint64']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.params.call(TrustVariationParamsFactory.autoMatch(params))
+    },
+
+    /**
+     * Makes a call to the TrustVariation smart contract using the `create_match_by_ids(uint32,address,uint32,address,pay)uint32` ABI method.
+     *
+    * Pair two roster participants. Each address is checked against its
+    user_id in BxHiveRegistry, since the roster only stores flags. Roster players have no p_ box: they find their match through the MatchCreated event or get_matches rather than get_player_match.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    createMatchByIds: (params: CallParams<TrustVariationArgs['obj']['create_match_by_ids(uint32,address,uint32,address,pay)uint32'] | TrustVariationArgs['tuple']['create_match_by_ids(uint32,address,uint32,address,pay)uint32']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.params.call(TrustVariationParamsFactory.createMatchByIds(params))
+    },
+
     /**
      * Makes a call to the TrustVariation smart contract using the `close_registration()void` ABI method.
      *
@@ -948,6 +1614,33 @@ export class TrustVariationClient {
       return this.appClient.params.call(TrustVariationParamsFactory.submitTrusteeDecision(params))
     },
 
+    /**
+     * Makes a call to the TrustVariation smart contract using the `settle(uint32[])void` ABI method.
+     *
+    * Push the recorded payouts of completed, unpaid matches, at most
+    MAX_SETTLE_PER_CALL per call. Each match costs two inner transactions, so one group (four settle calls pooling their budget) can settle up to 128.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    settle: (params: CallParams<TrustVariationArgs['obj']['settle(uint32[])void'] | TrustVariationArgs['tuple']['settle(uint32[])void']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.params.call(TrustVariationParamsFactory.settle(params))
+    },
+
+    /**
+     * Makes a call to the TrustVariation smart contract using the `claim()uint64` ABI method.
+     *
+    * Pay out everything the claim ledger owes the sender in one transfer.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    claim: (params: CallParams<TrustVariationArgs['obj']['claim()uint64'] | TrustVariationArgs['tuple']['claim()uint64']> & { onComplete?: OnApplicationComplete.NoOp } = {args: []}) => {
+      return this.appClient.params.call(TrustVariationParamsFactory.claim(params))
+    },
+
     /**
      * Makes a call to the TrustVariation smart contract using the `withdraw_escrow()void` ABI method.
      *
@@ -970,6 +1663,22 @@ export class TrustVariationClient {
       return this.appClient.params.call(TrustVariationParamsFactory.getConfig(params))
     },
 
+    /**
+     * Makes a call to the TrustVariation smart contract using the `get_player_state(address)((uint8,uint8,uint32),uint8,(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8),(uint64,uint64,uint64,uint64,uint64,uint8,uint64))` ABI method.
+     *
+    * Participant record, their match and the variation config in one call.
+    Unknown addresses get enrolled == 0; match is zeroed when has_match == 0, which includes an assigned player whose m_ box sweep_boxes has deleted.
+
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    getPlayerState: (params: CallParams<TrustVariationArgs['obj']['get_player_state(address)((uint8,uint8,uint32),uint8,(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8),(uint64,uint64,uint64,uint64,uint64,uint8,uint64))'] | TrustVariationArgs['tuple']['get_player_state(address)((uint8,uint8,uint32),uint8,(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8),(uint64,uint64,uint64,uint64,uint64,uint8,uint64))']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.params.call(TrustVariationParamsFactory.getPlayerState(params))
+    },
+
     /**
      * Makes a call to the TrustVariation smart contract using the `get_match(uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)` ABI method.
      * 
@@ -982,6 +1691,22 @@ export class TrustVariationClient {
       return this.appClient.params.call(TrustVariationParamsFactory.getMatch(params))
     },
 
+    /**
+     * Makes a call to the TrustVariation smart contract using the `get_matches(uint32,uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)[]` ABI method.
+     *
+    * Matches start .. start + count - 1, capped at MATCHES_PAGE_SIZE ids and
+    at match_count. Match ids whose m_ box was swept are skipped, so a short page does not mean the end: continue from start + min(count, MATCHES_PAGE_SIZE) while that is below match_count.
+
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    getMatches: (params: CallParams<TrustVariationArgs['obj']['get_matches(uint32,uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)[]'] | TrustVariationArgs['tuple']['get_matches(uint32,uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)[]']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.params.call(TrustVariationParamsFactory.getMatches(params))
+    },
+
     /**
      * Makes a call to the TrustVariation smart contract using the `get_player_match(address)uint32` ABI method.
      * 
@@ -994,6 +1719,57 @@ export class TrustVariationClient {
       return this.appClient.params.call(TrustVariationParamsFactory.getPlayerMatch(params))
     },
 
+    /**
+     * Makes a call to the TrustVariation smart contract using the `get_roster_flags(uint32)uint8` ABI method.
+     *
+    * ROSTER_ENROLLED | ROSTER_ASSIGNED bits for a roster user_id.
+
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    getRosterFlags: (params: CallParams<TrustVariationArgs['obj']['get_roster_flags(uint32)uint8'] | TrustVariationArgs['tuple']['get_roster_flags(uint32)uint8']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.params.call(TrustVariationParamsFactory.getRosterFlags(params))
+    },
+
+    /**
+     * Makes a call to the TrustVariation smart contract using the `get_roster_count()uint64` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    getRosterCount: (params: CallParams<TrustVariationArgs['obj']['get_roster_count()uint64'] | TrustVariationArgs['tuple']['get_roster_count()uint64']> & { onComplete?: OnApplicationComplete.NoOp } = {args: []}) => {
+      return this.appClient.params.call(TrustVariationParamsFactory.getRosterCount(params))
+    },
+
+    /**
+     * Makes a call to the TrustVariation smart contract using the `get_stats()(uint64,uint64,uint64,uint128,uint64,uint128,uint64,uint128,uint64,uint128)` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    getStats: (params: CallParams<TrustVariationArgs['obj']['get_stats()(uint64,uint64,uint64,uint128,uint64,uint128,uint64,uint128,uint64,uint128)'] | TrustVariationArgs['tuple']['get_stats()(uint64,uint64,uint64,uint128,uint64,uint128,uint64,uint128,uint64,uint128)']> & { onComplete?: OnApplicationComplete.NoOp } = {args: []}) => {
+      return this.appClient.params.call(TrustVariationParamsFactory.getStats(params))
+    },
+
+    /**
+     * Makes a call to the TrustVariation smart contract using the `get_claimable(address)uint64` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    getClaimable: (params: CallParams<TrustVariationArgs['obj']['get_claimable(address)uint64'] | TrustVariationArgs['tuple']['get_claimable(address)uint64']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.params.call(TrustVariationParamsFactory.getClaimable(params))
+    },
+
     /**
      * Makes a call to the TrustVariation smart contract using the `get_participant_count()uint64` ABI method.
      * 
@@ -1054,6 +1830,20 @@ export class TrustVariationClient {
       return this.appClient.createTransaction.call(TrustVariationParamsFactory.recordEscrow(params))
     },
 
+    /**
+     * Makes a call to the TrustVariation smart contract using the `enable_treasury_funding()void` ABI method.
+     *
+    * Called by TrustExperiments right after create for treasury-funded
+    variations: instead of holding a prefunded escrow, the variation draws each payout shortfall from the experiment treasury when it is needed.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    enableTreasuryFunding: (params: CallParams<TrustVariationArgs['obj']['enable_treasury_funding()void'] | TrustVariationArgs['tuple']['enable_treasury_funding()void']> & { onComplete?: OnApplicationComplete.NoOp } = {args: []}) => {
+      return this.appClient.createTransaction.call(TrustVariationParamsFactory.enableTreasuryFunding(params))
+    },
+
     /**
      * Makes a call to the TrustVariation smart contract using the `end_variation()void` ABI method.
      *
@@ -1065,141 +1855,378 @@ export class TrustVariationClient {
     },
 
     /**
-     * Makes a call to the TrustVariation smart contract using the `add_participants(address[],pay)void` ABI method.
+     * Makes a call to the TrustVariation smart contract using the `sweep_boxes(uint8,byte[][])uint64` ABI method.
+     *
+    * Delete boxes of one SWEEP_* kind from an ended variation and refund
+    their MBR to the owner in one payment; returns the amount. keys are the box keys without prefix (32-byte address or 4-byte uint32). Missing keys and matches with an unsettled deferred payout are skipped, so sweeps can be retried. Swept data is gone from get_match/get_matches; the events remain the record. The payment also returns the MBR of claim boxes claimed since the last refund, so a call with no keys collects just that.
+
      *
      * @param params The params for the smart contract call
      * @returns The call transaction
      */
-    addParticipants: (params: CallParams<TrustVariationArgs['obj']['add_participants(address[],pay)void'] | TrustVariationArgs['tuple']['add_participants(address[],pay)void']> & { onComplete?: OnApplicationComplete.NoOp }) => {
-      return this.appClient.createTransaction.call(TrustVariationParamsFactory.addParticipants(params))
+    sweepBoxes: (params: CallParams<TrustVariationArgs['obj']['sweep_boxes(uint8,byte[][])uint64'] | TrustVariationArgs['tuple']['sweep_boxes(uint8,byte[][])uint64']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.createTransaction.call(TrustVariationParamsFactory.sweepBoxes(params))
     },
 
     /**
-     * Makes a call to the TrustVariation smart contract using the `self_enroll(pay)void` ABI method.
+     * Makes a call to the TrustVariation smart contract using the `set_settlement_mode(uint8)void` ABI method.
+     *
+    * SETTLEMENT_IMMEDIATE pays both players inside submit_trustee_decision.
+    SETTLEMENT_DEFERRED only records the payouts; the owner pushes them later in bulk with settle(). SETTLEMENT_CLAIM credits them to the claim ledger and each player pulls their balance with claim().
+    The mode is fixed once the first match exists, because match MBR depends on it (claim boxes are prepaid at match creation).
+
      *
      * @param params The params for the smart contract call
      * @returns The call transaction
      */
-    selfEnroll: (params: CallParams<TrustVariationArgs['obj']['self_enroll(pay)void'] | TrustVariationArgs['tuple']['self_enroll(pay)void']> & { onComplete?: OnApplicationComplete.NoOp }) => {
-      return this.appClient.createTransaction.call(TrustVariationParamsFactory.selfEnroll(params))
+    setSettlementMode: (params: CallParams<TrustVariationArgs['obj']['set_settlement_mode(uint8)void'] | TrustVariationArgs['tuple']['set_settlement_mode(uint8)void']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.createTransaction.call(TrustVariationParamsFactory.setSettlementMode(params))
     },
 
     /**
-     * Makes a call to the TrustVariation smart contract using the `create_match(address,address,pay)uint32` ABI method.
+     * Makes a call to the TrustVariation smart contract using the `enable_auto_match()void` ABI method.
+     *
+    * Record every later enrollment's position in an o_ box so auto_match can
+    pair in enrollment order. Must precede the first enrollment, since earlier participants would have no position; each enrollment then costs PARTICIPANT_MBR + ORDER_BOX_MBR.
+
      *
      * @param params The params for the smart contract call
      * @returns The call transaction
      */
-    createMatch: (params: CallParams<TrustVariationArgs['obj']['create_match(address,address,pay)uint32'] | TrustVariationArgs['tuple']['create_match(address,address,pay)uint32']> & { onComplete?: OnApplicationComplete.NoOp }) => {
-      return this.appClient.createTransaction.call(TrustVariationParamsFactory.createMatch(params))
+    enableAutoMatch: (params: CallParams<TrustVariationArgs['obj']['enable_auto_match()void'] | TrustVariationArgs['tuple']['enable_auto_match()void']> & { onComplete?: OnApplicationComplete.NoOp } = {args: []}) => {
+      return this.appClient.createTransaction.call(TrustVariationParamsFactory.enableAutoMatch(params))
     },
 
     /**
-     * Makes a call to the TrustVariation smart contract using the `close_registration()void` ABI method.
+     * Makes a call to the TrustVariation smart contract using the `add_participants(address[],pay)void` ABI method.
      *
      * @param params The params for the smart contract call
      * @returns The call transaction
      */
-    closeRegistration: (params: CallParams<TrustVariationArgs['obj']['close_registration()void'] | TrustVariationArgs['tuple']['close_registration()void']> & { onComplete?: OnApplicationComplete.NoOp } = {args: []}) => {
-      return this.appClient.createTransaction.call(TrustVariationParamsFactory.closeRegistration(params))
+    addParticipants: (params: CallParams<TrustVariationArgs['obj']['add_participants(address[],pay)void'] | TrustVariationArgs['tuple']['add_participants(address[],pay)void']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.createTransaction.call(TrustVariationParamsFactory.addParticipants(params))
     },
 
     /**
-     * Makes a call to the TrustVariation smart contract using the `submit_investor_decision(uint32,uint64)void` ABI method.
+     * Makes a call to the TrustVariation smart contract using the `self_enroll(pay)void` ABI method.
      *
      * @param params The params for the smart contract call
      * @returns The call transaction
      */
-    submitInvestorDecision: (params: CallParams<TrustVariationArgs['obj']['submit_investor_decision(uint32,uint64)void'] | TrustVariationArgs['tuple']['submit_investor_decision(uint32,uint64)void']> & { onComplete?: OnApplicationComplete.NoOp }) => {
-      return this.appClient.createTransaction.call(TrustVariationParamsFactory.submitInvestorDecision(params))
+    selfEnroll: (params: CallParams<TrustVariationArgs['obj']['self_enroll(pay)void'] | TrustVariationArgs['tuple']['self_enroll(pay)void']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.createTransaction.call(TrustVariationParamsFactory.selfEnroll(params))
     },
 
     /**
-     * Makes a call to the TrustVariation smart contract using the `submit_trustee_decision(uint32,uint64)void` ABI method.
+     * Makes a call to the TrustVariation smart contract using the `self_enroll_grouped(appl,pay)void` ABI method.
+     *
+    * self_enroll without the inner call: the sender puts their own
+    BxHiveRegistry.get_user(sender) call in the group instead. get_user fails for unregistered accounts and groups are atomic, so its presence proves registration at the minimum fee; its return log carries the user_id that is checked against the roster.
+
      *
      * @param params The params for the smart contract call
      * @returns The call transaction
      */
-    submitTrusteeDecision: (params: CallParams<TrustVariationArgs['obj']['submit_trustee_decision(uint32,uint64)void'] | TrustVariationArgs['tuple']['submit_trustee_decision(uint32,uint64)void']> & { onComplete?: OnApplicationComplete.NoOp }) => {
-      return this.appClient.createTransaction.call(TrustVariationParamsFactory.submitTrusteeDecision(params))
+    selfEnrollGrouped: (params: CallParams<TrustVariationArgs['obj']['self_enroll_grouped(appl,pay)void'] | TrustVariationArgs['tuple']['self_enroll_grouped(appl,pay)void']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.createTransaction.call(TrustVariationParamsFactory.selfEnrollGrouped(params))
     },
 
     /**
-     * Makes a call to the TrustVariation smart contract using the `withdraw_escrow()void` ABI method.
+     * Makes a call to the TrustVariation smart contract using the `self_enroll_with_proof(uint32,byte[],pay)void` ABI method.
+     *
+    * self_enroll without any registry call: proof is the sender's path in
+    the registry member tree (registry/membership.py member_proof), checked against the registry's member root globals read directly. The hashes need about 1,200 opcodes; pool them with another app call in the group or pay one extra minimum fee for the op-up.
+
      *
      * @param params The params for the smart contract call
      * @returns The call transaction
      */
-    withdrawEscrow: (params: CallParams<TrustVariationArgs['obj']['withdraw_escrow()void'] | TrustVariationArgs['tuple']['withdraw_escrow()void']> & { onComplete?: OnApplicationComplete.NoOp } = {args: []}) => {
-      return this.appClient.createTransaction.call(TrustVariationParamsFactory.withdrawEscrow(params))
+    selfEnrollWithProof: (params: CallParams<TrustVariationArgs['obj']['self_enroll_with_proof(uint32,byte[],pay)void'] | TrustVariationArgs['tuple']['self_enroll_with_proof(uint32,byte[],pay)void']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.createTransaction.call(TrustVariationParamsFactory.selfEnrollWithProof(params))
     },
 
     /**
-     * Makes a call to the TrustVariation smart contract using the `get_config()(uint64,uint64,uint64,uint64,uint64,uint8,uint64)` ABI method.
-     * 
-     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     * Makes a call to the TrustVariation smart contract using the `enroll_user_ids(uint32[],pay)void` ABI method.
+     *
+    * Enroll registry users into the roster bitmap instead of p_ boxes. The
+    bitmap grows to cover the highest user_id; the MBR payment must cover the added bytes (plus ROSTER_BOX_MBR the first time). No per-user event is emitted, so large batches stay within the log limits. Roster users count towards max_participants; ones that also hold a p_ box are rejected by create_match_by_ids, and self-enrollment rejects roster user_ids.
+
      *
      * @param params The params for the smart contract call
      * @returns The call transaction
      */
-    getConfig: (params: CallParams<TrustVariationArgs['obj']['get_config()(uint64,uint64,uint64,uint64,uint64,uint8,uint64)'] | TrustVariationArgs['tuple']['get_config()(uint64,uint64,uint64,uint64,uint64,uint8,uint64)']> & { onComplete?: OnApplicationComplete.NoOp } = {args: []}) => {
-      return this.appClient.createTransaction.call(TrustVariationParamsFactory.getConfig(params))
+    enrollUserIds: (params: CallParams<TrustVariationArgs['obj']['enroll_user_ids(uint32[],pay)void'] | TrustVariationArgs['tuple']['enroll_user_ids(uint32[],pay)void']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.createTransaction.call(TrustVariationParamsFactory.enrollUserIds(params))
     },
 
     /**
-     * Makes a call to the TrustVariation smart contract using the `get_match(uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)` ABI method.
-     * 
-     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     * Makes a call to the TrustVariation smart contract using the `create_match(address,address,pay)uint32` ABI method.
      *
      * @param params The params for the smart contract call
      * @returns The call transaction
      */
-    getMatch: (params: CallParams<TrustVariationArgs['obj']['get_match(uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)'] | TrustVariationArgs['tuple']['get_match(uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)']> & { onComplete?: OnApplicationComplete.NoOp }) => {
-      return this.appClient.createTransaction.call(TrustVariationParamsFactory.getMatch(params))
+    createMatch: (params: CallParams<TrustVariationArgs['obj']['create_match(address,address,pay)uint32'] | TrustVariationArgs['tuple']['create_match(address,address,pay)uint32']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.createTransaction.call(TrustVariationParamsFactory.createMatch(params))
     },
 
     /**
-     * Makes a call to the TrustVariation smart contract using the `get_player_match(address)uint32` ABI method.
-     * 
-     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     * Makes a call to the TrustVariation smart contract using the `create_matches((address,address)[],pay)uint32` ABI method.
+     *
+    * Pair several (investor, trustee) tuples in one call, funded by a single
+    aggregate MBR payment. Match IDs are assigned sequentially; returns the first one. Emits a single MatchesCreated for the whole batch.
+
      *
      * @param params The params for the smart contract call
      * @returns The call transaction
      */
-    getPlayerMatch: (params: CallParams<TrustVariationArgs['obj']['get_player_match(address)uint32'] | TrustVariationArgs['tuple']['get_player_match(address)uint32']> & { onComplete?: OnApplicationComplete.NoOp }) => {
-      return this.appClient.createTransaction.call(TrustVariationParamsFactory.getPlayerMatch(params))
+    createMatches: (params: CallParams<TrustVariationArgs['obj']['create_matches((address,address)[],pay)uint32'] | TrustVariationArgs['tuple']['create_matches((address,address)[],pay)uint32']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.createTransaction.call(TrustVariationParamsFactory.createMatches(params))
     },
 
     /**
-     * Makes a call to the TrustVariation smart contract using the `get_participant_count()uint64` ABI method.
-     * 
-     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     * Makes a call to the TrustVariation smart contract using the `auto_match(uint64,pay)uint64` ABI method.
+     *
+    * Pair up to n unassigned participants in enrollment order, starting at
+    match_cursor. Within a pair the earlier enrollee is the investor and the later one the trustee; participants already paired via create_match are skipped. An odd leftover stays unpaired and the cursor parks on it so the next call picks it up. MBR is charged for n / 2 matches up front. Requires enable_auto_match. Emits one MatchesCreated and returns the number of matches created.
+
      *
      * @param params The params for the smart contract call
      * @returns The call transaction
      */
-    getParticipantCount: (params: CallParams<TrustVariationArgs['obj']['get_participant_count()uint64'] | TrustVariationArgs['tuple']['get_participant_count()uint64']> & { onComplete?: OnApplicationComplete.NoOp } = {args: []}) => {
-      return this.appClient.createTransaction.call(TrustVariationParamsFactory.getParticipantCount(params))
+    autoMatch: (params: CallParams<TrustVariationArgs['obj']['auto_match(uint64,pay)uint64'] | TrustVariationArgs['tuple']['auto_match(uint64,pay)uint64']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.createTransaction.call(TrustVariationParamsFactory.autoMatch(params))
     },
 
     /**
-     * Makes a call to the TrustVariation smart contract using the `get_escrow_balance()uint64` ABI method.
-     * 
-     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     * Makes a call to the TrustVariation smart contract using the `create_match_by_ids(uint32,address,uint32,address,pay)uint32` ABI method.
+     *
+    * Pair two roster participants. Each address is checked against its
+    user_id in BxHiveRegistry, since the roster only stores flags. Roster players have no p_ box: they find their match through the MatchCreated event or get_matches rather than get_player_match.
+
      *
      * @param params The params for the smart contract call
      * @returns The call transaction
      */
-    getEscrowBalance: (params: CallParams<TrustVariationArgs['obj']['get_escrow_balance()uint64'] | TrustVariationArgs['tuple']['get_escrow_balance()uint64']> & { onComplete?: OnApplicationComplete.NoOp } = {args: []}) => {
-      return this.appClient.createTransaction.call(TrustVariationParamsFactory.getEscrowBalance(params))
+    createMatchByIds: (params: CallParams<TrustVariationArgs['obj']['create_match_by_ids(uint32,address,uint32,address,pay)uint32'] | TrustVariationArgs['tuple']['create_match_by_ids(uint32,address,uint32,address,pay)uint32']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.createTransaction.call(TrustVariationParamsFactory.createMatchByIds(params))
     },
 
-  }
-
-  /**
-   * Send calls to the current app
-   */
-  readonly send = {
+    /**
+     * Makes a call to the TrustVariation smart contract using the `close_registration()void` ABI method.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    closeRegistration: (params: CallParams<TrustVariationArgs['obj']['close_registration()void'] | TrustVariationArgs['tuple']['close_registration()void']> & { onComplete?: OnApplicationComplete.NoOp } = {args: []}) => {
+      return this.appClient.createTransaction.call(TrustVariationParamsFactory.closeRegistration(params))
+    },
+
+    /**
+     * Makes a call to the TrustVariation smart contract using the `submit_investor_decision(uint32,uint64)void` ABI method.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    submitInvestorDecision: (params: CallParams<TrustVariationArgs['obj']['submit_investor_decision(uint32,uint64)void'] | TrustVariationArgs['tuple']['submit_investor_decision(uint32,uint64)void']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.createTransaction.call(TrustVariationParamsFactory.submitInvestorDecision(params))
+    },
+
+    /**
+     * Makes a call to the TrustVariation smart contract using the `submit_trustee_decision(uint32,uint64)void` ABI method.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    submitTrusteeDecision: (params: CallParams<TrustVariationArgs['obj']['submit_trustee_decision(uint32,uint64)void'] | TrustVariationArgs['tuple']['submit_trustee_decision(uint32,uint64)void']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.createTransaction.call(TrustVariationParamsFactory.submitTrusteeDecision(params))
+    },
+
+    /**
+     * Makes a call to the TrustVariation smart contract using the `settle(uint32[])void` ABI method.
+     *
+    * Push the recorded payouts of completed, unpaid matches, at most
+    MAX_SETTLE_PER_CALL per call. Each match costs two inner transactions, so one group (four settle calls pooling their budget) can settle up to 128.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    settle: (params: CallParams<TrustVariationArgs['obj']['settle(uint32[])void'] | TrustVariationArgs['tuple']['settle(uint32[])void']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.createTransaction.call(TrustVariationParamsFactory.settle(params))
+    },
+
+    /**
+     * Makes a call to the TrustVariation smart contract using the `claim()uint64` ABI method.
+     *
+    * Pay out everything the claim ledger owes the sender in one transfer.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    claim: (params: CallParams<TrustVariationArgs['obj']['claim()uint64'] | TrustVariationArgs['tuple']['claim()uint64']> & { onComplete?: OnApplicationComplete.NoOp } = {args: []}) => {
+      return this.appClient.createTransaction.call(TrustVariationParamsFactory.claim(params))
+    },
+
+    /**
+     * Makes a call to the TrustVariation smart contract using the `withdraw_escrow()void` ABI method.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    withdrawEscrow: (params: CallParams<TrustVariationArgs['obj']['withdraw_escrow()void'] | TrustVariationArgs['tuple']['withdraw_escrow()void']> & { onComplete?: OnApplicationComplete.NoOp } = {args: []}) => {
+      return this.appClient.createTransaction.call(TrustVariationParamsFactory.withdrawEscrow(params))
+    },
+
+    /**
+     * Makes a call to the TrustVariation smart contract using the `get_config()(uint64,uint64,uint64,uint64,uint64,uint8,uint64)` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    getConfig: (params: CallParams<TrustVariationArgs['obj']['get_config()(uint64,uint64,uint64,uint64,uint64,uint8,uint64)'] | TrustVariationArgs['tuple']['get_config()(uint64,uint64,uint64,uint64,uint64,uint8,uint64)']> & { onComplete?: OnApplicationComplete.NoOp } = {args: []}) => {
+      return this.appClient.createTransaction.call(TrustVariationParamsFactory.getConfig(params))
+    },
+
+    /**
+     * Makes a call to the TrustVariation smart contract using the `get_player_state(address)((uint8,uint8,uint32),uint8,(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8),(uint64,uint64,uint64,uint64,uint64,uint8,uint64))` ABI method.
+     *
+    * Participant record, their match and the variation config in one call.
+    Unknown addresses get enrolled == 0; match is zeroed when has_match == 0, which includes an assigned player whose m_ box sweep_boxes has deleted.
+
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    getPlayerState: (params: CallParams<TrustVariationArgs['obj']['get_player_state(address)((uint8,uint8,uint32),uint8,(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8),(uint64,uint64,uint64,uint64,uint64,uint8,uint64))'] | TrustVariationArgs['tuple']['get_player_state(address)((uint8,uint8,uint32),uint8,(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8),(uint64,uint64,uint64,uint64,uint64,uint8,uint64))']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.createTransaction.call(TrustVariationParamsFactory.getPlayerState(params))
+    },
+
+    /**
+     * Makes a call to the TrustVariation smart contract using the `get_match(uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    getMatch: (params: CallParams<TrustVariationArgs['obj']['get_match(uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)'] | TrustVariationArgs['tuple']['get_match(uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.createTransaction.call(TrustVariationParamsFactory.getMatch(params))
+    },
+
+    /**
+     * Makes a call to the TrustVariation smart contract using the `get_matches(uint32,uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)[]` ABI method.
+     *
+    * Matches start .. start + count - 1, capped at MATCHES_PAGE_SIZE ids and
+    at match_count. Match ids whose m_ box was swept are skipped, so a short page does not mean the end: continue from start + min(count, MATCHES_PAGE_SIZE) while that is below match_count.
+
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    getMatches: (params: CallParams<TrustVariationArgs['obj']['get_matches(uint32,uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)[]'] | TrustVariationArgs['tuple']['get_matches(uint32,uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)[]']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.createTransaction.call(TrustVariationParamsFactory.getMatches(params))
+    },
+
+    /**
+     * Makes a call to the TrustVariation smart contract using the `get_player_match(address)uint32` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    getPlayerMatch: (params: CallParams<TrustVariationArgs['obj']['get_player_match(address)uint32'] | TrustVariationArgs['tuple']['get_player_match(address)uint32']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.createTransaction.call(TrustVariationParamsFactory.getPlayerMatch(params))
+    },
+
+    /**
+     * Makes a call to the TrustVariation smart contract using the `get_roster_flags(uint32)uint8` ABI method.
+     *
+    * ROSTER_ENROLLED | ROSTER_ASSIGNED bits for a roster user_id.
+
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    getRosterFlags: (params: CallParams<TrustVariationArgs['obj']['get_roster_flags(uint32)uint8'] | TrustVariationArgs['tuple']['get_roster_flags(uint32)uint8']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.createTransaction.call(TrustVariationParamsFactory.getRosterFlags(params))
+    },
+
+    /**
+     * Makes a call to the TrustVariation smart contract using the `get_roster_count()uint64` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    getRosterCount: (params: CallParams<TrustVariationArgs['obj']['get_roster_count()uint64'] | TrustVariationArgs['tuple']['get_roster_count()uint64']> & { onComplete?: OnApplicationComplete.NoOp } = {args: []}) => {
+      return this.appClient.createTransaction.call(TrustVariationParamsFactory.getRosterCount(params))
+    },
+
+    /**
+     * Makes a call to the TrustVariation smart contract using the `get_stats()(uint64,uint64,uint64,uint128,uint64,uint128,uint64,uint128,uint64,uint128)` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    getStats: (params: CallParams<TrustVariationArgs['obj']['get_stats()(uint64,uint64,uint64,uint128,uint64,uint128,uint64,uint128,uint64,uint128)'] | TrustVariationArgs['tuple']['get_stats()(uint64,uint64,uint64,uint128,uint64,uint128,uint64,uint128,uint64,uint128)']> & { onComplete?: OnApplicationComplete.NoOp } = {args: []}) => {
+      return this.appClient.createTransaction.call(TrustVariationParamsFactory.getStats(params))
+    },
+
+    /**
+     * Makes a call to the TrustVariation smart contract using the `get_claimable(address)uint64` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    getClaimable: (params: CallParams<TrustVariationArgs['obj']['get_claimable(address)uint64'] | TrustVariationArgs['tuple']['get_claimable(address)uint64']> & { onComplete?: OnApplicationComplete.NoOp }) => {
+      return this.appClient.createTransaction.call(TrustVariationParamsFactory.getClaimable(params))
+    },
+
+    /**
+     * Makes a call to the TrustVariation smart contract using the `get_participant_count()uint64` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    getParticipantCount: (params: CallParams<TrustVariationArgs['obj']['get_participant_count()uint64'] | TrustVariationArgs['tuple']['get_participant_count()uint64']> & { onComplete?: OnApplicationComplete.NoOp } = {args: []}) => {
+      return this.appClient.createTransaction.call(TrustVariationParamsFactory.getParticipantCount(params))
+    },
+
+    /**
+     * Makes a call to the TrustVariation smart contract using the `get_escrow_balance()uint64` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    getEscrowBalance: (params: CallParams<TrustVariationArgs['obj']['get_escrow_balance()uint64'] | TrustVariationArgs['tuple']['get_escrow_balance()uint64']> & { onComplete?: OnApplicationComplete.NoOp } = {args: []}) => {
+      return this.appClient.createTransaction.call(TrustVariationParamsFactory.getEscrowBalance(params))
+    },
+
+  }
+
+  /**
+   * Send calls to the current app
+   */
+  readonly send = {
     /**
      * Makes a clear_state call to an existing instance of the TrustVariation smart contract.
      *
@@ -1232,6 +2259,21 @@ export class TrustVariationClient {
       return {...result, return: result.return as unknown as (undefined | TrustVariationReturns['record_escrow(uint64)void'])}
     },
 
+    /**
+     * Makes a call to the TrustVariation smart contract using the `enable_treasury_funding()void` ABI method.
+     *
+    * Called by TrustExperiments right after create for treasury-funded
+    variations: instead of holding a prefunded escrow, the variation draws each payout shortfall from the experiment treasury when it is needed.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    enableTreasuryFunding: async (params: CallParams<TrustVariationArgs['obj']['enable_treasury_funding()void'] | TrustVariationArgs['tuple']['enable_treasury_funding()void']> & SendParams & { onComplete?: OnApplicationComplete.NoOp } = {args: []}) => {
+      const result = await this.appClient.send.call(TrustVariationParamsFactory.enableTreasuryFunding(params))
+      return {...result, return: result.return as unknown as (undefined | TrustVariationReturns['enable_treasury_funding()void'])}
+    },
+
     /**
      * Makes a call to the TrustVariation smart contract using the `end_variation()void` ABI method.
      *
@@ -1243,6 +2285,52 @@ export class TrustVariationClient {
       return {...result, return: result.return as unknown as (undefined | TrustVariationReturns['end_variation()void'])}
     },
 
+    /**
+     * Makes a call to the TrustVariation smart contract using the `sweep_boxes(uint8,byte[][])uint64` ABI method.
+     *
+    * Delete boxes of one SWEEP_* kind from an ended variation and refund
+    their MBR to the owner in one payment; returns the amount. keys are the box keys without prefix (32-byte address or 4-byte uint32). Missing keys and matches with an unsettled deferred payout are skipped, so sweeps can be retried. Swept data is gone from get_match/get_matches; the events remain the record. The payment also returns the MBR of claim boxes claimed since the last refund, so a call with no keys collects just that.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    sweepBoxes: async (params: CallParams<TrustVariationArgs['obj']['sweep_boxes(uint8,byte[][])uint64'] | TrustVariationArgs['tuple']['sweep_boxes(uint8,byte[][])uint64']> & SendParams & { onComplete?: OnApplicationComplete.NoOp }) => {
+      const result = await this.appClient.send.call(TrustVariationParamsFactory.sweepBoxes(params))
+      return {...result, return: result.return as unknown as (undefined | TrustVariationReturns['sweep_boxes(uint8,byte[][])uint64'])}
+    },
+
+    /**
+     * Makes a call to the TrustVariation smart contract using the `set_settlement_mode(uint8)void` ABI method.
+     *
+    * SETTLEMENT_IMMEDIATE pays both players inside submit_trustee_decision.
+    SETTLEMENT_DEFERRED only records the payouts; the owner pushes them later in bulk with settle(). SETTLEMENT_CLAIM credits them to the claim ledger and each player pulls their balance with claim().
+    The mode is fixed once the first match exists, because match MBR depends on it (claim boxes are prepaid at match creation).
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    setSettlementMode: async (params: CallParams<TrustVariationArgs['obj']['set_settlement_mode(uint8)void'] | TrustVariationArgs['tuple']['set_settlement_mode(uint8)void']> & SendParams & { onComplete?: OnApplicationComplete.NoOp }) => {
+      const result = await this.appClient.send.call(TrustVariationParamsFactory.setSettlementMode(params))
+      return {...result, return: result.return as unknown as (undefined | TrustVariationReturns['set_settlement_mode(uint8)void'])}
+    },
+
+    /**
+     * Makes a call to the TrustVariation smart contract using the `enable_auto_match()void` ABI method.
+     *
+    * Record every later enrollment's position in an o_ box so auto_match can
+    pair in enrollment order. Must precede the first enrollment, since earlier participants would have no position; each enrollment then costs PARTICIPANT_MBR + ORDER_BOX_MBR.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    enableAutoMatch: async (params: CallParams<TrustVariationArgs['obj']['enable_auto_match()void'] | TrustVariationArgs['tuple']['enable_auto_match()void']> & SendParams & { onComplete?: OnApplicationComplete.NoOp } = {args: []}) => {
+      const result = await this.appClient.send.call(TrustVariationParamsFactory.enableAutoMatch(params))
+      return {...result, return: result.return as unknown as (undefined | TrustVariationReturns['enable_auto_match()void'])}
+    },
+
     /**
      * Makes a call to the TrustVariation smart contract using the `add_participants(address[],pay)void` ABI method.
      *
@@ -1265,6 +2353,51 @@ export class TrustVariationClient {
       return {...result, return: result.return as unknown as (undefined | TrustVariationReturns['self_enroll(pay)void'])}
     },
 
+    /**
+     * Makes a call to the TrustVariation smart contract using the `self_enroll_grouped(appl,pay)void` ABI method.
+     *
+    * self_enroll without the inner call: the sender puts their own
+    BxHiveRegistry.get_user(sender) call in the group instead. get_user fails for unregistered accounts and groups are atomic, so its presence proves registration at the minimum fee; its return log carries the user_id that is checked against the roster.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    selfEnrollGrouped: async (params: CallParams<TrustVariationArgs['obj']['self_enroll_grouped(appl,pay)void'] | TrustVariationArgs['tuple']['self_enroll_grouped(appl,pay)void']> & SendParams & { onComplete?: OnApplicationComplete.NoOp }) => {
+      const result = await this.appClient.send.call(TrustVariationParamsFactory.selfEnrollGrouped(params))
+      return {...result, return: result.return as unknown as (undefined | TrustVariationReturns['self_enroll_grouped(appl,pay)void'])}
+    },
+
+    /**
+     * Makes a call to the TrustVariation smart contract using the `self_enroll_with_proof(uint32,byte[],pay)void` ABI method.
+     *
+    * self_enroll without any registry call: proof is the sender's path in
+    the registry member tree (registry/membership.py member_proof), checked against the registry's member root globals read directly. The hashes need about 1,200 opcodes; pool them with another app call in the group or pay one extra minimum fee for the op-up.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    selfEnrollWithProof: async (params: CallParams<TrustVariationArgs['obj']['self_enroll_with_proof(uint32,byte[],pay)void'] | TrustVariationArgs['tuple']['self_enroll_with_proof(uint32,byte[],pay)void']> & SendParams & { onComplete?: OnApplicationComplete.NoOp }) => {
+      const result = await this.appClient.send.call(TrustVariationParamsFactory.selfEnrollWithProof(params))
+      return {...result, return: result.return as unknown as (undefined | TrustVariationReturns['self_enroll_with_proof(uint32,byte[],pay)void'])}
+    },
+
+    /**
+     * Makes a call to the TrustVariation smart contract using the `enroll_user_ids(uint32[],pay)void` ABI method.
+     *
+    * Enroll registry users into the roster bitmap instead of p_ boxes. The
+    bitmap grows to cover the highest user_id; the MBR payment must cover the added bytes (plus ROSTER_BOX_MBR the first time). No per-user event is emitted, so large batches stay within the log limits. Roster users count towards max_participants; ones that also hold a p_ box are rejected by create_match_by_ids, and self-enrollment rejects roster user_ids.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    enrollUserIds: async (params: CallParams<TrustVariationArgs['obj']['enroll_user_ids(uint32[],pay)void'] | TrustVariationArgs['tuple']['enroll_user_ids(uint32[],pay)void']> & SendParams & { onComplete?: OnApplicationComplete.NoOp }) => {
+      const result = await this.appClient.send.call(TrustVariationParamsFactory.enrollUserIds(params))
+      return {...result, return: result.return as unknown as (undefined | TrustVariationReturns['enroll_user_ids(uint32[],pay)void'])}
+    },
+
     /**
      * Makes a call to the TrustVariation smart contract using the `create_match(address,address,pay)uint32` ABI method.
      *
@@ -1276,6 +2409,51 @@ export class TrustVariationClient {
       return {...result, return: result.return as unknown as (undefined | TrustVariationReturns['create_match(address,address,pay)uint32'])}
     },
 
+    /**
+     * Makes a call to the TrustVariation smart contract using the `create_matches((address,address)[],pay)uint32` ABI method.
+     *
+    * Pair several (investor, trustee) tuples in one call, funded by a single
+    aggregate MBR payment. Match IDs are assigned sequentially; returns the first one. Emits a single MatchesCreated for the whole batch.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    createMatches: async (params: CallParams<TrustVariationArgs['obj']['create_matches((address,address)[],pay)uint32'] | TrustVariationArgs['tuple']['create_matches((address,address)[],pay)uint32']> & SendParams & { onComplete?: OnApplicationComplete.NoOp }) => {
+      const result = await this.appClient.send.call(TrustVariationParamsFactory.createMatches(params))
+      return {...result, return: result.return as unknown as (undefined | TrustVariationReturns['create_matches((address,address)[],pay)uint32'])}
+    },
+
+    /**
+     * Makes a call to the TrustVariation smart contract using the `auto_match(uint64,pay)uint64` ABI method.
+     *
+    * Pair up to n unassigned participants in enrollment order, starting at
+    match_cursor. Within a pair the earlier enrollee is the investor and the later one the trustee; participants already paired via create_match are skipped. An odd leftover stays unpaired and the cursor parks on it so the next call picks it up. MBR is charged for n / 2 matches up front. Requires enable_auto_match. Emits one MatchesCreated and returns the number of matches created.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    autoMatch: async (params: CallParams<TrustVariationArgs['obj']['auto_match(uint64,pay)uint64'] | TrustVariationArgs['tuple']['auto_match(uint64,pay)uint64']> & SendParams & { onComplete?: OnApplicationComplete.NoOp }) => {
+      const result = await this.appClient.send.call(TrustVariationParamsFactory.autoMatch(params))
+      return {...result, return: result.return as unknown as (undefined | TrustVariationReturns['auto_match(uint64,pay)uint64'])}
+    },
+
+    /**
+     * Makes a call to the TrustVariation smart contract using the `create_match_by_ids(uint32,address,uint32,address,pay)uint32` ABI method.
+     *
+    * Pair two roster participants. Each address is checked against its
+    user_id in BxHiveRegistry, since the roster only stores flags. Roster players have no p_ box: they find their match through the MatchCreated event or get_matches rather than get_player_match.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    createMatchByIds: async (params: CallParams<TrustVariationArgs['obj']['create_match_by_ids(uint32,address,uint32,address,pay)uint32'] | TrustVariationArgs['tuple']['create_match_by_ids(uint32,address,uint32,address,pay)uint32']> & SendParams & { onComplete?: OnApplicationComplete.NoOp }) => {
+      const result = await this.appClient.send.call(TrustVariationParamsFactory.createMatchByIds(params))
+      return {...result, return: result.return as unknown as (undefined | TrustVariationReturns['create_match_by_ids(uint32,address,uint32,address,pay)uint32'])}
+    },
+
     /**
      * Makes a call to the TrustVariation smart contract using the `close_registration()void` ABI method.
      *
@@ -1309,6 +2487,35 @@ export class TrustVariationClient {
       return {...result, return: result.return as unknown as (undefined | TrustVariationReturns['submit_trustee_decision(uint32,uint64)void'])}
     },
 
+    /**
+     * Makes a call to the TrustVariation smart contract using the `settle(uint32[])void` ABI method.
+     *
+    * Push the recorded payouts of completed, unpaid matches, at most
+    MAX_SETTLE_PER_CALL per call. Each match costs two inner transactions, so one group (four settle calls pooling their budget) can settle up to 128.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    settle: async (params: CallParams<TrustVariationArgs['obj']['settle(uint32[])void'] | TrustVariationArgs['tuple']['settle(uint32[])void']> & SendParams & { onComplete?: OnApplicationComplete.NoOp }) => {
+      const result = await this.appClient.send.call(TrustVariationParamsFactory.settle(params))
+      return {...result, return: result.return as unknown as (undefined | TrustVariationReturns['settle(uint32[])void'])}
+    },
+
+    /**
+     * Makes a call to the TrustVariation smart contract using the `claim()uint64` ABI method.
+     *
+    * Pay out everything the claim ledger owes the sender in one transfer.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    claim: async (params: CallParams<TrustVariationArgs['obj']['claim()uint64'] | TrustVariationArgs['tuple']['claim()uint64']> & SendParams & { onComplete?: OnApplicationComplete.NoOp } = {args: []}) => {
+      const result = await this.appClient.send.call(TrustVariationParamsFactory.claim(params))
+      return {...result, return: result.return as unknown as (undefined | TrustVariationReturns['claim()uint64'])}
+    },
+
     /**
      * Makes a call to the TrustVariation smart contract using the `withdraw_escrow()void` ABI method.
      *
@@ -1333,6 +2540,23 @@ export class TrustVariationClient {
       return {...result, return: result.return as unknown as (undefined | TrustVariationReturns['get_config()(uint64,uint64,uint64,uint64,uint64,uint8,uint64)'])}
     },
 
+    /**
+     * Makes a call to the TrustVariation smart contract using the `get_player_state(address)((uint8,uint8,uint32),uint8,(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8),(uint64,uint64,uint64,uint64,uint64,uint8,uint64))` ABI method.
+     *
+    * Participant record, their match and the variation config in one call.
+    Unknown addresses get enrolled == 0; match is zeroed when has_match == 0, which includes an assigned player whose m_ box sweep_boxes has deleted.
+
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    getPlayerState: async (params: CallParams<TrustVariationArgs['obj']['get_player_state(address)((uint8,uint8,uint32),uint8,(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8),(uint64,uint64,uint64,uint64,uint64,uint8,uint64))'] | TrustVariationArgs['tuple']['get_player_state(address)((uint8,uint8,uint32),uint8,(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8),(uint64,uint64,uint64,uint64,uint64,uint8,uint64))']> & SendParams & { onComplete?: OnApplicationComplete.NoOp }) => {
+      const result = await this.appClient.send.call(TrustVariationParamsFactory.getPlayerState(params))
+      return {...result, return: result.return as unknown as (undefined | TrustVariationReturns['get_player_state(address)((uint8,uint8,uint32),uint8,(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8),(uint64,uint64,uint64,uint64,uint64,uint8,uint64))'])}
+    },
+
     /**
      * Makes a call to the TrustVariation smart contract using the `get_match(uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)` ABI method.
      * 
@@ -1346,6 +2570,23 @@ export class TrustVariationClient {
       return {...result, return: result.return as unknown as (undefined | TrustVariationReturns['get_match(uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)'])}
     },
 
+    /**
+     * Makes a call to the TrustVariation smart contract using the `get_matches(uint32,uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)[]` ABI method.
+     *
+    * Matches start .. start + count - 1, capped at MATCHES_PAGE_SIZE ids and
+    at match_count. Match ids whose m_ box was swept are skipped, so a short page does not mean the end: continue from start + min(count, MATCHES_PAGE_SIZE) while that is below match_count.
+
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    getMatches: async (params: CallParams<TrustVariationArgs['obj']['get_matches(uint32,uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)[]'] | TrustVariationArgs['tuple']['get_matches(uint32,uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)[]']> & SendParams & { onComplete?: OnApplicationComplete.NoOp }) => {
+      const result = await this.appClient.send.call(TrustVariationParamsFactory.getMatches(params))
+      return {...result, return: result.return as unknown as (undefined | TrustVariationReturns['get_matches(uint32,uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)[]'])}
+    },
+
     /**
      * Makes a call to the TrustVariation smart contract using the `get_player_match(address)uint32` ABI method.
      * 
@@ -1359,6 +2600,61 @@ export class TrustVariationClient {
       return {...result, return: result.return as unknown as (undefined | TrustVariationReturns['get_player_match(address)uint32'])}
     },
 
+    /**
+     * Makes a call to the TrustVariation smart contract using the `get_roster_flags(uint32)uint8` ABI method.
+     *
+    * ROSTER_ENROLLED | ROSTER_ASSIGNED bits for a roster user_id.
+
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    getRosterFlags: async (params: CallParams<TrustVariationArgs['obj']['get_roster_flags(uint32)uint8'] | TrustVariationArgs['tuple']['get_roster_flags(uint32)uint8']> & SendParams & { onComplete?: OnApplicationComplete.NoOp }) => {
+      const result = await this.appClient.send.call(TrustVariationParamsFactory.getRosterFlags(params))
+      return {...result, return: result.return as unknown as (undefined | TrustVariationReturns['get_roster_flags(uint32)uint8'])}
+    },
+
+    /**
+     * Makes a call to the TrustVariation smart contract using the `get_roster_count()uint64` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    getRosterCount: async (params: CallParams<TrustVariationArgs['obj']['get_roster_count()uint64'] | TrustVariationArgs['tuple']['get_roster_count()uint64']> & SendParams & { onComplete?: OnApplicationComplete.NoOp } = {args: []}) => {
+      const result = await this.appClient.send.call(TrustVariationParamsFactory.getRosterCount(params))
+      return {...result, return: result.return as unknown as (undefined | TrustVariationReturns['get_roster_count()uint64'])}
+    },
+
+    /**
+     * Makes a call to the TrustVariation smart contract using the `get_stats()(uint64,uint64,uint64,uint128,uint64,uint128,uint64,uint128,uint64,uint128)` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    getStats: async (params: CallParams<TrustVariationArgs['obj']['get_stats()(uint64,uint64,uint64,uint128,uint64,uint128,uint64,uint128,uint64,uint128)'] | TrustVariationArgs['tuple']['get_stats()(uint64,uint64,uint64,uint128,uint64,uint128,uint64,uint128,uint64,uint128)']> & SendParams & { onComplete?: OnApplicationComplete.NoOp } = {args: []}) => {
+      const result = await this.appClient.send.call(TrustVariationParamsFactory.getStats(params))
+      return {...result, return: result.return as unknown as (undefined | TrustVariationReturns['get_stats()(uint64,uint64,uint64,uint128,uint64,uint128,uint64,uint128,uint64,uint128)'])}
+    },
+
+    /**
+     * Makes a call to the TrustVariation smart contract using the `get_claimable(address)uint64` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    getClaimable: async (params: CallParams<TrustVariationArgs['obj']['get_claimable(address)uint64'] | TrustVariationArgs['tuple']['get_claimable(address)uint64']> & SendParams & { onComplete?: OnApplicationComplete.NoOp }) => {
+      const result = await this.appClient.send.call(TrustVariationParamsFactory.getClaimable(params))
+      return {...result, return: result.return as unknown as (undefined | TrustVariationReturns['get_claimable(address)uint64'])}
+    },
+
     /**
      * Makes a call to the TrustVariation smart contract using the `get_participant_count()uint64` ABI method.
      * 
@@ -1390,50 +2686,139 @@ export class TrustVariationClient {
   /**
    * Clone this app client with different params
    *
-   * @param params The params to use for the cloned app client. Omit a param to keep the original value. Set a param to override the original value. Setting to undefined will clear the original value.
-   * @returns A new app client with the altered params
+   * @param params The params to use for the cloned app client. Omit a param to keep the original value. Set a param to override the original value. Setting to undefined will clear the original value.
+   * @returns A new app client with the altered params
+   */
+  public clone(params: CloneAppClientParams) {
+    return new TrustVariationClient(this.appClient.clone(params))
+  }
+
+  /**
+   * Makes a readonly (simulated) call to the TrustVariation smart contract using the `get_config()(uint64,uint64,uint64,uint64,uint64,uint8,uint64)` ABI method.
+   * 
+   * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+   *
+   * @param params The params for the smart contract call
+   * @returns The call result
+   */
+  async getConfig(params: CallParams<TrustVariationArgs['obj']['get_config()(uint64,uint64,uint64,uint64,uint64,uint8,uint64)'] | TrustVariationArgs['tuple']['get_config()(uint64,uint64,uint64,uint64,uint64,uint8,uint64)']> = {args: []}) {
+    const result = await this.appClient.send.call(TrustVariationParamsFactory.getConfig(params))
+    return result.return as unknown as TrustVariationReturns['get_config()(uint64,uint64,uint64,uint64,uint64,uint8,uint64)']
+  }
+
+  /**
+   * Makes a readonly (simulated) call to the TrustVariation smart contract using the `get_player_state(address)((uint8,uint8,uint32),uint8,(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8),(uint64,uint64,uint64,uint64,uint64,uint8,uint64))` ABI method.
+   *
+  * Participant record, their match and the variation config in one call.
+  Unknown addresses get enrolled == 0; match is zeroed when has_match == 0, which includes an assigned player whose m_ box sweep_boxes has deleted.
+
+   * 
+   * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+   *
+   * @param params The params for the smart contract call
+   * @returns The call result
+   */
+  async getPlayerState(params: CallParams<TrustVariationArgs['obj']['get_player_state(address)((uint8,uint8,uint32),uint8,(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8),(uint64,uint64,uint64,uint64,uint64,uint8,uint64))'] | TrustVariationArgs['tuple']['get_player_state(address)((uint8,uint8,uint32),uint8,(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8),(uint64,uint64,uint64,uint64,uint64,uint8,uint64))']>) {
+    const result = await this.appClient.send.call(TrustVariationParamsFactory.getPlayerState(params))
+    return result.return as unknown as TrustVariationReturns['get_player_state(address)((uint8,uint8,uint32),uint8,(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8),(uint64,uint64,uint64,uint64,uint64,uint8,uint64))']
+  }
+
+  /**
+   * Makes a readonly (simulated) call to the TrustVariation smart contract using the `get_match(uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)` ABI method.
+   * 
+   * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+   *
+   * @param params The params for the smart contract call
+   * @returns The call result
+   */
+  async getMatch(params: CallParams<TrustVariationArgs['obj']['get_match(uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)'] | TrustVariationArgs['tuple']['get_match(uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)']>) {
+    const result = await this.appClient.send.call(TrustVariationParamsFactory.getMatch(params))
+    return result.return as unknown as TrustVariationReturns['get_match(uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)']
+  }
+
+  /**
+   * Makes a readonly (simulated) call to the TrustVariation smart contract using the `get_matches(uint32,uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)[]` ABI method.
+   *
+  * Matches start .. start + count - 1, capped at MATCHES_PAGE_SIZE ids and
+  at match_count. Match ids whose m_ box was swept are skipped, so a short page does not mean the end: continue from start + min(count, MATCHES_PAGE_SIZE) while that is below match_count.
+
+   * 
+   * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+   *
+   * @param params The params for the smart contract call
+   * @returns The call result
+   */
+  async getMatches(params: CallParams<TrustVariationArgs['obj']['get_matches(uint32,uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)[]'] | TrustVariationArgs['tuple']['get_matches(uint32,uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)[]']>) {
+    const result = await this.appClient.send.call(TrustVariationParamsFactory.getMatches(params))
+    return result.return as unknown as TrustVariationReturns['get_matches(uint32,uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)[]']
+  }
+
+  /**
+   * Makes a readonly (simulated) call to the TrustVariation smart contract using the `get_player_match(address)uint32` ABI method.
+   * 
+   * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+   *
+   * @param params The params for the smart contract call
+   * @returns The call result
+   */
+  async getPlayerMatch(params: CallParams<TrustVariationArgs['obj']['get_player_match(address)uint32'] | TrustVariationArgs['tuple']['get_player_match(address)uint32']>) {
+    const result = await this.appClient.send.call(TrustVariationParamsFactory.getPlayerMatch(params))
+    return result.return as unknown as TrustVariationReturns['get_player_match(address)uint32']
+  }
+
+  /**
+   * Makes a readonly (simulated) call to the TrustVariation smart contract using the `get_roster_flags(uint32)uint8` ABI method.
+   *
+  * ROSTER_ENROLLED | ROSTER_ASSIGNED bits for a roster user_id.
+
+   * 
+   * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+   *
+   * @param params The params for the smart contract call
+   * @returns The call result
    */
-  public clone(params: CloneAppClientParams) {
-    return new TrustVariationClient(this.appClient.clone(params))
+  async getRosterFlags(params: CallParams<TrustVariationArgs['obj']['get_roster_flags(uint32)uint8'] | TrustVariationArgs['tuple']['get_roster_flags(uint32)uint8']>) {
+    const result = await this.appClient.send.call(TrustVariationParamsFactory.getRosterFlags(params))
+    return result.return as unknown as TrustVariationReturns['get_roster_flags(uint32)uint8']
   }
 
   /**
-   * Makes a readonly (simulated) call to the TrustVariation smart contract using the `get_config()(uint64,uint64,uint64,uint64,uint64,uint8,uint64)` ABI method.
+   * Makes a readonly (simulated) call to the TrustVariation smart contract using the `get_roster_count()uint64` ABI method.
    * 
    * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
    *
    * @param params The params for the smart contract call
    * @returns The call result
    */
-  async getConfig(params: CallParams<TrustVariationArgs['obj']['get_config()(uint64,uint64,uint64,uint64,uint64,uint8,uint64)'] | TrustVariationArgs['tuple']['get_config()(uint64,uint64,uint64,uint64,uint64,uint8,uint64)']> = {args: []}) {
-    const result = await this.appClient.send.call(TrustVariationParamsFactory.getConfig(params))
-    return result.return as unknown as TrustVariationReturns['get_config()(uint64,uint64,uint64,uint64,uint64,uint8,uint64)']
+  async getRosterCount(params: CallParams<TrustVariationArgs['obj']['get_roster_count()uint64'] | TrustVariationArgs['tuple']['get_roster_count()uint64']> = {args: []}) {
+    const result = await this.appClient.send.call(TrustVariationParamsFactory.getRosterCount(params))
+    return result.return as unknown as TrustVariationReturns['get_roster_count()uint64']
   }
 
   /**
-   * Makes a readonly (simulated) call to the TrustVariation smart contract using the `get_match(uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)` ABI method.
+   * Makes a readonly (simulated) call to the TrustVariation smart contract using the `get_stats()(uint64,uint64,uint64,uint128,uint64,uint128,uint64,uint128,uint64,uint128)` ABI method.
    * 
    * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
    *
    * @param params The params for the smart contract call
    * @returns The call result
    */
-  async getMatch(params: CallParams<TrustVariationArgs['obj']['get_match(uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)'] | TrustVariationArgs['tuple']['get_match(uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)']>) {
-    const result = await this.appClient.send.call(TrustVariationParamsFactory.getMatch(params))
-    return result.return as unknown as TrustVariationReturns['get_match(uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)']
+  async getStats(params: CallParams<TrustVariationArgs['obj']['get_stats()(uint64,uint64,uint64,uint128,uint64,uint128,uint64,uint128,uint64,uint128)'] | TrustVariationArgs['tuple']['get_stats()(uint64,uint64,uint64,uint128,uint64,uint128,uint64,uint128,uint64,uint128)']> = {args: []}) {
+    const result = await this.appClient.send.call(TrustVariationParamsFactory.getStats(params))
+    return result.return as unknown as TrustVariationReturns['get_stats()(uint64,uint64,uint64,uint128,uint64,uint128,uint64,uint128,uint64,uint128)']
   }
 
   /**
-   * Makes a readonly (simulated) call to the TrustVariation smart contract using the `get_player_match(address)uint32` ABI method.
+   * Makes a readonly (simulated) call to the TrustVariation smart contract using the `get_claimable(address)uint64` ABI method.
    * 
    * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
    *
    * @param params The params for the smart contract call
    * @returns The call result
    */
-  async getPlayerMatch(params: CallParams<TrustVariationArgs['obj']['get_player_match(address)uint32'] | TrustVariationArgs['tuple']['get_player_match(address)uint32']>) {
-    const result = await this.appClient.send.call(TrustVariationParamsFactory.getPlayerMatch(params))
-    return result.return as unknown as TrustVariationReturns['get_player_match(address)uint32']
+  async getClaimable(params: CallParams<TrustVariationArgs['obj']['get_claimable(address)uint64'] | TrustVariationArgs['tuple']['get_claimable(address)uint64']>) {
+    const result = await this.appClient.send.call(TrustVariationParamsFactory.getClaimable(params))
+    return result.return as unknown as TrustVariationReturns['get_claimable(address)uint64']
   }
 
   /**
@@ -1493,6 +2878,14 @@ export class TrustVariationClient {
           registryApp: result.registry_app,
           participantCount: result.participant_count,
           maxParticipants: result.max_participants,
+          matchCursor: result.match_cursor,
+          settlementMode: result.settlement_mode,
+          escrowPending: result.escrow_pending,
+          stats: result.stats,
+          rosterCount: result.roster_count,
+          treasuryFunded: result.treasury_funded,
+          autoMatchEnabled: result.auto_match_enabled,
+          claimMbrRefund: result.claim_mbr_refund,
         }
       },
       /**
@@ -1563,6 +2956,38 @@ export class TrustVariationClient {
        * Get the current value of the max_participants key in global state
        */
       maxParticipants: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("max_participants")) as bigint | undefined },
+      /**
+       * Get the current value of the match_cursor key in global state
+       */
+      matchCursor: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("match_cursor")) as bigint | undefined },
+      /**
+       * Get the current value of the settlement_mode key in global state
+       */
+      settlementMode: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("settlement_mode")) as bigint | undefined },
+      /**
+       * Get the current value of the escrow_pending key in global state
+       */
+      escrowPending: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("escrow_pending")) as bigint | undefined },
+      /**
+       * Get the current value of the stats key in global state
+       */
+      stats: async (): Promise<VariationStats | undefined> => { return (await this.appClient.state.global.getValue("stats")) as VariationStats | undefined },
+      /**
+       * Get the current value of the roster_count key in global state
+       */
+      rosterCount: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("roster_count")) as bigint | undefined },
+      /**
+       * Get the current value of the treasury_funded key in global state
+       */
+      treasuryFunded: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("treasury_funded")) as bigint | undefined },
+      /**
+       * Get the current value of the auto_match_enabled key in global state
+       */
+      autoMatchEnabled: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("auto_match_enabled")) as bigint | undefined },
+      /**
+       * Get the current value of the claim_mbr_refund key in global state
+       */
+      claimMbrRefund: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("claim_mbr_refund")) as bigint | undefined },
     },
     /**
      * Methods to access box state for the current TrustVariation app
@@ -1574,8 +2999,13 @@ export class TrustVariationClient {
       getAll: async (): Promise<Partial<Expand<BoxKeysState>>> => {
         const result = await this.appClient.state.box.getAll()
         return {
+          roster: new BinaryStateValue(result.roster),
         }
       },
+      /**
+       * Get the current value of the roster key in box state
+       */
+      roster: async (): Promise<BinaryState> => { return new BinaryStateValue((await this.appClient.state.box.getValue("roster")) as Uint8Array | undefined) },
       /**
        * Get values from the participants map in box state
        */
@@ -1603,17 +3033,30 @@ export class TrustVariationClient {
         value: async (key: bigint | number): Promise<Match | undefined> => { return await this.appClient.state.box.getMapValue("matches", key) as Match | undefined },
       },
       /**
-       * Get values from the player_match map in box state
+       * Get values from the enrollment_order map in box state
+       */
+      enrollmentOrder: {
+        /**
+         * Get all current values of the enrollment_order map in box state
+         */
+        getMap: async (): Promise<Map<number, string>> => { return (await this.appClient.state.box.getMap("enrollment_order")) as Map<number, string> },
+        /**
+         * Get a current value of the enrollment_order map by key from box state
+         */
+        value: async (key: bigint | number): Promise<string | undefined> => { return await this.appClient.state.box.getMapValue("enrollment_order", key) as string | undefined },
+      },
+      /**
+       * Get values from the claimable map in box state
        */
-      playerMatch: {
+      claimable: {
         /**
-         * Get all current values of the player_match map in box state
+         * Get all current values of the claimable map in box state
          */
-        getMap: async (): Promise<Map<string, number>> => { return (await this.appClient.state.box.getMap("player_match")) as Map<string, number> },
+        getMap: async (): Promise<Map<string, bigint>> => { return (await this.appClient.state.box.getMap("claimable")) as Map<string, bigint> },
         /**
-         * Get a current value of the player_match map by key from box state
+         * Get a current value of the claimable map by key from box state
          */
-        value: async (key: string): Promise<number | undefined> => { return await this.appClient.state.box.getMapValue("player_match", key) as number | undefined },
+        value: async (key: string): Promise<bigint | undefined> => { return await this.appClient.state.box.getMapValue("claimable", key) as bigint | undefined },
       },
     },
   }
@@ -1637,6 +3080,13 @@ export class TrustVariationClient {
         promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.recordEscrow(params)))
         return this
       },
+      /**
+       * Add a enable_treasury_funding()void method call against the TrustVariation contract
+       */
+      enableTreasuryFunding(params: CallParams<TrustVariationArgs['obj']['enable_treasury_funding()void'] | TrustVariationArgs['tuple']['enable_treasury_funding()void']> & { onComplete?: OnApplicationComplete.NoOp }) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.enableTreasuryFunding(params)))
+        return this
+      },
       /**
        * Add a end_variation()void method call against the TrustVariation contract
        */
@@ -1644,6 +3094,27 @@ export class TrustVariationClient {
         promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.endVariation(params)))
         return this
       },
+      /**
+       * Add a sweep_boxes(uint8,byte[][])uint64 method call against the TrustVariation contract
+       */
+      sweepBoxes(params: CallParams<TrustVariationArgs['obj']['sweep_boxes(uint8,byte[][])uint64'] | TrustVariationArgs['tuple']['sweep_boxes(uint8,byte[][])uint64']> & { onComplete?: OnApplicationComplete.NoOp }) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.sweepBoxes(params)))
+        return this
+      },
+      /**
+       * Add a set_settlement_mode(uint8)void method call against the TrustVariation contract
+       */
+      setSettlementMode(params: CallParams<TrustVariationArgs['obj']['set_settlement_mode(uint8)void'] | TrustVariationArgs['tuple']['set_settlement_mode(uint8)void']> & { onComplete?: OnApplicationComplete.NoOp }) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.setSettlementMode(params)))
+        return this
+      },
+      /**
+       * Add a enable_auto_match()void method call against the TrustVariation contract
+       */
+      enableAutoMatch(params: CallParams<TrustVariationArgs['obj']['enable_auto_match()void'] | TrustVariationArgs['tuple']['enable_auto_match()void']> & { onComplete?: OnApplicationComplete.NoOp }) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.enableAutoMatch(params)))
+        return this
+      },
       /**
        * Add a add_participants(address[],pay)void method call against the TrustVariation contract
        */
@@ -1658,6 +3129,27 @@ export class TrustVariationClient {
         promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.selfEnroll(params)))
         return this
       },
+      /**
+       * Add a self_enroll_grouped(appl,pay)void method call against the TrustVariation contract
+       */
+      selfEnrollGrouped(params: CallParams<TrustVariationArgs['obj']['self_enroll_grouped(appl,pay)void'] | TrustVariationArgs['tuple']['self_enroll_grouped(appl,pay)void']> & { onComplete?: OnApplicationComplete.NoOp }) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.selfEnrollGrouped(params)))
+        return this
+      },
+      /**
+       * Add a self_enroll_with_proof(uint32,byte[],pay)void method call against the TrustVariation contract
+       */
+      selfEnrollWithProof(params: CallParams<TrustVariationArgs['obj']['self_enroll_with_proof(uint32,byte[],pay)void'] | TrustVariationArgs['tuple']['self_enroll_with_proof(uint32,byte[],pay)void']> & { onComplete?: OnApplicationComplete.NoOp }) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.selfEnrollWithProof(params)))
+        return this
+      },
+      /**
+       * Add a enroll_user_ids(uint32[],pay)void method call against the TrustVariation contract
+       */
+      enrollUserIds(params: CallParams<TrustVariationArgs['obj']['enroll_user_ids(uint32[],pay)void'] | TrustVariationArgs['tuple']['enroll_user_ids(uint32[],pay)void']> & { onComplete?: OnApplicationComplete.NoOp }) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.enrollUserIds(params)))
+        return this
+      },
       /**
        * Add a create_match(address,address,pay)uint32 method call against the TrustVariation contract
        */
@@ -1665,6 +3157,27 @@ export class TrustVariationClient {
         promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.createMatch(params)))
         return this
       },
+      /**
+       * Add a create_matches((address,address)[],pay)uint32 method call against the TrustVariation contract
+       */
+      createMatches(params: CallParams<TrustVariationArgs['obj']['create_matches((address,address)[],pay)uint32'] | TrustVariationArgs['tuple']['create_matches((address,address)[],pay)uint32']> & { onComplete?: OnApplicationComplete.NoOp }) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.createMatches(params)))
+        return this
+      },
+      /**
+       * Add a auto_match(uint64,pay)uint64 method call against the TrustVariation contract
+       */
+      autoMatch(params: CallParams<TrustVariationArgs['obj']['auto_match(uint64,pay)uint64'] | TrustVariationArgs['tuple']['auto_match(uint64,pay)uint64']> & { onComplete?: OnApplicationComplete.NoOp }) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.autoMatch(params)))
+        return this
+      },
+      /**
+       * Add a create_match_by_ids(uint32,address,uint32,address,pay)uint32 method call against the TrustVariation contract
+       */
+      createMatchByIds(params: CallParams<TrustVariationArgs['obj']['create_match_by_ids(uint32,address,uint32,address,pay)uint32'] | TrustVariationArgs['tuple']['create_match_by_ids(uint32,address,uint32,address,pay)uint32']> & { onComplete?: OnApplicationComplete.NoOp }) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.createMatchByIds(params)))
+        return this
+      },
       /**
        * Add a close_registration()void method call against the TrustVariation contract
        */
@@ -1686,6 +3199,20 @@ export class TrustVariationClient {
         promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.submitTrusteeDecision(params)))
         return this
       },
+      /**
+       * Add a settle(uint32[])void method call against the TrustVariation contract
+       */
+      settle(params: CallParams<TrustVariationArgs['obj']['settle(uint32[])void'] | TrustVariationArgs['tuple']['settle(uint32[])void']> & { onComplete?: OnApplicationComplete.NoOp }) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.settle(params)))
+        return this
+      },
+      /**
+       * Add a claim()uint64 method call against the TrustVariation contract
+       */
+      claim(params: CallParams<TrustVariationArgs['obj']['claim()uint64'] | TrustVariationArgs['tuple']['claim()uint64']> & { onComplete?: OnApplicationComplete.NoOp }) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.claim(params)))
+        return this
+      },
       /**
        * Add a withdraw_escrow()void method call against the TrustVariation contract
        */
@@ -1700,6 +3227,13 @@ export class TrustVariationClient {
         promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getConfig(params)))
         return this
       },
+      /**
+       * Add a get_player_state(address)((uint8,uint8,uint32),uint8,(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8),(uint64,uint64,uint64,uint64,uint64,uint8,uint64)) method call against the TrustVariation contract
+       */
+      getPlayerState(params: CallParams<TrustVariationArgs['obj']['get_player_state(address)((uint8,uint8,uint32),uint8,(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8),(uint64,uint64,uint64,uint64,uint64,uint8,uint64))'] | TrustVariationArgs['tuple']['get_player_state(address)((uint8,uint8,uint32),uint8,(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8),(uint64,uint64,uint64,uint64,uint64,uint8,uint64))']> & { onComplete?: OnApplicationComplete.NoOp }) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getPlayerState(params)))
+        return this
+      },
       /**
        * Add a get_match(uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8) method call against the TrustVariation contract
        */
@@ -1707,6 +3241,13 @@ export class TrustVariationClient {
         promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getMatch(params)))
         return this
       },
+      /**
+       * Add a get_matches(uint32,uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)[] method call against the TrustVariation contract
+       */
+      getMatches(params: CallParams<TrustVariationArgs['obj']['get_matches(uint32,uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)[]'] | TrustVariationArgs['tuple']['get_matches(uint32,uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)[]']> & { onComplete?: OnApplicationComplete.NoOp }) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getMatches(params)))
+        return this
+      },
       /**
        * Add a get_player_match(address)uint32 method call against the TrustVariation contract
        */
@@ -1714,6 +3255,34 @@ export class TrustVariationClient {
         promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getPlayerMatch(params)))
         return this
       },
+      /**
+       * Add a get_roster_flags(uint32)uint8 method call against the TrustVariation contract
+       */
+      getRosterFlags(params: CallParams<TrustVariationArgs['obj']['get_roster_flags(uint32)uint8'] | TrustVariationArgs['tuple']['get_roster_flags(uint32)uint8']> & { onComplete?: OnApplicationComplete.NoOp }) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getRosterFlags(params)))
+        return this
+      },
+      /**
+       * Add a get_roster_count()uint64 method call against the TrustVariation contract
+       */
+      getRosterCount(params: CallParams<TrustVariationArgs['obj']['get_roster_count()uint64'] | TrustVariationArgs['tuple']['get_roster_count()uint64']> & { onComplete?: OnApplicationComplete.NoOp }) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getRosterCount(params)))
+        return this
+      },
+      /**
+       * Add a get_stats()(uint64,uint64,uint64,uint128,uint64,uint128,uint64,uint128,uint64,uint128) method call against the TrustVariation contract
+       */
+      getStats(params: CallParams<TrustVariationArgs['obj']['get_stats()(uint64,uint64,uint64,uint128,uint64,uint128,uint64,uint128,uint64,uint128)'] | TrustVariationArgs['tuple']['get_stats()(uint64,uint64,uint64,uint128,uint64,uint128,uint64,uint128,uint64,uint128)']> & { onComplete?: OnApplicationComplete.NoOp }) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getStats(params)))
+        return this
+      },
+      /**
+       * Add a get_claimable(address)uint64 method call against the TrustVariation contract
+       */
+      getClaimable(params: CallParams<TrustVariationArgs['obj']['get_claimable(address)uint64'] | TrustVariationArgs['tuple']['get_claimable(address)uint64']> & { onComplete?: OnApplicationComplete.NoOp }) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getClaimable(params)))
+        return this
+      },
       /**
        * Add a get_participant_count()uint64 method call against the TrustVariation contract
        */
@@ -1779,6 +3348,18 @@ export type TrustVariationComposer<TReturns extends [...any[]] = []> = {
    */
   recordEscrow(params?: CallParams<TrustVariationArgs['obj']['record_escrow(uint64)void'] | TrustVariationArgs['tuple']['record_escrow(uint64)void']>): TrustVariationComposer<[...TReturns, TrustVariationReturns['record_escrow(uint64)void'] | undefined]>
 
+  /**
+   * Calls the enable_treasury_funding()void ABI method.
+   *
+  * Called by TrustExperiments right after create for treasury-funded
+  variations: instead of holding a prefunded escrow, the variation draws each payout shortfall from the experiment treasury when it is needed.
+
+   *
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  enableTreasuryFunding(params?: CallParams<TrustVariationArgs['obj']['enable_treasury_funding()void'] | TrustVariationArgs['tuple']['enable_treasury_funding()void']>): TrustVariationComposer<[...TReturns, TrustVariationReturns['enable_treasury_funding()void'] | undefined]>
+
   /**
    * Calls the end_variation()void ABI method.
    *
@@ -1787,6 +3368,43 @@ export type TrustVariationComposer<TReturns extends [...any[]] = []> = {
    */
   endVariation(params?: CallParams<TrustVariationArgs['obj']['end_variation()void'] | TrustVariationArgs['tuple']['end_variation()void']>): TrustVariationComposer<[...TReturns, TrustVariationReturns['end_variation()void'] | undefined]>
 
+  /**
+   * Calls the sweep_boxes(uint8,byte[][])uint64 ABI method.
+   *
+  * Delete boxes of one SWEEP_* kind from an ended variation and refund
+  their MBR to the owner in one payment; returns the amount. keys are the box keys without prefix (32-byte address or 4-byte uint32). Missing keys and matches with an unsettled deferred payout are skipped, so sweeps can be retried. Swept data is gone from get_match/get_matches; the events remain the record. The payment also returns the MBR of claim boxes claimed since the last refund, so a call with no keys collects just that.
+
+   *
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  sweepBoxes(params?: CallParams<TrustVariationArgs['obj']['sweep_boxes(uint8,byte[][])uint64'] | TrustVariationArgs['tuple']['sweep_boxes(uint8,byte[][])uint64']>): TrustVariationComposer<[...TReturns, TrustVariationReturns['sweep_boxes(uint8,byte[][])uint64'] | undefined]>
+
+  /**
+   * Calls the set_settlement_mode(uint8)void ABI method.
+   *
+  * SETTLEMENT_IMMEDIATE pays both players inside submit_trustee_decision.
+  SETTLEMENT_DEFERRED only records the payouts; the owner pushes them later in bulk with settle(). SETTLEMENT_CLAIM credits them to the claim ledger and each player pulls their balance with claim().
+  The mode is fixed once the first match exists, because match MBR depends on it (claim boxes are prepaid at match creation).
+
+   *
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  setSettlementMode(params?: CallParams<TrustVariationArgs['obj']['set_settlement_mode(uint8)void'] | TrustVariationArgs['tuple']['set_settlement_mode(uint8)void']>): TrustVariationComposer<[...TReturns, TrustVariationReturns['set_settlement_mode(uint8)void'] | undefined]>
+
+  /**
+   * Calls the enable_auto_match()void ABI method.
+   *
+  * Record every later enrollment's position in an o_ box so auto_match can
+  pair in enrollment order. Must precede the first enrollment, since earlier participants would have no position; each enrollment then costs PARTICIPANT_MBR + ORDER_BOX_MBR.
+
+   *
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  enableAutoMatch(params?: CallParams<TrustVariationArgs['obj']['enable_auto_match()void'] | TrustVariationArgs['tuple']['enable_auto_match()void']>): TrustVariationComposer<[...TReturns, TrustVariationReturns['enable_auto_match()void'] | undefined]>
+
   /**
    * Calls the add_participants(address[],pay)void ABI method.
    *
@@ -1803,6 +3421,42 @@ export type TrustVariationComposer<TReturns extends [...any[]] = []> = {
    */
   selfEnroll(params?: CallParams<TrustVariationArgs['obj']['self_enroll(pay)void'] | TrustVariationArgs['tuple']['self_enroll(pay)void']>): TrustVariationComposer<[...TReturns, TrustVariationReturns['self_enroll(pay)void'] | undefined]>
 
+  /**
+   * Calls the self_enroll_grouped(appl,pay)void ABI method.
+   *
+  * self_enroll without the inner call: the sender puts their own
+  BxHiveRegistry.get_user(sender) call in the group instead. get_user fails for unregistered accounts and groups are atomic, so its presence proves registration at the minimum fee; its return log carries the user_id that is checked against the roster.
+
+   *
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  selfEnrollGrouped(params?: CallParams<TrustVariationArgs['obj']['self_enroll_grouped(appl,pay)void'] | TrustVariationArgs['tuple']['self_enroll_grouped(appl,pay)void']>): TrustVariationComposer<[...TReturns, TrustVariationReturns['self_enroll_grouped(appl,pay)void'] | undefined]>
+
+  /**
+   * Calls the self_enroll_with_proof(uint32,byte[],pay)void ABI method.
+   *
+  * self_enroll without any registry call: proof is the sender's path in
+  the registry member tree (registry/membership.py member_proof), checked against the registry's member root globals read directly. The hashes need about 1,200 opcodes; pool them with another app call in the group or pay one extra minimum fee for the op-up.
+
+   *
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  selfEnrollWithProof(params?: CallParams<TrustVariationArgs['obj']['self_enroll_with_proof(uint32,byte[],pay)void'] | TrustVariationArgs['tuple']['self_enroll_with_proof(uint32,byte[],pay)void']>): TrustVariationComposer<[...TReturns, TrustVariationReturns['self_enroll_with_proof(uint32,byte[],pay)void'] | undefined]>
+
+  /**
+   * Calls the enroll_user_ids(uint32[],pay)void ABI method.
+   *
+  * Enroll registry users into the roster bitmap instead of p_ boxes. The
+  bitmap grows to cover the highest user_id; the MBR payment must cover the added bytes (plus ROSTER_BOX_MBR the first time). No per-user event is emitted, so large batches stay within the log limits. Roster users count towards max_participants; ones that also hold a p_ box are rejected by create_match_by_ids, and self-enrollment rejects roster user_ids.
+
+   *
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  enrollUserIds(params?: CallParams<TrustVariationArgs['obj']['enroll_user_ids(uint32[],pay)void'] | TrustVariationArgs['tuple']['enroll_user_ids(uint32[],pay)void']>): TrustVariationComposer<[...TReturns, TrustVariationReturns['enroll_user_ids(uint32[],pay)void'] | undefined]>
+
   /**
    * Calls the create_match(address,address,pay)uint32 ABI method.
    *
@@ -1811,6 +3465,42 @@ export type TrustVariationComposer<TReturns extends [...any[]] = []> = {
    */
   createMatch(params?: CallParams<TrustVariationArgs['obj']['create_match(address,address,pay)uint32'] | TrustVariationArgs['tuple']['create_match(address,address,pay)uint32']>): TrustVariationComposer<[...TReturns, TrustVariationReturns['create_match(address,address,pay)uint32'] | undefined]>
 
+  /**
+   * Calls the create_matches((address,address)[],pay)uint32 ABI method.
+   *
+  * Pair several (investor, trustee) tuples in one call, funded by a single
+  aggregate MBR payment. Match IDs are assigned sequentially; returns the first one. Emits a single MatchesCreated for the whole batch.
+
+   *
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  createMatches(params?: CallParams<TrustVariationArgs['obj']['create_matches((address,address)[],pay)uint32'] | TrustVariationArgs['tuple']['create_matches((address,address)[],pay)uint32']>): TrustVariationComposer<[...TReturns, TrustVariationReturns['create_matches((address,address)[],pay)uint32'] | undefined]>
+
+  /**
+   * Calls the auto_match(uint64,pay)uint64 ABI method.
+   *
+  * Pair up to n unassigned participants in enrollment order, starting at
+  match_cursor. Within a pair the earlier enrollee is the investor and the later one the trustee; participants already paired via create_match are skipped. An odd leftover stays unpaired and the cursor parks on it so the next call picks it up. MBR is charged for n / 2 matches up front. Requires enable_auto_match. Emits one MatchesCreated and returns the number of matches created.
+
+   *
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  autoMatch(params?: CallParams<TrustVariationArgs['obj']['auto_match(uint64,pay)uint64'] | TrustVariationArgs['tuple']['auto_match(uint64,pay)uint64']>): TrustVariationComposer<[...TReturns, TrustVariationReturns['auto_match(uint64,pay)uint64'] | undefined]>
+
+  /**
+   * Calls the create_match_by_ids(uint32,address,uint32,address,pay)uint32 ABI method.
+   *
+  * Pair two roster participants. Each address is checked against its
+  user_id in BxHiveRegistry, since the roster only stores flags. Roster players have no p_ box: they find their match through the MatchCreated event or get_matches rather than get_player_match.
+
+   *
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  createMatchByIds(params?: CallParams<TrustVariationArgs['obj']['create_match_by_ids(uint32,address,uint32,address,pay)uint32'] | TrustVariationArgs['tuple']['create_match_by_ids(uint32,address,uint32,address,pay)uint32']>): TrustVariationComposer<[...TReturns, TrustVariationReturns['create_match_by_ids(uint32,address,uint32,address,pay)uint32'] | undefined]>
+
   /**
    * Calls the close_registration()void ABI method.
    *
@@ -1835,6 +3525,29 @@ export type TrustVariationComposer<TReturns extends [...any[]] = []> = {
    */
   submitTrusteeDecision(params?: CallParams<TrustVariationArgs['obj']['submit_trustee_decision(uint32,uint64)void'] | TrustVariationArgs['tuple']['submit_trustee_decision(uint32,uint64)void']>): TrustVariationComposer<[...TReturns, TrustVariationReturns['submit_trustee_decision(uint32,uint64)void'] | undefined]>
 
+  /**
+   * Calls the settle(uint32[])void ABI method.
+   *
+  * Push the recorded payouts of completed, unpaid matches, at most
+  MAX_SETTLE_PER_CALL per call. Each match costs two inner transactions, so one group (four settle calls pooling their budget) can settle up to 128.
+
+   *
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  settle(params?: CallParams<TrustVariationArgs['obj']['settle(uint32[])void'] | TrustVariationArgs['tuple']['settle(uint32[])void']>): TrustVariationComposer<[...TReturns, TrustVariationReturns['settle(uint32[])void'] | undefined]>
+
+  /**
+   * Calls the claim()uint64 ABI method.
+   *
+  * Pay out everything the claim ledger owes the sender in one transfer.
+
+   *
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  claim(params?: CallParams<TrustVariationArgs['obj']['claim()uint64'] | TrustVariationArgs['tuple']['claim()uint64']>): TrustVariationComposer<[...TReturns, TrustVariationReturns['claim()uint64'] | undefined]>
+
   /**
    * Calls the withdraw_escrow()void ABI method.
    *
@@ -1851,6 +3564,18 @@ export type TrustVariationComposer<TReturns extends [...any[]] = []> = {
    */
   getConfig(params?: CallParams<TrustVariationArgs['obj']['get_config()(uint64,uint64,uint64,uint64,uint64,uint8,uint64)'] | TrustVariationArgs['tuple']['get_config()(uint64,uint64,uint64,uint64,uint64,uint8,uint64)']>): TrustVariationComposer<[...TReturns, TrustVariationReturns['get_config()(uint64,uint64,uint64,uint64,uint64,uint8,uint64)'] | undefined]>
 
+  /**
+   * Calls the get_player_state(address)((uint8,uint8,uint32),uint8,(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8),(uint64,uint64,uint64,uint64,uint64,uint8,uint64)) ABI method.
+   *
+  * Participant record, their match and the variation config in one call.
+  Unknown addresses get enrolled == 0; match is zeroed when has_match == 0, which includes an assigned player whose m_ box sweep_boxes has deleted.
+
+   *
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  getPlayerState(params?: CallParams<TrustVariationArgs['obj']['get_player_state(address)((uint8,uint8,uint32),uint8,(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8),(uint64,uint64,uint64,uint64,uint64,uint8,uint64))'] | TrustVariationArgs['tuple']['get_player_state(address)((uint8,uint8,uint32),uint8,(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8),(uint64,uint64,uint64,uint64,uint64,uint8,uint64))']>): TrustVariationComposer<[...TReturns, TrustVariationReturns['get_player_state(address)((uint8,uint8,uint32),uint8,(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8),(uint64,uint64,uint64,uint64,uint64,uint8,uint64))'] | undefined]>
+
   /**
    * Calls the get_match(uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8) ABI method.
    *
@@ -1859,6 +3584,18 @@ export type TrustVariationComposer<TReturns extends [...any[]] = []> = {
    */
   getMatch(params?: CallParams<TrustVariationArgs['obj']['get_match(uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)'] | TrustVariationArgs['tuple']['get_match(uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)']>): TrustVariationComposer<[...TReturns, TrustVariationReturns['get_match(uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)'] | undefined]>
 
+  /**
+   * Calls the get_matches(uint32,uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)[] ABI method.
+   *
+  * Matches start .. start + count - 1, capped at MATCHES_PAGE_SIZE ids and
+  at match_count. Match ids whose m_ box was swept are skipped, so a short page does not mean the end: continue from start + min(count, MATCHES_PAGE_SIZE) while that is below match_count.
+
+   *
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  getMatches(params?: CallParams<TrustVariationArgs['obj']['get_matches(uint32,uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)[]'] | TrustVariationArgs['tuple']['get_matches(uint32,uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)[]']>): TrustVariationComposer<[...TReturns, TrustVariationReturns['get_matches(uint32,uint32)(uint32,address,address,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8)[]'] | undefined]>
+
   /**
    * Calls the get_player_match(address)uint32 ABI method.
    *
@@ -1867,6 +3604,41 @@ export type TrustVariationComposer<TReturns extends [...any[]] = []> = {
    */
   getPlayerMatch(params?: CallParams<TrustVariationArgs['obj']['get_player_match(address)uint32'] | TrustVariationArgs['tuple']['get_player_match(address)uint32']>): TrustVariationComposer<[...TReturns, TrustVariationReturns['get_player_match(address)uint32'] | undefined]>
 
+  /**
+   * Calls the get_roster_flags(uint32)uint8 ABI method.
+   *
+  * ROSTER_ENROLLED | ROSTER_ASSIGNED bits for a roster user_id.
+
+   *
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  getRosterFlags(params?: CallParams<TrustVariationArgs['obj']['get_roster_flags(uint32)uint8'] | TrustVariationArgs['tuple']['get_roster_flags(uint32)uint8']>): TrustVariationComposer<[...TReturns, TrustVariationReturns['get_roster_flags(uint32)uint8'] | undefined]>
+
+  /**
+   * Calls the get_roster_count()uint64 ABI method.
+   *
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  getRosterCount(params?: CallParams<TrustVariationArgs['obj']['get_roster_count()uint64'] | TrustVariationArgs['tuple']['get_roster_count()uint64']>): TrustVariationComposer<[...TReturns, TrustVariationReturns['get_roster_count()uint64'] | undefined]>
+
+  /**
+   * Calls the get_stats()(uint64,uint64,uint64,uint128,uint64,uint128,uint64,uint128,uint64,uint128) ABI method.
+   *
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  getStats(params?: CallParams<TrustVariationArgs['obj']['get_stats()(uint64,uint64,uint64,uint128,uint64,uint128,uint64,uint128,uint64,uint128)'] | TrustVariationArgs['tuple']['get_stats()(uint64,uint64,uint64,uint128,uint64,uint128,uint64,uint128,uint64,uint128)']>): TrustVariationComposer<[...TReturns, TrustVariationReturns['get_stats()(uint64,uint64,uint64,uint128,uint64,uint128,uint64,uint128,uint64,uint128)'] | undefined]>
+
+  /**
+   * Calls the get_claimable(address)uint64 ABI method.
+   *
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  getClaimable(params?: CallParams<TrustVariationArgs['obj']['get_claimable(address)uint64'] | TrustVariationArgs['tuple']['get_claimable(address)uint64']>): TrustVariationComposer<[...TReturns, TrustVariationReturns['get_claimable(address)uint64'] | undefined]>
+
   /**
    * Calls the get_participant_count()uint64 ABI method.
    *
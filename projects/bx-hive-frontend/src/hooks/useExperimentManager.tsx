@@ -1,5 +1,6 @@
 import { AlgoAmount, getApplicationAddress } from '@algorandfoundation/algokit-utils'
 import { createContext, useCallback, useContext, useEffect, useRef, useState, type ReactNode } from 'react'
+import { MATCH_MBR_MICROALGOS } from '../utils/trustGameCalc'
 import { STATUS_ACTIVE } from './useTrustVariation'
 import { useAlgorand } from './useAlgorand'
 
@@ -143,7 +144,7 @@ export function ExperimentManagerProvider({ children }: { children: ReactNode })
                 const mbrPayment = algo.createTransaction.payment({
                   sender,
                   receiver: appAddress,
-                  amount: AlgoAmount.MicroAlgos(88_300),
+                  amount: AlgoAmount.MicroAlgos(MATCH_MBR_MICROALGOS),
                 })
                 await client.send.createMatch({ args: { investor, trustee, mbrPayment } })
               }
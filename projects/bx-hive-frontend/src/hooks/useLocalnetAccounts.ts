@@ -1,8 +1,8 @@
-import { AlgorandClient, algo } from '@algorandfoundation/algokit-utils'
+import { AlgorandClient, algo, microAlgo } from '@algorandfoundation/algokit-utils'
 import { useSuspenseQuery, useQueries, useMutation, useQueryClient } from '@tanstack/react-query'
 import { getRegistryClient } from '../utils/algorand'
 import { queryKeys } from '../lib/queryKeys'
-import { TEST_WALLET_NAME } from '../lib/constants'
+import { REGISTER_USER_MAX_FEE_MICROALGOS, TEST_WALLET_NAME } from '../lib/constants'
 import { useNetworkConfig, type NetworkConfig } from '../providers/NetworkProvider'
 
 const ROLE_MAP = { experimenter: 0, participant: 1 } as const
@@ -222,7 +222,11 @@ export function useLocalnetAccounts() {
       await algorand.account.ensureFunded(address, dispenserAccount.addr, algo(5))
 
       const client = getRegistryClient(algorand, address)
-      await client.send.registerUser({ args: { role: ROLE_MAP[role], name } })
+      await client.send.registerUser({
+        args: { role: ROLE_MAP[role], name },
+        coverAppCallInnerTransactionFees: true,
+        maxFee: microAlgo(REGISTER_USER_MAX_FEE_MICROALGOS),
+      })
 
       return { address }
     },
@@ -1,5 +1,7 @@
+import { microAlgo } from '@algorandfoundation/algokit-utils'
 import { useCallback } from 'react'
 import type { User as ContractUser } from '../contracts/BxHiveRegistry'
+import { REGISTER_USER_MAX_FEE_MICROALGOS } from '../lib/constants'
 import { useAlgorand } from './useAlgorand'
 
 // Role encoding matches contract constants: 0=experimenter, 1=participant
@@ -16,13 +18,16 @@ export function useRegistry() {
 
   /**
    * Registers the connected wallet as a new user in the Registry.
-   * Returns the on-chain user_id (uint32).
+   * Returns the on-chain user_id (uint32). The sender's fee covers the op-ups
+   * the member tree update needs.
    */
   const registerUser = useCallback(
     async (role: 'experimenter' | 'participant', name: string): Promise<number> => {
       if (!registryClient || !activeAddress) throw new Error('Wallet not connected')
       const result = await registryClient.send.registerUser({
         args: { role: ROLE_MAP[role], name },
+        coverAppCallInnerTransactionFees: true,
+        maxFee: microAlgo(REGISTER_USER_MAX_FEE_MICROALGOS),
       })
       return result.return!
     },
@@ -2,10 +2,18 @@ import { AlgoAmount, getApplicationAddress, microAlgo } from '@algorandfoundatio
 import { useCallback } from 'react'
 import type { Match, VariationConfig } from '../contracts/TrustVariation'
 import { isAccountOptedInToAsset } from '../utils/algorand'
+import { MATCH_MBR_MICROALGOS, PARTICIPANT_MBR_MICROALGOS } from '../utils/trustGameCalc'
 import { useAlgorand } from './useAlgorand'
 
 export type { Match, VariationConfig }
 
+/** A participant's view of a variation, from get_player_state. */
+export interface PlayerView {
+  enrolled: boolean
+  match: Match | null
+  config: VariationConfig
+}
+
 // Phase constants matching contract values
 export const PHASE_INVESTOR_DECISION = 0
 export const PHASE_TRUSTEE_DECISION = 1
@@ -49,7 +57,7 @@ export function useTrustVariation() {
 
   /**
    * Adds participant wallet addresses to a variation (owner-only).
-   * Sends a grouped MBR payment (16,900 microAlgo per participant) for participant boxes.
+   * Sends a grouped MBR payment (18,500 microAlgo per participant) for participant boxes.
    */
   const addParticipants = useCallback(
     async (appId: bigint, addresses: string[]): Promise<void> => {
@@ -61,7 +69,7 @@ export function useTrustVariation() {
       const mbrPayment = algorand.createTransaction.payment({
         sender: activeAddress,
         receiver: appAddress,
-        amount: AlgoAmount.MicroAlgos(16_900 * addresses.length),
+        amount: AlgoAmount.MicroAlgos(PARTICIPANT_MBR_MICROALGOS * addresses.length),
       })
 
       await client.send.addParticipants({ args: { addresses, mbrPayment } })
@@ -71,7 +79,7 @@ export function useTrustVariation() {
 
   /**
    * Creates a match pairing an investor and trustee (owner-only).
-   * Sends a grouped MBR payment (88,300 microAlgo) for match + player_match boxes.
+   * Sends a grouped MBR payment (52,100 microAlgo) for the match box.
    * Returns the match_id (uint32).
    */
   const createMatch = useCallback(
@@ -84,7 +92,7 @@ export function useTrustVariation() {
       const mbrPayment = algorand.createTransaction.payment({
         sender: activeAddress,
         receiver: appAddress,
-        amount: AlgoAmount.MicroAlgos(88_300),
+        amount: AlgoAmount.MicroAlgos(MATCH_MBR_MICROALGOS),
       })
 
       const result = await client.send.createMatch({ args: { investor, trustee, mbrPayment } })
@@ -141,23 +149,37 @@ export function useTrustVariation() {
   )
 
   /**
-   * Looks up the match_id for the connected wallet address, then fetches the full Match.
-   * Returns null if the address has no match in this variation.
+   * Fetches an address's enrollment, match and the variation config in one
+   * readonly call. match is null if the address has no match in this variation.
    */
-  const getPlayerMatch = useCallback(
-    async (appId: bigint, address: string): Promise<Match | null> => {
+  const getPlayerState = useCallback(
+    async (appId: bigint, address: string): Promise<PlayerView> => {
       if (!activeAddress) throw new Error('Wallet not connected')
       const client = getTrustVariationClient(appId)
       if (!client) throw new Error('Wallet not connected')
+      const result = await client.send.getPlayerState({ args: { addr: address } })
+      const state = result.return!
+      return {
+        enrolled: state.participant.enrolled === 1,
+        match: state.hasMatch === 1 ? state.match : null,
+        config: state.config,
+      }
+    },
+    [activeAddress, getTrustVariationClient],
+  )
+
+  /**
+   * Fetches the Match of an address, or null if it has no match in this variation.
+   */
+  const getPlayerMatch = useCallback(
+    async (appId: bigint, address: string): Promise<Match | null> => {
       try {
-        const matchIdResult = await client.send.getPlayerMatch({ args: { addr: address } })
-        const matchId = matchIdResult.return!
-        return getMatch(appId, matchId)
+        return (await getPlayerState(appId, address)).match
       } catch {
         return null
       }
     },
-    [activeAddress, getTrustVariationClient, getMatch],
+    [getPlayerState],
   )
 
   /**
@@ -180,7 +202,7 @@ export function useTrustVariation() {
       const mbrPayment = await algorand.createTransaction.payment({
         sender: activeAddress,
         receiver: appAddress,
-        amount: AlgoAmount.MicroAlgos(16_900),
+        amount: AlgoAmount.MicroAlgos(PARTICIPANT_MBR_MICROALGOS),
       })
 
       const composer = algorand.newGroup({ coverAppCallInnerTransactionFees: true, populateAppCallResources: true })
@@ -294,6 +316,7 @@ export function useTrustVariation() {
     submitTrusteeDecision,
     getMatch,
     getPlayerMatch,
+    getPlayerState,
     getConfig,
     getParticipantCount,
     getEnrolledParticipants,
@@ -1,2 +1,8 @@
 /** KMD wallet name used by the seed script and frontend for localnet test accounts. */
 export const TEST_WALLET_NAME = 'bx-hive-test-accounts'
+
+/**
+ * Fee ceiling for Registry.register_user: its own fee plus up to 4 op-up inner
+ * transactions for the member tree hashing, paid from the caller's fee credit.
+ */
+export const REGISTER_USER_MAX_FEE_MICROALGOS = 5_000
@@ -11,7 +11,7 @@ import { useAlgorand } from '../hooks/useAlgorand'
 import { useTrustExperiments } from '../hooks/useTrustExperiments'
 import type { ExperimentGroup, VariationInfo } from '../hooks/useTrustExperiments'
 import { useTrustVariation, PHASE_COMPLETED, PHASE_INVESTOR_DECISION, PHASE_TRUSTEE_DECISION } from '../hooks/useTrustVariation'
-import type { Match as OnChainMatch } from '../hooks/useTrustVariation'
+import type { Match as OnChainMatch, PlayerView } from '../hooks/useTrustVariation'
 import { queryKeys } from '../lib/queryKeys'
 import { pickVariationRoundRobin, type VariationSlot } from '../utils/distributeParticipants'
 
@@ -39,7 +39,7 @@ export default function ParticipantDashboard() {
   const { activeAddress } = useAlgorand()
   const { activeUser } = useActiveUser()
   const { listExperiments, listVariations } = useTrustExperiments()
-  const { getPlayerMatch, selfEnroll, getParticipantCount, getConfig, isParticipantEnrolled } = useTrustVariation()
+  const { getPlayerState, selfEnroll, getParticipantCount, getConfig } = useTrustVariation()
   const queryClient = useQueryClient()
 
   const { data: onChainData } = useQuery<OnChainData>({
@@ -65,28 +65,22 @@ export default function ParticipantDashboard() {
         let hasMatch = false
 
         for (const v of vars) {
-          const match = await getPlayerMatch(v.appId, activeAddress!)
-          if (match) {
-            const cfg = await config(v.appId)
-            matchViews.push({ appId: v.appId, match, assetId: cfg.assetId })
+          // One readonly call returns enrollment, match and config together
+          let state: PlayerView
+          try {
+            state = await getPlayerState(v.appId, activeAddress!)
+          } catch {
+            continue
+          }
+          configCache.set(v.appId, Promise.resolve(state.config))
+          if (state.enrolled) enrolled = true
+          if (state.match) {
+            matchViews.push({ appId: v.appId, match: state.match, assetId: state.config.assetId })
             enrolled = true
             hasMatch = true
           }
         }
 
-        if (!enrolled) {
-          for (const v of vars) {
-            try {
-              if (await isParticipantEnrolled(v.appId, activeAddress!)) {
-                enrolled = true
-                break
-              }
-            } catch {
-              /* ignore */
-            }
-          }
-        }
-
         const slots: VariationSlot[] = await Promise.all(
           vars.map(async (v) => {
             const [count, cfg] = await Promise.all([getParticipantCount(v.appId), config(v.appId)])
@@ -9,7 +9,6 @@ import InstructionsModal from '../components/InstructionsModal'
 import { LoadingSpinner, PageHeader } from '../components/ui'
 import { useAlgorand } from '../hooks/useAlgorand'
 import { useTrustVariation } from '../hooks/useTrustVariation'
-import type { VariationConfig } from '../hooks/useTrustVariation'
 import { queryKeys } from '../lib/queryKeys'
 import investorInstructions from 'virtual:instructions/trust-variation/investor'
 import trusteeInstructions from 'virtual:instructions/trust-variation/trustee'
@@ -21,7 +20,7 @@ const REFRESH_INTERVAL_MS = 5000
 
 function OnChainTrustGame({ appId, activeAddress }: { appId: bigint; activeAddress: string }) {
   const [showInstructions, setShowInstructions] = useState(true)
-  const { getPlayerMatch, getConfig } = useTrustVariation()
+  const { getPlayerState } = useTrustVariation()
 
   const {
     data,
@@ -32,9 +31,9 @@ function OnChainTrustGame({ appId, activeAddress }: { appId: bigint; activeAddre
   } = useQuery({
     queryKey: queryKeys.playerMatch(appId, activeAddress),
     queryFn: async () => {
-      const [match, config] = await Promise.all([getPlayerMatch(appId, activeAddress), getConfig(appId)])
+      const { match, config } = await getPlayerState(appId, activeAddress)
       if (!match) throw new Error('You are not matched in this variation yet.')
-      return { match, config } as { match: NonNullable<Awaited<ReturnType<typeof getPlayerMatch>>>; config: VariationConfig }
+      return { match, config }
     },
     refetchInterval: REFRESH_INTERVAL_MS,
   })
@@ -42,8 +42,8 @@ describe('computeEscrowWhole', () => {
 
 describe('computeMatchMbrAlgo', () => {
   it('always returns the ALGO-denominated MBR regardless of payout asset', () => {
-    // 0.0883 ALGO per pair, 5 pairs from maxSubjects=10
-    expect(computeMatchMbrAlgo(10)).toBeCloseTo(0.4415, 6)
+    // 0.0521 ALGO per pair, 5 pairs from maxSubjects=10
+    expect(computeMatchMbrAlgo(10)).toBeCloseTo(0.2605, 6)
   })
 })
 
@@ -94,11 +94,11 @@ describe('computeAlgoRequired', () => {
   const oneCombo = [{ E1: 100, E2: 50, m: 3 }]
 
   it('counts escrow when payout asset is ALGO', () => {
-    // maxParticipants=10 → 5 pairs → escrow=(100*3+50)*5=1750 ALGO; MBR=5*0.0883
+    // maxParticipants=10 → 5 pairs → escrow=(100*3+50)*5=1750 ALGO; MBR=5*0.0521
     const out = computeAlgoRequired(oneCombo, 10, true)
     expect(out.totalEscrowWhole).toBe(1750)
-    expect(out.totalMatchMbrAlgo).toBeCloseTo(0.4415, 6)
-    expect(out.algoRequired).toBeCloseTo(1750.4415, 6)
+    expect(out.totalMatchMbrAlgo).toBeCloseTo(0.2605, 6)
+    expect(out.algoRequired).toBeCloseTo(1750.2605, 6)
   })
 
   it('excludes escrow from the ALGO requirement when payout asset is NOT ALGO', () => {
@@ -109,15 +109,15 @@ describe('computeAlgoRequired', () => {
     // in ALGO.)
     const out = computeAlgoRequired(oneCombo, 10, false)
     expect(out.totalEscrowWhole).toBe(1750)
-    expect(out.totalMatchMbrAlgo).toBeCloseTo(0.4415, 6)
-    expect(out.algoRequired).toBeCloseTo(0.4415, 6)
+    expect(out.totalMatchMbrAlgo).toBeCloseTo(0.2605, 6)
+    expect(out.algoRequired).toBeCloseTo(0.2605, 6)
   })
 
   it('regression: large USDC escrow with a small ALGO wallet does not block submission', () => {
     // Mirrors the reported issue: 3 batch variations, maxParticipants=10
     // (5 pairs/variation), E1=100, E2=0 across m ∈ {3,4,5}. Escrow per
     // variation: 1500 / 2000 / 2500 USDC; total 6000 USDC. MBR per variation:
-    // 0.4415 ALGO; total 1.3245 ALGO. (Matches the Funding Summary the user
+    // 0.2605 ALGO; total 0.7815 ALGO. (Matches the Funding Summary the user
     // saw with the Deploy button incorrectly disabled.)
     const combos = [
       { E1: 100, E2: 0, m: 3 },
@@ -128,8 +128,8 @@ describe('computeAlgoRequired', () => {
     const algo = computeAlgoRequired(combos, 10, true)
 
     expect(usdc.totalEscrowWhole).toBe(6000)
-    expect(usdc.algoRequired).toBeCloseTo(1.3245, 4)
-    expect(algo.algoRequired).toBeCloseTo(6001.3245, 4)
+    expect(usdc.algoRequired).toBeCloseTo(0.7815, 4)
+    expect(algo.algoRequired).toBeCloseTo(6000.7815, 4)
 
     // A typical seeded wallet has ~10 ALGO. The USDC case must NOT be flagged
     // insufficient against that balance; the ALGO case obviously is.
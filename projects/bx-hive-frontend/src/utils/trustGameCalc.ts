@@ -1,5 +1,11 @@
 import type { ParameterVariation } from '../types'
 
+// Box MBR amounts in microAlgo; mirror smart_contracts/trust_variation/contract.py.
+/** Participant box (`p_` + address → ParticipantInfo), paid on each enrollment */
+export const PARTICIPANT_MBR_MICROALGOS = 18_500
+/** Match box (`m_` + match_id → Match), paid on each create_match */
+export const MATCH_MBR_MICROALGOS = 52_100
+
 /** Expand parameter variations into factorial combinations */
 export function generateVariationCombinations(
   baseParams: Record<string, number | string>,
@@ -31,10 +37,10 @@ export function computeEscrowWhole(params: Record<string, number | string>, maxP
   return (e1 * m + e2) * numPairs
 }
 
-/** Match MBR in ALGO for one variation (88,300 microAlgo per match = per pair) */
+/** Match MBR in ALGO for one variation (52,100 microAlgo per match = per pair) */
 export function computeMatchMbrAlgo(maxParticipants: number): number {
   const numPairs = Math.floor(maxParticipants / 2)
-  return (88_300 * numPairs) / 1_000_000
+  return (MATCH_MBR_MICROALGOS * numPairs) / 1_000_000
 }
 
 /**
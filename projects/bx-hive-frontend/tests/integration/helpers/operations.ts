@@ -2,18 +2,14 @@ import { AlgoAmount, getApplicationAddress, type Address, type AlgorandClient }
 import { BxHiveRegistryClient } from '../../../src/contracts/BxHiveRegistry'
 import { TrustExperimentsClient } from '../../../src/contracts/TrustExperiments'
 import { TrustVariationClient } from '../../../src/contracts/TrustVariation'
+import { REGISTER_USER_MAX_FEE_MICROALGOS } from '../../../src/lib/constants'
+import { MATCH_MBR_MICROALGOS, PARTICIPANT_MBR_MICROALGOS } from '../../../src/utils/trustGameCalc'
 
 // Role byte values mirror the convention in src/hooks/useRegistry.ts.
 // The contract stores role as an opaque uint8 — any value is accepted.
 export const ROLE_EXPERIMENTER = 0
 export const ROLE_PARTICIPANT = 1
 
-// Box-MBR amounts mirror those used by the production hooks
-// (see src/hooks/useTrustVariation.ts) so tests exercise the same
-// caller-pays-MBR pattern the app uses in production.
-const PARTICIPANT_BOX_MBR_MICROALGOS = 16_900
-const MATCH_BOX_MBR_MICROALGOS = 88_300
-
 // Variation app MBR; mirrors smart_contracts/trust_experiments/contract.py.
 const VAR_APP_MBR_ALGO = 100_000
 const VAR_APP_MBR_ASA = 200_000
@@ -171,7 +167,7 @@ export async function enrollParticipant(
   const mbrPayment = await algorand.createTransaction.payment({
     sender: participant,
     receiver: getApplicationAddress(variationClient.appId),
-    amount: AlgoAmount.MicroAlgos(PARTICIPANT_BOX_MBR_MICROALGOS),
+    amount: AlgoAmount.MicroAlgos(PARTICIPANT_MBR_MICROALGOS),
   })
   await variationClient.send.selfEnroll({
     sender: participant,
@@ -194,7 +190,7 @@ export async function ownerCreateMatch(
   const mbrPayment = await algorand.createTransaction.payment({
     sender: owner,
     receiver: getApplicationAddress(variationClient.appId),
-    amount: AlgoAmount.MicroAlgos(MATCH_BOX_MBR_MICROALGOS),
+    amount: AlgoAmount.MicroAlgos(MATCH_MBR_MICROALGOS),
   })
   const result = await variationClient.send.createMatch({
     sender: owner,
@@ -217,6 +213,8 @@ export async function registerUser(
   const result = await registryClient.send.registerUser({
     sender: account,
     args: { role, name },
+    coverAppCallInnerTransactionFees: true,
+    maxFee: AlgoAmount.MicroAlgos(REGISTER_USER_MAX_FEE_MICROALGOS),
   })
   return Number(result.return!)
 }